@@ -61,8 +61,6 @@ bl_info = {
 import bpy
 import os
 import bl_ui
-import bmesh
-from mathutils import Vector
 
 from bpy.types import PropertyGroup
 from bpy.props import StringProperty, FloatProperty, IntProperty, BoolProperty,EnumProperty, FloatVectorProperty
@@ -103,6 +101,9 @@ from .rig_functions import *
 ######### Import all from visual_assistant.py #########
 from .visual_assistant import visual_assistant_props
 from bpy.app.handlers import persistent
+from .handler_policy import policy_handler, register_policy_handlers, unregister_policy_handlers
+from .deformer_graph import invalidate_deformer_graph, subscribe_deformer_graph, register_deformer_graph, unregister_deformer_graph
+from .driver_index import invalidate_driver_index
 
 
 ######### Update Function for Properties ##########
@@ -164,42 +165,8 @@ def vol_prservation_update(self, context):
 def state_only_insert_available(self, context):
     get_state_only_insert_available(context)
 
-def get_custom_attribute_from_object(obj, attribute):
-    if str(attribute) in obj:
-        return obj[attribute]
-
 def snap_points_update(self, context):
-    props = context.window_manager.blenrig_6_props.adjust_distance_cage
-    active_obj = context.active_object
-    bm = bmesh.from_edit_mesh(active_obj.data)
-    bm.verts.ensure_lookup_table()
-    sel_verts = [v for v in bm.verts if v.select]
-
-    for vert in sel_verts:
-        old_co = get_custom_attribute_from_object(active_obj, str(vert.index))
-        a = old_co.split()
-        old_vec = Vector((float(a[0]),float(a[1]),float(a[2])))
-        bm.normal_update()
-        vert.co = old_vec + vert.normal*float("%f" % props)
-        bmesh.update_edit_mesh(active_obj.data)
-
-    bpy.ops.mesh.select_all(action='DESELECT')
-    nombre_vertex_group = 'center_loop'
-    bpy.context.active_object.vertex_groups.active = bpy.context.active_object.vertex_groups.get(nombre_vertex_group)
-    bpy.ops.object.vertex_group_select()
-    bm = bmesh.from_edit_mesh(active_obj.data)
-    bm.normal_update()
-    sel_center_verts = [v for v in bm.verts if v.select]
-
-    for vert in sel_center_verts:
-        vert.co[0] = 0
-        vert.select = False
-        bm.normal_update()
-        bmesh.update_edit_mesh(active_obj.data)
-
-    for vert in sel_verts:
-        vert.select= True
-        bmesh.update_edit_mesh(active_obj.data)
+    adjust_cage_distance(context.active_object, self.adjust_distance_cage)
 
 ######### Handler for update on load and frame change #########
 
@@ -207,6 +174,11 @@ def snap_points_update(self, context):
 
 @persistent
 def load_reprop_handler(self, context):
+    clear_bone_indices()
+    invalidate_driver_index()
+    subscribe_bone_indices()
+    invalidate_deformer_graph()
+    subscribe_deformer_graph()
     bone_auto_hide(context)
     reproportion_toggle(self, context)
 
@@ -220,8 +192,9 @@ def load_state_only_insert_available(self, context):
     state_only_insert_available(self, context)
 
 
+#load_post handlers reset caches and state for the new file, they always run, also in background
 bpy.app.handlers.load_post.append(load_reprop_handler)
-bpy.app.handlers.frame_change_post.append(load_handler)
+bpy.app.handlers.frame_change_post.append(policy_handler(load_handler))
 bpy.app.handlers.load_post.append(load_state_only_insert_available)
 
 
@@ -2555,7 +2528,7 @@ from .ui.panels.ui_legacy_panel_controls import BLENRIG_PT_legacy_blenrig_5_Inte
 from .ui.panels.ui_panel_blenrig import BLENRIG_PT_blenrig_6_general,BLENRIG_PT_blenrig_6_general_SubPanel
 from .ui.panels.ui_panel_controls import BLENRIG_PT_blenrig_6_Interface
 from .ui.panels.ui_legacy_panel_controls_1_5 import BLENRIG_PT_legacy_blenrig_5_5_Interface
-from .snap_points import BLENRIG_OT_SnapPoints,BLENRIG_OT_center_loop_cage
+from .snap_points import BLENRIG_OT_SnapPoints,BLENRIG_OT_center_loop_cage, adjust_cage_distance
 from .ui.panels.cage_snapping_panel import BLENRIG_PT_Cage_snapping_panel
 
 ####### Load BlenRig 6 Rigging Panel
@@ -2629,6 +2602,8 @@ from .shape_Keys.panels import (
 ####### Load BlenRig 6 Bake Operators
 from .ops_baking import (
     ARMATURE_OT_mesh_pose_baker,
+    ARMATURE_OT_mesh_sequence_baker,
+    ARMATURE_OT_import_point_cache,
     ARMATURE_OT_reset_hooks,
     ARMATURE_OT_disable_hooks_modif,
     ARMATURE_OT_reset_deformers,
@@ -2747,7 +2722,10 @@ from .ops_snapping import (
     Operator_Leg_L_Snap_FK_IK,
     Operator_Leg_L_Snap_IK_FK,
     Operator_Leg_R_Snap_FK_IK,
-    Operator_Leg_R_Snap_IK_FK
+    Operator_Leg_R_Snap_IK_FK,
+    Operator_Snap_Bake_IK_FK,
+    Operator_Space_Switch_Bake,
+    pose_ops
     )
 
 ####### Load BlenRig 6 Body Picker Operators
@@ -3214,7 +3192,8 @@ from .blenrig_biped.ops_biped_layers_scheme import (
 ####### Load BlenRig 6 Rig Updater Operators
 from .ops_rig_updater import (
     Operator_Biped_Updater,
-    Operator_Set_Lib_Override_On
+    Operator_Set_Lib_Override_On,
+    Operator_Recompute_Rig_Settings
 )
 
 ####### Load BlenRig 6 Rig Presets Operators
@@ -3431,6 +3410,8 @@ armature_classes = [
     ARMATURE_OT_armature_baker_all_part_1,
     ARMATURE_OT_armature_baker_all_part_2,
     ARMATURE_OT_mesh_pose_baker,
+    ARMATURE_OT_mesh_sequence_baker,
+    ARMATURE_OT_import_point_cache,
     ARMATURE_OT_reset_hooks,
     ARMATURE_OT_disable_hooks_modif,
     ARMATURE_OT_reset_deformers,
@@ -3501,7 +3482,8 @@ schemes_classes = [
 # BlenRig Rig Updater Operators
 rig_updater_classes = [
     Operator_Biped_Updater,
-    Operator_Set_Lib_Override_On
+    Operator_Set_Lib_Override_On,
+    Operator_Recompute_Rig_Settings
 ]
 # BlenRig IK/FK Snapping Operators
 snapping_classes = [
@@ -3598,7 +3580,10 @@ snapping_classes = [
     Operator_Leg_L_Snap_FK_IK,
     Operator_Leg_L_Snap_IK_FK,
     Operator_Leg_R_Snap_FK_IK,
-    Operator_Leg_R_Snap_IK_FK
+    Operator_Leg_R_Snap_IK_FK,
+    Operator_Snap_Bake_IK_FK,
+    Operator_Space_Switch_Bake,
+    *pose_ops
 ]
 # BlenRig Picker Operators
 body_picker_biped_classes = [
@@ -4209,6 +4194,13 @@ def register():
 
     register_class(visual_assistant_props)
 
+    # Bones Hiding System and Rig Toggles indices
+    subscribe_bone_indices()
+    # Deformer relations for the bakers and guides
+    register_deformer_graph()
+    # Skip handlers during playback and render
+    register_policy_handlers()
+
     # BlenRig Props
     bpy.types.WindowManager.blenrig_6_props = bpy.props.PointerProperty(type = blenrig_6_props)
 
@@ -4259,6 +4251,10 @@ def unregister():
     unregister_class(BLENRIG_PT_blenrig_6_general)
     unregister_class(BLENRIG_PT_blenrig_6_general_SubPanel)
 
+    bpy.msgbus.clear_by_owner(auto_hide_index)
+    unregister_deformer_graph()
+    unregister_policy_handlers()
+
     # BlenRig Props
     del bpy.types.WindowManager.blenrig_6_props
     # Side Visibility Props
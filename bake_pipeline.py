@@ -0,0 +1,174 @@
+import bpy
+from time import perf_counter
+from .deformer_graph import get_deformer_graph, invalidate_deformer_graph
+from .mesh_bake import evaluated_coords, bake_coords
+
+##################################### Bake All Pipeline #######################################
+
+# Stages in baking order: objects bound to cages are baked before the cages that deform them
+BAKE_STAGES = (
+    ('SURFACE_DEFORM', "Surface Deform Objects"),
+    ('MESH_DEFORM', "Mesh Deform Objects"),
+    ('ARMATURE', "Armature Objects"),
+    ('SDEF_CAGES', "Surface Deform Cages"),
+    ('MDEF_CAGES', "Mesh Deform Cages"),
+)
+
+def plan_bake_all(arm_name, graph=None):
+    """Ordered bake plan for the objects deformed by an armature: [(stage, label, [(object name, to_shape)])].
+       Every mesh is baked once, in the first stage that claims it. Objects with shape keys
+       are baked to a new shape key, the rest to their mesh. Returns the plan and the skipped object names.
+    """
+    if graph is None:
+        graph = get_deformer_graph(refresh=True)
+    mdef_cages = [ob.name for ob in graph.mdef_cages(arm_name)]
+    sdef_cages = [ob.name for ob in graph.sdef_cages(arm_name)]
+    cages = set(mdef_cages) | set(sdef_cages)
+    candidates = {
+        'SURFACE_DEFORM': [ob.name for ob in graph.sdef_bound_objects(arm_name) if ob.name not in cages],
+        'MESH_DEFORM': [ob.name for ob in graph.mdef_bound_objects(arm_name) if ob.name not in cages],
+        'ARMATURE': [ob.name for ob in graph.armature_deformed(arm_name) if ob.name not in cages],
+        'SDEF_CAGES': sdef_cages,
+        'MDEF_CAGES': mdef_cages,
+    }
+
+    plan = []
+    planned = set()
+    skipped = []
+    for stage, label in BAKE_STAGES:
+        entries = []
+        for name in candidates[stage]:
+            if name in planned:
+                continue
+            planned.add(name)
+            ob = bpy.data.objects[name]
+            if ob.type != 'MESH':
+                skipped.append(name)
+                continue
+            entries.append((name, bool(ob.data.shape_keys)))
+        plan.append((stage, label, entries))
+    return plan, skipped
+
+def format_plan(plan, skipped=()):
+    lines = ['BlenRig Bake All plan:']
+    for stage, label, entries in plan:
+        lines.append('  ' + label + ': ' + str(len(entries)) + ' objects')
+        for name, to_shape in entries:
+            lines.append('    ' + name + (' -> Baked_shape' if to_shape else ' -> mesh'))
+    if skipped:
+        lines.append('  Skipped, not meshes: ' + ', '.join(skipped))
+    return '\n'.join(lines)
+
+def unbind_deformers(context, objects):
+    """Unbinds the bound Mesh Deform and Surface Deform modifiers of objects, bind operators toggle the binding"""
+    view_layer = context.view_layer
+    old_ob = view_layer.objects.active
+    for ob in objects:
+        bound = [mod for mod in ob.modifiers if mod.type in ('MESH_DEFORM', 'SURFACE_DEFORM') and mod.is_bound]
+        if not bound:
+            continue
+        view_layer.objects.active = ob
+        for mod in bound:
+            if mod.type == 'MESH_DEFORM':
+                bpy.ops.object.meshdeform_bind(modifier=mod.name)
+            else:
+                bpy.ops.object.surfacedeform_bind(modifier=mod.name)
+    view_layer.objects.active = old_ob
+
+def execute_bake_plan(context, plan):
+    """Bakes every stage of a plan with one depsgraph evaluation per stage.
+       Returns the report: [(label, stage seconds, {object name: seconds})].
+    """
+    report = []
+    for stage, label, entries in plan:
+        start = perf_counter()
+        timings = {}
+        objects = [bpy.data.objects[name] for name, to_shape in entries]
+        coords = evaluated_coords(objects, timings)
+        for ob, (name, to_shape) in zip(objects, entries):
+            ob_start = perf_counter()
+            co = coords[name]
+            if len(co) == len(ob.data.vertices) * 3:
+                bake_coords(ob, co, to_shape)
+            else:
+                print('BlenRig: ' + name + ' not baked, its modifiers change the vertex count')
+            unbind_deformers(context, [ob])
+            timings[name] += perf_counter() - ob_start
+        report.append((label, perf_counter() - start, timings))
+    return report
+
+def format_report(report):
+    lines = ['BlenRig Bake All report:']
+    for label, seconds, timings in report:
+        lines.append('  ' + label + ': ' + '{:.3f}'.format(seconds) + 's')
+        for name, ob_seconds in timings.items():
+            lines.append('    ' + name + ': ' + '{:.3f}'.format(ob_seconds) + 's')
+    lines.append('  Total: ' + '{:.3f}'.format(sum(r[1] for r in report)) + 's')
+    return '\n'.join(lines)
+
+##################################### Armature Baking #######################################
+
+def reset_constraints(armobj):
+    """Zeroes the rest distances of Limit Distance and Stretch To constraints, returns the number of constraints reset"""
+    armobj.data.pose_position = 'REST'
+    amount = 0
+    for pbone in armobj.pose.bones:
+        for con in pbone.constraints:
+            if con.type == 'LIMIT_DISTANCE':
+                amount += 1
+                con.distance = 0
+            elif con.type == 'STRETCH_TO':
+                amount += 1
+                con.rest_length = 0
+    armobj.data.pose_position = 'POSE'
+    return amount
+
+def unparent_children(armobj):
+    """Clears the parent of the objects parented to the armature keeping their world transform.
+       Returns [(object, parent type, parent bone, world matrix)] for reparent_children.
+    """
+    parent_pairs = []
+    for ob in get_deformer_graph(refresh=True).child_objects(armobj.name):
+        world = ob.matrix_world.copy()
+        parent_pairs.append((ob, ob.parent_type, ob.parent_bone, world))
+        ob.parent = None
+        ob.matrix_basis = world
+    return parent_pairs
+
+def bone_parent_matrix(armobj, b_name):
+    """World matrix a bone gives to its children: the pose matrix moved to the bone tail"""
+    pbone = armobj.pose.bones.get(b_name)
+    if pbone is None:
+        return armobj.matrix_world.copy()
+    mat = pbone.matrix.copy()
+    mat.translation = pbone.tail
+    return armobj.matrix_world @ mat
+
+def reparent_children(armobj, parent_pairs):
+    """Parents the objects back to their bones keeping the world transform stored by unparent_children"""
+    for ob, parent_type, bone, world in parent_pairs:
+        ob.parent = armobj
+        ob.parent_type = parent_type
+        if parent_type == 'BONE':
+            ob.parent_bone = bone
+            ob.matrix_parent_inverse = bone_parent_matrix(armobj, bone).inverted()
+        else:
+            ob.matrix_parent_inverse = armobj.matrix_world.inverted()
+        ob.matrix_basis = world
+    invalidate_deformer_graph()
+
+def reset_object_hooks(objects):
+    """Recomputes the inverse matrix of the Hook modifiers of objects from the current target transforms,
+       like the Reset Hook operator does. Returns the number of hooks reset.
+    """
+    amount = 0
+    for ob in objects:
+        for mod in ob.modifiers:
+            if mod.type != 'HOOK' or not mod.object:
+                continue
+            target = mod.object.matrix_world
+            if mod.subtarget and mod.object.type == 'ARMATURE' and mod.subtarget in mod.object.pose.bones:
+                target = target @ mod.object.pose.bones[mod.subtarget].matrix
+            mod.matrix_inverse = target.inverted() @ ob.matrix_world
+            amount += 1
+    return amount
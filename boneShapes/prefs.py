@@ -1,7 +1,9 @@
 import bpy
 from bpy.types import AddonPreferences
-from bpy.props import StringProperty, EnumProperty
+from bpy.props import StringProperty, EnumProperty, BoolProperty
 from .. import __package__ as main_package
+from ..handler_policy import handler_stats
+from ..instrumentation import timing_stats
 
 
 class BoneShapesPreferences(AddonPreferences):
@@ -21,6 +23,27 @@ class BoneShapesPreferences(AddonPreferences):
         default="BoneShapes",
     )
 
+    # pose refresh
+    legacy_pose_refresh: BoolProperty(
+        name="Legacy Pose Refresh",
+        description="Refresh the pose while snapping by toggling Object/Pose mode instead of updating the depsgraph. Slower, only use it if snapping gives wrong results",
+        default=False,
+    )
+
+    # handlers
+    handlers_fast_path: BoolProperty(
+        name="Skip Handlers During Playback and Render",
+        description="Don't update control visibility while playing back, rendering or running in background. A single update runs when playback or render ends",
+        default=True,
+    )
+
+    # instrumentation
+    rig_instrumentation: BoolProperty(
+        name="Time Rig Functions",
+        description="Record how many times and how long the rig toggles and bone hiding functions run",
+        default=False,
+    )
+
     def draw(self, context):
         layout = self.layout
 
@@ -28,3 +51,23 @@ class BoneShapesPreferences(AddonPreferences):
         col = row.column()
         col.prop(self, "widget_prefix", text="Shapes Prefix")
         col.prop(self, "boneshape_collection_name", text="Collection name")
+
+        row = layout.row()
+        col = row.column()
+        col.prop(self, "legacy_pose_refresh")
+
+        box = layout.box()
+        box.prop(self, "handlers_fast_path")
+        if handler_stats:
+            col = box.column(align=True)
+            for name, (runs, skipped, seconds) in sorted(handler_stats.items()):
+                col.label(text="{}: {} runs, {} skipped, {:.1f} ms".format(name, runs, skipped, seconds * 1000))
+        else:
+            box.label(text="No handler has run yet")
+
+        box = layout.box()
+        box.prop(self, "rig_instrumentation")
+        if self.rig_instrumentation:
+            col = box.column(align=True)
+            for name, (calls, seconds) in sorted(timing_stats.items()):
+                col.label(text="{}: {} calls, {:.1f} ms".format(name, calls, seconds * 1000))
@@ -0,0 +1,79 @@
+import bpy
+import numpy as np
+
+##################################### Bulk Bone Visibility Writer #######################################
+
+class BoneVisibilityWriter():
+    """Collects hide states and layers of armature bones and writes them with one foreach_set per property.
+       Current values are read with foreach_get, only bones whose state differs count as changed
+       and nothing is written when no bone changed.
+    """
+
+    def __init__(self, arm):
+        self.arm = arm
+        self.hide_state = {}
+        self.layer_state = {}
+
+    def hide(self, b_name, state):
+        self.hide_state[b_name] = bool(state)
+
+    def layers(self, b_name, layer_list):
+        """Sets the bone on the given layers only"""
+        self.layer_state[b_name] = layer_list
+
+    def write(self):
+        """Writes the collected states, returns the number of bones that changed"""
+        bones = self.arm.bones
+        count = len(bones)
+        if not count or not (self.hide_state or self.layer_state):
+            return 0
+        index = {name: i for i, name in enumerate(bones.keys())}
+        changed = np.zeros(count, dtype=bool)
+
+        if self.hide_state:
+            current = np.empty(count, dtype=bool)
+            bones.foreach_get('hide', current)
+            new = current.copy()
+            for name, state in self.hide_state.items():
+                i = index.get(name)
+                if i is not None:
+                    new[i] = state
+            diff = new != current
+            if diff.any():
+                bones.foreach_set('hide', new)
+                changed |= diff
+
+        if self.layer_state:
+            layer_count = len(bones[0].layers)
+            current = np.empty(count * layer_count, dtype=bool)
+            bones.foreach_get('layers', current)
+            current = current.reshape(count, layer_count)
+            new = current.copy()
+            for name, layer_list in self.layer_state.items():
+                i = index.get(name)
+                if i is not None:
+                    new[i] = False
+                    new[i, list(layer_list)] = True
+            diff = (new != current).any(axis=1)
+            if diff.any():
+                bones.foreach_set('layers', new.ravel())
+                changed |= diff
+
+        self.hide_state.clear()
+        self.layer_state.clear()
+        changed_count = int(np.count_nonzero(changed))
+        if changed_count:
+            # foreach_set skips the RNA updates, tag the armature and redraw the viewports
+            self.arm.update_tag()
+            screen = bpy.context.screen
+            if screen:
+                for area in screen.areas:
+                    if area.type == 'VIEW_3D':
+                        area.tag_redraw()
+        return changed_count
+
+def write_bone_hide(arm, hide_state):
+    """Applies a {bone name: hide} dict in one write, returns the number of bones that changed"""
+    writer = BoneVisibilityWriter(arm)
+    writer.hide_state.update((name, bool(state)) for name, state in hide_state.items())
+    return writer.write()
@@ -0,0 +1,148 @@
+import bpy
+from bpy.app.handlers import persistent
+
+##################################### Deformer Graph #######################################
+
+# Name tags of the objects the guides look up by name
+NAME_TAGS = ('MdefCage', 'MDefHeadWeightsModel', 'MDefHandsWeightsModel', 'FaceRigMesh')
+
+class DeformerGraph():
+    """Deformation relations of every object in the file, built in one pass over bpy.data.objects:
+       armature -> meshes with an Armature modifier, mesh deform cages -> bound meshes,
+       surface deform targets -> bound meshes, hook objects -> hooked lattices and curves,
+       parent -> children and name tags.
+       Stores object names in file order, queries return the objects that still exist.
+    """
+
+    def __init__(self):
+        self.stamp = graph_stamp()
+        # {armature name: [object names]}
+        self.armature_objects = {}
+        # {cage name: [object names]}
+        self.mdef_objects = {}
+        self.sdef_objects = {}
+        # {hook object name: [object names]}
+        self.hooked_objects = {}
+        # {object name: [armature names]} for objects deformed by an Armature modifier
+        self.deforming_armatures = {}
+        # {parent name: [child names]}
+        self.children = {}
+        self.boneshapes = []
+        self.tagged = {tag: [] for tag in NAME_TAGS}
+
+        for ob in bpy.data.objects:
+            name = ob.name
+            if ob.parent:
+                self.children.setdefault(ob.parent.name, []).append(name)
+            if name.startswith('cs_'):
+                self.boneshapes.append(name)
+            for tag in NAME_TAGS:
+                if tag in name:
+                    self.tagged[tag].append(name)
+            for mod in getattr(ob, 'modifiers', ()):
+                if mod.type == 'ARMATURE' and mod.object:
+                    self.add(self.armature_objects, mod.object.name, name)
+                    self.add(self.deforming_armatures, name, mod.object.name)
+                elif mod.type == 'MESH_DEFORM' and mod.object:
+                    self.add(self.mdef_objects, mod.object.name, name)
+                elif mod.type == 'SURFACE_DEFORM' and mod.target:
+                    self.add(self.sdef_objects, mod.target.name, name)
+                elif mod.type == 'HOOK' and mod.object:
+                    self.add(self.hooked_objects, mod.object.name, name)
+
+    @staticmethod
+    def add(relation, key, name):
+        names = relation.setdefault(key, [])
+        if name not in names:
+            names.append(name)
+
+    @staticmethod
+    def objects(names):
+        objects = bpy.data.objects
+        return [objects[n] for n in names if n in objects]
+
+    def cages(self, bound, arm_name):
+        """Names of the cages of a relation that are deformed by the armature"""
+        return [cage for cage in bound if arm_name in self.deforming_armatures.get(cage, ())]
+
+    def mdef_cages(self, arm_name):
+        return self.objects(self.cages(self.mdef_objects, arm_name))
+
+    def sdef_cages(self, arm_name):
+        return self.objects(self.cages(self.sdef_objects, arm_name))
+
+    def bound_objects(self, bound, arm_name):
+        names = []
+        for cage in self.cages(bound, arm_name):
+            names.extend(n for n in bound[cage] if n not in names)
+        return self.objects(names)
+
+    def mdef_bound_objects(self, arm_name):
+        """Objects with a Mesh Deform modifier whose cage is deformed by the armature"""
+        return self.bound_objects(self.mdef_objects, arm_name)
+
+    def sdef_bound_objects(self, arm_name):
+        """Objects with a Surface Deform modifier whose target is deformed by the armature"""
+        return self.bound_objects(self.sdef_objects, arm_name)
+
+    def armature_deformed(self, arm_name):
+        """Objects with an Armature modifier using the armature"""
+        return self.objects(self.armature_objects.get(arm_name, ()))
+
+    def hooked(self, ob_name):
+        """Objects with a Hook modifier using the object"""
+        return self.objects(self.hooked_objects.get(ob_name, ()))
+
+    def child_objects(self, parent_name, ob_type=None):
+        found = self.objects(self.children.get(parent_name, ()))
+        if ob_type:
+            found = [ob for ob in found if ob.type == ob_type]
+        return found
+
+    def boneshape_objects(self):
+        return self.objects(self.boneshapes)
+
+    def tagged_objects(self, tag):
+        return self.objects(self.tagged[tag])
+
+deformer_graph_cache = {}
+
+def graph_stamp():
+    """Object and modifier counts of the file, adding or removing either gives a new stamp"""
+    objects = bpy.data.objects
+    return (len(objects), sum(len(ob.modifiers) for ob in objects))
+
+def get_deformer_graph(refresh=False):
+    """Cached deformer graph, rebuilt when objects or modifiers were added or removed, on file load, undo
+       and when modifier targets, parents or object names change from the interface.
+       Scripts that change those call invalidate_deformer_graph or pass refresh.
+    """
+    graph = deformer_graph_cache.get('graph')
+    if refresh or graph is None or graph.stamp != graph_stamp():
+        graph = deformer_graph_cache['graph'] = DeformerGraph()
+    return graph
+
+@persistent
+def invalidate_deformer_graph(*args):
+    deformer_graph_cache.clear()
+
+def subscribe_deformer_graph():
+    """Invalidate the graph when relations change. Subscriptions are lost on file load, call again from load_post."""
+    bpy.msgbus.clear_by_owner(deformer_graph_cache)
+    for key in ((bpy.types.Object, "name"), (bpy.types.Object, "parent"), (bpy.types.ArmatureModifier, "object"),
+                (bpy.types.MeshDeformModifier, "object"), (bpy.types.SurfaceDeformModifier, "target"),
+                (bpy.types.HookModifier, "object")):
+        bpy.msgbus.subscribe_rna(key=key, owner=deformer_graph_cache, args=(), notify=invalidate_deformer_graph)
+
+def register_deformer_graph():
+    subscribe_deformer_graph()
+    for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if invalidate_deformer_graph not in handlers:
+            handlers.append(invalidate_deformer_graph)
+
+def unregister_deformer_graph():
+    bpy.msgbus.clear_by_owner(deformer_graph_cache)
+    for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if invalidate_deformer_graph in handlers:
+            handlers.remove(invalidate_deformer_graph)
+    deformer_graph_cache.clear()
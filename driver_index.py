@@ -0,0 +1,115 @@
+##################################### Driver Index #######################################
+
+# Cached driver indices per ID: {ID pointer: DriverIndex}
+driver_index_cache = {}
+# Bumped by invalidate_driver_index, for changes that keep the driver count (rig updates, new targets)
+index_version = [0]
+
+def driver_stamp(id_data):
+    """Driver count, rig version and index version: when any of them changes the index is rebuilt"""
+    anim_data = id_data.animation_data
+    count = len(anim_data.drivers) if anim_data else 0
+    rig_version = id_data.data.get('rig_version') if hasattr(id_data, 'data') and hasattr(id_data.data, 'get') else None
+    return (count, str(rig_version), index_version[0])
+
+class DriverIndex():
+    """Drivers of an ID indexed by (data_path, array_index) and by the data paths their variables read.
+       Stores positions in animation_data.drivers rather than the F-Curves, which don't survive undo.
+    """
+
+    def __init__(self, id_data):
+        self.stamp = driver_stamp(id_data)
+        # (data_path, array_index) of the driver at each position, to check positions before using them
+        self.paths = []
+        self.by_path = {}
+        self.by_target = {}
+        # Cached results of drivers_reading: {target paths: driver positions}
+        self.groups = {}
+        anim_data = id_data.animation_data
+        if not anim_data:
+            return
+        for i, fc in enumerate(anim_data.drivers):
+            self.paths.append((fc.data_path, fc.array_index))
+            self.by_path[(fc.data_path, fc.array_index)] = i
+            for var in fc.driver.variables:
+                for target in var.targets:
+                    if target.data_path:
+                        self.by_target.setdefault(target.data_path, []).append(i)
+
+    def drivers_reading(self, target_paths):
+        """Positions of the drivers with a variable whose target data path contains any of target_paths"""
+        key = tuple(target_paths)
+        found = self.groups.get(key)
+        if found is None:
+            found = set()
+            for path, positions in self.by_target.items():
+                if any(t in path for t in key):
+                    found.update(positions)
+            found = self.groups[key] = sorted(found)
+        return found
+
+    def positions_valid(self, drivers, positions):
+        """False when the drivers at positions are not the ones indexed, they were reordered without changing the count"""
+        for i in positions:
+            fc = drivers[i]
+            if (fc.data_path, fc.array_index) != self.paths[i]:
+                return False
+        return True
+
+def get_driver_index(id_data):
+    """Returns the driver index of an ID (object, shape keys...), rebuilding it when its stamp changed"""
+    key = id_data.as_pointer()
+    index = driver_index_cache.get(key)
+    if index is None or index.stamp != driver_stamp(id_data):
+        index = driver_index_cache[key] = DriverIndex(id_data)
+    return index
+
+def invalidate_driver_index(id_data=None):
+    """Forces a rebuild of one or all indices, call it after editing drivers without changing their count"""
+    if id_data is None:
+        driver_index_cache.clear()
+        index_version[0] += 1
+    else:
+        driver_index_cache.pop(id_data.as_pointer(), None)
+
+def find_driver(id_data, data_path, array_index=0):
+    """Driver F-Curve of data_path, or None"""
+    anim_data = id_data.animation_data
+    if not anim_data:
+        return None
+    i = get_driver_index(id_data).by_path.get((data_path, array_index))
+    if i is None:
+        return None
+    fc = anim_data.drivers[i]
+    if fc.data_path != data_path or fc.array_index != array_index:
+        # Drivers reordered without changing the count
+        invalidate_driver_index(id_data)
+        return anim_data.drivers.find(data_path, index=array_index)
+    return fc
+
+def set_drivers_mute(id_data, target_paths, mute):
+    """Mutes or unmutes the drivers reading any of target_paths in one foreach_set.
+       Returns the number of drivers that changed.
+    """
+    anim_data = id_data.animation_data
+    if not anim_data:
+        return 0
+    drivers = anim_data.drivers
+    index = get_driver_index(id_data)
+    positions = index.drivers_reading(target_paths)
+    if positions and not index.positions_valid(drivers, positions):
+        invalidate_driver_index(id_data)
+        positions = get_driver_index(id_data).drivers_reading(target_paths)
+    if not positions:
+        return 0
+    states = [False] * len(drivers)
+    drivers.foreach_get('mute', states)
+    changed = 0
+    for i in positions:
+        if states[i] != mute:
+            states[i] = mute
+            changed += 1
+    if changed:
+        drivers.foreach_set('mute', states)
+        id_data.update_tag()
+    return changed
@@ -1,6 +1,5 @@
 import bpy
 from math import radians
-from mathutils import Vector
 from bpy.props import StringProperty, BoolProperty, EnumProperty
 
 
@@ -5938,7 +5937,7 @@ class Operator_blenrig_reset_shapekey(bpy.types.Operator):
         # Store Current Mode
         ob_mode = ob.mode
 
-        if basis_search:
+        if basis_search():
             blend_from_shape('Basis', [ob.active_shape_key.name])
         else:
             self.report({'WARNING'}, 'Could not find Basis Shapekey')
@@ -6083,6 +6082,7 @@ class Operator_Apply_Sculpt_Object_to_Shapekey(bpy.types.Operator):
     #Code based from Pose Shapkeys addon by Mets
     def execute(self, context):
         from . utils import deselect_all_objects, set_active_object, set_mode, switch_out_local_view
+        from ..shape_key_math import sculpt_to_shape_key
         scene = bpy.context.scene
         ob = scene.blenrig_guide.shapekeys_obj
         sculpt_object = scene.blenrig_guide.sculpt_shapekey_obj
@@ -6114,40 +6114,13 @@ class Operator_Apply_Sculpt_Object_to_Shapekey(bpy.types.Operator):
             self.report({'ERROR'}, 'Sculpt object "{sculpt_object.name}" must be in view layer!')
             raise Exception
 
-        # The Pose Key stores the vertex positions of a previous evaluated mesh.
-        # This, and the current vertex positions of the mesh are subtracted
-        # from each other to get the difference in their shape.
-        sculpt_eval_verts = sculpt_object.evaluated_get(depsgraph).data.vertices
-        ob_eval_verts = ob.evaluated_get(depsgraph).data.vertices
-
-        # Shape keys are relative to the base shape of the mesh, so that delta
-        # will be added to the base mesh to get the final shape key vertex positions.
-        rigged_base_verts = ob.data.vertices
-
-        # The CrazySpace provides us the matrix by which each vertex has been
-        # deformed by modifiers and shape keys. This matrix is necessary to
-        # calculate the correct delta.
-        ob.crazyspace_eval(depsgraph, scene)
-
-        for i, v in enumerate(sculpt_eval_verts):
-            if i > len(rigged_base_verts)-1:
-                break
-            sculpt_eval_co = Vector(v.co)
-            rigged_eval_co = ob_eval_verts[i].co
-
-            delta = sculpt_eval_co - rigged_eval_co
-
-            delta = ob.crazyspace_displacement_to_original(vertex_index=i, displacement=delta)
-
-            base_v = rigged_base_verts[i].co
-
-            if hasattr(ob, 'data') and hasattr(ob.data, 'shape_keys') and hasattr(ob.data.shape_keys, 'key_blocks'):
-                active_shape = bpy.context.active_object.active_shape_key
-                shapekeys = ob.data.shape_keys.key_blocks
-                key_block = shapekeys[active_shape.name]
-                key_block.data[i].co = base_v+delta
-
-        ob.crazyspace_eval_clear()
+        # The sculpt and the current evaluated mesh are subtracted from each other to get the
+        # difference in their shape, that difference is taken back through the deformation of
+        # modifiers and shape keys with the CrazySpace and added to the base mesh.
+        sculpt_count = len(sculpt_object.evaluated_get(depsgraph).data.vertices)
+        ob_count = len(ob.evaluated_get(depsgraph).data.vertices)
+        if ob.data.shape_keys and ob.active_shape_key:
+            sculpt_to_shape_key(ob, sculpt_object, ob.active_shape_key, depsgraph, scene)
 
         #Enable Modifiers
         for d_mod in disable_list:
@@ -6159,7 +6132,7 @@ class Operator_Apply_Sculpt_Object_to_Shapekey(bpy.types.Operator):
         deselect_all_objects(context)
         set_active_object(context, ob)
 
-        if len(sculpt_eval_verts) != len(ob_eval_verts):
+        if sculpt_count != ob_count:
             self.report({'WARNING'}, 'Sculpt Object and Shapekeys Object Topology does not Match')
 
         #Delete Sculpt Object
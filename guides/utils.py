@@ -2,6 +2,10 @@ import bpy
 from bpy_extras import view3d_utils
 from math import radians, degrees
 from mathutils import Matrix, Vector
+from ..driver_index import find_driver
+from ..deformer_graph import get_deformer_graph
+from ..mesh_bake import set_coords
+from ..shape_key_math import shape_coords, propagate_shape
 
 
 # GET BLENRIG ARMATURE
@@ -377,48 +381,39 @@ face_rig_objects = []
 
 def collect_facemask():
     face_rig_objects.clear()
-    for ob in bpy.data.objects:
-        if hasattr(ob, 'parent'):
-            if ob.parent == bpy.context.active_object:
-                if "FaceRigMesh" in ob.name:
-                    face_rig_objects.append(ob)
+    if bpy.context.active_object:
+        children = get_deformer_graph().child_objects(bpy.context.active_object.name)
+        face_rig_objects.extend(ob for ob in children if "FaceRigMesh" in ob.name)
     return face_rig_objects
 
 mdef_cage_objects = []
 
 def collect_cage():
     mdef_cage_objects.clear()
-    for ob in bpy.data.objects:
-        if "MdefCage" in ob.name:
-            mdef_cage_objects.append(ob)
+    mdef_cage_objects.extend(get_deformer_graph().tagged_objects("MdefCage"))
     return mdef_cage_objects
 
 mdef_head_weights_model_objects = []
 
 def collect_mdef_head_weights_model():
     mdef_head_weights_model_objects.clear()
-    for ob in bpy.data.objects:
-        if "MDefHeadWeightsModel" in ob.name:
-            mdef_head_weights_model_objects.append(ob)
+    mdef_head_weights_model_objects.extend(get_deformer_graph().tagged_objects("MDefHeadWeightsModel"))
     return mdef_head_weights_model_objects
 
 mdef_hands_weights_model_objects = []
 
 def collect_mdef_hands_weights_model():
     mdef_hands_weights_model_objects.clear()
-    for ob in bpy.data.objects:
-        if "MDefHandsWeightsModel" in ob.name:
-            mdef_hands_weights_model_objects.append(ob)
+    mdef_hands_weights_model_objects.extend(get_deformer_graph().tagged_objects("MDefHandsWeightsModel"))
     return mdef_hands_weights_model_objects
 
 lattice_objects = []
 
 def collect_lattice_objects():
     lattice_objects.clear()
-    for ob in bpy.data.objects:
-        if hasattr(ob, 'type') and hasattr(ob, 'parent'):
-            if ob.type == 'LATTICE' and ob.parent == bpy.context.scene.blenrig_guide.arm_obj:
-                lattice_objects.append(ob)
+    arm_obj = bpy.context.scene.blenrig_guide.arm_obj
+    if arm_obj:
+        lattice_objects.extend(get_deformer_graph().child_objects(arm_obj.name, 'LATTICE'))
     return lattice_objects
 
 #### Local View
@@ -525,29 +520,12 @@ def basis_shapekey_fix(context):
         if hasattr(ob.data.shape_keys, 'key_blocks'):
             shapekeys = ob.data.shape_keys.key_blocks
             if shapekeys.find('Basis') == 0:
-            #Fix Basis Shapekey Hack for correct creation of New Shapekeys
+            #Fix Basis Shapekey Hack for correct creation of New Shapekeys: write the Basis to the mesh
+                if ob.mode != 'OBJECT':
+                    set_mode('OBJECT')
                 set_active_shapekey('Basis')
-                set_mode('EDIT')
-                bpy.ops.mesh.select_mode(type="VERT")
-                bpy.ops.mesh.select_all(action = 'SELECT')
-                bpy.ops.mesh.blend_from_shape(shape='Basis', blend=1.0, add=True)
-                bpy.ops.mesh.select_all(action = 'DESELECT')
-                set_mode('OBJECT')
-
-#Propagate shapekey and other shapekeys
-def blend_from_shape(source_shape, destination_keys):
-    ob = bpy.context.active_object
-    shapekeys_list = destination_keys
-
-    set_mode('EDIT')
-    bpy.ops.mesh.select_mode(type="VERT")
-    bpy.ops.mesh.select_all(action = 'SELECT')
-
-    for shape in shapekeys_list:
-        set_active_shapekey(shape)
-        bpy.ops.mesh.blend_from_shape(shape=source_shape, blend=1.0, add=False)
-    bpy.ops.mesh.select_all(action = 'DESELECT')
-    set_mode('OBJECT')
+                set_coords(ob.data.vertices, shape_coords(shapekeys['Basis']))
+                ob.data.update()
 
 #Mirror Shapekey
 def mirror_active_shapekey(self, context, side, mirror_side):
@@ -2159,10 +2137,9 @@ def get_driver_transform_rot(shapekey, default_value):
 
     #Get Active Shapekey Driver
     if hasattr(ob, 'data') and hasattr(ob.data, 'shape_keys') and hasattr(ob.data.shape_keys, 'animation_data') and hasattr(ob.data.shape_keys.animation_data, 'drivers'):
-        for driver in ob.data.shape_keys.animation_data.drivers:
-            d_path = driver.data_path
-            if d_path == 'key_blocks["' + str(shapekey) + '"].value':
-                return degrees(1 / driver.modifiers[0].coefficients[1])
+        driver = find_driver(ob.data.shape_keys, 'key_blocks["' + str(shapekey) + '"].value')
+        if driver:
+            return degrees(1 / driver.modifiers[0].coefficients[1])
     return default_value
 #Location
 def get_driver_transform_loc(shapekey, default_value):
@@ -2172,26 +2149,17 @@ def get_driver_transform_loc(shapekey, default_value):
 
     #Get Active Shapekey Driver
     if hasattr(ob, 'data') and hasattr(ob.data, 'shape_keys') and hasattr(ob.data.shape_keys, 'animation_data') and hasattr(ob.data.shape_keys.animation_data, 'drivers'):
-        for driver in ob.data.shape_keys.animation_data.drivers:
-            d_path = driver.data_path
-            if d_path == 'key_blocks["' + str(shapekey) + '"].value':
-                return 1 / driver.modifiers[0].coefficients[1]
+        driver = find_driver(ob.data.shape_keys, 'key_blocks["' + str(shapekey) + '"].value')
+        if driver:
+            return 1 / driver.modifiers[0].coefficients[1]
     return default_value
 
 #Propagate shapekey to other shapekeys
 def blend_from_shape(source_shape, destination_keys):
     ob = bpy.context.active_object
-    shapekeys_list = destination_keys
-
-    set_mode('EDIT')
-    bpy.ops.mesh.select_mode(type="VERT")
-    bpy.ops.mesh.select_all(action = 'SELECT')
-
-    for shape in shapekeys_list:
-        set_active_shapekey(shape)
-        bpy.ops.mesh.blend_from_shape(shape=source_shape, blend=1.0, add=False)
-    bpy.ops.mesh.select_all(action = 'DESELECT')
-    set_mode('OBJECT')
+    if ob.mode != 'OBJECT':
+        set_mode('OBJECT')
+    return propagate_shape(ob, source_shape, destination_keys)
 
 #Basis Shapekey Search
 def basis_search():
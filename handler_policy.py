@@ -0,0 +1,102 @@
+import bpy
+from time import perf_counter
+from bpy.app.handlers import persistent
+
+##################################### App Handlers Policy #######################################
+
+# Runs, skips and cumulative time per handler: {handler name: [runs, skipped, seconds]}
+handler_stats = {}
+# Handlers skipped while busy, run once when playback or render ends: {handler name: function}
+deferred_handlers = {}
+rendering = [False]
+
+def use_fast_path():
+    """Returns False when the add-on preferences ask to run the handlers always"""
+    addon = bpy.context.preferences.addons.get(__package__)
+    if addon is None:
+        return True
+    return getattr(addon.preferences, 'handlers_fast_path', True)
+
+def is_busy():
+    """True while rendering, playing back or running in background, when control visibility is irrelevant"""
+    if bpy.app.background or rendering[0]:
+        return True
+    screen = bpy.context.screen
+    return bool(screen and screen.is_animation_playing)
+
+def call_handler(name, func, args):
+    stats = handler_stats.setdefault(name, [0, 0, 0.0])
+    start = perf_counter()
+    # Handlers written for one argument only get the first one, like Blender does
+    func(*args[:func.__code__.co_argcount])
+    stats[0] += 1
+    stats[2] += perf_counter() - start
+
+def policy_handler(func, defer=True):
+    """Wraps an app handler so that it is skipped while busy (see is_busy).
+       With defer, the last skipped call runs once when playback or render ends.
+    """
+    name = func.__name__
+
+    @persistent
+    def handler(*args):
+        if use_fast_path() and is_busy():
+            handler_stats.setdefault(name, [0, 0, 0.0])[1] += 1
+            if defer and not bpy.app.background:
+                deferred_handlers[name] = func
+            return
+        deferred_handlers.pop(name, None)
+        #Without animation_playback_post (before Blender 3.6) catch up on the first call after playback
+        if deferred_handlers and playback_post_handlers() is None:
+            run_deferred()
+        call_handler(name, func, args)
+
+    handler.__name__ = name
+    return handler
+
+def run_deferred():
+    """Runs the skipped handlers on the current scene, the arguments they were skipped with are stale"""
+    pending = list(deferred_handlers.items())
+    deferred_handlers.clear()
+    for name, func in pending:
+        call_handler(name, func, (bpy.context.scene,))
+
+@persistent
+def on_render_init(*args):
+    rendering[0] = True
+
+#render_post runs after every frame of an animation render, catch up once the whole render is done
+@persistent
+def on_render_done(*args):
+    rendering[0] = False
+    run_deferred()
+
+@persistent
+def on_playback_post(*args):
+    run_deferred()
+
+def playback_post_handlers():
+    """animation_playback_post handler list, None before Blender 3.6"""
+    return getattr(bpy.app.handlers, 'animation_playback_post', None)
+
+def policy_handlers():
+    handlers = bpy.app.handlers
+    pairs = [
+        (handlers.render_init, on_render_init),
+        (handlers.render_complete, on_render_done),
+        (handlers.render_cancel, on_render_done),
+    ]
+    if playback_post_handlers() is not None:
+        pairs.append((playback_post_handlers(), on_playback_post))
+    return pairs
+
+def register_policy_handlers():
+    for handlers, func in policy_handlers():
+        if func not in handlers:
+            handlers.append(func)
+
+def unregister_policy_handlers():
+    for handlers, func in policy_handlers():
+        if func in handlers:
+            handlers.remove(func)
+    deferred_handlers.clear()
@@ -0,0 +1,32 @@
+import bpy
+from time import perf_counter
+from functools import wraps
+
+##################################### Opt-in Timing #######################################
+
+# Calls and cumulative time per function: {function name: [calls, seconds]}
+timing_stats = {}
+
+def use_instrumentation():
+    """Returns True when the add-on preferences ask to time the rig functions"""
+    addon = bpy.context.preferences.addons.get(__package__)
+    if addon is None:
+        return False
+    return getattr(addon.preferences, 'rig_instrumentation', False)
+
+def instrumented(func):
+    """Decorator that records calls and time of func in timing_stats, only when enabled in the preferences"""
+    name = func.__name__
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not use_instrumentation():
+            return func(*args, **kwargs)
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            stats = timing_stats.setdefault(name, [0, 0.0])
+            stats[0] += 1
+            stats[1] += perf_counter() - start
+    return wrapper
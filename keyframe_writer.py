@@ -0,0 +1,211 @@
+import bpy
+import numpy as np
+
+##################################### Batched Keyframe Writer #######################################
+
+def rotation_path(pbone):
+    """Rotation data path used by the bone's rotation mode"""
+    if pbone.rotation_mode == 'QUATERNION':
+        return 'rotation_quaternion'
+    elif pbone.rotation_mode == 'AXIS_ANGLE':
+        return 'rotation_axis_angle'
+    return 'rotation_euler'
+
+def key_paths(pbone, key_type):
+    """Data paths keyed for a key type (Loc, Rot, Scale, LocRot, LocScale, RotScale, LocRotScale)"""
+    paths = []
+    if 'Loc' in key_type:
+        paths.append('location')
+    if 'Rot' in key_type:
+        paths.append(rotation_path(pbone))
+    if 'Scale' in key_type:
+        paths.append('scale')
+    return paths
+
+def bone_path(b_name):
+    return 'pose.bones["{}"]'.format(b_name)
+
+# Defaults of the points made by keyframe_points.add(), other preferences are set on the new points
+ADD_DEFAULTS = ('BEZIER', 'AUTO_CLAMPED', 'KEYFRAME')
+
+def keying_settings():
+    """New key interpolation, handle and keyframe types and the Only Insert Available/Needed options
+       that keyframe_insert follows
+    """
+    edit = bpy.context.preferences.edit
+    return {
+        'interpolation': edit.keyframe_new_interpolation_type,
+        'handle': edit.keyframe_new_handle_type,
+        'type': bpy.context.scene.tool_settings.keyframe_type,
+        'available': getattr(edit, 'use_keyframe_insert_available', False),
+        'needed': getattr(edit, 'use_keyframe_insert_needed', False),
+    }
+
+def tweak_strip(anim_data):
+    """NLA strip being edited in tweak mode, None out of tweak mode"""
+    if not anim_data or not anim_data.use_tweak_mode:
+        return None
+    tracks = [anim_data.nla_tracks.active] if anim_data.nla_tracks.active else []
+    for track in tracks + list(anim_data.nla_tracks):
+        for strip in track.strips:
+            if strip.active:
+                return strip
+    return None
+
+def action_frame(strip, frame):
+    """Scene frame to action frame through a tweaked strip, as keyframe_insert maps it"""
+    if strip is None:
+        return frame
+    scale = abs(strip.scale) or 1.0
+    if strip.use_reverse:
+        return (strip.frame_end + strip.action_frame_start * scale - frame) / scale
+    return strip.action_frame_start + (frame - strip.frame_start) / scale
+
+class KeyframeWriter():
+    """Collects keyframes and writes them straight into the F-Curves of the object's action.
+       F-Curves are looked up or created once, new points are added in a single keyframe_points.add()
+       and foreach_set, and handles are updated once per F-Curve on write().
+       Same semantics as keyframe_insert: a key on an existing frame replaces its value, new keys get the
+       keyframe preferences, Only Insert Available doesn't create F-Curves, Only Insert Needed skips values
+       the F-Curve already has, and frames are mapped through the strip in NLA tweak mode.
+       use_preferences=False writes the keys as given, for generated animation.
+    """
+
+    def __init__(self, obj, use_preferences=True):
+        self.obj = obj
+        self.use_preferences = use_preferences
+        # {(data_path, index): (group, {frame: value})}
+        self.keys = {}
+
+    def insert(self, data_path, index, frame, value, group=None):
+        entry = self.keys.setdefault((data_path, index), (group, {}))
+        entry[1][frame] = float(value)
+
+    def insert_path(self, owner, owner_path, prop_path, frame, group=None):
+        """Keys the current value of a property (RNA or custom ["prop"]) of owner"""
+        value = owner.path_resolve(prop_path)
+        data_path = owner_path + prop_path if prop_path.startswith('[') else owner_path + '.' + prop_path
+        if hasattr(value, '__len__'):
+            for i, v in enumerate(value):
+                self.insert(data_path, i, frame, v, group)
+        else:
+            self.insert(data_path, 0, frame, value, group)
+
+    def insert_bone(self, pbone, key_type, frame):
+        """Keys the transform channels of a pose bone, grouped by bone name"""
+        for path in key_paths(pbone, key_type):
+            self.insert_path(pbone, bone_path(pbone.name), path, frame, pbone.name)
+
+    def insert_bone_prop(self, pbone, prop_path, frame):
+        """Keys a property of a pose bone, grouped by bone name"""
+        self.insert_path(pbone, bone_path(pbone.name), prop_path, frame, pbone.name)
+
+    def get_action(self, create=True):
+        anim_data = self.obj.animation_data
+        if anim_data and anim_data.action:
+            return anim_data.action
+        if not create:
+            return None
+        anim_data = anim_data or self.obj.animation_data_create()
+        anim_data.action = bpy.data.actions.new(self.obj.name + 'Action')
+        return anim_data.action
+
+    def write(self):
+        """Writes all the collected keys, returns the number of keys written"""
+        if not self.keys:
+            return 0
+        settings = keying_settings() if self.use_preferences else None
+        available = settings and settings['available']
+        needed = settings and settings['needed']
+        action = self.get_action(create=not available)
+        if action is None:
+            self.keys.clear()
+            return 0
+        strip = tweak_strip(self.obj.animation_data) if self.use_preferences else None
+        count = 0
+        for (data_path, index), (group, values) in self.keys.items():
+            fc = action.fcurves.find(data_path, index=index)
+            if fc is None:
+                if available:
+                    continue
+                if group:
+                    fc = action.fcurves.new(data_path, index=index, action_group=group)
+                else:
+                    fc = action.fcurves.new(data_path, index=index)
+            points = fc.keyframe_points
+            old_count = len(points)
+            co = np.empty(old_count * 2, dtype=np.float32)
+            points.foreach_get('co', co)
+            existing = {f: i for i, f in enumerate(co[0::2].tolist())}
+
+            new_co = []
+            for frame, value in values.items():
+                frame = action_frame(strip, frame)
+                if needed and old_count and abs(fc.evaluate(frame) - value) < 1e-6:
+                    continue
+                i = existing.get(float(frame))
+                if i is None:
+                    new_co.extend((frame, value))
+                else:
+                    co[i * 2 + 1] = value
+                count += 1
+            if new_co:
+                points.add(len(new_co) // 2)
+                co = np.concatenate((co, np.array(new_co, dtype=np.float32)))
+            points.foreach_set('co', co)
+            if settings and new_co and (settings['interpolation'], settings['handle'], settings['type']) != ADD_DEFAULTS:
+                for i in range(old_count, len(points)):
+                    point = points[i]
+                    point.interpolation = settings['interpolation']
+                    point.handle_left_type = point.handle_right_type = settings['handle']
+                    point.type = settings['type']
+            fc.update()
+        self.keys.clear()
+        return count
+
+##################################### Keyframe Batches #######################################
+
+# Writers of the open batches, innermost last: [{object name: KeyframeWriter}]
+batch_stack = []
+
+def flush_batches(*args):
+    """Writes the pending keys of every open batch. Runs on frame change, so that the action
+       is complete before a frame is evaluated, as it would be with keyframe_insert.
+    """
+    for writers in batch_stack:
+        for writer in writers.values():
+            writer.write()
+
+def batch_writer(obj):
+    """KeyframeWriter of obj in the innermost open batch, None when no batch is open"""
+    if not batch_stack:
+        return None
+    writers = batch_stack[-1]
+    writer = writers.get(obj.name)
+    if writer is None:
+        writer = writers[obj.name] = KeyframeWriter(obj)
+    return writer
+
+def keyframe_batch(func):
+    """Decorator for operator execute methods: the insert helpers share one writer per object
+       and the keys are written once when the operator ends, or before the frame changes.
+       Nested operators flush the outer batch first.
+    """
+    # Blender checks the argument count of operator methods, keep (self, context)
+    def wrapper(self, context):
+        flush_batches()
+        handlers = bpy.app.handlers.frame_change_pre
+        if flush_batches not in handlers:
+            handlers.append(flush_batches)
+        batch_stack.append({})
+        try:
+            return func(self, context)
+        finally:
+            for writer in batch_stack.pop().values():
+                writer.write()
+            if not batch_stack and flush_batches in handlers:
+                handlers.remove(flush_batches)
+
+    wrapper.__name__ = func.__name__
+    wrapper.__doc__ = func.__doc__
+    return wrapper
@@ -0,0 +1,321 @@
+import bpy
+import os
+import json
+import struct
+import numpy as np
+from time import perf_counter
+from .keyframe_writer import KeyframeWriter
+
+##################################### Vectorized Mesh Baking #######################################
+
+def get_coords(collection):
+    """Flat float32 array with the co of every vertex or shape key point of a collection"""
+    co = np.empty(len(collection) * 3, dtype=np.float32)
+    collection.foreach_get('co', co)
+    return co
+
+def set_coords(collection, co):
+    collection.foreach_set('co', np.ascontiguousarray(co, dtype=np.float32).ravel())
+
+def disable_subsurf(objects):
+    """Turns off the Subdivision Surface modifiers of objects, returns their states for restore_subsurf"""
+    subsurf_state = []
+    for ob in objects:
+        for mod in ob.modifiers:
+            if mod.type == 'SUBSURF':
+                subsurf_state.append((mod, mod.show_viewport))
+                mod.show_viewport = False
+    return subsurf_state
+
+def restore_subsurf(subsurf_state):
+    for mod, state in subsurf_state:
+        mod.show_viewport = state
+
+def read_evaluated_coords(objects, depsgraph, timings=None):
+    """Vertex coordinates of mesh objects in an evaluated depsgraph: {object name: flat co array}.
+       Every evaluated mesh is cleared right after reading it. Reading times are added to timings.
+    """
+    coords = {}
+    for ob in objects:
+        start = perf_counter()
+        ob_eval = ob.evaluated_get(depsgraph)
+        mesh = ob_eval.to_mesh()
+        try:
+            coords[ob.name] = get_coords(mesh.vertices)
+        finally:
+            ob_eval.to_mesh_clear()
+        if timings is not None:
+            timings[ob.name] = timings.get(ob.name, 0.0) + perf_counter() - start
+    return coords
+
+def evaluated_coords(objects, timings=None):
+    """Evaluated vertex coordinates of mesh objects without Subdivision Surface,
+       the depsgraph is evaluated once for all objects
+    """
+    subsurf_state = disable_subsurf(objects)
+    try:
+        return read_evaluated_coords(objects, bpy.context.evaluated_depsgraph_get(), timings)
+    finally:
+        restore_subsurf(subsurf_state)
+
+def mute_active_shapes(key, keep=None):
+    """Mutes the shape keys that influenced the baked shape to avoid double transforms"""
+    key_blocks = key.key_blocks
+    count = len(key_blocks)
+    values = np.empty(count, dtype=np.float32)
+    mute = np.empty(count, dtype=bool)
+    key_blocks.foreach_get('value', values)
+    key_blocks.foreach_get('mute', mute)
+    mute |= values > 0.1
+    if keep is not None:
+        mute[keep] = False
+    key_blocks.foreach_set('mute', mute)
+
+def bake_coords(ob, co, to_shape=False):
+    """Writes baked coordinates to the Basis, to the mesh when it has no shape keys,
+       or to a new Baked_shape key when to_shape is set
+    """
+    if not to_shape:
+        if ob.data.shape_keys:
+            key = ob.data.shape_keys
+            set_coords(key.reference_key.data, co)
+            mute_active_shapes(key)
+            ob.active_shape_key_index = 0
+        else:
+            set_coords(ob.data.vertices, co)
+        ob.data.update()
+        return
+
+    if not ob.data.shape_keys:
+        Basis = ob.shape_key_add(from_mix=False)
+        Basis.name = 'Basis'
+    baked_shape = ob.shape_key_add(from_mix=False)
+    baked_shape.name = 'Baked_shape'
+    baked_shape.value = 1
+    set_coords(baked_shape.data, co)
+    key_blocks = ob.data.shape_keys.key_blocks
+    index = key_blocks.find(baked_shape.name)
+    mute_active_shapes(ob.data.shape_keys, keep=index)
+    ob.active_shape_key_index = index
+    ob.data.update()
+
+def bake_mesh_objects(objects, to_shape=False):
+    """Bakes the current deformation of mesh objects, returns {object name: seconds}.
+       Objects whose evaluated vertex count differs from the mesh are skipped and left out of the result.
+    """
+    timings = {}
+    coords = evaluated_coords(objects, timings)
+    for ob in objects:
+        co = coords[ob.name]
+        if len(co) != len(ob.data.vertices) * 3:
+            print('BlenRig: ' + ob.name + ' not baked, its modifiers change the vertex count')
+            del timings[ob.name]
+            continue
+        start = perf_counter()
+        bake_coords(ob, co, to_shape)
+        timings[ob.name] += perf_counter() - start
+    return timings
+
+##################################### Point Cache Sequences #######################################
+
+# A point cache is a directory with a cache.json manifest and one float32 .npy file per object,
+# shaped (frames, points, 3). Delta caches store offsets from the undeformed mesh, saved as <name>.rest.npy.
+
+def cache_file_names(ob_names):
+    """Unique file names for objects: {object name: file name without extension}.
+       clean_name maps names like "Body.001" and "Body_001" to the same one, those get a number.
+       Compared without case for case insensitive file systems.
+    """
+    names = {}
+    used = set()
+    for ob_name in ob_names:
+        base = name = bpy.path.clean_name(ob_name)
+        number = 1
+        while name.lower() in used:
+            number += 1
+            name = base + '_' + str(number)
+        used.add(name.lower())
+        names[ob_name] = name
+    return names
+
+class SequenceBake():
+    """Bakes the deformation of mesh objects on every frame of a range into a point cache,
+       one frame per step(), so that long ranges can run from a modal operator with progress and cancel.
+       Frames are streamed into memory-mapped .npy files and flushed every chunk_size frames,
+       only the pages being written are kept in memory.
+    """
+
+    def __init__(self, context, objects, frames, directory, use_delta=False, chunk_size=16):
+        self.scene = context.scene
+        self.objects = list(objects)
+        self.frames = list(frames)
+        self.directory = bpy.path.abspath(directory)
+        self.use_delta = use_delta
+        self.chunk_size = max(1, chunk_size)
+        self.index = 0
+        self.timings = {}
+        self.frame_current = self.scene.frame_current
+        os.makedirs(self.directory, exist_ok=True)
+
+        self.caches = {}
+        self.rest = {}
+        self.manifest = {'frame_start': self.frames[0] if self.frames else 0, 'frames': self.frames,
+                         'delta': use_delta, 'objects': {}}
+        file_names = cache_file_names([ob.name for ob in self.objects])
+        for ob in self.objects:
+            points = len(ob.data.vertices)
+            name = file_names[ob.name]
+            entry = {'file': name + '.npy', 'points': points, 'rest': None}
+            self.caches[ob.name] = np.lib.format.open_memmap(os.path.join(self.directory, entry['file']),
+                mode='w+', dtype=np.float32, shape=(len(self.frames), points, 3))
+            if use_delta:
+                entry['rest'] = name + '.rest.npy'
+                self.rest[ob.name] = get_coords(ob.data.vertices)
+                np.save(os.path.join(self.directory, entry['rest']), self.rest[ob.name].reshape(-1, 3))
+            self.manifest['objects'][ob.name] = entry
+        self.subsurf_state = disable_subsurf(self.objects)
+
+    def __len__(self):
+        return len(self.frames)
+
+    def step(self):
+        """Bakes the next frame, returns False when there are no frames left"""
+        if self.index >= len(self.frames):
+            return False
+        self.scene.frame_set(self.frames[self.index])
+        coords = read_evaluated_coords(self.objects, bpy.context.evaluated_depsgraph_get(), self.timings)
+        for name, co in coords.items():
+            cache = self.caches[name]
+            if len(co) != cache.shape[1] * 3:
+                # The vertex count changed on this frame, keep the frame at rest
+                co = get_coords(bpy.data.objects[name].data.vertices)
+            if self.use_delta:
+                co = co - self.rest[name]
+            cache[self.index] = co.reshape(-1, 3)
+        self.index += 1
+        if self.index % self.chunk_size == 0:
+            for cache in self.caches.values():
+                cache.flush()
+        return True
+
+    def close(self):
+        restore_subsurf(self.subsurf_state)
+        self.subsurf_state = []
+        for cache in self.caches.values():
+            cache.flush()
+        self.caches.clear()
+        self.scene.frame_set(self.frame_current)
+
+    def finish(self):
+        """Closes the cache files and writes the manifest, returns the path of the manifest"""
+        self.close()
+        path = os.path.join(self.directory, 'cache.json')
+        with open(path, 'w') as f:
+            json.dump(self.manifest, f, indent=2)
+        return path
+
+    def cancel(self):
+        """Closes and removes the cache files"""
+        self.close()
+        for entry in self.manifest['objects'].values():
+            for file in (entry['file'], entry['rest']):
+                if file and os.path.exists(os.path.join(self.directory, file)):
+                    os.remove(os.path.join(self.directory, file))
+
+class PointCache():
+    """Reads a point cache written by SequenceBake, frames are memory-mapped and read on demand"""
+
+    def __init__(self, filepath):
+        filepath = bpy.path.abspath(filepath)
+        if os.path.isdir(filepath):
+            filepath = os.path.join(filepath, 'cache.json')
+        self.directory = os.path.dirname(filepath)
+        with open(filepath) as f:
+            self.manifest = json.load(f)
+        self.frames = self.manifest['frames']
+        self.objects = self.manifest['objects']
+
+    def points(self, ob_name):
+        entry = self.objects.get(ob_name)
+        return entry['points'] if entry else None
+
+    def frame_coords(self, ob_name):
+        """Yields (frame, flat absolute co array) for every frame of an object"""
+        entry = self.objects[ob_name]
+        cache = np.load(os.path.join(self.directory, entry['file']), mmap_mode='r')
+        rest = None
+        if entry['rest']:
+            rest = np.load(os.path.join(self.directory, entry['rest'])).ravel()
+        for i, frame in enumerate(self.frames):
+            co = np.asarray(cache[i], dtype=np.float32).ravel()
+            yield frame, (co + rest if rest is not None else co)
+
+def import_cache_shape_keys(ob, cache, prefix='Frame_'):
+    """Adds a shape key per cached frame, keyed to be fully on at its frame only.
+       Returns the number of shape keys added.
+    """
+    if not ob.data.shape_keys:
+        Basis = ob.shape_key_add(from_mix=False)
+        Basis.name = 'Basis'
+    writer = KeyframeWriter(ob.data.shape_keys, use_preferences=False)
+    count = 0
+    for frame, co in cache.frame_coords(ob.name):
+        shape = ob.shape_key_add(name=prefix + str(frame).zfill(4), from_mix=False)
+        set_coords(shape.data, co)
+        data_path = 'key_blocks["{}"].value'.format(shape.name)
+        writer.insert(data_path, 0, frame - 1, 0.0)
+        writer.insert(data_path, 0, frame, 1.0)
+        writer.insert(data_path, 0, frame + 1, 0.0)
+        count += 1
+    writer.write()
+    ob.data.update()
+    return count
+
+def write_pc2(cache, ob_name, filepath):
+    """Streams the frames of an object into a PC2 file readable by the Mesh Cache modifier"""
+    frames = cache.frames
+    sample_rate = frames[1] - frames[0] if len(frames) > 1 else 1
+    with open(filepath, 'wb') as f:
+        f.write(struct.pack('<12siiffi', b'POINTCACHE2\0', 1, cache.points(ob_name), frames[0], sample_rate, len(frames)))
+        for frame, co in cache.frame_coords(ob_name):
+            f.write(co.astype('<f4').tobytes())
+
+# Deforming modifiers whose result is in the cache, the Mesh Cache modifier overwrites them
+CACHED_DEFORM_MODIFIERS = ('ARMATURE', 'MESH_DEFORM', 'SURFACE_DEFORM', 'LATTICE', 'HOOK', 'CORRECTIVE_SMOOTH',
+    'LAPLACIANSMOOTH', 'SMOOTH', 'SHRINKWRAP', 'CAST', 'SIMPLE_DEFORM', 'DISPLACE', 'WARP', 'WAVE')
+
+def move_modifier(ob, mod, index):
+    modifiers = ob.modifiers
+    if hasattr(modifiers, 'move'):
+        modifiers.move(modifiers.find(mod.name), index)
+    else:
+        bpy.ops.object.modifier_move_to_index({'object': ob}, modifier=mod.name, index=index)
+
+def import_cache_modifier(ob, cache):
+    """Converts the frames of an object to PC2 next to the cache and plays them with a Mesh Cache modifier.
+       The cache was baked without Subdivision Surface, so the modifier goes before the first one.
+       It overwrites the positions given by the deforming modifiers above it, those are turned off.
+       Returns the modifier and the names of the modifiers turned off.
+    """
+    filepath = os.path.join(cache.directory, os.path.splitext(cache.objects[ob.name]['file'])[0] + '.pc2')
+    write_pc2(cache, ob.name, filepath)
+    mod = ob.modifiers.get('BlenRig_Point_Cache')
+    if mod is None or mod.type != 'MESH_CACHE':
+        mod = ob.modifiers.new('BlenRig_Point_Cache', 'MESH_CACHE')
+    mod.cache_format = 'PC2'
+    mod.deform_mode = 'OVERWRITE'
+    mod.filepath = filepath
+    mod.frame_start = cache.frames[0]
+
+    subsurf = [i for i, m in enumerate(ob.modifiers) if m.type == 'SUBSURF']
+    if subsurf and ob.modifiers.find(mod.name) > subsurf[0]:
+        move_modifier(ob, mod, subsurf[0])
+
+    disabled = []
+    for m in ob.modifiers:
+        if m == mod:
+            break
+        if m.type in CACHED_DEFORM_MODIFIERS and (m.show_viewport or m.show_render):
+            m.show_viewport = m.show_render = False
+            disabled.append(m.name)
+    return mod, disabled
@@ -1,5 +1,10 @@
 import bpy
 from .search_functions import *
+from time import perf_counter
+from .deformer_graph import get_deformer_graph
+from .bake_pipeline import plan_bake_all, format_plan, execute_bake_plan, format_report, unbind_deformers, \
+    reset_constraints, unparent_children, reparent_children, reset_object_hooks
+from .mesh_bake import bake_mesh_objects, SequenceBake, PointCache, import_cache_shape_keys, import_cache_modifier
 
 ################################# BAKING OPERATORS ##########################################################
 
@@ -20,130 +25,163 @@ class ARMATURE_OT_mesh_pose_baker(bpy.types.Operator):
     #Baking
     def bake(self, context):
         props = context.window_manager.blenrig_6_props
+        self.timings = {}
         if not bpy.context.object:
             return False
-        old_ob = bpy.context.active_object
-        bake_meshes = [ob.name for ob in bpy.context.selected_objects if ob.type=="MESH"]
+        bake_meshes = [ob for ob in bpy.context.selected_objects if ob.type=="MESH"]
+        self.timings = bake_mesh_objects(bake_meshes, props.bake_to_shape)
+        for name, seconds in self.timings.items():
+            print('BlenRig: baked ' + name + ' in ' + '{:.3f}'.format(seconds) + 's')
 
-        for name in bake_meshes:
-            if name in bpy.data.objects:
-                ob = bpy.data.objects[name]
-
-            bpy.context.view_layer.objects.active = ob
-
-            # Turn off SUBSURF for baking
-            for mod in ob.modifiers:
-                if mod.type == 'SUBSURF':
-                    old_state = mod.show_viewport
-                    mod.show_viewport = False
-
-            # --- get a mesh from the object ---
-            depsgraph = bpy.context.evaluated_depsgraph_get()
-            mesh_owner = ob.evaluated_get(depsgraph)
-            mesh = mesh_owner.to_mesh()
-
-            for mod in ob.modifiers:
-                if mod.type == 'SUBSURF':
-                    mod.show_viewport = old_state
-
-            # If Bake to shape option is off
-            if props.bake_to_shape == False:
-                # Check if there are shapekeys in object
-                try:
-                    if ob.data.shape_keys.key_blocks:
-                        key = ob.data.shape_keys
-                        shapekeys = key.key_blocks
-                        # Transfer vertex locations to Basis key
-                        for vert in ob.data.vertices:
-                            shapekeys['Basis'].data[vert.index].co = mesh.vertices[vert.index].co
-
-                        #Disable Shapekeys that influenced the Baked Shape to avoid double transforms
-                        for i in range(len(ob.data.shape_keys.key_blocks)):
-                            shape = ob.data.shape_keys.key_blocks[i]
-                            if shape.value > 0.1:
-                                shape.mute = True
-
-                        # Make baked shape active
-                        for i in range(len(shapekeys)):
-                            shape = shapekeys[i]
-                            if shape.name == 'Basis':
-                                ob.active_shape_key_index = i
-                except (AttributeError):
-                    # Transfer vertex locations to Mesh
-                    for vert in ob.data.vertices:
-                        vert.co = mesh.vertices[vert.index].co
-
-            # If Bake to shape option is on
-            else:
-                # Check if there are shapekeys in object
-                try:
-                    ob.data.shape_keys.key_blocks
-                except (AttributeError):
-                    Basis = ob.shape_key_add(from_mix=False)
-                    Basis.name = 'Basis'
-
-                # Create new shape for storing the bake
-
-                baked_shape = ob.shape_key_add(from_mix=False)
-                baked_shape.name = 'Baked_shape'
-                baked_shape.value = 1
-
-                # Transfer vertex locations
-                for vert in ob.data.vertices:
-                    baked_shape.data[vert.index].co = mesh.vertices[vert.index].co
+    #Unbind Mdef modifier if object is bound
+    def mdef_unbind(self, context):
+        if not bpy.context.object:
+            return False
+        unbind_deformers(context, [ob for ob in bpy.context.selected_objects if ob.type=="MESH"])
 
-                #Disable Shapekeys that influenced the Baked Shape to avoid double transforms
-                for i in range(len(ob.data.shape_keys.key_blocks)):
-                    shape = ob.data.shape_keys.key_blocks[i]
-                    if shape.value > 0.1:
-                        shape.mute = True
+    def execute(self, context):
+        self.bake(context)
+        self.mdef_unbind(context)
+        self.report({'INFO'}, "Baking done: {} objects in {:.3f}s".format(len(self.timings), sum(self.timings.values())))
+        return{'FINISHED'}
 
-                # Make baked shape active
-                for i in range(len(ob.data.shape_keys.key_blocks)):
-                    shape = ob.data.shape_keys.key_blocks[i]
-                    if shape.name == baked_shape.name:
-                        shape.mute = False
-                        ob.active_shape_key_index = i
+# Mesh Sequence Baker operator
+class ARMATURE_OT_mesh_sequence_baker(bpy.types.Operator):
+    bl_label = "BlenRig 6 Mesh Sequence Baker"
+    bl_idname = "blenrig.mesh_sequence_baker"
+    bl_description = "Bake the deformation of the selected meshes on a range of frames to a point cache. Esc cancels"
+    bl_options = {'REGISTER'}
 
-        # Remove unused baked mesh
-        ob.to_mesh_clear()
-        bpy.context.view_layer.objects.active = old_ob
+    directory : bpy.props.StringProperty(name="Cache Directory", subtype='DIR_PATH', default="//blenrig_cache/")
+    frame_start : bpy.props.IntProperty(name="Start", default=1)
+    frame_end : bpy.props.IntProperty(name="End", default=250)
+    use_delta : bpy.props.BoolProperty(name="Delta from Rest", default=False, description="Store offsets from the undeformed mesh instead of positions")
+    chunk_size : bpy.props.IntProperty(name="Chunk Size", default=16, min=1, description="Frames written between flushes to disk")
 
+    _timer = None
+    _bake = None
 
-    #Unbind Mdef modifier if object is bound
-    def mdef_unbind(self, context):
+    @classmethod
+    def poll(cls, context):
         if not bpy.context.object:
             return False
+        return (bpy.context.object.type == "MESH" and context.mode=='OBJECT')
 
-        old_ob = bpy.context.active_object
+    def invoke(self, context, event):
+        self.frame_start = context.scene.frame_start
+        self.frame_end = context.scene.frame_end
+        return context.window_manager.invoke_props_dialog(self)
 
-        bake_meshes = [ob.name for ob in bpy.context.selected_objects if ob.type=="MESH"]
-        for name in bake_meshes:
-            if name in bpy.data.objects:
-                ob = bpy.data.objects[name]
-            bpy.context.view_layer.objects.active = ob
+    def execute(self, context):
+        bake_meshes = [ob for ob in bpy.context.selected_objects if ob.type=="MESH"]
+        frames = range(min(self.frame_start, self.frame_end), max(self.frame_start, self.frame_end) + 1)
+        self._bake = SequenceBake(context, bake_meshes, frames, self.directory, self.use_delta, self.chunk_size)
+        self._start = perf_counter()
+        #Without a window (scripts, background) bake in one go
+        if context.window is None:
+            try:
+                while self._bake.step():
+                    pass
+            except Exception:
+                self._bake.cancel()
+                raise
+            return self.finish(context)
+
+        wm = context.window_manager
+        wm.progress_begin(0, len(self._bake))
+        self._timer = wm.event_timer_add(0.01, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type in {'ESC', 'RIGHTMOUSE'}:
+            self.cancel(context)
+            self.report({'WARNING'}, "Sequence bake cancelled")
+            return {'CANCELLED'}
+        if event.type != 'TIMER':
+            return {'RUNNING_MODAL'}
+
+        #Bake frames for a short time slice, then let the UI breathe
+        slice_end = perf_counter() + 0.05
+        try:
+            while perf_counter() < slice_end:
+                if not self._bake.step():
+                    self.end_progress(context)
+                    return self.finish(context)
+        except Exception as error:
+            self.cancel(context)
+            self.report({'ERROR'}, "Sequence bake failed: " + str(error))
+            return {'CANCELLED'}
+        context.window_manager.progress_update(self._bake.index)
+        return {'RUNNING_MODAL'}
+
+    def cancel(self, context):
+        """Restores the modifiers and frame and removes the partial cache files, also called by Blender when the modal is stopped"""
+        if self._bake:
+            self._bake.cancel()
+            self._bake = None
+        self.end_progress(context)
+
+    def end_progress(self, context):
+        wm = context.window_manager
+        wm.progress_end()
+        if self._timer:
+            wm.event_timer_remove(self._timer)
+            self._timer = None
+
+    def finish(self, context):
+        path = self._bake.finish()
+        for name, seconds in self._bake.timings.items():
+            print('BlenRig: read ' + name + ' in ' + '{:.3f}'.format(seconds) + 's')
+        self.report({'INFO'}, "Baked {} frames to {} in {:.2f}s".format(len(self._bake), path, perf_counter() - self._start))
+        return {"FINISHED"}
+
+# Point Cache Importer operator
+class ARMATURE_OT_import_point_cache(bpy.types.Operator):
+    bl_label = "BlenRig 6 Import Point Cache"
+    bl_idname = "blenrig.import_point_cache"
+    bl_description = "Load a point cache baked with the Mesh Sequence Baker on the selected meshes"
+    bl_options = {'REGISTER', 'UNDO'}
 
-            # unbind mdef modifiers
-            for i in range(len(ob.modifiers)):
-                mod = ob.modifiers[i]
-                if mod.type in ['MESH_DEFORM']:
-                    if mod.is_bound == True:
-                        bpy.ops.object.meshdeform_bind(modifier=mod.name)
+    filepath : bpy.props.StringProperty(name="Cache", subtype='FILE_PATH')
+    filter_glob : bpy.props.StringProperty(default="cache.json", options={'HIDDEN'})
+    mode : bpy.props.EnumProperty(
+        name = "Import As",
+        items = (('SHAPE_KEYS', "Shape Keys", "One shape key per frame, keyed on its frame"),
+                 ('MESH_CACHE', "Mesh Cache Modifier", "Convert the cache to PC2 and play it with a Mesh Cache modifier")),
+        default = 'MESH_CACHE')
 
-            # unbind sdef modifiers
-            for i in range(len(ob.modifiers)):
-                mod = ob.modifiers[i]
-                if mod.type in ['SURFACE_DEFORM']:
-                    if mod.is_bound == True:
-                        bpy.ops.object.surfacedeform_bind(modifier=mod.name)
+    @classmethod
+    def poll(cls, context):
+        if not bpy.context.object:
+            return False
+        return (bpy.context.object.type == "MESH" and context.mode=='OBJECT')
 
-        bpy.context.view_layer.objects.active = old_ob
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
 
     def execute(self, context):
-        self.bake(context)
-        self.mdef_unbind(context)
-        self.report({'INFO'}, "Baking done")
-        return{'FINISHED'}
+        try:
+            cache = PointCache(self.filepath)
+        except (OSError, ValueError, KeyError):
+            self.report({'ERROR'}, "Could not read the point cache")
+            return {"CANCELLED"}
+
+        imported = 0
+        for ob in [ob for ob in bpy.context.selected_objects if ob.type=="MESH"]:
+            if cache.points(ob.name) != len(ob.data.vertices):
+                self.report({'WARNING'}, ob.name + " not in the cache or with a different vertex count")
+                continue
+            if self.mode == 'SHAPE_KEYS':
+                import_cache_shape_keys(ob, cache)
+            else:
+                mod, disabled = import_cache_modifier(ob, cache)
+                if disabled:
+                    print('BlenRig: ' + ob.name + ' plays the point cache, turned off ' + ', '.join(disabled))
+            imported += 1
+        self.report({'INFO'}, "Point cache loaded on {} objects".format(imported))
+        return {"FINISHED"}
 
 # Hook Reset operator
 class ARMATURE_OT_reset_hooks(bpy.types.Operator):
@@ -255,21 +293,13 @@ class ARMATURE_OT_reset_deformers(bpy.types.Operator):
         deformers_collection = []
         selected_deformers = []
 
-        for ob in bpy.data.objects:
-            if ob.type in 'LATTICE' or 'CURVE':
-                for mod in ob.modifiers:
-                    if mod.type in 'HOOK':
-                        if mod.object.name == bpy.context.object.name:
-                            # Toggle on active collections
-                            for coll in bpy.data.collections:
-                                for coll_ob in coll.objects:
-                                    if ob.name == coll_ob.name:
-                                        deformers_collection.append(coll.name)
-                            for coll in bpy.data.collections:
-                                if coll.name in deformers_collection:
-                                    coll.hide_viewport = False
-                            ob.select_set(True)
-                            selected_deformers.append(ob.name)
+        for ob in get_deformer_graph().hooked(old_active.name):
+            # Toggle on active collections
+            for coll in ob.users_collection:
+                deformers_collection.append(coll.name)
+                coll.hide_viewport = False
+            ob.select_set(True)
+            selected_deformers.append(ob.name)
 
         for name in selected_deformers:
             if name in bpy.data.objects:
@@ -341,6 +371,8 @@ class ARMATURE_OT_armature_baker_all_part_1(bpy.types.Operator):
     bl_description = "Bake current pose to armature"
     bl_options = {'REGISTER', 'UNDO'}
 
+    dry_run : bpy.props.BoolProperty(name="Dry Run", default=False, description="Only print the bake plan to the console", options={'SKIP_SAVE'})
+
     @classmethod
     def poll(cls, context):
         if not bpy.context.object:
@@ -350,14 +382,14 @@ class ARMATURE_OT_armature_baker_all_part_1(bpy.types.Operator):
                 context.mode=='POSE' or 'EDIT_ARMATURE')
 
     def bake_all_1(self, context):
-        props = context.window_manager.blenrig_6_props
         arm = context.active_object
         #Get Objects List
-        mdef_cage = mdef_search('MESH_DEFORM')[1]
-        sdef_cage = mdef_search('SURFACE_DEFORM')[1]
+        graph = get_deformer_graph(refresh=True)
+        plan, skipped = plan_bake_all(arm.name, graph)
+        print(format_plan(plan, skipped))
+        if self.dry_run:
+            return False
         mdef_objects = search_mod('MESH_DEFORM')[1]
-        armature_objects = search_mod('ARMATURE')[1]
-        sdef_objects = search_mod('SURFACE_DEFORM')[1]
         #Link Objects to Temp Collection
         from .guides.utils import blenrig_temp_unlink
         blenrig_temp_unlink()
@@ -366,87 +398,10 @@ class ARMATURE_OT_armature_baker_all_part_1(bpy.types.Operator):
         blenrig_temp('MESH_DEFORM')
         blenrig_temp('ARMATURE')
         blenrig_temp('SURFACE_DEFORM')
-        #Bake Surface Deform Objects First
-        bpy.ops.object.mode_set(mode='OBJECT')
-        bpy.ops.object.select_all(action='DESELECT')
-        for ob in sdef_objects:
-            if ob not in mdef_cage and ob not in sdef_cage:
-                context.view_layer.objects.active = bpy.data.objects[ob]
-                bpy.data.objects[ob].select_set(1)
-                if hasattr(context.active_object, 'data'):
-                    if context.active_object.data.shape_keys:
-                        if not props.bake_to_shape:
-                            props.bake_to_shape = True
-                    else:
-                        props.bake_to_shape = False
-                    bpy.ops.blenrig.mesh_pose_baker()
-                    bpy.ops.object.select_all(action='DESELECT')
-        context.view_layer.objects.active = arm
-        bpy.ops.object.mode_set(mode='POSE')
-        #Bake Mesh Deform Objects Second
-        bpy.ops.object.mode_set(mode='OBJECT')
-        bpy.ops.object.select_all(action='DESELECT')
-        for ob in mdef_objects:
-            if ob not in mdef_cage and ob not in sdef_cage:
-                context.view_layer.objects.active = bpy.data.objects[ob]
-                bpy.data.objects[ob].select_set(1)
-                if hasattr(context.active_object, 'data'):
-                    if context.active_object.data.shape_keys:
-                        if not props.bake_to_shape:
-                            props.bake_to_shape = True
-                    else:
-                        props.bake_to_shape = False
-                    bpy.ops.blenrig.mesh_pose_baker()
-                    bpy.ops.object.select_all(action='DESELECT')
-        context.view_layer.objects.active = arm
-        bpy.ops.object.mode_set(mode='POSE')
-        #Bake Armature Objects Third
-        bpy.ops.object.mode_set(mode='OBJECT')
-        bpy.ops.object.select_all(action='DESELECT')
-        for ob in armature_objects:
-            if ob not in mdef_cage and ob not in mdef_objects and ob not in sdef_objects:
-                context.view_layer.objects.active = bpy.data.objects[ob]
-                bpy.data.objects[ob].select_set(1)
-                if hasattr(context.active_object, 'data'):
-                    if context.active_object.data.shape_keys:
-                        if not props.bake_to_shape:
-                            props.bake_to_shape = True
-                    else:
-                        props.bake_to_shape = False
-                    bpy.ops.blenrig.mesh_pose_baker()
-                    bpy.ops.object.select_all(action='DESELECT')
-        context.view_layer.objects.active = arm
-        bpy.ops.object.mode_set(mode='POSE')
-        #Bake Sdef Cages Last
-        bpy.ops.object.mode_set(mode='OBJECT')
-        bpy.ops.object.select_all(action='DESELECT')
-        for ob in sdef_cage:
-            context.view_layer.objects.active = bpy.data.objects[ob]
-            bpy.data.objects[ob].select_set(1)
-            if hasattr(context.active_object, 'data'):
-                if context.active_object.data.shape_keys:
-                    if not props.bake_to_shape:
-                        props.bake_to_shape = True
-                else:
-                    props.bake_to_shape = False
-                bpy.ops.blenrig.mesh_pose_baker()
-                bpy.ops.object.select_all(action='DESELECT')
-        context.view_layer.objects.active = arm
-        bpy.ops.object.mode_set(mode='POSE')
-        #Bake Mdef Cages Last
+        #Bake Surface Deform, Mesh Deform and Armature Objects, then the Cages
         bpy.ops.object.mode_set(mode='OBJECT')
-        bpy.ops.object.select_all(action='DESELECT')
-        for ob in mdef_cage:
-            context.view_layer.objects.active = bpy.data.objects[ob]
-            bpy.data.objects[ob].select_set(1)
-            if hasattr(context.active_object, 'data'):
-                if context.active_object.data.shape_keys:
-                    if not props.bake_to_shape:
-                        props.bake_to_shape = True
-                else:
-                    props.bake_to_shape = False
-                bpy.ops.blenrig.mesh_pose_baker()
-                bpy.ops.object.select_all(action='DESELECT')
+        self.bake_report = execute_bake_plan(context, plan)
+        print(format_report(self.bake_report))
         context.view_layer.objects.active = arm
         bpy.ops.object.mode_set(mode='POSE')
         #Bake Armature
@@ -482,8 +437,11 @@ class ARMATURE_OT_armature_baker_all_part_1(bpy.types.Operator):
         context.scene.cursor.location = [0,0,0]
 
     def execute(self, context):
-        self.bake_all_1(context)
-        self.report({'INFO'}, "1º Baking part done")
+        self.bake_report = []
+        if self.bake_all_1(context) is False:
+            self.report({'INFO'}, "Bake plan printed to the console")
+            return{'FINISHED'}
+        self.report({'INFO'}, "1º Baking part done, meshes baked in {:.2f}s".format(sum(r[1] for r in self.bake_report)))
         return{'FINISHED'}
 
 class ARMATURE_OT_armature_baker_all_part_2(bpy.types.Operator):
@@ -536,115 +494,32 @@ class ARMATURE_OT_advanced_armature_baker(bpy.types.Operator):
                 context.mode=='POSE')
 
     def bake_armature(self, context):
-
-        # preparing scene
-        bpy.ops.object.mode_set(mode='OBJECT')
-        old_active = bpy.context.active_object
-        old_selected = bpy.context.selected_objects
-
-        # activating lattices collection:
-        blenrig_temp_parent(1)
-
-        for ob in old_selected:
-            ob.select_set(False)
-
+        armobj = bpy.context.active_object
 
         # unparenting external objects related to the armature
-        deformers_collection = []
-        parent_pairs = []
-        for ob in bpy.data.objects:
-            if ob.parent is not None:
-                if ob.parent.name == bpy.context.object.name:
-                    ob.select_set(True)
-                    parent_pairs.append([ob, ob.parent, ob.parent_bone])
-                    bpy.ops.object.parent_clear(type='CLEAR_KEEP_TRANSFORM')
-
-        #Back to Armature
-        for ob in bpy.context.selected_objects:
-            ob.select_set(False)
-        bpy.context.view_layer.objects.active = old_active
-        for ob in old_selected:
-            ob.select_set(True)
-
-        bpy.ops.object.mode_set(mode='POSE')
-        posebones = bpy.context.object.pose.bones
+        parent_pairs = unparent_children(armobj)
 
         # Bake Armature
         bpy.ops.pose.armature_apply()
 
-        arm = bpy.context.object.data
-
         # Reset Constraints
-        bpy.ops.blenrig.reset_constraints()
-
-        bpy.ops.object.mode_set(mode='OBJECT')
-        for ob in bpy.context.selected_objects:
-            ob.select_set(False)
+        reset_constraints(armobj)
+        context.view_layer.update()
 
         # re-parenting external objects related to the armature
-        for pp in parent_pairs:
-            ob, parent, bone = pp
-            ob.parent = parent
-            ob.parent_type = 'BONE'
-            ob.parent_bone = bone
-            #Reseting Hooks
-            ob.select_set(True)
-            bpy.ops.blenrig.reset_hooks()
+        reparent_children(armobj, parent_pairs)
+        context.view_layer.update()
 
-        #Back to Armature
-        for ob in bpy.context.selected_objects:
-            ob.select_set(False)
-        bpy.context.view_layer.objects.active = old_active
-        for ob in old_selected:
-            ob.select_set(True)
-
-        bpy.ops.object.mode_set(mode='POSE')
-
-        #deactivating lattices collection:
-        blenrig_temp_parent(0)
+        #Reseting Hooks
+        reset_object_hooks([pp[0] for pp in parent_pairs if pp[0].type in ('LATTICE', 'CURVE')])
 
     def armature_update_values(self, context):
-
-        armobj = bpy.context.active_object
-
-        #Bone Length Properties Update
-        for b in armobj.pose.bones:
-            if b.keys() != '[]':
-                if 'b_length_L' in b.keys():
-                    b['b_length_L'] = b.bone.length
-                if 'b_length_R' in b.keys():
-                    b['b_length_R'] = b.bone.length
-                if 'b_length' in b.keys():
-                    b['b_length'] = b.bone.length
-        #Floor constraints distance calculation
-        for b in armobj.pose.bones:
-            for C in b.constraints:
-                if C.type == 'FLOOR':
-                    if 'Floor_Lips' in C.name:
-                        C.offset = abs((b.head[2] - armobj.pose.bones[C.subtarget].head[2]) * 0.9)
-                    if 'Floor_Foot' in C.name:
-                        C.offset = abs(b.head[2] - armobj.pose.bones[b.custom_shape_transform.name].head[2])
-
-        #Blink rate calculation
-        for b in armobj.pose.bones:
-            if b.name == 'blink_ctrl_L':
-                try:
-                    b['Blink_Rate_L'] = abs(armobj.pose.bones['eyelid_up_ctrl_L'].head[2] - armobj.pose.bones['eyelid_low_ctrl_L'].head[2])
-                except:
-                    pass
-            if b.name == 'blink_ctrl_R':
-                try:
-                    b['Blink_Rate_R'] = abs(armobj.pose.bones['eyelid_up_ctrl_R'].head[2] - armobj.pose.bones['eyelid_low_ctrl_R'].head[2])
-                except:
-                    pass
-
-    def calc_poles(self, context):
-        bpy.ops.blenrig.calculate_pole_angles()
+        from .rig_functions import update_rest_pose_values
+        update_rest_pose_values(bpy.context.active_object)
 
     def execute(self, context):
         self.bake_armature(context)
         self.armature_update_values(context)
-        self.calc_poles(context)
         self.report({'INFO'}, "Baking done")
         return{'FINISHED'}
 
@@ -663,37 +538,12 @@ class ARMATURE_OT_reset_constraints(bpy.types.Operator):
                 context.mode=='POSE')
 
     def execute(self, context):
-        context.object.data.pose_position = 'REST'
         pbones = context.active_object.pose.bones
-        edit_bones = context.active_object.data.edit_bones
         if len(pbones) < 1:
             self.report({'INFO'}, "No bones found")
             return{'FINISHED'}
 
-        amount = 0
-        arm = bpy.context.object.data
-
-        for pbone in pbones:
-            for con in pbone.constraints:
-                if con.type == 'LIMIT_DISTANCE':
-                    amount += 1
-                    con.distance = 0
-                elif con.type == 'STRETCH_TO':
-                    amount += 1
-                    con.rest_length = 0
-                #elif con.type == 'CHILD_OF':
-                    #bpy.ops.object.mode_set(mode='EDIT')
-                    #arm.edit_bones.active = arm.edit_bones[pbone.name]
-                    #bpy.ops.object.mode_set(mode='POSE')
-                    #print ('"{}"'.format(con.name))
-                    #bpy.ops.constraint.childof_clear_inverse(constraint=con.name, owner='BONE')
-                    #bpy.ops.constraint.childof_set_inverse(constraint=con.name, owner='BONE')
-                    ## somehow it only works if you run it twice
-                    #bpy.ops.constraint.childof_set_inverse(constraint=con.name, owner='BONE')
-                    #bpy.ops.object.mode_set(mode='EDIT')
-                    #arm.edit_bones[b.name].select = False
-                    #bpy.ops.object.mode_set(mode='POSE')
-        context.object.data.pose_position = 'POSE'
+        amount = reset_constraints(context.active_object)
         self.report({'INFO'}, str(amount) + " constraints reset")
 
         return{'FINISHED'}
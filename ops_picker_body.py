@@ -1,4 +1,5 @@
 import bpy
+from .keyframe_writer import KeyframeWriter
 
 #################################### BLENRIG BODY PICKER OPERATORS ####################################################
 
@@ -73,75 +74,85 @@ class Operator_Keyframe_Main_Props(bpy.types.Operator):
         else:
             return False
 
-    def execute(self, context):
-        pbones = bpy.context.active_object.pose.bones
+    #Main animation properties (bone, data path)
+    main_props = (
         #Head
-        pbones["properties_head"].keyframe_insert(data_path='look_switch')
-        pbones["properties_head"].keyframe_insert(data_path='space_head')
-        pbones["properties_head"].keyframe_insert(data_path='space_neck')
+        ('properties_head', 'look_switch'),
+        ('properties_head', 'space_head'),
+        ('properties_head', 'space_neck'),
         #Arm_L
-        pbones["properties_arm_L"].keyframe_insert(data_path='ik_arm_L')
-        pbones["properties_arm_L"].keyframe_insert(data_path='space_arm_L')
-        pbones["properties_arm_L"].keyframe_insert(data_path='toon_arm_L')
-        pbones["properties_arm_L"].keyframe_insert(data_path='toggle_arm_ik_pole_L')
-        pbones["properties_arm_L"].keyframe_insert(data_path='space_arm_ik_pole_L')
-        pbones["properties_arm_L"].keyframe_insert(data_path='pin_elbow_L')
-        pbones["properties_arm_L"].keyframe_insert(data_path='space_hand_L')
-        pbones["properties_arm_L"].keyframe_insert(data_path='space_fing_thumb_L')
-        pbones["properties_arm_L"].keyframe_insert(data_path='space_fing_ind_L')
-        pbones["properties_arm_L"].keyframe_insert(data_path='space_fing_mid_L')
-        pbones["properties_arm_L"].keyframe_insert(data_path='space_fing_ring_L')
-        pbones["properties_arm_L"].keyframe_insert(data_path='space_fing_lit_L')
+        ('properties_arm_L', 'ik_arm_L'),
+        ('properties_arm_L', 'space_arm_L'),
+        ('properties_arm_L', 'toon_arm_L'),
+        ('properties_arm_L', 'toggle_arm_ik_pole_L'),
+        ('properties_arm_L', 'space_arm_ik_pole_L'),
+        ('properties_arm_L', 'pin_elbow_L'),
+        ('properties_arm_L', 'space_hand_L'),
+        ('properties_arm_L', 'space_fing_thumb_L'),
+        ('properties_arm_L', 'space_fing_ind_L'),
+        ('properties_arm_L', 'space_fing_mid_L'),
+        ('properties_arm_L', 'space_fing_ring_L'),
+        ('properties_arm_L', 'space_fing_lit_L'),
         #Arm_R
-        pbones["properties_arm_R"].keyframe_insert(data_path='ik_arm_R')
-        pbones["properties_arm_R"].keyframe_insert(data_path='space_arm_R')
-        pbones["properties_arm_R"].keyframe_insert(data_path='toon_arm_R')
-        pbones["properties_arm_R"].keyframe_insert(data_path='toggle_arm_ik_pole_R')
-        pbones["properties_arm_R"].keyframe_insert(data_path='space_arm_ik_pole_R')
-        pbones["properties_arm_R"].keyframe_insert(data_path='pin_elbow_R')
-        pbones["properties_arm_R"].keyframe_insert(data_path='space_hand_R')
-        pbones["properties_arm_R"].keyframe_insert(data_path='space_fing_thumb_R')
-        pbones["properties_arm_R"].keyframe_insert(data_path='space_fing_ind_R')
-        pbones["properties_arm_R"].keyframe_insert(data_path='space_fing_mid_R')
-        pbones["properties_arm_R"].keyframe_insert(data_path='space_fing_ring_R')
-        pbones["properties_arm_R"].keyframe_insert(data_path='space_fing_lit_R')
+        ('properties_arm_R', 'ik_arm_R'),
+        ('properties_arm_R', 'space_arm_R'),
+        ('properties_arm_R', 'toon_arm_R'),
+        ('properties_arm_R', 'toggle_arm_ik_pole_R'),
+        ('properties_arm_R', 'space_arm_ik_pole_R'),
+        ('properties_arm_R', 'pin_elbow_R'),
+        ('properties_arm_R', 'space_hand_R'),
+        ('properties_arm_R', 'space_fing_thumb_R'),
+        ('properties_arm_R', 'space_fing_ind_R'),
+        ('properties_arm_R', 'space_fing_mid_R'),
+        ('properties_arm_R', 'space_fing_ring_R'),
+        ('properties_arm_R', 'space_fing_lit_R'),
         #Leg_L
-        pbones["properties_leg_L"].keyframe_insert(data_path='ik_leg_L')
-        pbones["properties_leg_L"].keyframe_insert(data_path='space_leg_L')
-        pbones["properties_leg_L"].keyframe_insert(data_path='toon_leg_L')
-        pbones["properties_leg_L"].keyframe_insert(data_path='toggle_leg_ik_pole_L')
-        pbones["properties_leg_L"].keyframe_insert(data_path='space_leg_ik_pole_L')
-        pbones["properties_leg_L"].keyframe_insert(data_path='pin_knee_L')
-        pbones["properties_leg_L"].keyframe_insert(data_path='ik_toes_all_L')
+        ('properties_leg_L', 'ik_leg_L'),
+        ('properties_leg_L', 'space_leg_L'),
+        ('properties_leg_L', 'toon_leg_L'),
+        ('properties_leg_L', 'toggle_leg_ik_pole_L'),
+        ('properties_leg_L', 'space_leg_ik_pole_L'),
+        ('properties_leg_L', 'pin_knee_L'),
+        ('properties_leg_L', 'ik_toes_all_L'),
         #Leg_R
-        pbones["properties_leg_R"].keyframe_insert(data_path='ik_leg_R')
-        pbones["properties_leg_R"].keyframe_insert(data_path='space_leg_R')
-        pbones["properties_leg_R"].keyframe_insert(data_path='toon_leg_R')
-        pbones["properties_leg_R"].keyframe_insert(data_path='toggle_leg_ik_pole_R')
-        pbones["properties_leg_R"].keyframe_insert(data_path='space_leg_ik_pole_R')
-        pbones["properties_leg_R"].keyframe_insert(data_path='pin_knee_R')
-        pbones["properties_leg_R"].keyframe_insert(data_path='ik_toes_all_R')
+        ('properties_leg_R', 'ik_leg_R'),
+        ('properties_leg_R', 'space_leg_R'),
+        ('properties_leg_R', 'toon_leg_R'),
+        ('properties_leg_R', 'toggle_leg_ik_pole_R'),
+        ('properties_leg_R', 'space_leg_ik_pole_R'),
+        ('properties_leg_R', 'pin_knee_R'),
+        ('properties_leg_R', 'ik_toes_all_R'),
         #Extra Properties
         #Props
-        pbones["properties_head"].keyframe_insert(data_path='["hat_free"]')
-        pbones["properties_head"].keyframe_insert(data_path='["glasses_free"]')
-        pbones["properties_arm_L"].keyframe_insert(data_path='["hand_accessory_L"]')
-        pbones["properties_arm_R"].keyframe_insert(data_path='["hand_accessory_R"]')
+        ('properties_head', '["hat_free"]'),
+        ('properties_head', '["glasses_free"]'),
+        ('properties_arm_L', '["hand_accessory_L"]'),
+        ('properties_arm_R', '["hand_accessory_R"]'),
         #Curve
-        pbones["properties_arm_L"].keyframe_insert(data_path='["curved_arm_L"]')
-        pbones["properties_arm_L"].keyframe_insert(data_path='["curved_arm_tweak_L"]')
-        pbones["properties_leg_L"].keyframe_insert(data_path='["curved_leg_L"]')
-        pbones["properties_leg_L"].keyframe_insert(data_path='["curved_leg_tweak_L"]')
-        pbones["properties_arm_R"].keyframe_insert(data_path='["curved_arm_R"]')
-        pbones["properties_arm_R"].keyframe_insert(data_path='["curved_arm_tweak_R"]')
-        pbones["properties_leg_R"].keyframe_insert(data_path='["curved_leg_R"]')
-        pbones["properties_leg_R"].keyframe_insert(data_path='["curved_leg_tweak_R"]')
+        ('properties_arm_L', '["curved_arm_L"]'),
+        ('properties_arm_L', '["curved_arm_tweak_L"]'),
+        ('properties_leg_L', '["curved_leg_L"]'),
+        ('properties_leg_L', '["curved_leg_tweak_L"]'),
+        ('properties_arm_R', '["curved_arm_R"]'),
+        ('properties_arm_R', '["curved_arm_tweak_R"]'),
+        ('properties_leg_R', '["curved_leg_R"]'),
+        ('properties_leg_R', '["curved_leg_tweak_R"]'),
         #Face
-        pbones["properties_head"].keyframe_insert(data_path='["toon_teeth_up"]')
-        pbones["properties_head"].keyframe_insert(data_path='["toon_teeth_low"]')
-        pbones["properties_head"].keyframe_insert(data_path='["teeth_up_follow_mouth"]')
-        pbones["properties_head"].keyframe_insert(data_path='["teeth_low_follow_mouth"]')
-        pbones["properties_head"].keyframe_insert(data_path='["tongue_follow_mouth"]')
+        ('properties_head', '["toon_teeth_up"]'),
+        ('properties_head', '["toon_teeth_low"]'),
+        ('properties_head', '["teeth_up_follow_mouth"]'),
+        ('properties_head', '["teeth_low_follow_mouth"]'),
+        ('properties_head', '["tongue_follow_mouth"]'),
+    )
+
+    def execute(self, context):
+        armobj = bpy.context.active_object
+        pbones = armobj.pose.bones
+        frame = bpy.context.scene.frame_current
+        writer = KeyframeWriter(armobj)
+        for b_name, prop_path in self.main_props:
+            writer.insert_bone_prop(pbones[b_name], prop_path, frame)
+        writer.write()
 
         return {"FINISHED"}
 
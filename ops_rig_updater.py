@@ -61,6 +61,9 @@ class Operator_Biped_Updater(bpy.types.Operator):
 
         else:
             self.report({'INFO'}, 'Armature already up to date')
+        # Updates rewrite drivers and their targets
+        from .driver_index import invalidate_driver_index
+        invalidate_driver_index()
         return {"FINISHED"}
 
 #Library Overrides
@@ -98,3 +101,26 @@ class Operator_Set_Lib_Override_On(bpy.types.Operator):
         return {"FINISHED"}
 
 
+
+#Rig Settings
+
+class Operator_Recompute_Rig_Settings(bpy.types.Operator):
+    bl_idname = "blenrig.recompute_rig_settings"
+    bl_label = "Recompute Rig Settings"
+    bl_description = "Apply the values of all the rig settings properties to their constraints in one pass"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        if not bpy.context.active_object:
+            return False
+        if (bpy.context.active_object.type in ["ARMATURE"]):
+            for prop in bpy.context.active_object.data.items():
+                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
+                    return True
+
+    def execute(self, context):
+        from .rig_functions import recompute_rig_settings
+        changed, total, seconds = recompute_rig_settings(context.active_object)
+        self.report({'INFO'}, '{} of {} constraint values changed in {:.3f}s'.format(changed, total, seconds))
+        return {"FINISHED"}
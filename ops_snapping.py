@@ -1,17 +1,134 @@
 import bpy
+from time import perf_counter
 from mathutils import Matrix
-from bpy.props import StringProperty
+from bpy.props import StringProperty, EnumProperty, IntProperty, BoolProperty
 from bpy.types import (Operator)
 from .guides.utils import bone_local_transforms
+from .pose_solver import refresh_pose, get_rest_data, get_rest_inverses, compose_pose_matrix
+from .keyframe_writer import KeyframeWriter, keyframe_batch, batch_writer, batch_stack
+from .snap_engine import SPACE_SPECS, SnapBake, get_snap_spec, get_space_spec, space_names, collect_keyed_frames, bake_snap, snap_current_frame
+
+##### Snapping and Space Switch Operators #####
+# Generated from the snap and space tables in snap_engine, one class per limb, side and direction
+
+@classmethod
+def snap_poll(cls, context):
+    if not bpy.context.active_object:
+        return False
+    if (bpy.context.active_object.type in ["ARMATURE"]):
+        for prop in bpy.context.active_object.data.items():
+            if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
+                for prop in bpy.context.active_object.data.items():
+                    if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
+                        return True
+    else:
+        return False
+
+def build_snap_op(name, idname, label, description, limb, direction, side):
+    """Generator function that returns an IK/FK snap operator"""
+
+    def execute(self, context):
+        armobj = bpy.context.active_object
+        spec = get_snap_spec(armobj, limb, direction, side)
+        if spec is not None:
+            snap_current_frame(context, armobj, spec)
+        return {"FINISHED"}
+
+    return type(name, (Operator,), {
+        'bl_idname': idname,
+        'bl_label': label,
+        'bl_description': description,
+        'bl_options': {'REGISTER', 'UNDO','INTERNAL'},
+        'poll': snap_poll,
+        'execute': execute,
+        })
+
+def get_space_label(switch, side):
+    return SPACE_SPECS[switch]['label'].format(side = side)
+
+def build_space_op(name, idname, switch, side=None):
+    """Generator function that returns a space switch operator, the space is parsed as a string argument"""
+    label = get_space_label(switch, side)
+
+    def execute(self, context):
+        armobj = bpy.context.active_object
+        spec = get_space_spec(switch, self.space, side)
+        if spec is not None:
+            snap_current_frame(context, armobj, spec)
+        return {"FINISHED"}
+
+    return type(name, (Operator,), {
+        'bl_idname': idname,
+        'bl_label': "BlenRig Switch {} Space".format(label),
+        'bl_description': "Switch {} Space preserving pose".format(label),
+        'bl_options': {'REGISTER', 'UNDO','INTERNAL'},
+        '__annotations__': {'space': StringProperty()},
+        'poll': snap_poll,
+        'execute': execute,
+        })
+
+def build_space_list_op(name, idname, switch_idname, switch, side=None):
+    """Generator function that returns the operator showing the space PopUp of a space switch"""
+    label = get_space_label(switch, side)
+
+    #Create Space PopUp
+    def space_list(self, context):
+        col = self.layout.column()
+        for space in space_names(switch):
+            col.operator(switch_idname, text = space).space = space
+        col.separator()
+        bake = col.operator("switch.bake_space", text = "Bake Range...", icon = 'REC')
+        bake.switch = switch
+        bake.side = side or 'L'
+
+    def invoke(self, context, event):
+        context.window_manager.popup_menu(space_list, title='Switch {} Space'.format(label), icon='MOD_ARMATURE')
+        return {'FINISHED'}
+
+    return type(name, (Operator,), {
+        'bl_idname': idname,
+        'bl_label': "{} Space Switch List".format(label),
+        'bl_description': "Switch {} Space".format(label),
+        'invoke': invoke,
+        })
+
 ##### Left Ops #####
 
-##### Arm_L IK>FK #####
+Operator_Snap_ArmIKtoFK_L = build_snap_op('Operator_Snap_ArmIKtoFK_L', "snap.arm_ik_to_fk_l", "BlenRig Arm_L IK to FK", "Switch Arm to FK preserving pose", 'arm', 'IK_TO_FK', 'L')
+Operator_Snap_ArmFKtoIK_L = build_snap_op('Operator_Snap_ArmFKtoIK_L', "snap.arm_fk_to_ik_l", "BlenRig Arm_L FK to IK", "Switch Arm to IK preserving pose", 'arm', 'FK_TO_IK', 'L')
+Operator_Snap_LegIKtoFK_L = build_snap_op('Operator_Snap_LegIKtoFK_L', "snap.leg_ik_to_fk_l", "BlenRig Leg_L IK to FK", "Switch Leg to FK preserving pose", 'leg', 'IK_TO_FK', 'L')
+Operator_Snap_LegFKtoIK_L = build_snap_op('Operator_Snap_LegFKtoIK_L', "snap.leg_fk_to_ik_l", "BlenRig Leg_L FK to IK", "Switch Leg to IK preserving pose", 'leg', 'FK_TO_IK', 'L')
+
+Operator_Switch_Arm_Space_L = build_space_op('Operator_Switch_Arm_Space_L', "switch.arm_space_l", 'arm', 'L')
+Operator_Show_Arm_Space_List_L = build_space_list_op('Operator_Show_Arm_Space_List_L', "show.arm_list_l", "switch.arm_space_l", 'arm', 'L')
+Operator_Switch_Hand_Space_L = build_space_op('Operator_Switch_Hand_Space_L', "switch.hand_space_l", 'hand', 'L')
+Operator_Show_Hand_Space_List_L = build_space_list_op('Operator_Show_Hand_Space_List_L', "show.hand_list_l", "switch.hand_space_l", 'hand', 'L')
+Operator_Switch_Arm_Pole_Space_L = build_space_op('Operator_Switch_Arm_Pole_Space_L', "switch.arm_pole_space_l", 'arm_pole', 'L')
+Operator_Show_Arm_Pole_Space_List_L = build_space_list_op('Operator_Show_Arm_Pole_Space_List_L', "show.arm_pole_list_l", "switch.arm_pole_space_l", 'arm_pole', 'L')
+Operator_Switch_Fing_All_Space_L = build_space_op('Operator_Switch_Fing_All_Space_L', "switch.fing_all_space_l", 'fing_all', 'L')
+Operator_Show_Fing_All_Space_List_L = build_space_list_op('Operator_Show_Fing_All_Space_List_L', "show.fing_all_list_l", "switch.fing_all_space_l", 'fing_all', 'L')
+Operator_Switch_Fing_Thumb_Space_L = build_space_op('Operator_Switch_Fing_Thumb_Space_L', "switch.fing_thumb_space_l", 'fing_thumb', 'L')
+Operator_Show_Fing_Thumb_Space_List_L = build_space_list_op('Operator_Show_Fing_Thumb_Space_List_L', "show.fing_thumb_list_l", "switch.fing_thumb_space_l", 'fing_thumb', 'L')
+Operator_Switch_Fing_Ind_Space_L = build_space_op('Operator_Switch_Fing_Ind_Space_L', "switch.fing_ind_space_l", 'fing_ind', 'L')
+Operator_Show_Fing_Ind_Space_List_L = build_space_list_op('Operator_Show_Fing_Ind_Space_List_L', "show.fing_ind_list_l", "switch.fing_ind_space_l", 'fing_ind', 'L')
+Operator_Switch_Fing_Mid_Space_L = build_space_op('Operator_Switch_Fing_Mid_Space_L', "switch.fing_mid_space_l", 'fing_mid', 'L')
+Operator_Show_Fing_Mid_Space_List_L = build_space_list_op('Operator_Show_Fing_Mid_Space_List_L', "show.fing_mid_list_l", "switch.fing_mid_space_l", 'fing_mid', 'L')
+Operator_Switch_Fing_Ring_Space_L = build_space_op('Operator_Switch_Fing_Ring_Space_L', "switch.fing_ring_space_l", 'fing_ring', 'L')
+Operator_Show_Fing_Ring_Space_List_L = build_space_list_op('Operator_Show_Fing_Ring_Space_List_L', "show.fing_ring_list_l", "switch.fing_ring_space_l", 'fing_ring', 'L')
+Operator_Switch_Fing_Lit_Space_L = build_space_op('Operator_Switch_Fing_Lit_Space_L', "switch.fing_lit_space_l", 'fing_lit', 'L')
+Operator_Show_Fing_Lit_Space_List_L = build_space_list_op('Operator_Show_Fing_Lit_Space_List_L', "show.fing_lit_list_l", "switch.fing_lit_space_l", 'fing_lit', 'L')
+Operator_Switch_Leg_Space_L = build_space_op('Operator_Switch_Leg_Space_L', "switch.leg_space_l", 'leg', 'L')
+Operator_Show_Leg_Space_List_L = build_space_list_op('Operator_Show_Leg_Space_List_L', "show.leg_list_l", "switch.leg_space_l", 'leg', 'L')
+Operator_Switch_Leg_Pole_Space_L = build_space_op('Operator_Switch_Leg_Pole_Space_L', "switch.leg_pole_space_l", 'leg_pole', 'L')
+Operator_Show_Leg_Pole_Space_List_L = build_space_list_op('Operator_Show_Leg_Pole_Space_List_L', "show.leg_pole_list_l", "switch.leg_pole_space_l", 'leg_pole', 'L')
+
+##### Elbow_L Pin #####
 
-class Operator_Snap_ArmIKtoFK_L(bpy.types.Operator):
+class Operator_Elbow_Pin_L(bpy.types.Operator):
 
-    bl_idname = "snap.arm_ik_to_fk_l"
-    bl_label = "BlenRig Arm_L IK to FK"
-    bl_description = "Switch Arm to FK preserving pose"
+    bl_idname = "pin.elbow_l"
+    bl_label = "BlenRig Pin Elbow_L"
+    bl_description = "Pin Elbow_L"
     bl_options = {'REGISTER', 'UNDO','INTERNAL'}
 
     @classmethod
@@ -27,7 +144,9 @@ class Operator_Snap_ArmIKtoFK_L(bpy.types.Operator):
         else:
             return False
 
+    @keyframe_batch
     def execute(self, context):
+
         armobj = bpy.context.active_object
         pbones = armobj.pose.bones
         anim_data = armobj.animation_data
@@ -36,7 +155,8 @@ class Operator_Snap_ArmIKtoFK_L(bpy.types.Operator):
         for prop in bpy.context.active_object.data.items():
             if prop[0] == 'rig_type' and prop[1] == 'Biped':
 
-                if armobj.pose.bones["properties_arm_L"].ik_arm_L < 0.1:
+        #### Pin ####
+                if armobj.pose.bones["properties_arm_L"].pin_elbow_L < 0.1:
 
                     #Collect Matrix
                     ArmFkMat = pbones['arm_fk_L'].matrix.copy()
@@ -53,7 +173,25 @@ class Operator_Snap_ArmIKtoFK_L(bpy.types.Operator):
                     if anim_data:
                         if anim_data.action:
                             if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                                pbones["properties_arm_L"].keyframe_insert(data_path='ik_arm_L')
+                                insert_pkeys('properties_arm_L', 'pin_elbow_L')
+                                insert_bkeys('master_torso', 'LocRotScale')
+                                insert_bkeys('pelvis_ctrl', 'LocRotScale')
+                                insert_bkeys('spine_1_fk', 'LocRotScale')
+                                insert_bkeys('spine_2_fk', 'LocRotScale')
+                                insert_bkeys('spine_3_fk', 'LocRotScale')
+                                insert_bkeys('spine_1_toon', 'LocRotScale')
+                                insert_bkeys('spine_2_toon', 'LocRotScale')
+                                insert_bkeys('spine_3_toon', 'LocRotScale')
+                                insert_bkeys('spine_4_toon', 'LocRotScale')
+                                insert_bkeys('torso_fk_ctrl_inv', 'LocRotScale')
+                                insert_bkeys('spine_3_fk_inv', 'LocRotScale')
+                                insert_bkeys('spine_2_fk_inv', 'LocRotScale')
+                                insert_bkeys('torso_fk_ctrl', 'LocRotScale')
+                                insert_bkeys('look', 'LocRotScale')
+                                insert_bkeys('elbow_pole_L', 'LocRotScale')
+                                insert_bkeys('elbow_pole_R', 'LocRotScale')
+                                insert_bkeys('knee_pole_L', 'LocRotScale')
+                                insert_bkeys('knee_pole_R', 'LocRotScale')
                                 insert_bkeys('arm_fk_L', 'LocRotScale')
                                 insert_bkeys('forearm_fk_L', 'LocRotScale')
                                 insert_bkeys('arm_ik_L', 'RotScale')
@@ -62,16 +200,24 @@ class Operator_Snap_ArmIKtoFK_L(bpy.types.Operator):
                                 insert_bkeys('shoulder_L', 'LocRotScale')
                                 insert_bkeys('hand_ik_ctrl_L', 'LocRotScale')
                                 insert_bkeys('hand_fk_L', 'LocRotScale')
+                                insert_bkeys('elbow_pin_L', 'LocRotScale')
                                 if pbones["properties_arm_L"].toggle_arm_ik_pole_L == 1.0:
                                     insert_bkeys('elbow_pole_L', 'Loc')
+                                for prop in bpy.context.active_object.data.items():
+                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
+                                        insert_bkeys('carpal_ik_ctrl_L', 'LocRotScale')
+                                        insert_bkeys('carpal_fk_L', 'LocRotScale')
+                                        insert_bkeys('hand_fk_L', 'LocRotScale')
 
-                    armobj.pose.bones["properties_arm_L"].ik_arm_L = 1.0
+                    #Paste Matrix
+                    pVisLocExec(pbones['elbow_pin_L'], pbones['snap_elbow_pin_L'])
+                    pVisRotExec(pbones['elbow_pin_L'], pbones['snap_elbow_pin_L'])
+                    pVisScaExec(pbones['elbow_pin_L'], pbones['snap_elbow_pin_L'])
                     refresh_hack()
 
-                    #Paste Matrix
-                    pVisRotExec (pbones['arm_fk_ctrl_L'], pbones['arm_ik_L'])
-                    pbones['arm_fk_ctrl_L'].scale[:] = (1.0, 1.0, 1.0)
+                    armobj.pose.bones["properties_arm_L"].pin_elbow_L = 1.0
                     refresh_hack()
+
                     pbones['shoulder_L'].matrix = ShoulderMat
                     pbones['shoulder_L'].location = ShoulderLoc
                     pbones['shoulder_L'].scale = ShoulderScale
@@ -84,30 +230,22 @@ class Operator_Snap_ArmIKtoFK_L(bpy.types.Operator):
                     pbones['forearm_fk_L'].location = ForearmFkLoc
                     pbones['forearm_fk_L'].scale = ForearmFkScale
                     refresh_hack()
-                    #Correct arm_fk twist
-                    pVisRotExec (pbones['arm_fk_L'], pbones['arm_rot_L'])
-                    refresh_hack()
-                    #Re-paste forearm matrix
-                    pbones['forearm_fk_L'].matrix = ForearmFkMat
-                    pbones['forearm_fk_L'].location = ForearmFkLoc
-                    pbones['forearm_fk_L'].scale = ForearmFkScale
-                    refresh_hack()
 
                     #Insert Keyframes if Action present
                     if anim_data:
                         if anim_data.action:
                             if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
                                 #Collect Local Transforms
+                                ElbowPinRotEuler = pbones['elbow_pin_L'].rotation_euler.copy()
+                                ElbowPinRotQuat = pbones['elbow_pin_L'].rotation_quaternion.copy()
+                                ElbowPinLoc = pbones['elbow_pin_L'].location.copy()
+                                ElbowPinScale = pbones['elbow_pin_L'].scale.copy()
+
                                 ShoulderRotEuler = pbones['shoulder_L'].rotation_euler.copy()
                                 ShoulderRotQuat = pbones['shoulder_L'].rotation_quaternion.copy()
                                 ShoulderLoc = pbones['shoulder_L'].location.copy()
                                 ShoulderScale = pbones['shoulder_L'].scale.copy()
 
-                                ArmCtrlRotEuler = pbones['arm_fk_ctrl_L'].rotation_euler.copy()
-                                ArmCtrlRotQuat = pbones['arm_fk_ctrl_L'].rotation_quaternion.copy()
-                                ArmCtrlLoc = pbones['arm_fk_ctrl_L'].location.copy()
-                                ArmCtrlScale = pbones['arm_fk_ctrl_L'].scale.copy()
-
                                 ArmFkRotEuler = pbones['arm_fk_L'].rotation_euler.copy()
                                 ArmFkRotQuat = pbones['arm_fk_L'].rotation_quaternion.copy()
                                 ArmFkLoc = pbones['arm_fk_L'].location.copy()
@@ -122,21 +260,21 @@ class Operator_Snap_ArmIKtoFK_L(bpy.types.Operator):
                                 bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
 
                                 #Key Property
-                                armobj.pose.bones["properties_arm_L"].ik_arm_L = 1.0
+                                armobj.pose.bones["properties_arm_L"].pin_elbow_L = 1.0
                                 refresh_hack()
-                                pbones["properties_arm_L"].keyframe_insert(data_path='ik_arm_L')
+                                insert_pkeys('properties_arm_L', 'pin_elbow_L')
 
                                 #Re-Paste Transforms
+                                pbones['elbow_pin_L'].rotation_euler = ElbowPinRotEuler
+                                pbones['elbow_pin_L'].rotation_quaternion = ElbowPinRotQuat
+                                pbones['elbow_pin_L'].location = ElbowPinLoc
+                                pbones['elbow_pin_L'].scale = ElbowPinScale
+                                refresh_hack()
                                 pbones['shoulder_L'].rotation_euler = ShoulderRotEuler
                                 pbones['shoulder_L'].rotation_quaternion = ShoulderRotQuat
                                 pbones['shoulder_L'].location = ShoulderLoc
                                 pbones['shoulder_L'].scale = ShoulderScale
                                 refresh_hack()
-                                pbones['arm_fk_ctrl_L'].rotation_euler = ArmCtrlRotEuler
-                                pbones['arm_fk_ctrl_L'].rotation_quaternion = ArmCtrlRotQuat
-                                pbones['arm_fk_ctrl_L'].location = ArmCtrlLoc
-                                pbones['arm_fk_ctrl_L'].scale = ArmCtrlScale
-                                refresh_hack()
                                 pbones['arm_fk_L'].rotation_euler = ArmFkRotEuler
                                 pbones['arm_fk_L'].rotation_quaternion = ArmFkRotQuat
                                 pbones['arm_fk_L'].location = ArmFkLoc
@@ -148,6 +286,24 @@ class Operator_Snap_ArmIKtoFK_L(bpy.types.Operator):
                                 pbones['forearm_fk_L'].scale = ForearmFkScale
                                 refresh_hack()
 
+                                insert_bkeys('master_torso', 'LocRotScale')
+                                insert_bkeys('pelvis_ctrl', 'LocRotScale')
+                                insert_bkeys('spine_1_fk', 'LocRotScale')
+                                insert_bkeys('spine_2_fk', 'LocRotScale')
+                                insert_bkeys('spine_3_fk', 'LocRotScale')
+                                insert_bkeys('spine_1_toon', 'LocRotScale')
+                                insert_bkeys('spine_2_toon', 'LocRotScale')
+                                insert_bkeys('spine_3_toon', 'LocRotScale')
+                                insert_bkeys('spine_4_toon', 'LocRotScale')
+                                insert_bkeys('torso_fk_ctrl_inv', 'LocRotScale')
+                                insert_bkeys('spine_3_fk_inv', 'LocRotScale')
+                                insert_bkeys('spine_2_fk_inv', 'LocRotScale')
+                                insert_bkeys('torso_fk_ctrl', 'LocRotScale')
+                                insert_bkeys('look', 'LocRotScale')
+                                insert_bkeys('elbow_pole_L', 'LocRotScale')
+                                insert_bkeys('elbow_pole_R', 'LocRotScale')
+                                insert_bkeys('knee_pole_L', 'LocRotScale')
+                                insert_bkeys('knee_pole_R', 'LocRotScale')
                                 insert_bkeys('arm_fk_L', 'LocRotScale')
                                 insert_bkeys('forearm_fk_L', 'LocRotScale')
                                 insert_bkeys('arm_ik_L', 'RotScale')
@@ -156,6 +312,7 @@ class Operator_Snap_ArmIKtoFK_L(bpy.types.Operator):
                                 insert_bkeys('shoulder_L', 'LocRotScale')
                                 insert_bkeys('hand_ik_ctrl_L', 'LocRotScale')
                                 insert_bkeys('hand_fk_L', 'LocRotScale')
+                                insert_bkeys('elbow_pin_L', 'LocRotScale')
                                 if pbones["properties_arm_L"].toggle_arm_ik_pole_L == 1.0:
                                     insert_bkeys('elbow_pole_L', 'Loc')
                                 for prop in bpy.context.active_object.data.items():
@@ -174,11 +331,42 @@ class Operator_Snap_ArmIKtoFK_L(bpy.types.Operator):
                     #Switch Hand to Arm Space
                     bpy.ops.switch.hand_space_l(space='Arm')
 
-        #Quadruped
+        return {"FINISHED"}
+
+##### Elbow_L UnPin #####
+
+class Operator_Elbow_UnPin_L(bpy.types.Operator):
+
+    bl_idname = "unpin.elbow_l"
+    bl_label = "BlenRig UnPin Elbow_L"
+    bl_description = "UnPin Elbow_L"
+    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
+
+    @classmethod
+    def poll(cls, context):
+        if not bpy.context.active_object:
+            return False
+        if (bpy.context.active_object.type in ["ARMATURE"]):
+            for prop in bpy.context.active_object.data.items():
+                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
+                    for prop in bpy.context.active_object.data.items():
+                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
+                            return True
+        else:
+            return False
+
+    @keyframe_batch
+    def execute(self, context):
+
+        armobj = bpy.context.active_object
+        pbones = armobj.pose.bones
+        anim_data = armobj.animation_data
+
+        #Biped
         for prop in bpy.context.active_object.data.items():
-            if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
+            if prop[0] == 'rig_type' and prop[1] == 'Biped':
 
-                if armobj.pose.bones["properties_arm_L"].ik_arm_L < 0.1:
+                if armobj.pose.bones["properties_arm_L"].pin_elbow_L > 0.9:
 
                     #Collect Matrix
                     ArmFkMat = pbones['arm_fk_L'].matrix.copy()
@@ -190,52 +378,61 @@ class Operator_Snap_ArmIKtoFK_L(bpy.types.Operator):
                     ShoulderMat = pbones['shoulder_L'].matrix.copy()
                     ShoulderLoc = pbones['shoulder_L'].location.copy()
                     ShoulderScale = pbones['shoulder_L'].scale.copy()
-                    CarpalFkMat = pbones['carpal_fk_L'].matrix.copy()
-                    CarpalFkLoc = pbones['carpal_fk_L'].location.copy()
-                    CarpalFkScale = pbones['carpal_fk_L'].scale.copy()
-                    HandFkMat = pbones['hand_fk_L'].matrix.copy()
-                    HandFkLoc = pbones['hand_fk_L'].location.copy()
-                    HandFkScale = pbones['hand_fk_L'].scale.copy()
-                    HandFing1FkMat = pbones['hand_fing_1_fk_L'].matrix.copy()
-                    HandFing1FkLoc = pbones['hand_fing_1_fk_L'].location.copy()
-                    HandFing1FkScale = pbones['hand_fing_1_fk_L'].scale.copy()
-                    HandFing2FkMat = pbones['hand_fing_2_fk_L'].matrix.copy()
-                    HandFing2FkLoc = pbones['hand_fing_2_fk_L'].location.copy()
-                    HandFing2FkScale = pbones['hand_fing_2_fk_L'].scale.copy()
 
                     #Insert Keyframes if Action present
                     if anim_data:
                         if anim_data.action:
                             if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                                pbones["properties_arm_L"].keyframe_insert(data_path='ik_arm_L')
+                                insert_pkeys('properties_arm_L', 'pin_elbow_L')
+                                insert_bkeys('master_torso', 'LocRotScale')
+                                insert_bkeys('pelvis_ctrl', 'LocRotScale')
+                                insert_bkeys('spine_1_fk', 'LocRotScale')
+                                insert_bkeys('spine_2_fk', 'LocRotScale')
+                                insert_bkeys('spine_3_fk', 'LocRotScale')
+                                insert_bkeys('spine_1_toon', 'LocRotScale')
+                                insert_bkeys('spine_2_toon', 'LocRotScale')
+                                insert_bkeys('spine_3_toon', 'LocRotScale')
+                                insert_bkeys('spine_4_toon', 'LocRotScale')
+                                insert_bkeys('torso_fk_ctrl_inv', 'LocRotScale')
+                                insert_bkeys('spine_3_fk_inv', 'LocRotScale')
+                                insert_bkeys('spine_2_fk_inv', 'LocRotScale')
+                                insert_bkeys('torso_fk_ctrl', 'LocRotScale')
+                                insert_bkeys('look', 'LocRotScale')
+                                insert_bkeys('elbow_pole_L', 'LocRotScale')
+                                insert_bkeys('elbow_pole_R', 'LocRotScale')
+                                insert_bkeys('knee_pole_L', 'LocRotScale')
+                                insert_bkeys('knee_pole_R', 'LocRotScale')
                                 insert_bkeys('arm_fk_L', 'LocRotScale')
                                 insert_bkeys('forearm_fk_L', 'LocRotScale')
-                                insert_bkeys('carpal_fk_L', 'LocRotScale')
-                                insert_bkeys('carpal_ik_ctrl_L', 'LocRotScale')
-                                insert_bkeys('arm_fk_ctrl_L', 'LocRotScale')
-                                insert_bkeys('shoulder_L', 'LocRotScale')
-                                insert_bkeys('hand_fk_L', 'LocRotScale')
-                                insert_bkeys('hand_fing_1_fk_L', 'LocRotScale')
-                                insert_bkeys('hand_fing_2_fk_L', 'LocRotScale')
                                 insert_bkeys('arm_ik_L', 'RotScale')
                                 insert_bkeys('forearm_ik_L', 'RotScale')
+                                insert_bkeys('arm_fk_ctrl_L', 'LocRotScale')
+                                insert_bkeys('shoulder_L', 'LocRotScale')
                                 insert_bkeys('hand_ik_ctrl_L', 'LocRotScale')
-                                insert_bkeys('hand_fing_ik_ctrl_mid_L', 'LocRotScale')
-                                insert_bkeys('fings_ik_ctrl_L', 'LocRotScale')
-                                insert_bkeys('hand_roll_ctrl_L', 'Rot')
-                                insert_bkeys('fing_roll_1_L', 'Rot')
-                                insert_bkeys('fing_roll_2_L', 'Rot')
-                                insert_bkeys('hand_sole_ctrl_L', 'LocRotScale')
+                                insert_bkeys('hand_fk_L', 'LocRotScale')
+                                insert_bkeys('elbow_pin_L', 'LocRotScale')
                                 if pbones["properties_arm_L"].toggle_arm_ik_pole_L == 1.0:
                                     insert_bkeys('elbow_pole_L', 'Loc')
-
-                    bpy.context.active_object.pose.bones["properties_arm_L"].ik_arm_L = 1.0
-                    refresh_hack()
+                                for prop in bpy.context.active_object.data.items():
+                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
+                                        insert_bkeys('carpal_ik_ctrl_L', 'LocRotScale')
+                                        insert_bkeys('carpal_fk_L', 'LocRotScale')
+                                        insert_bkeys('hand_fk_L', 'LocRotScale')
 
                     #Paste Matrix
-                    pVisRotExec (pbones['arm_fk_ctrl_L'], pbones['arm_ik_L'])
+                    pVisLocExec(pbones['hand_ik_ctrl_L'], pbones['hand_fk_L'])
+                    refresh_hack()
+                    pVisLocExec(pbones['elbow_pole_L'], pbones['snap_elbow_pole_fk_L'])
+                    refresh_hack()
+                    pVisRotExec (pbones['arm_ik_L'], pbones['arm_rot_L'])
+                    refresh_hack()
+                    pVisRotExec (pbones['arm_fk_ctrl_L'], pbones['arm_fk_L'])
                     pbones['arm_fk_ctrl_L'].scale[:] = (1.0, 1.0, 1.0)
                     refresh_hack()
+
+                    bpy.context.active_object.pose.bones["properties_arm_L"].pin_elbow_L = 0.0
+                    refresh_hack()
+
                     pbones['shoulder_L'].matrix = ShoulderMat
                     pbones['shoulder_L'].location = ShoulderLoc
                     pbones['shoulder_L'].scale = ShoulderScale
@@ -248,21 +445,13 @@ class Operator_Snap_ArmIKtoFK_L(bpy.types.Operator):
                     pbones['forearm_fk_L'].location = ForearmFkLoc
                     pbones['forearm_fk_L'].scale = ForearmFkScale
                     refresh_hack()
-                    pbones['carpal_fk_L'].matrix = CarpalFkMat
-                    pbones['carpal_fk_L'].location = CarpalFkLoc
-                    pbones['carpal_fk_L'].scale = CarpalFkScale
-                    refresh_hack()
-                    pbones['hand_fk_L'].matrix = HandFkMat
-                    pbones['hand_fk_L'].location = HandFkLoc
-                    pbones['hand_fk_L'].scale = HandFkScale
-                    refresh_hack()
-                    pbones['hand_fing_1_fk_L'].matrix = HandFing1FkMat
-                    pbones['hand_fing_1_fk_L'].location = HandFing1FkLoc
-                    pbones['hand_fing_1_fk_L'].scale = HandFing1FkScale
+                    #Correct arm_fk twist
+                    pVisRotExec (pbones['arm_fk_L'], pbones['arm_rot_L'])
                     refresh_hack()
-                    pbones['hand_fing_2_fk_L'].matrix = HandFing2FkMat
-                    pbones['hand_fing_2_fk_L'].location = HandFing2FkLoc
-                    pbones['hand_fing_2_fk_L'].scale = HandFing2FkScale
+                    #Re-paste forearm matrix
+                    pbones['forearm_fk_L'].matrix = ForearmFkMat
+                    pbones['forearm_fk_L'].location = ForearmFkLoc
+                    pbones['forearm_fk_L'].scale = ForearmFkScale
                     refresh_hack()
 
                     #Insert Keyframes if Action present
@@ -270,16 +459,16 @@ class Operator_Snap_ArmIKtoFK_L(bpy.types.Operator):
                         if anim_data.action:
                             if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
                                 #Collect Local Transforms
-                                ShoulderRotEuler = pbones['shoulder_L'].rotation_euler.copy()
-                                ShoulderRotQuat = pbones['shoulder_L'].rotation_quaternion.copy()
-                                ShoulderLoc = pbones['shoulder_L'].location.copy()
-                                ShoulderScale = pbones['shoulder_L'].scale.copy()
-
                                 ArmCtrlRotEuler = pbones['arm_fk_ctrl_L'].rotation_euler.copy()
                                 ArmCtrlRotQuat = pbones['arm_fk_ctrl_L'].rotation_quaternion.copy()
                                 ArmCtrlLoc = pbones['arm_fk_ctrl_L'].location.copy()
                                 ArmCtrlScale = pbones['arm_fk_ctrl_L'].scale.copy()
 
+                                ShoulderRotEuler = pbones['shoulder_L'].rotation_euler.copy()
+                                ShoulderRotQuat = pbones['shoulder_L'].rotation_quaternion.copy()
+                                ShoulderLoc = pbones['shoulder_L'].location.copy()
+                                ShoulderScale = pbones['shoulder_L'].scale.copy()
+
                                 ArmFkRotEuler = pbones['arm_fk_L'].rotation_euler.copy()
                                 ArmFkRotQuat = pbones['arm_fk_L'].rotation_quaternion.copy()
                                 ArmFkLoc = pbones['arm_fk_L'].location.copy()
@@ -290,45 +479,37 @@ class Operator_Snap_ArmIKtoFK_L(bpy.types.Operator):
                                 ForearmFkLoc = pbones['forearm_fk_L'].location.copy()
                                 ForearmFkScale = pbones['forearm_fk_L'].scale.copy()
 
-                                CarpalFkRotEuler = pbones['carpal_fk_L'].rotation_euler.copy()
-                                CarpalFkRotQuat = pbones['carpal_fk_L'].rotation_quaternion.copy()
-                                CarpalFkLoc = pbones['carpal_fk_L'].location.copy()
-                                CarpalFkScale = pbones['carpal_fk_L'].scale.copy()
-
-                                HandFkRotEuler = pbones['hand_fk_L'].rotation_euler.copy()
-                                HandFkRotQuat = pbones['hand_fk_L'].rotation_quaternion.copy()
-                                HandFkLoc = pbones['hand_fk_L'].location.copy()
-                                HandFkScale = pbones['hand_fk_L'].scale.copy()
+                                HandIkCtrlRotEuler = pbones['hand_ik_ctrl_L'].rotation_euler.copy()
+                                HandIkCtrlRotQuat = pbones['hand_ik_ctrl_L'].rotation_quaternion.copy()
+                                HandIkCtrlLoc = pbones['hand_ik_ctrl_L'].location.copy()
+                                HandIkCtrlScale = pbones['hand_ik_ctrl_L'].scale.copy()
 
-                                HandFing1FkRotEuler = pbones['hand_fing_1_fk_L'].rotation_euler.copy()
-                                HandFing1FkRotQuat = pbones['hand_fing_1_fk_L'].rotation_quaternion.copy()
-                                HandFing1FkLoc = pbones['hand_fing_1_fk_L'].location.copy()
-                                HandFing1FkScale = pbones['hand_fing_1_fk_L'].scale.copy()
+                                ArmIkRotEuler = pbones['arm_ik_L'].rotation_euler.copy()
+                                ArmIkRotQuat = pbones['arm_ik_L'].rotation_quaternion.copy()
+                                ArmIkLoc = pbones['arm_ik_L'].location.copy()
+                                ArmIkScale = pbones['arm_ik_L'].scale.copy()
 
-                                HandFing2FkRotEuler = pbones['hand_fing_2_fk_L'].rotation_euler.copy()
-                                HandFing2FkRotQuat = pbones['hand_fing_2_fk_L'].rotation_quaternion.copy()
-                                HandFing2FkLoc = pbones['hand_fing_2_fk_L'].location.copy()
-                                HandFing2FkScale = pbones['hand_fing_2_fk_L'].scale.copy()
+                                ElbowlLoc = pbones['elbow_pole_L'].location.copy()
 
                                 #Jump to next Frame
                                 bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
 
                                 #Key Property
-                                armobj.pose.bones["properties_arm_L"].ik_arm_L = 1.0
+                                armobj.pose.bones["properties_arm_L"].pin_elbow_L = 0.0
                                 refresh_hack()
-                                pbones["properties_arm_L"].keyframe_insert(data_path='ik_arm_L')
+                                insert_pkeys('properties_arm_L', 'pin_elbow_L')
 
                                 #Re-Paste Transforms
-                                pbones['shoulder_L'].rotation_euler = ShoulderRotEuler
-                                pbones['shoulder_L'].rotation_quaternion = ShoulderRotQuat
-                                pbones['shoulder_L'].location = ShoulderLoc
-                                pbones['shoulder_L'].scale = ShoulderScale
-                                refresh_hack()
                                 pbones['arm_fk_ctrl_L'].rotation_euler = ArmCtrlRotEuler
                                 pbones['arm_fk_ctrl_L'].rotation_quaternion = ArmCtrlRotQuat
                                 pbones['arm_fk_ctrl_L'].location = ArmCtrlLoc
                                 pbones['arm_fk_ctrl_L'].scale = ArmCtrlScale
                                 refresh_hack()
+                                pbones['shoulder_L'].rotation_euler = ShoulderRotEuler
+                                pbones['shoulder_L'].rotation_quaternion = ShoulderRotQuat
+                                pbones['shoulder_L'].location = ShoulderLoc
+                                pbones['shoulder_L'].scale = ShoulderScale
+                                refresh_hack()
                                 pbones['arm_fk_L'].rotation_euler = ArmFkRotEuler
                                 pbones['arm_fk_L'].rotation_quaternion = ArmFkRotQuat
                                 pbones['arm_fk_L'].location = ArmFkLoc
@@ -339,57 +520,74 @@ class Operator_Snap_ArmIKtoFK_L(bpy.types.Operator):
                                 pbones['forearm_fk_L'].location = ForearmFkLoc
                                 pbones['forearm_fk_L'].scale = ForearmFkScale
                                 refresh_hack()
-                                pbones['carpal_fk_L'].rotation_euler = CarpalFkRotEuler
-                                pbones['carpal_fk_L'].rotation_quaternion = CarpalFkRotQuat
-                                pbones['carpal_fk_L'].location = CarpalFkLoc
-                                pbones['carpal_fk_L'].scale = CarpalFkScale
-                                refresh_hack()
-                                pbones['hand_fk_L'].rotation_euler = HandFkRotEuler
-                                pbones['hand_fk_L'].rotation_quaternion = HandFkRotQuat
-                                pbones['hand_fk_L'].location = HandFkLoc
-                                pbones['hand_fk_L'].scale = HandFkScale
+                                pbones['hand_ik_ctrl_L'].rotation_euler = HandIkCtrlRotEuler
+                                pbones['hand_ik_ctrl_L'].rotation_quaternion = HandIkCtrlRotQuat
+                                pbones['hand_ik_ctrl_L'].location = HandIkCtrlLoc
+                                pbones['hand_ik_ctrl_L'].scale = HandIkCtrlScale
                                 refresh_hack()
-                                pbones['hand_fing_1_fk_L'].rotation_euler = HandFing1FkRotEuler
-                                pbones['hand_fing_1_fk_L'].rotation_quaternion = HandFing1FkRotQuat
-                                pbones['hand_fing_1_fk_L'].location = HandFing1FkLoc
-                                pbones['hand_fing_1_fk_L'].scale = HandFing1FkScale
+                                pbones['elbow_pole_L'].location = ElbowlLoc
                                 refresh_hack()
-                                pbones['hand_fing_2_fk_L'].rotation_euler = HandFing2FkRotEuler
-                                pbones['hand_fing_2_fk_L'].rotation_quaternion = HandFing2FkRotQuat
-                                pbones['hand_fing_2_fk_L'].location = HandFing2FkLoc
-                                pbones['hand_fing_2_fk_L'].scale = HandFing2FkScale
+                                pbones['arm_ik_L'].rotation_euler = ArmIkRotEuler
+                                pbones['arm_ik_L'].rotation_quaternion = ArmIkRotQuat
+                                pbones['arm_ik_L'].location = ArmIkLoc
+                                pbones['arm_ik_L'].scale = ArmIkScale
                                 refresh_hack()
 
+                                insert_bkeys('master_torso', 'LocRotScale')
+                                insert_bkeys('pelvis_ctrl', 'LocRotScale')
+                                insert_bkeys('spine_1_fk', 'LocRotScale')
+                                insert_bkeys('spine_2_fk', 'LocRotScale')
+                                insert_bkeys('spine_3_fk', 'LocRotScale')
+                                insert_bkeys('spine_1_toon', 'LocRotScale')
+                                insert_bkeys('spine_2_toon', 'LocRotScale')
+                                insert_bkeys('spine_3_toon', 'LocRotScale')
+                                insert_bkeys('spine_4_toon', 'LocRotScale')
+                                insert_bkeys('torso_fk_ctrl_inv', 'LocRotScale')
+                                insert_bkeys('spine_3_fk_inv', 'LocRotScale')
+                                insert_bkeys('spine_2_fk_inv', 'LocRotScale')
+                                insert_bkeys('torso_fk_ctrl', 'LocRotScale')
+                                insert_bkeys('look', 'LocRotScale')
+                                insert_bkeys('elbow_pole_L', 'LocRotScale')
+                                insert_bkeys('elbow_pole_R', 'LocRotScale')
+                                insert_bkeys('knee_pole_L', 'LocRotScale')
+                                insert_bkeys('knee_pole_R', 'LocRotScale')
                                 insert_bkeys('arm_fk_L', 'LocRotScale')
                                 insert_bkeys('forearm_fk_L', 'LocRotScale')
-                                insert_bkeys('carpal_fk_L', 'LocRotScale')
-                                insert_bkeys('carpal_ik_ctrl_L', 'LocRotScale')
-                                insert_bkeys('arm_fk_ctrl_L', 'LocRotScale')
-                                insert_bkeys('shoulder_L', 'LocRotScale')
-                                insert_bkeys('hand_fk_L', 'LocRotScale')
-                                insert_bkeys('hand_fing_1_fk_L', 'LocRotScale')
-                                insert_bkeys('hand_fing_2_fk_L', 'LocRotScale')
                                 insert_bkeys('arm_ik_L', 'RotScale')
                                 insert_bkeys('forearm_ik_L', 'RotScale')
+                                insert_bkeys('arm_fk_ctrl_L', 'LocRotScale')
+                                insert_bkeys('shoulder_L', 'LocRotScale')
                                 insert_bkeys('hand_ik_ctrl_L', 'LocRotScale')
-                                insert_bkeys('hand_fing_ik_ctrl_mid_L', 'LocRotScale')
-                                insert_bkeys('fings_ik_ctrl_L', 'LocRotScale')
-                                insert_bkeys('hand_roll_ctrl_L', 'Rot')
-                                insert_bkeys('fing_roll_1_L', 'Rot')
-                                insert_bkeys('fing_roll_2_L', 'Rot')
-                                insert_bkeys('hand_sole_ctrl_L', 'LocRotScale')
+                                insert_bkeys('hand_fk_L', 'LocRotScale')
+                                insert_bkeys('elbow_pin_L', 'LocRotScale')
                                 if pbones["properties_arm_L"].toggle_arm_ik_pole_L == 1.0:
                                     insert_bkeys('elbow_pole_L', 'Loc')
+                                for prop in bpy.context.active_object.data.items():
+                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
+                                        insert_bkeys('carpal_ik_ctrl_L', 'LocRotScale')
+                                        insert_bkeys('carpal_fk_L', 'LocRotScale')
+                                        insert_bkeys('hand_fk_L', 'LocRotScale')
+
+                    #Switch Hand to Arm Space
+                    if armobj.pose.bones["properties_arm_L"].ik_arm_L < 0.1:
+                        if anim_data:
+                            if anim_data.action:
+                                if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
+                                    #Jump to previous Frame
+                                    bpy.context.scene.frame_set (bpy.context.scene.frame_current - 1)
+
+                        #Switch Hand to Free Space
+                        bpy.ops.switch.hand_space_l(space='Free')
 
         return {"FINISHED"}
 
-##### Arm_L FK>IK #####
+##### Knee_L Pin #####
 
-class Operator_Snap_ArmFKtoIK_L(bpy.types.Operator):
+class Operator_Knee_Pin_L(bpy.types.Operator):
 
-    bl_idname = "snap.arm_fk_to_ik_l"
-    bl_label = "BlenRig Arm_L FK to IK"
-    bl_description = "Switch Arm to IK preserving pose"
+    bl_idname = "pin.knee_l"
+    bl_label = "BlenRig Pin Knee_L"
+    bl_description = "Pin Knee_L"
     bl_options = {'REGISTER', 'UNDO','INTERNAL'}
 
     @classmethod
@@ -405,7 +603,9 @@ class Operator_Snap_ArmFKtoIK_L(bpy.types.Operator):
         else:
             return False
 
+    @keyframe_batch
     def execute(self, context):
+
         armobj = bpy.context.active_object
         pbones = armobj.pose.bones
         anim_data = armobj.animation_data
@@ -414,415 +614,839 @@ class Operator_Snap_ArmFKtoIK_L(bpy.types.Operator):
         for prop in bpy.context.active_object.data.items():
             if prop[0] == 'rig_type' and prop[1] == 'Biped':
 
-                if bpy.context.active_object.pose.bones["properties_arm_L"].ik_arm_L > 0.9:
+        #### Pin ####
+                if armobj.pose.bones["properties_leg_L"].pin_knee_L < 0.1:
+
                     #Collect Matrix
-                    ArmFkMat = pbones['arm_fk_L'].matrix.copy()
-                    ArmFkLoc = pbones['arm_fk_L'].location.copy()
-                    ArmFkScale = pbones['arm_fk_L'].scale.copy()
-                    ForearmFkMat = pbones['forearm_fk_L'].matrix.copy()
-                    ForearmFkLoc = pbones['forearm_fk_L'].location.copy()
-                    ForearmFkScale = pbones['forearm_fk_L'].scale.copy()
-                    ArmFkCtrlMat = pbones['arm_fk_ctrl_L'].matrix.copy()
-                    ShoulderMat = pbones['shoulder_L'].matrix.copy()
-                    ShoulderLoc = pbones['shoulder_L'].location.copy()
-                    ShoulderScale = pbones['shoulder_L'].scale.copy()
+                    ThighFkMat = pbones['thigh_fk_L'].matrix.copy()
+                    ThighFkLoc = pbones['thigh_fk_L'].location.copy()
+                    ThighFkScale = pbones['thigh_fk_L'].scale.copy()
+                    ShinFkMat = pbones['shin_fk_L'].matrix.copy()
+                    ShinFkLoc = pbones['shin_fk_L'].location.copy()
+                    ShinFkScale = pbones['shin_fk_L'].scale.copy()
+                    TorsoMat = pbones['master_torso'].matrix.copy()
+                    TorsoLoc = pbones['master_torso'].location.copy()
+                    TorsoScale = pbones['master_torso'].scale.copy()
+                    PelvisMat = pbones['pelvis_ctrl'].matrix.copy()
+                    PelvisLoc = pbones['pelvis_ctrl'].location.copy()
+                    PelvisScale = pbones['pelvis_ctrl'].scale.copy()
+                    FootFkMat = pbones['foot_fk_L'].matrix.copy()
+                    FootFkLoc = pbones['foot_fk_L'].location.copy()
+                    FootFkScale = pbones['foot_fk_L'].scale.copy()
+                    FootToe1FkMat = pbones['foot_toe_1_fk_L'].matrix.copy()
+                    FootToe1FkLoc = pbones['foot_toe_1_fk_L'].location.copy()
+                    FootToe1FkScale = pbones['foot_toe_1_fk_L'].scale.copy()
+                    FootToe2FkMat = pbones['foot_toe_2_fk_L'].matrix.copy()
+                    FootToe2FkLoc = pbones['foot_toe_2_fk_L'].location.copy()
+                    FootToe2FkScale = pbones['foot_toe_2_fk_L'].scale.copy()
+                    for prop in bpy.context.active_object.data.items():
+                        if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
+                            TarsalFkMat = pbones['tarsal_fk_L'].matrix.copy()
+                            TarsalFkLoc = pbones['tarsal_fk_L'].location.copy()
+                            TarsalFkScale = pbones['tarsal_fk_L'].scale.copy()
 
                     #Insert Keyframes if Action present
                     if anim_data:
                         if anim_data.action:
                             if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                                pbones["properties_arm_L"].keyframe_insert(data_path='ik_arm_L')
-                                insert_bkeys('arm_fk_L', 'LocRotScale')
-                                insert_bkeys('forearm_fk_L', 'LocRotScale')
-                                insert_bkeys('arm_ik_L', 'RotScale')
-                                insert_bkeys('forearm_ik_L', 'RotScale')
-                                insert_bkeys('arm_fk_ctrl_L', 'LocRotScale')
-                                insert_bkeys('shoulder_L', 'LocRotScale')
-                                insert_bkeys('hand_ik_ctrl_L', 'LocRotScale')
-                                insert_bkeys('hand_fk_L', 'LocRotScale')
-                                if pbones["properties_arm_L"].toggle_arm_ik_pole_L == 1.0:
-                                    insert_bkeys('elbow_pole_L', 'Loc')
+                                insert_pkeys('properties_leg_L', 'pin_knee_L')
+                                insert_bkeys('master_torso', 'LocRotScale')
+                                insert_bkeys('pelvis_ctrl', 'LocRotScale')
+                                insert_bkeys('spine_1_fk', 'LocRotScale')
+                                insert_bkeys('spine_2_fk', 'LocRotScale')
+                                insert_bkeys('spine_3_fk', 'LocRotScale')
+                                insert_bkeys('spine_1_toon', 'LocRotScale')
+                                insert_bkeys('spine_2_toon', 'LocRotScale')
+                                insert_bkeys('spine_3_toon', 'LocRotScale')
+                                insert_bkeys('spine_4_toon', 'LocRotScale')
+                                insert_bkeys('torso_fk_ctrl_inv', 'LocRotScale')
+                                insert_bkeys('spine_3_fk_inv', 'LocRotScale')
+                                insert_bkeys('spine_2_fk_inv', 'LocRotScale')
+                                insert_bkeys('torso_fk_ctrl', 'LocRotScale')
+                                insert_bkeys('look', 'LocRotScale')
+                                insert_bkeys('elbow_pole_L', 'LocRotScale')
+                                insert_bkeys('elbow_pole_R', 'LocRotScale')
+                                insert_bkeys('knee_pole_L', 'LocRotScale')
+                                insert_bkeys('knee_pole_R', 'LocRotScale')
+                                insert_bkeys('thigh_fk_L', 'LocRotScale')
+                                insert_bkeys('shin_fk_L', 'LocRotScale')
+                                insert_bkeys('thigh_fk_ctrl_L', 'LocRotScale')
+                                insert_bkeys('foot_fk_L', 'LocRotScale')
+                                insert_bkeys('foot_toe_1_fk_L', 'LocRotScale')
+                                insert_bkeys('foot_toe_2_fk_L', 'LocRotScale')
+                                insert_bkeys('thigh_ik_L', 'RotScale')
+                                insert_bkeys('shin_ik_L', 'RotScale')
+                                insert_bkeys('foot_ik_ctrl_L', 'LocRotScale')
+                                insert_bkeys('foot_toe_ik_ctrl_mid_L', 'LocRotScale')
+                                insert_bkeys('foot_toe_ik_ctrl_L', 'LocRotScale')
+                                insert_bkeys('foot_roll_ctrl_L', 'Rot')
+                                insert_bkeys('toe_roll_1_L', 'Rot')
+                                insert_bkeys('toe_roll_2_L', 'Rot')
+                                insert_bkeys('sole_ctrl_L', 'LocRotScale')
+                                insert_bkeys('knee_pin_L', 'LocRotScale')
+                                if pbones["properties_leg_L"].toggle_leg_ik_pole_L == 1.0:
+                                    insert_bkeys('knee_pole_L', 'Loc')
+                                for prop in bpy.context.active_object.data.items():
+                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
+                                        insert_bkeys('tarsal_fk_L', 'LocRotScale')
+                                        insert_bkeys('tarsal_ik_ctrl_L', 'LocRotScale')
 
                     #Paste Matrix
-                    pVisLocExec(pbones['hand_ik_ctrl_L'], pbones['hand_fk_L'])
-                    refresh_hack()
-                    pVisLocExec(pbones['elbow_pole_L'], pbones['snap_elbow_pole_fk_L'])
+                    pVisLocExec(pbones['knee_pin_L'], pbones['snap_knee_pin_L'])
+                    pVisRotExec(pbones['knee_pin_L'], pbones['snap_knee_pin_L'])
+                    pVisScaExec(pbones['knee_pin_L'], pbones['snap_knee_pin_L'])
                     refresh_hack()
-                    pVisRotExec (pbones['arm_ik_L'], pbones['arm_rot_L'])
+                    pVisLocExec(pbones['sole_ctrl_L'], pbones['snap_sole_ctrl_fk_L'])
+                    pVisRotExec(pbones['sole_ctrl_L'], pbones['snap_sole_ctrl_fk_L'])
                     refresh_hack()
+                    pbones['foot_roll_ctrl_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                    pbones['foot_ik_ctrl_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                    pbones['foot_ik_ctrl_L'].location[:] = (0.0, 0.0, 0.0)
+                    pbones['toe_roll_1_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                    pbones['toe_roll_2_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                    pbones['foot_toe_ik_ctrl_mid_L'].location[:] = (0.0, 0.0, 0.0)
+                    pbones['foot_toe_ik_ctrl_mid_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                    pbones['foot_toe_ik_ctrl_L'].location[:] = (0.0, 0.0, 0.0)
+                    pbones['foot_toe_ik_ctrl_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
 
-                    bpy.context.active_object.pose.bones["properties_arm_L"].ik_arm_L = 0.0
+                    armobj.pose.bones["properties_leg_L"].pin_knee_L = 1.0
                     refresh_hack()
 
-                    pbones['shoulder_L'].matrix = ShoulderMat
-                    pbones['shoulder_L'].location = ShoulderLoc
-                    pbones['shoulder_L'].scale = ShoulderScale
+                    pbones['master_torso'].matrix = TorsoMat
                     refresh_hack()
-                    pbones['arm_fk_L'].matrix = ArmFkMat
-                    pbones['arm_fk_L'].location = ArmFkLoc
-                    pbones['arm_fk_L'].scale = ArmFkScale
+                    pbones['pelvis_ctrl'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                    pbones['pelvis_ctrl'].location[:] = (0.0, 0.0, 0.0)
                     refresh_hack()
-                    pbones['forearm_fk_L'].matrix = ForearmFkMat
-                    pbones['forearm_fk_L'].location = ForearmFkLoc
-                    pbones['forearm_fk_L'].scale = ForearmFkScale
+                    pbones['thigh_fk_L'].matrix = ThighFkMat
+                    pbones['thigh_fk_L'].location = ThighFkLoc
+                    pbones['thigh_fk_L'].scale = ThighFkScale
                     refresh_hack()
-                    #Correct arm_fk twist
-                    pVisRotExec (pbones['arm_fk_L'], pbones['arm_rot_L'])
+                    pbones['shin_fk_L'].matrix = ShinFkMat
+                    pbones['shin_fk_L'].location = ShinFkLoc
+                    pbones['shin_fk_L'].scale = ShinFkScale
+                    pbones['foot_fk_L'].matrix = FootFkMat
+                    pbones['foot_fk_L'].location = FootFkLoc
+                    pbones['foot_fk_L'].scale = FootFkScale
                     refresh_hack()
-                    #Re-paste forearm matrix
-                    pbones['forearm_fk_L'].matrix = ForearmFkMat
-                    pbones['forearm_fk_L'].location = ForearmFkLoc
-                    pbones['forearm_fk_L'].scale = ForearmFkScale
+                    pbones['foot_toe_1_fk_L'].matrix = FootToe1FkMat
+                    pbones['foot_toe_1_fk_L'].location = FootToe1FkLoc
+                    pbones['foot_toe_1_fk_L'].scale = FootToe1FkScale
+                    refresh_hack()
+                    pbones['foot_toe_2_fk_L'].matrix = FootToe2FkMat
+                    pbones['foot_toe_2_fk_L'].location = FootToe2FkLoc
+                    pbones['foot_toe_2_fk_L'].scale = FootToe2FkScale
                     refresh_hack()
 
+
+
                     #Insert Keyframes if Action present
                     if anim_data:
                         if anim_data.action:
                             if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
                                 #Collect Local Transforms
-                                HandIkCtrlRotEuler = pbones['hand_ik_ctrl_L'].rotation_euler.copy()
-                                HandIkCtrlRotQuat = pbones['hand_ik_ctrl_L'].rotation_quaternion.copy()
-                                HandIkCtrlLoc = pbones['hand_ik_ctrl_L'].location.copy()
-                                HandIkCtrlScale = pbones['hand_ik_ctrl_L'].scale.copy()
+                                KneePinRotEuler = pbones['knee_pin_L'].rotation_euler.copy()
+                                KneePinRotQuat = pbones['knee_pin_L'].rotation_quaternion.copy()
+                                KneePinLoc = pbones['knee_pin_L'].location.copy()
+                                KneePinScale = pbones['knee_pin_L'].scale.copy()
 
-                                ArmIkRotEuler = pbones['arm_ik_L'].rotation_euler.copy()
-                                ArmIkRotQuat = pbones['arm_ik_L'].rotation_quaternion.copy()
-                                ArmIkLoc = pbones['arm_ik_L'].location.copy()
-                                ArmIkScale = pbones['arm_ik_L'].scale.copy()
+                                MasterTorsoRotEuler = pbones['master_torso'].rotation_euler.copy()
+                                MasterTorsoRotQuat = pbones['master_torso'].rotation_quaternion.copy()
+                                MasterTorsoLoc = pbones['master_torso'].location.copy()
+                                MasterTorsoScale = pbones['master_torso'].scale.copy()
 
-                                ElbowlLoc = pbones['elbow_pole_L'].location.copy()
+                                SoleCtrlRotEuler = pbones['sole_ctrl_L'].rotation_euler.copy()
+                                SoleCtrlRotQuat = pbones['sole_ctrl_L'].rotation_quaternion.copy()
+                                SoleCtrlLoc = pbones['sole_ctrl_L'].location.copy()
+                                SoleCtrlScale = pbones['sole_ctrl_L'].scale.copy()
 
-                                ShoulderRotEuler = pbones['shoulder_L'].rotation_euler.copy()
-                                ShoulderRotQuat = pbones['shoulder_L'].rotation_quaternion.copy()
-                                ShoulderLoc = pbones['shoulder_L'].location.copy()
-                                ShoulderScale = pbones['shoulder_L'].scale.copy()
+                                KneePoleRotEuler = pbones['knee_pole_L'].rotation_euler.copy()
+                                KneePoleRotQuat = pbones['knee_pole_L'].rotation_quaternion.copy()
+                                KneePoleLoc = pbones['knee_pole_L'].location.copy()
+                                KneePoleScale = pbones['knee_pole_L'].scale.copy()
 
-                                ArmFkRotEuler = pbones['arm_fk_L'].rotation_euler.copy()
-                                ArmFkRotQuat = pbones['arm_fk_L'].rotation_quaternion.copy()
-                                ArmFkLoc = pbones['arm_fk_L'].location.copy()
-                                ArmFkScale = pbones['arm_fk_L'].scale.copy()
+                                ThighIkRotEuler = pbones['thigh_ik_L'].rotation_euler.copy()
+                                ThighIkRotQuat = pbones['thigh_ik_L'].rotation_quaternion.copy()
+                                ThighIkLoc = pbones['thigh_ik_L'].location.copy()
+                                ThighIkScale = pbones['thigh_ik_L'].scale.copy()
 
-                                ForearmFkRotEuler = pbones['forearm_fk_L'].rotation_euler.copy()
-                                ForearmFkRotQuat = pbones['forearm_fk_L'].rotation_quaternion.copy()
-                                ForearmFkLoc = pbones['forearm_fk_L'].location.copy()
-                                ForearmFkScale = pbones['forearm_fk_L'].scale.copy()
+                                ThighFkRotEuler = pbones['thigh_fk_L'].rotation_euler.copy()
+                                ThighFkRotQuat = pbones['thigh_fk_L'].rotation_quaternion.copy()
+                                ThighFkLoc = pbones['thigh_fk_L'].location.copy()
+                                ThighFkScale = pbones['thigh_fk_L'].scale.copy()
+
+                                ShinFkRotEuler = pbones['shin_fk_L'].rotation_euler.copy()
+                                ShinFkRotQuat = pbones['shin_fk_L'].rotation_quaternion.copy()
+                                ShinFkLoc = pbones['shin_fk_L'].location.copy()
+                                ShinFkScale = pbones['shin_fk_L'].scale.copy()
+                                FootFkRotEuler = pbones['foot_fk_L'].rotation_euler.copy()
+                                FootFkRotQuat = pbones['foot_fk_L'].rotation_quaternion.copy()
+                                FootFkLoc = pbones['foot_fk_L'].location.copy()
+                                FootFkScale = pbones['foot_fk_L'].scale.copy()
+
+                                for prop in bpy.context.active_object.data.items():
+                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
+                                        TarsalFkRotEuler = pbones['tarsal_fk_L'].rotation_euler.copy()
+                                        TarsalFkRotQuat = pbones['tarsal_fk_L'].rotation_quaternion.copy()
+                                        TarsalFkLoc = pbones['tarsal_fk_L'].location.copy()
+                                        TarsalFkScale = pbones['tarsal_fk_L'].scale.copy()
+                                        TarsalIkRotEuler = pbones['tarsal_ik_ctrl_L'].rotation_euler.copy()
+                                        TarsalIkRotQuat = pbones['tarsal_ik_ctrl_L'].rotation_quaternion.copy()
+                                        TarsaIFkLoc = pbones['tarsal_ik_ctrl_L'].location.copy()
+                                        TarsalIkScale = pbones['tarsal_ik_ctrl_L'].scale.copy()
+
+                                FootToe1FkRotEuler = pbones['foot_toe_1_fk_L'].rotation_euler.copy()
+                                FootToe1FkRotQuat = pbones['foot_toe_1_fk_L'].rotation_quaternion.copy()
+                                FootToe1FkLoc = pbones['foot_toe_1_fk_L'].location.copy()
+                                FootToe1FkScale = pbones['foot_toe_1_fk_L'].scale.copy()
+
+                                FootToe2FkRotEuler = pbones['foot_toe_2_fk_L'].rotation_euler.copy()
+                                FootToe2FkRotQuat = pbones['foot_toe_2_fk_L'].rotation_quaternion.copy()
+                                FootToe2FkLoc = pbones['foot_toe_2_fk_L'].location.copy()
+                                FootToe2FkScale = pbones['foot_toe_2_fk_L'].scale.copy()
 
                                 #Jump to next Frame
                                 bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
 
                                 #Key Property
-                                armobj.pose.bones["properties_arm_L"].ik_arm_L = 0.0
+                                armobj.pose.bones["properties_leg_L"].pin_knee_L = 1.0
                                 refresh_hack()
-                                pbones["properties_arm_L"].keyframe_insert(data_path='ik_arm_L')
+                                insert_pkeys('properties_leg_L', 'pin_knee_L')
 
                                 #Re-Paste Transforms
-                                pbones['hand_ik_ctrl_L'].rotation_euler = HandIkCtrlRotEuler
-                                pbones['hand_ik_ctrl_L'].rotation_quaternion = HandIkCtrlRotQuat
-                                pbones['hand_ik_ctrl_L'].location = HandIkCtrlLoc
-                                pbones['hand_ik_ctrl_L'].scale = HandIkCtrlScale
+                                pbones['master_torso'].rotation_euler = MasterTorsoRotEuler
+                                pbones['master_torso'].rotation_quaternion = MasterTorsoRotQuat
+                                pbones['master_torso'].location = MasterTorsoLoc
+                                pbones['master_torso'].scale = MasterTorsoScale
                                 refresh_hack()
-                                pbones['elbow_pole_L'].location = ElbowlLoc
+                                pbones['pelvis_ctrl'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                                pbones['pelvis_ctrl'].location[:] = (0.0, 0.0, 0.0)
                                 refresh_hack()
-                                pbones['arm_ik_L'].rotation_euler = ArmIkRotEuler
-                                pbones['arm_ik_L'].rotation_quaternion = ArmIkRotQuat
-                                pbones['arm_ik_L'].location = ArmIkLoc
-                                pbones['arm_ik_L'].scale = ArmIkScale
+                                pbones['knee_pin_L'].rotation_euler = KneePinRotEuler
+                                pbones['knee_pin_L'].rotation_quaternion = KneePinRotQuat
+                                pbones['knee_pin_L'].location = KneePinLoc
+                                pbones['knee_pin_L'].scale = KneePinScale
                                 refresh_hack()
-                                pbones['shoulder_L'].rotation_euler = ShoulderRotEuler
-                                pbones['shoulder_L'].rotation_quaternion = ShoulderRotQuat
-                                pbones['shoulder_L'].location = ShoulderLoc
-                                pbones['shoulder_L'].scale = ShoulderScale
+                                pbones['sole_ctrl_L'].rotation_euler = SoleCtrlRotEuler
+                                pbones['sole_ctrl_L'].rotation_quaternion = SoleCtrlRotQuat
+                                pbones['sole_ctrl_L'].location = SoleCtrlLoc
+                                pbones['sole_ctrl_L'].scale = SoleCtrlScale
                                 refresh_hack()
-                                pbones['arm_fk_L'].rotation_euler = ArmFkRotEuler
-                                pbones['arm_fk_L'].rotation_quaternion = ArmFkRotQuat
-                                pbones['arm_fk_L'].location = ArmFkLoc
-                                pbones['arm_fk_L'].scale = ArmFkScale
+                                pbones['knee_pole_L'].rotation_euler = KneePoleRotEuler
+                                pbones['knee_pole_L'].rotation_quaternion = KneePoleRotQuat
+                                pbones['knee_pole_L'].location = KneePoleLoc
+                                pbones['knee_pole_L'].scale = KneePoleScale
                                 refresh_hack()
-                                pbones['forearm_fk_L'].rotation_euler = ForearmFkRotEuler
-                                pbones['forearm_fk_L'].rotation_quaternion = ForearmFkRotQuat
-                                pbones['forearm_fk_L'].location = ForearmFkLoc
-                                pbones['forearm_fk_L'].scale = ForearmFkScale
+                                pbones['thigh_ik_L'].rotation_euler = ThighIkRotEuler
+                                pbones['thigh_ik_L'].rotation_quaternion = ThighIkRotQuat
+                                pbones['thigh_ik_L'].location = ThighIkLoc
+                                pbones['thigh_ik_L'].scale = ThighIkScale
+                                refresh_hack()
+                                pbones['thigh_fk_L'].rotation_euler = ThighFkRotEuler
+                                pbones['thigh_fk_L'].rotation_quaternion = ThighFkRotQuat
+                                pbones['thigh_fk_L'].location = ThighFkLoc
+                                pbones['thigh_fk_L'].scale = ThighFkScale
+                                refresh_hack()
+                                pbones['shin_fk_L'].rotation_euler = ShinFkRotEuler
+                                pbones['shin_fk_L'].rotation_quaternion = ShinFkRotQuat
+                                pbones['shin_fk_L'].location = ShinFkLoc
+                                pbones['shin_fk_L'].scale = ShinFkScale
+                                refresh_hack()
+                                pbones['foot_fk_L'].rotation_euler = FootFkRotEuler
+                                pbones['foot_fk_L'].rotation_quaternion = FootFkRotQuat
+                                pbones['foot_fk_L'].location = FootFkLoc
+                                pbones['foot_fk_L'].scale = FootFkScale
+                                refresh_hack()
+                                for prop in bpy.context.active_object.data.items():
+                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
+                                        pbones['tarsal_ik_ctrl_L'].rotation_euler = TarsalIkRotEuler
+                                        pbones['tarsal_ik_ctrl_L'].rotation_quaternion = TarsalIkRotQuat
+                                        pbones['tarsal_ik_ctrl_L'].location = TarsaIFkLoc
+                                        pbones['tarsal_ik_ctrl_L'].scale = TarsalIkScale
+                                        refresh_hack()
+                                        pbones['tarsal_fk_L'].rotation_euler = TarsalFkRotEuler
+                                        pbones['tarsal_fk_L'].rotation_quaternion = TarsalFkRotQuat
+                                        pbones['tarsal_fk_L'].location = TarsalFkLoc
+                                        pbones['tarsal_fk_L'].scale = TarsalFkScale
+                                        refresh_hack()
+                                pbones['foot_toe_1_fk_L'].rotation_euler = FootToe1FkRotEuler
+                                pbones['foot_toe_1_fk_L'].rotation_quaternion = FootToe1FkRotQuat
+                                pbones['foot_toe_1_fk_L'].location = FootToe1FkLoc
+                                pbones['foot_toe_1_fk_L'].scale = FootToe1FkScale
+                                refresh_hack()
+                                pbones['foot_toe_2_fk_L'].rotation_euler = FootToe2FkRotEuler
+                                pbones['foot_toe_2_fk_L'].rotation_quaternion = FootToe2FkRotQuat
+                                pbones['foot_toe_2_fk_L'].location = FootToe2FkLoc
+                                pbones['foot_toe_2_fk_L'].scale = FootToe2FkScale
+                                refresh_hack()
+                                pbones['foot_roll_ctrl_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                                pbones['foot_ik_ctrl_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                                pbones['foot_ik_ctrl_L'].location[:] = (0.0, 0.0, 0.0)
+                                pbones['toe_roll_1_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                                pbones['toe_roll_2_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                                pbones['foot_toe_ik_ctrl_mid_L'].location[:] = (0.0, 0.0, 0.0)
+                                pbones['foot_toe_ik_ctrl_mid_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                                pbones['foot_toe_ik_ctrl_L'].location[:] = (0.0, 0.0, 0.0)
+                                pbones['foot_toe_ik_ctrl_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
                                 refresh_hack()
 
-                                insert_bkeys('arm_fk_L', 'LocRotScale')
-                                insert_bkeys('forearm_fk_L', 'LocRotScale')
-                                insert_bkeys('arm_ik_L', 'RotScale')
-                                insert_bkeys('forearm_ik_L', 'RotScale')
-                                insert_bkeys('arm_fk_ctrl_L', 'LocRotScale')
-                                insert_bkeys('shoulder_L', 'LocRotScale')
-                                insert_bkeys('hand_ik_ctrl_L', 'LocRotScale')
-                                insert_bkeys('hand_fk_L', 'LocRotScale')
-                                if pbones["properties_arm_L"].toggle_arm_ik_pole_L == 1.0:
-                                    insert_bkeys('elbow_pole_L', 'Loc')
+                                insert_bkeys('master_torso', 'LocRotScale')
+                                insert_bkeys('pelvis_ctrl', 'LocRotScale')
+                                insert_bkeys('spine_1_fk', 'LocRotScale')
+                                insert_bkeys('spine_2_fk', 'LocRotScale')
+                                insert_bkeys('spine_3_fk', 'LocRotScale')
+                                insert_bkeys('spine_1_toon', 'LocRotScale')
+                                insert_bkeys('spine_2_toon', 'LocRotScale')
+                                insert_bkeys('spine_3_toon', 'LocRotScale')
+                                insert_bkeys('spine_4_toon', 'LocRotScale')
+                                insert_bkeys('torso_fk_ctrl_inv', 'LocRotScale')
+                                insert_bkeys('spine_3_fk_inv', 'LocRotScale')
+                                insert_bkeys('spine_2_fk_inv', 'LocRotScale')
+                                insert_bkeys('torso_fk_ctrl', 'LocRotScale')
+                                insert_bkeys('look', 'LocRotScale')
+                                insert_bkeys('elbow_pole_L', 'LocRotScale')
+                                insert_bkeys('elbow_pole_R', 'LocRotScale')
+                                insert_bkeys('knee_pole_L', 'LocRotScale')
+                                insert_bkeys('knee_pole_R', 'LocRotScale')
+                                insert_bkeys('thigh_fk_L', 'LocRotScale')
+                                insert_bkeys('shin_fk_L', 'LocRotScale')
+                                insert_bkeys('thigh_fk_ctrl_L', 'LocRotScale')
+                                insert_bkeys('foot_fk_L', 'LocRotScale')
+                                insert_bkeys('foot_toe_1_fk_L', 'LocRotScale')
+                                insert_bkeys('foot_toe_2_fk_L', 'LocRotScale')
+                                insert_bkeys('thigh_ik_L', 'RotScale')
+                                insert_bkeys('shin_ik_L', 'RotScale')
+                                insert_bkeys('foot_ik_ctrl_L', 'LocRotScale')
+                                insert_bkeys('foot_toe_ik_ctrl_mid_L', 'LocRotScale')
+                                insert_bkeys('foot_toe_ik_ctrl_L', 'LocRotScale')
+                                insert_bkeys('foot_roll_ctrl_L', 'Rot')
+                                insert_bkeys('toe_roll_1_L', 'Rot')
+                                insert_bkeys('toe_roll_2_L', 'Rot')
+                                insert_bkeys('sole_ctrl_L', 'LocRotScale')
+                                insert_bkeys('knee_pin_L', 'LocRotScale')
+                                if pbones["properties_leg_L"].toggle_leg_ik_pole_L == 1.0:
+                                    insert_bkeys('knee_pole_L', 'Loc')
+                                for prop in bpy.context.active_object.data.items():
+                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
+                                        insert_bkeys('tarsal_fk_L', 'LocRotScale')
+                                        insert_bkeys('tarsal_ik_ctrl_L', 'LocRotScale')
 
-                    #Switch Hand to Arm Space
-                    if anim_data:
-                        if anim_data.action:
-                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                                #Jump to previous Frame
-                                bpy.context.scene.frame_set (bpy.context.scene.frame_current - 1)
+        return {"FINISHED"}
+
+##### Knee_L UnPin #####
 
-                    #Switch Hand to Free Space
-                    bpy.ops.switch.hand_space_l(space='Free')
+class Operator_Knee_UnPin_L(bpy.types.Operator):
 
-        #Quadruped
+    bl_idname = "unpin.knee_l"
+    bl_label = "BlenRig UnPin Knee_L"
+    bl_description = "UnPin Knee_L"
+    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
+
+    @classmethod
+    def poll(cls, context):
+        if not bpy.context.active_object:
+            return False
+        if (bpy.context.active_object.type in ["ARMATURE"]):
+            for prop in bpy.context.active_object.data.items():
+                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
+                    for prop in bpy.context.active_object.data.items():
+                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
+                            return True
+        else:
+            return False
+
+    @keyframe_batch
+    def execute(self, context):
+
+        armobj = bpy.context.active_object
+        pbones = armobj.pose.bones
+        anim_data = armobj.animation_data
+
+        #Biped
         for prop in bpy.context.active_object.data.items():
-            if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
+            if prop[0] == 'rig_type' and prop[1] == 'Biped':
 
-                if bpy.context.active_object.pose.bones["properties_arm_L"].ik_arm_L > 0.9:
+                if armobj.pose.bones["properties_leg_L"].pin_knee_L > 0.9:
 
                     #Collect Matrix
-                    ArmFkMat = pbones['arm_fk_L'].matrix.copy()
-                    ArmFkLoc = pbones['arm_fk_L'].location.copy()
-                    ArmFkScale = pbones['arm_fk_L'].scale.copy()
-                    ForearmFkMat = pbones['forearm_fk_L'].matrix.copy()
-                    ForearmFkLoc = pbones['forearm_fk_L'].location.copy()
-                    ForearmFkScale = pbones['forearm_fk_L'].scale.copy()
-                    CarpalFkMat = pbones['carpal_fk_L'].matrix.copy()
-                    CarpalFkLoc = pbones['carpal_fk_L'].location.copy()
-                    CarpalFkScale = pbones['carpal_fk_L'].scale.copy()
-                    HandFing1FkMat = pbones['hand_fing_1_fk_L'].matrix.copy()
-                    HandFing1FkLoc = pbones['hand_fing_1_fk_L'].location.copy()
-                    HandFing1FkScale = pbones['hand_fing_1_fk_L'].scale.copy()
-                    HandFing2FkMat = pbones['hand_fing_2_fk_L'].matrix.copy()
-                    HandFing2FkLoc = pbones['hand_fing_2_fk_L'].location.copy()
-                    HandFing2FkScale = pbones['hand_fing_2_fk_L'].scale.copy()
-                    ArmFkCtrlMat = pbones['arm_fk_ctrl_L'].matrix.copy()
-                    ShoulderMat = pbones['shoulder_L'].matrix.copy()
-                    ShoulderLoc = pbones['shoulder_L'].location.copy()
-                    ShoulderScale = pbones['shoulder_L'].scale.copy()
+                    MasterTorsoMat = pbones['master_torso'].matrix.copy()
+                    MasterTorsoLoc = pbones['master_torso'].location.copy()
+                    MasterTorsoScale = pbones['master_torso'].scale.copy()
+                    PelvisMat = pbones['pelvis_ctrl'].matrix.copy()
+                    PelvisLoc = pbones['pelvis_ctrl'].location.copy()
+                    PelvisScale = pbones['pelvis_ctrl'].scale.copy()
+                    Spine1FKMat = pbones['spine_1_fk'].matrix.copy()
+                    Spine1FKLoc = pbones['spine_1_fk'].location.copy()
+                    Spine1FKScale = pbones['spine_1_fk'].scale.copy()
+                    Spine2FKMat = pbones['spine_2_fk'].matrix.copy()
+                    Spine2FKLoc = pbones['spine_2_fk'].location.copy()
+                    Spine2FKScale = pbones['spine_2_fk'].scale.copy()
+                    Spine3FKMat = pbones['spine_3_fk'].matrix.copy()
+                    Spine3FKLoc = pbones['spine_3_fk'].location.copy()
+                    Spine3FKScale = pbones['spine_3_fk'].scale.copy()
+                    Spine1ToonMat = pbones['spine_1_toon'].matrix.copy()
+                    Spine1ToonLoc = pbones['spine_1_toon'].location.copy()
+                    Spine1ToonScale = pbones['spine_1_toon'].scale.copy()
+                    Spine2ToonMat = pbones['spine_2_toon'].matrix.copy()
+                    Spine2ToonLoc = pbones['spine_2_toon'].location.copy()
+                    Spine2ToonScale = pbones['spine_2_toon'].scale.copy()
+                    Spine3ToonMat = pbones['spine_3_toon'].matrix.copy()
+                    Spine3ToonLoc = pbones['spine_3_toon'].location.copy()
+                    Spine3ToonScale = pbones['spine_3_toon'].scale.copy()
+                    Spine4ToonMat = pbones['spine_4_toon'].matrix.copy()
+                    Spine4ToonLoc = pbones['spine_4_toon'].location.copy()
+                    Spine4ToonScale = pbones['spine_4_toon'].scale.copy()
+                    Look_world_mat = pbones['look'].id_data.matrix_world.copy()
+                    Look_mat = pbones['look'].matrix.copy()
+                    ElbowLMat = pbones['elbow_pole_L'].matrix.copy()
+                    ElbowRMat = pbones['elbow_pole_R'].matrix.copy()
+                    KneeLMat = pbones['knee_pole_L'].matrix.copy()
+                    KneeRMat = pbones['knee_pole_R'].matrix.copy()
+                    ThighFkMat = pbones['thigh_fk_L'].matrix.copy()
+                    ThighFkLoc = pbones['thigh_fk_L'].location.copy()
+                    ThighFkScale = pbones['thigh_fk_L'].scale.copy()
+                    ShinFkMat = pbones['shin_fk_L'].matrix.copy()
+                    ShinFkLoc = pbones['shin_fk_L'].location.copy()
+                    ShinFkScale = pbones['shin_fk_L'].scale.copy()
+                    SoleCtrlMat = pbones['sole_ctrl_L'].matrix.copy()
+                    SoleCtrlLoc = pbones['sole_ctrl_L'].location.copy()
+                    SoleCtrlScale = pbones['sole_ctrl_L'].scale.copy()
+                    FootFKMat = pbones['foot_fk_L'].matrix.copy()
+                    FootFKLoc = pbones['foot_fk_L'].location.copy()
+                    FootFkScale = pbones['foot_fk_L'].scale.copy()
 
                     #Insert Keyframes if Action present
                     if anim_data:
                         if anim_data.action:
                             if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                                pbones["properties_arm_L"].keyframe_insert(data_path='ik_arm_L')
-                                insert_bkeys('arm_fk_L', 'LocRotScale')
-                                insert_bkeys('forearm_fk_L', 'LocRotScale')
-                                insert_bkeys('shoulder_L', 'LocRotScale')
-                                insert_bkeys('carpal_fk_L', 'LocRotScale')
-                                insert_bkeys('carpal_ik_ctrl_L', 'LocRotScale')
-                                insert_bkeys('arm_fk_ctrl_L', 'LocRotScale')
-                                insert_bkeys('hand_fk_L', 'LocRotScale')
-                                insert_bkeys('hand_fing_1_fk_L', 'LocRotScale')
-                                insert_bkeys('hand_fing_2_fk_L', 'LocRotScale')
-                                insert_bkeys('arm_ik_L', 'RotScale')
-                                insert_bkeys('forearm_ik_L', 'RotScale')
-                                insert_bkeys('hand_ik_ctrl_L', 'LocRotScale')
-                                insert_bkeys('hand_fing_ik_ctrl_mid_L', 'LocRotScale')
-                                insert_bkeys('fings_ik_ctrl_L', 'LocRotScale')
-                                insert_bkeys('hand_roll_ctrl_L', 'Rot')
-                                insert_bkeys('fing_roll_1_L', 'Rot')
-                                insert_bkeys('fing_roll_2_L', 'Rot')
-                                insert_bkeys('hand_sole_ctrl_L', 'LocRotScale')
-                                if pbones["properties_arm_L"].toggle_arm_ik_pole_L == 1.0:
-                                    insert_bkeys('elbow_pole_L', 'Loc')
-
-                    #Paste Matrix
-                    pVisLocExec(pbones['hand_sole_ctrl_L'], pbones['snap_hand_sole_ctrl_fk_L'])
-                    pVisRotExec(pbones['hand_sole_ctrl_L'], pbones['snap_hand_sole_ctrl_fk_L'])
-                    refresh_hack()
-                    pbones['hand_roll_ctrl_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    pbones['hand_ik_ctrl_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    pbones['hand_ik_ctrl_L'].location[:] = (0.0, 0.0, 0.0)
-                    pbones['fing_roll_1_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    pbones['fing_roll_2_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    pbones['hand_fing_ik_ctrl_mid_L'].location[:] = (0.0, 0.0, 0.0)
-                    pbones['hand_fing_ik_ctrl_mid_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    pbones['fings_ik_ctrl_L'].location[:] = (0.0, 0.0, 0.0)
-                    pbones['fings_ik_ctrl_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    pVisLocExec(pbones['elbow_pole_L'], pbones['snap_elbow_pole_fk_L'])
-                    refresh_hack()
-                    pVisLocExec(pbones['carpal_ik_ctrl_L'], pbones['snap_carpal_fk_L'])
-                    pVisRotExec(pbones['carpal_ik_ctrl_L'], pbones['snap_carpal_fk_L'])
-                    refresh_hack()
-
-                    bpy.context.active_object.pose.bones["properties_arm_L"].ik_arm_L = 0.0
-                    refresh_hack()
-
-                    pVisRotExec (pbones['arm_ik_L'], pbones['arm_fk_ctrl_L'])
-                    refresh_hack()
-                    pbones['shoulder_L'].matrix = ShoulderMat
-                    pbones['shoulder_L'].location = ShoulderLoc
-                    pbones['shoulder_L'].scale = ShoulderScale
-                    refresh_hack()
-                    pbones['arm_fk_L'].matrix = ArmFkMat
-                    pbones['arm_fk_L'].location = ArmFkLoc
-                    pbones['arm_fk_L'].scale = ArmFkScale
-                    refresh_hack()
-                    pbones['forearm_fk_L'].matrix = ForearmFkMat
-                    pbones['forearm_fk_L'].location = ForearmFkLoc
-                    pbones['forearm_fk_L'].scale = ForearmFkScale
-                    refresh_hack()
-                    pbones['carpal_fk_L'].matrix = CarpalFkMat
-                    pbones['carpal_fk_L'].location = CarpalFkLoc
-                    pbones['carpal_fk_L'].scale = CarpalFkScale
-                    refresh_hack()
-                    pbones['hand_fing_1_fk_L'].matrix = HandFing1FkMat
-                    pbones['hand_fing_1_fk_L'].location = HandFing1FkLoc
-                    pbones['hand_fing_1_fk_L'].scale = HandFing1FkScale
+                                insert_pkeys('properties_leg_L', 'pin_knee_L')
+                                insert_bkeys('master_torso', 'LocRotScale')
+                                insert_bkeys('pelvis_ctrl', 'LocRotScale')
+                                insert_bkeys('spine_1_fk', 'LocRotScale')
+                                insert_bkeys('spine_2_fk', 'LocRotScale')
+                                insert_bkeys('spine_3_fk', 'LocRotScale')
+                                insert_bkeys('spine_1_toon', 'LocRotScale')
+                                insert_bkeys('spine_2_toon', 'LocRotScale')
+                                insert_bkeys('spine_3_toon', 'LocRotScale')
+                                insert_bkeys('spine_4_toon', 'LocRotScale')
+                                insert_bkeys('torso_fk_ctrl_inv', 'LocRotScale')
+                                insert_bkeys('spine_3_fk_inv', 'LocRotScale')
+                                insert_bkeys('spine_2_fk_inv', 'LocRotScale')
+                                insert_bkeys('torso_fk_ctrl', 'LocRotScale')
+                                insert_bkeys('look', 'LocRotScale')
+                                insert_bkeys('elbow_pole_L', 'LocRotScale')
+                                insert_bkeys('elbow_pole_R', 'LocRotScale')
+                                insert_bkeys('knee_pole_L', 'LocRotScale')
+                                insert_bkeys('knee_pole_R', 'LocRotScale')
+                                insert_bkeys('thigh_fk_L', 'LocRotScale')
+                                insert_bkeys('shin_fk_L', 'LocRotScale')
+                                insert_bkeys('thigh_fk_ctrl_L', 'LocRotScale')
+                                insert_bkeys('foot_fk_L', 'LocRotScale')
+                                insert_bkeys('foot_toe_1_fk_L', 'LocRotScale')
+                                insert_bkeys('foot_toe_2_fk_L', 'LocRotScale')
+                                insert_bkeys('thigh_ik_L', 'RotScale')
+                                insert_bkeys('shin_ik_L', 'RotScale')
+                                insert_bkeys('foot_ik_ctrl_L', 'LocRotScale')
+                                insert_bkeys('foot_toe_ik_ctrl_mid_L', 'LocRotScale')
+                                insert_bkeys('foot_toe_ik_ctrl_L', 'LocRotScale')
+                                insert_bkeys('foot_roll_ctrl_L', 'Rot')
+                                insert_bkeys('toe_roll_1_L', 'Rot')
+                                insert_bkeys('toe_roll_2_L', 'Rot')
+                                insert_bkeys('sole_ctrl_L', 'LocRotScale')
+                                insert_bkeys('knee_pin_L', 'LocRotScale')
+                                if pbones["properties_leg_L"].toggle_leg_ik_pole_L == 1.0:
+                                    insert_bkeys('knee_pole_L', 'Loc')
+                                for prop in bpy.context.active_object.data.items():
+                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
+                                        insert_bkeys('tarsal_fk_L', 'LocRotScale')
+                                        insert_bkeys('tarsal_ik_ctrl_L', 'LocRotScale')
+
+                    #Collect Current Pose and save new Matrix
+                    pVisLocExec (pbones['spine_1_fk'], pbones['spine_1_def'])
+                    pVisRotExec (pbones['spine_1_fk'], pbones['spine_1_def'])
+                    refresh_hack()
+                    Spine1FKMat2 = pbones['spine_1_fk'].matrix.copy()
+                    refresh_hack()
+                    pbones['spine_1_fk'].matrix = Spine1FKMat
+                    refresh_hack()
+                    pVisLocExec (pbones['spine_2_fk'], pbones['spine_2_def'])
+                    pVisRotExec (pbones['spine_2_fk'], pbones['spine_2_def'])
+                    refresh_hack()
+                    Spine2FKMat2 = pbones['spine_2_fk'].matrix.copy()
+                    refresh_hack()
+                    pbones['spine_2_fk'].matrix = Spine2FKMat
+                    refresh_hack()
+                    pVisLocExec (pbones['spine_3_fk'], pbones['spine_3_def'])
+                    pVisRotExec (pbones['spine_3_fk'], pbones['spine_3_def'])
+                    refresh_hack()
+                    Spine3FKMat2 = pbones['spine_3_fk'].matrix.copy()
+                    refresh_hack()
+                    pbones['spine_3_fk'].matrix = Spine3FKMat
+                    refresh_hack()
+
+                    #Paste Matrix
+                    pVisLocExec(pbones['master_torso'], pbones['snap_master_torso'])
+                    pVisRotExec (pbones['master_torso'], pbones['snap_master_torso'])
+                    refresh_hack()
+                    pVisLocExec(pbones['sole_ctrl_L'], pbones['snap_sole_ctrl_fk_L'])
+                    pVisRotExec (pbones['sole_ctrl_L'], pbones['snap_sole_ctrl_fk_L'])
+                    refresh_hack()
+                    pVisLocExec(pbones['knee_pole_L'], pbones['snap_knee_pole_fk_L'])
                     refresh_hack()
-                    pbones['hand_fing_2_fk_L'].matrix = HandFing2FkMat
-                    pbones['hand_fing_2_fk_L'].location = HandFing2FkLoc
-                    pbones['hand_fing_2_fk_L'].scale = HandFing2FkScale
+                    pVisRotExec (pbones['thigh_ik_L'], pbones['thigh_rot_L'])
+                    refresh_hack()
+                    pVisRotExec (pbones['thigh_fk_ctrl_L'], pbones['thigh_fk_L'])
+                    pbones['thigh_fk_ctrl_L'].scale[:] = (1.0, 1.0, 1.0)
                     refresh_hack()
 
+                    bpy.context.active_object.pose.bones["properties_leg_L"].pin_knee_L = 0.0
+                    refresh_hack()
+                    #Align Spine
+                    pbones['torso_fk_ctrl_inv'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                    pbones['torso_fk_ctrl_inv'].rotation_quaternion[:] = (1.0,0.0, 0.0, 0.0)
+                    pbones['torso_fk_ctrl_inv'].location[:] = (0.0, 0.0, 0.0)
+                    pbones['torso_fk_ctrl_inv'].scale[:] = (1.0, 1.0, 1.0)
+                    refresh_hack()
+                    pbones['spine_3_fk_inv'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                    pbones['spine_3_fk_inv'].rotation_quaternion[:] = (1.0,0.0, 0.0, 0.0)
+                    pbones['spine_3_fk_inv'].location[:] = (0.0, 0.0, 0.0)
+                    pbones['spine_3_fk_inv'].scale[:] = (1.0, 1.0, 1.0)
+                    refresh_hack()
+                    pbones['spine_2_fk_inv'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                    pbones['spine_2_fk_inv'].rotation_quaternion[:] = (1.0,0.0, 0.0, 0.0)
+                    pbones['spine_2_fk_inv'].location[:] = (0.0, 0.0, 0.0)
+                    pbones['spine_2_fk_inv'].scale[:] = (1.0, 1.0, 1.0)
+                    refresh_hack()
+                    pbones['pelvis_ctrl'].matrix = PelvisMat
+                    refresh_hack()
+                    pbones['spine_1_fk'].matrix = Spine1FKMat2
+                    refresh_hack()
+                    pbones['spine_2_fk'].matrix = Spine2FKMat2
+                    refresh_hack()
+                    pbones['spine_3_fk'].matrix = Spine3FKMat2
+                    refresh_hack()
+                    pbones['spine_1_toon'].matrix = Spine1ToonMat
+                    pbones['spine_1_toon'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                    refresh_hack()
+                    pbones['spine_2_toon'].matrix = Spine2ToonMat
+                    pbones['spine_2_toon'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                    refresh_hack()
+                    pbones['spine_3_toon'].matrix = Spine3ToonMat
+                    pbones['spine_3_toon'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                    refresh_hack()
+                    pbones['spine_4_toon'].matrix = Spine4ToonMat
+                    pbones['spine_4_toon'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                    refresh_hack()
+                    pbones['elbow_pole_L'].matrix = ElbowLMat
+                    refresh_hack()
+                    pbones['elbow_pole_R'].matrix = ElbowRMat
+                    refresh_hack()
+                    #Leg
+                    pbones['thigh_fk_L'].matrix = ThighFkMat
+                    refresh_hack()
+                    pbones['shin_fk_L'].matrix = ShinFkMat
+                    refresh_hack()
+                    #Correct thigh_fk twist
+                    pVisRotExec (pbones['thigh_fk_L'], pbones['thigh_rot_L'])
+                    refresh_hack()
+                    #Re-paste shin matrix
+                    pbones['shin_fk_L'].matrix = ShinFkMat
+                    pbones['shin_fk_L'].location = ShinFkLoc
+                    pbones['shin_fk_L'].scale = ShinFkScale
+                    refresh_hack()
+                    pbones['foot_fk_L'].matrix = FootFKMat
+                    pbones['foot_fk_L'].location = FootFKLoc
+                    pbones['foot_fk_L'].scale = FootFkScale
+                    refresh_hack()
+                    if bpy.context.active_object.pose.bones["properties_head"].look_switch == 0.0:
+                        paste_visual_matrix('look', 'look_free', Look_world_mat, Look_mat, 'Location')
+                        paste_visual_matrix('look', 'look_free', Look_world_mat, Look_mat, 'Rotation')
+                    if bpy.context.active_object.pose.bones["properties_head"].look_switch == 1.0:
+                        paste_visual_matrix('look', 'master_body_pivot', Look_world_mat, Look_mat, 'Location')
+                        paste_visual_matrix('look', 'master_body_pivot', Look_world_mat, Look_mat, 'Rotation')
+                    if bpy.context.active_object.pose.bones["properties_head"].look_switch == 2.0:
+                        paste_visual_matrix('look', 'master_torso_pivot', Look_world_mat, Look_mat, 'Location')
+                        paste_visual_matrix('look', 'master_torso_pivot', Look_world_mat, Look_mat, 'Rotation')
+                    if bpy.context.active_object.pose.bones["properties_head"].look_switch == 3.0:
+                        paste_visual_matrix('look', 'head_fk', Look_world_mat, Look_mat, 'Location')
+                        paste_visual_matrix('look', 'head_fk', Look_world_mat, Look_mat, 'Rotation')
+                    refresh_hack()
                     #Insert Keyframes if Action present
                     if anim_data:
                         if anim_data.action:
                             if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
                                 #Collect Local Transforms
+                                MasterTorsoRotEuler = pbones['master_torso'].rotation_euler.copy()
+                                MasterTorsoLoc = pbones['master_torso'].location.copy()
+                                MasterTorsoScale = pbones['master_torso'].scale.copy()
 
-                                SoleCtrlRotEuler = pbones['hand_sole_ctrl_L'].rotation_euler.copy()
-                                SoleCtrlRotQuat = pbones['hand_sole_ctrl_L'].rotation_quaternion.copy()
-                                SoleCtrlLoc = pbones['hand_sole_ctrl_L'].location.copy()
-                                SoleCtrlScale = pbones['hand_sole_ctrl_L'].scale.copy()
+                                PelvisRotEuler = pbones['pelvis_ctrl'].rotation_euler.copy()
+                                PelvisLoc = pbones['pelvis_ctrl'].location.copy()
+                                PelvisScale = pbones['pelvis_ctrl'].scale.copy()
 
-                                ElbowPoleRotEuler = pbones['elbow_pole_L'].rotation_euler.copy()
-                                ElbowPoleRotQuat = pbones['elbow_pole_L'].rotation_quaternion.copy()
-                                ElbowPoleLoc = pbones['elbow_pole_L'].location.copy()
-                                ElbowPoleScale = pbones['elbow_pole_L'].scale.copy()
+                                Spine1FKRotEuler = pbones['spine_1_fk'].rotation_euler.copy()
+                                Spine1FKLoc = pbones['spine_1_fk'].location.copy()
+                                Spine1FKScale = pbones['spine_1_fk'].scale.copy()
 
-                                ShoulderRotEuler = pbones['shoulder_L'].rotation_euler.copy()
-                                ShoulderRotQuat = pbones['shoulder_L'].rotation_quaternion.copy()
-                                ShoulderLoc = pbones['shoulder_L'].location.copy()
-                                ShoulderScale = pbones['shoulder_L'].scale.copy()
+                                Spine2FKRotEuler = pbones['spine_2_fk'].rotation_euler.copy()
+                                Spine2FKLoc = pbones['spine_2_fk'].location.copy()
+                                Spine2FKScale = pbones['spine_2_fk'].scale.copy()
 
-                                ArmIkRotEuler = pbones['arm_ik_L'].rotation_euler.copy()
-                                ArmIkRotQuat = pbones['arm_ik_L'].rotation_quaternion.copy()
-                                ArmIkLoc = pbones['arm_ik_L'].location.copy()
-                                ArmIkScale = pbones['arm_ik_L'].scale.copy()
+                                Spine3FKRotEuler = pbones['spine_3_fk'].rotation_euler.copy()
+                                Spine3FKLoc = pbones['spine_3_fk'].location.copy()
+                                Spine3FKScale = pbones['spine_3_fk'].scale.copy()
 
-                                ArmFkRotEuler = pbones['arm_fk_L'].rotation_euler.copy()
-                                ArmFkRotQuat = pbones['arm_fk_L'].rotation_quaternion.copy()
-                                ArmFkLoc = pbones['arm_fk_L'].location.copy()
-                                ArmFkScale = pbones['arm_fk_L'].scale.copy()
+                                Spine1ToonRotEuler = pbones['spine_1_toon'].rotation_euler.copy()
+                                Spine1ToonLoc = pbones['spine_1_toon'].location.copy()
+                                Spine1ToonScale = pbones['spine_1_toon'].scale.copy()
 
-                                ForearmFkRotEuler = pbones['forearm_fk_L'].rotation_euler.copy()
-                                ForearmFkRotQuat = pbones['forearm_fk_L'].rotation_quaternion.copy()
-                                ForearmFkLoc = pbones['forearm_fk_L'].location.copy()
-                                ForearmFkScale = pbones['forearm_fk_L'].scale.copy()
+                                Spine2ToonRotEuler = pbones['spine_2_toon'].rotation_euler.copy()
+                                Spine2ToonLoc = pbones['spine_2_toon'].location.copy()
+                                Spine2ToonScale = pbones['spine_2_toon'].scale.copy()
+
+                                Spine3ToonRotEuler = pbones['spine_3_toon'].rotation_euler.copy()
+                                Spine3ToonLoc = pbones['spine_3_toon'].location.copy()
+                                Spine3ToonScale = pbones['spine_3_toon'].scale.copy()
+
+                                Spine4ToonRotEuler = pbones['spine_4_toon'].rotation_euler.copy()
+                                Spine4ToonLoc = pbones['spine_4_toon'].location.copy()
+                                Spine4ToonScale = pbones['spine_4_toon'].scale.copy()
+
+                                TorsoFkCtrlRotEuler = pbones['torso_fk_ctrl'].rotation_euler.copy()
+                                TorsoFkCtrlLoc = pbones['torso_fk_ctrl'].location.copy()
+                                TorsoFkCtrlScale = pbones['torso_fk_ctrl'].scale.copy()
+
+                                LookRotEuler = pbones['look'].rotation_euler.copy()
+                                LookLoc = pbones['look'].location.copy()
+                                LookScale = pbones['look'].scale.copy()
+
+                                ElbowLRotEuler = pbones['elbow_pole_L'].rotation_euler.copy()
+                                ElbowLLoc = pbones['elbow_pole_L'].location.copy()
+                                ElbowLScale = pbones['elbow_pole_L'].scale.copy()
+
+                                ElbowRRotEuler = pbones['elbow_pole_R'].rotation_euler.copy()
+                                ElbowRLoc = pbones['elbow_pole_R'].location.copy()
+                                ElbowRScale = pbones['elbow_pole_R'].scale.copy()
+
+                                KneeLRotEuler = pbones['knee_pole_L'].rotation_euler.copy()
+                                KneeLLoc = pbones['knee_pole_L'].location.copy()
+                                KneeLScale = pbones['knee_pole_L'].scale.copy()
+
+                                KneeRRotEuler = pbones['knee_pole_R'].rotation_euler.copy()
+                                KneeRLoc = pbones['knee_pole_R'].location.copy()
+                                KneeRScale = pbones['knee_pole_R'].scale.copy()
+
+                                ThighCtrlRotEuler = pbones['thigh_fk_ctrl_L'].rotation_euler.copy()
+                                ThighCtrlRotQuat = pbones['thigh_fk_ctrl_L'].rotation_quaternion.copy()
+                                ThighCtrlLoc = pbones['thigh_fk_ctrl_L'].location.copy()
+                                ThighCtrlScale = pbones['thigh_fk_ctrl_L'].scale.copy()
 
-                                CarpalFkRotEuler = pbones['carpal_fk_L'].rotation_euler.copy()
-                                CarpalFkRotQuat = pbones['carpal_fk_L'].rotation_quaternion.copy()
-                                CarpalFkLoc = pbones['carpal_fk_L'].location.copy()
-                                CarpalFkScale = pbones['carpal_fk_L'].scale.copy()
+                                ThighFkRotEuler = pbones['thigh_fk_L'].rotation_euler.copy()
+                                ThighFkRotQuat = pbones['thigh_fk_L'].rotation_quaternion.copy()
+                                ThighFkLoc = pbones['thigh_fk_L'].location.copy()
+                                ThighFkScale = pbones['thigh_fk_L'].scale.copy()
 
-                                CarpalIkRotEuler = pbones['carpal_ik_ctrl_L'].rotation_euler.copy()
-                                CarpalIkRotQuat = pbones['carpal_ik_ctrl_L'].rotation_quaternion.copy()
-                                CarpalIkLoc = pbones['carpal_ik_ctrl_L'].location.copy()
-                                CarpalIkScale = pbones['carpal_ik_ctrl_L'].scale.copy()
+                                ShinFkRotEuler = pbones['shin_fk_L'].rotation_euler.copy()
+                                ShinFkRotQuat = pbones['shin_fk_L'].rotation_quaternion.copy()
+                                ShinFkLoc = pbones['shin_fk_L'].location.copy()
+                                ShinFkScale = pbones['shin_fk_L'].scale.copy()
 
-                                HandFing1FkRotEuler = pbones['hand_fing_1_fk_L'].rotation_euler.copy()
-                                HandFing1FkRotQuat = pbones['hand_fing_1_fk_L'].rotation_quaternion.copy()
-                                HandFing1FkLoc = pbones['hand_fing_1_fk_L'].location.copy()
-                                HandFing1FkScale = pbones['hand_fing_1_fk_L'].scale.copy()
+                                SoleCtrlRotEuler = pbones['sole_ctrl_L'].rotation_euler.copy()
+                                SoleCtrlRotQuat = pbones['sole_ctrl_L'].rotation_quaternion.copy()
+                                SoleCtrlLoc = pbones['sole_ctrl_L'].location.copy()
+                                SoleCtrlScale = pbones['sole_ctrl_L'].scale.copy()
 
-                                HandFing2FkRotEuler = pbones['hand_fing_2_fk_L'].rotation_euler.copy()
-                                HandFing2FkRotQuat = pbones['hand_fing_2_fk_L'].rotation_quaternion.copy()
-                                HandFing2FkLoc = pbones['hand_fing_2_fk_L'].location.copy()
-                                HandFing2FkScale = pbones['hand_fing_2_fk_L'].scale.copy()
+                                ThighIkRotEuler = pbones['thigh_ik_L'].rotation_euler.copy()
+                                ThighIkRotQuat = pbones['thigh_ik_L'].rotation_quaternion.copy()
+                                ThighIkLoc = pbones['thigh_ik_L'].location.copy()
+                                ThighIkScale = pbones['thigh_ik_L'].scale.copy()
 
                                 #Jump to next Frame
                                 bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
 
                                 #Key Property
-                                armobj.pose.bones["properties_arm_L"].ik_arm_L = 0.0
+                                armobj.pose.bones["properties_leg_L"].pin_knee_L = 0.0
                                 refresh_hack()
-                                pbones["properties_arm_L"].keyframe_insert(data_path='ik_arm_L')
+                                insert_pkeys('properties_leg_L', 'pin_knee_L')
 
                                 #Re-Paste Transforms
-                                pbones['hand_sole_ctrl_L'].rotation_euler = SoleCtrlRotEuler
-                                pbones['hand_sole_ctrl_L'].rotation_quaternion = SoleCtrlRotQuat
-                                pbones['hand_sole_ctrl_L'].location = SoleCtrlLoc
-                                pbones['hand_sole_ctrl_L'].scale = SoleCtrlScale
+                                pbones['master_torso'].rotation_euler = MasterTorsoRotEuler
+                                pbones['master_torso'].location = MasterTorsoLoc
+                                pbones['master_torso'].scale = MasterTorsoScale
                                 refresh_hack()
-                                pbones['elbow_pole_L'].rotation_euler = ElbowPoleRotEuler
-                                pbones['elbow_pole_L'].rotation_quaternion = ElbowPoleRotQuat
-                                pbones['elbow_pole_L'].location = ElbowPoleLoc
-                                pbones['elbow_pole_L'].scale = ElbowPoleScale
+                                pbones['torso_fk_ctrl_inv'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                                pbones['torso_fk_ctrl_inv'].rotation_quaternion[:] = (1.0,0.0, 0.0, 0.0)
+                                pbones['torso_fk_ctrl_inv'].location[:] = (0.0, 0.0, 0.0)
                                 refresh_hack()
-                                pbones['arm_ik_L'].rotation_euler = ArmIkRotEuler
-                                pbones['arm_ik_L'].rotation_quaternion = ArmIkRotQuat
-                                pbones['arm_ik_L'].location = ArmIkLoc
-                                pbones['arm_ik_L'].scale = ArmIkScale
+                                pbones['spine_3_fk_inv'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                                pbones['spine_3_fk_inv'].rotation_quaternion[:] = (1.0,0.0, 0.0, 0.0)
+                                pbones['spine_3_fk_inv'].location[:] = (0.0, 0.0, 0.0)
                                 refresh_hack()
-                                pbones['shoulder_L'].rotation_euler = ShoulderRotEuler
-                                pbones['shoulder_L'].rotation_quaternion = ShoulderRotQuat
-                                pbones['shoulder_L'].location = ShoulderLoc
-                                pbones['shoulder_L'].scale = ShoulderScale
+                                pbones['spine_2_fk_inv'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                                pbones['spine_2_fk_inv'].rotation_quaternion[:] = (1.0,0.0, 0.0, 0.0)
+                                pbones['spine_2_fk_inv'].location[:] = (0.0, 0.0, 0.0)
                                 refresh_hack()
-                                pbones['arm_fk_L'].rotation_euler = ArmFkRotEuler
-                                pbones['arm_fk_L'].rotation_quaternion = ArmFkRotQuat
-                                pbones['arm_fk_L'].location = ArmFkLoc
-                                pbones['arm_fk_L'].scale = ArmFkScale
+                                pbones['pelvis_ctrl'].rotation_euler = PelvisRotEuler
+                                pbones['pelvis_ctrl'].location = PelvisLoc
+                                pbones['pelvis_ctrl'].scale = PelvisScale
                                 refresh_hack()
-                                pbones['forearm_fk_L'].rotation_euler = ForearmFkRotEuler
-                                pbones['forearm_fk_L'].rotation_quaternion = ForearmFkRotQuat
-                                pbones['forearm_fk_L'].location = ForearmFkLoc
-                                pbones['forearm_fk_L'].scale = ForearmFkScale
+                                pbones['spine_1_fk'].rotation_euler = Spine1FKRotEuler
+                                pbones['spine_1_fk'].location = Spine1FKLoc
+                                pbones['spine_1_fk'].scale = Spine1FKScale
+                                refresh_hack()
+                                pbones['spine_2_fk'].rotation_euler = Spine2FKRotEuler
+                                pbones['spine_2_fk'].location = Spine2FKLoc
+                                pbones['spine_2_fk'].scale = Spine2FKScale
+                                refresh_hack()
+                                pbones['spine_3_fk'].rotation_euler = Spine3FKRotEuler
+                                pbones['spine_3_fk'].location = Spine3FKLoc
+                                pbones['spine_3_fk'].scale = Spine3FKScale
+                                refresh_hack()
+                                pbones['spine_1_toon'].rotation_euler = Spine1ToonRotEuler
+                                pbones['spine_1_toon'].location = Spine1ToonLoc
+                                pbones['spine_1_toon'].scale = Spine1ToonScale
+                                refresh_hack()
+                                pbones['spine_2_toon'].rotation_euler = Spine2ToonRotEuler
+                                pbones['spine_2_toon'].location = Spine2ToonLoc
+                                pbones['spine_2_toon'].scale = Spine2ToonScale
+                                refresh_hack()
+                                pbones['spine_3_toon'].rotation_euler = Spine3ToonRotEuler
+                                pbones['spine_3_toon'].location = Spine3ToonLoc
+                                pbones['spine_3_toon'].scale = Spine3ToonScale
+                                refresh_hack()
+                                pbones['spine_4_toon'].rotation_euler = Spine4ToonRotEuler
+                                pbones['spine_4_toon'].location = Spine4ToonLoc
+                                pbones['spine_4_toon'].scale = Spine4ToonScale
+                                refresh_hack()
+                                pbones['torso_fk_ctrl'].rotation_euler = TorsoFkCtrlRotEuler
+                                pbones['torso_fk_ctrl'].location = TorsoFkCtrlLoc
+                                pbones['torso_fk_ctrl'].scale = TorsoFkCtrlScale
+                                refresh_hack()
+                                pbones['look'].rotation_euler = LookRotEuler
+                                pbones['look'].location = LookLoc
+                                pbones['look'].scale = LookScale
+                                refresh_hack()
+                                pbones['elbow_pole_L'].rotation_euler = ElbowLRotEuler
+                                pbones['elbow_pole_L'].location = ElbowLLoc
+                                pbones['elbow_pole_L'].scale = ElbowLScale
+                                refresh_hack()
+                                pbones['elbow_pole_R'].rotation_euler = ElbowRRotEuler
+                                pbones['elbow_pole_R'].location = ElbowRLoc
+                                pbones['elbow_pole_R'].scale = ElbowRScale
+                                refresh_hack()
+                                pbones['knee_pole_L'].rotation_euler = KneeLRotEuler
+                                pbones['knee_pole_L'].location = KneeLLoc
+                                pbones['knee_pole_L'].scale = KneeLScale
+                                refresh_hack()
+                                pbones['knee_pole_R'].rotation_euler = KneeRRotEuler
+                                pbones['knee_pole_R'].location = KneeRLoc
+                                pbones['knee_pole_R'].scale = KneeRScale
                                 refresh_hack()
-                                pbones['carpal_ik_ctrl_L'].rotation_euler = CarpalIkRotEuler
-                                pbones['carpal_ik_ctrl_L'].rotation_quaternion = CarpalIkRotQuat
-                                pbones['carpal_ik_ctrl_L'].location = CarpalIkLoc
-                                pbones['carpal_ik_ctrl_L'].scale = CarpalIkScale
+                                pbones['thigh_fk_ctrl_L'].rotation_euler = ThighCtrlRotEuler
+                                pbones['thigh_fk_ctrl_L'].rotation_quaternion = ThighCtrlRotQuat
+                                pbones['thigh_fk_ctrl_L'].location = ThighCtrlLoc
+                                pbones['thigh_fk_ctrl_L'].scale = ThighCtrlScale
                                 refresh_hack()
-                                pbones['carpal_fk_L'].rotation_euler = CarpalFkRotEuler
-                                pbones['carpal_fk_L'].rotation_quaternion = CarpalFkRotQuat
-                                pbones['carpal_fk_L'].location = CarpalFkLoc
-                                pbones['carpal_fk_L'].scale = CarpalFkScale
+                                pbones['thigh_fk_L'].rotation_euler = ThighFkRotEuler
+                                pbones['thigh_fk_L'].rotation_quaternion = ThighFkRotQuat
+                                pbones['thigh_fk_L'].location = ThighFkLoc
+                                pbones['thigh_fk_L'].scale = ThighFkScale
                                 refresh_hack()
-                                pbones['hand_fing_1_fk_L'].rotation_euler = HandFing1FkRotEuler
-                                pbones['hand_fing_1_fk_L'].rotation_quaternion = HandFing1FkRotQuat
-                                pbones['hand_fing_1_fk_L'].location = HandFing1FkLoc
-                                pbones['hand_fing_1_fk_L'].scale = HandFing1FkScale
+                                pbones['shin_fk_L'].rotation_euler = ShinFkRotEuler
+                                pbones['shin_fk_L'].rotation_quaternion = ShinFkRotQuat
+                                pbones['shin_fk_L'].location = ShinFkLoc
+                                pbones['shin_fk_L'].scale = ShinFkScale
                                 refresh_hack()
-                                pbones['hand_fing_2_fk_L'].rotation_euler = HandFing2FkRotEuler
-                                pbones['hand_fing_2_fk_L'].rotation_quaternion = HandFing2FkRotQuat
-                                pbones['hand_fing_2_fk_L'].location = HandFing2FkLoc
-                                pbones['hand_fing_2_fk_L'].scale = HandFing2FkScale
+                                pbones['sole_ctrl_L'].rotation_euler = SoleCtrlRotEuler
+                                pbones['sole_ctrl_L'].rotation_quaternion = SoleCtrlRotQuat
+                                pbones['sole_ctrl_L'].location = SoleCtrlLoc
+                                pbones['sole_ctrl_L'].scale = SoleCtrlScale
                                 refresh_hack()
-                                pbones['hand_roll_ctrl_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                                pbones['hand_ik_ctrl_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                                pbones['hand_ik_ctrl_L'].location[:] = (0.0, 0.0, 0.0)
-                                pbones['fing_roll_1_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                                pbones['fing_roll_2_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                                pbones['hand_fing_ik_ctrl_mid_L'].location[:] = (0.0, 0.0, 0.0)
-                                pbones['hand_fing_ik_ctrl_mid_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                                pbones['fings_ik_ctrl_L'].location[:] = (0.0, 0.0, 0.0)
-                                pbones['fings_ik_ctrl_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                                pbones['thigh_ik_L'].rotation_euler = ThighIkRotEuler
+                                pbones['thigh_ik_L'].rotation_quaternion = ThighIkRotQuat
+                                pbones['thigh_ik_L'].location = ThighIkLoc
+                                pbones['thigh_ik_L'].scale = ThighIkScale
                                 refresh_hack()
 
-                                insert_bkeys('arm_fk_L', 'LocRotScale')
-                                insert_bkeys('forearm_fk_L', 'LocRotScale')
-                                insert_bkeys('shoulder_L', 'LocRotScale')
-                                insert_bkeys('carpal_fk_L', 'LocRotScale')
-                                insert_bkeys('carpal_ik_ctrl_L', 'LocRotScale')
-                                insert_bkeys('arm_fk_ctrl_L', 'LocRotScale')
-                                insert_bkeys('hand_fk_L', 'LocRotScale')
-                                insert_bkeys('hand_fing_1_fk_L', 'LocRotScale')
-                                insert_bkeys('hand_fing_2_fk_L', 'LocRotScale')
-                                insert_bkeys('arm_ik_L', 'RotScale')
-                                insert_bkeys('forearm_ik_L', 'RotScale')
-                                insert_bkeys('hand_ik_ctrl_L', 'LocRotScale')
-                                insert_bkeys('hand_fing_ik_ctrl_mid_L', 'LocRotScale')
-                                insert_bkeys('fings_ik_ctrl_L', 'LocRotScale')
-                                insert_bkeys('hand_roll_ctrl_L', 'Rot')
-                                insert_bkeys('fing_roll_1_L', 'Rot')
-                                insert_bkeys('fing_roll_2_L', 'Rot')
-                                insert_bkeys('hand_sole_ctrl_L', 'LocRotScale')
-                                if pbones["properties_arm_L"].toggle_arm_ik_pole_L == 1.0:
-                                    insert_bkeys('elbow_pole_L', 'Loc')
+                                insert_bkeys('master_torso', 'LocRotScale')
+                                insert_bkeys('pelvis_ctrl', 'LocRotScale')
+                                insert_bkeys('spine_1_fk', 'LocRotScale')
+                                insert_bkeys('spine_2_fk', 'LocRotScale')
+                                insert_bkeys('spine_3_fk', 'LocRotScale')
+                                insert_bkeys('spine_1_toon', 'LocRotScale')
+                                insert_bkeys('spine_2_toon', 'LocRotScale')
+                                insert_bkeys('spine_3_toon', 'LocRotScale')
+                                insert_bkeys('spine_4_toon', 'LocRotScale')
+                                insert_bkeys('torso_fk_ctrl_inv', 'LocRotScale')
+                                insert_bkeys('spine_3_fk_inv', 'LocRotScale')
+                                insert_bkeys('spine_2_fk_inv', 'LocRotScale')
+                                insert_bkeys('torso_fk_ctrl', 'LocRotScale')
+                                insert_bkeys('look', 'LocRotScale')
+                                insert_bkeys('elbow_pole_L', 'LocRotScale')
+                                insert_bkeys('elbow_pole_R', 'LocRotScale')
+                                insert_bkeys('knee_pole_L', 'LocRotScale')
+                                insert_bkeys('knee_pole_R', 'LocRotScale')
+                                insert_bkeys('thigh_fk_L', 'LocRotScale')
+                                insert_bkeys('shin_fk_L', 'LocRotScale')
+                                insert_bkeys('thigh_fk_ctrl_L', 'LocRotScale')
+                                insert_bkeys('foot_fk_L', 'LocRotScale')
+                                insert_bkeys('foot_toe_1_fk_L', 'LocRotScale')
+                                insert_bkeys('foot_toe_2_fk_L', 'LocRotScale')
+                                insert_bkeys('thigh_ik_L', 'RotScale')
+                                insert_bkeys('shin_ik_L', 'RotScale')
+                                insert_bkeys('foot_ik_ctrl_L', 'LocRotScale')
+                                insert_bkeys('foot_toe_ik_ctrl_mid_L', 'LocRotScale')
+                                insert_bkeys('foot_toe_ik_ctrl_L', 'LocRotScale')
+                                insert_bkeys('foot_roll_ctrl_L', 'Rot')
+                                insert_bkeys('toe_roll_1_L', 'Rot')
+                                insert_bkeys('toe_roll_2_L', 'Rot')
+                                insert_bkeys('sole_ctrl_L', 'LocRotScale')
+                                insert_bkeys('knee_pin_L', 'LocRotScale')
+                                if pbones["properties_leg_L"].toggle_leg_ik_pole_L == 1.0:
+                                    insert_bkeys('knee_pole_L', 'Loc')
+                                for prop in bpy.context.active_object.data.items():
+                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
+                                        insert_bkeys('tarsal_fk_L', 'LocRotScale')
+                                        insert_bkeys('tarsal_ik_ctrl_L', 'LocRotScale')
 
         return {"FINISHED"}
 
-##### Arm_L Space #####
+##### Right Ops #####
+
+Operator_Snap_ArmIKtoFK_R = build_snap_op('Operator_Snap_ArmIKtoFK_R', "snap.arm_ik_to_fk_r", "BlenRig Arm_R IK to FK", "Switch Arm to FK preserving pose", 'arm', 'IK_TO_FK', 'R')
+Operator_Snap_ArmFKtoIK_R = build_snap_op('Operator_Snap_ArmFKtoIK_R', "snap.arm_fk_to_ik_r", "BlenRig Arm_R FK to IK", "Switch Arm to IK preserving pose", 'arm', 'FK_TO_IK', 'R')
+Operator_Snap_LegIKtoFK_R = build_snap_op('Operator_Snap_LegIKtoFK_R', "snap.leg_ik_to_fk_r", "BlenRig Leg_R IK to FK", "Switch Leg to FK preserving pose", 'leg', 'IK_TO_FK', 'R')
+Operator_Snap_LegFKtoIK_R = build_snap_op('Operator_Snap_LegFKtoIK_R', "snap.leg_fk_to_ik_r", "BlenRig Leg_R FK to IK", "Switch Leg to IK preserving pose", 'leg', 'FK_TO_IK', 'R')
+
+Operator_Switch_Arm_Space_R = build_space_op('Operator_Switch_Arm_Space_R', "switch.arm_space_r", 'arm', 'R')
+Operator_Show_Arm_Space_List_R = build_space_list_op('Operator_Show_Arm_Space_List_R', "show.arm_list_r", "switch.arm_space_r", 'arm', 'R')
+Operator_Switch_Hand_Space_R = build_space_op('Operator_Switch_Hand_Space_R', "switch.hand_space_r", 'hand', 'R')
+Operator_Show_Hand_Space_List_R = build_space_list_op('Operator_Show_Hand_Space_List_R', "show.hand_list_r", "switch.hand_space_r", 'hand', 'R')
+Operator_Switch_Arm_Pole_Space_R = build_space_op('Operator_Switch_Arm_Pole_Space_R', "switch.arm_pole_space_r", 'arm_pole', 'R')
+Operator_Show_Arm_Pole_Space_List_R = build_space_list_op('Operator_Show_Arm_Pole_Space_List_R', "show.arm_pole_list_r", "switch.arm_pole_space_r", 'arm_pole', 'R')
+Operator_Switch_Fing_All_Space_R = build_space_op('Operator_Switch_Fing_All_Space_R', "switch.fing_all_space_r", 'fing_all', 'R')
+Operator_Show_Fing_All_Space_List_R = build_space_list_op('Operator_Show_Fing_All_Space_List_R', "show.fing_all_list_r", "switch.fing_all_space_r", 'fing_all', 'R')
+Operator_Switch_Fing_Thumb_Space_R = build_space_op('Operator_Switch_Fing_Thumb_Space_R', "switch.fing_thumb_space_r", 'fing_thumb', 'R')
+Operator_Show_Fing_Thumb_Space_List_R = build_space_list_op('Operator_Show_Fing_Thumb_Space_List_R', "show.fing_thumb_list_r", "switch.fing_thumb_space_r", 'fing_thumb', 'R')
+Operator_Switch_Fing_Ind_Space_R = build_space_op('Operator_Switch_Fing_Ind_Space_R', "switch.fing_ind_space_r", 'fing_ind', 'R')
+Operator_Show_Fing_Ind_Space_List_R = build_space_list_op('Operator_Show_Fing_Ind_Space_List_R', "show.fing_ind_list_r", "switch.fing_ind_space_r", 'fing_ind', 'R')
+Operator_Switch_Fing_Mid_Space_R = build_space_op('Operator_Switch_Fing_Mid_Space_R', "switch.fing_mid_space_r", 'fing_mid', 'R')
+Operator_Show_Fing_Mid_Space_List_R = build_space_list_op('Operator_Show_Fing_Mid_Space_List_R', "show.fing_mid_list_r", "switch.fing_mid_space_r", 'fing_mid', 'R')
+Operator_Switch_Fing_Ring_Space_R = build_space_op('Operator_Switch_Fing_Ring_Space_R', "switch.fing_ring_space_r", 'fing_ring', 'R')
+Operator_Show_Fing_Ring_Space_List_R = build_space_list_op('Operator_Show_Fing_Ring_Space_List_R', "show.fing_ring_list_r", "switch.fing_ring_space_r", 'fing_ring', 'R')
+Operator_Switch_Fing_Lit_Space_R = build_space_op('Operator_Switch_Fing_Lit_Space_R', "switch.fing_lit_space_r", 'fing_lit', 'R')
+Operator_Show_Fing_Lit_Space_List_R = build_space_list_op('Operator_Show_Fing_Lit_Space_List_R', "show.fing_lit_list_r", "switch.fing_lit_space_r", 'fing_lit', 'R')
+Operator_Switch_Leg_Space_R = build_space_op('Operator_Switch_Leg_Space_R', "switch.leg_space_r", 'leg', 'R')
+Operator_Show_Leg_Space_List_R = build_space_list_op('Operator_Show_Leg_Space_List_R', "show.leg_list_r", "switch.leg_space_r", 'leg', 'R')
+Operator_Switch_Leg_Pole_Space_R = build_space_op('Operator_Switch_Leg_Pole_Space_R', "switch.leg_pole_space_r", 'leg_pole', 'R')
+Operator_Show_Leg_Pole_Space_List_R = build_space_list_op('Operator_Show_Leg_Pole_Space_List_R', "show.leg_pole_list_r", "switch.leg_pole_space_r", 'leg_pole', 'R')
+
+##### Elbow_R Pin #####
 
-class Operator_Switch_Arm_Space_L(bpy.types.Operator):
+class Operator_Elbow_Pin_R(bpy.types.Operator):
 
-    bl_idname = "switch.arm_space_l"
-    bl_label = "BlenRig Switch Arm_L Space"
-    bl_description = "Switch Arm_L Space preserving pose"
+    bl_idname = "pin.elbow_r"
+    bl_label = "BlenRig Pin Elbow_R"
+    bl_description = "Pin Elbow_R"
     bl_options = {'REGISTER', 'UNDO','INTERNAL'}
 
     @classmethod
@@ -838,234 +1462,202 @@ class Operator_Switch_Arm_Space_L(bpy.types.Operator):
         else:
             return False
 
-    #Create string property to parse argument to the operator
-    space : bpy.props.StringProperty()
-
+    @keyframe_batch
     def execute(self, context):
+
         armobj = bpy.context.active_object
         pbones = armobj.pose.bones
         anim_data = armobj.animation_data
 
-        #Collect Matrix
-        HandIkMat = pbones['hand_ik_ctrl_L'].matrix.copy()
-        ArmFkCtrlMat = pbones['arm_fk_ctrl_L'].matrix.copy()
-
-        #Insert Keyframes if Action present
-        if anim_data:
-            if anim_data.action:
-                if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                    pbones["properties_arm_L"].keyframe_insert(data_path='space_arm_L')
-                    insert_bkeys('hand_ik_ctrl_L', 'LocRotScale')
-                    insert_bkeys('arm_fk_ctrl_L', 'LocRotScale')
-
-        if self.space == 'Free':
-            bpy.context.active_object.pose.bones["properties_arm_L"].space_arm_L = 0.0
-            refresh_hack()
-        if self.space == 'Pelvis':
-            bpy.context.active_object.pose.bones["properties_arm_L"].space_arm_L = 1.0
-            refresh_hack()
-        if self.space == 'Torso':
-            bpy.context.active_object.pose.bones["properties_arm_L"].space_arm_L = 2.0
-            refresh_hack()
-        if self.space == 'Head':
-            bpy.context.active_object.pose.bones["properties_arm_L"].space_arm_L = 3.0
-            refresh_hack()
+        #Biped
+        for prop in bpy.context.active_object.data.items():
+            if prop[0] == 'rig_type' and prop[1] == 'Biped':
 
-        #Paste Matrix
-        pbones['hand_ik_ctrl_L'].matrix = HandIkMat
-        pbones['arm_fk_ctrl_L'].matrix = ArmFkCtrlMat
-        refresh_hack()
+        #### Pin ####
+                if armobj.pose.bones["properties_arm_R"].pin_elbow_R < 0.1:
 
-        #Insert Keyframes if Action present
-        if anim_data:
-            if anim_data.action:
-                if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                    #Collect Local Transforms
-                    HandIkCtrlRotEuler = pbones['hand_ik_ctrl_L'].rotation_euler.copy()
-                    HandIkCtrlRotQuat = pbones['hand_ik_ctrl_L'].rotation_quaternion.copy()
-                    HandIkCtrlLoc = pbones['hand_ik_ctrl_L'].location.copy()
-                    HandIkCtrlScale = pbones['hand_ik_ctrl_L'].scale.copy()
+                    #Collect Matrix
+                    ArmFkMat = pbones['arm_fk_R'].matrix.copy()
+                    ArmFkLoc = pbones['arm_fk_R'].location.copy()
+                    ArmFkScale = pbones['arm_fk_R'].scale.copy()
+                    ForearmFkMat = pbones['forearm_fk_R'].matrix.copy()
+                    ForearmFkLoc = pbones['forearm_fk_R'].location.copy()
+                    ForearmFkScale = pbones['forearm_fk_R'].scale.copy()
+                    ShoulderMat = pbones['shoulder_R'].matrix.copy()
+                    ShoulderLoc = pbones['shoulder_R'].location.copy()
+                    ShoulderScale = pbones['shoulder_R'].scale.copy()
 
-                    ArmCtrlRotEuler = pbones['arm_fk_ctrl_L'].rotation_euler.copy()
-                    ArmCtrlRotQuat = pbones['arm_fk_ctrl_L'].rotation_quaternion.copy()
-                    ArmCtrlLoc = pbones['arm_fk_ctrl_L'].location.copy()
-                    ArmCtrlScale = pbones['arm_fk_ctrl_L'].scale.copy()
+                    #Insert Keyframes if Action present
+                    if anim_data:
+                        if anim_data.action:
+                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
+                                insert_pkeys('properties_arm_R', 'pin_elbow_R')
+                                insert_bkeys('master_torso', 'LocRotScale')
+                                insert_bkeys('pelvis_ctrl', 'LocRotScale')
+                                insert_bkeys('spine_1_fk', 'LocRotScale')
+                                insert_bkeys('spine_2_fk', 'LocRotScale')
+                                insert_bkeys('spine_3_fk', 'LocRotScale')
+                                insert_bkeys('spine_1_toon', 'LocRotScale')
+                                insert_bkeys('spine_2_toon', 'LocRotScale')
+                                insert_bkeys('spine_3_toon', 'LocRotScale')
+                                insert_bkeys('spine_4_toon', 'LocRotScale')
+                                insert_bkeys('torso_fk_ctrl_inv', 'LocRotScale')
+                                insert_bkeys('spine_3_fk_inv', 'LocRotScale')
+                                insert_bkeys('spine_2_fk_inv', 'LocRotScale')
+                                insert_bkeys('torso_fk_ctrl', 'LocRotScale')
+                                insert_bkeys('look', 'LocRotScale')
+                                insert_bkeys('elbow_pole_L', 'LocRotScale')
+                                insert_bkeys('elbow_pole_R', 'LocRotScale')
+                                insert_bkeys('knee_pole_L', 'LocRotScale')
+                                insert_bkeys('knee_pole_R', 'LocRotScale')
+                                insert_bkeys('arm_fk_R', 'LocRotScale')
+                                insert_bkeys('forearm_fk_R', 'LocRotScale')
+                                insert_bkeys('arm_ik_R', 'RotScale')
+                                insert_bkeys('forearm_ik_R', 'RotScale')
+                                insert_bkeys('arm_fk_ctrl_R', 'LocRotScale')
+                                insert_bkeys('shoulder_R', 'LocRotScale')
+                                insert_bkeys('hand_ik_ctrl_R', 'LocRotScale')
+                                insert_bkeys('hand_fk_R', 'LocRotScale')
+                                insert_bkeys('elbow_pin_R', 'LocRotScale')
+                                if pbones["properties_arm_R"].toggle_arm_ik_pole_R == 1.0:
+                                    insert_bkeys('elbow_pole_R', 'Loc')
+                                for prop in bpy.context.active_object.data.items():
+                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
+                                        insert_bkeys('carpal_ik_ctrl_R', 'LocRotScale')
+                                        insert_bkeys('carpal_fk_R', 'LocRotScale')
+                                        insert_bkeys('hand_fk_R', 'LocRotScale')
 
-                    #Jump to next Frame
-                    bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
+                    #Paste Matrix
+                    pVisLocExec(pbones['elbow_pin_R'], pbones['snap_elbow_pin_R'])
+                    pVisRotExec(pbones['elbow_pin_R'], pbones['snap_elbow_pin_R'])
+                    pVisScaExec(pbones['elbow_pin_R'], pbones['snap_elbow_pin_R'])
+                    refresh_hack()
 
-                    #Key Property
-                    if self.space == 'Free':
-                        bpy.context.active_object.pose.bones["properties_arm_L"].space_arm_L = 0.0
-                        refresh_hack()
-                    if self.space == 'Pelvis':
-                        bpy.context.active_object.pose.bones["properties_arm_L"].space_arm_L = 1.0
-                        refresh_hack()
-                    if self.space == 'Torso':
-                        bpy.context.active_object.pose.bones["properties_arm_L"].space_arm_L = 2.0
-                        refresh_hack()
-                    if self.space == 'Head':
-                        bpy.context.active_object.pose.bones["properties_arm_L"].space_arm_L = 3.0
-                        refresh_hack()
-                    pbones["properties_arm_L"].keyframe_insert(data_path='space_arm_L')
+                    armobj.pose.bones["properties_arm_R"].pin_elbow_R = 1.0
+                    refresh_hack()
 
-                    #Re-Paste Transforms
-                    pbones['hand_ik_ctrl_L'].rotation_euler = HandIkCtrlRotEuler
-                    pbones['hand_ik_ctrl_L'].rotation_quaternion = HandIkCtrlRotQuat
-                    pbones['hand_ik_ctrl_L'].location = HandIkCtrlLoc
-                    pbones['hand_ik_ctrl_L'].scale = HandIkCtrlScale
+                    pbones['shoulder_R'].matrix = ShoulderMat
+                    pbones['shoulder_R'].location = ShoulderLoc
+                    pbones['shoulder_R'].scale = ShoulderScale
                     refresh_hack()
-                    pbones['arm_fk_ctrl_L'].rotation_euler = ArmCtrlRotEuler
-                    pbones['arm_fk_ctrl_L'].rotation_quaternion = ArmCtrlRotQuat
-                    pbones['arm_fk_ctrl_L'].location = ArmCtrlLoc
-                    pbones['arm_fk_ctrl_L'].scale = ArmCtrlScale
+                    pbones['arm_fk_R'].matrix = ArmFkMat
+                    pbones['arm_fk_R'].location = ArmFkLoc
+                    pbones['arm_fk_R'].scale = ArmFkScale
+                    refresh_hack()
+                    pbones['forearm_fk_R'].matrix = ForearmFkMat
+                    pbones['forearm_fk_R'].location = ForearmFkLoc
+                    pbones['forearm_fk_R'].scale = ForearmFkScale
                     refresh_hack()
 
-                    insert_bkeys('hand_ik_ctrl_L', 'LocRotScale')
-                    insert_bkeys('arm_fk_ctrl_L', 'LocRotScale')
-
-
-        return {"FINISHED"}
-
-#Create Space PopUp
-def Arm_Space_List_L(self, context):
-    col = self.layout.column()
-    col.operator("switch.arm_space_l", text = "Free").space = 'Free'
-    col.operator("switch.arm_space_l", text = "Pelvis").space = 'Pelvis'
-    col.operator("switch.arm_space_l", text = "Torso").space = 'Torso'
-    col.operator("switch.arm_space_l", text = "Head").space = 'Head'
-
-class Operator_Show_Arm_Space_List_L(bpy.types.Operator):
-    bl_idname = "show.arm_list_l"
-    bl_label = "Arm_L Space Switch List"
-    bl_description = "Switch Arm_L Space"
-
-    def invoke(self, context, event):
-        context.window_manager.popup_menu(Arm_Space_List_L, title='Switch Arm_L Space', icon='MOD_ARMATURE')
-        return {'FINISHED'}
-
-##### Hand_L Space #####
-
-class Operator_Switch_Hand_Space_L(bpy.types.Operator):
-
-    bl_idname = "switch.hand_space_l"
-    bl_label = "BlenRig Switch Hand_L Space"
-    bl_description = "Switch Hand_L Space preserving pose"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
-
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
-
-    #Create string property to parse argument to the operator
-    space : bpy.props.StringProperty()
-
-    def execute(self, context):
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        anim_data = armobj.animation_data
-
-        #Insert Keyframes if Action present
-        if anim_data:
-            if anim_data.action:
-                if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                    pbones["properties_arm_L"].keyframe_insert(data_path='space_hand_L')
-                    insert_bkeys('hand_ik_ctrl_L', 'RotScale')
-                    insert_bkeys('hand_fk_L', 'RotScale')
-
-        if self.space == 'Arm':
-            #Collect Matrix
-            HandFkMat = pbones['hand_fk_L'].matrix.copy()
-            HandFkLoc = pbones['hand_fk_L'].location.copy()
-            HandFkScale = pbones['hand_fk_L'].scale.copy()
-
-            bpy.context.active_object.pose.bones["properties_arm_L"].space_hand_L = 1.0
+                    #Insert Keyframes if Action present
+                    if anim_data:
+                        if anim_data.action:
+                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
+                                #Collect Local Transforms
+                                ElbowPinRotEuler = pbones['elbow_pin_R'].rotation_euler.copy()
+                                ElbowPinRotQuat = pbones['elbow_pin_R'].rotation_quaternion.copy()
+                                ElbowPinLoc = pbones['elbow_pin_R'].location.copy()
+                                ElbowPinScale = pbones['elbow_pin_R'].scale.copy()
 
-            #Paste Matrix
-            pbones['hand_fk_L'].matrix = HandFkMat
-            pbones['hand_fk_L'].location = HandFkLoc
-            pbones['hand_fk_L'].scale = HandFkScale
-            refresh_hack()
+                                ShoulderRotEuler = pbones['shoulder_R'].rotation_euler.copy()
+                                ShoulderRotQuat = pbones['shoulder_R'].rotation_quaternion.copy()
+                                ShoulderLoc = pbones['shoulder_R'].location.copy()
+                                ShoulderScale = pbones['shoulder_R'].scale.copy()
 
-        if self.space == 'Free':
-            #Paste Matrix
-            pVisRotExec (pbones['hand_ik_ctrl_L'], pbones['hand_fk_L'])
-            refresh_hack()
+                                ArmFkRotEuler = pbones['arm_fk_R'].rotation_euler.copy()
+                                ArmFkRotQuat = pbones['arm_fk_R'].rotation_quaternion.copy()
+                                ArmFkLoc = pbones['arm_fk_R'].location.copy()
+                                ArmFkScale = pbones['arm_fk_R'].scale.copy()
 
-            bpy.context.active_object.pose.bones["properties_arm_L"].space_hand_L = 0.0
-            refresh_hack()
+                                ForearmFkRotEuler = pbones['forearm_fk_R'].rotation_euler.copy()
+                                ForearmFkRotQuat = pbones['forearm_fk_R'].rotation_quaternion.copy()
+                                ForearmFkLoc = pbones['forearm_fk_R'].location.copy()
+                                ForearmFkScale = pbones['forearm_fk_R'].scale.copy()
 
-        #Insert Keyframes if Action present
-        if anim_data:
-            if anim_data.action:
-                if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                    #Collect Local Transforms
-                    HandIkCtrlRotEuler = pbones['hand_ik_ctrl_L'].rotation_euler.copy()
-                    HandIkCtrlRotQuat = pbones['hand_ik_ctrl_L'].rotation_quaternion.copy()
-                    HandIkCtrlScale = pbones['hand_ik_ctrl_L'].scale.copy()
+                                #Jump to next Frame
+                                bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
 
-                    HandFkCtrlRotEuler = pbones['hand_fk_L'].rotation_euler.copy()
-                    HandFkCtrlRotQuat = pbones['hand_fk_L'].rotation_quaternion.copy()
-                    HandFkCtrlScale = pbones['hand_fk_L'].scale.copy()
+                                #Key Property
+                                armobj.pose.bones["properties_arm_R"].pin_elbow_R = 1.0
+                                refresh_hack()
+                                insert_pkeys('properties_arm_R', 'pin_elbow_R')
 
-                    #Jump to next Frame
-                    bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
+                                #Re-Paste Transforms
+                                pbones['elbow_pin_R'].rotation_euler = ElbowPinRotEuler
+                                pbones['elbow_pin_R'].rotation_quaternion = ElbowPinRotQuat
+                                pbones['elbow_pin_R'].location = ElbowPinLoc
+                                pbones['elbow_pin_R'].scale = ElbowPinScale
+                                refresh_hack()
+                                pbones['shoulder_R'].rotation_euler = ShoulderRotEuler
+                                pbones['shoulder_R'].rotation_quaternion = ShoulderRotQuat
+                                pbones['shoulder_R'].location = ShoulderLoc
+                                pbones['shoulder_R'].scale = ShoulderScale
+                                refresh_hack()
+                                pbones['arm_fk_R'].rotation_euler = ArmFkRotEuler
+                                pbones['arm_fk_R'].rotation_quaternion = ArmFkRotQuat
+                                pbones['arm_fk_R'].location = ArmFkLoc
+                                pbones['arm_fk_R'].scale = ArmFkScale
+                                refresh_hack()
+                                pbones['forearm_fk_R'].rotation_euler = ForearmFkRotEuler
+                                pbones['forearm_fk_R'].rotation_quaternion = ForearmFkRotQuat
+                                pbones['forearm_fk_R'].location = ForearmFkLoc
+                                pbones['forearm_fk_R'].scale = ForearmFkScale
+                                refresh_hack()
 
-                    #Key Property
-                    if self.space == 'Arm':
-                        bpy.context.active_object.pose.bones["properties_arm_L"].space_hand_L = 1.0
-                        refresh_hack()
-                    if self.space == 'Free':
-                        bpy.context.active_object.pose.bones["properties_arm_L"].space_hand_L = 0.0
-                        refresh_hack()
-                    pbones["properties_arm_L"].keyframe_insert(data_path='space_hand_L')
+                                insert_bkeys('master_torso', 'LocRotScale')
+                                insert_bkeys('pelvis_ctrl', 'LocRotScale')
+                                insert_bkeys('spine_1_fk', 'LocRotScale')
+                                insert_bkeys('spine_2_fk', 'LocRotScale')
+                                insert_bkeys('spine_3_fk', 'LocRotScale')
+                                insert_bkeys('spine_1_toon', 'LocRotScale')
+                                insert_bkeys('spine_2_toon', 'LocRotScale')
+                                insert_bkeys('spine_3_toon', 'LocRotScale')
+                                insert_bkeys('spine_4_toon', 'LocRotScale')
+                                insert_bkeys('torso_fk_ctrl_inv', 'LocRotScale')
+                                insert_bkeys('spine_3_fk_inv', 'LocRotScale')
+                                insert_bkeys('spine_2_fk_inv', 'LocRotScale')
+                                insert_bkeys('torso_fk_ctrl', 'LocRotScale')
+                                insert_bkeys('look', 'LocRotScale')
+                                insert_bkeys('elbow_pole_L', 'LocRotScale')
+                                insert_bkeys('elbow_pole_R', 'LocRotScale')
+                                insert_bkeys('knee_pole_L', 'LocRotScale')
+                                insert_bkeys('knee_pole_R', 'LocRotScale')
+                                insert_bkeys('arm_fk_R', 'LocRotScale')
+                                insert_bkeys('forearm_fk_R', 'LocRotScale')
+                                insert_bkeys('arm_ik_R', 'RotScale')
+                                insert_bkeys('forearm_ik_R', 'RotScale')
+                                insert_bkeys('arm_fk_ctrl_R', 'LocRotScale')
+                                insert_bkeys('shoulder_R', 'LocRotScale')
+                                insert_bkeys('hand_ik_ctrl_R', 'LocRotScale')
+                                insert_bkeys('hand_fk_R', 'LocRotScale')
+                                insert_bkeys('elbow_pin_R', 'LocRotScale')
+                                if pbones["properties_arm_R"].toggle_arm_ik_pole_R == 1.0:
+                                    insert_bkeys('elbow_pole_R', 'Loc')
+                                for prop in bpy.context.active_object.data.items():
+                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
+                                        insert_bkeys('carpal_ik_ctrl_R', 'LocRotScale')
+                                        insert_bkeys('carpal_fk_R', 'LocRotScale')
+                                        insert_bkeys('hand_fk_R', 'LocRotScale')
 
-                    #Re-Paste Transforms
-                    pbones['hand_ik_ctrl_L'].rotation_euler = HandIkCtrlRotEuler
-                    pbones['hand_ik_ctrl_L'].rotation_quaternion = HandIkCtrlRotQuat
-                    pbones['hand_ik_ctrl_L'].scale = HandIkCtrlScale
-                    refresh_hack()
-                    pbones['hand_fk_L'].rotation_euler = HandFkCtrlRotEuler
-                    pbones['hand_fk_L'].rotation_quaternion = HandFkCtrlRotQuat
-                    pbones['hand_fk_L'].scale = HandFkCtrlScale
-                    refresh_hack()
+                    #Switch Hand to Arm Space
+                    if anim_data:
+                        if anim_data.action:
+                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
+                                #Jump to previous Frame
+                                bpy.context.scene.frame_set (bpy.context.scene.frame_current - 1)
 
-                    insert_bkeys('hand_ik_ctrl_L', 'LocRotScale')
-                    insert_bkeys('hand_fk_L', 'LocRotScale')
+                    #Switch Hand to Arm Space
+                    bpy.ops.switch.hand_space_r(space='Arm')
 
         return {"FINISHED"}
 
-#Create Space PopUp
-def Hand_Space_List_L(self, context):
-    col = self.layout.column()
-    col.operator("switch.hand_space_l", text = "Arm").space = 'Arm'
-    col.operator("switch.hand_space_l", text = "Free").space = 'Free'
-
-class Operator_Show_Hand_Space_List_L(bpy.types.Operator):
-    bl_idname = "show.hand_list_l"
-    bl_label = "Hand_L Space Switch List"
-    bl_description = "Switch Hand_L Space"
-
-    def invoke(self, context, event):
-        context.window_manager.popup_menu(Hand_Space_List_L, title='Switch Hand_L Space', icon='MOD_ARMATURE')
-        return {'FINISHED'}
-
-##### Arm_Pole_L Space #####
+##### Elbow_R UnPin #####
 
-class Operator_Switch_Arm_Pole_Space_L(bpy.types.Operator):
+class Operator_Elbow_UnPin_R(bpy.types.Operator):
 
-    bl_idname = "switch.arm_pole_space_l"
-    bl_label = "BlenRig Switch Arm_L Pole Space"
-    bl_description = "Switch Arm_L Pole Space preserving pose"
+    bl_idname = "unpin.elbow_r"
+    bl_label = "BlenRig UnPin Elbow_R"
+    bl_description = "UnPin Elbow_R"
     bl_options = {'REGISTER', 'UNDO','INTERNAL'}
 
     @classmethod
@@ -1081,194 +1673,239 @@ class Operator_Switch_Arm_Pole_Space_L(bpy.types.Operator):
         else:
             return False
 
-    #Create string property to parse argument to the operator
-    space : bpy.props.StringProperty()
-
+    @keyframe_batch
     def execute(self, context):
 
         armobj = bpy.context.active_object
         pbones = armobj.pose.bones
         anim_data = armobj.animation_data
 
-        #Insert Keyframes if Action present
-        if anim_data:
-            if anim_data.action:
-                if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                    pbones["properties_arm_L"].keyframe_insert(data_path='space_arm_ik_pole_L')
-                    insert_bkeys('elbow_pole_L', 'Loc')
-
-        #Collect Matrix
-        PoleMat = pbones['elbow_pole_L'].matrix.copy()
+        #Biped
+        for prop in bpy.context.active_object.data.items():
+            if prop[0] == 'rig_type' and prop[1] == 'Biped':
 
-        if self.space == 'Free':
-            bpy.context.active_object.pose.bones["properties_arm_L"].space_arm_ik_pole_L = 0.0
-            refresh_hack()
-        if self.space == 'Torso':
-            bpy.context.active_object.pose.bones["properties_arm_L"].space_arm_ik_pole_L = 1.0
-            refresh_hack()
+                if armobj.pose.bones["properties_arm_R"].pin_elbow_R > 0.9:
 
-        #Paste Matrix
-        pbones['elbow_pole_L'].matrix = PoleMat
-        refresh_hack()
+                    #Collect Matrix
+                    ArmFkMat = pbones['arm_fk_R'].matrix.copy()
+                    ArmFkLoc = pbones['arm_fk_R'].location.copy()
+                    ArmFkScale = pbones['arm_fk_R'].scale.copy()
+                    ForearmFkMat = pbones['forearm_fk_R'].matrix.copy()
+                    ForearmFkLoc = pbones['forearm_fk_R'].location.copy()
+                    ForearmFkScale = pbones['forearm_fk_R'].scale.copy()
+                    ShoulderMat = pbones['shoulder_R'].matrix.copy()
+                    ShoulderLoc = pbones['shoulder_R'].location.copy()
+                    ShoulderScale = pbones['shoulder_R'].scale.copy()
 
-        #Insert Keyframes if Action present
-        if anim_data:
-            if anim_data.action:
-                if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                    #Collect Local Transforms
-                    PoleLoc = pbones['elbow_pole_L'].location.copy()
+                    #Insert Keyframes if Action present
+                    if anim_data:
+                        if anim_data.action:
+                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
+                                insert_pkeys('properties_arm_R', 'pin_elbow_R')
+                                insert_bkeys('master_torso', 'LocRotScale')
+                                insert_bkeys('pelvis_ctrl', 'LocRotScale')
+                                insert_bkeys('spine_1_fk', 'LocRotScale')
+                                insert_bkeys('spine_2_fk', 'LocRotScale')
+                                insert_bkeys('spine_3_fk', 'LocRotScale')
+                                insert_bkeys('spine_1_toon', 'LocRotScale')
+                                insert_bkeys('spine_2_toon', 'LocRotScale')
+                                insert_bkeys('spine_3_toon', 'LocRotScale')
+                                insert_bkeys('spine_4_toon', 'LocRotScale')
+                                insert_bkeys('torso_fk_ctrl_inv', 'LocRotScale')
+                                insert_bkeys('spine_3_fk_inv', 'LocRotScale')
+                                insert_bkeys('spine_2_fk_inv', 'LocRotScale')
+                                insert_bkeys('torso_fk_ctrl', 'LocRotScale')
+                                insert_bkeys('look', 'LocRotScale')
+                                insert_bkeys('elbow_pole_L', 'LocRotScale')
+                                insert_bkeys('elbow_pole_R', 'LocRotScale')
+                                insert_bkeys('knee_pole_L', 'LocRotScale')
+                                insert_bkeys('knee_pole_R', 'LocRotScale')
+                                insert_bkeys('arm_fk_R', 'LocRotScale')
+                                insert_bkeys('forearm_fk_R', 'LocRotScale')
+                                insert_bkeys('arm_ik_R', 'RotScale')
+                                insert_bkeys('forearm_ik_R', 'RotScale')
+                                insert_bkeys('arm_fk_ctrl_R', 'LocRotScale')
+                                insert_bkeys('shoulder_R', 'LocRotScale')
+                                insert_bkeys('hand_ik_ctrl_R', 'LocRotScale')
+                                insert_bkeys('hand_fk_R', 'LocRotScale')
+                                insert_bkeys('elbow_pin_R', 'LocRotScale')
+                                if pbones["properties_arm_R"].toggle_arm_ik_pole_R == 1.0:
+                                    insert_bkeys('elbow_pole_R', 'Loc')
+                                for prop in bpy.context.active_object.data.items():
+                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
+                                        insert_bkeys('carpal_ik_ctrl_R', 'LocRotScale')
+                                        insert_bkeys('carpal_fk_R', 'LocRotScale')
+                                        insert_bkeys('hand_fk_R', 'LocRotScale')
 
-                    #Jump to next Frame
-                    bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
+                    #Paste Matrix
+                    pVisLocExec(pbones['hand_ik_ctrl_R'], pbones['hand_fk_R'])
+                    refresh_hack()
+                    pVisLocExec(pbones['elbow_pole_R'], pbones['snap_elbow_pole_fk_R'])
+                    refresh_hack()
+                    pVisRotExec (pbones['arm_ik_R'], pbones['arm_rot_R'])
+                    refresh_hack()
+                    pVisRotExec (pbones['arm_fk_ctrl_R'], pbones['arm_fk_R'])
+                    pbones['arm_fk_ctrl_R'].scale[:] = (1.0, 1.0, 1.0)
+                    refresh_hack()
 
-                    #Key Property
-                    if self.space == 'Free':
-                        bpy.context.active_object.pose.bones["properties_arm_L"].space_arm_ik_pole_L = 0.0
-                        refresh_hack()
-                    if self.space == 'Torso':
-                        bpy.context.active_object.pose.bones["properties_arm_L"].space_arm_ik_pole_L = 1.0
-                        refresh_hack()
-                    pbones["properties_arm_L"].keyframe_insert(data_path='space_arm_ik_pole_L')
+                    bpy.context.active_object.pose.bones["properties_arm_R"].pin_elbow_R = 0.0
+                    refresh_hack()
 
-                    #Re-Paste Transforms
-                    pbones['elbow_pole_L'].location = PoleLoc
+                    pbones['shoulder_R'].matrix = ShoulderMat
+                    pbones['shoulder_R'].location = ShoulderLoc
+                    pbones['shoulder_R'].scale = ShoulderScale
+                    refresh_hack()
+                    pbones['arm_fk_R'].matrix = ArmFkMat
+                    pbones['arm_fk_R'].location = ArmFkLoc
+                    pbones['arm_fk_R'].scale = ArmFkScale
+                    refresh_hack()
+                    pbones['forearm_fk_R'].matrix = ForearmFkMat
+                    pbones['forearm_fk_R'].location = ForearmFkLoc
+                    pbones['forearm_fk_R'].scale = ForearmFkScale
+                    refresh_hack()
+                    #Correct arm_fk twist
+                    pVisRotExec (pbones['arm_fk_R'], pbones['arm_rot_R'])
+                    refresh_hack()
+                    #Re-paste forearm matrix
+                    pbones['forearm_fk_R'].matrix = ForearmFkMat
+                    pbones['forearm_fk_R'].location = ForearmFkLoc
+                    pbones['forearm_fk_R'].scale = ForearmFkScale
                     refresh_hack()
 
-                    insert_bkeys('elbow_pole_L', 'Loc')
-
-        return {"FINISHED"}
-
-#Create Space PopUp
-def Arm_Pole_Space_List_L(self, context):
-    col = self.layout.column()
-    col.operator("switch.arm_pole_space_l", text = "Free").space = 'Free'
-    col.operator("switch.arm_pole_space_l", text = "Torso").space = 'Torso'
-
-class Operator_Show_Arm_Pole_Space_List_L(bpy.types.Operator):
-    bl_idname = "show.arm_pole_list_l"
-    bl_label = "Arm_L Pole Space Switch List"
-    bl_description = "Switch Arm_L Pole Space"
+                    #Insert Keyframes if Action present
+                    if anim_data:
+                        if anim_data.action:
+                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
+                                #Collect Local Transforms
+                                ArmCtrlRotEuler = pbones['arm_fk_ctrl_R'].rotation_euler.copy()
+                                ArmCtrlRotQuat = pbones['arm_fk_ctrl_R'].rotation_quaternion.copy()
+                                ArmCtrlLoc = pbones['arm_fk_ctrl_R'].location.copy()
+                                ArmCtrlScale = pbones['arm_fk_ctrl_R'].scale.copy()
 
-    def invoke(self, context, event):
-        context.window_manager.popup_menu(Arm_Pole_Space_List_L, title='Switch Arm_L Pole Space', icon='MOD_ARMATURE')
-        return {'FINISHED'}
+                                ShoulderRotEuler = pbones['shoulder_R'].rotation_euler.copy()
+                                ShoulderRotQuat = pbones['shoulder_R'].rotation_quaternion.copy()
+                                ShoulderLoc = pbones['shoulder_R'].location.copy()
+                                ShoulderScale = pbones['shoulder_R'].scale.copy()
 
-##### All Fingers_L Space #####
+                                ArmFkRotEuler = pbones['arm_fk_R'].rotation_euler.copy()
+                                ArmFkRotQuat = pbones['arm_fk_R'].rotation_quaternion.copy()
+                                ArmFkLoc = pbones['arm_fk_R'].location.copy()
+                                ArmFkScale = pbones['arm_fk_R'].scale.copy()
 
-class Operator_Switch_Fing_All_Space_L(bpy.types.Operator):
+                                ForearmFkRotEuler = pbones['forearm_fk_R'].rotation_euler.copy()
+                                ForearmFkRotQuat = pbones['forearm_fk_R'].rotation_quaternion.copy()
+                                ForearmFkLoc = pbones['forearm_fk_R'].location.copy()
+                                ForearmFkScale = pbones['forearm_fk_R'].scale.copy()
 
-    bl_idname = "switch.fing_all_space_l"
-    bl_label = "BlenRig Switch All Fingers_L Space"
-    bl_description = "Switch All Fingers_L Space preserving pose"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
+                                HandIkCtrlRotEuler = pbones['hand_ik_ctrl_R'].rotation_euler.copy()
+                                HandIkCtrlRotQuat = pbones['hand_ik_ctrl_R'].rotation_quaternion.copy()
+                                HandIkCtrlLoc = pbones['hand_ik_ctrl_R'].location.copy()
+                                HandIkCtrlScale = pbones['hand_ik_ctrl_R'].scale.copy()
 
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
+                                ArmIkRotEuler = pbones['arm_ik_R'].rotation_euler.copy()
+                                ArmIkRotQuat = pbones['arm_ik_R'].rotation_quaternion.copy()
+                                ArmIkLoc = pbones['arm_ik_R'].location.copy()
+                                ArmIkScale = pbones['arm_ik_R'].scale.copy()
 
-    #Create string property to parse argument to the operator
-    space : bpy.props.StringProperty()
+                                ElbowlLoc = pbones['elbow_pole_R'].location.copy()
 
-    def execute(self, context):
+                                #Jump to next Frame
+                                bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
 
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        dbones = armobj.data.bones
-        anim_data = armobj.animation_data
+                                #Key Property
+                                armobj.pose.bones["properties_arm_R"].pin_elbow_R = 0.0
+                                refresh_hack()
+                                insert_pkeys('properties_arm_R', 'pin_elbow_R')
 
-        if self.space == 'Free':
-            bpy.ops.switch.fing_thumb_space_l(space='Free')
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        #Jump to previous Frame
-                        bpy.context.scene.frame_set (bpy.context.scene.frame_current - 1)
-            bpy.ops.switch.fing_ind_space_l(space='Free')
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        #Jump to previous Frame
-                        bpy.context.scene.frame_set (bpy.context.scene.frame_current - 1)
-            bpy.ops.switch.fing_mid_space_l(space='Free')
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        #Jump to previous Frame
-                        bpy.context.scene.frame_set (bpy.context.scene.frame_current - 1)
-            bpy.ops.switch.fing_ring_space_l(space='Free')
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        #Jump to previous Frame
-                        bpy.context.scene.frame_set (bpy.context.scene.frame_current - 1)
-            bpy.ops.switch.fing_lit_space_l(space='Free')
+                                #Re-Paste Transforms
+                                pbones['arm_fk_ctrl_R'].rotation_euler = ArmCtrlRotEuler
+                                pbones['arm_fk_ctrl_R'].rotation_quaternion = ArmCtrlRotQuat
+                                pbones['arm_fk_ctrl_R'].location = ArmCtrlLoc
+                                pbones['arm_fk_ctrl_R'].scale = ArmCtrlScale
+                                refresh_hack()
+                                pbones['shoulder_R'].rotation_euler = ShoulderRotEuler
+                                pbones['shoulder_R'].rotation_quaternion = ShoulderRotQuat
+                                pbones['shoulder_R'].location = ShoulderLoc
+                                pbones['shoulder_R'].scale = ShoulderScale
+                                refresh_hack()
+                                pbones['arm_fk_R'].rotation_euler = ArmFkRotEuler
+                                pbones['arm_fk_R'].rotation_quaternion = ArmFkRotQuat
+                                pbones['arm_fk_R'].location = ArmFkLoc
+                                pbones['arm_fk_R'].scale = ArmFkScale
+                                refresh_hack()
+                                pbones['forearm_fk_R'].rotation_euler = ForearmFkRotEuler
+                                pbones['forearm_fk_R'].rotation_quaternion = ForearmFkRotQuat
+                                pbones['forearm_fk_R'].location = ForearmFkLoc
+                                pbones['forearm_fk_R'].scale = ForearmFkScale
+                                refresh_hack()
+                                pbones['hand_ik_ctrl_R'].rotation_euler = HandIkCtrlRotEuler
+                                pbones['hand_ik_ctrl_R'].rotation_quaternion = HandIkCtrlRotQuat
+                                pbones['hand_ik_ctrl_R'].location = HandIkCtrlLoc
+                                pbones['hand_ik_ctrl_R'].scale = HandIkCtrlScale
+                                refresh_hack()
+                                pbones['elbow_pole_R'].location = ElbowlLoc
+                                refresh_hack()
+                                pbones['arm_ik_R'].rotation_euler = ArmIkRotEuler
+                                pbones['arm_ik_R'].rotation_quaternion = ArmIkRotQuat
+                                pbones['arm_ik_R'].location = ArmIkLoc
+                                pbones['arm_ik_R'].scale = ArmIkScale
+                                refresh_hack()
 
-            #Change Space
-            bpy.context.active_object.pose.bones["properties_arm_L"].space_fing_all_L = 0.0
+                                insert_bkeys('master_torso', 'LocRotScale')
+                                insert_bkeys('pelvis_ctrl', 'LocRotScale')
+                                insert_bkeys('spine_1_fk', 'LocRotScale')
+                                insert_bkeys('spine_2_fk', 'LocRotScale')
+                                insert_bkeys('spine_3_fk', 'LocRotScale')
+                                insert_bkeys('spine_1_toon', 'LocRotScale')
+                                insert_bkeys('spine_2_toon', 'LocRotScale')
+                                insert_bkeys('spine_3_toon', 'LocRotScale')
+                                insert_bkeys('spine_4_toon', 'LocRotScale')
+                                insert_bkeys('torso_fk_ctrl_inv', 'LocRotScale')
+                                insert_bkeys('spine_3_fk_inv', 'LocRotScale')
+                                insert_bkeys('spine_2_fk_inv', 'LocRotScale')
+                                insert_bkeys('torso_fk_ctrl', 'LocRotScale')
+                                insert_bkeys('look', 'LocRotScale')
+                                insert_bkeys('elbow_pole_L', 'LocRotScale')
+                                insert_bkeys('elbow_pole_R', 'LocRotScale')
+                                insert_bkeys('knee_pole_L', 'LocRotScale')
+                                insert_bkeys('knee_pole_R', 'LocRotScale')
+                                insert_bkeys('arm_fk_R', 'LocRotScale')
+                                insert_bkeys('forearm_fk_R', 'LocRotScale')
+                                insert_bkeys('arm_ik_R', 'RotScale')
+                                insert_bkeys('forearm_ik_R', 'RotScale')
+                                insert_bkeys('arm_fk_ctrl_R', 'LocRotScale')
+                                insert_bkeys('shoulder_R', 'LocRotScale')
+                                insert_bkeys('hand_ik_ctrl_R', 'LocRotScale')
+                                insert_bkeys('hand_fk_R', 'LocRotScale')
+                                insert_bkeys('elbow_pin_R', 'LocRotScale')
+                                if pbones["properties_arm_R"].toggle_arm_ik_pole_R == 1.0:
+                                    insert_bkeys('elbow_pole_R', 'Loc')
+                                for prop in bpy.context.active_object.data.items():
+                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
+                                        insert_bkeys('carpal_ik_ctrl_R', 'LocRotScale')
+                                        insert_bkeys('carpal_fk_R', 'LocRotScale')
+                                        insert_bkeys('hand_fk_R', 'LocRotScale')
 
-        if self.space == 'Hand':
-            bpy.ops.switch.fing_thumb_space_l(space='Hand')
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        #Jump to previous Frame
-                        bpy.context.scene.frame_set (bpy.context.scene.frame_current - 1)
-            bpy.ops.switch.fing_ind_space_l(space='Hand')
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        #Jump to previous Frame
-                        bpy.context.scene.frame_set (bpy.context.scene.frame_current - 1)
-            bpy.ops.switch.fing_mid_space_l(space='Hand')
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        #Jump to previous Frame
-                        bpy.context.scene.frame_set (bpy.context.scene.frame_current - 1)
-            bpy.ops.switch.fing_ring_space_l(space='Hand')
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        #Jump to previous Frame
-                        bpy.context.scene.frame_set (bpy.context.scene.frame_current - 1)
-            bpy.ops.switch.fing_lit_space_l(space='Hand')
+                    #Switch Hand to Arm Space
+                    if armobj.pose.bones["properties_arm_R"].ik_arm_R < 0.1:
+                        if anim_data:
+                            if anim_data.action:
+                                if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
+                                    #Jump to previous Frame
+                                    bpy.context.scene.frame_set (bpy.context.scene.frame_current - 1)
 
-            #Change Space
-            bpy.context.active_object.pose.bones["properties_arm_L"].space_fing_all_L = 1.0
+                        #Switch Hand to Free Space
+                        bpy.ops.switch.hand_space_r(space='Free')
 
         return {"FINISHED"}
 
-#Create Space PopUp
-def Fing_All_Space_List_L(self, context):
-    col = self.layout.column()
-    col.operator("switch.fing_all_space_l", text = "Free").space = 'Free'
-    col.operator("switch.fing_all_space_l", text = "Hand").space = 'Hand'
-
-class Operator_Show_Fing_All_Space_List_L(bpy.types.Operator):
-    bl_idname = "show.fing_all_list_l"
-    bl_label = "All Fingers_L Space Switch List"
-    bl_description = "Switch All Fingers_L Space"
-
-    def invoke(self, context, event):
-        context.window_manager.popup_menu(Fing_All_Space_List_L, title='Switch All Fingers_L Space', icon='MOD_ARMATURE')
-        return {'FINISHED'}
-
-##### Thumb Finger_L Space #####
+##### Knee_R Pin #####
 
-class Operator_Switch_Fing_Thumb_Space_L(bpy.types.Operator):
+class Operator_Knee_Pin_R(bpy.types.Operator):
 
-    bl_idname = "switch.fing_thumb_space_l"
-    bl_label = "BlenRig Switch Thumb Finger_L Space"
-    bl_description = "Switch Thumb Finger_L Space preserving pose"
+    bl_idname = "pin.knee_r"
+    bl_label = "BlenRig Pin Knee_R"
+    bl_description = "Pin Knee_R"
     bl_options = {'REGISTER', 'UNDO','INTERNAL'}
 
     @classmethod
@@ -1284,297 +1921,342 @@ class Operator_Switch_Fing_Thumb_Space_L(bpy.types.Operator):
         else:
             return False
 
-    #Create string property to parse argument to the operator
-    space : bpy.props.StringProperty()
-
+    @keyframe_batch
     def execute(self, context):
 
         armobj = bpy.context.active_object
         pbones = armobj.pose.bones
-        dbones = armobj.data.bones
         anim_data = armobj.animation_data
-        try:
-            #Insert Keyframes if Action present
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        pbones["properties_arm_L"].keyframe_insert(data_path='space_fing_thumb_L')
-                        insert_bkeys('fing_thumb_ik_L', 'Loc')
-
-            if self.space == 'Free':
-                #Get Matrix in previous space
-                Thumb_world_mat = pbones['fing_thumb_ik_L'].id_data.matrix_world.copy()
-                Thumb_mat = pbones['fing_thumb_ik_L'].matrix.copy()
-
-                #Change Space
-                bpy.context.active_object.pose.bones["properties_arm_L"].space_fing_thumb_L = 0.0
-
-                paste_visual_matrix('fing_thumb_ik_L', 'master_pivot', Thumb_world_mat, Thumb_mat, 'Location')
-
-            if self.space == 'Hand':
-                #Get Matrix in previous space
-                Thumb_world_mat = pbones['fing_thumb_ik_L'].id_data.matrix_world.copy()
-                Thumb_mat = pbones['fing_thumb_ik_L'].matrix.copy()
-
-                #Change Space
-                bpy.context.active_object.pose.bones["properties_arm_L"].space_fing_thumb_L = 1.0
-
-                paste_visual_matrix('fing_thumb_ik_L', 'fing_thumb_ctrl_track_L', Thumb_world_mat, Thumb_mat, 'Location')
-
-            #Insert Keyframes if Action present
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        #Collect Local Transforms
-                        ThumbLoc = pbones['fing_thumb_ik_L'].location.copy()
-
-                        #Jump to next Frame
-                        bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
-
-                        #Key Property
-                        if self.space == 'Free':
-                            bpy.context.active_object.pose.bones["properties_arm_L"].space_fing_thumb_L = 0.0
-                            refresh_hack()
-                        if self.space == 'Hand':
-                            bpy.context.active_object.pose.bones["properties_arm_L"].space_fing_thumb_L = 1.0
-                            refresh_hack()
-                        pbones["properties_arm_L"].keyframe_insert(data_path='space_fing_thumb_L')
-
-                        #Re-Paste Transforms
-                        pbones['fing_thumb_ik_L'].location = ThumbLoc
-                        refresh_hack()
-
-                        insert_bkeys('fing_thumb_ik_L', 'Loc')
-        except:
-            pass
-        return {"FINISHED"}
-
-#Create Space PopUp
-def Fing_Thumb_Space_List_L(self, context):
-    col = self.layout.column()
-    col.operator("switch.fing_thumb_space_l", text = "Free").space = 'Free'
-    col.operator("switch.fing_thumb_space_l", text = "Hand").space = 'Hand'
-
-class Operator_Show_Fing_Thumb_Space_List_L(bpy.types.Operator):
-    bl_idname = "show.fing_thumb_list_l"
-    bl_label = "Thumb Finger_L Space Switch List"
-    bl_description = "Switch Thumb Finger_L Space"
-
-    def invoke(self, context, event):
-        context.window_manager.popup_menu(Fing_Thumb_Space_List_L, title='Switch Thumb Finger_L Space', icon='MOD_ARMATURE')
-        return {'FINISHED'}
 
-##### Ind Finger_L Space #####
-
-class Operator_Switch_Fing_Ind_Space_L(bpy.types.Operator):
+        #Biped
+        for prop in bpy.context.active_object.data.items():
+            if prop[0] == 'rig_type' and prop[1] == 'Biped':
 
-    bl_idname = "switch.fing_ind_space_l"
-    bl_label = "BlenRig Switch Index Finger_L Space"
-    bl_description = "Switch Index Finger_L Space preserving pose"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
+        #### Pin ####
+                if armobj.pose.bones["properties_leg_R"].pin_knee_R < 0.1:
 
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
+                    #Collect Matrix
+                    ThighFkMat = pbones['thigh_fk_R'].matrix.copy()
+                    ThighFkLoc = pbones['thigh_fk_R'].location.copy()
+                    ThighFkScale = pbones['thigh_fk_R'].scale.copy()
+                    ShinFkMat = pbones['shin_fk_R'].matrix.copy()
+                    ShinFkLoc = pbones['shin_fk_R'].location.copy()
+                    ShinFkScale = pbones['shin_fk_R'].scale.copy()
+                    TorsoMat = pbones['master_torso'].matrix.copy()
+                    TorsoLoc = pbones['master_torso'].location.copy()
+                    TorsoScale = pbones['master_torso'].scale.copy()
+                    PelvisMat = pbones['pelvis_ctrl'].matrix.copy()
+                    PelvisLoc = pbones['pelvis_ctrl'].location.copy()
+                    PelvisScale = pbones['pelvis_ctrl'].scale.copy()
+                    FootFkMat = pbones['foot_fk_R'].matrix.copy()
+                    FootFkLoc = pbones['foot_fk_R'].location.copy()
+                    FootFkScale = pbones['foot_fk_R'].scale.copy()
+                    FootToe1FkMat = pbones['foot_toe_1_fk_R'].matrix.copy()
+                    FootToe1FkLoc = pbones['foot_toe_1_fk_R'].location.copy()
+                    FootToe1FkScale = pbones['foot_toe_1_fk_R'].scale.copy()
+                    FootToe2FkMat = pbones['foot_toe_2_fk_R'].matrix.copy()
+                    FootToe2FkLoc = pbones['foot_toe_2_fk_R'].location.copy()
+                    FootToe2FkScale = pbones['foot_toe_2_fk_R'].scale.copy()
                     for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
-
-    #Create string property to parse argument to the operator
-    space : bpy.props.StringProperty()
-
-    def execute(self, context):
-
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        dbones = armobj.data.bones
-        anim_data = armobj.animation_data
-        try:
-            #Insert Keyframes if Action present
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        pbones["properties_arm_L"].keyframe_insert(data_path='space_fing_ind_L')
-                        insert_bkeys('fing_ind_ik_L', 'Loc')
-
-            if self.space == 'Free':
-                #Get Matrix in previous space
-                Ind_world_mat = pbones['fing_ind_ik_L'].id_data.matrix_world.copy()
-                Ind_mat = pbones['fing_ind_ik_L'].matrix.copy()
+                        if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
+                            TarsalFkMat = pbones['tarsal_fk_R'].matrix.copy()
+                            TarsalFkLoc = pbones['tarsal_fk_R'].location.copy()
+                            TarsalFkScale = pbones['tarsal_fk_R'].scale.copy()
 
-                #Change Space
-                bpy.context.active_object.pose.bones["properties_arm_L"].space_fing_ind_L = 0.0
+                    #Insert Keyframes if Action present
+                    if anim_data:
+                        if anim_data.action:
+                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
+                                insert_pkeys('properties_leg_R', 'pin_knee_R')
+                                insert_bkeys('master_torso', 'LocRotScale')
+                                insert_bkeys('pelvis_ctrl', 'LocRotScale')
+                                insert_bkeys('spine_1_fk', 'LocRotScale')
+                                insert_bkeys('spine_2_fk', 'LocRotScale')
+                                insert_bkeys('spine_3_fk', 'LocRotScale')
+                                insert_bkeys('spine_1_toon', 'LocRotScale')
+                                insert_bkeys('spine_2_toon', 'LocRotScale')
+                                insert_bkeys('spine_3_toon', 'LocRotScale')
+                                insert_bkeys('spine_4_toon', 'LocRotScale')
+                                insert_bkeys('torso_fk_ctrl_inv', 'LocRotScale')
+                                insert_bkeys('spine_3_fk_inv', 'LocRotScale')
+                                insert_bkeys('spine_2_fk_inv', 'LocRotScale')
+                                insert_bkeys('torso_fk_ctrl', 'LocRotScale')
+                                insert_bkeys('look', 'LocRotScale')
+                                insert_bkeys('elbow_pole_L', 'LocRotScale')
+                                insert_bkeys('elbow_pole_R', 'LocRotScale')
+                                insert_bkeys('knee_pole_L', 'LocRotScale')
+                                insert_bkeys('knee_pole_R', 'LocRotScale')
+                                insert_bkeys('thigh_fk_R', 'LocRotScale')
+                                insert_bkeys('shin_fk_R', 'LocRotScale')
+                                insert_bkeys('thigh_fk_ctrl_R', 'LocRotScale')
+                                insert_bkeys('foot_fk_R', 'LocRotScale')
+                                insert_bkeys('foot_toe_1_fk_R', 'LocRotScale')
+                                insert_bkeys('foot_toe_2_fk_R', 'LocRotScale')
+                                insert_bkeys('thigh_ik_R', 'RotScale')
+                                insert_bkeys('shin_ik_R', 'RotScale')
+                                insert_bkeys('foot_ik_ctrl_R', 'LocRotScale')
+                                insert_bkeys('foot_toe_ik_ctrl_mid_R', 'LocRotScale')
+                                insert_bkeys('foot_toe_ik_ctrl_R', 'LocRotScale')
+                                insert_bkeys('foot_roll_ctrl_R', 'Rot')
+                                insert_bkeys('toe_roll_1_R', 'Rot')
+                                insert_bkeys('toe_roll_2_R', 'Rot')
+                                insert_bkeys('sole_ctrl_R', 'LocRotScale')
+                                insert_bkeys('knee_pin_R', 'LocRotScale')
+                                if pbones["properties_leg_R"].toggle_leg_ik_pole_R == 1.0:
+                                    insert_bkeys('knee_pole_R', 'Loc')
+                                for prop in bpy.context.active_object.data.items():
+                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
+                                        insert_bkeys('tarsal_fk_R', 'LocRotScale')
+                                        insert_bkeys('tarsal_ik_ctrl_R', 'LocRotScale')
 
-                paste_visual_matrix('fing_ind_ik_L', 'master_pivot', Ind_world_mat, Ind_mat, 'Location')
+                    #Paste Matrix
+                    pVisLocExec(pbones['knee_pin_R'], pbones['snap_knee_pin_R'])
+                    pVisRotExec(pbones['knee_pin_R'], pbones['snap_knee_pin_R'])
+                    pVisScaExec(pbones['knee_pin_R'], pbones['snap_knee_pin_R'])
+                    refresh_hack()
+                    pVisLocExec(pbones['sole_ctrl_R'], pbones['snap_sole_ctrl_fk_R'])
+                    pVisRotExec(pbones['sole_ctrl_R'], pbones['snap_sole_ctrl_fk_R'])
+                    refresh_hack()
+                    pbones['foot_roll_ctrl_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                    pbones['foot_ik_ctrl_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                    pbones['foot_ik_ctrl_R'].location[:] = (0.0, 0.0, 0.0)
+                    pbones['toe_roll_1_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                    pbones['toe_roll_2_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                    pbones['foot_toe_ik_ctrl_mid_R'].location[:] = (0.0, 0.0, 0.0)
+                    pbones['foot_toe_ik_ctrl_mid_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                    pbones['foot_toe_ik_ctrl_R'].location[:] = (0.0, 0.0, 0.0)
+                    pbones['foot_toe_ik_ctrl_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
 
-            if self.space == 'Hand':
-                #Get Matrix in previous space
-                Ind_world_mat = pbones['fing_ind_ik_L'].id_data.matrix_world.copy()
-                Ind_mat = pbones['fing_ind_ik_L'].matrix.copy()
+                    armobj.pose.bones["properties_leg_R"].pin_knee_R = 1.0
+                    refresh_hack()
 
-                #Change Space
-                bpy.context.active_object.pose.bones["properties_arm_L"].space_fing_ind_L = 1.0
+                    pbones['master_torso'].matrix = TorsoMat
+                    refresh_hack()
+                    pbones['pelvis_ctrl'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                    pbones['pelvis_ctrl'].location[:] = (0.0, 0.0, 0.0)
+                    refresh_hack()
+                    pbones['thigh_fk_R'].matrix = ThighFkMat
+                    pbones['thigh_fk_R'].location = ThighFkLoc
+                    pbones['thigh_fk_R'].scale = ThighFkScale
+                    refresh_hack()
+                    pbones['shin_fk_R'].matrix = ShinFkMat
+                    pbones['shin_fk_R'].location = ShinFkLoc
+                    pbones['shin_fk_R'].scale = ShinFkScale
+                    pbones['foot_fk_R'].matrix = FootFkMat
+                    pbones['foot_fk_R'].location = FootFkLoc
+                    pbones['foot_fk_R'].scale = FootFkScale
+                    refresh_hack()
+                    pbones['foot_toe_1_fk_R'].matrix = FootToe1FkMat
+                    pbones['foot_toe_1_fk_R'].location = FootToe1FkLoc
+                    pbones['foot_toe_1_fk_R'].scale = FootToe1FkScale
+                    refresh_hack()
+                    pbones['foot_toe_2_fk_R'].matrix = FootToe2FkMat
+                    pbones['foot_toe_2_fk_R'].location = FootToe2FkLoc
+                    pbones['foot_toe_2_fk_R'].scale = FootToe2FkScale
+                    refresh_hack()
 
-                paste_visual_matrix('fing_ind_ik_L', 'fing_ind_ctrl_track_L', Ind_world_mat, Ind_mat, 'Location')
 
-            #Insert Keyframes if Action present
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        #Collect Local Transforms
-                        IndLoc = pbones['fing_ind_ik_L'].location.copy()
 
-                        #Jump to next Frame
-                        bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
+                    #Insert Keyframes if Action present
+                    if anim_data:
+                        if anim_data.action:
+                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
+                                #Collect Local Transforms
+                                KneePinRotEuler = pbones['knee_pin_R'].rotation_euler.copy()
+                                KneePinRotQuat = pbones['knee_pin_R'].rotation_quaternion.copy()
+                                KneePinLoc = pbones['knee_pin_R'].location.copy()
+                                KneePinScale = pbones['knee_pin_R'].scale.copy()
 
-                        #Key Property
-                        if self.space == 'Free':
-                            bpy.context.active_object.pose.bones["properties_arm_L"].space_fing_ind_L = 0.0
-                            refresh_hack()
-                        if self.space == 'Hand':
-                            bpy.context.active_object.pose.bones["properties_arm_L"].space_fing_ind_L = 1.0
-                            refresh_hack()
-                        pbones["properties_arm_L"].keyframe_insert(data_path='space_fing_ind_L')
+                                MasterTorsoRotEuler = pbones['master_torso'].rotation_euler.copy()
+                                MasterTorsoRotQuat = pbones['master_torso'].rotation_quaternion.copy()
+                                MasterTorsoLoc = pbones['master_torso'].location.copy()
+                                MasterTorsoScale = pbones['master_torso'].scale.copy()
 
-                        #Re-Paste Transforms
-                        pbones['fing_ind_ik_L'].location = IndLoc
-                        refresh_hack()
+                                SoleCtrlRotEuler = pbones['sole_ctrl_R'].rotation_euler.copy()
+                                SoleCtrlRotQuat = pbones['sole_ctrl_R'].rotation_quaternion.copy()
+                                SoleCtrlLoc = pbones['sole_ctrl_R'].location.copy()
+                                SoleCtrlScale = pbones['sole_ctrl_R'].scale.copy()
 
-                        insert_bkeys('fing_ind_ik_L', 'Loc')
-        except:
-            pass
-        return {"FINISHED"}
+                                KneePoleRotEuler = pbones['knee_pole_R'].rotation_euler.copy()
+                                KneePoleRotQuat = pbones['knee_pole_R'].rotation_quaternion.copy()
+                                KneePoleLoc = pbones['knee_pole_R'].location.copy()
+                                KneePoleScale = pbones['knee_pole_R'].scale.copy()
 
-#Create Space PopUp
-def Fing_Ind_Space_List_L(self, context):
-    col = self.layout.column()
-    col.operator("switch.fing_ind_space_l", text = "Free").space = 'Free'
-    col.operator("switch.fing_ind_space_l", text = "Hand").space = 'Hand'
+                                ThighIkRotEuler = pbones['thigh_ik_R'].rotation_euler.copy()
+                                ThighIkRotQuat = pbones['thigh_ik_R'].rotation_quaternion.copy()
+                                ThighIkLoc = pbones['thigh_ik_R'].location.copy()
+                                ThighIkScale = pbones['thigh_ik_R'].scale.copy()
 
-class Operator_Show_Fing_Ind_Space_List_L(bpy.types.Operator):
-    bl_idname = "show.fing_ind_list_l"
-    bl_label = "Index Finger_L Space Switch List"
-    bl_description = "Switch Index Finger_L Space"
+                                ThighFkRotEuler = pbones['thigh_fk_R'].rotation_euler.copy()
+                                ThighFkRotQuat = pbones['thigh_fk_R'].rotation_quaternion.copy()
+                                ThighFkLoc = pbones['thigh_fk_R'].location.copy()
+                                ThighFkScale = pbones['thigh_fk_R'].scale.copy()
 
-    def invoke(self, context, event):
-        context.window_manager.popup_menu(Fing_Ind_Space_List_L, title='Switch Index Finger_L Space', icon='MOD_ARMATURE')
-        return {'FINISHED'}
+                                ShinFkRotEuler = pbones['shin_fk_R'].rotation_euler.copy()
+                                ShinFkRotQuat = pbones['shin_fk_R'].rotation_quaternion.copy()
+                                ShinFkLoc = pbones['shin_fk_R'].location.copy()
+                                ShinFkScale = pbones['shin_fk_R'].scale.copy()
+                                FootFkRotEuler = pbones['foot_fk_R'].rotation_euler.copy()
+                                FootFkRotQuat = pbones['foot_fk_R'].rotation_quaternion.copy()
+                                FootFkLoc = pbones['foot_fk_R'].location.copy()
+                                FootFkScale = pbones['foot_fk_R'].scale.copy()
 
-##### Mid Finger_L Space #####
+                                for prop in bpy.context.active_object.data.items():
+                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
+                                        TarsalFkRotEuler = pbones['tarsal_fk_R'].rotation_euler.copy()
+                                        TarsalFkRotQuat = pbones['tarsal_fk_R'].rotation_quaternion.copy()
+                                        TarsalFkLoc = pbones['tarsal_fk_R'].location.copy()
+                                        TarsalFkScale = pbones['tarsal_fk_R'].scale.copy()
+                                        TarsalIkRotEuler = pbones['tarsal_ik_ctrl_R'].rotation_euler.copy()
+                                        TarsalIkRotQuat = pbones['tarsal_ik_ctrl_R'].rotation_quaternion.copy()
+                                        TarsaIFkLoc = pbones['tarsal_ik_ctrl_R'].location.copy()
+                                        TarsalIkScale = pbones['tarsal_ik_ctrl_R'].scale.copy()
 
-class Operator_Switch_Fing_Mid_Space_L(bpy.types.Operator):
+                                FootToe1FkRotEuler = pbones['foot_toe_1_fk_R'].rotation_euler.copy()
+                                FootToe1FkRotQuat = pbones['foot_toe_1_fk_R'].rotation_quaternion.copy()
+                                FootToe1FkLoc = pbones['foot_toe_1_fk_R'].location.copy()
+                                FootToe1FkScale = pbones['foot_toe_1_fk_R'].scale.copy()
 
-    bl_idname = "switch.fing_mid_space_l"
-    bl_label = "BlenRig Switch Middle Finger_L Space"
-    bl_description = "Switch Middle Finger_L Space preserving pose"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
+                                FootToe2FkRotEuler = pbones['foot_toe_2_fk_R'].rotation_euler.copy()
+                                FootToe2FkRotQuat = pbones['foot_toe_2_fk_R'].rotation_quaternion.copy()
+                                FootToe2FkLoc = pbones['foot_toe_2_fk_R'].location.copy()
+                                FootToe2FkScale = pbones['foot_toe_2_fk_R'].scale.copy()
 
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
+                                #Jump to next Frame
+                                bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
 
-    #Create string property to parse argument to the operator
-    space : bpy.props.StringProperty()
+                                #Key Property
+                                armobj.pose.bones["properties_leg_R"].pin_knee_R = 1.0
+                                refresh_hack()
+                                insert_pkeys('properties_leg_R', 'pin_knee_R')
 
-    def execute(self, context):
+                                #Re-Paste Transforms
+                                pbones['master_torso'].rotation_euler = MasterTorsoRotEuler
+                                pbones['master_torso'].rotation_quaternion = MasterTorsoRotQuat
+                                pbones['master_torso'].location = MasterTorsoLoc
+                                pbones['master_torso'].scale = MasterTorsoScale
+                                refresh_hack()
+                                pbones['pelvis_ctrl'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                                pbones['pelvis_ctrl'].location[:] = (0.0, 0.0, 0.0)
+                                refresh_hack()
+                                pbones['knee_pin_R'].rotation_euler = KneePinRotEuler
+                                pbones['knee_pin_R'].rotation_quaternion = KneePinRotQuat
+                                pbones['knee_pin_R'].location = KneePinLoc
+                                pbones['knee_pin_R'].scale = KneePinScale
+                                refresh_hack()
+                                pbones['sole_ctrl_R'].rotation_euler = SoleCtrlRotEuler
+                                pbones['sole_ctrl_R'].rotation_quaternion = SoleCtrlRotQuat
+                                pbones['sole_ctrl_R'].location = SoleCtrlLoc
+                                pbones['sole_ctrl_R'].scale = SoleCtrlScale
+                                refresh_hack()
+                                pbones['knee_pole_R'].rotation_euler = KneePoleRotEuler
+                                pbones['knee_pole_R'].rotation_quaternion = KneePoleRotQuat
+                                pbones['knee_pole_R'].location = KneePoleLoc
+                                pbones['knee_pole_R'].scale = KneePoleScale
+                                refresh_hack()
+                                pbones['thigh_ik_R'].rotation_euler = ThighIkRotEuler
+                                pbones['thigh_ik_R'].rotation_quaternion = ThighIkRotQuat
+                                pbones['thigh_ik_R'].location = ThighIkLoc
+                                pbones['thigh_ik_R'].scale = ThighIkScale
+                                refresh_hack()
+                                pbones['thigh_fk_R'].rotation_euler = ThighFkRotEuler
+                                pbones['thigh_fk_R'].rotation_quaternion = ThighFkRotQuat
+                                pbones['thigh_fk_R'].location = ThighFkLoc
+                                pbones['thigh_fk_R'].scale = ThighFkScale
+                                refresh_hack()
+                                pbones['shin_fk_R'].rotation_euler = ShinFkRotEuler
+                                pbones['shin_fk_R'].rotation_quaternion = ShinFkRotQuat
+                                pbones['shin_fk_R'].location = ShinFkLoc
+                                pbones['shin_fk_R'].scale = ShinFkScale
+                                refresh_hack()
+                                pbones['foot_fk_R'].rotation_euler = FootFkRotEuler
+                                pbones['foot_fk_R'].rotation_quaternion = FootFkRotQuat
+                                pbones['foot_fk_R'].location = FootFkLoc
+                                pbones['foot_fk_R'].scale = FootFkScale
+                                refresh_hack()
+                                for prop in bpy.context.active_object.data.items():
+                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
+                                        pbones['tarsal_ik_ctrl_R'].rotation_euler = TarsalIkRotEuler
+                                        pbones['tarsal_ik_ctrl_R'].rotation_quaternion = TarsalIkRotQuat
+                                        pbones['tarsal_ik_ctrl_R'].location = TarsaIFkLoc
+                                        pbones['tarsal_ik_ctrl_R'].scale = TarsalIkScale
+                                        refresh_hack()
+                                        pbones['tarsal_fk_R'].rotation_euler = TarsalFkRotEuler
+                                        pbones['tarsal_fk_R'].rotation_quaternion = TarsalFkRotQuat
+                                        pbones['tarsal_fk_R'].location = TarsalFkLoc
+                                        pbones['tarsal_fk_R'].scale = TarsalFkScale
+                                        refresh_hack()
+                                pbones['foot_toe_1_fk_R'].rotation_euler = FootToe1FkRotEuler
+                                pbones['foot_toe_1_fk_R'].rotation_quaternion = FootToe1FkRotQuat
+                                pbones['foot_toe_1_fk_R'].location = FootToe1FkLoc
+                                pbones['foot_toe_1_fk_R'].scale = FootToe1FkScale
+                                refresh_hack()
+                                pbones['foot_toe_2_fk_R'].rotation_euler = FootToe2FkRotEuler
+                                pbones['foot_toe_2_fk_R'].rotation_quaternion = FootToe2FkRotQuat
+                                pbones['foot_toe_2_fk_R'].location = FootToe2FkLoc
+                                pbones['foot_toe_2_fk_R'].scale = FootToe2FkScale
+                                refresh_hack()
+                                pbones['foot_roll_ctrl_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                                pbones['foot_ik_ctrl_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                                pbones['foot_ik_ctrl_R'].location[:] = (0.0, 0.0, 0.0)
+                                pbones['toe_roll_1_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                                pbones['toe_roll_2_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                                pbones['foot_toe_ik_ctrl_mid_R'].location[:] = (0.0, 0.0, 0.0)
+                                pbones['foot_toe_ik_ctrl_mid_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                                pbones['foot_toe_ik_ctrl_R'].location[:] = (0.0, 0.0, 0.0)
+                                pbones['foot_toe_ik_ctrl_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                                refresh_hack()
 
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        dbones = armobj.data.bones
-        anim_data = armobj.animation_data
-        try:
-            #Insert Keyframes if Action present
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        pbones["properties_arm_L"].keyframe_insert(data_path='space_fing_mid_L')
-                        insert_bkeys('fing_mid_ik_L', 'Loc')
-
-            if self.space == 'Free':
-                #Get Matrix in previous space
-                Mid_world_mat = pbones['fing_mid_ik_L'].id_data.matrix_world.copy()
-                Mid_mat = pbones['fing_mid_ik_L'].matrix.copy()
-
-                #Change Space
-                bpy.context.active_object.pose.bones["properties_arm_L"].space_fing_mid_L = 0.0
-
-                paste_visual_matrix('fing_mid_ik_L', 'master_pivot', Mid_world_mat, Mid_mat, 'Location')
-
-            if self.space == 'Hand':
-                #Get Matrix in previous space
-                Mid_world_mat = pbones['fing_mid_ik_L'].id_data.matrix_world.copy()
-                Mid_mat = pbones['fing_mid_ik_L'].matrix.copy()
-
-                #Change Space
-                bpy.context.active_object.pose.bones["properties_arm_L"].space_fing_mid_L = 1.0
-
-                paste_visual_matrix('fing_mid_ik_L', 'fing_mid_ctrl_track_L', Mid_world_mat, Mid_mat, 'Location')
-
-            #Insert Keyframes if Action present
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        #Collect Local Transforms
-                        MidLoc = pbones['fing_mid_ik_L'].location.copy()
-
-                        #Jump to next Frame
-                        bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
-
-                        #Key Property
-                        if self.space == 'Free':
-                            bpy.context.active_object.pose.bones["properties_arm_L"].space_fing_mid_L = 0.0
-                            refresh_hack()
-                        if self.space == 'Hand':
-                            bpy.context.active_object.pose.bones["properties_arm_L"].space_fing_mid_L = 1.0
-                            refresh_hack()
-                        pbones["properties_arm_L"].keyframe_insert(data_path='space_fing_mid_L')
-
-                        #Re-Paste Transforms
-                        pbones['fing_mid_ik_L'].location = MidLoc
-                        refresh_hack()
+                                insert_bkeys('master_torso', 'LocRotScale')
+                                insert_bkeys('pelvis_ctrl', 'LocRotScale')
+                                insert_bkeys('spine_1_fk', 'LocRotScale')
+                                insert_bkeys('spine_2_fk', 'LocRotScale')
+                                insert_bkeys('spine_3_fk', 'LocRotScale')
+                                insert_bkeys('spine_1_toon', 'LocRotScale')
+                                insert_bkeys('spine_2_toon', 'LocRotScale')
+                                insert_bkeys('spine_3_toon', 'LocRotScale')
+                                insert_bkeys('spine_4_toon', 'LocRotScale')
+                                insert_bkeys('torso_fk_ctrl_inv', 'LocRotScale')
+                                insert_bkeys('spine_3_fk_inv', 'LocRotScale')
+                                insert_bkeys('spine_2_fk_inv', 'LocRotScale')
+                                insert_bkeys('torso_fk_ctrl', 'LocRotScale')
+                                insert_bkeys('look', 'LocRotScale')
+                                insert_bkeys('elbow_pole_L', 'LocRotScale')
+                                insert_bkeys('elbow_pole_R', 'LocRotScale')
+                                insert_bkeys('knee_pole_L', 'LocRotScale')
+                                insert_bkeys('knee_pole_R', 'LocRotScale')
+                                insert_bkeys('thigh_fk_R', 'LocRotScale')
+                                insert_bkeys('shin_fk_R', 'LocRotScale')
+                                insert_bkeys('thigh_fk_ctrl_R', 'LocRotScale')
+                                insert_bkeys('foot_fk_R', 'LocRotScale')
+                                insert_bkeys('foot_toe_1_fk_R', 'LocRotScale')
+                                insert_bkeys('foot_toe_2_fk_R', 'LocRotScale')
+                                insert_bkeys('thigh_ik_R', 'RotScale')
+                                insert_bkeys('shin_ik_R', 'RotScale')
+                                insert_bkeys('foot_ik_ctrl_R', 'LocRotScale')
+                                insert_bkeys('foot_toe_ik_ctrl_mid_R', 'LocRotScale')
+                                insert_bkeys('foot_toe_ik_ctrl_R', 'LocRotScale')
+                                insert_bkeys('foot_roll_ctrl_R', 'Rot')
+                                insert_bkeys('toe_roll_1_R', 'Rot')
+                                insert_bkeys('toe_roll_2_R', 'Rot')
+                                insert_bkeys('sole_ctrl_R', 'LocRotScale')
+                                insert_bkeys('knee_pin_R', 'LocRotScale')
+                                if pbones["properties_leg_R"].toggle_leg_ik_pole_R == 1.0:
+                                    insert_bkeys('knee_pole_R', 'Loc')
+                                for prop in bpy.context.active_object.data.items():
+                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
+                                        insert_bkeys('tarsal_fk_R', 'LocRotScale')
+                                        insert_bkeys('tarsal_ik_ctrl_R', 'LocRotScale')
 
-                        insert_bkeys('fing_mid_ik_L', 'Loc')
-        except:
-            pass
         return {"FINISHED"}
 
-#Create Space PopUp
-def Fing_Mid_Space_List_L(self, context):
-    col = self.layout.column()
-    col.operator("switch.fing_mid_space_l", text = "Free").space = 'Free'
-    col.operator("switch.fing_mid_space_l", text = "Hand").space = 'Hand'
-
-class Operator_Show_Fing_Mid_Space_List_L(bpy.types.Operator):
-    bl_idname = "show.fing_mid_list_l"
-    bl_label = "Middle Finger_L Space Switch List"
-    bl_description = "Switch Middle Finger_L Space"
-
-    def invoke(self, context, event):
-        context.window_manager.popup_menu(Fing_Mid_Space_List_L, title='Switch Middle Finger_L Space', icon='MOD_ARMATURE')
-        return {'FINISHED'}
-
-##### Ring Finger_L Space #####
+##### Knee_R UnPin #####
 
-class Operator_Switch_Fing_Ring_Space_L(bpy.types.Operator):
+class Operator_Knee_UnPin_R(bpy.types.Operator):
 
-    bl_idname = "switch.fing_ring_space_l"
-    bl_label = "BlenRig Switch Ring Finger_L Space"
-    bl_description = "Switch Ring Finger_L Space preserving pose"
+    bl_idname = "unpin.knee_r"
+    bl_label = "BlenRig UnPin Knee_R"
+    bl_description = "UnPin Knee_R"
     bl_options = {'REGISTER', 'UNDO','INTERNAL'}
 
     @classmethod
@@ -1590,6597 +2272,479 @@ class Operator_Switch_Fing_Ring_Space_L(bpy.types.Operator):
         else:
             return False
 
-    #Create string property to parse argument to the operator
-    space : bpy.props.StringProperty()
-
+    @keyframe_batch
     def execute(self, context):
 
         armobj = bpy.context.active_object
         pbones = armobj.pose.bones
-        dbones = armobj.data.bones
         anim_data = armobj.animation_data
-        try:
-            #Insert Keyframes if Action present
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        pbones["properties_arm_L"].keyframe_insert(data_path='space_fing_ring_L')
-                        insert_bkeys('fing_ring_ik_L', 'Loc')
-
-            if self.space == 'Free':
-                #Get Matrix in previous space
-                Ring_world_mat = pbones['fing_ring_ik_L'].id_data.matrix_world.copy()
-                Ring_mat = pbones['fing_ring_ik_L'].matrix.copy()
-
-                #Change Space
-                bpy.context.active_object.pose.bones["properties_arm_L"].space_fing_ring_L = 0.0
-
-                paste_visual_matrix('fing_ring_ik_L', 'master_pivot', Ring_world_mat, Ring_mat, 'Location')
-
-            if self.space == 'Hand':
-                #Get Matrix in previous space
-                Ring_world_mat = pbones['fing_ring_ik_L'].id_data.matrix_world.copy()
-                Ring_mat = pbones['fing_ring_ik_L'].matrix.copy()
-
-                #Change Space
-                bpy.context.active_object.pose.bones["properties_arm_L"].space_fing_ring_L = 1.0
-
-                paste_visual_matrix('fing_ring_ik_L', 'fing_ring_ctrl_track_L', Ring_world_mat, Ring_mat, 'Location')
-
-            #Insert Keyframes if Action present
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        #Collect Local Transforms
-                        RingLoc = pbones['fing_ring_ik_L'].location.copy()
-
-                        #Jump to next Frame
-                        bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
-
-                        #Key Property
-                        if self.space == 'Free':
-                            bpy.context.active_object.pose.bones["properties_arm_L"].space_fing_ring_L = 0.0
-                            refresh_hack()
-                        if self.space == 'Hand':
-                            bpy.context.active_object.pose.bones["properties_arm_L"].space_fing_ring_L = 1.0
-                            refresh_hack()
-                        pbones["properties_arm_L"].keyframe_insert(data_path='space_fing_ring_L')
-
-                        #Re-Paste Transforms
-                        pbones['fing_ring_ik_L'].location = RingLoc
-                        refresh_hack()
 
-                        insert_bkeys('fing_ring_ik_L', 'Loc')
-        except:
-            pass
-        return {"FINISHED"}
-
-#Create Space PopUp
-def Fing_Ring_Space_List_L(self, context):
-    col = self.layout.column()
-    col.operator("switch.fing_ring_space_l", text = "Free").space = 'Free'
-    col.operator("switch.fing_ring_space_l", text = "Hand").space = 'Hand'
-
-class Operator_Show_Fing_Ring_Space_List_L(bpy.types.Operator):
-    bl_idname = "show.fing_ring_list_l"
-    bl_label = "Ring Finger_L Space Switch List"
-    bl_description = "Switch Ring Finger_L Space"
-
-    def invoke(self, context, event):
-        context.window_manager.popup_menu(Fing_Ring_Space_List_L, title='Switch Ring Finger_L Space', icon='MOD_ARMATURE')
-        return {'FINISHED'}
-
-##### Lit Finger_L Space #####
-
-class Operator_Switch_Fing_Lit_Space_L(bpy.types.Operator):
-
-    bl_idname = "switch.fing_lit_space_l"
-    bl_label = "BlenRig Switch Little Finger_L Space"
-    bl_description = "Switch Little Finger_L Space preserving pose"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
+        #Biped
+        for prop in bpy.context.active_object.data.items():
+            if prop[0] == 'rig_type' and prop[1] == 'Biped':
 
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
+                if armobj.pose.bones["properties_leg_R"].pin_knee_R > 0.9:
 
-    #Create string property to parse argument to the operator
-    space : bpy.props.StringProperty()
+                    #Collect Matrix
+                    MasterTorsoMat = pbones['master_torso'].matrix.copy()
+                    MasterTorsoLoc = pbones['master_torso'].location.copy()
+                    MasterTorsoScale = pbones['master_torso'].scale.copy()
+                    PelvisMat = pbones['pelvis_ctrl'].matrix.copy()
+                    PelvisLoc = pbones['pelvis_ctrl'].location.copy()
+                    PelvisScale = pbones['pelvis_ctrl'].scale.copy()
+                    Spine1FKMat = pbones['spine_1_fk'].matrix.copy()
+                    Spine1FKLoc = pbones['spine_1_fk'].location.copy()
+                    Spine1FKScale = pbones['spine_1_fk'].scale.copy()
+                    Spine2FKMat = pbones['spine_2_fk'].matrix.copy()
+                    Spine2FKLoc = pbones['spine_2_fk'].location.copy()
+                    Spine2FKScale = pbones['spine_2_fk'].scale.copy()
+                    Spine3FKMat = pbones['spine_3_fk'].matrix.copy()
+                    Spine3FKLoc = pbones['spine_3_fk'].location.copy()
+                    Spine3FKScale = pbones['spine_3_fk'].scale.copy()
+                    Spine1ToonMat = pbones['spine_1_toon'].matrix.copy()
+                    Spine1ToonLoc = pbones['spine_1_toon'].location.copy()
+                    Spine1ToonScale = pbones['spine_1_toon'].scale.copy()
+                    Spine2ToonMat = pbones['spine_2_toon'].matrix.copy()
+                    Spine2ToonLoc = pbones['spine_2_toon'].location.copy()
+                    Spine2ToonScale = pbones['spine_2_toon'].scale.copy()
+                    Spine3ToonMat = pbones['spine_3_toon'].matrix.copy()
+                    Spine3ToonLoc = pbones['spine_3_toon'].location.copy()
+                    Spine3ToonScale = pbones['spine_3_toon'].scale.copy()
+                    Spine4ToonMat = pbones['spine_4_toon'].matrix.copy()
+                    Spine4ToonLoc = pbones['spine_4_toon'].location.copy()
+                    Spine4ToonScale = pbones['spine_4_toon'].scale.copy()
+                    ElbowLMat = pbones['elbow_pole_R'].matrix.copy()
+                    ElbowRMat = pbones['elbow_pole_R'].matrix.copy()
+                    KneeLMat = pbones['knee_pole_R'].matrix.copy()
+                    KneeRMat = pbones['knee_pole_R'].matrix.copy()
+                    ThighFkMat = pbones['thigh_fk_R'].matrix.copy()
+                    ThighFkLoc = pbones['thigh_fk_R'].location.copy()
+                    ThighFkScale = pbones['thigh_fk_R'].scale.copy()
+                    ShinFkMat = pbones['shin_fk_R'].matrix.copy()
+                    ShinFkLoc = pbones['shin_fk_R'].location.copy()
+                    ShinFkScale = pbones['shin_fk_R'].scale.copy()
+                    SoleCtrlMat = pbones['sole_ctrl_R'].matrix.copy()
+                    SoleCtrlLoc = pbones['sole_ctrl_R'].location.copy()
+                    SoleCtrlScale = pbones['sole_ctrl_R'].scale.copy()
+                    FootFKMat = pbones['foot_fk_R'].matrix.copy()
+                    FootFKLoc = pbones['foot_fk_R'].location.copy()
+                    FootFkScale = pbones['foot_fk_R'].scale.copy()
+                    Look_world_mat = pbones['look'].id_data.matrix_world.copy()
+                    Look_mat = pbones['look'].matrix.copy()
 
-    def execute(self, context):
+                    #Insert Keyframes if Action present
+                    if anim_data:
+                        if anim_data.action:
+                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
+                                insert_pkeys('properties_leg_R', 'pin_knee_R')
+                                insert_bkeys('master_torso', 'LocRotScale')
+                                insert_bkeys('pelvis_ctrl', 'LocRotScale')
+                                insert_bkeys('spine_1_fk', 'LocRotScale')
+                                insert_bkeys('spine_2_fk', 'LocRotScale')
+                                insert_bkeys('spine_3_fk', 'LocRotScale')
+                                insert_bkeys('spine_1_toon', 'LocRotScale')
+                                insert_bkeys('spine_2_toon', 'LocRotScale')
+                                insert_bkeys('spine_3_toon', 'LocRotScale')
+                                insert_bkeys('spine_4_toon', 'LocRotScale')
+                                insert_bkeys('torso_fk_ctrl_inv', 'LocRotScale')
+                                insert_bkeys('spine_3_fk_inv', 'LocRotScale')
+                                insert_bkeys('spine_2_fk_inv', 'LocRotScale')
+                                insert_bkeys('torso_fk_ctrl', 'LocRotScale')
+                                insert_bkeys('look', 'LocRotScale')
+                                insert_bkeys('elbow_pole_R', 'LocRotScale')
+                                insert_bkeys('elbow_pole_R', 'LocRotScale')
+                                insert_bkeys('knee_pole_R', 'LocRotScale')
+                                insert_bkeys('knee_pole_R', 'LocRotScale')
+                                insert_bkeys('thigh_fk_R', 'LocRotScale')
+                                insert_bkeys('shin_fk_R', 'LocRotScale')
+                                insert_bkeys('thigh_fk_ctrl_R', 'LocRotScale')
+                                insert_bkeys('foot_fk_R', 'LocRotScale')
+                                insert_bkeys('foot_toe_1_fk_R', 'LocRotScale')
+                                insert_bkeys('foot_toe_2_fk_R', 'LocRotScale')
+                                insert_bkeys('thigh_ik_R', 'RotScale')
+                                insert_bkeys('shin_ik_R', 'RotScale')
+                                insert_bkeys('foot_ik_ctrl_R', 'LocRotScale')
+                                insert_bkeys('foot_toe_ik_ctrl_mid_R', 'LocRotScale')
+                                insert_bkeys('foot_toe_ik_ctrl_R', 'LocRotScale')
+                                insert_bkeys('foot_roll_ctrl_R', 'Rot')
+                                insert_bkeys('toe_roll_1_R', 'Rot')
+                                insert_bkeys('toe_roll_2_R', 'Rot')
+                                insert_bkeys('sole_ctrl_R', 'LocRotScale')
+                                insert_bkeys('knee_pin_R', 'LocRotScale')
+                                if pbones["properties_leg_R"].toggle_leg_ik_pole_R == 1.0:
+                                    insert_bkeys('knee_pole_R', 'Loc')
+                                for prop in bpy.context.active_object.data.items():
+                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
+                                        insert_bkeys('tarsal_fk_R', 'LocRotScale')
+                                        insert_bkeys('tarsal_ik_ctrl_R', 'LocRotScale')
 
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        dbones = armobj.data.bones
-        anim_data = armobj.animation_data
-        try:
-            #Insert Keyframes if Action present
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        pbones["properties_arm_L"].keyframe_insert(data_path='space_fing_lit_L')
-                        insert_bkeys('fing_lit_ik_L', 'Loc')
+                    #Collect Current Pose and save new Matrix
+                    pVisLocExec (pbones['spine_1_fk'], pbones['spine_1_def'])
+                    pVisRotExec (pbones['spine_1_fk'], pbones['spine_1_def'])
+                    refresh_hack()
+                    Spine1FKMat2 = pbones['spine_1_fk'].matrix.copy()
+                    refresh_hack()
+                    pbones['spine_1_fk'].matrix = Spine1FKMat
+                    refresh_hack()
+                    pVisLocExec (pbones['spine_2_fk'], pbones['spine_2_def'])
+                    pVisRotExec (pbones['spine_2_fk'], pbones['spine_2_def'])
+                    refresh_hack()
+                    Spine2FKMat2 = pbones['spine_2_fk'].matrix.copy()
+                    refresh_hack()
+                    pbones['spine_2_fk'].matrix = Spine2FKMat
+                    refresh_hack()
+                    pVisLocExec (pbones['spine_3_fk'], pbones['spine_3_def'])
+                    pVisRotExec (pbones['spine_3_fk'], pbones['spine_3_def'])
+                    refresh_hack()
+                    Spine3FKMat2 = pbones['spine_3_fk'].matrix.copy()
+                    refresh_hack()
+                    pbones['spine_3_fk'].matrix = Spine3FKMat
+                    refresh_hack()
 
-            if self.space == 'Free':
-                #Get Matrix in previous space
-                Lit_world_mat = pbones['fing_lit_ik_L'].id_data.matrix_world.copy()
-                Lit_mat = pbones['fing_lit_ik_L'].matrix.copy()
+                    #Paste Matrix
+                    pVisLocExec(pbones['master_torso'], pbones['snap_master_torso'])
+                    pVisRotExec (pbones['master_torso'], pbones['snap_master_torso'])
+                    refresh_hack()
+                    pVisLocExec(pbones['sole_ctrl_R'], pbones['snap_sole_ctrl_fk_R'])
+                    pVisRotExec (pbones['sole_ctrl_R'], pbones['snap_sole_ctrl_fk_R'])
+                    refresh_hack()
+                    pVisLocExec(pbones['knee_pole_R'], pbones['snap_knee_pole_fk_R'])
+                    refresh_hack()
+                    pVisRotExec (pbones['thigh_ik_R'], pbones['thigh_rot_R'])
+                    refresh_hack()
+                    pVisRotExec (pbones['thigh_fk_ctrl_R'], pbones['thigh_fk_R'])
+                    pbones['thigh_fk_ctrl_R'].scale[:] = (1.0, 1.0, 1.0)
+                    refresh_hack()
 
-                #Change Space
-                bpy.context.active_object.pose.bones["properties_arm_L"].space_fing_lit_L = 0.0
-
-                paste_visual_matrix('fing_lit_ik_L', 'master_pivot', Lit_world_mat, Lit_mat, 'Location')
-
-            if self.space == 'Hand':
-                #Get Matrix in previous space
-                Lit_world_mat = pbones['fing_lit_ik_L'].id_data.matrix_world.copy()
-                Lit_mat = pbones['fing_lit_ik_L'].matrix.copy()
-
-                #Change Space
-                bpy.context.active_object.pose.bones["properties_arm_L"].space_fing_lit_L = 1.0
-
-                paste_visual_matrix('fing_lit_ik_L', 'fing_lit_ctrl_track_L', Lit_world_mat, Lit_mat, 'Location')
-
-            #Insert Keyframes if Action present
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        #Collect Local Transforms
-                        LitLoc = pbones['fing_lit_ik_L'].location.copy()
-
-                        #Jump to next Frame
-                        bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
-
-                        #Key Property
-                        if self.space == 'Free':
-                            bpy.context.active_object.pose.bones["properties_arm_L"].space_fing_lit_L = 0.0
-                            refresh_hack()
-                        if self.space == 'Hand':
-                            bpy.context.active_object.pose.bones["properties_arm_L"].space_fing_lit_L = 1.0
-                            refresh_hack()
-                        pbones["properties_arm_L"].keyframe_insert(data_path='space_fing_lit_L')
-
-                        #Re-Paste Transforms
-                        pbones['fing_lit_ik_L'].location = LitLoc
-                        refresh_hack()
-
-                        insert_bkeys('fing_lit_ik_L', 'Loc')
-        except:
-            pass
-        return {"FINISHED"}
-
-#Create Space PopUp
-def Fing_Lit_Space_List_L(self, context):
-    col = self.layout.column()
-    col.operator("switch.fing_lit_space_l", text = "Free").space = 'Free'
-    col.operator("switch.fing_lit_space_l", text = "Hand").space = 'Hand'
-
-class Operator_Show_Fing_Lit_Space_List_L(bpy.types.Operator):
-    bl_idname = "show.fing_lit_list_l"
-    bl_label = "Little Finger_L Space Switch List"
-    bl_description = "Switch Little Finger_L Space"
-
-    def invoke(self, context, event):
-        context.window_manager.popup_menu(Fing_Lit_Space_List_L, title='Switch Little Finger_L Space', icon='MOD_ARMATURE')
-        return {'FINISHED'}
-
-##### Leg_L IK>FK #####
-
-class Operator_Snap_LegIKtoFK_L(bpy.types.Operator):
-
-    bl_idname = "snap.leg_ik_to_fk_l"
-    bl_label = "BlenRig Leg_L IK to FK"
-    bl_description = "Switch Leg to FK preserving pose"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
-
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
-
-    def execute(self, context):
-
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        anim_data = armobj.animation_data
-
-        if bpy.context.active_object.pose.bones["properties_leg_L"].ik_leg_L < 0.1:
-
-            #Collect Matrix
-            ThighFkMat = pbones['thigh_fk_L'].matrix.copy()
-            ThighFkLoc = pbones['thigh_fk_L'].location.copy()
-            ThighFkScale = pbones['thigh_fk_L'].scale.copy()
-            ShinFkMat = pbones['shin_fk_L'].matrix.copy()
-            ShinFkLoc = pbones['shin_fk_L'].location.copy()
-            ShinFkScale = pbones['shin_fk_L'].scale.copy()
-            FootFkMat = pbones['foot_fk_L'].matrix.copy()
-            FootFkLoc = pbones['foot_fk_L'].location.copy()
-            FootFkScale = pbones['foot_fk_L'].scale.copy()
-            FootToe1FkMat = pbones['foot_toe_1_fk_L'].matrix.copy()
-            FootToe1FkLoc = pbones['foot_toe_1_fk_L'].location.copy()
-            FootToe1FkScale = pbones['foot_toe_1_fk_L'].scale.copy()
-            FootToe2FkMat = pbones['foot_toe_2_fk_L'].matrix.copy()
-            FootToe2FkLoc = pbones['foot_toe_2_fk_L'].location.copy()
-            FootToe2FkScale = pbones['foot_toe_2_fk_L'].scale.copy()
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                    TarsalFkMat = pbones['tarsal_fk_L'].matrix.copy()
-                    TarsalFkLoc = pbones['tarsal_fk_L'].location.copy()
-                    TarsalFkScale = pbones['tarsal_fk_L'].scale.copy()
-
-            #Insert Keyframes if Action present
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        pbones["properties_leg_L"].keyframe_insert(data_path='ik_leg_L')
-                        insert_bkeys('thigh_fk_L', 'LocRotScale')
-                        insert_bkeys('shin_fk_L', 'LocRotScale')
-                        insert_bkeys('thigh_fk_ctrl_L', 'LocRotScale')
-                        insert_bkeys('foot_fk_L', 'LocRotScale')
-                        insert_bkeys('foot_toe_1_fk_L', 'LocRotScale')
-                        insert_bkeys('foot_toe_2_fk_L', 'LocRotScale')
-                        insert_bkeys('thigh_ik_L', 'RotScale')
-                        insert_bkeys('shin_ik_L', 'RotScale')
-                        insert_bkeys('foot_ik_ctrl_L', 'LocRotScale')
-                        insert_bkeys('foot_toe_ik_ctrl_mid_L', 'LocRotScale')
-                        insert_bkeys('foot_toe_ik_ctrl_L', 'LocRotScale')
-                        insert_bkeys('foot_roll_ctrl_L', 'Rot')
-                        insert_bkeys('toe_roll_1_L', 'Rot')
-                        insert_bkeys('toe_roll_2_L', 'Rot')
-                        insert_bkeys('sole_ctrl_L', 'LocRotScale')
-                        if pbones["properties_leg_L"].toggle_leg_ik_pole_L == 1.0:
-                            insert_bkeys('knee_pole_L', 'Loc')
-                        for prop in bpy.context.active_object.data.items():
-                            if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                                insert_bkeys('tarsal_fk_L', 'LocRotScale')
-                                insert_bkeys('tarsal_ik_ctrl_L', 'LocRotScale')
-
-            bpy.context.active_object.pose.bones["properties_leg_L"].ik_leg_L = 1.0
-            refresh_hack()
-
-            #Paste Matrix
-            pVisRotExec (pbones['thigh_fk_ctrl_L'], pbones['thigh_ik_L'])
-            pbones['thigh_fk_ctrl_L'].scale[:] = (1.0, 1.0, 1.0)
-            refresh_hack()
-            pbones['thigh_fk_L'].matrix = ThighFkMat
-            pbones['thigh_fk_L'].location = ThighFkLoc
-            pbones['thigh_fk_L'].scale = ThighFkScale
-            refresh_hack()
-            pbones['shin_fk_L'].matrix = ShinFkMat
-            pbones['shin_fk_L'].location = ShinFkLoc
-            pbones['shin_fk_L'].scale = ShinFkScale
-            refresh_hack()
-            #Correct thigh_fk twist
-            pVisRotExec (pbones['thigh_fk_L'], pbones['thigh_rot_L'])
-            refresh_hack()
-            #Re-paste shin matrix
-            pbones['shin_fk_L'].matrix = ShinFkMat
-            pbones['shin_fk_L'].location = ShinFkLoc
-            pbones['shin_fk_L'].scale = ShinFkScale
-            refresh_hack()
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                    pbones['tarsal_fk_L'].matrix = TarsalFkMat
-                    pbones['tarsal_fk_L'].location = TarsalFkLoc
-                    pbones['tarsal_fk_L'].scale = TarsalFkScale
-                    refresh_hack()
-            pbones['foot_fk_L'].matrix = FootFkMat
-            pbones['foot_fk_L'].location = FootFkLoc
-            pbones['foot_fk_L'].scale = FootFkScale
-            refresh_hack()
-            pbones['foot_toe_1_fk_L'].matrix = FootToe1FkMat
-            pbones['foot_toe_1_fk_L'].location = FootToe1FkLoc
-            pbones['foot_toe_1_fk_L'].scale = FootToe1FkScale
-            refresh_hack()
-            pbones['foot_toe_2_fk_L'].matrix = FootToe2FkMat
-            pbones['foot_toe_2_fk_L'].location = FootToe2FkLoc
-            pbones['foot_toe_2_fk_L'].scale = FootToe2FkScale
-            refresh_hack()
-
-            #Insert Keyframes if Action present
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        #Collect Local Transforms
-
-                        ThighCtrlRotEuler = pbones['thigh_fk_ctrl_L'].rotation_euler.copy()
-                        ThighCtrlRotQuat = pbones['thigh_fk_ctrl_L'].rotation_quaternion.copy()
-                        ThighCtrlLoc = pbones['thigh_fk_ctrl_L'].location.copy()
-                        ThighCtrlScale = pbones['thigh_fk_ctrl_L'].scale.copy()
-
-                        ThighFkRotEuler = pbones['thigh_fk_L'].rotation_euler.copy()
-                        ThighFkRotQuat = pbones['thigh_fk_L'].rotation_quaternion.copy()
-                        ThighFkLoc = pbones['thigh_fk_L'].location.copy()
-                        ThighFkScale = pbones['thigh_fk_L'].scale.copy()
-
-                        ShinFkRotEuler = pbones['shin_fk_L'].rotation_euler.copy()
-                        ShinFkRotQuat = pbones['shin_fk_L'].rotation_quaternion.copy()
-                        ShinFkLoc = pbones['shin_fk_L'].location.copy()
-                        ShinFkScale = pbones['shin_fk_L'].scale.copy()
-
-                        for prop in bpy.context.active_object.data.items():
-                            if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                                TarsalFkRotEuler = pbones['tarsal_fk_L'].rotation_euler.copy()
-                                TarsalFkRotQuat = pbones['tarsal_fk_L'].rotation_quaternion.copy()
-                                TarsalFkLoc = pbones['tarsal_fk_L'].location.copy()
-                                TarsalFkScale = pbones['tarsal_fk_L'].scale.copy()
-
-                        FootFkRotEuler = pbones['foot_fk_L'].rotation_euler.copy()
-                        FootFkRotQuat = pbones['foot_fk_L'].rotation_quaternion.copy()
-                        FootFkLoc = pbones['foot_fk_L'].location.copy()
-                        FootFkScale = pbones['foot_fk_L'].scale.copy()
-
-                        FootToe1FkRotEuler = pbones['foot_toe_1_fk_L'].rotation_euler.copy()
-                        FootToe1FkRotQuat = pbones['foot_toe_1_fk_L'].rotation_quaternion.copy()
-                        FootToe1FkLoc = pbones['foot_toe_1_fk_L'].location.copy()
-                        FootToe1FkScale = pbones['foot_toe_1_fk_L'].scale.copy()
-
-                        FootToe2FkRotEuler = pbones['foot_toe_2_fk_L'].rotation_euler.copy()
-                        FootToe2FkRotQuat = pbones['foot_toe_2_fk_L'].rotation_quaternion.copy()
-                        FootToe2FkLoc = pbones['foot_toe_2_fk_L'].location.copy()
-                        FootToe2FkScale = pbones['foot_toe_2_fk_L'].scale.copy()
-
-                        #Jump to next Frame
-                        bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
-
-                        #Key Property
-                        armobj.pose.bones["properties_leg_L"].ik_leg_L = 1.0
-                        refresh_hack()
-                        pbones["properties_leg_L"].keyframe_insert(data_path='ik_leg_L')
-
-                        #Re-Paste Transforms
-                        pbones['thigh_fk_ctrl_L'].rotation_euler = ThighCtrlRotEuler
-                        pbones['thigh_fk_ctrl_L'].rotation_quaternion = ThighCtrlRotQuat
-                        pbones['thigh_fk_ctrl_L'].location = ThighCtrlLoc
-                        pbones['thigh_fk_ctrl_L'].scale = ThighCtrlScale
-                        refresh_hack()
-                        pbones['thigh_fk_L'].rotation_euler = ThighFkRotEuler
-                        pbones['thigh_fk_L'].rotation_quaternion = ThighFkRotQuat
-                        pbones['thigh_fk_L'].location = ThighFkLoc
-                        pbones['thigh_fk_L'].scale = ThighFkScale
-                        refresh_hack()
-                        pbones['shin_fk_L'].rotation_euler = ShinFkRotEuler
-                        pbones['shin_fk_L'].rotation_quaternion = ShinFkRotQuat
-                        pbones['shin_fk_L'].location = ShinFkLoc
-                        pbones['shin_fk_L'].scale = ShinFkScale
-                        refresh_hack()
-                        for prop in bpy.context.active_object.data.items():
-                            if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                                pbones['tarsal_fk_L'].rotation_euler = TarsalFkRotEuler
-                                pbones['tarsal_fk_L'].rotation_quaternion = TarsalFkRotQuat
-                                pbones['tarsal_fk_L'].location = TarsalFkLoc
-                                pbones['tarsal_fk_L'].scale = TarsalFkScale
-                                refresh_hack()
-                        pbones['foot_fk_L'].rotation_euler = FootFkRotEuler
-                        pbones['foot_fk_L'].rotation_quaternion = FootFkRotQuat
-                        pbones['foot_fk_L'].location = FootFkLoc
-                        pbones['foot_fk_L'].scale = FootFkScale
-                        refresh_hack()
-                        pbones['foot_toe_1_fk_L'].rotation_euler = FootToe1FkRotEuler
-                        pbones['foot_toe_1_fk_L'].rotation_quaternion = FootToe1FkRotQuat
-                        pbones['foot_toe_1_fk_L'].location = FootToe1FkLoc
-                        pbones['foot_toe_1_fk_L'].scale = FootToe1FkScale
-                        refresh_hack()
-                        pbones['foot_toe_2_fk_L'].rotation_euler = FootToe2FkRotEuler
-                        pbones['foot_toe_2_fk_L'].rotation_quaternion = FootToe2FkRotQuat
-                        pbones['foot_toe_2_fk_L'].location = FootToe2FkLoc
-                        pbones['foot_toe_2_fk_L'].scale = FootToe2FkScale
-                        refresh_hack()
-
-                        insert_bkeys('thigh_fk_L', 'LocRotScale')
-                        insert_bkeys('shin_fk_L', 'LocRotScale')
-                        insert_bkeys('thigh_fk_ctrl_L', 'LocRotScale')
-                        insert_bkeys('foot_fk_L', 'LocRotScale')
-                        insert_bkeys('foot_toe_1_fk_L', 'LocRotScale')
-                        insert_bkeys('foot_toe_2_fk_L', 'LocRotScale')
-                        insert_bkeys('thigh_ik_L', 'RotScale')
-                        insert_bkeys('shin_ik_L', 'RotScale')
-                        insert_bkeys('foot_ik_ctrl_L', 'LocRotScale')
-                        insert_bkeys('foot_toe_ik_ctrl_mid_L', 'LocRotScale')
-                        insert_bkeys('foot_toe_ik_ctrl_L', 'LocRotScale')
-                        insert_bkeys('foot_roll_ctrl_L', 'Rot')
-                        insert_bkeys('toe_roll_1_L', 'Rot')
-                        insert_bkeys('toe_roll_2_L', 'Rot')
-                        insert_bkeys('sole_ctrl_L', 'LocRotScale')
-                        if pbones["properties_leg_L"].toggle_leg_ik_pole_L == 1.0:
-                            insert_bkeys('knee_pole_L', 'Loc')
-                        for prop in bpy.context.active_object.data.items():
-                            if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                                insert_bkeys('tarsal_fk_L', 'LocRotScale')
-                                insert_bkeys('tarsal_ik_ctrl_L', 'LocRotScale')
-
-        return {"FINISHED"}
-
-##### Leg_L FK>IK #####
-
-class Operator_Snap_LegFKtoIK_L(bpy.types.Operator):
-
-    bl_idname = "snap.leg_fk_to_ik_l"
-    bl_label = "BlenRig Leg_L IK to FK"
-    bl_description = "Switch Leg to IK preserving pose"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
-
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
-
-    def execute(self, context):
-
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        anim_data = armobj.animation_data
-
-        if bpy.context.active_object.pose.bones["properties_leg_L"].ik_leg_L > 0.9:
-
-            #Collect Matrix
-            ThighFkMat = pbones['thigh_fk_L'].matrix.copy()
-            ThighFkLoc = pbones['thigh_fk_L'].location.copy()
-            ThighFkScale = pbones['thigh_fk_L'].scale.copy()
-            ShinFkMat = pbones['shin_fk_L'].matrix.copy()
-            ShinFkLoc = pbones['shin_fk_L'].location.copy()
-            ShinFkScale = pbones['shin_fk_L'].scale.copy()
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                    TarsalFkMat = pbones['tarsal_fk_L'].matrix.copy()
-                    TarsalFkLoc = pbones['tarsal_fk_L'].location.copy()
-                    TarsalFkScale = pbones['tarsal_fk_L'].scale.copy()
-            FootToe1FkMat = pbones['foot_toe_1_fk_L'].matrix.copy()
-            FootToe1FkLoc = pbones['foot_toe_1_fk_L'].location.copy()
-            FootToe1FkScale = pbones['foot_toe_1_fk_L'].scale.copy()
-            FootToe2FkMat = pbones['foot_toe_2_fk_L'].matrix.copy()
-            FootToe2FkLoc = pbones['foot_toe_2_fk_L'].location.copy()
-            FootToe2FkScale = pbones['foot_toe_2_fk_L'].scale.copy()
-
-            #Insert Keyframes if Action present
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        pbones["properties_leg_L"].keyframe_insert(data_path='ik_leg_L')
-                        insert_bkeys('thigh_fk_L', 'LocRotScale')
-                        insert_bkeys('shin_fk_L', 'LocRotScale')
-                        insert_bkeys('thigh_fk_ctrl_L', 'LocRotScale')
-                        insert_bkeys('foot_fk_L', 'LocRotScale')
-                        insert_bkeys('foot_toe_1_fk_L', 'LocRotScale')
-                        insert_bkeys('foot_toe_2_fk_L', 'LocRotScale')
-                        insert_bkeys('thigh_ik_L', 'RotScale')
-                        insert_bkeys('shin_ik_L', 'RotScale')
-                        insert_bkeys('foot_ik_ctrl_L', 'LocRotScale')
-                        insert_bkeys('foot_toe_ik_ctrl_mid_L', 'LocRotScale')
-                        insert_bkeys('foot_toe_ik_ctrl_L', 'LocRotScale')
-                        insert_bkeys('foot_roll_ctrl_L', 'Rot')
-                        insert_bkeys('toe_roll_1_L', 'Rot')
-                        insert_bkeys('toe_roll_2_L', 'Rot')
-                        insert_bkeys('sole_ctrl_L', 'LocRotScale')
-                        if pbones["properties_leg_L"].toggle_leg_ik_pole_L == 1.0:
-                            insert_bkeys('knee_pole_L', 'Loc')
-                        for prop in bpy.context.active_object.data.items():
-                            if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                                insert_bkeys('tarsal_fk_L', 'LocRotScale')
-                                insert_bkeys('tarsal_ik_ctrl_L', 'LocRotScale')
-
-            #Paste Matrix
-            pVisLocExec(pbones['sole_ctrl_L'], pbones['snap_sole_ctrl_fk_L'])
-            pVisRotExec(pbones['sole_ctrl_L'], pbones['snap_sole_ctrl_fk_L'])
-            refresh_hack()
-            pbones['foot_roll_ctrl_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
-            pbones['foot_ik_ctrl_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
-            pbones['foot_ik_ctrl_L'].location[:] = (0.0, 0.0, 0.0)
-            pbones['toe_roll_1_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
-            pbones['toe_roll_2_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
-            pbones['foot_toe_ik_ctrl_mid_L'].location[:] = (0.0, 0.0, 0.0)
-            pbones['foot_toe_ik_ctrl_mid_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
-            pbones['foot_toe_ik_ctrl_L'].location[:] = (0.0, 0.0, 0.0)
-            pbones['foot_toe_ik_ctrl_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
-            pVisLocExec(pbones['knee_pole_L'], pbones['snap_knee_pole_fk_L'])
-            refresh_hack()
-            pVisRotExec (pbones['thigh_ik_L'], pbones['thigh_rot_L'])
-            refresh_hack()
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                    pVisLocExec(pbones['tarsal_ik_ctrl_L'], pbones['snap_tarsal_fk_L'])
-                    pVisRotExec(pbones['tarsal_ik_ctrl_L'], pbones['snap_tarsal_fk_L'])
-                    refresh_hack()
-
-            bpy.context.active_object.pose.bones["properties_leg_L"].ik_leg_L = 0.0
-            refresh_hack()
-
-            pbones['thigh_fk_L'].matrix = ThighFkMat
-            pbones['thigh_fk_L'].location = ThighFkLoc
-            pbones['thigh_fk_L'].scale = ThighFkScale
-            refresh_hack()
-            pbones['shin_fk_L'].matrix = ShinFkMat
-            pbones['shin_fk_L'].location = ShinFkLoc
-            pbones['shin_fk_L'].scale = ShinFkScale
-            refresh_hack()
-            #Correct thigh_fk twist
-            pVisRotExec (pbones['thigh_fk_L'], pbones['thigh_rot_L'])
-            refresh_hack()
-            #Re-paste shin matrix
-            pbones['shin_fk_L'].matrix = ShinFkMat
-            pbones['shin_fk_L'].location = ShinFkLoc
-            pbones['shin_fk_L'].scale = ShinFkScale
-            refresh_hack()
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                    pbones['tarsal_fk_L'].matrix = TarsalFkMat
-                    pbones['tarsal_fk_L'].location = TarsalFkLoc
-                    pbones['tarsal_fk_L'].scale = TarsalFkScale
-                    refresh_hack()
-            pbones['foot_toe_1_fk_L'].matrix = FootToe1FkMat
-            pbones['foot_toe_1_fk_L'].location = FootToe1FkLoc
-            pbones['foot_toe_1_fk_L'].scale = FootToe1FkScale
-            refresh_hack()
-            pbones['foot_toe_2_fk_L'].matrix = FootToe2FkMat
-            pbones['foot_toe_2_fk_L'].location = FootToe2FkLoc
-            pbones['foot_toe_2_fk_L'].scale = FootToe2FkScale
-            refresh_hack()
-
-            #Insert Keyframes if Action present
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        #Collect Local Transforms
-
-                        SoleCtrlRotEuler = pbones['sole_ctrl_L'].rotation_euler.copy()
-                        SoleCtrlRotQuat = pbones['sole_ctrl_L'].rotation_quaternion.copy()
-                        SoleCtrlLoc = pbones['sole_ctrl_L'].location.copy()
-                        SoleCtrlScale = pbones['sole_ctrl_L'].scale.copy()
-
-                        KneePoleRotEuler = pbones['knee_pole_L'].rotation_euler.copy()
-                        KneePoleRotQuat = pbones['knee_pole_L'].rotation_quaternion.copy()
-                        KneePoleLoc = pbones['knee_pole_L'].location.copy()
-                        KneePoleScale = pbones['knee_pole_L'].scale.copy()
-
-                        ThighIkRotEuler = pbones['thigh_ik_L'].rotation_euler.copy()
-                        ThighIkRotQuat = pbones['thigh_ik_L'].rotation_quaternion.copy()
-                        ThighIkLoc = pbones['thigh_ik_L'].location.copy()
-                        ThighIkScale = pbones['thigh_ik_L'].scale.copy()
-
-                        ThighFkRotEuler = pbones['thigh_fk_L'].rotation_euler.copy()
-                        ThighFkRotQuat = pbones['thigh_fk_L'].rotation_quaternion.copy()
-                        ThighFkLoc = pbones['thigh_fk_L'].location.copy()
-                        ThighFkScale = pbones['thigh_fk_L'].scale.copy()
-
-                        ShinFkRotEuler = pbones['shin_fk_L'].rotation_euler.copy()
-                        ShinFkRotQuat = pbones['shin_fk_L'].rotation_quaternion.copy()
-                        ShinFkLoc = pbones['shin_fk_L'].location.copy()
-                        ShinFkScale = pbones['shin_fk_L'].scale.copy()
-
-                        for prop in bpy.context.active_object.data.items():
-                            if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                                TarsalFkRotEuler = pbones['tarsal_fk_L'].rotation_euler.copy()
-                                TarsalFkRotQuat = pbones['tarsal_fk_L'].rotation_quaternion.copy()
-                                TarsalFkLoc = pbones['tarsal_fk_L'].location.copy()
-                                TarsalFkScale = pbones['tarsal_fk_L'].scale.copy()
-                                TarsalIkRotEuler = pbones['tarsal_ik_ctrl_L'].rotation_euler.copy()
-                                TarsalIkRotQuat = pbones['tarsal_ik_ctrl_L'].rotation_quaternion.copy()
-                                TarsaIFkLoc = pbones['tarsal_ik_ctrl_L'].location.copy()
-                                TarsalIkScale = pbones['tarsal_ik_ctrl_L'].scale.copy()
-
-                        FootToe1FkRotEuler = pbones['foot_toe_1_fk_L'].rotation_euler.copy()
-                        FootToe1FkRotQuat = pbones['foot_toe_1_fk_L'].rotation_quaternion.copy()
-                        FootToe1FkLoc = pbones['foot_toe_1_fk_L'].location.copy()
-                        FootToe1FkScale = pbones['foot_toe_1_fk_L'].scale.copy()
-
-                        FootToe2FkRotEuler = pbones['foot_toe_2_fk_L'].rotation_euler.copy()
-                        FootToe2FkRotQuat = pbones['foot_toe_2_fk_L'].rotation_quaternion.copy()
-                        FootToe2FkLoc = pbones['foot_toe_2_fk_L'].location.copy()
-                        FootToe2FkScale = pbones['foot_toe_2_fk_L'].scale.copy()
-
-                        #Jump to next Frame
-                        bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
-
-                        #Key Property
-                        armobj.pose.bones["properties_leg_L"].ik_leg_L = 0.0
-                        refresh_hack()
-                        pbones["properties_leg_L"].keyframe_insert(data_path='ik_leg_L')
-
-                        #Re-Paste Transforms
-                        pbones['sole_ctrl_L'].rotation_euler = SoleCtrlRotEuler
-                        pbones['sole_ctrl_L'].rotation_quaternion = SoleCtrlRotQuat
-                        pbones['sole_ctrl_L'].location = SoleCtrlLoc
-                        pbones['sole_ctrl_L'].scale = SoleCtrlScale
-                        refresh_hack()
-                        pbones['knee_pole_L'].rotation_euler = KneePoleRotEuler
-                        pbones['knee_pole_L'].rotation_quaternion = KneePoleRotQuat
-                        pbones['knee_pole_L'].location = KneePoleLoc
-                        pbones['knee_pole_L'].scale = KneePoleScale
-                        refresh_hack()
-                        pbones['thigh_ik_L'].rotation_euler = ThighIkRotEuler
-                        pbones['thigh_ik_L'].rotation_quaternion = ThighIkRotQuat
-                        pbones['thigh_ik_L'].location = ThighIkLoc
-                        pbones['thigh_ik_L'].scale = ThighIkScale
-                        refresh_hack()
-                        pbones['thigh_fk_L'].rotation_euler = ThighFkRotEuler
-                        pbones['thigh_fk_L'].rotation_quaternion = ThighFkRotQuat
-                        pbones['thigh_fk_L'].location = ThighFkLoc
-                        pbones['thigh_fk_L'].scale = ThighFkScale
-                        refresh_hack()
-                        pbones['shin_fk_L'].rotation_euler = ShinFkRotEuler
-                        pbones['shin_fk_L'].rotation_quaternion = ShinFkRotQuat
-                        pbones['shin_fk_L'].location = ShinFkLoc
-                        pbones['shin_fk_L'].scale = ShinFkScale
-                        refresh_hack()
-                        for prop in bpy.context.active_object.data.items():
-                            if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                                pbones['tarsal_ik_ctrl_L'].rotation_euler = TarsalIkRotEuler
-                                pbones['tarsal_ik_ctrl_L'].rotation_quaternion = TarsalIkRotQuat
-                                pbones['tarsal_ik_ctrl_L'].location = TarsaIFkLoc
-                                pbones['tarsal_ik_ctrl_L'].scale = TarsalIkScale
-                                refresh_hack()
-                                pbones['tarsal_fk_L'].rotation_euler = TarsalFkRotEuler
-                                pbones['tarsal_fk_L'].rotation_quaternion = TarsalFkRotQuat
-                                pbones['tarsal_fk_L'].location = TarsalFkLoc
-                                pbones['tarsal_fk_L'].scale = TarsalFkScale
-                                refresh_hack()
-                        pbones['foot_toe_1_fk_L'].rotation_euler = FootToe1FkRotEuler
-                        pbones['foot_toe_1_fk_L'].rotation_quaternion = FootToe1FkRotQuat
-                        pbones['foot_toe_1_fk_L'].location = FootToe1FkLoc
-                        pbones['foot_toe_1_fk_L'].scale = FootToe1FkScale
-                        refresh_hack()
-                        pbones['foot_toe_2_fk_L'].rotation_euler = FootToe2FkRotEuler
-                        pbones['foot_toe_2_fk_L'].rotation_quaternion = FootToe2FkRotQuat
-                        pbones['foot_toe_2_fk_L'].location = FootToe2FkLoc
-                        pbones['foot_toe_2_fk_L'].scale = FootToe2FkScale
-                        refresh_hack()
-                        pbones['foot_roll_ctrl_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                        pbones['foot_ik_ctrl_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                        pbones['foot_ik_ctrl_L'].location[:] = (0.0, 0.0, 0.0)
-                        pbones['toe_roll_1_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                        pbones['toe_roll_2_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                        pbones['foot_toe_ik_ctrl_mid_L'].location[:] = (0.0, 0.0, 0.0)
-                        pbones['foot_toe_ik_ctrl_mid_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                        pbones['foot_toe_ik_ctrl_L'].location[:] = (0.0, 0.0, 0.0)
-                        pbones['foot_toe_ik_ctrl_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                        refresh_hack()
-
-                        insert_bkeys('thigh_fk_L', 'LocRotScale')
-                        insert_bkeys('shin_fk_L', 'LocRotScale')
-                        insert_bkeys('thigh_fk_ctrl_L', 'LocRotScale')
-                        insert_bkeys('foot_fk_L', 'LocRotScale')
-                        insert_bkeys('foot_toe_1_fk_L', 'LocRotScale')
-                        insert_bkeys('foot_toe_2_fk_L', 'LocRotScale')
-                        insert_bkeys('thigh_ik_L', 'RotScale')
-                        insert_bkeys('shin_ik_L', 'RotScale')
-                        insert_bkeys('foot_ik_ctrl_L', 'LocRotScale')
-                        insert_bkeys('foot_toe_ik_ctrl_mid_L', 'LocRotScale')
-                        insert_bkeys('foot_toe_ik_ctrl_L', 'LocRotScale')
-                        insert_bkeys('foot_roll_ctrl_L', 'Rot')
-                        insert_bkeys('toe_roll_1_L', 'Rot')
-                        insert_bkeys('toe_roll_2_L', 'Rot')
-                        insert_bkeys('sole_ctrl_L', 'LocRotScale')
-                        if pbones["properties_leg_L"].toggle_leg_ik_pole_L == 1.0:
-                            insert_bkeys('knee_pole_L', 'Loc')
-                        for prop in bpy.context.active_object.data.items():
-                            if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                                insert_bkeys('tarsal_fk_L', 'LocRotScale')
-                                insert_bkeys('tarsal_ik_ctrl_L', 'LocRotScale')
-
-        return {"FINISHED"}
-
-##### Leg_L Space #####
-
-class Operator_Switch_Leg_Space_L(bpy.types.Operator):
-
-    bl_idname = "switch.leg_space_l"
-    bl_label = "BlenRig Switch Leg_L FK Space"
-    bl_description = "Switch Leg_L FK Space preserving pose"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
-
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
-
-    #Create string property to parse argument to the operator
-    space : bpy.props.StringProperty()
-
-    def execute(self, context):
-
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        anim_data = armobj.animation_data
-
-        #Collect Matrix
-        ThighFkCtrlMat = pbones['thigh_fk_ctrl_L'].matrix.copy()
-
-        #Insert Keyframes if Action present
-        if anim_data:
-            if anim_data.action:
-                if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                    pbones["properties_leg_L"].keyframe_insert(data_path='space_leg_L')
-                    insert_bkeys('thigh_fk_ctrl_L', 'RotScale')
-
-        if self.space == 'Free':
-            bpy.context.active_object.pose.bones["properties_leg_L"].space_leg_L = 0.0
-            refresh_hack()
-        if self.space == 'Torso':
-            bpy.context.active_object.pose.bones["properties_leg_L"].space_leg_L = 1.0
-            refresh_hack()
-
-        #Paste Matrix
-        pbones['thigh_fk_ctrl_L'].matrix = ThighFkCtrlMat
-        refresh_hack()
-
-        #Insert Keyframes if Action present
-        if anim_data:
-            if anim_data.action:
-                if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                    #Collect Local Transforms
-                    ThighFkCtrlRotEuler = pbones['thigh_fk_ctrl_L'].rotation_euler.copy()
-                    ThighFkCtrlRotQuat = pbones['thigh_fk_ctrl_L'].rotation_quaternion.copy()
-                    ThighFkCtrlScale = pbones['thigh_fk_ctrl_L'].scale.copy()
-
-                    #Jump to next Frame
-                    bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
-
-                    #Key Property
-                    if self.space == 'Free':
-                        bpy.context.active_object.pose.bones["properties_leg_L"].space_leg_L = 0.0
-                        refresh_hack()
-                    if self.space == 'Torso':
-                        bpy.context.active_object.pose.bones["properties_leg_L"].space_leg_L = 1.0
-                        refresh_hack()
-                    pbones["properties_leg_L"].keyframe_insert(data_path='space_leg_L')
-
-                    #Re-Paste Transforms
-                    pbones['thigh_fk_ctrl_L'].rotation_euler = ThighFkCtrlRotEuler
-                    pbones['thigh_fk_ctrl_L'].rotation_quaternion = ThighFkCtrlRotQuat
-                    pbones['thigh_fk_ctrl_L'].scale = ThighFkCtrlScale
-                    refresh_hack()
-
-                    insert_bkeys('thigh_fk_ctrl_L', 'RotScale')
-
-        return {"FINISHED"}
-
-#Create Space PopUp
-def Leg_Space_List_L(self, context):
-    col = self.layout.column()
-    col.operator("switch.leg_space_l", text = "Free").space = 'Free'
-    col.operator("switch.leg_space_l", text = "Torso").space = 'Torso'
-
-class Operator_Show_Leg_Space_List_L(bpy.types.Operator):
-    bl_idname = "show.leg_list_l"
-    bl_label = "Leg_L FK Space Switch List"
-    bl_description = "Switch Leg_L FK Space"
-
-    def invoke(self, context, event):
-        context.window_manager.popup_menu(Leg_Space_List_L, title='Switch Leg_L FK Space', icon='MOD_ARMATURE')
-        return {'FINISHED'}
-
-##### Leg_Pole_L Space #####
-
-class Operator_Switch_Leg_Pole_Space_L(bpy.types.Operator):
-
-    bl_idname = "switch.leg_pole_space_l"
-    bl_label = "BlenRig Switch Leg_L Pole Space"
-    bl_description = "Switch Leg_L Pole Space preserving pose"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
-
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
-
-    #Create string property to parse argument to the operator
-    space : bpy.props.StringProperty()
-
-    def execute(self, context):
-
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        anim_data = armobj.animation_data
-
-        #Insert Keyframes if Action present
-        if anim_data:
-            if anim_data.action:
-                if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                    pbones["properties_leg_L"].keyframe_insert(data_path='space_leg_ik_pole_L')
-                    insert_bkeys('knee_pole_L', 'Loc')
-
-        #Collect Matrix
-        PoleMat = pbones['knee_pole_L'].matrix.copy()
-
-        if self.space == 'Free':
-            bpy.context.active_object.pose.bones["properties_leg_L"].space_leg_ik_pole_L = 0.0
-            refresh_hack()
-        if self.space == 'Torso':
-            bpy.context.active_object.pose.bones["properties_leg_L"].space_leg_ik_pole_L = 1.0
-            refresh_hack()
-        if self.space == 'Foot':
-            bpy.context.active_object.pose.bones["properties_leg_L"].space_leg_ik_pole_L = 2.0
-            refresh_hack()
-
-        #Paste Matrix
-        pbones['knee_pole_L'].matrix = PoleMat
-        refresh_hack()
-
-        #Insert Keyframes if Action present
-        if anim_data:
-            if anim_data.action:
-                if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                    #Collect Local Transforms
-                    KneePoleLoc = pbones['knee_pole_L'].location.copy()
-
-                    #Jump to next Frame
-                    bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
-
-                    #Key Property
-                    if self.space == 'Free':
-                        bpy.context.active_object.pose.bones["properties_leg_L"].space_leg_ik_pole_L = 0.0
-                        refresh_hack()
-                    if self.space == 'Torso':
-                        bpy.context.active_object.pose.bones["properties_leg_L"].space_leg_ik_pole_L = 1.0
-                        refresh_hack()
-                    if self.space == 'Foot':
-                        bpy.context.active_object.pose.bones["properties_leg_L"].space_leg_ik_pole_L = 2.0
-                        refresh_hack()
-                    pbones["properties_leg_L"].keyframe_insert(data_path='space_leg_ik_pole_L')
-
-                    #Re-Paste Transforms
-                    pbones['knee_pole_L'].location = KneePoleLoc
-                    refresh_hack()
-
-                    insert_bkeys('knee_pole_L', 'Loc')
-
-        return {"FINISHED"}
-
-#Create Space PopUp
-def Leg_Pole_Space_List_L(self, context):
-    col = self.layout.column()
-    col.operator("switch.leg_pole_space_l", text = "Free").space = 'Free'
-    col.operator("switch.leg_pole_space_l", text = "Torso").space = 'Torso'
-    col.operator("switch.leg_pole_space_l", text = "Foot").space = 'Foot'
-
-class Operator_Show_Leg_Pole_Space_List_L(bpy.types.Operator):
-    bl_idname = "show.leg_pole_list_l"
-    bl_label = "Leg_L Pole Space Switch List"
-    bl_description = "Switch Leg_L Pole Space"
-
-    def invoke(self, context, event):
-        context.window_manager.popup_menu(Leg_Pole_Space_List_L, title='Switch Leg_L Pole Space', icon='MOD_ARMATURE')
-        return {'FINISHED'}
-
-##### Elbow_L Pin #####
-
-class Operator_Elbow_Pin_L(bpy.types.Operator):
-
-    bl_idname = "pin.elbow_l"
-    bl_label = "BlenRig Pin Elbow_L"
-    bl_description = "Pin Elbow_L"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
-
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
-
-    def execute(self, context):
-
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        anim_data = armobj.animation_data
-
-        #Biped
-        for prop in bpy.context.active_object.data.items():
-            if prop[0] == 'rig_type' and prop[1] == 'Biped':
-
-        #### Pin ####
-                if armobj.pose.bones["properties_arm_L"].pin_elbow_L < 0.1:
-
-                    #Collect Matrix
-                    ArmFkMat = pbones['arm_fk_L'].matrix.copy()
-                    ArmFkLoc = pbones['arm_fk_L'].location.copy()
-                    ArmFkScale = pbones['arm_fk_L'].scale.copy()
-                    ForearmFkMat = pbones['forearm_fk_L'].matrix.copy()
-                    ForearmFkLoc = pbones['forearm_fk_L'].location.copy()
-                    ForearmFkScale = pbones['forearm_fk_L'].scale.copy()
-                    ShoulderMat = pbones['shoulder_L'].matrix.copy()
-                    ShoulderLoc = pbones['shoulder_L'].location.copy()
-                    ShoulderScale = pbones['shoulder_L'].scale.copy()
-
-                    #Insert Keyframes if Action present
-                    if anim_data:
-                        if anim_data.action:
-                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                                pbones["properties_arm_L"].keyframe_insert(data_path='pin_elbow_L')
-                                insert_bkeys('master_torso', 'LocRotScale')
-                                insert_bkeys('pelvis_ctrl', 'LocRotScale')
-                                insert_bkeys('spine_1_fk', 'LocRotScale')
-                                insert_bkeys('spine_2_fk', 'LocRotScale')
-                                insert_bkeys('spine_3_fk', 'LocRotScale')
-                                insert_bkeys('spine_1_toon', 'LocRotScale')
-                                insert_bkeys('spine_2_toon', 'LocRotScale')
-                                insert_bkeys('spine_3_toon', 'LocRotScale')
-                                insert_bkeys('spine_4_toon', 'LocRotScale')
-                                insert_bkeys('torso_fk_ctrl_inv', 'LocRotScale')
-                                insert_bkeys('spine_3_fk_inv', 'LocRotScale')
-                                insert_bkeys('spine_2_fk_inv', 'LocRotScale')
-                                insert_bkeys('torso_fk_ctrl', 'LocRotScale')
-                                insert_bkeys('look', 'LocRotScale')
-                                insert_bkeys('elbow_pole_L', 'LocRotScale')
-                                insert_bkeys('elbow_pole_R', 'LocRotScale')
-                                insert_bkeys('knee_pole_L', 'LocRotScale')
-                                insert_bkeys('knee_pole_R', 'LocRotScale')
-                                insert_bkeys('arm_fk_L', 'LocRotScale')
-                                insert_bkeys('forearm_fk_L', 'LocRotScale')
-                                insert_bkeys('arm_ik_L', 'RotScale')
-                                insert_bkeys('forearm_ik_L', 'RotScale')
-                                insert_bkeys('arm_fk_ctrl_L', 'LocRotScale')
-                                insert_bkeys('shoulder_L', 'LocRotScale')
-                                insert_bkeys('hand_ik_ctrl_L', 'LocRotScale')
-                                insert_bkeys('hand_fk_L', 'LocRotScale')
-                                insert_bkeys('elbow_pin_L', 'LocRotScale')
-                                if pbones["properties_arm_L"].toggle_arm_ik_pole_L == 1.0:
-                                    insert_bkeys('elbow_pole_L', 'Loc')
-                                for prop in bpy.context.active_object.data.items():
-                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                                        insert_bkeys('carpal_ik_ctrl_L', 'LocRotScale')
-                                        insert_bkeys('carpal_fk_L', 'LocRotScale')
-                                        insert_bkeys('hand_fk_L', 'LocRotScale')
-
-                    #Paste Matrix
-                    pVisLocExec(pbones['elbow_pin_L'], pbones['snap_elbow_pin_L'])
-                    pVisRotExec(pbones['elbow_pin_L'], pbones['snap_elbow_pin_L'])
-                    pVisScaExec(pbones['elbow_pin_L'], pbones['snap_elbow_pin_L'])
-                    refresh_hack()
-
-                    armobj.pose.bones["properties_arm_L"].pin_elbow_L = 1.0
-                    refresh_hack()
-
-                    pbones['shoulder_L'].matrix = ShoulderMat
-                    pbones['shoulder_L'].location = ShoulderLoc
-                    pbones['shoulder_L'].scale = ShoulderScale
-                    refresh_hack()
-                    pbones['arm_fk_L'].matrix = ArmFkMat
-                    pbones['arm_fk_L'].location = ArmFkLoc
-                    pbones['arm_fk_L'].scale = ArmFkScale
-                    refresh_hack()
-                    pbones['forearm_fk_L'].matrix = ForearmFkMat
-                    pbones['forearm_fk_L'].location = ForearmFkLoc
-                    pbones['forearm_fk_L'].scale = ForearmFkScale
-                    refresh_hack()
-
-                    #Insert Keyframes if Action present
-                    if anim_data:
-                        if anim_data.action:
-                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                                #Collect Local Transforms
-                                ElbowPinRotEuler = pbones['elbow_pin_L'].rotation_euler.copy()
-                                ElbowPinRotQuat = pbones['elbow_pin_L'].rotation_quaternion.copy()
-                                ElbowPinLoc = pbones['elbow_pin_L'].location.copy()
-                                ElbowPinScale = pbones['elbow_pin_L'].scale.copy()
-
-                                ShoulderRotEuler = pbones['shoulder_L'].rotation_euler.copy()
-                                ShoulderRotQuat = pbones['shoulder_L'].rotation_quaternion.copy()
-                                ShoulderLoc = pbones['shoulder_L'].location.copy()
-                                ShoulderScale = pbones['shoulder_L'].scale.copy()
-
-                                ArmFkRotEuler = pbones['arm_fk_L'].rotation_euler.copy()
-                                ArmFkRotQuat = pbones['arm_fk_L'].rotation_quaternion.copy()
-                                ArmFkLoc = pbones['arm_fk_L'].location.copy()
-                                ArmFkScale = pbones['arm_fk_L'].scale.copy()
-
-                                ForearmFkRotEuler = pbones['forearm_fk_L'].rotation_euler.copy()
-                                ForearmFkRotQuat = pbones['forearm_fk_L'].rotation_quaternion.copy()
-                                ForearmFkLoc = pbones['forearm_fk_L'].location.copy()
-                                ForearmFkScale = pbones['forearm_fk_L'].scale.copy()
-
-                                #Jump to next Frame
-                                bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
-
-                                #Key Property
-                                armobj.pose.bones["properties_arm_L"].pin_elbow_L = 1.0
-                                refresh_hack()
-                                pbones["properties_arm_L"].keyframe_insert(data_path='pin_elbow_L')
-
-                                #Re-Paste Transforms
-                                pbones['elbow_pin_L'].rotation_euler = ElbowPinRotEuler
-                                pbones['elbow_pin_L'].rotation_quaternion = ElbowPinRotQuat
-                                pbones['elbow_pin_L'].location = ElbowPinLoc
-                                pbones['elbow_pin_L'].scale = ElbowPinScale
-                                refresh_hack()
-                                pbones['shoulder_L'].rotation_euler = ShoulderRotEuler
-                                pbones['shoulder_L'].rotation_quaternion = ShoulderRotQuat
-                                pbones['shoulder_L'].location = ShoulderLoc
-                                pbones['shoulder_L'].scale = ShoulderScale
-                                refresh_hack()
-                                pbones['arm_fk_L'].rotation_euler = ArmFkRotEuler
-                                pbones['arm_fk_L'].rotation_quaternion = ArmFkRotQuat
-                                pbones['arm_fk_L'].location = ArmFkLoc
-                                pbones['arm_fk_L'].scale = ArmFkScale
-                                refresh_hack()
-                                pbones['forearm_fk_L'].rotation_euler = ForearmFkRotEuler
-                                pbones['forearm_fk_L'].rotation_quaternion = ForearmFkRotQuat
-                                pbones['forearm_fk_L'].location = ForearmFkLoc
-                                pbones['forearm_fk_L'].scale = ForearmFkScale
-                                refresh_hack()
-
-                                insert_bkeys('master_torso', 'LocRotScale')
-                                insert_bkeys('pelvis_ctrl', 'LocRotScale')
-                                insert_bkeys('spine_1_fk', 'LocRotScale')
-                                insert_bkeys('spine_2_fk', 'LocRotScale')
-                                insert_bkeys('spine_3_fk', 'LocRotScale')
-                                insert_bkeys('spine_1_toon', 'LocRotScale')
-                                insert_bkeys('spine_2_toon', 'LocRotScale')
-                                insert_bkeys('spine_3_toon', 'LocRotScale')
-                                insert_bkeys('spine_4_toon', 'LocRotScale')
-                                insert_bkeys('torso_fk_ctrl_inv', 'LocRotScale')
-                                insert_bkeys('spine_3_fk_inv', 'LocRotScale')
-                                insert_bkeys('spine_2_fk_inv', 'LocRotScale')
-                                insert_bkeys('torso_fk_ctrl', 'LocRotScale')
-                                insert_bkeys('look', 'LocRotScale')
-                                insert_bkeys('elbow_pole_L', 'LocRotScale')
-                                insert_bkeys('elbow_pole_R', 'LocRotScale')
-                                insert_bkeys('knee_pole_L', 'LocRotScale')
-                                insert_bkeys('knee_pole_R', 'LocRotScale')
-                                insert_bkeys('arm_fk_L', 'LocRotScale')
-                                insert_bkeys('forearm_fk_L', 'LocRotScale')
-                                insert_bkeys('arm_ik_L', 'RotScale')
-                                insert_bkeys('forearm_ik_L', 'RotScale')
-                                insert_bkeys('arm_fk_ctrl_L', 'LocRotScale')
-                                insert_bkeys('shoulder_L', 'LocRotScale')
-                                insert_bkeys('hand_ik_ctrl_L', 'LocRotScale')
-                                insert_bkeys('hand_fk_L', 'LocRotScale')
-                                insert_bkeys('elbow_pin_L', 'LocRotScale')
-                                if pbones["properties_arm_L"].toggle_arm_ik_pole_L == 1.0:
-                                    insert_bkeys('elbow_pole_L', 'Loc')
-                                for prop in bpy.context.active_object.data.items():
-                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                                        insert_bkeys('carpal_ik_ctrl_L', 'LocRotScale')
-                                        insert_bkeys('carpal_fk_L', 'LocRotScale')
-                                        insert_bkeys('hand_fk_L', 'LocRotScale')
-
-                    #Switch Hand to Arm Space
-                    if anim_data:
-                        if anim_data.action:
-                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                                #Jump to previous Frame
-                                bpy.context.scene.frame_set (bpy.context.scene.frame_current - 1)
-
-                    #Switch Hand to Arm Space
-                    bpy.ops.switch.hand_space_l(space='Arm')
-
-        return {"FINISHED"}
-
-##### Elbow_L UnPin #####
-
-class Operator_Elbow_UnPin_L(bpy.types.Operator):
-
-    bl_idname = "unpin.elbow_l"
-    bl_label = "BlenRig UnPin Elbow_L"
-    bl_description = "UnPin Elbow_L"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
-
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
-
-    def execute(self, context):
-
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        anim_data = armobj.animation_data
-
-        #Biped
-        for prop in bpy.context.active_object.data.items():
-            if prop[0] == 'rig_type' and prop[1] == 'Biped':
-
-                if armobj.pose.bones["properties_arm_L"].pin_elbow_L > 0.9:
-
-                    #Collect Matrix
-                    ArmFkMat = pbones['arm_fk_L'].matrix.copy()
-                    ArmFkLoc = pbones['arm_fk_L'].location.copy()
-                    ArmFkScale = pbones['arm_fk_L'].scale.copy()
-                    ForearmFkMat = pbones['forearm_fk_L'].matrix.copy()
-                    ForearmFkLoc = pbones['forearm_fk_L'].location.copy()
-                    ForearmFkScale = pbones['forearm_fk_L'].scale.copy()
-                    ShoulderMat = pbones['shoulder_L'].matrix.copy()
-                    ShoulderLoc = pbones['shoulder_L'].location.copy()
-                    ShoulderScale = pbones['shoulder_L'].scale.copy()
-
-                    #Insert Keyframes if Action present
-                    if anim_data:
-                        if anim_data.action:
-                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                                pbones["properties_arm_L"].keyframe_insert(data_path='pin_elbow_L')
-                                insert_bkeys('master_torso', 'LocRotScale')
-                                insert_bkeys('pelvis_ctrl', 'LocRotScale')
-                                insert_bkeys('spine_1_fk', 'LocRotScale')
-                                insert_bkeys('spine_2_fk', 'LocRotScale')
-                                insert_bkeys('spine_3_fk', 'LocRotScale')
-                                insert_bkeys('spine_1_toon', 'LocRotScale')
-                                insert_bkeys('spine_2_toon', 'LocRotScale')
-                                insert_bkeys('spine_3_toon', 'LocRotScale')
-                                insert_bkeys('spine_4_toon', 'LocRotScale')
-                                insert_bkeys('torso_fk_ctrl_inv', 'LocRotScale')
-                                insert_bkeys('spine_3_fk_inv', 'LocRotScale')
-                                insert_bkeys('spine_2_fk_inv', 'LocRotScale')
-                                insert_bkeys('torso_fk_ctrl', 'LocRotScale')
-                                insert_bkeys('look', 'LocRotScale')
-                                insert_bkeys('elbow_pole_L', 'LocRotScale')
-                                insert_bkeys('elbow_pole_R', 'LocRotScale')
-                                insert_bkeys('knee_pole_L', 'LocRotScale')
-                                insert_bkeys('knee_pole_R', 'LocRotScale')
-                                insert_bkeys('arm_fk_L', 'LocRotScale')
-                                insert_bkeys('forearm_fk_L', 'LocRotScale')
-                                insert_bkeys('arm_ik_L', 'RotScale')
-                                insert_bkeys('forearm_ik_L', 'RotScale')
-                                insert_bkeys('arm_fk_ctrl_L', 'LocRotScale')
-                                insert_bkeys('shoulder_L', 'LocRotScale')
-                                insert_bkeys('hand_ik_ctrl_L', 'LocRotScale')
-                                insert_bkeys('hand_fk_L', 'LocRotScale')
-                                insert_bkeys('elbow_pin_L', 'LocRotScale')
-                                if pbones["properties_arm_L"].toggle_arm_ik_pole_L == 1.0:
-                                    insert_bkeys('elbow_pole_L', 'Loc')
-                                for prop in bpy.context.active_object.data.items():
-                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                                        insert_bkeys('carpal_ik_ctrl_L', 'LocRotScale')
-                                        insert_bkeys('carpal_fk_L', 'LocRotScale')
-                                        insert_bkeys('hand_fk_L', 'LocRotScale')
-
-                    #Paste Matrix
-                    pVisLocExec(pbones['hand_ik_ctrl_L'], pbones['hand_fk_L'])
-                    refresh_hack()
-                    pVisLocExec(pbones['elbow_pole_L'], pbones['snap_elbow_pole_fk_L'])
-                    refresh_hack()
-                    pVisRotExec (pbones['arm_ik_L'], pbones['arm_rot_L'])
-                    refresh_hack()
-                    pVisRotExec (pbones['arm_fk_ctrl_L'], pbones['arm_fk_L'])
-                    pbones['arm_fk_ctrl_L'].scale[:] = (1.0, 1.0, 1.0)
-                    refresh_hack()
-
-                    bpy.context.active_object.pose.bones["properties_arm_L"].pin_elbow_L = 0.0
-                    refresh_hack()
-
-                    pbones['shoulder_L'].matrix = ShoulderMat
-                    pbones['shoulder_L'].location = ShoulderLoc
-                    pbones['shoulder_L'].scale = ShoulderScale
-                    refresh_hack()
-                    pbones['arm_fk_L'].matrix = ArmFkMat
-                    pbones['arm_fk_L'].location = ArmFkLoc
-                    pbones['arm_fk_L'].scale = ArmFkScale
-                    refresh_hack()
-                    pbones['forearm_fk_L'].matrix = ForearmFkMat
-                    pbones['forearm_fk_L'].location = ForearmFkLoc
-                    pbones['forearm_fk_L'].scale = ForearmFkScale
-                    refresh_hack()
-                    #Correct arm_fk twist
-                    pVisRotExec (pbones['arm_fk_L'], pbones['arm_rot_L'])
-                    refresh_hack()
-                    #Re-paste forearm matrix
-                    pbones['forearm_fk_L'].matrix = ForearmFkMat
-                    pbones['forearm_fk_L'].location = ForearmFkLoc
-                    pbones['forearm_fk_L'].scale = ForearmFkScale
-                    refresh_hack()
-
-                    #Insert Keyframes if Action present
-                    if anim_data:
-                        if anim_data.action:
-                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                                #Collect Local Transforms
-                                ArmCtrlRotEuler = pbones['arm_fk_ctrl_L'].rotation_euler.copy()
-                                ArmCtrlRotQuat = pbones['arm_fk_ctrl_L'].rotation_quaternion.copy()
-                                ArmCtrlLoc = pbones['arm_fk_ctrl_L'].location.copy()
-                                ArmCtrlScale = pbones['arm_fk_ctrl_L'].scale.copy()
-
-                                ShoulderRotEuler = pbones['shoulder_L'].rotation_euler.copy()
-                                ShoulderRotQuat = pbones['shoulder_L'].rotation_quaternion.copy()
-                                ShoulderLoc = pbones['shoulder_L'].location.copy()
-                                ShoulderScale = pbones['shoulder_L'].scale.copy()
-
-                                ArmFkRotEuler = pbones['arm_fk_L'].rotation_euler.copy()
-                                ArmFkRotQuat = pbones['arm_fk_L'].rotation_quaternion.copy()
-                                ArmFkLoc = pbones['arm_fk_L'].location.copy()
-                                ArmFkScale = pbones['arm_fk_L'].scale.copy()
-
-                                ForearmFkRotEuler = pbones['forearm_fk_L'].rotation_euler.copy()
-                                ForearmFkRotQuat = pbones['forearm_fk_L'].rotation_quaternion.copy()
-                                ForearmFkLoc = pbones['forearm_fk_L'].location.copy()
-                                ForearmFkScale = pbones['forearm_fk_L'].scale.copy()
-
-                                HandIkCtrlRotEuler = pbones['hand_ik_ctrl_L'].rotation_euler.copy()
-                                HandIkCtrlRotQuat = pbones['hand_ik_ctrl_L'].rotation_quaternion.copy()
-                                HandIkCtrlLoc = pbones['hand_ik_ctrl_L'].location.copy()
-                                HandIkCtrlScale = pbones['hand_ik_ctrl_L'].scale.copy()
-
-                                ArmIkRotEuler = pbones['arm_ik_L'].rotation_euler.copy()
-                                ArmIkRotQuat = pbones['arm_ik_L'].rotation_quaternion.copy()
-                                ArmIkLoc = pbones['arm_ik_L'].location.copy()
-                                ArmIkScale = pbones['arm_ik_L'].scale.copy()
-
-                                ElbowlLoc = pbones['elbow_pole_L'].location.copy()
-
-                                #Jump to next Frame
-                                bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
-
-                                #Key Property
-                                armobj.pose.bones["properties_arm_L"].pin_elbow_L = 0.0
-                                refresh_hack()
-                                pbones["properties_arm_L"].keyframe_insert(data_path='pin_elbow_L')
-
-                                #Re-Paste Transforms
-                                pbones['arm_fk_ctrl_L'].rotation_euler = ArmCtrlRotEuler
-                                pbones['arm_fk_ctrl_L'].rotation_quaternion = ArmCtrlRotQuat
-                                pbones['arm_fk_ctrl_L'].location = ArmCtrlLoc
-                                pbones['arm_fk_ctrl_L'].scale = ArmCtrlScale
-                                refresh_hack()
-                                pbones['shoulder_L'].rotation_euler = ShoulderRotEuler
-                                pbones['shoulder_L'].rotation_quaternion = ShoulderRotQuat
-                                pbones['shoulder_L'].location = ShoulderLoc
-                                pbones['shoulder_L'].scale = ShoulderScale
-                                refresh_hack()
-                                pbones['arm_fk_L'].rotation_euler = ArmFkRotEuler
-                                pbones['arm_fk_L'].rotation_quaternion = ArmFkRotQuat
-                                pbones['arm_fk_L'].location = ArmFkLoc
-                                pbones['arm_fk_L'].scale = ArmFkScale
-                                refresh_hack()
-                                pbones['forearm_fk_L'].rotation_euler = ForearmFkRotEuler
-                                pbones['forearm_fk_L'].rotation_quaternion = ForearmFkRotQuat
-                                pbones['forearm_fk_L'].location = ForearmFkLoc
-                                pbones['forearm_fk_L'].scale = ForearmFkScale
-                                refresh_hack()
-                                pbones['hand_ik_ctrl_L'].rotation_euler = HandIkCtrlRotEuler
-                                pbones['hand_ik_ctrl_L'].rotation_quaternion = HandIkCtrlRotQuat
-                                pbones['hand_ik_ctrl_L'].location = HandIkCtrlLoc
-                                pbones['hand_ik_ctrl_L'].scale = HandIkCtrlScale
-                                refresh_hack()
-                                pbones['elbow_pole_L'].location = ElbowlLoc
-                                refresh_hack()
-                                pbones['arm_ik_L'].rotation_euler = ArmIkRotEuler
-                                pbones['arm_ik_L'].rotation_quaternion = ArmIkRotQuat
-                                pbones['arm_ik_L'].location = ArmIkLoc
-                                pbones['arm_ik_L'].scale = ArmIkScale
-                                refresh_hack()
-
-                                insert_bkeys('master_torso', 'LocRotScale')
-                                insert_bkeys('pelvis_ctrl', 'LocRotScale')
-                                insert_bkeys('spine_1_fk', 'LocRotScale')
-                                insert_bkeys('spine_2_fk', 'LocRotScale')
-                                insert_bkeys('spine_3_fk', 'LocRotScale')
-                                insert_bkeys('spine_1_toon', 'LocRotScale')
-                                insert_bkeys('spine_2_toon', 'LocRotScale')
-                                insert_bkeys('spine_3_toon', 'LocRotScale')
-                                insert_bkeys('spine_4_toon', 'LocRotScale')
-                                insert_bkeys('torso_fk_ctrl_inv', 'LocRotScale')
-                                insert_bkeys('spine_3_fk_inv', 'LocRotScale')
-                                insert_bkeys('spine_2_fk_inv', 'LocRotScale')
-                                insert_bkeys('torso_fk_ctrl', 'LocRotScale')
-                                insert_bkeys('look', 'LocRotScale')
-                                insert_bkeys('elbow_pole_L', 'LocRotScale')
-                                insert_bkeys('elbow_pole_R', 'LocRotScale')
-                                insert_bkeys('knee_pole_L', 'LocRotScale')
-                                insert_bkeys('knee_pole_R', 'LocRotScale')
-                                insert_bkeys('arm_fk_L', 'LocRotScale')
-                                insert_bkeys('forearm_fk_L', 'LocRotScale')
-                                insert_bkeys('arm_ik_L', 'RotScale')
-                                insert_bkeys('forearm_ik_L', 'RotScale')
-                                insert_bkeys('arm_fk_ctrl_L', 'LocRotScale')
-                                insert_bkeys('shoulder_L', 'LocRotScale')
-                                insert_bkeys('hand_ik_ctrl_L', 'LocRotScale')
-                                insert_bkeys('hand_fk_L', 'LocRotScale')
-                                insert_bkeys('elbow_pin_L', 'LocRotScale')
-                                if pbones["properties_arm_L"].toggle_arm_ik_pole_L == 1.0:
-                                    insert_bkeys('elbow_pole_L', 'Loc')
-                                for prop in bpy.context.active_object.data.items():
-                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                                        insert_bkeys('carpal_ik_ctrl_L', 'LocRotScale')
-                                        insert_bkeys('carpal_fk_L', 'LocRotScale')
-                                        insert_bkeys('hand_fk_L', 'LocRotScale')
-
-                    #Switch Hand to Arm Space
-                    if armobj.pose.bones["properties_arm_L"].ik_arm_L < 0.1:
-                        if anim_data:
-                            if anim_data.action:
-                                if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                                    #Jump to previous Frame
-                                    bpy.context.scene.frame_set (bpy.context.scene.frame_current - 1)
-
-                        #Switch Hand to Free Space
-                        bpy.ops.switch.hand_space_l(space='Free')
-
-        return {"FINISHED"}
-
-##### Knee_L Pin #####
-
-class Operator_Knee_Pin_L(bpy.types.Operator):
-
-    bl_idname = "pin.knee_l"
-    bl_label = "BlenRig Pin Knee_L"
-    bl_description = "Pin Knee_L"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
-
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
-
-    def execute(self, context):
-
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        anim_data = armobj.animation_data
-
-        #Biped
-        for prop in bpy.context.active_object.data.items():
-            if prop[0] == 'rig_type' and prop[1] == 'Biped':
-
-        #### Pin ####
-                if armobj.pose.bones["properties_leg_L"].pin_knee_L < 0.1:
-
-                    #Collect Matrix
-                    ThighFkMat = pbones['thigh_fk_L'].matrix.copy()
-                    ThighFkLoc = pbones['thigh_fk_L'].location.copy()
-                    ThighFkScale = pbones['thigh_fk_L'].scale.copy()
-                    ShinFkMat = pbones['shin_fk_L'].matrix.copy()
-                    ShinFkLoc = pbones['shin_fk_L'].location.copy()
-                    ShinFkScale = pbones['shin_fk_L'].scale.copy()
-                    TorsoMat = pbones['master_torso'].matrix.copy()
-                    TorsoLoc = pbones['master_torso'].location.copy()
-                    TorsoScale = pbones['master_torso'].scale.copy()
-                    PelvisMat = pbones['pelvis_ctrl'].matrix.copy()
-                    PelvisLoc = pbones['pelvis_ctrl'].location.copy()
-                    PelvisScale = pbones['pelvis_ctrl'].scale.copy()
-                    FootFkMat = pbones['foot_fk_L'].matrix.copy()
-                    FootFkLoc = pbones['foot_fk_L'].location.copy()
-                    FootFkScale = pbones['foot_fk_L'].scale.copy()
-                    FootToe1FkMat = pbones['foot_toe_1_fk_L'].matrix.copy()
-                    FootToe1FkLoc = pbones['foot_toe_1_fk_L'].location.copy()
-                    FootToe1FkScale = pbones['foot_toe_1_fk_L'].scale.copy()
-                    FootToe2FkMat = pbones['foot_toe_2_fk_L'].matrix.copy()
-                    FootToe2FkLoc = pbones['foot_toe_2_fk_L'].location.copy()
-                    FootToe2FkScale = pbones['foot_toe_2_fk_L'].scale.copy()
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                            TarsalFkMat = pbones['tarsal_fk_L'].matrix.copy()
-                            TarsalFkLoc = pbones['tarsal_fk_L'].location.copy()
-                            TarsalFkScale = pbones['tarsal_fk_L'].scale.copy()
-
-                    #Insert Keyframes if Action present
-                    if anim_data:
-                        if anim_data.action:
-                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                                pbones["properties_leg_L"].keyframe_insert(data_path='pin_knee_L')
-                                insert_bkeys('master_torso', 'LocRotScale')
-                                insert_bkeys('pelvis_ctrl', 'LocRotScale')
-                                insert_bkeys('spine_1_fk', 'LocRotScale')
-                                insert_bkeys('spine_2_fk', 'LocRotScale')
-                                insert_bkeys('spine_3_fk', 'LocRotScale')
-                                insert_bkeys('spine_1_toon', 'LocRotScale')
-                                insert_bkeys('spine_2_toon', 'LocRotScale')
-                                insert_bkeys('spine_3_toon', 'LocRotScale')
-                                insert_bkeys('spine_4_toon', 'LocRotScale')
-                                insert_bkeys('torso_fk_ctrl_inv', 'LocRotScale')
-                                insert_bkeys('spine_3_fk_inv', 'LocRotScale')
-                                insert_bkeys('spine_2_fk_inv', 'LocRotScale')
-                                insert_bkeys('torso_fk_ctrl', 'LocRotScale')
-                                insert_bkeys('look', 'LocRotScale')
-                                insert_bkeys('elbow_pole_L', 'LocRotScale')
-                                insert_bkeys('elbow_pole_R', 'LocRotScale')
-                                insert_bkeys('knee_pole_L', 'LocRotScale')
-                                insert_bkeys('knee_pole_R', 'LocRotScale')
-                                insert_bkeys('thigh_fk_L', 'LocRotScale')
-                                insert_bkeys('shin_fk_L', 'LocRotScale')
-                                insert_bkeys('thigh_fk_ctrl_L', 'LocRotScale')
-                                insert_bkeys('foot_fk_L', 'LocRotScale')
-                                insert_bkeys('foot_toe_1_fk_L', 'LocRotScale')
-                                insert_bkeys('foot_toe_2_fk_L', 'LocRotScale')
-                                insert_bkeys('thigh_ik_L', 'RotScale')
-                                insert_bkeys('shin_ik_L', 'RotScale')
-                                insert_bkeys('foot_ik_ctrl_L', 'LocRotScale')
-                                insert_bkeys('foot_toe_ik_ctrl_mid_L', 'LocRotScale')
-                                insert_bkeys('foot_toe_ik_ctrl_L', 'LocRotScale')
-                                insert_bkeys('foot_roll_ctrl_L', 'Rot')
-                                insert_bkeys('toe_roll_1_L', 'Rot')
-                                insert_bkeys('toe_roll_2_L', 'Rot')
-                                insert_bkeys('sole_ctrl_L', 'LocRotScale')
-                                insert_bkeys('knee_pin_L', 'LocRotScale')
-                                if pbones["properties_leg_L"].toggle_leg_ik_pole_L == 1.0:
-                                    insert_bkeys('knee_pole_L', 'Loc')
-                                for prop in bpy.context.active_object.data.items():
-                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                                        insert_bkeys('tarsal_fk_L', 'LocRotScale')
-                                        insert_bkeys('tarsal_ik_ctrl_L', 'LocRotScale')
-
-                    #Paste Matrix
-                    pVisLocExec(pbones['knee_pin_L'], pbones['snap_knee_pin_L'])
-                    pVisRotExec(pbones['knee_pin_L'], pbones['snap_knee_pin_L'])
-                    pVisScaExec(pbones['knee_pin_L'], pbones['snap_knee_pin_L'])
-                    refresh_hack()
-                    pVisLocExec(pbones['sole_ctrl_L'], pbones['snap_sole_ctrl_fk_L'])
-                    pVisRotExec(pbones['sole_ctrl_L'], pbones['snap_sole_ctrl_fk_L'])
-                    refresh_hack()
-                    pbones['foot_roll_ctrl_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    pbones['foot_ik_ctrl_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    pbones['foot_ik_ctrl_L'].location[:] = (0.0, 0.0, 0.0)
-                    pbones['toe_roll_1_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    pbones['toe_roll_2_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    pbones['foot_toe_ik_ctrl_mid_L'].location[:] = (0.0, 0.0, 0.0)
-                    pbones['foot_toe_ik_ctrl_mid_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    pbones['foot_toe_ik_ctrl_L'].location[:] = (0.0, 0.0, 0.0)
-                    pbones['foot_toe_ik_ctrl_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
-
-                    armobj.pose.bones["properties_leg_L"].pin_knee_L = 1.0
-                    refresh_hack()
-
-                    pbones['master_torso'].matrix = TorsoMat
-                    refresh_hack()
-                    pbones['pelvis_ctrl'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    pbones['pelvis_ctrl'].location[:] = (0.0, 0.0, 0.0)
-                    refresh_hack()
-                    pbones['thigh_fk_L'].matrix = ThighFkMat
-                    pbones['thigh_fk_L'].location = ThighFkLoc
-                    pbones['thigh_fk_L'].scale = ThighFkScale
-                    refresh_hack()
-                    pbones['shin_fk_L'].matrix = ShinFkMat
-                    pbones['shin_fk_L'].location = ShinFkLoc
-                    pbones['shin_fk_L'].scale = ShinFkScale
-                    pbones['foot_fk_L'].matrix = FootFkMat
-                    pbones['foot_fk_L'].location = FootFkLoc
-                    pbones['foot_fk_L'].scale = FootFkScale
-                    refresh_hack()
-                    pbones['foot_toe_1_fk_L'].matrix = FootToe1FkMat
-                    pbones['foot_toe_1_fk_L'].location = FootToe1FkLoc
-                    pbones['foot_toe_1_fk_L'].scale = FootToe1FkScale
-                    refresh_hack()
-                    pbones['foot_toe_2_fk_L'].matrix = FootToe2FkMat
-                    pbones['foot_toe_2_fk_L'].location = FootToe2FkLoc
-                    pbones['foot_toe_2_fk_L'].scale = FootToe2FkScale
-                    refresh_hack()
-
-
-
-                    #Insert Keyframes if Action present
-                    if anim_data:
-                        if anim_data.action:
-                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                                #Collect Local Transforms
-                                KneePinRotEuler = pbones['knee_pin_L'].rotation_euler.copy()
-                                KneePinRotQuat = pbones['knee_pin_L'].rotation_quaternion.copy()
-                                KneePinLoc = pbones['knee_pin_L'].location.copy()
-                                KneePinScale = pbones['knee_pin_L'].scale.copy()
-
-                                MasterTorsoRotEuler = pbones['master_torso'].rotation_euler.copy()
-                                MasterTorsoRotQuat = pbones['master_torso'].rotation_quaternion.copy()
-                                MasterTorsoLoc = pbones['master_torso'].location.copy()
-                                MasterTorsoScale = pbones['master_torso'].scale.copy()
-
-                                SoleCtrlRotEuler = pbones['sole_ctrl_L'].rotation_euler.copy()
-                                SoleCtrlRotQuat = pbones['sole_ctrl_L'].rotation_quaternion.copy()
-                                SoleCtrlLoc = pbones['sole_ctrl_L'].location.copy()
-                                SoleCtrlScale = pbones['sole_ctrl_L'].scale.copy()
-
-                                KneePoleRotEuler = pbones['knee_pole_L'].rotation_euler.copy()
-                                KneePoleRotQuat = pbones['knee_pole_L'].rotation_quaternion.copy()
-                                KneePoleLoc = pbones['knee_pole_L'].location.copy()
-                                KneePoleScale = pbones['knee_pole_L'].scale.copy()
-
-                                ThighIkRotEuler = pbones['thigh_ik_L'].rotation_euler.copy()
-                                ThighIkRotQuat = pbones['thigh_ik_L'].rotation_quaternion.copy()
-                                ThighIkLoc = pbones['thigh_ik_L'].location.copy()
-                                ThighIkScale = pbones['thigh_ik_L'].scale.copy()
-
-                                ThighFkRotEuler = pbones['thigh_fk_L'].rotation_euler.copy()
-                                ThighFkRotQuat = pbones['thigh_fk_L'].rotation_quaternion.copy()
-                                ThighFkLoc = pbones['thigh_fk_L'].location.copy()
-                                ThighFkScale = pbones['thigh_fk_L'].scale.copy()
-
-                                ShinFkRotEuler = pbones['shin_fk_L'].rotation_euler.copy()
-                                ShinFkRotQuat = pbones['shin_fk_L'].rotation_quaternion.copy()
-                                ShinFkLoc = pbones['shin_fk_L'].location.copy()
-                                ShinFkScale = pbones['shin_fk_L'].scale.copy()
-                                FootFkRotEuler = pbones['foot_fk_L'].rotation_euler.copy()
-                                FootFkRotQuat = pbones['foot_fk_L'].rotation_quaternion.copy()
-                                FootFkLoc = pbones['foot_fk_L'].location.copy()
-                                FootFkScale = pbones['foot_fk_L'].scale.copy()
-
-                                for prop in bpy.context.active_object.data.items():
-                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                                        TarsalFkRotEuler = pbones['tarsal_fk_L'].rotation_euler.copy()
-                                        TarsalFkRotQuat = pbones['tarsal_fk_L'].rotation_quaternion.copy()
-                                        TarsalFkLoc = pbones['tarsal_fk_L'].location.copy()
-                                        TarsalFkScale = pbones['tarsal_fk_L'].scale.copy()
-                                        TarsalIkRotEuler = pbones['tarsal_ik_ctrl_L'].rotation_euler.copy()
-                                        TarsalIkRotQuat = pbones['tarsal_ik_ctrl_L'].rotation_quaternion.copy()
-                                        TarsaIFkLoc = pbones['tarsal_ik_ctrl_L'].location.copy()
-                                        TarsalIkScale = pbones['tarsal_ik_ctrl_L'].scale.copy()
-
-                                FootToe1FkRotEuler = pbones['foot_toe_1_fk_L'].rotation_euler.copy()
-                                FootToe1FkRotQuat = pbones['foot_toe_1_fk_L'].rotation_quaternion.copy()
-                                FootToe1FkLoc = pbones['foot_toe_1_fk_L'].location.copy()
-                                FootToe1FkScale = pbones['foot_toe_1_fk_L'].scale.copy()
-
-                                FootToe2FkRotEuler = pbones['foot_toe_2_fk_L'].rotation_euler.copy()
-                                FootToe2FkRotQuat = pbones['foot_toe_2_fk_L'].rotation_quaternion.copy()
-                                FootToe2FkLoc = pbones['foot_toe_2_fk_L'].location.copy()
-                                FootToe2FkScale = pbones['foot_toe_2_fk_L'].scale.copy()
-
-                                #Jump to next Frame
-                                bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
-
-                                #Key Property
-                                armobj.pose.bones["properties_leg_L"].pin_knee_L = 1.0
-                                refresh_hack()
-                                pbones["properties_leg_L"].keyframe_insert(data_path='pin_knee_L')
-
-                                #Re-Paste Transforms
-                                pbones['master_torso'].rotation_euler = MasterTorsoRotEuler
-                                pbones['master_torso'].rotation_quaternion = MasterTorsoRotQuat
-                                pbones['master_torso'].location = MasterTorsoLoc
-                                pbones['master_torso'].scale = MasterTorsoScale
-                                refresh_hack()
-                                pbones['pelvis_ctrl'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                                pbones['pelvis_ctrl'].location[:] = (0.0, 0.0, 0.0)
-                                refresh_hack()
-                                pbones['knee_pin_L'].rotation_euler = KneePinRotEuler
-                                pbones['knee_pin_L'].rotation_quaternion = KneePinRotQuat
-                                pbones['knee_pin_L'].location = KneePinLoc
-                                pbones['knee_pin_L'].scale = KneePinScale
-                                refresh_hack()
-                                pbones['sole_ctrl_L'].rotation_euler = SoleCtrlRotEuler
-                                pbones['sole_ctrl_L'].rotation_quaternion = SoleCtrlRotQuat
-                                pbones['sole_ctrl_L'].location = SoleCtrlLoc
-                                pbones['sole_ctrl_L'].scale = SoleCtrlScale
-                                refresh_hack()
-                                pbones['knee_pole_L'].rotation_euler = KneePoleRotEuler
-                                pbones['knee_pole_L'].rotation_quaternion = KneePoleRotQuat
-                                pbones['knee_pole_L'].location = KneePoleLoc
-                                pbones['knee_pole_L'].scale = KneePoleScale
-                                refresh_hack()
-                                pbones['thigh_ik_L'].rotation_euler = ThighIkRotEuler
-                                pbones['thigh_ik_L'].rotation_quaternion = ThighIkRotQuat
-                                pbones['thigh_ik_L'].location = ThighIkLoc
-                                pbones['thigh_ik_L'].scale = ThighIkScale
-                                refresh_hack()
-                                pbones['thigh_fk_L'].rotation_euler = ThighFkRotEuler
-                                pbones['thigh_fk_L'].rotation_quaternion = ThighFkRotQuat
-                                pbones['thigh_fk_L'].location = ThighFkLoc
-                                pbones['thigh_fk_L'].scale = ThighFkScale
-                                refresh_hack()
-                                pbones['shin_fk_L'].rotation_euler = ShinFkRotEuler
-                                pbones['shin_fk_L'].rotation_quaternion = ShinFkRotQuat
-                                pbones['shin_fk_L'].location = ShinFkLoc
-                                pbones['shin_fk_L'].scale = ShinFkScale
-                                refresh_hack()
-                                pbones['foot_fk_L'].rotation_euler = FootFkRotEuler
-                                pbones['foot_fk_L'].rotation_quaternion = FootFkRotQuat
-                                pbones['foot_fk_L'].location = FootFkLoc
-                                pbones['foot_fk_L'].scale = FootFkScale
-                                refresh_hack()
-                                for prop in bpy.context.active_object.data.items():
-                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                                        pbones['tarsal_ik_ctrl_L'].rotation_euler = TarsalIkRotEuler
-                                        pbones['tarsal_ik_ctrl_L'].rotation_quaternion = TarsalIkRotQuat
-                                        pbones['tarsal_ik_ctrl_L'].location = TarsaIFkLoc
-                                        pbones['tarsal_ik_ctrl_L'].scale = TarsalIkScale
-                                        refresh_hack()
-                                        pbones['tarsal_fk_L'].rotation_euler = TarsalFkRotEuler
-                                        pbones['tarsal_fk_L'].rotation_quaternion = TarsalFkRotQuat
-                                        pbones['tarsal_fk_L'].location = TarsalFkLoc
-                                        pbones['tarsal_fk_L'].scale = TarsalFkScale
-                                        refresh_hack()
-                                pbones['foot_toe_1_fk_L'].rotation_euler = FootToe1FkRotEuler
-                                pbones['foot_toe_1_fk_L'].rotation_quaternion = FootToe1FkRotQuat
-                                pbones['foot_toe_1_fk_L'].location = FootToe1FkLoc
-                                pbones['foot_toe_1_fk_L'].scale = FootToe1FkScale
-                                refresh_hack()
-                                pbones['foot_toe_2_fk_L'].rotation_euler = FootToe2FkRotEuler
-                                pbones['foot_toe_2_fk_L'].rotation_quaternion = FootToe2FkRotQuat
-                                pbones['foot_toe_2_fk_L'].location = FootToe2FkLoc
-                                pbones['foot_toe_2_fk_L'].scale = FootToe2FkScale
-                                refresh_hack()
-                                pbones['foot_roll_ctrl_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                                pbones['foot_ik_ctrl_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                                pbones['foot_ik_ctrl_L'].location[:] = (0.0, 0.0, 0.0)
-                                pbones['toe_roll_1_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                                pbones['toe_roll_2_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                                pbones['foot_toe_ik_ctrl_mid_L'].location[:] = (0.0, 0.0, 0.0)
-                                pbones['foot_toe_ik_ctrl_mid_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                                pbones['foot_toe_ik_ctrl_L'].location[:] = (0.0, 0.0, 0.0)
-                                pbones['foot_toe_ik_ctrl_L'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                                refresh_hack()
-
-                                insert_bkeys('master_torso', 'LocRotScale')
-                                insert_bkeys('pelvis_ctrl', 'LocRotScale')
-                                insert_bkeys('spine_1_fk', 'LocRotScale')
-                                insert_bkeys('spine_2_fk', 'LocRotScale')
-                                insert_bkeys('spine_3_fk', 'LocRotScale')
-                                insert_bkeys('spine_1_toon', 'LocRotScale')
-                                insert_bkeys('spine_2_toon', 'LocRotScale')
-                                insert_bkeys('spine_3_toon', 'LocRotScale')
-                                insert_bkeys('spine_4_toon', 'LocRotScale')
-                                insert_bkeys('torso_fk_ctrl_inv', 'LocRotScale')
-                                insert_bkeys('spine_3_fk_inv', 'LocRotScale')
-                                insert_bkeys('spine_2_fk_inv', 'LocRotScale')
-                                insert_bkeys('torso_fk_ctrl', 'LocRotScale')
-                                insert_bkeys('look', 'LocRotScale')
-                                insert_bkeys('elbow_pole_L', 'LocRotScale')
-                                insert_bkeys('elbow_pole_R', 'LocRotScale')
-                                insert_bkeys('knee_pole_L', 'LocRotScale')
-                                insert_bkeys('knee_pole_R', 'LocRotScale')
-                                insert_bkeys('thigh_fk_L', 'LocRotScale')
-                                insert_bkeys('shin_fk_L', 'LocRotScale')
-                                insert_bkeys('thigh_fk_ctrl_L', 'LocRotScale')
-                                insert_bkeys('foot_fk_L', 'LocRotScale')
-                                insert_bkeys('foot_toe_1_fk_L', 'LocRotScale')
-                                insert_bkeys('foot_toe_2_fk_L', 'LocRotScale')
-                                insert_bkeys('thigh_ik_L', 'RotScale')
-                                insert_bkeys('shin_ik_L', 'RotScale')
-                                insert_bkeys('foot_ik_ctrl_L', 'LocRotScale')
-                                insert_bkeys('foot_toe_ik_ctrl_mid_L', 'LocRotScale')
-                                insert_bkeys('foot_toe_ik_ctrl_L', 'LocRotScale')
-                                insert_bkeys('foot_roll_ctrl_L', 'Rot')
-                                insert_bkeys('toe_roll_1_L', 'Rot')
-                                insert_bkeys('toe_roll_2_L', 'Rot')
-                                insert_bkeys('sole_ctrl_L', 'LocRotScale')
-                                insert_bkeys('knee_pin_L', 'LocRotScale')
-                                if pbones["properties_leg_L"].toggle_leg_ik_pole_L == 1.0:
-                                    insert_bkeys('knee_pole_L', 'Loc')
-                                for prop in bpy.context.active_object.data.items():
-                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                                        insert_bkeys('tarsal_fk_L', 'LocRotScale')
-                                        insert_bkeys('tarsal_ik_ctrl_L', 'LocRotScale')
-
-        return {"FINISHED"}
-
-##### Knee_L UnPin #####
-
-class Operator_Knee_UnPin_L(bpy.types.Operator):
-
-    bl_idname = "unpin.knee_l"
-    bl_label = "BlenRig UnPin Knee_L"
-    bl_description = "UnPin Knee_L"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
-
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
-
-    def execute(self, context):
-
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        anim_data = armobj.animation_data
-
-        #Biped
-        for prop in bpy.context.active_object.data.items():
-            if prop[0] == 'rig_type' and prop[1] == 'Biped':
-
-                if armobj.pose.bones["properties_leg_L"].pin_knee_L > 0.9:
-
-                    #Collect Matrix
-                    MasterTorsoMat = pbones['master_torso'].matrix.copy()
-                    MasterTorsoLoc = pbones['master_torso'].location.copy()
-                    MasterTorsoScale = pbones['master_torso'].scale.copy()
-                    PelvisMat = pbones['pelvis_ctrl'].matrix.copy()
-                    PelvisLoc = pbones['pelvis_ctrl'].location.copy()
-                    PelvisScale = pbones['pelvis_ctrl'].scale.copy()
-                    Spine1FKMat = pbones['spine_1_fk'].matrix.copy()
-                    Spine1FKLoc = pbones['spine_1_fk'].location.copy()
-                    Spine1FKScale = pbones['spine_1_fk'].scale.copy()
-                    Spine2FKMat = pbones['spine_2_fk'].matrix.copy()
-                    Spine2FKLoc = pbones['spine_2_fk'].location.copy()
-                    Spine2FKScale = pbones['spine_2_fk'].scale.copy()
-                    Spine3FKMat = pbones['spine_3_fk'].matrix.copy()
-                    Spine3FKLoc = pbones['spine_3_fk'].location.copy()
-                    Spine3FKScale = pbones['spine_3_fk'].scale.copy()
-                    Spine1ToonMat = pbones['spine_1_toon'].matrix.copy()
-                    Spine1ToonLoc = pbones['spine_1_toon'].location.copy()
-                    Spine1ToonScale = pbones['spine_1_toon'].scale.copy()
-                    Spine2ToonMat = pbones['spine_2_toon'].matrix.copy()
-                    Spine2ToonLoc = pbones['spine_2_toon'].location.copy()
-                    Spine2ToonScale = pbones['spine_2_toon'].scale.copy()
-                    Spine3ToonMat = pbones['spine_3_toon'].matrix.copy()
-                    Spine3ToonLoc = pbones['spine_3_toon'].location.copy()
-                    Spine3ToonScale = pbones['spine_3_toon'].scale.copy()
-                    Spine4ToonMat = pbones['spine_4_toon'].matrix.copy()
-                    Spine4ToonLoc = pbones['spine_4_toon'].location.copy()
-                    Spine4ToonScale = pbones['spine_4_toon'].scale.copy()
-                    Look_world_mat = pbones['look'].id_data.matrix_world.copy()
-                    Look_mat = pbones['look'].matrix.copy()
-                    ElbowLMat = pbones['elbow_pole_L'].matrix.copy()
-                    ElbowRMat = pbones['elbow_pole_R'].matrix.copy()
-                    KneeLMat = pbones['knee_pole_L'].matrix.copy()
-                    KneeRMat = pbones['knee_pole_R'].matrix.copy()
-                    ThighFkMat = pbones['thigh_fk_L'].matrix.copy()
-                    ThighFkLoc = pbones['thigh_fk_L'].location.copy()
-                    ThighFkScale = pbones['thigh_fk_L'].scale.copy()
-                    ShinFkMat = pbones['shin_fk_L'].matrix.copy()
-                    ShinFkLoc = pbones['shin_fk_L'].location.copy()
-                    ShinFkScale = pbones['shin_fk_L'].scale.copy()
-                    SoleCtrlMat = pbones['sole_ctrl_L'].matrix.copy()
-                    SoleCtrlLoc = pbones['sole_ctrl_L'].location.copy()
-                    SoleCtrlScale = pbones['sole_ctrl_L'].scale.copy()
-                    FootFKMat = pbones['foot_fk_L'].matrix.copy()
-                    FootFKLoc = pbones['foot_fk_L'].location.copy()
-                    FootFkScale = pbones['foot_fk_L'].scale.copy()
-
-                    #Insert Keyframes if Action present
-                    if anim_data:
-                        if anim_data.action:
-                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                                pbones["properties_leg_L"].keyframe_insert(data_path='pin_knee_L')
-                                insert_bkeys('master_torso', 'LocRotScale')
-                                insert_bkeys('pelvis_ctrl', 'LocRotScale')
-                                insert_bkeys('spine_1_fk', 'LocRotScale')
-                                insert_bkeys('spine_2_fk', 'LocRotScale')
-                                insert_bkeys('spine_3_fk', 'LocRotScale')
-                                insert_bkeys('spine_1_toon', 'LocRotScale')
-                                insert_bkeys('spine_2_toon', 'LocRotScale')
-                                insert_bkeys('spine_3_toon', 'LocRotScale')
-                                insert_bkeys('spine_4_toon', 'LocRotScale')
-                                insert_bkeys('torso_fk_ctrl_inv', 'LocRotScale')
-                                insert_bkeys('spine_3_fk_inv', 'LocRotScale')
-                                insert_bkeys('spine_2_fk_inv', 'LocRotScale')
-                                insert_bkeys('torso_fk_ctrl', 'LocRotScale')
-                                insert_bkeys('look', 'LocRotScale')
-                                insert_bkeys('elbow_pole_L', 'LocRotScale')
-                                insert_bkeys('elbow_pole_R', 'LocRotScale')
-                                insert_bkeys('knee_pole_L', 'LocRotScale')
-                                insert_bkeys('knee_pole_R', 'LocRotScale')
-                                insert_bkeys('thigh_fk_L', 'LocRotScale')
-                                insert_bkeys('shin_fk_L', 'LocRotScale')
-                                insert_bkeys('thigh_fk_ctrl_L', 'LocRotScale')
-                                insert_bkeys('foot_fk_L', 'LocRotScale')
-                                insert_bkeys('foot_toe_1_fk_L', 'LocRotScale')
-                                insert_bkeys('foot_toe_2_fk_L', 'LocRotScale')
-                                insert_bkeys('thigh_ik_L', 'RotScale')
-                                insert_bkeys('shin_ik_L', 'RotScale')
-                                insert_bkeys('foot_ik_ctrl_L', 'LocRotScale')
-                                insert_bkeys('foot_toe_ik_ctrl_mid_L', 'LocRotScale')
-                                insert_bkeys('foot_toe_ik_ctrl_L', 'LocRotScale')
-                                insert_bkeys('foot_roll_ctrl_L', 'Rot')
-                                insert_bkeys('toe_roll_1_L', 'Rot')
-                                insert_bkeys('toe_roll_2_L', 'Rot')
-                                insert_bkeys('sole_ctrl_L', 'LocRotScale')
-                                insert_bkeys('knee_pin_L', 'LocRotScale')
-                                if pbones["properties_leg_L"].toggle_leg_ik_pole_L == 1.0:
-                                    insert_bkeys('knee_pole_L', 'Loc')
-                                for prop in bpy.context.active_object.data.items():
-                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                                        insert_bkeys('tarsal_fk_L', 'LocRotScale')
-                                        insert_bkeys('tarsal_ik_ctrl_L', 'LocRotScale')
-
-                    #Collect Current Pose and save new Matrix
-                    pVisLocExec (pbones['spine_1_fk'], pbones['spine_1_def'])
-                    pVisRotExec (pbones['spine_1_fk'], pbones['spine_1_def'])
-                    refresh_hack()
-                    Spine1FKMat2 = pbones['spine_1_fk'].matrix.copy()
-                    refresh_hack()
-                    pbones['spine_1_fk'].matrix = Spine1FKMat
-                    refresh_hack()
-                    pVisLocExec (pbones['spine_2_fk'], pbones['spine_2_def'])
-                    pVisRotExec (pbones['spine_2_fk'], pbones['spine_2_def'])
-                    refresh_hack()
-                    Spine2FKMat2 = pbones['spine_2_fk'].matrix.copy()
-                    refresh_hack()
-                    pbones['spine_2_fk'].matrix = Spine2FKMat
-                    refresh_hack()
-                    pVisLocExec (pbones['spine_3_fk'], pbones['spine_3_def'])
-                    pVisRotExec (pbones['spine_3_fk'], pbones['spine_3_def'])
-                    refresh_hack()
-                    Spine3FKMat2 = pbones['spine_3_fk'].matrix.copy()
-                    refresh_hack()
-                    pbones['spine_3_fk'].matrix = Spine3FKMat
-                    refresh_hack()
-
-                    #Paste Matrix
-                    pVisLocExec(pbones['master_torso'], pbones['snap_master_torso'])
-                    pVisRotExec (pbones['master_torso'], pbones['snap_master_torso'])
-                    refresh_hack()
-                    pVisLocExec(pbones['sole_ctrl_L'], pbones['snap_sole_ctrl_fk_L'])
-                    pVisRotExec (pbones['sole_ctrl_L'], pbones['snap_sole_ctrl_fk_L'])
-                    refresh_hack()
-                    pVisLocExec(pbones['knee_pole_L'], pbones['snap_knee_pole_fk_L'])
-                    refresh_hack()
-                    pVisRotExec (pbones['thigh_ik_L'], pbones['thigh_rot_L'])
-                    refresh_hack()
-                    pVisRotExec (pbones['thigh_fk_ctrl_L'], pbones['thigh_fk_L'])
-                    pbones['thigh_fk_ctrl_L'].scale[:] = (1.0, 1.0, 1.0)
-                    refresh_hack()
-
-                    bpy.context.active_object.pose.bones["properties_leg_L"].pin_knee_L = 0.0
-                    refresh_hack()
-                    #Align Spine
-                    pbones['torso_fk_ctrl_inv'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    pbones['torso_fk_ctrl_inv'].rotation_quaternion[:] = (1.0,0.0, 0.0, 0.0)
-                    pbones['torso_fk_ctrl_inv'].location[:] = (0.0, 0.0, 0.0)
-                    pbones['torso_fk_ctrl_inv'].scale[:] = (1.0, 1.0, 1.0)
-                    refresh_hack()
-                    pbones['spine_3_fk_inv'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    pbones['spine_3_fk_inv'].rotation_quaternion[:] = (1.0,0.0, 0.0, 0.0)
-                    pbones['spine_3_fk_inv'].location[:] = (0.0, 0.0, 0.0)
-                    pbones['spine_3_fk_inv'].scale[:] = (1.0, 1.0, 1.0)
-                    refresh_hack()
-                    pbones['spine_2_fk_inv'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    pbones['spine_2_fk_inv'].rotation_quaternion[:] = (1.0,0.0, 0.0, 0.0)
-                    pbones['spine_2_fk_inv'].location[:] = (0.0, 0.0, 0.0)
-                    pbones['spine_2_fk_inv'].scale[:] = (1.0, 1.0, 1.0)
-                    refresh_hack()
-                    pbones['pelvis_ctrl'].matrix = PelvisMat
-                    refresh_hack()
-                    pbones['spine_1_fk'].matrix = Spine1FKMat2
-                    refresh_hack()
-                    pbones['spine_2_fk'].matrix = Spine2FKMat2
-                    refresh_hack()
-                    pbones['spine_3_fk'].matrix = Spine3FKMat2
-                    refresh_hack()
-                    pbones['spine_1_toon'].matrix = Spine1ToonMat
-                    pbones['spine_1_toon'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    refresh_hack()
-                    pbones['spine_2_toon'].matrix = Spine2ToonMat
-                    pbones['spine_2_toon'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    refresh_hack()
-                    pbones['spine_3_toon'].matrix = Spine3ToonMat
-                    pbones['spine_3_toon'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    refresh_hack()
-                    pbones['spine_4_toon'].matrix = Spine4ToonMat
-                    pbones['spine_4_toon'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    refresh_hack()
-                    pbones['elbow_pole_L'].matrix = ElbowLMat
-                    refresh_hack()
-                    pbones['elbow_pole_R'].matrix = ElbowRMat
-                    refresh_hack()
-                    #Leg
-                    pbones['thigh_fk_L'].matrix = ThighFkMat
-                    refresh_hack()
-                    pbones['shin_fk_L'].matrix = ShinFkMat
-                    refresh_hack()
-                    #Correct thigh_fk twist
-                    pVisRotExec (pbones['thigh_fk_L'], pbones['thigh_rot_L'])
-                    refresh_hack()
-                    #Re-paste shin matrix
-                    pbones['shin_fk_L'].matrix = ShinFkMat
-                    pbones['shin_fk_L'].location = ShinFkLoc
-                    pbones['shin_fk_L'].scale = ShinFkScale
-                    refresh_hack()
-                    pbones['foot_fk_L'].matrix = FootFKMat
-                    pbones['foot_fk_L'].location = FootFKLoc
-                    pbones['foot_fk_L'].scale = FootFkScale
-                    refresh_hack()
-                    if bpy.context.active_object.pose.bones["properties_head"].look_switch == 0.0:
-                        paste_visual_matrix('look', 'look_free', Look_world_mat, Look_mat, 'Location')
-                        paste_visual_matrix('look', 'look_free', Look_world_mat, Look_mat, 'Rotation')
-                    if bpy.context.active_object.pose.bones["properties_head"].look_switch == 1.0:
-                        paste_visual_matrix('look', 'master_body_pivot', Look_world_mat, Look_mat, 'Location')
-                        paste_visual_matrix('look', 'master_body_pivot', Look_world_mat, Look_mat, 'Rotation')
-                    if bpy.context.active_object.pose.bones["properties_head"].look_switch == 2.0:
-                        paste_visual_matrix('look', 'master_torso_pivot', Look_world_mat, Look_mat, 'Location')
-                        paste_visual_matrix('look', 'master_torso_pivot', Look_world_mat, Look_mat, 'Rotation')
-                    if bpy.context.active_object.pose.bones["properties_head"].look_switch == 3.0:
-                        paste_visual_matrix('look', 'head_fk', Look_world_mat, Look_mat, 'Location')
-                        paste_visual_matrix('look', 'head_fk', Look_world_mat, Look_mat, 'Rotation')
-                    refresh_hack()
-                    #Insert Keyframes if Action present
-                    if anim_data:
-                        if anim_data.action:
-                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                                #Collect Local Transforms
-                                MasterTorsoRotEuler = pbones['master_torso'].rotation_euler.copy()
-                                MasterTorsoLoc = pbones['master_torso'].location.copy()
-                                MasterTorsoScale = pbones['master_torso'].scale.copy()
-
-                                PelvisRotEuler = pbones['pelvis_ctrl'].rotation_euler.copy()
-                                PelvisLoc = pbones['pelvis_ctrl'].location.copy()
-                                PelvisScale = pbones['pelvis_ctrl'].scale.copy()
-
-                                Spine1FKRotEuler = pbones['spine_1_fk'].rotation_euler.copy()
-                                Spine1FKLoc = pbones['spine_1_fk'].location.copy()
-                                Spine1FKScale = pbones['spine_1_fk'].scale.copy()
-
-                                Spine2FKRotEuler = pbones['spine_2_fk'].rotation_euler.copy()
-                                Spine2FKLoc = pbones['spine_2_fk'].location.copy()
-                                Spine2FKScale = pbones['spine_2_fk'].scale.copy()
-
-                                Spine3FKRotEuler = pbones['spine_3_fk'].rotation_euler.copy()
-                                Spine3FKLoc = pbones['spine_3_fk'].location.copy()
-                                Spine3FKScale = pbones['spine_3_fk'].scale.copy()
-
-                                Spine1ToonRotEuler = pbones['spine_1_toon'].rotation_euler.copy()
-                                Spine1ToonLoc = pbones['spine_1_toon'].location.copy()
-                                Spine1ToonScale = pbones['spine_1_toon'].scale.copy()
-
-                                Spine2ToonRotEuler = pbones['spine_2_toon'].rotation_euler.copy()
-                                Spine2ToonLoc = pbones['spine_2_toon'].location.copy()
-                                Spine2ToonScale = pbones['spine_2_toon'].scale.copy()
-
-                                Spine3ToonRotEuler = pbones['spine_3_toon'].rotation_euler.copy()
-                                Spine3ToonLoc = pbones['spine_3_toon'].location.copy()
-                                Spine3ToonScale = pbones['spine_3_toon'].scale.copy()
-
-                                Spine4ToonRotEuler = pbones['spine_4_toon'].rotation_euler.copy()
-                                Spine4ToonLoc = pbones['spine_4_toon'].location.copy()
-                                Spine4ToonScale = pbones['spine_4_toon'].scale.copy()
-
-                                TorsoFkCtrlRotEuler = pbones['torso_fk_ctrl'].rotation_euler.copy()
-                                TorsoFkCtrlLoc = pbones['torso_fk_ctrl'].location.copy()
-                                TorsoFkCtrlScale = pbones['torso_fk_ctrl'].scale.copy()
-
-                                LookRotEuler = pbones['look'].rotation_euler.copy()
-                                LookLoc = pbones['look'].location.copy()
-                                LookScale = pbones['look'].scale.copy()
-
-                                ElbowLRotEuler = pbones['elbow_pole_L'].rotation_euler.copy()
-                                ElbowLLoc = pbones['elbow_pole_L'].location.copy()
-                                ElbowLScale = pbones['elbow_pole_L'].scale.copy()
-
-                                ElbowRRotEuler = pbones['elbow_pole_R'].rotation_euler.copy()
-                                ElbowRLoc = pbones['elbow_pole_R'].location.copy()
-                                ElbowRScale = pbones['elbow_pole_R'].scale.copy()
-
-                                KneeLRotEuler = pbones['knee_pole_L'].rotation_euler.copy()
-                                KneeLLoc = pbones['knee_pole_L'].location.copy()
-                                KneeLScale = pbones['knee_pole_L'].scale.copy()
-
-                                KneeRRotEuler = pbones['knee_pole_R'].rotation_euler.copy()
-                                KneeRLoc = pbones['knee_pole_R'].location.copy()
-                                KneeRScale = pbones['knee_pole_R'].scale.copy()
-
-                                ThighCtrlRotEuler = pbones['thigh_fk_ctrl_L'].rotation_euler.copy()
-                                ThighCtrlRotQuat = pbones['thigh_fk_ctrl_L'].rotation_quaternion.copy()
-                                ThighCtrlLoc = pbones['thigh_fk_ctrl_L'].location.copy()
-                                ThighCtrlScale = pbones['thigh_fk_ctrl_L'].scale.copy()
-
-                                ThighFkRotEuler = pbones['thigh_fk_L'].rotation_euler.copy()
-                                ThighFkRotQuat = pbones['thigh_fk_L'].rotation_quaternion.copy()
-                                ThighFkLoc = pbones['thigh_fk_L'].location.copy()
-                                ThighFkScale = pbones['thigh_fk_L'].scale.copy()
-
-                                ShinFkRotEuler = pbones['shin_fk_L'].rotation_euler.copy()
-                                ShinFkRotQuat = pbones['shin_fk_L'].rotation_quaternion.copy()
-                                ShinFkLoc = pbones['shin_fk_L'].location.copy()
-                                ShinFkScale = pbones['shin_fk_L'].scale.copy()
-
-                                SoleCtrlRotEuler = pbones['sole_ctrl_L'].rotation_euler.copy()
-                                SoleCtrlRotQuat = pbones['sole_ctrl_L'].rotation_quaternion.copy()
-                                SoleCtrlLoc = pbones['sole_ctrl_L'].location.copy()
-                                SoleCtrlScale = pbones['sole_ctrl_L'].scale.copy()
-
-                                ThighIkRotEuler = pbones['thigh_ik_L'].rotation_euler.copy()
-                                ThighIkRotQuat = pbones['thigh_ik_L'].rotation_quaternion.copy()
-                                ThighIkLoc = pbones['thigh_ik_L'].location.copy()
-                                ThighIkScale = pbones['thigh_ik_L'].scale.copy()
-
-                                #Jump to next Frame
-                                bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
-
-                                #Key Property
-                                armobj.pose.bones["properties_leg_L"].pin_knee_L = 0.0
-                                refresh_hack()
-                                pbones["properties_leg_L"].keyframe_insert(data_path='pin_knee_L')
-
-                                #Re-Paste Transforms
-                                pbones['master_torso'].rotation_euler = MasterTorsoRotEuler
-                                pbones['master_torso'].location = MasterTorsoLoc
-                                pbones['master_torso'].scale = MasterTorsoScale
-                                refresh_hack()
-                                pbones['torso_fk_ctrl_inv'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                                pbones['torso_fk_ctrl_inv'].rotation_quaternion[:] = (1.0,0.0, 0.0, 0.0)
-                                pbones['torso_fk_ctrl_inv'].location[:] = (0.0, 0.0, 0.0)
-                                refresh_hack()
-                                pbones['spine_3_fk_inv'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                                pbones['spine_3_fk_inv'].rotation_quaternion[:] = (1.0,0.0, 0.0, 0.0)
-                                pbones['spine_3_fk_inv'].location[:] = (0.0, 0.0, 0.0)
-                                refresh_hack()
-                                pbones['spine_2_fk_inv'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                                pbones['spine_2_fk_inv'].rotation_quaternion[:] = (1.0,0.0, 0.0, 0.0)
-                                pbones['spine_2_fk_inv'].location[:] = (0.0, 0.0, 0.0)
-                                refresh_hack()
-                                pbones['pelvis_ctrl'].rotation_euler = PelvisRotEuler
-                                pbones['pelvis_ctrl'].location = PelvisLoc
-                                pbones['pelvis_ctrl'].scale = PelvisScale
-                                refresh_hack()
-                                pbones['spine_1_fk'].rotation_euler = Spine1FKRotEuler
-                                pbones['spine_1_fk'].location = Spine1FKLoc
-                                pbones['spine_1_fk'].scale = Spine1FKScale
-                                refresh_hack()
-                                pbones['spine_2_fk'].rotation_euler = Spine2FKRotEuler
-                                pbones['spine_2_fk'].location = Spine2FKLoc
-                                pbones['spine_2_fk'].scale = Spine2FKScale
-                                refresh_hack()
-                                pbones['spine_3_fk'].rotation_euler = Spine3FKRotEuler
-                                pbones['spine_3_fk'].location = Spine3FKLoc
-                                pbones['spine_3_fk'].scale = Spine3FKScale
-                                refresh_hack()
-                                pbones['spine_1_toon'].rotation_euler = Spine1ToonRotEuler
-                                pbones['spine_1_toon'].location = Spine1ToonLoc
-                                pbones['spine_1_toon'].scale = Spine1ToonScale
-                                refresh_hack()
-                                pbones['spine_2_toon'].rotation_euler = Spine2ToonRotEuler
-                                pbones['spine_2_toon'].location = Spine2ToonLoc
-                                pbones['spine_2_toon'].scale = Spine2ToonScale
-                                refresh_hack()
-                                pbones['spine_3_toon'].rotation_euler = Spine3ToonRotEuler
-                                pbones['spine_3_toon'].location = Spine3ToonLoc
-                                pbones['spine_3_toon'].scale = Spine3ToonScale
-                                refresh_hack()
-                                pbones['spine_4_toon'].rotation_euler = Spine4ToonRotEuler
-                                pbones['spine_4_toon'].location = Spine4ToonLoc
-                                pbones['spine_4_toon'].scale = Spine4ToonScale
-                                refresh_hack()
-                                pbones['torso_fk_ctrl'].rotation_euler = TorsoFkCtrlRotEuler
-                                pbones['torso_fk_ctrl'].location = TorsoFkCtrlLoc
-                                pbones['torso_fk_ctrl'].scale = TorsoFkCtrlScale
-                                refresh_hack()
-                                pbones['look'].rotation_euler = LookRotEuler
-                                pbones['look'].location = LookLoc
-                                pbones['look'].scale = LookScale
-                                refresh_hack()
-                                pbones['elbow_pole_L'].rotation_euler = ElbowLRotEuler
-                                pbones['elbow_pole_L'].location = ElbowLLoc
-                                pbones['elbow_pole_L'].scale = ElbowLScale
-                                refresh_hack()
-                                pbones['elbow_pole_R'].rotation_euler = ElbowRRotEuler
-                                pbones['elbow_pole_R'].location = ElbowRLoc
-                                pbones['elbow_pole_R'].scale = ElbowRScale
-                                refresh_hack()
-                                pbones['knee_pole_L'].rotation_euler = KneeLRotEuler
-                                pbones['knee_pole_L'].location = KneeLLoc
-                                pbones['knee_pole_L'].scale = KneeLScale
-                                refresh_hack()
-                                pbones['knee_pole_R'].rotation_euler = KneeRRotEuler
-                                pbones['knee_pole_R'].location = KneeRLoc
-                                pbones['knee_pole_R'].scale = KneeRScale
-                                refresh_hack()
-                                pbones['thigh_fk_ctrl_L'].rotation_euler = ThighCtrlRotEuler
-                                pbones['thigh_fk_ctrl_L'].rotation_quaternion = ThighCtrlRotQuat
-                                pbones['thigh_fk_ctrl_L'].location = ThighCtrlLoc
-                                pbones['thigh_fk_ctrl_L'].scale = ThighCtrlScale
-                                refresh_hack()
-                                pbones['thigh_fk_L'].rotation_euler = ThighFkRotEuler
-                                pbones['thigh_fk_L'].rotation_quaternion = ThighFkRotQuat
-                                pbones['thigh_fk_L'].location = ThighFkLoc
-                                pbones['thigh_fk_L'].scale = ThighFkScale
-                                refresh_hack()
-                                pbones['shin_fk_L'].rotation_euler = ShinFkRotEuler
-                                pbones['shin_fk_L'].rotation_quaternion = ShinFkRotQuat
-                                pbones['shin_fk_L'].location = ShinFkLoc
-                                pbones['shin_fk_L'].scale = ShinFkScale
-                                refresh_hack()
-                                pbones['sole_ctrl_L'].rotation_euler = SoleCtrlRotEuler
-                                pbones['sole_ctrl_L'].rotation_quaternion = SoleCtrlRotQuat
-                                pbones['sole_ctrl_L'].location = SoleCtrlLoc
-                                pbones['sole_ctrl_L'].scale = SoleCtrlScale
-                                refresh_hack()
-                                pbones['thigh_ik_L'].rotation_euler = ThighIkRotEuler
-                                pbones['thigh_ik_L'].rotation_quaternion = ThighIkRotQuat
-                                pbones['thigh_ik_L'].location = ThighIkLoc
-                                pbones['thigh_ik_L'].scale = ThighIkScale
-                                refresh_hack()
-
-                                insert_bkeys('master_torso', 'LocRotScale')
-                                insert_bkeys('pelvis_ctrl', 'LocRotScale')
-                                insert_bkeys('spine_1_fk', 'LocRotScale')
-                                insert_bkeys('spine_2_fk', 'LocRotScale')
-                                insert_bkeys('spine_3_fk', 'LocRotScale')
-                                insert_bkeys('spine_1_toon', 'LocRotScale')
-                                insert_bkeys('spine_2_toon', 'LocRotScale')
-                                insert_bkeys('spine_3_toon', 'LocRotScale')
-                                insert_bkeys('spine_4_toon', 'LocRotScale')
-                                insert_bkeys('torso_fk_ctrl_inv', 'LocRotScale')
-                                insert_bkeys('spine_3_fk_inv', 'LocRotScale')
-                                insert_bkeys('spine_2_fk_inv', 'LocRotScale')
-                                insert_bkeys('torso_fk_ctrl', 'LocRotScale')
-                                insert_bkeys('look', 'LocRotScale')
-                                insert_bkeys('elbow_pole_L', 'LocRotScale')
-                                insert_bkeys('elbow_pole_R', 'LocRotScale')
-                                insert_bkeys('knee_pole_L', 'LocRotScale')
-                                insert_bkeys('knee_pole_R', 'LocRotScale')
-                                insert_bkeys('thigh_fk_L', 'LocRotScale')
-                                insert_bkeys('shin_fk_L', 'LocRotScale')
-                                insert_bkeys('thigh_fk_ctrl_L', 'LocRotScale')
-                                insert_bkeys('foot_fk_L', 'LocRotScale')
-                                insert_bkeys('foot_toe_1_fk_L', 'LocRotScale')
-                                insert_bkeys('foot_toe_2_fk_L', 'LocRotScale')
-                                insert_bkeys('thigh_ik_L', 'RotScale')
-                                insert_bkeys('shin_ik_L', 'RotScale')
-                                insert_bkeys('foot_ik_ctrl_L', 'LocRotScale')
-                                insert_bkeys('foot_toe_ik_ctrl_mid_L', 'LocRotScale')
-                                insert_bkeys('foot_toe_ik_ctrl_L', 'LocRotScale')
-                                insert_bkeys('foot_roll_ctrl_L', 'Rot')
-                                insert_bkeys('toe_roll_1_L', 'Rot')
-                                insert_bkeys('toe_roll_2_L', 'Rot')
-                                insert_bkeys('sole_ctrl_L', 'LocRotScale')
-                                insert_bkeys('knee_pin_L', 'LocRotScale')
-                                if pbones["properties_leg_L"].toggle_leg_ik_pole_L == 1.0:
-                                    insert_bkeys('knee_pole_L', 'Loc')
-                                for prop in bpy.context.active_object.data.items():
-                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                                        insert_bkeys('tarsal_fk_L', 'LocRotScale')
-                                        insert_bkeys('tarsal_ik_ctrl_L', 'LocRotScale')
-
-        return {"FINISHED"}
-
-##### Right Ops #####
-
-##### Arm_R IK>FK #####
-
-class Operator_Snap_ArmIKtoFK_R(bpy.types.Operator):
-
-    bl_idname = "snap.arm_ik_to_fk_r"
-    bl_label = "BlenRig Arm_R IK to FK"
-    bl_description = "Switch Arm to FK preserving pose"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
-
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
-
-    def execute(self, context):
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        anim_data = armobj.animation_data
-
-        #Biped
-        for prop in bpy.context.active_object.data.items():
-            if prop[0] == 'rig_type' and prop[1] == 'Biped':
-
-                if armobj.pose.bones["properties_arm_R"].ik_arm_R < 0.1:
-
-                    #Collect Matrix
-                    ArmFkMat = pbones['arm_fk_R'].matrix.copy()
-                    ArmFkLoc = pbones['arm_fk_R'].location.copy()
-                    ArmFkScale = pbones['arm_fk_R'].scale.copy()
-                    ForearmFkMat = pbones['forearm_fk_R'].matrix.copy()
-                    ForearmFkLoc = pbones['forearm_fk_R'].location.copy()
-                    ForearmFkScale = pbones['forearm_fk_R'].scale.copy()
-                    ShoulderMat = pbones['shoulder_R'].matrix.copy()
-                    ShoulderLoc = pbones['shoulder_R'].location.copy()
-                    ShoulderScale = pbones['shoulder_R'].scale.copy()
-
-                    #Insert Keyframes if Action present
-                    if anim_data:
-                        if anim_data.action:
-                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                                pbones["properties_arm_R"].keyframe_insert(data_path='ik_arm_R')
-                                insert_bkeys('arm_fk_R', 'LocRotScale')
-                                insert_bkeys('forearm_fk_R', 'LocRotScale')
-                                insert_bkeys('arm_ik_R', 'RotScale')
-                                insert_bkeys('forearm_ik_R', 'RotScale')
-                                insert_bkeys('arm_fk_ctrl_R', 'LocRotScale')
-                                insert_bkeys('shoulder_R', 'LocRotScale')
-                                insert_bkeys('hand_ik_ctrl_R', 'LocRotScale')
-                                insert_bkeys('hand_fk_R', 'LocRotScale')
-                                if pbones["properties_arm_R"].toggle_arm_ik_pole_R == 1.0:
-                                    insert_bkeys('elbow_pole_R', 'Loc')
-
-                    armobj.pose.bones["properties_arm_R"].ik_arm_R = 1.0
-                    refresh_hack()
-
-                    #Paste Matrix
-                    pVisRotExec (pbones['arm_fk_ctrl_R'], pbones['arm_ik_R'])
-                    pbones['arm_fk_ctrl_R'].scale[:] = (1.0, 1.0, 1.0)
-                    refresh_hack()
-                    pbones['shoulder_R'].matrix = ShoulderMat
-                    pbones['shoulder_R'].location = ShoulderLoc
-                    pbones['shoulder_R'].scale = ShoulderScale
-                    refresh_hack()
-                    pbones['arm_fk_R'].matrix = ArmFkMat
-                    pbones['arm_fk_R'].location = ArmFkLoc
-                    pbones['arm_fk_R'].scale = ArmFkScale
-                    refresh_hack()
-                    pbones['forearm_fk_R'].matrix = ForearmFkMat
-                    pbones['forearm_fk_R'].location = ForearmFkLoc
-                    pbones['forearm_fk_R'].scale = ForearmFkScale
-                    refresh_hack()
-                    #Correct arm_fk twist
-                    pVisRotExec (pbones['arm_fk_R'], pbones['arm_rot_R'])
-                    refresh_hack()
-                    #Re-paste forearm matrix
-                    pbones['forearm_fk_R'].matrix = ForearmFkMat
-                    pbones['forearm_fk_R'].location = ForearmFkLoc
-                    pbones['forearm_fk_R'].scale = ForearmFkScale
-                    refresh_hack()
-
-                    #Insert Keyframes if Action present
-                    if anim_data:
-                        if anim_data.action:
-                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                                #Collect Local Transforms
-                                ShoulderRotEuler = pbones['shoulder_R'].rotation_euler.copy()
-                                ShoulderRotQuat = pbones['shoulder_R'].rotation_quaternion.copy()
-                                ShoulderLoc = pbones['shoulder_R'].location.copy()
-                                ShoulderScale = pbones['shoulder_R'].scale.copy()
-
-                                ArmCtrlRotEuler = pbones['arm_fk_ctrl_R'].rotation_euler.copy()
-                                ArmCtrlRotQuat = pbones['arm_fk_ctrl_R'].rotation_quaternion.copy()
-                                ArmCtrlLoc = pbones['arm_fk_ctrl_R'].location.copy()
-                                ArmCtrlScale = pbones['arm_fk_ctrl_R'].scale.copy()
-
-                                ArmFkRotEuler = pbones['arm_fk_R'].rotation_euler.copy()
-                                ArmFkRotQuat = pbones['arm_fk_R'].rotation_quaternion.copy()
-                                ArmFkLoc = pbones['arm_fk_R'].location.copy()
-                                ArmFkScale = pbones['arm_fk_R'].scale.copy()
-
-                                ForearmFkRotEuler = pbones['forearm_fk_R'].rotation_euler.copy()
-                                ForearmFkRotQuat = pbones['forearm_fk_R'].rotation_quaternion.copy()
-                                ForearmFkLoc = pbones['forearm_fk_R'].location.copy()
-                                ForearmFkScale = pbones['forearm_fk_R'].scale.copy()
-
-                                #Jump to next Frame
-                                bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
-
-                                #Key Property
-                                armobj.pose.bones["properties_arm_R"].ik_arm_R = 1.0
-                                refresh_hack()
-                                pbones["properties_arm_R"].keyframe_insert(data_path='ik_arm_R')
-
-                                #Re-Paste Transforms
-                                pbones['shoulder_R'].rotation_euler = ShoulderRotEuler
-                                pbones['shoulder_R'].rotation_quaternion = ShoulderRotQuat
-                                pbones['shoulder_R'].location = ShoulderLoc
-                                pbones['shoulder_R'].scale = ShoulderScale
-                                refresh_hack()
-                                pbones['arm_fk_ctrl_R'].rotation_euler = ArmCtrlRotEuler
-                                pbones['arm_fk_ctrl_R'].rotation_quaternion = ArmCtrlRotQuat
-                                pbones['arm_fk_ctrl_R'].location = ArmCtrlLoc
-                                pbones['arm_fk_ctrl_R'].scale = ArmCtrlScale
-                                refresh_hack()
-                                pbones['arm_fk_R'].rotation_euler = ArmFkRotEuler
-                                pbones['arm_fk_R'].rotation_quaternion = ArmFkRotQuat
-                                pbones['arm_fk_R'].location = ArmFkLoc
-                                pbones['arm_fk_R'].scale = ArmFkScale
-                                refresh_hack()
-                                pbones['forearm_fk_R'].rotation_euler = ForearmFkRotEuler
-                                pbones['forearm_fk_R'].rotation_quaternion = ForearmFkRotQuat
-                                pbones['forearm_fk_R'].location = ForearmFkLoc
-                                pbones['forearm_fk_R'].scale = ForearmFkScale
-                                refresh_hack()
-
-                                insert_bkeys('arm_fk_R', 'LocRotScale')
-                                insert_bkeys('forearm_fk_R', 'LocRotScale')
-                                insert_bkeys('arm_ik_R', 'RotScale')
-                                insert_bkeys('forearm_ik_R', 'RotScale')
-                                insert_bkeys('arm_fk_ctrl_R', 'LocRotScale')
-                                insert_bkeys('shoulder_R', 'LocRotScale')
-                                insert_bkeys('hand_ik_ctrl_R', 'LocRotScale')
-                                insert_bkeys('hand_fk_R', 'LocRotScale')
-                                if pbones["properties_arm_R"].toggle_arm_ik_pole_R == 1.0:
-                                    insert_bkeys('elbow_pole_R', 'Loc')
-                                for prop in bpy.context.active_object.data.items():
-                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                                        insert_bkeys('carpal_ik_ctrl_R', 'LocRotScale')
-                                        insert_bkeys('carpal_fk_R', 'LocRotScale')
-                                        insert_bkeys('hand_fk_R', 'LocRotScale')
-
-                    #Switch Hand to Arm Space
-                    if anim_data:
-                        if anim_data.action:
-                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                                #Jump to previous Frame
-                                bpy.context.scene.frame_set (bpy.context.scene.frame_current - 1)
-
-                    #Switch Hand to Arm Space
-                    bpy.ops.switch.hand_space_r(space='Arm')
-
-        #Quadruped
-        for prop in bpy.context.active_object.data.items():
-            if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-
-                if armobj.pose.bones["properties_arm_R"].ik_arm_R < 0.1:
-
-                    #Collect Matrix
-                    ArmFkMat = pbones['arm_fk_R'].matrix.copy()
-                    ArmFkLoc = pbones['arm_fk_R'].location.copy()
-                    ArmFkScale = pbones['arm_fk_R'].scale.copy()
-                    ForearmFkMat = pbones['forearm_fk_R'].matrix.copy()
-                    ForearmFkLoc = pbones['forearm_fk_R'].location.copy()
-                    ForearmFkScale = pbones['forearm_fk_R'].scale.copy()
-                    ShoulderMat = pbones['shoulder_R'].matrix.copy()
-                    ShoulderLoc = pbones['shoulder_R'].location.copy()
-                    ShoulderScale = pbones['shoulder_R'].scale.copy()
-                    CarpalFkMat = pbones['carpal_fk_R'].matrix.copy()
-                    CarpalFkLoc = pbones['carpal_fk_R'].location.copy()
-                    CarpalFkScale = pbones['carpal_fk_R'].scale.copy()
-                    HandFkMat = pbones['hand_fk_R'].matrix.copy()
-                    HandFkLoc = pbones['hand_fk_R'].location.copy()
-                    HandFkScale = pbones['hand_fk_R'].scale.copy()
-                    HandFing1FkMat = pbones['hand_fing_1_fk_R'].matrix.copy()
-                    HandFing1FkLoc = pbones['hand_fing_1_fk_R'].location.copy()
-                    HandFing1FkScale = pbones['hand_fing_1_fk_R'].scale.copy()
-                    HandFing2FkMat = pbones['hand_fing_2_fk_R'].matrix.copy()
-                    HandFing2FkLoc = pbones['hand_fing_2_fk_R'].location.copy()
-                    HandFing2FkScale = pbones['hand_fing_2_fk_R'].scale.copy()
-
-                    #Insert Keyframes if Action present
-                    if anim_data:
-                        if anim_data.action:
-                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                                pbones["properties_arm_R"].keyframe_insert(data_path='ik_arm_R')
-                                insert_bkeys('arm_fk_R', 'LocRotScale')
-                                insert_bkeys('forearm_fk_R', 'LocRotScale')
-                                insert_bkeys('carpal_fk_R', 'LocRotScale')
-                                insert_bkeys('carpal_ik_ctrl_R', 'LocRotScale')
-                                insert_bkeys('arm_fk_ctrl_R', 'LocRotScale')
-                                insert_bkeys('shoulder_R', 'LocRotScale')
-                                insert_bkeys('hand_fk_R', 'LocRotScale')
-                                insert_bkeys('hand_fing_1_fk_R', 'LocRotScale')
-                                insert_bkeys('hand_fing_2_fk_R', 'LocRotScale')
-                                insert_bkeys('arm_ik_R', 'RotScale')
-                                insert_bkeys('forearm_ik_R', 'RotScale')
-                                insert_bkeys('hand_ik_ctrl_R', 'LocRotScale')
-                                insert_bkeys('hand_fing_ik_ctrl_mid_R', 'LocRotScale')
-                                insert_bkeys('fings_ik_ctrl_R', 'LocRotScale')
-                                insert_bkeys('hand_roll_ctrl_R', 'Rot')
-                                insert_bkeys('fing_roll_1_R', 'Rot')
-                                insert_bkeys('fing_roll_2_R', 'Rot')
-                                insert_bkeys('hand_sole_ctrl_R', 'LocRotScale')
-                                if pbones["properties_arm_R"].toggle_arm_ik_pole_R == 1.0:
-                                    insert_bkeys('elbow_pole_R', 'Loc')
-
-                    bpy.context.active_object.pose.bones["properties_arm_R"].ik_arm_R = 1.0
-                    refresh_hack()
-
-                    #Paste Matrix
-                    pVisRotExec (pbones['arm_fk_ctrl_R'], pbones['arm_ik_R'])
-                    pbones['arm_fk_ctrl_R'].scale[:] = (1.0, 1.0, 1.0)
-                    refresh_hack()
-                    pbones['shoulder_R'].matrix = ShoulderMat
-                    pbones['shoulder_R'].location = ShoulderLoc
-                    pbones['shoulder_R'].scale = ShoulderScale
-                    refresh_hack()
-                    pbones['arm_fk_R'].matrix = ArmFkMat
-                    pbones['arm_fk_R'].location = ArmFkLoc
-                    pbones['arm_fk_R'].scale = ArmFkScale
-                    refresh_hack()
-                    pbones['forearm_fk_R'].matrix = ForearmFkMat
-                    pbones['forearm_fk_R'].location = ForearmFkLoc
-                    pbones['forearm_fk_R'].scale = ForearmFkScale
-                    refresh_hack()
-                    pbones['carpal_fk_R'].matrix = CarpalFkMat
-                    pbones['carpal_fk_R'].location = CarpalFkLoc
-                    pbones['carpal_fk_R'].scale = CarpalFkScale
-                    refresh_hack()
-                    pbones['hand_fk_R'].matrix = HandFkMat
-                    pbones['hand_fk_R'].location = HandFkLoc
-                    pbones['hand_fk_R'].scale = HandFkScale
-                    refresh_hack()
-                    pbones['hand_fing_1_fk_R'].matrix = HandFing1FkMat
-                    pbones['hand_fing_1_fk_R'].location = HandFing1FkLoc
-                    pbones['hand_fing_1_fk_R'].scale = HandFing1FkScale
-                    refresh_hack()
-                    pbones['hand_fing_2_fk_R'].matrix = HandFing2FkMat
-                    pbones['hand_fing_2_fk_R'].location = HandFing2FkLoc
-                    pbones['hand_fing_2_fk_R'].scale = HandFing2FkScale
-                    refresh_hack()
-
-                    #Insert Keyframes if Action present
-                    if anim_data:
-                        if anim_data.action:
-                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                                #Collect Local Transforms
-                                ShoulderRotEuler = pbones['shoulder_R'].rotation_euler.copy()
-                                ShoulderRotQuat = pbones['shoulder_R'].rotation_quaternion.copy()
-                                ShoulderLoc = pbones['shoulder_R'].location.copy()
-                                ShoulderScale = pbones['shoulder_R'].scale.copy()
-
-                                ArmCtrlRotEuler = pbones['arm_fk_ctrl_R'].rotation_euler.copy()
-                                ArmCtrlRotQuat = pbones['arm_fk_ctrl_R'].rotation_quaternion.copy()
-                                ArmCtrlLoc = pbones['arm_fk_ctrl_R'].location.copy()
-                                ArmCtrlScale = pbones['arm_fk_ctrl_R'].scale.copy()
-
-                                ArmFkRotEuler = pbones['arm_fk_R'].rotation_euler.copy()
-                                ArmFkRotQuat = pbones['arm_fk_R'].rotation_quaternion.copy()
-                                ArmFkLoc = pbones['arm_fk_R'].location.copy()
-                                ArmFkScale = pbones['arm_fk_R'].scale.copy()
-
-                                ForearmFkRotEuler = pbones['forearm_fk_R'].rotation_euler.copy()
-                                ForearmFkRotQuat = pbones['forearm_fk_R'].rotation_quaternion.copy()
-                                ForearmFkLoc = pbones['forearm_fk_R'].location.copy()
-                                ForearmFkScale = pbones['forearm_fk_R'].scale.copy()
-
-                                CarpalFkRotEuler = pbones['carpal_fk_R'].rotation_euler.copy()
-                                CarpalFkRotQuat = pbones['carpal_fk_R'].rotation_quaternion.copy()
-                                CarpalFkLoc = pbones['carpal_fk_R'].location.copy()
-                                CarpalFkScale = pbones['carpal_fk_R'].scale.copy()
-
-                                HandFkRotEuler = pbones['hand_fk_R'].rotation_euler.copy()
-                                HandFkRotQuat = pbones['hand_fk_R'].rotation_quaternion.copy()
-                                HandFkLoc = pbones['hand_fk_R'].location.copy()
-                                HandFkScale = pbones['hand_fk_R'].scale.copy()
-
-                                HandFing1FkRotEuler = pbones['hand_fing_1_fk_R'].rotation_euler.copy()
-                                HandFing1FkRotQuat = pbones['hand_fing_1_fk_R'].rotation_quaternion.copy()
-                                HandFing1FkLoc = pbones['hand_fing_1_fk_R'].location.copy()
-                                HandFing1FkScale = pbones['hand_fing_1_fk_R'].scale.copy()
-
-                                HandFing2FkRotEuler = pbones['hand_fing_2_fk_R'].rotation_euler.copy()
-                                HandFing2FkRotQuat = pbones['hand_fing_2_fk_R'].rotation_quaternion.copy()
-                                HandFing2FkLoc = pbones['hand_fing_2_fk_R'].location.copy()
-                                HandFing2FkScale = pbones['hand_fing_2_fk_R'].scale.copy()
-
-                                #Jump to next Frame
-                                bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
-
-                                #Key Property
-                                armobj.pose.bones["properties_arm_R"].ik_arm_R = 1.0
-                                refresh_hack()
-                                pbones["properties_arm_R"].keyframe_insert(data_path='ik_arm_R')
-
-                                #Re-Paste Transforms
-                                pbones['shoulder_R'].rotation_euler = ShoulderRotEuler
-                                pbones['shoulder_R'].rotation_quaternion = ShoulderRotQuat
-                                pbones['shoulder_R'].location = ShoulderLoc
-                                pbones['shoulder_R'].scale = ShoulderScale
-                                refresh_hack()
-                                pbones['arm_fk_ctrl_R'].rotation_euler = ArmCtrlRotEuler
-                                pbones['arm_fk_ctrl_R'].rotation_quaternion = ArmCtrlRotQuat
-                                pbones['arm_fk_ctrl_R'].location = ArmCtrlLoc
-                                pbones['arm_fk_ctrl_R'].scale = ArmCtrlScale
-                                refresh_hack()
-                                pbones['arm_fk_R'].rotation_euler = ArmFkRotEuler
-                                pbones['arm_fk_R'].rotation_quaternion = ArmFkRotQuat
-                                pbones['arm_fk_R'].location = ArmFkLoc
-                                pbones['arm_fk_R'].scale = ArmFkScale
-                                refresh_hack()
-                                pbones['forearm_fk_R'].rotation_euler = ForearmFkRotEuler
-                                pbones['forearm_fk_R'].rotation_quaternion = ForearmFkRotQuat
-                                pbones['forearm_fk_R'].location = ForearmFkLoc
-                                pbones['forearm_fk_R'].scale = ForearmFkScale
-                                refresh_hack()
-                                pbones['carpal_fk_R'].rotation_euler = CarpalFkRotEuler
-                                pbones['carpal_fk_R'].rotation_quaternion = CarpalFkRotQuat
-                                pbones['carpal_fk_R'].location = CarpalFkLoc
-                                pbones['carpal_fk_R'].scale = CarpalFkScale
-                                refresh_hack()
-                                pbones['hand_fk_R'].rotation_euler = HandFkRotEuler
-                                pbones['hand_fk_R'].rotation_quaternion = HandFkRotQuat
-                                pbones['hand_fk_R'].location = HandFkLoc
-                                pbones['hand_fk_R'].scale = HandFkScale
-                                refresh_hack()
-                                pbones['hand_fing_1_fk_R'].rotation_euler = HandFing1FkRotEuler
-                                pbones['hand_fing_1_fk_R'].rotation_quaternion = HandFing1FkRotQuat
-                                pbones['hand_fing_1_fk_R'].location = HandFing1FkLoc
-                                pbones['hand_fing_1_fk_R'].scale = HandFing1FkScale
-                                refresh_hack()
-                                pbones['hand_fing_2_fk_R'].rotation_euler = HandFing2FkRotEuler
-                                pbones['hand_fing_2_fk_R'].rotation_quaternion = HandFing2FkRotQuat
-                                pbones['hand_fing_2_fk_R'].location = HandFing2FkLoc
-                                pbones['hand_fing_2_fk_R'].scale = HandFing2FkScale
-                                refresh_hack()
-
-                                insert_bkeys('arm_fk_R', 'LocRotScale')
-                                insert_bkeys('forearm_fk_R', 'LocRotScale')
-                                insert_bkeys('carpal_fk_R', 'LocRotScale')
-                                insert_bkeys('carpal_ik_ctrl_R', 'LocRotScale')
-                                insert_bkeys('arm_fk_ctrl_R', 'LocRotScale')
-                                insert_bkeys('shoulder_R', 'LocRotScale')
-                                insert_bkeys('hand_fk_R', 'LocRotScale')
-                                insert_bkeys('hand_fing_1_fk_R', 'LocRotScale')
-                                insert_bkeys('hand_fing_2_fk_R', 'LocRotScale')
-                                insert_bkeys('arm_ik_R', 'RotScale')
-                                insert_bkeys('forearm_ik_R', 'RotScale')
-                                insert_bkeys('hand_ik_ctrl_R', 'LocRotScale')
-                                insert_bkeys('hand_fing_ik_ctrl_mid_R', 'LocRotScale')
-                                insert_bkeys('fings_ik_ctrl_R', 'LocRotScale')
-                                insert_bkeys('hand_roll_ctrl_R', 'Rot')
-                                insert_bkeys('fing_roll_1_R', 'Rot')
-                                insert_bkeys('fing_roll_2_R', 'Rot')
-                                insert_bkeys('hand_sole_ctrl_R', 'LocRotScale')
-                                if pbones["properties_arm_R"].toggle_arm_ik_pole_R == 1.0:
-                                    insert_bkeys('elbow_pole_R', 'Loc')
-
-        return {"FINISHED"}
-
-
-
-##### Arm_R FK>IK #####
-
-class Operator_Snap_ArmFKtoIK_R(bpy.types.Operator):
-
-    bl_idname = "snap.arm_fk_to_ik_r"
-    bl_label = "BlenRig Arm_R FK to IK"
-    bl_description = "Switch Arm to IK preserving pose"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
-
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
-
-    def execute(self, context):
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        anim_data = armobj.animation_data
-
-        #Biped
-        for prop in bpy.context.active_object.data.items():
-            if prop[0] == 'rig_type' and prop[1] == 'Biped':
-
-                if bpy.context.active_object.pose.bones["properties_arm_R"].ik_arm_R > 0.9:
-                    #Collect Matrix
-                    ArmFkMat = pbones['arm_fk_R'].matrix.copy()
-                    ArmFkLoc = pbones['arm_fk_R'].location.copy()
-                    ArmFkScale = pbones['arm_fk_R'].scale.copy()
-                    ForearmFkMat = pbones['forearm_fk_R'].matrix.copy()
-                    ForearmFkLoc = pbones['forearm_fk_R'].location.copy()
-                    ForearmFkScale = pbones['forearm_fk_R'].scale.copy()
-                    ArmFkCtrlMat = pbones['arm_fk_ctrl_R'].matrix.copy()
-                    ShoulderMat = pbones['shoulder_R'].matrix.copy()
-                    ShoulderLoc = pbones['shoulder_R'].location.copy()
-                    ShoulderScale = pbones['shoulder_R'].scale.copy()
-
-                    #Insert Keyframes if Action present
-                    if anim_data:
-                        if anim_data.action:
-                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                                pbones["properties_arm_R"].keyframe_insert(data_path='ik_arm_R')
-                                insert_bkeys('arm_fk_R', 'LocRotScale')
-                                insert_bkeys('forearm_fk_R', 'LocRotScale')
-                                insert_bkeys('arm_ik_R', 'RotScale')
-                                insert_bkeys('forearm_ik_R', 'RotScale')
-                                insert_bkeys('arm_fk_ctrl_R', 'LocRotScale')
-                                insert_bkeys('shoulder_R', 'LocRotScale')
-                                insert_bkeys('hand_ik_ctrl_R', 'LocRotScale')
-                                insert_bkeys('hand_fk_R', 'LocRotScale')
-                                if pbones["properties_arm_R"].toggle_arm_ik_pole_R == 1.0:
-                                    insert_bkeys('elbow_pole_R', 'Loc')
-
-                    #Paste Matrix
-                    pVisLocExec(pbones['hand_ik_ctrl_R'], pbones['hand_fk_R'])
-                    refresh_hack()
-                    pVisLocExec(pbones['elbow_pole_R'], pbones['snap_elbow_pole_fk_R'])
-                    refresh_hack()
-                    pVisRotExec (pbones['arm_ik_R'], pbones['arm_rot_R'])
-                    refresh_hack()
-
-                    bpy.context.active_object.pose.bones["properties_arm_R"].ik_arm_R = 0.0
-                    refresh_hack()
-
-                    pbones['shoulder_R'].matrix = ShoulderMat
-                    pbones['shoulder_R'].location = ShoulderLoc
-                    pbones['shoulder_R'].scale = ShoulderScale
-                    refresh_hack()
-                    pbones['arm_fk_R'].matrix = ArmFkMat
-                    pbones['arm_fk_R'].location = ArmFkLoc
-                    pbones['arm_fk_R'].scale = ArmFkScale
-                    refresh_hack()
-                    pbones['forearm_fk_R'].matrix = ForearmFkMat
-                    pbones['forearm_fk_R'].location = ForearmFkLoc
-                    pbones['forearm_fk_R'].scale = ForearmFkScale
-                    refresh_hack()
-                    #Correct arm_fk twist
-                    pVisRotExec (pbones['arm_fk_R'], pbones['arm_rot_R'])
-                    refresh_hack()
-                    #Re-paste forearm matrix
-                    pbones['forearm_fk_R'].matrix = ForearmFkMat
-                    pbones['forearm_fk_R'].location = ForearmFkLoc
-                    pbones['forearm_fk_R'].scale = ForearmFkScale
-                    refresh_hack()
-
-                    #Insert Keyframes if Action present
-                    if anim_data:
-                        if anim_data.action:
-                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                                #Collect Local Transforms
-                                HandIkCtrlRotEuler = pbones['hand_ik_ctrl_R'].rotation_euler.copy()
-                                HandIkCtrlRotQuat = pbones['hand_ik_ctrl_R'].rotation_quaternion.copy()
-                                HandIkCtrlLoc = pbones['hand_ik_ctrl_R'].location.copy()
-                                HandIkCtrlScale = pbones['hand_ik_ctrl_R'].scale.copy()
-
-                                ArmIkRotEuler = pbones['arm_ik_R'].rotation_euler.copy()
-                                ArmIkRotQuat = pbones['arm_ik_R'].rotation_quaternion.copy()
-                                ArmIkLoc = pbones['arm_ik_R'].location.copy()
-                                ArmIkScale = pbones['arm_ik_R'].scale.copy()
-
-                                ElbowlLoc = pbones['elbow_pole_R'].location.copy()
-
-                                ShoulderRotEuler = pbones['shoulder_R'].rotation_euler.copy()
-                                ShoulderRotQuat = pbones['shoulder_R'].rotation_quaternion.copy()
-                                ShoulderLoc = pbones['shoulder_R'].location.copy()
-                                ShoulderScale = pbones['shoulder_R'].scale.copy()
-
-                                ArmFkRotEuler = pbones['arm_fk_R'].rotation_euler.copy()
-                                ArmFkRotQuat = pbones['arm_fk_R'].rotation_quaternion.copy()
-                                ArmFkLoc = pbones['arm_fk_R'].location.copy()
-                                ArmFkScale = pbones['arm_fk_R'].scale.copy()
-
-                                ForearmFkRotEuler = pbones['forearm_fk_R'].rotation_euler.copy()
-                                ForearmFkRotQuat = pbones['forearm_fk_R'].rotation_quaternion.copy()
-                                ForearmFkLoc = pbones['forearm_fk_R'].location.copy()
-                                ForearmFkScale = pbones['forearm_fk_R'].scale.copy()
-
-                                #Jump to next Frame
-                                bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
-
-                                #Key Property
-                                armobj.pose.bones["properties_arm_R"].ik_arm_R = 0.0
-                                refresh_hack()
-                                pbones["properties_arm_R"].keyframe_insert(data_path='ik_arm_R')
-
-                                #Re-Paste Transforms
-                                pbones['hand_ik_ctrl_R'].rotation_euler = HandIkCtrlRotEuler
-                                pbones['hand_ik_ctrl_R'].rotation_quaternion = HandIkCtrlRotQuat
-                                pbones['hand_ik_ctrl_R'].location = HandIkCtrlLoc
-                                pbones['hand_ik_ctrl_R'].scale = HandIkCtrlScale
-                                refresh_hack()
-                                pbones['elbow_pole_R'].location = ElbowlLoc
-                                refresh_hack()
-                                pbones['arm_ik_R'].rotation_euler = ArmIkRotEuler
-                                pbones['arm_ik_R'].rotation_quaternion = ArmIkRotQuat
-                                pbones['arm_ik_R'].location = ArmIkLoc
-                                pbones['arm_ik_R'].scale = ArmIkScale
-                                refresh_hack()
-                                pbones['shoulder_R'].rotation_euler = ShoulderRotEuler
-                                pbones['shoulder_R'].rotation_quaternion = ShoulderRotQuat
-                                pbones['shoulder_R'].location = ShoulderLoc
-                                pbones['shoulder_R'].scale = ShoulderScale
-                                refresh_hack()
-                                pbones['arm_fk_R'].rotation_euler = ArmFkRotEuler
-                                pbones['arm_fk_R'].rotation_quaternion = ArmFkRotQuat
-                                pbones['arm_fk_R'].location = ArmFkLoc
-                                pbones['arm_fk_R'].scale = ArmFkScale
-                                refresh_hack()
-                                pbones['forearm_fk_R'].rotation_euler = ForearmFkRotEuler
-                                pbones['forearm_fk_R'].rotation_quaternion = ForearmFkRotQuat
-                                pbones['forearm_fk_R'].location = ForearmFkLoc
-                                pbones['forearm_fk_R'].scale = ForearmFkScale
-                                refresh_hack()
-
-                                insert_bkeys('arm_fk_R', 'LocRotScale')
-                                insert_bkeys('forearm_fk_R', 'LocRotScale')
-                                insert_bkeys('arm_ik_R', 'RotScale')
-                                insert_bkeys('forearm_ik_R', 'RotScale')
-                                insert_bkeys('arm_fk_ctrl_R', 'LocRotScale')
-                                insert_bkeys('shoulder_R', 'LocRotScale')
-                                insert_bkeys('hand_ik_ctrl_R', 'LocRotScale')
-                                insert_bkeys('hand_fk_R', 'LocRotScale')
-                                if pbones["properties_arm_R"].toggle_arm_ik_pole_R == 1.0:
-                                    insert_bkeys('elbow_pole_R', 'Loc')
-
-                    #Switch Hand to Arm Space
-                    if anim_data:
-                        if anim_data.action:
-                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                                #Jump to previous Frame
-                                bpy.context.scene.frame_set (bpy.context.scene.frame_current - 1)
-
-                    #Switch Hand to Free Space
-                    bpy.ops.switch.hand_space_r(space='Free')
-
-        #Quadruped
-        for prop in bpy.context.active_object.data.items():
-            if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-
-                if bpy.context.active_object.pose.bones["properties_arm_R"].ik_arm_R > 0.9:
-
-                    #Collect Matrix
-                    ArmFkMat = pbones['arm_fk_R'].matrix.copy()
-                    ArmFkLoc = pbones['arm_fk_R'].location.copy()
-                    ArmFkScale = pbones['arm_fk_R'].scale.copy()
-                    ForearmFkMat = pbones['forearm_fk_R'].matrix.copy()
-                    ForearmFkLoc = pbones['forearm_fk_R'].location.copy()
-                    ForearmFkScale = pbones['forearm_fk_R'].scale.copy()
-                    CarpalFkMat = pbones['carpal_fk_R'].matrix.copy()
-                    CarpalFkLoc = pbones['carpal_fk_R'].location.copy()
-                    CarpalFkScale = pbones['carpal_fk_R'].scale.copy()
-                    HandFing1FkMat = pbones['hand_fing_1_fk_R'].matrix.copy()
-                    HandFing1FkLoc = pbones['hand_fing_1_fk_R'].location.copy()
-                    HandFing1FkScale = pbones['hand_fing_1_fk_R'].scale.copy()
-                    HandFing2FkMat = pbones['hand_fing_2_fk_R'].matrix.copy()
-                    HandFing2FkLoc = pbones['hand_fing_2_fk_R'].location.copy()
-                    HandFing2FkScale = pbones['hand_fing_2_fk_R'].scale.copy()
-                    ArmFkCtrlMat = pbones['arm_fk_ctrl_R'].matrix.copy()
-                    ShoulderMat = pbones['shoulder_R'].matrix.copy()
-                    ShoulderLoc = pbones['shoulder_R'].location.copy()
-                    ShoulderScale = pbones['shoulder_R'].scale.copy()
-
-                    #Insert Keyframes if Action present
-                    if anim_data:
-                        if anim_data.action:
-                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                                pbones["properties_arm_R"].keyframe_insert(data_path='ik_arm_R')
-                                insert_bkeys('arm_fk_R', 'LocRotScale')
-                                insert_bkeys('forearm_fk_R', 'LocRotScale')
-                                insert_bkeys('shoulder_R', 'LocRotScale')
-                                insert_bkeys('carpal_fk_R', 'LocRotScale')
-                                insert_bkeys('carpal_ik_ctrl_R', 'LocRotScale')
-                                insert_bkeys('arm_fk_ctrl_R', 'LocRotScale')
-                                insert_bkeys('hand_fk_R', 'LocRotScale')
-                                insert_bkeys('hand_fing_1_fk_R', 'LocRotScale')
-                                insert_bkeys('hand_fing_2_fk_R', 'LocRotScale')
-                                insert_bkeys('arm_ik_R', 'RotScale')
-                                insert_bkeys('forearm_ik_R', 'RotScale')
-                                insert_bkeys('hand_ik_ctrl_R', 'LocRotScale')
-                                insert_bkeys('hand_fing_ik_ctrl_mid_R', 'LocRotScale')
-                                insert_bkeys('fings_ik_ctrl_R', 'LocRotScale')
-                                insert_bkeys('hand_roll_ctrl_R', 'Rot')
-                                insert_bkeys('fing_roll_1_R', 'Rot')
-                                insert_bkeys('fing_roll_2_R', 'Rot')
-                                insert_bkeys('hand_sole_ctrl_R', 'LocRotScale')
-                                if pbones["properties_arm_R"].toggle_arm_ik_pole_R == 1.0:
-                                    insert_bkeys('elbow_pole_R', 'Loc')
-
-                    #Paste Matrix
-                    pVisLocExec(pbones['hand_sole_ctrl_R'], pbones['snap_hand_sole_ctrl_fk_R'])
-                    pVisRotExec(pbones['hand_sole_ctrl_R'], pbones['snap_hand_sole_ctrl_fk_R'])
-                    refresh_hack()
-                    pbones['hand_roll_ctrl_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    pbones['hand_ik_ctrl_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    pbones['hand_ik_ctrl_R'].location[:] = (0.0, 0.0, 0.0)
-                    pbones['fing_roll_1_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    pbones['fing_roll_2_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    pbones['hand_fing_ik_ctrl_mid_R'].location[:] = (0.0, 0.0, 0.0)
-                    pbones['hand_fing_ik_ctrl_mid_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    pbones['fings_ik_ctrl_R'].location[:] = (0.0, 0.0, 0.0)
-                    pbones['fings_ik_ctrl_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    pVisLocExec(pbones['elbow_pole_R'], pbones['snap_elbow_pole_fk_R'])
-                    refresh_hack()
-                    pVisLocExec(pbones['carpal_ik_ctrl_R'], pbones['snap_carpal_fk_R'])
-                    pVisRotExec(pbones['carpal_ik_ctrl_R'], pbones['snap_carpal_fk_R'])
-                    refresh_hack()
-
-                    bpy.context.active_object.pose.bones["properties_arm_R"].ik_arm_R = 0.0
-                    refresh_hack()
-
-                    pVisRotExec (pbones['arm_ik_R'], pbones['arm_fk_ctrl_R'])
-                    refresh_hack()
-                    pbones['shoulder_R'].matrix = ShoulderMat
-                    pbones['shoulder_R'].location = ShoulderLoc
-                    pbones['shoulder_R'].scale = ShoulderScale
-                    refresh_hack()
-                    pbones['arm_fk_R'].matrix = ArmFkMat
-                    pbones['arm_fk_R'].location = ArmFkLoc
-                    pbones['arm_fk_R'].scale = ArmFkScale
-                    refresh_hack()
-                    pbones['forearm_fk_R'].matrix = ForearmFkMat
-                    pbones['forearm_fk_R'].location = ForearmFkLoc
-                    pbones['forearm_fk_R'].scale = ForearmFkScale
-                    refresh_hack()
-                    pbones['carpal_fk_R'].matrix = CarpalFkMat
-                    pbones['carpal_fk_R'].location = CarpalFkLoc
-                    pbones['carpal_fk_R'].scale = CarpalFkScale
-                    refresh_hack()
-                    pbones['hand_fing_1_fk_R'].matrix = HandFing1FkMat
-                    pbones['hand_fing_1_fk_R'].location = HandFing1FkLoc
-                    pbones['hand_fing_1_fk_R'].scale = HandFing1FkScale
-                    refresh_hack()
-                    pbones['hand_fing_2_fk_R'].matrix = HandFing2FkMat
-                    pbones['hand_fing_2_fk_R'].location = HandFing2FkLoc
-                    pbones['hand_fing_2_fk_R'].scale = HandFing2FkScale
-                    refresh_hack()
-
-                    #Insert Keyframes if Action present
-                    if anim_data:
-                        if anim_data.action:
-                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                                #Collect Local Transforms
-
-                                SoleCtrlRotEuler = pbones['hand_sole_ctrl_R'].rotation_euler.copy()
-                                SoleCtrlRotQuat = pbones['hand_sole_ctrl_R'].rotation_quaternion.copy()
-                                SoleCtrlLoc = pbones['hand_sole_ctrl_R'].location.copy()
-                                SoleCtrlScale = pbones['hand_sole_ctrl_R'].scale.copy()
-
-                                ElbowPoleRotEuler = pbones['elbow_pole_R'].rotation_euler.copy()
-                                ElbowPoleRotQuat = pbones['elbow_pole_R'].rotation_quaternion.copy()
-                                ElbowPoleLoc = pbones['elbow_pole_R'].location.copy()
-                                ElbowPoleScale = pbones['elbow_pole_R'].scale.copy()
-
-                                ShoulderRotEuler = pbones['shoulder_R'].rotation_euler.copy()
-                                ShoulderRotQuat = pbones['shoulder_R'].rotation_quaternion.copy()
-                                ShoulderLoc = pbones['shoulder_R'].location.copy()
-                                ShoulderScale = pbones['shoulder_R'].scale.copy()
-
-                                ArmIkRotEuler = pbones['arm_ik_R'].rotation_euler.copy()
-                                ArmIkRotQuat = pbones['arm_ik_R'].rotation_quaternion.copy()
-                                ArmIkLoc = pbones['arm_ik_R'].location.copy()
-                                ArmIkScale = pbones['arm_ik_R'].scale.copy()
-
-                                ArmFkRotEuler = pbones['arm_fk_R'].rotation_euler.copy()
-                                ArmFkRotQuat = pbones['arm_fk_R'].rotation_quaternion.copy()
-                                ArmFkLoc = pbones['arm_fk_R'].location.copy()
-                                ArmFkScale = pbones['arm_fk_R'].scale.copy()
-
-                                ForearmFkRotEuler = pbones['forearm_fk_R'].rotation_euler.copy()
-                                ForearmFkRotQuat = pbones['forearm_fk_R'].rotation_quaternion.copy()
-                                ForearmFkLoc = pbones['forearm_fk_R'].location.copy()
-                                ForearmFkScale = pbones['forearm_fk_R'].scale.copy()
-
-                                CarpalFkRotEuler = pbones['carpal_fk_R'].rotation_euler.copy()
-                                CarpalFkRotQuat = pbones['carpal_fk_R'].rotation_quaternion.copy()
-                                CarpalFkLoc = pbones['carpal_fk_R'].location.copy()
-                                CarpalFkScale = pbones['carpal_fk_R'].scale.copy()
-
-                                CarpalIkRotEuler = pbones['carpal_ik_ctrl_R'].rotation_euler.copy()
-                                CarpalIkRotQuat = pbones['carpal_ik_ctrl_R'].rotation_quaternion.copy()
-                                CarpalIkLoc = pbones['carpal_ik_ctrl_R'].location.copy()
-                                CarpalIkScale = pbones['carpal_ik_ctrl_R'].scale.copy()
-
-                                HandFing1FkRotEuler = pbones['hand_fing_1_fk_R'].rotation_euler.copy()
-                                HandFing1FkRotQuat = pbones['hand_fing_1_fk_R'].rotation_quaternion.copy()
-                                HandFing1FkLoc = pbones['hand_fing_1_fk_R'].location.copy()
-                                HandFing1FkScale = pbones['hand_fing_1_fk_R'].scale.copy()
-
-                                HandFing2FkRotEuler = pbones['hand_fing_2_fk_R'].rotation_euler.copy()
-                                HandFing2FkRotQuat = pbones['hand_fing_2_fk_R'].rotation_quaternion.copy()
-                                HandFing2FkLoc = pbones['hand_fing_2_fk_R'].location.copy()
-                                HandFing2FkScale = pbones['hand_fing_2_fk_R'].scale.copy()
-
-                                #Jump to next Frame
-                                bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
-
-                                #Key Property
-                                armobj.pose.bones["properties_arm_R"].ik_arm_R = 0.0
-                                refresh_hack()
-                                pbones["properties_arm_R"].keyframe_insert(data_path='ik_arm_R')
-
-                                #Re-Paste Transforms
-                                pbones['hand_sole_ctrl_R'].rotation_euler = SoleCtrlRotEuler
-                                pbones['hand_sole_ctrl_R'].rotation_quaternion = SoleCtrlRotQuat
-                                pbones['hand_sole_ctrl_R'].location = SoleCtrlLoc
-                                pbones['hand_sole_ctrl_R'].scale = SoleCtrlScale
-                                refresh_hack()
-                                pbones['elbow_pole_R'].rotation_euler = ElbowPoleRotEuler
-                                pbones['elbow_pole_R'].rotation_quaternion = ElbowPoleRotQuat
-                                pbones['elbow_pole_R'].location = ElbowPoleLoc
-                                pbones['elbow_pole_R'].scale = ElbowPoleScale
-                                refresh_hack()
-                                pbones['arm_ik_R'].rotation_euler = ArmIkRotEuler
-                                pbones['arm_ik_R'].rotation_quaternion = ArmIkRotQuat
-                                pbones['arm_ik_R'].location = ArmIkLoc
-                                pbones['arm_ik_R'].scale = ArmIkScale
-                                refresh_hack()
-                                pbones['shoulder_R'].rotation_euler = ShoulderRotEuler
-                                pbones['shoulder_R'].rotation_quaternion = ShoulderRotQuat
-                                pbones['shoulder_R'].location = ShoulderLoc
-                                pbones['shoulder_R'].scale = ShoulderScale
-                                refresh_hack()
-                                pbones['arm_fk_R'].rotation_euler = ArmFkRotEuler
-                                pbones['arm_fk_R'].rotation_quaternion = ArmFkRotQuat
-                                pbones['arm_fk_R'].location = ArmFkLoc
-                                pbones['arm_fk_R'].scale = ArmFkScale
-                                refresh_hack()
-                                pbones['forearm_fk_R'].rotation_euler = ForearmFkRotEuler
-                                pbones['forearm_fk_R'].rotation_quaternion = ForearmFkRotQuat
-                                pbones['forearm_fk_R'].location = ForearmFkLoc
-                                pbones['forearm_fk_R'].scale = ForearmFkScale
-                                refresh_hack()
-                                pbones['carpal_ik_ctrl_R'].rotation_euler = CarpalIkRotEuler
-                                pbones['carpal_ik_ctrl_R'].rotation_quaternion = CarpalIkRotQuat
-                                pbones['carpal_ik_ctrl_R'].location = CarpalIkLoc
-                                pbones['carpal_ik_ctrl_R'].scale = CarpalIkScale
-                                refresh_hack()
-                                pbones['carpal_fk_R'].rotation_euler = CarpalFkRotEuler
-                                pbones['carpal_fk_R'].rotation_quaternion = CarpalFkRotQuat
-                                pbones['carpal_fk_R'].location = CarpalFkLoc
-                                pbones['carpal_fk_R'].scale = CarpalFkScale
-                                refresh_hack()
-                                pbones['hand_fing_1_fk_R'].rotation_euler = HandFing1FkRotEuler
-                                pbones['hand_fing_1_fk_R'].rotation_quaternion = HandFing1FkRotQuat
-                                pbones['hand_fing_1_fk_R'].location = HandFing1FkLoc
-                                pbones['hand_fing_1_fk_R'].scale = HandFing1FkScale
-                                refresh_hack()
-                                pbones['hand_fing_2_fk_R'].rotation_euler = HandFing2FkRotEuler
-                                pbones['hand_fing_2_fk_R'].rotation_quaternion = HandFing2FkRotQuat
-                                pbones['hand_fing_2_fk_R'].location = HandFing2FkLoc
-                                pbones['hand_fing_2_fk_R'].scale = HandFing2FkScale
-                                refresh_hack()
-                                pbones['hand_roll_ctrl_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                                pbones['hand_ik_ctrl_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                                pbones['hand_ik_ctrl_R'].location[:] = (0.0, 0.0, 0.0)
-                                pbones['fing_roll_1_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                                pbones['fing_roll_2_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                                pbones['hand_fing_ik_ctrl_mid_R'].location[:] = (0.0, 0.0, 0.0)
-                                pbones['hand_fing_ik_ctrl_mid_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                                pbones['fings_ik_ctrl_R'].location[:] = (0.0, 0.0, 0.0)
-                                pbones['fings_ik_ctrl_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                                refresh_hack()
-
-                                insert_bkeys('arm_fk_R', 'LocRotScale')
-                                insert_bkeys('forearm_fk_R', 'LocRotScale')
-                                insert_bkeys('shoulder_R', 'LocRotScale')
-                                insert_bkeys('carpal_fk_R', 'LocRotScale')
-                                insert_bkeys('carpal_ik_ctrl_R', 'LocRotScale')
-                                insert_bkeys('arm_fk_ctrl_R', 'LocRotScale')
-                                insert_bkeys('hand_fk_R', 'LocRotScale')
-                                insert_bkeys('hand_fing_1_fk_R', 'LocRotScale')
-                                insert_bkeys('hand_fing_2_fk_R', 'LocRotScale')
-                                insert_bkeys('arm_ik_R', 'RotScale')
-                                insert_bkeys('forearm_ik_R', 'RotScale')
-                                insert_bkeys('hand_ik_ctrl_R', 'LocRotScale')
-                                insert_bkeys('hand_fing_ik_ctrl_mid_R', 'LocRotScale')
-                                insert_bkeys('fings_ik_ctrl_R', 'LocRotScale')
-                                insert_bkeys('hand_roll_ctrl_R', 'Rot')
-                                insert_bkeys('fing_roll_1_R', 'Rot')
-                                insert_bkeys('fing_roll_2_R', 'Rot')
-                                insert_bkeys('hand_sole_ctrl_R', 'LocRotScale')
-                                if pbones["properties_arm_R"].toggle_arm_ik_pole_R == 1.0:
-                                    insert_bkeys('elbow_pole_R', 'Loc')
-
-        return {"FINISHED"}
-
-##### Arm_R Space #####
-
-class Operator_Switch_Arm_Space_R(bpy.types.Operator):
-
-    bl_idname = "switch.arm_space_r"
-    bl_label = "BlenRig Switch Arm_R Space"
-    bl_description = "Switch Arm_R Space preserving pose"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
-
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
-
-    #Create string property to parse argument to the operator
-    space : bpy.props.StringProperty()
-
-    def execute(self, context):
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        anim_data = armobj.animation_data
-
-        #Collect Matrix
-        HandIkMat = pbones['hand_ik_ctrl_R'].matrix.copy()
-        ArmFkCtrlMat = pbones['arm_fk_ctrl_R'].matrix.copy()
-
-        #Insert Keyframes if Action present
-        if anim_data:
-            if anim_data.action:
-                if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                    pbones["properties_arm_R"].keyframe_insert(data_path='space_arm_R')
-                    insert_bkeys('hand_ik_ctrl_R', 'LocRotScale')
-                    insert_bkeys('arm_fk_ctrl_R', 'LocRotScale')
-
-        if self.space == 'Free':
-            bpy.context.active_object.pose.bones["properties_arm_R"].space_arm_R = 0.0
-            refresh_hack()
-        if self.space == 'Pelvis':
-            bpy.context.active_object.pose.bones["properties_arm_R"].space_arm_R = 1.0
-            refresh_hack()
-        if self.space == 'Torso':
-            bpy.context.active_object.pose.bones["properties_arm_R"].space_arm_R = 2.0
-            refresh_hack()
-        if self.space == 'Head':
-            bpy.context.active_object.pose.bones["properties_arm_R"].space_arm_R = 3.0
-            refresh_hack()
-
-        #Paste Matrix
-        pbones['hand_ik_ctrl_R'].matrix = HandIkMat
-        pbones['arm_fk_ctrl_R'].matrix = ArmFkCtrlMat
-        refresh_hack()
-
-        #Insert Keyframes if Action present
-        if anim_data:
-            if anim_data.action:
-                if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                    #Collect Local Transforms
-                    HandIkCtrlRotEuler = pbones['hand_ik_ctrl_R'].rotation_euler.copy()
-                    HandIkCtrlRotQuat = pbones['hand_ik_ctrl_R'].rotation_quaternion.copy()
-                    HandIkCtrlLoc = pbones['hand_ik_ctrl_R'].location.copy()
-                    HandIkCtrlScale = pbones['hand_ik_ctrl_R'].scale.copy()
-
-                    ArmCtrlRotEuler = pbones['arm_fk_ctrl_R'].rotation_euler.copy()
-                    ArmCtrlRotQuat = pbones['arm_fk_ctrl_R'].rotation_quaternion.copy()
-                    ArmCtrlLoc = pbones['arm_fk_ctrl_R'].location.copy()
-                    ArmCtrlScale = pbones['arm_fk_ctrl_R'].scale.copy()
-
-                    #Jump to next Frame
-                    bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
-
-                    #Key Property
-                    if self.space == 'Free':
-                        bpy.context.active_object.pose.bones["properties_arm_R"].space_arm_R = 0.0
-                        refresh_hack()
-                    if self.space == 'Pelvis':
-                        bpy.context.active_object.pose.bones["properties_arm_R"].space_arm_R = 1.0
-                        refresh_hack()
-                    if self.space == 'Torso':
-                        bpy.context.active_object.pose.bones["properties_arm_R"].space_arm_R = 2.0
-                        refresh_hack()
-                    if self.space == 'Head':
-                        bpy.context.active_object.pose.bones["properties_arm_R"].space_arm_R = 3.0
-                        refresh_hack()
-                    pbones["properties_arm_R"].keyframe_insert(data_path='space_arm_R')
-
-                    #Re-Paste Transforms
-                    pbones['hand_ik_ctrl_R'].rotation_euler = HandIkCtrlRotEuler
-                    pbones['hand_ik_ctrl_R'].rotation_quaternion = HandIkCtrlRotQuat
-                    pbones['hand_ik_ctrl_R'].location = HandIkCtrlLoc
-                    pbones['hand_ik_ctrl_R'].scale = HandIkCtrlScale
-                    refresh_hack()
-                    pbones['arm_fk_ctrl_R'].rotation_euler = ArmCtrlRotEuler
-                    pbones['arm_fk_ctrl_R'].rotation_quaternion = ArmCtrlRotQuat
-                    pbones['arm_fk_ctrl_R'].location = ArmCtrlLoc
-                    pbones['arm_fk_ctrl_R'].scale = ArmCtrlScale
-                    refresh_hack()
-
-                    insert_bkeys('hand_ik_ctrl_R', 'LocRotScale')
-                    insert_bkeys('arm_fk_ctrl_R', 'LocRotScale')
-
-        return {"FINISHED"}
-
-#Create Space PopUp
-def Arm_Space_List_R(self, context):
-    col = self.layout.column()
-    col.operator("switch.arm_space_r", text = "Free").space = 'Free'
-    col.operator("switch.arm_space_r", text = "Pelvis").space = 'Pelvis'
-    col.operator("switch.arm_space_r", text = "Torso").space = 'Torso'
-    col.operator("switch.arm_space_r", text = "Head").space = 'Head'
-
-class Operator_Show_Arm_Space_List_R(bpy.types.Operator):
-    bl_idname = "show.arm_list_r"
-    bl_label = "Arm_R Space Switch List"
-    bl_description = "Switch Arm_R Space"
-
-    def invoke(self, context, event):
-        context.window_manager.popup_menu(Arm_Space_List_R, title='Switch Arm_R Space', icon='MOD_ARMATURE')
-        return {'FINISHED'}
-
-##### Hand_R Space #####
-
-class Operator_Switch_Hand_Space_R(bpy.types.Operator):
-
-    bl_idname = "switch.hand_space_r"
-    bl_label = "BlenRig Switch Hand_R Space"
-    bl_description = "Switch Hand_R Space preserving pose"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
-
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
-
-    #Create string property to parse argument to the operator
-    space : bpy.props.StringProperty()
-
-    def execute(self, context):
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        anim_data = armobj.animation_data
-
-        #Insert Keyframes if Action present
-        if anim_data:
-            if anim_data.action:
-                if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                    pbones["properties_arm_R"].keyframe_insert(data_path='space_hand_R')
-                    insert_bkeys('hand_ik_ctrl_R', 'RotScale')
-                    insert_bkeys('hand_fk_R', 'RotScale')
-
-        if self.space == 'Arm':
-            #Collect Matrix
-            HandFkMat = pbones['hand_fk_R'].matrix.copy()
-            HandFkLoc = pbones['hand_fk_R'].location.copy()
-            HandFkScale = pbones['hand_fk_R'].scale.copy()
-
-            bpy.context.active_object.pose.bones["properties_arm_R"].space_hand_R = 1.0
-
-            #Paste Matrix
-            pbones['hand_fk_R'].matrix = HandFkMat
-            pbones['hand_fk_R'].location = HandFkLoc
-            pbones['hand_fk_R'].scale = HandFkScale
-            refresh_hack()
-
-        if self.space == 'Free':
-            #Paste Matrix
-            pVisRotExec (pbones['hand_ik_ctrl_R'], pbones['hand_fk_R'])
-            refresh_hack()
-
-            bpy.context.active_object.pose.bones["properties_arm_R"].space_hand_R = 0.0
-            refresh_hack()
-
-        #Insert Keyframes if Action present
-        if anim_data:
-            if anim_data.action:
-                if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                    #Collect Local Transforms
-                    HandIkCtrlRotEuler = pbones['hand_ik_ctrl_R'].rotation_euler.copy()
-                    HandIkCtrlRotQuat = pbones['hand_ik_ctrl_R'].rotation_quaternion.copy()
-                    HandIkCtrlScale = pbones['hand_ik_ctrl_R'].scale.copy()
-
-                    HandFkCtrlRotEuler = pbones['hand_fk_R'].rotation_euler.copy()
-                    HandFkCtrlRotQuat = pbones['hand_fk_R'].rotation_quaternion.copy()
-                    HandFkCtrlScale = pbones['hand_fk_R'].scale.copy()
-
-                    #Jump to next Frame
-                    bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
-
-                    #Key Property
-                    if self.space == 'Arm':
-                        bpy.context.active_object.pose.bones["properties_arm_R"].space_hand_R = 1.0
-                        refresh_hack()
-                    if self.space == 'Free':
-                        bpy.context.active_object.pose.bones["properties_arm_R"].space_hand_R = 0.0
-                        refresh_hack()
-                    pbones["properties_arm_R"].keyframe_insert(data_path='space_hand_R')
-
-                    #Re-Paste Transforms
-                    pbones['hand_ik_ctrl_R'].rotation_euler = HandIkCtrlRotEuler
-                    pbones['hand_ik_ctrl_R'].rotation_quaternion = HandIkCtrlRotQuat
-                    pbones['hand_ik_ctrl_R'].scale = HandIkCtrlScale
-                    refresh_hack()
-                    pbones['hand_fk_R'].rotation_euler = HandFkCtrlRotEuler
-                    pbones['hand_fk_R'].rotation_quaternion = HandFkCtrlRotQuat
-                    pbones['hand_fk_R'].scale = HandFkCtrlScale
-                    refresh_hack()
-
-                    insert_bkeys('hand_ik_ctrl_R', 'LocRotScale')
-                    insert_bkeys('hand_fk_R', 'LocRotScale')
-
-        return {"FINISHED"}
-
-#Create Space PopUp
-def Hand_Space_List_R(self, context):
-    col = self.layout.column()
-    col.operator("switch.hand_space_r", text = "Arm").space = 'Arm'
-    col.operator("switch.hand_space_r", text = "Free").space = 'Free'
-
-class Operator_Show_Hand_Space_List_R(bpy.types.Operator):
-    bl_idname = "show.hand_list_r"
-    bl_label = "Hand_R Space Switch List"
-    bl_description = "Switch Hand_R Space"
-
-    def invoke(self, context, event):
-        context.window_manager.popup_menu(Hand_Space_List_R, title='Switch Hand_R Space', icon='MOD_ARMATURE')
-        return {'FINISHED'}
-
-##### Arm_Pole_R Space #####
-
-class Operator_Switch_Arm_Pole_Space_R(bpy.types.Operator):
-
-    bl_idname = "switch.arm_pole_space_r"
-    bl_label = "BlenRig Switch Arm_R Pole Space"
-    bl_description = "Switch Arm_R Pole Space preserving pose"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
-
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
-
-    #Create string property to parse argument to the operator
-    space : bpy.props.StringProperty()
-
-    def execute(self, context):
-
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        anim_data = armobj.animation_data
-
-        #Insert Keyframes if Action present
-        if anim_data:
-            if anim_data.action:
-                if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                    pbones["properties_arm_R"].keyframe_insert(data_path='space_arm_ik_pole_R')
-                    insert_bkeys('elbow_pole_R', 'Loc')
-
-        #Collect Matrix
-        PoleMat = pbones['elbow_pole_R'].matrix.copy()
-
-        if self.space == 'Free':
-            bpy.context.active_object.pose.bones["properties_arm_R"].space_arm_ik_pole_R = 0.0
-            refresh_hack()
-        if self.space == 'Torso':
-            bpy.context.active_object.pose.bones["properties_arm_R"].space_arm_ik_pole_R = 1.0
-            refresh_hack()
-
-        #Paste Matrix
-        pbones['elbow_pole_R'].matrix = PoleMat
-        refresh_hack()
-
-        #Insert Keyframes if Action present
-        if anim_data:
-            if anim_data.action:
-                if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                    #Collect Local Transforms
-                    PoleLoc = pbones['elbow_pole_R'].location.copy()
-
-                    #Jump to next Frame
-                    bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
-
-                    #Key Property
-                    if self.space == 'Free':
-                        bpy.context.active_object.pose.bones["properties_arm_R"].space_arm_ik_pole_R = 0.0
-                        refresh_hack()
-                    if self.space == 'Torso':
-                        bpy.context.active_object.pose.bones["properties_arm_R"].space_arm_ik_pole_R = 1.0
-                        refresh_hack()
-                    pbones["properties_arm_R"].keyframe_insert(data_path='space_arm_ik_pole_R')
-
-                    #Re-Paste Transforms
-                    pbones['elbow_pole_R'].location = PoleLoc
-                    refresh_hack()
-
-                    insert_bkeys('elbow_pole_R', 'Loc')
-
-        return {"FINISHED"}
-
-#Create Space PopUp
-def Arm_Pole_Space_List_R(self, context):
-    col = self.layout.column()
-    col.operator("switch.arm_pole_space_r", text = "Free").space = 'Free'
-    col.operator("switch.arm_pole_space_r", text = "Torso").space = 'Torso'
-
-class Operator_Show_Arm_Pole_Space_List_R(bpy.types.Operator):
-    bl_idname = "show.arm_pole_list_r"
-    bl_label = "Arm_R Pole Space Switch List"
-    bl_description = "Switch Arm_R Pole Space"
-
-    def invoke(self, context, event):
-        context.window_manager.popup_menu(Arm_Pole_Space_List_R, title='Switch Arm_R Pole Space', icon='MOD_ARMATURE')
-        return {'FINISHED'}
-
-##### All Fingers_R Space #####
-
-class Operator_Switch_Fing_All_Space_R(bpy.types.Operator):
-
-    bl_idname = "switch.fing_all_space_r"
-    bl_label = "BlenRig Switch All Fingers_R Space"
-    bl_description = "Switch All Fingers_R Space preserving pose"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
-
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
-
-    #Create string property to parse argument to the operator
-    space : bpy.props.StringProperty()
-
-    def execute(self, context):
-
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        dbones = armobj.data.bones
-        anim_data = armobj.animation_data
-
-        if self.space == 'Free':
-            bpy.ops.switch.fing_thumb_space_r(space='Free')
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        #Jump to previous Frame
-                        bpy.context.scene.frame_set (bpy.context.scene.frame_current - 1)
-            bpy.ops.switch.fing_ind_space_r(space='Free')
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        #Jump to previous Frame
-                        bpy.context.scene.frame_set (bpy.context.scene.frame_current - 1)
-            bpy.ops.switch.fing_mid_space_r(space='Free')
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        #Jump to previous Frame
-                        bpy.context.scene.frame_set (bpy.context.scene.frame_current - 1)
-            bpy.ops.switch.fing_ring_space_r(space='Free')
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        #Jump to previous Frame
-                        bpy.context.scene.frame_set (bpy.context.scene.frame_current - 1)
-            bpy.ops.switch.fing_lit_space_r(space='Free')
-
-            #Change Space
-            bpy.context.active_object.pose.bones["properties_arm_R"].space_fing_all_R = 0.0
-
-        if self.space == 'Hand':
-            bpy.ops.switch.fing_thumb_space_r(space='Hand')
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        #Jump to previous Frame
-                        bpy.context.scene.frame_set (bpy.context.scene.frame_current - 1)
-            bpy.ops.switch.fing_ind_space_r(space='Hand')
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        #Jump to previous Frame
-                        bpy.context.scene.frame_set (bpy.context.scene.frame_current - 1)
-            bpy.ops.switch.fing_mid_space_r(space='Hand')
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        #Jump to previous Frame
-                        bpy.context.scene.frame_set (bpy.context.scene.frame_current - 1)
-            bpy.ops.switch.fing_ring_space_r(space='Hand')
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        #Jump to previous Frame
-                        bpy.context.scene.frame_set (bpy.context.scene.frame_current - 1)
-            bpy.ops.switch.fing_lit_space_r(space='Hand')
-
-            #Change Space
-            bpy.context.active_object.pose.bones["properties_arm_R"].space_fing_all_R = 1.0
-
-        return {"FINISHED"}
-
-#Create Space PopUp
-def Fing_All_Space_List_R(self, context):
-    col = self.layout.column()
-    col.operator("switch.fing_all_space_r", text = "Free").space = 'Free'
-    col.operator("switch.fing_all_space_r", text = "Hand").space = 'Hand'
-
-class Operator_Show_Fing_All_Space_List_R(bpy.types.Operator):
-    bl_idname = "show.fing_all_list_r"
-    bl_label = "All Fingers_R Space Switch List"
-    bl_description = "Switch All Fingers_R Space"
-
-    def invoke(self, context, event):
-        context.window_manager.popup_menu(Fing_All_Space_List_R, title='Switch All Fingers_R Space', icon='MOD_ARMATURE')
-        return {'FINISHED'}
-
-##### Thumb Finger_R Space #####
-
-class Operator_Switch_Fing_Thumb_Space_R(bpy.types.Operator):
-
-    bl_idname = "switch.fing_thumb_space_r"
-    bl_label = "BlenRig Switch Thumb Finger_R Space"
-    bl_description = "Switch Thumb Finger_R Space preserving pose"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
-
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
-
-    #Create string property to parse argument to the operator
-    space : bpy.props.StringProperty()
-
-    def execute(self, context):
-
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        dbones = armobj.data.bones
-        anim_data = armobj.animation_data
-        try:
-            #Insert Keyframes if Action present
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        pbones["properties_arm_R"].keyframe_insert(data_path='space_fing_thumb_R')
-                        insert_bkeys('fing_thumb_ik_R', 'Loc')
-
-            if self.space == 'Free':
-                #Get Matrix in previous space
-                Thumb_world_mat = pbones['fing_thumb_ik_R'].id_data.matrix_world.copy()
-                Thumb_mat = pbones['fing_thumb_ik_R'].matrix.copy()
-
-                #Change Space
-                bpy.context.active_object.pose.bones["properties_arm_R"].space_fing_thumb_R = 0.0
-
-                paste_visual_matrix('fing_thumb_ik_R', 'master_pivot', Thumb_world_mat, Thumb_mat, 'Location')
-
-            if self.space == 'Hand':
-                #Get Matrix in previous space
-                Thumb_world_mat = pbones['fing_thumb_ik_R'].id_data.matrix_world.copy()
-                Thumb_mat = pbones['fing_thumb_ik_R'].matrix.copy()
-
-                #Change Space
-                bpy.context.active_object.pose.bones["properties_arm_R"].space_fing_thumb_R = 1.0
-
-                paste_visual_matrix('fing_thumb_ik_R', 'fing_thumb_ctrl_track_R', Thumb_world_mat, Thumb_mat, 'Location')
-
-            #Insert Keyframes if Action present
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        #Collect Local Transforms
-                        ThumbLoc = pbones['fing_thumb_ik_R'].location.copy()
-
-                        #Jump to next Frame
-                        bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
-
-                        #Key Property
-                        if self.space == 'Free':
-                            bpy.context.active_object.pose.bones["properties_arm_R"].space_fing_thumb_R = 0.0
-                            refresh_hack()
-                        if self.space == 'Hand':
-                            bpy.context.active_object.pose.bones["properties_arm_R"].space_fing_thumb_R = 1.0
-                            refresh_hack()
-                        pbones["properties_arm_R"].keyframe_insert(data_path='space_fing_thumb_R')
-
-                        #Re-Paste Transforms
-                        pbones['fing_thumb_ik_R'].location = ThumbLoc
-                        refresh_hack()
-
-                        insert_bkeys('fing_thumb_ik_R', 'Loc')
-        except:
-            pass
-        return {"FINISHED"}
-
-#Create Space PopUp
-def Fing_Thumb_Space_List_R(self, context):
-    col = self.layout.column()
-    col.operator("switch.fing_thumb_space_r", text = "Free").space = 'Free'
-    col.operator("switch.fing_thumb_space_r", text = "Hand").space = 'Hand'
-
-class Operator_Show_Fing_Thumb_Space_List_R(bpy.types.Operator):
-    bl_idname = "show.fing_thumb_list_r"
-    bl_label = "Thumb Finger_R Space Switch List"
-    bl_description = "Switch Thumb Finger_R Space"
-
-    def invoke(self, context, event):
-        context.window_manager.popup_menu(Fing_Thumb_Space_List_R, title='Switch Thumb Finger_R Space', icon='MOD_ARMATURE')
-        return {'FINISHED'}
-
-##### Ind Finger_R Space #####
-
-class Operator_Switch_Fing_Ind_Space_R(bpy.types.Operator):
-
-    bl_idname = "switch.fing_ind_space_r"
-    bl_label = "BlenRig Switch Index Finger_R Space"
-    bl_description = "Switch Index Finger_R Space preserving pose"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
-
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
-
-    #Create string property to parse argument to the operator
-    space : bpy.props.StringProperty()
-
-    def execute(self, context):
-
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        dbones = armobj.data.bones
-        anim_data = armobj.animation_data
-        try:
-            #Insert Keyframes if Action present
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        pbones["properties_arm_R"].keyframe_insert(data_path='space_fing_ind_R')
-                        insert_bkeys('fing_ind_ik_R', 'Loc')
-
-            if self.space == 'Free':
-                #Get Matrix in previous space
-                Ind_world_mat = pbones['fing_ind_ik_R'].id_data.matrix_world.copy()
-                Ind_mat = pbones['fing_ind_ik_R'].matrix.copy()
-
-                #Change Space
-                bpy.context.active_object.pose.bones["properties_arm_R"].space_fing_ind_R = 0.0
-
-                paste_visual_matrix('fing_ind_ik_R', 'master_pivot', Ind_world_mat, Ind_mat, 'Location')
-
-            if self.space == 'Hand':
-                #Get Matrix in previous space
-                Ind_world_mat = pbones['fing_ind_ik_R'].id_data.matrix_world.copy()
-                Ind_mat = pbones['fing_ind_ik_R'].matrix.copy()
-
-                #Change Space
-                bpy.context.active_object.pose.bones["properties_arm_R"].space_fing_ind_R = 1.0
-
-                paste_visual_matrix('fing_ind_ik_R', 'fing_ind_ctrl_track_R', Ind_world_mat, Ind_mat, 'Location')
-
-            #Insert Keyframes if Action present
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        #Collect Local Transforms
-                        IndLoc = pbones['fing_ind_ik_R'].location.copy()
-
-                        #Jump to next Frame
-                        bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
-
-                        #Key Property
-                        if self.space == 'Free':
-                            bpy.context.active_object.pose.bones["properties_arm_R"].space_fing_ind_R = 0.0
-                            refresh_hack()
-                        if self.space == 'Hand':
-                            bpy.context.active_object.pose.bones["properties_arm_R"].space_fing_ind_R = 1.0
-                            refresh_hack()
-                        pbones["properties_arm_R"].keyframe_insert(data_path='space_fing_ind_R')
-
-                        #Re-Paste Transforms
-                        pbones['fing_ind_ik_R'].location = IndLoc
-                        refresh_hack()
-
-                        insert_bkeys('fing_ind_ik_R', 'Loc')
-        except:
-            pass
-        return {"FINISHED"}
-
-#Create Space PopUp
-def Fing_Ind_Space_List_R(self, context):
-    col = self.layout.column()
-    col.operator("switch.fing_ind_space_r", text = "Free").space = 'Free'
-    col.operator("switch.fing_ind_space_r", text = "Hand").space = 'Hand'
-
-class Operator_Show_Fing_Ind_Space_List_R(bpy.types.Operator):
-    bl_idname = "show.fing_ind_list_r"
-    bl_label = "Index Finger_R Space Switch List"
-    bl_description = "Switch Index Finger_R Space"
-
-    def invoke(self, context, event):
-        context.window_manager.popup_menu(Fing_Ind_Space_List_R, title='Switch Index Finger_R Space', icon='MOD_ARMATURE')
-        return {'FINISHED'}
-
-##### Mid Finger_R Space #####
-
-class Operator_Switch_Fing_Mid_Space_R(bpy.types.Operator):
-
-    bl_idname = "switch.fing_mid_space_r"
-    bl_label = "BlenRig Switch Middle Finger_R Space"
-    bl_description = "Switch Middle Finger_R Space preserving pose"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
-
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
-
-    #Create string property to parse argument to the operator
-    space : bpy.props.StringProperty()
-
-    def execute(self, context):
-
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        dbones = armobj.data.bones
-        anim_data = armobj.animation_data
-        try:
-            #Insert Keyframes if Action present
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        pbones["properties_arm_R"].keyframe_insert(data_path='space_fing_mid_R')
-                        insert_bkeys('fing_mid_ik_R', 'Loc')
-
-            if self.space == 'Free':
-                #Get Matrix in previous space
-                Mid_world_mat = pbones['fing_mid_ik_R'].id_data.matrix_world.copy()
-                Mid_mat = pbones['fing_mid_ik_R'].matrix.copy()
-
-                #Change Space
-                bpy.context.active_object.pose.bones["properties_arm_R"].space_fing_mid_R = 0.0
-
-                paste_visual_matrix('fing_mid_ik_R', 'master_pivot', Mid_world_mat, Mid_mat, 'Location')
-
-            if self.space == 'Hand':
-                #Get Matrix in previous space
-                Mid_world_mat = pbones['fing_mid_ik_R'].id_data.matrix_world.copy()
-                Mid_mat = pbones['fing_mid_ik_R'].matrix.copy()
-
-                #Change Space
-                bpy.context.active_object.pose.bones["properties_arm_R"].space_fing_mid_R = 1.0
-
-                paste_visual_matrix('fing_mid_ik_R', 'fing_mid_ctrl_track_R', Mid_world_mat, Mid_mat, 'Location')
-
-            #Insert Keyframes if Action present
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        #Collect Local Transforms
-                        MidLoc = pbones['fing_mid_ik_R'].location.copy()
-
-                        #Jump to next Frame
-                        bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
-
-                        #Key Property
-                        if self.space == 'Free':
-                            bpy.context.active_object.pose.bones["properties_arm_R"].space_fing_mid_R = 0.0
-                            refresh_hack()
-                        if self.space == 'Hand':
-                            bpy.context.active_object.pose.bones["properties_arm_R"].space_fing_mid_R = 1.0
-                            refresh_hack()
-                        pbones["properties_arm_R"].keyframe_insert(data_path='space_fing_mid_R')
-
-                        #Re-Paste Transforms
-                        pbones['fing_mid_ik_R'].location = MidLoc
-                        refresh_hack()
-
-                        insert_bkeys('fing_mid_ik_R', 'Loc')
-        except:
-            pass
-        return {"FINISHED"}
-
-#Create Space PopUp
-def Fing_Mid_Space_List_R(self, context):
-    col = self.layout.column()
-    col.operator("switch.fing_mid_space_r", text = "Free").space = 'Free'
-    col.operator("switch.fing_mid_space_r", text = "Hand").space = 'Hand'
-
-class Operator_Show_Fing_Mid_Space_List_R(bpy.types.Operator):
-    bl_idname = "show.fing_mid_list_r"
-    bl_label = "Middle Finger_R Space Switch List"
-    bl_description = "Switch Middle Finger_R Space"
-
-    def invoke(self, context, event):
-        context.window_manager.popup_menu(Fing_Mid_Space_List_R, title='Switch Middle Finger_R Space', icon='MOD_ARMATURE')
-        return {'FINISHED'}
-
-##### Ring Finger_R Space #####
-
-class Operator_Switch_Fing_Ring_Space_R(bpy.types.Operator):
-
-    bl_idname = "switch.fing_ring_space_r"
-    bl_label = "BlenRig Switch Ring Finger_R Space"
-    bl_description = "Switch Ring Finger_R Space preserving pose"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
-
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
-
-    #Create string property to parse argument to the operator
-    space : bpy.props.StringProperty()
-
-    def execute(self, context):
-
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        dbones = armobj.data.bones
-        anim_data = armobj.animation_data
-        try:
-            #Insert Keyframes if Action present
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        pbones["properties_arm_R"].keyframe_insert(data_path='space_fing_ring_R')
-                        insert_bkeys('fing_ring_ik_R', 'Loc')
-
-            if self.space == 'Free':
-                #Get Matrix in previous space
-                Ring_world_mat = pbones['fing_ring_ik_R'].id_data.matrix_world.copy()
-                Ring_mat = pbones['fing_ring_ik_R'].matrix.copy()
-
-                #Change Space
-                bpy.context.active_object.pose.bones["properties_arm_R"].space_fing_ring_R = 0.0
-
-                paste_visual_matrix('fing_ring_ik_R', 'master_pivot', Ring_world_mat, Ring_mat, 'Location')
-
-            if self.space == 'Hand':
-                #Get Matrix in previous space
-                Ring_world_mat = pbones['fing_ring_ik_R'].id_data.matrix_world.copy()
-                Ring_mat = pbones['fing_ring_ik_R'].matrix.copy()
-
-                #Change Space
-                bpy.context.active_object.pose.bones["properties_arm_R"].space_fing_ring_R = 1.0
-
-                paste_visual_matrix('fing_ring_ik_R', 'fing_ring_ctrl_track_R', Ring_world_mat, Ring_mat, 'Location')
-
-            #Insert Keyframes if Action present
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        #Collect Local Transforms
-                        RingLoc = pbones['fing_ring_ik_R'].location.copy()
-
-                        #Jump to next Frame
-                        bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
-
-                        #Key Property
-                        if self.space == 'Free':
-                            bpy.context.active_object.pose.bones["properties_arm_R"].space_fing_ring_R = 0.0
-                            refresh_hack()
-                        if self.space == 'Hand':
-                            bpy.context.active_object.pose.bones["properties_arm_R"].space_fing_ring_R = 1.0
-                            refresh_hack()
-                        pbones["properties_arm_R"].keyframe_insert(data_path='space_fing_ring_R')
-
-                        #Re-Paste Transforms
-                        pbones['fing_ring_ik_R'].location = RingLoc
-                        refresh_hack()
-
-                        insert_bkeys('fing_ring_ik_R', 'Loc')
-        except:
-            pass
-        return {"FINISHED"}
-
-#Create Space PopUp
-def Fing_Ring_Space_List_R(self, context):
-    col = self.layout.column()
-    col.operator("switch.fing_ring_space_r", text = "Free").space = 'Free'
-    col.operator("switch.fing_ring_space_r", text = "Hand").space = 'Hand'
-
-class Operator_Show_Fing_Ring_Space_List_R(bpy.types.Operator):
-    bl_idname = "show.fing_ring_list_r"
-    bl_label = "Ring Finger_R Space Switch List"
-    bl_description = "Switch Ring Finger_R Space"
-
-    def invoke(self, context, event):
-        context.window_manager.popup_menu(Fing_Ring_Space_List_R, title='Switch Ring Finger_R Space', icon='MOD_ARMATURE')
-        return {'FINISHED'}
-
-##### Lit Finger_R Space #####
-
-class Operator_Switch_Fing_Lit_Space_R(bpy.types.Operator):
-
-    bl_idname = "switch.fing_lit_space_r"
-    bl_label = "BlenRig Switch Little Finger_R Space"
-    bl_description = "Switch Little Finger_R Space preserving pose"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
-
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
-
-    #Create string property to parse argument to the operator
-    space : bpy.props.StringProperty()
-
-    def execute(self, context):
-
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        dbones = armobj.data.bones
-        anim_data = armobj.animation_data
-        try:
-            #Insert Keyframes if Action present
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        pbones["properties_arm_R"].keyframe_insert(data_path='space_fing_lit_R')
-                        insert_bkeys('fing_lit_ik_R', 'Loc')
-
-            if self.space == 'Free':
-                #Get Matrix in previous space
-                Lit_world_mat = pbones['fing_lit_ik_R'].id_data.matrix_world.copy()
-                Lit_mat = pbones['fing_lit_ik_R'].matrix.copy()
-
-                #Change Space
-                bpy.context.active_object.pose.bones["properties_arm_R"].space_fing_lit_R = 0.0
-
-                paste_visual_matrix('fing_lit_ik_R', 'master_pivot', Lit_world_mat, Lit_mat, 'Location')
-
-            if self.space == 'Hand':
-                #Get Matrix in previous space
-                Lit_world_mat = pbones['fing_lit_ik_R'].id_data.matrix_world.copy()
-                Lit_mat = pbones['fing_lit_ik_R'].matrix.copy()
-
-                #Change Space
-                bpy.context.active_object.pose.bones["properties_arm_R"].space_fing_lit_R = 1.0
-
-                paste_visual_matrix('fing_lit_ik_R', 'fing_lit_ctrl_track_R', Lit_world_mat, Lit_mat, 'Location')
-
-            #Insert Keyframes if Action present
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        #Collect Local Transforms
-                        LitLoc = pbones['fing_lit_ik_R'].location.copy()
-
-                        #Jump to next Frame
-                        bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
-
-                        #Key Property
-                        if self.space == 'Free':
-                            bpy.context.active_object.pose.bones["properties_arm_R"].space_fing_lit_R = 0.0
-                            refresh_hack()
-                        if self.space == 'Hand':
-                            bpy.context.active_object.pose.bones["properties_arm_R"].space_fing_lit_R = 1.0
-                            refresh_hack()
-                        pbones["properties_arm_R"].keyframe_insert(data_path='space_fing_lit_R')
-
-                        #Re-Paste Transforms
-                        pbones['fing_lit_ik_R'].location = LitLoc
-                        refresh_hack()
-
-                        insert_bkeys('fing_lit_ik_R', 'Loc')
-        except:
-            pass
-        return {"FINISHED"}
-
-#Create Space PopUp
-def Fing_Lit_Space_List_R(self, context):
-    col = self.layout.column()
-    col.operator("switch.fing_lit_space_r", text = "Free").space = 'Free'
-    col.operator("switch.fing_lit_space_r", text = "Hand").space = 'Hand'
-
-class Operator_Show_Fing_Lit_Space_List_R(bpy.types.Operator):
-    bl_idname = "show.fing_lit_list_r"
-    bl_label = "Little Finger_R Space Switch List"
-    bl_description = "Switch Little Finger_R Space"
-
-    def invoke(self, context, event):
-        context.window_manager.popup_menu(Fing_Lit_Space_List_R, title='Switch Little Finger_R Space', icon='MOD_ARMATURE')
-        return {'FINISHED'}
-
-##### Leg_R IK>FK #####
-
-class Operator_Snap_LegIKtoFK_R(bpy.types.Operator):
-
-    bl_idname = "snap.leg_ik_to_fk_r"
-    bl_label = "BlenRig Leg_R IK to FK"
-    bl_description = "Switch Leg to FK preserving pose"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
-
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
-
-    def execute(self, context):
-
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        anim_data = armobj.animation_data
-
-        if bpy.context.active_object.pose.bones["properties_leg_R"].ik_leg_R < 0.1:
-
-            #Collect Matrix
-            ThighFkMat = pbones['thigh_fk_R'].matrix.copy()
-            ThighFkLoc = pbones['thigh_fk_R'].location.copy()
-            ThighFkScale = pbones['thigh_fk_R'].scale.copy()
-            ShinFkMat = pbones['shin_fk_R'].matrix.copy()
-            ShinFkLoc = pbones['shin_fk_R'].location.copy()
-            ShinFkScale = pbones['shin_fk_R'].scale.copy()
-            FootFkMat = pbones['foot_fk_R'].matrix.copy()
-            FootFkLoc = pbones['foot_fk_R'].location.copy()
-            FootFkScale = pbones['foot_fk_R'].scale.copy()
-            FootToe1FkMat = pbones['foot_toe_1_fk_R'].matrix.copy()
-            FootToe1FkLoc = pbones['foot_toe_1_fk_R'].location.copy()
-            FootToe1FkScale = pbones['foot_toe_1_fk_R'].scale.copy()
-            FootToe2FkMat = pbones['foot_toe_2_fk_R'].matrix.copy()
-            FootToe2FkLoc = pbones['foot_toe_2_fk_R'].location.copy()
-            FootToe2FkScale = pbones['foot_toe_2_fk_R'].scale.copy()
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                    TarsalFkMat = pbones['tarsal_fk_R'].matrix.copy()
-                    TarsalFkLoc = pbones['tarsal_fk_R'].location.copy()
-                    TarsalFkScale = pbones['tarsal_fk_R'].scale.copy()
-
-            #Insert Keyframes if Action present
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        pbones["properties_leg_R"].keyframe_insert(data_path='ik_leg_R')
-                        insert_bkeys('thigh_fk_R', 'LocRotScale')
-                        insert_bkeys('shin_fk_R', 'LocRotScale')
-                        insert_bkeys('thigh_fk_ctrl_R', 'LocRotScale')
-                        insert_bkeys('foot_fk_R', 'LocRotScale')
-                        insert_bkeys('foot_toe_1_fk_R', 'LocRotScale')
-                        insert_bkeys('foot_toe_2_fk_R', 'LocRotScale')
-                        insert_bkeys('thigh_ik_R', 'RotScale')
-                        insert_bkeys('shin_ik_R', 'RotScale')
-                        insert_bkeys('foot_ik_ctrl_R', 'LocRotScale')
-                        insert_bkeys('foot_toe_ik_ctrl_mid_R', 'LocRotScale')
-                        insert_bkeys('foot_toe_ik_ctrl_R', 'LocRotScale')
-                        insert_bkeys('foot_roll_ctrl_R', 'Rot')
-                        insert_bkeys('toe_roll_1_R', 'Rot')
-                        insert_bkeys('toe_roll_2_R', 'Rot')
-                        insert_bkeys('sole_ctrl_R', 'LocRotScale')
-                        if pbones["properties_leg_R"].toggle_leg_ik_pole_R == 1.0:
-                            insert_bkeys('knee_pole_R', 'Loc')
-                        for prop in bpy.context.active_object.data.items():
-                            if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                                insert_bkeys('tarsal_fk_R', 'LocRotScale')
-                                insert_bkeys('tarsal_ik_ctrl_R', 'LocRotScale')
-
-            bpy.context.active_object.pose.bones["properties_leg_R"].ik_leg_R = 1.0
-            refresh_hack()
-
-            #Paste Matrix
-            pVisRotExec (pbones['thigh_fk_ctrl_R'], pbones['thigh_ik_R'])
-            pbones['thigh_fk_ctrl_R'].scale[:] = (1.0, 1.0, 1.0)
-            refresh_hack()
-            pbones['thigh_fk_R'].matrix = ThighFkMat
-            pbones['thigh_fk_R'].location = ThighFkLoc
-            pbones['thigh_fk_R'].scale = ThighFkScale
-            refresh_hack()
-            pbones['shin_fk_R'].matrix = ShinFkMat
-            pbones['shin_fk_R'].location = ShinFkLoc
-            pbones['shin_fk_R'].scale = ShinFkScale
-            refresh_hack()
-            #Correct thigh_fk twist
-            pVisRotExec (pbones['thigh_fk_R'], pbones['thigh_rot_R'])
-            refresh_hack()
-            #Re-paste shin matrix
-            pbones['shin_fk_R'].matrix = ShinFkMat
-            pbones['shin_fk_R'].location = ShinFkLoc
-            pbones['shin_fk_R'].scale = ShinFkScale
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                    pbones['tarsal_fk_R'].matrix = TarsalFkMat
-                    pbones['tarsal_fk_R'].location = TarsalFkLoc
-                    pbones['tarsal_fk_R'].scale = TarsalFkScale
-                    refresh_hack()
-            pbones['foot_fk_R'].matrix = FootFkMat
-            pbones['foot_fk_R'].location = FootFkLoc
-            pbones['foot_fk_R'].scale = FootFkScale
-            refresh_hack()
-            pbones['foot_toe_1_fk_R'].matrix = FootToe1FkMat
-            pbones['foot_toe_1_fk_R'].location = FootToe1FkLoc
-            pbones['foot_toe_1_fk_R'].scale = FootToe1FkScale
-            refresh_hack()
-            pbones['foot_toe_2_fk_R'].matrix = FootToe2FkMat
-            pbones['foot_toe_2_fk_R'].location = FootToe2FkLoc
-            pbones['foot_toe_2_fk_R'].scale = FootToe2FkScale
-            refresh_hack()
-
-            #Insert Keyframes if Action present
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        #Collect Local Transforms
-
-                        ThighCtrlRotEuler = pbones['thigh_fk_ctrl_R'].rotation_euler.copy()
-                        ThighCtrlRotQuat = pbones['thigh_fk_ctrl_R'].rotation_quaternion.copy()
-                        ThighCtrlLoc = pbones['thigh_fk_ctrl_R'].location.copy()
-                        ThighCtrlScale = pbones['thigh_fk_ctrl_R'].scale.copy()
-
-                        ThighFkRotEuler = pbones['thigh_fk_R'].rotation_euler.copy()
-                        ThighFkRotQuat = pbones['thigh_fk_R'].rotation_quaternion.copy()
-                        ThighFkLoc = pbones['thigh_fk_R'].location.copy()
-                        ThighFkScale = pbones['thigh_fk_R'].scale.copy()
-
-                        ShinFkRotEuler = pbones['shin_fk_R'].rotation_euler.copy()
-                        ShinFkRotQuat = pbones['shin_fk_R'].rotation_quaternion.copy()
-                        ShinFkLoc = pbones['shin_fk_R'].location.copy()
-                        ShinFkScale = pbones['shin_fk_R'].scale.copy()
-
-                        for prop in bpy.context.active_object.data.items():
-                            if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                                TarsalFkRotEuler = pbones['tarsal_fk_R'].rotation_euler.copy()
-                                TarsalFkRotQuat = pbones['tarsal_fk_R'].rotation_quaternion.copy()
-                                TarsalFkLoc = pbones['tarsal_fk_R'].location.copy()
-                                TarsalFkScale = pbones['tarsal_fk_R'].scale.copy()
-
-                        FootFkRotEuler = pbones['foot_fk_R'].rotation_euler.copy()
-                        FootFkRotQuat = pbones['foot_fk_R'].rotation_quaternion.copy()
-                        FootFkLoc = pbones['foot_fk_R'].location.copy()
-                        FootFkScale = pbones['foot_fk_R'].scale.copy()
-
-                        FootToe1FkRotEuler = pbones['foot_toe_1_fk_R'].rotation_euler.copy()
-                        FootToe1FkRotQuat = pbones['foot_toe_1_fk_R'].rotation_quaternion.copy()
-                        FootToe1FkLoc = pbones['foot_toe_1_fk_R'].location.copy()
-                        FootToe1FkScale = pbones['foot_toe_1_fk_R'].scale.copy()
-
-                        FootToe2FkRotEuler = pbones['foot_toe_2_fk_R'].rotation_euler.copy()
-                        FootToe2FkRotQuat = pbones['foot_toe_2_fk_R'].rotation_quaternion.copy()
-                        FootToe2FkLoc = pbones['foot_toe_2_fk_R'].location.copy()
-                        FootToe2FkScale = pbones['foot_toe_2_fk_R'].scale.copy()
-
-                        #Jump to next Frame
-                        bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
-
-                        #Key Property
-                        armobj.pose.bones["properties_leg_R"].ik_leg_R = 1.0
-                        refresh_hack()
-                        pbones["properties_leg_R"].keyframe_insert(data_path='ik_leg_R')
-
-                        #Re-Paste Transforms
-                        pbones['thigh_fk_ctrl_R'].rotation_euler = ThighCtrlRotEuler
-                        pbones['thigh_fk_ctrl_R'].rotation_quaternion = ThighCtrlRotQuat
-                        pbones['thigh_fk_ctrl_R'].location = ThighCtrlLoc
-                        pbones['thigh_fk_ctrl_R'].scale = ThighCtrlScale
-                        refresh_hack()
-                        pbones['thigh_fk_R'].rotation_euler = ThighFkRotEuler
-                        pbones['thigh_fk_R'].rotation_quaternion = ThighFkRotQuat
-                        pbones['thigh_fk_R'].location = ThighFkLoc
-                        pbones['thigh_fk_R'].scale = ThighFkScale
-                        refresh_hack()
-                        pbones['shin_fk_R'].rotation_euler = ShinFkRotEuler
-                        pbones['shin_fk_R'].rotation_quaternion = ShinFkRotQuat
-                        pbones['shin_fk_R'].location = ShinFkLoc
-                        pbones['shin_fk_R'].scale = ShinFkScale
-                        refresh_hack()
-                        for prop in bpy.context.active_object.data.items():
-                            if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                                pbones['tarsal_fk_R'].rotation_euler = TarsalFkRotEuler
-                                pbones['tarsal_fk_R'].rotation_quaternion = TarsalFkRotQuat
-                                pbones['tarsal_fk_R'].location = TarsalFkLoc
-                                pbones['tarsal_fk_R'].scale = TarsalFkScale
-                                refresh_hack()
-                        pbones['foot_fk_R'].rotation_euler = FootFkRotEuler
-                        pbones['foot_fk_R'].rotation_quaternion = FootFkRotQuat
-                        pbones['foot_fk_R'].location = FootFkLoc
-                        pbones['foot_fk_R'].scale = FootFkScale
-                        refresh_hack()
-                        pbones['foot_toe_1_fk_R'].rotation_euler = FootToe1FkRotEuler
-                        pbones['foot_toe_1_fk_R'].rotation_quaternion = FootToe1FkRotQuat
-                        pbones['foot_toe_1_fk_R'].location = FootToe1FkLoc
-                        pbones['foot_toe_1_fk_R'].scale = FootToe1FkScale
-                        refresh_hack()
-                        pbones['foot_toe_2_fk_R'].rotation_euler = FootToe2FkRotEuler
-                        pbones['foot_toe_2_fk_R'].rotation_quaternion = FootToe2FkRotQuat
-                        pbones['foot_toe_2_fk_R'].location = FootToe2FkLoc
-                        pbones['foot_toe_2_fk_R'].scale = FootToe2FkScale
-                        refresh_hack()
-
-                        insert_bkeys('thigh_fk_R', 'LocRotScale')
-                        insert_bkeys('shin_fk_R', 'LocRotScale')
-                        insert_bkeys('thigh_fk_ctrl_R', 'LocRotScale')
-                        insert_bkeys('foot_fk_R', 'LocRotScale')
-                        insert_bkeys('foot_toe_1_fk_R', 'LocRotScale')
-                        insert_bkeys('foot_toe_2_fk_R', 'LocRotScale')
-                        insert_bkeys('thigh_ik_R', 'RotScale')
-                        insert_bkeys('shin_ik_R', 'RotScale')
-                        insert_bkeys('foot_ik_ctrl_R', 'LocRotScale')
-                        insert_bkeys('foot_toe_ik_ctrl_mid_R', 'LocRotScale')
-                        insert_bkeys('foot_toe_ik_ctrl_R', 'LocRotScale')
-                        insert_bkeys('foot_roll_ctrl_R', 'Rot')
-                        insert_bkeys('toe_roll_1_R', 'Rot')
-                        insert_bkeys('toe_roll_2_R', 'Rot')
-                        insert_bkeys('sole_ctrl_R', 'LocRotScale')
-                        if pbones["properties_leg_R"].toggle_leg_ik_pole_R == 1.0:
-                            insert_bkeys('knee_pole_R', 'Loc')
-                        for prop in bpy.context.active_object.data.items():
-                            if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                                insert_bkeys('tarsal_fk_R', 'LocRotScale')
-                                insert_bkeys('tarsal_ik_ctrl_R', 'LocRotScale')
-
-        return {"FINISHED"}
-
-##### Leg_R FK>IK #####
-
-class Operator_Snap_LegFKtoIK_R(bpy.types.Operator):
-
-    bl_idname = "snap.leg_fk_to_ik_r"
-    bl_label = "BlenRig Leg_R IK to FK"
-    bl_description = "Switch Leg to IK preserving pose"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
-
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
-
-    def execute(self, context):
-
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        anim_data = armobj.animation_data
-
-        if bpy.context.active_object.pose.bones["properties_leg_R"].ik_leg_R > 0.9:
-
-            #Collect Matrix
-            ThighFkMat = pbones['thigh_fk_R'].matrix.copy()
-            ThighFkLoc = pbones['thigh_fk_R'].location.copy()
-            ThighFkScale = pbones['thigh_fk_R'].scale.copy()
-            ShinFkMat = pbones['shin_fk_R'].matrix.copy()
-            ShinFkLoc = pbones['shin_fk_R'].location.copy()
-            ShinFkScale = pbones['shin_fk_R'].scale.copy()
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                    TarsalFkMat = pbones['tarsal_fk_R'].matrix.copy()
-                    TarsalFkLoc = pbones['tarsal_fk_R'].location.copy()
-                    TarsalFkScale = pbones['tarsal_fk_R'].scale.copy()
-            FootToe1FkMat = pbones['foot_toe_1_fk_R'].matrix.copy()
-            FootToe1FkLoc = pbones['foot_toe_1_fk_R'].location.copy()
-            FootToe1FkScale = pbones['foot_toe_1_fk_R'].scale.copy()
-            FootToe2FkMat = pbones['foot_toe_2_fk_R'].matrix.copy()
-            FootToe2FkLoc = pbones['foot_toe_2_fk_R'].location.copy()
-            FootToe2FkScale = pbones['foot_toe_2_fk_R'].scale.copy()
-
-            #Insert Keyframes if Action present
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        pbones["properties_leg_R"].keyframe_insert(data_path='ik_leg_R')
-                        insert_bkeys('thigh_fk_R', 'LocRotScale')
-                        insert_bkeys('shin_fk_R', 'LocRotScale')
-                        insert_bkeys('thigh_fk_ctrl_R', 'LocRotScale')
-                        insert_bkeys('foot_fk_R', 'LocRotScale')
-                        insert_bkeys('foot_toe_1_fk_R', 'LocRotScale')
-                        insert_bkeys('foot_toe_2_fk_R', 'LocRotScale')
-                        insert_bkeys('thigh_ik_R', 'RotScale')
-                        insert_bkeys('shin_ik_R', 'RotScale')
-                        insert_bkeys('foot_ik_ctrl_R', 'LocRotScale')
-                        insert_bkeys('foot_toe_ik_ctrl_mid_R', 'LocRotScale')
-                        insert_bkeys('foot_toe_ik_ctrl_R', 'LocRotScale')
-                        insert_bkeys('foot_roll_ctrl_R', 'Rot')
-                        insert_bkeys('toe_roll_1_R', 'Rot')
-                        insert_bkeys('toe_roll_2_R', 'Rot')
-                        insert_bkeys('sole_ctrl_R', 'LocRotScale')
-                        if pbones["properties_leg_R"].toggle_leg_ik_pole_R == 1.0:
-                            insert_bkeys('knee_pole_R', 'Loc')
-                        for prop in bpy.context.active_object.data.items():
-                            if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                                insert_bkeys('tarsal_fk_R', 'LocRotScale')
-                                insert_bkeys('tarsal_ik_ctrl_R', 'LocRotScale')
-
-            #Paste Matrix
-            pVisLocExec(pbones['sole_ctrl_R'], pbones['snap_sole_ctrl_fk_R'])
-            pVisRotExec(pbones['sole_ctrl_R'], pbones['snap_sole_ctrl_fk_R'])
-            refresh_hack()
-            pbones['foot_roll_ctrl_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
-            pbones['foot_ik_ctrl_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
-            pbones['foot_ik_ctrl_R'].location[:] = (0.0, 0.0, 0.0)
-            pbones['toe_roll_1_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
-            pbones['toe_roll_2_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
-            pbones['foot_toe_ik_ctrl_mid_R'].location[:] = (0.0, 0.0, 0.0)
-            pbones['foot_toe_ik_ctrl_mid_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
-            pbones['foot_toe_ik_ctrl_R'].location[:] = (0.0, 0.0, 0.0)
-            pbones['foot_toe_ik_ctrl_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
-            pVisLocExec(pbones['knee_pole_R'], pbones['snap_knee_pole_fk_R'])
-            refresh_hack()
-            pVisRotExec (pbones['thigh_ik_R'], pbones['thigh_rot_R'])
-            refresh_hack()
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                    pVisLocExec(pbones['tarsal_ik_ctrl_R'], pbones['snap_tarsal_fk_R'])
-                    pVisRotExec(pbones['tarsal_ik_ctrl_R'], pbones['snap_tarsal_fk_R'])
-                    refresh_hack()
-
-            bpy.context.active_object.pose.bones["properties_leg_R"].ik_leg_R = 0.0
-            refresh_hack()
-
-            pbones['thigh_fk_R'].matrix = ThighFkMat
-            pbones['thigh_fk_R'].location = ThighFkLoc
-            pbones['thigh_fk_R'].scale = ThighFkScale
-            refresh_hack()
-            pbones['shin_fk_R'].matrix = ShinFkMat
-            pbones['shin_fk_R'].location = ShinFkLoc
-            pbones['shin_fk_R'].scale = ShinFkScale
-            refresh_hack()
-            #Correct thigh_fk twist
-            pVisRotExec (pbones['thigh_fk_R'], pbones['thigh_rot_R'])
-            refresh_hack()
-            #Re-paste shin matrix
-            pbones['shin_fk_R'].matrix = ShinFkMat
-            pbones['shin_fk_R'].location = ShinFkLoc
-            pbones['shin_fk_R'].scale = ShinFkScale
-            refresh_hack()
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                    pbones['tarsal_fk_R'].matrix = TarsalFkMat
-                    pbones['tarsal_fk_R'].location = TarsalFkLoc
-                    pbones['tarsal_fk_R'].scale = TarsalFkScale
-                    refresh_hack()
-            pbones['foot_toe_1_fk_R'].matrix = FootToe1FkMat
-            pbones['foot_toe_1_fk_R'].location = FootToe1FkLoc
-            pbones['foot_toe_1_fk_R'].scale = FootToe1FkScale
-            refresh_hack()
-            pbones['foot_toe_2_fk_R'].matrix = FootToe2FkMat
-            pbones['foot_toe_2_fk_R'].location = FootToe2FkLoc
-            pbones['foot_toe_2_fk_R'].scale = FootToe2FkScale
-            refresh_hack()
-
-            #Insert Keyframes if Action present
-            if anim_data:
-                if anim_data.action:
-                    if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        #Collect Local Transforms
-
-                        SoleCtrlRotEuler = pbones['sole_ctrl_R'].rotation_euler.copy()
-                        SoleCtrlRotQuat = pbones['sole_ctrl_R'].rotation_quaternion.copy()
-                        SoleCtrlLoc = pbones['sole_ctrl_R'].location.copy()
-                        SoleCtrlScale = pbones['sole_ctrl_R'].scale.copy()
-
-                        KneePoleRotEuler = pbones['knee_pole_R'].rotation_euler.copy()
-                        KneePoleRotQuat = pbones['knee_pole_R'].rotation_quaternion.copy()
-                        KneePoleLoc = pbones['knee_pole_R'].location.copy()
-                        KneePoleScale = pbones['knee_pole_R'].scale.copy()
-
-                        ThighIkRotEuler = pbones['thigh_ik_R'].rotation_euler.copy()
-                        ThighIkRotQuat = pbones['thigh_ik_R'].rotation_quaternion.copy()
-                        ThighIkLoc = pbones['thigh_ik_R'].location.copy()
-                        ThighIkScale = pbones['thigh_ik_R'].scale.copy()
-
-                        ThighFkRotEuler = pbones['thigh_fk_R'].rotation_euler.copy()
-                        ThighFkRotQuat = pbones['thigh_fk_R'].rotation_quaternion.copy()
-                        ThighFkLoc = pbones['thigh_fk_R'].location.copy()
-                        ThighFkScale = pbones['thigh_fk_R'].scale.copy()
-
-                        ShinFkRotEuler = pbones['shin_fk_R'].rotation_euler.copy()
-                        ShinFkRotQuat = pbones['shin_fk_R'].rotation_quaternion.copy()
-                        ShinFkLoc = pbones['shin_fk_R'].location.copy()
-                        ShinFkScale = pbones['shin_fk_R'].scale.copy()
-
-                        for prop in bpy.context.active_object.data.items():
-                            if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                                TarsalFkRotEuler = pbones['tarsal_fk_R'].rotation_euler.copy()
-                                TarsalFkRotQuat = pbones['tarsal_fk_R'].rotation_quaternion.copy()
-                                TarsalFkLoc = pbones['tarsal_fk_R'].location.copy()
-                                TarsalFkScale = pbones['tarsal_fk_R'].scale.copy()
-                                TarsalIkRotEuler = pbones['tarsal_ik_ctrl_R'].rotation_euler.copy()
-                                TarsalIkRotQuat = pbones['tarsal_ik_ctrl_R'].rotation_quaternion.copy()
-                                TarsaIFkLoc = pbones['tarsal_ik_ctrl_R'].location.copy()
-                                TarsalIkScale = pbones['tarsal_ik_ctrl_R'].scale.copy()
-
-                        FootToe1FkRotEuler = pbones['foot_toe_1_fk_R'].rotation_euler.copy()
-                        FootToe1FkRotQuat = pbones['foot_toe_1_fk_R'].rotation_quaternion.copy()
-                        FootToe1FkLoc = pbones['foot_toe_1_fk_R'].location.copy()
-                        FootToe1FkScale = pbones['foot_toe_1_fk_R'].scale.copy()
-
-                        FootToe2FkRotEuler = pbones['foot_toe_2_fk_R'].rotation_euler.copy()
-                        FootToe2FkRotQuat = pbones['foot_toe_2_fk_R'].rotation_quaternion.copy()
-                        FootToe2FkLoc = pbones['foot_toe_2_fk_R'].location.copy()
-                        FootToe2FkScale = pbones['foot_toe_2_fk_R'].scale.copy()
-
-                        #Jump to next Frame
-                        bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
-
-                        #Key Property
-                        armobj.pose.bones["properties_leg_R"].ik_leg_R = 0.0
-                        refresh_hack()
-                        pbones["properties_leg_R"].keyframe_insert(data_path='ik_leg_R')
-
-                        #Re-Paste Transforms
-                        pbones['sole_ctrl_R'].rotation_euler = SoleCtrlRotEuler
-                        pbones['sole_ctrl_R'].rotation_quaternion = SoleCtrlRotQuat
-                        pbones['sole_ctrl_R'].location = SoleCtrlLoc
-                        pbones['sole_ctrl_R'].scale = SoleCtrlScale
-                        refresh_hack()
-                        pbones['knee_pole_R'].rotation_euler = KneePoleRotEuler
-                        pbones['knee_pole_R'].rotation_quaternion = KneePoleRotQuat
-                        pbones['knee_pole_R'].location = KneePoleLoc
-                        pbones['knee_pole_R'].scale = KneePoleScale
-                        refresh_hack()
-                        pbones['thigh_ik_R'].rotation_euler = ThighIkRotEuler
-                        pbones['thigh_ik_R'].rotation_quaternion = ThighIkRotQuat
-                        pbones['thigh_ik_R'].location = ThighIkLoc
-                        pbones['thigh_ik_R'].scale = ThighIkScale
-                        refresh_hack()
-                        pbones['thigh_fk_R'].rotation_euler = ThighFkRotEuler
-                        pbones['thigh_fk_R'].rotation_quaternion = ThighFkRotQuat
-                        pbones['thigh_fk_R'].location = ThighFkLoc
-                        pbones['thigh_fk_R'].scale = ThighFkScale
-                        refresh_hack()
-                        pbones['shin_fk_R'].rotation_euler = ShinFkRotEuler
-                        pbones['shin_fk_R'].rotation_quaternion = ShinFkRotQuat
-                        pbones['shin_fk_R'].location = ShinFkLoc
-                        pbones['shin_fk_R'].scale = ShinFkScale
-                        refresh_hack()
-                        for prop in bpy.context.active_object.data.items():
-                            if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                                pbones['tarsal_ik_ctrl_R'].rotation_euler = TarsalIkRotEuler
-                                pbones['tarsal_ik_ctrl_R'].rotation_quaternion = TarsalIkRotQuat
-                                pbones['tarsal_ik_ctrl_R'].location = TarsaIFkLoc
-                                pbones['tarsal_ik_ctrl_R'].scale = TarsalIkScale
-                                refresh_hack()
-                                pbones['tarsal_fk_R'].rotation_euler = TarsalFkRotEuler
-                                pbones['tarsal_fk_R'].rotation_quaternion = TarsalFkRotQuat
-                                pbones['tarsal_fk_R'].location = TarsalFkLoc
-                                pbones['tarsal_fk_R'].scale = TarsalFkScale
-                                refresh_hack()
-                        pbones['foot_toe_1_fk_R'].rotation_euler = FootToe1FkRotEuler
-                        pbones['foot_toe_1_fk_R'].rotation_quaternion = FootToe1FkRotQuat
-                        pbones['foot_toe_1_fk_R'].location = FootToe1FkLoc
-                        pbones['foot_toe_1_fk_R'].scale = FootToe1FkScale
-                        refresh_hack()
-                        pbones['foot_toe_2_fk_R'].rotation_euler = FootToe2FkRotEuler
-                        pbones['foot_toe_2_fk_R'].rotation_quaternion = FootToe2FkRotQuat
-                        pbones['foot_toe_2_fk_R'].location = FootToe2FkLoc
-                        pbones['foot_toe_2_fk_R'].scale = FootToe2FkScale
-                        refresh_hack()
-                        pbones['foot_roll_ctrl_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                        pbones['foot_ik_ctrl_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                        pbones['foot_ik_ctrl_R'].location[:] = (0.0, 0.0, 0.0)
-                        pbones['toe_roll_1_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                        pbones['toe_roll_2_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                        pbones['foot_toe_ik_ctrl_mid_R'].location[:] = (0.0, 0.0, 0.0)
-                        pbones['foot_toe_ik_ctrl_mid_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                        pbones['foot_toe_ik_ctrl_R'].location[:] = (0.0, 0.0, 0.0)
-                        pbones['foot_toe_ik_ctrl_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                        refresh_hack()
-
-                        insert_bkeys('thigh_fk_R', 'LocRotScale')
-                        insert_bkeys('shin_fk_R', 'LocRotScale')
-                        insert_bkeys('thigh_fk_ctrl_R', 'LocRotScale')
-                        insert_bkeys('foot_fk_R', 'LocRotScale')
-                        insert_bkeys('foot_toe_1_fk_R', 'LocRotScale')
-                        insert_bkeys('foot_toe_2_fk_R', 'LocRotScale')
-                        insert_bkeys('thigh_ik_R', 'RotScale')
-                        insert_bkeys('shin_ik_R', 'RotScale')
-                        insert_bkeys('foot_ik_ctrl_R', 'LocRotScale')
-                        insert_bkeys('foot_toe_ik_ctrl_mid_R', 'LocRotScale')
-                        insert_bkeys('foot_toe_ik_ctrl_R', 'LocRotScale')
-                        insert_bkeys('foot_roll_ctrl_R', 'Rot')
-                        insert_bkeys('toe_roll_1_R', 'Rot')
-                        insert_bkeys('toe_roll_2_R', 'Rot')
-                        insert_bkeys('sole_ctrl_R', 'LocRotScale')
-                        if pbones["properties_leg_R"].toggle_leg_ik_pole_R == 1.0:
-                            insert_bkeys('knee_pole_R', 'Loc')
-                        for prop in bpy.context.active_object.data.items():
-                            if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                                insert_bkeys('tarsal_fk_R', 'LocRotScale')
-                                insert_bkeys('tarsal_ik_ctrl_R', 'LocRotScale')
-
-        return {"FINISHED"}
-
-##### Leg_R Space #####
-
-class Operator_Switch_Leg_Space_R(bpy.types.Operator):
-
-    bl_idname = "switch.leg_space_r"
-    bl_label = "BlenRig Switch Leg_R FK Space"
-    bl_description = "Switch Leg_R FK Space preserving pose"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
-
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
-
-    #Create string property to parse argument to the operator
-    space : bpy.props.StringProperty()
-
-    def execute(self, context):
-
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        anim_data = armobj.animation_data
-
-        #Collect Matrix
-        ThighFkCtrlMat = pbones['thigh_fk_ctrl_R'].matrix.copy()
-
-        #Insert Keyframes if Action present
-        if anim_data:
-            if anim_data.action:
-                if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                    pbones["properties_leg_R"].keyframe_insert(data_path='space_leg_R')
-                    insert_bkeys('thigh_fk_ctrl_R', 'RotScale')
-
-        if self.space == 'Free':
-            bpy.context.active_object.pose.bones["properties_leg_R"].space_leg_R = 0.0
-            refresh_hack()
-        if self.space == 'Torso':
-            bpy.context.active_object.pose.bones["properties_leg_R"].space_leg_R = 1.0
-            refresh_hack()
-
-        #Paste Matrix
-        pbones['thigh_fk_ctrl_R'].matrix = ThighFkCtrlMat
-        refresh_hack()
-
-        #Insert Keyframes if Action present
-        if anim_data:
-            if anim_data.action:
-                if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                    #Collect Local Transforms
-                    ThighFkCtrlRotEuler = pbones['thigh_fk_ctrl_R'].rotation_euler.copy()
-                    ThighFkCtrlRotQuat = pbones['thigh_fk_ctrl_R'].rotation_quaternion.copy()
-                    ThighFkCtrlScale = pbones['thigh_fk_ctrl_R'].scale.copy()
-
-                    #Jump to next Frame
-                    bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
-
-                    #Key Property
-                    if self.space == 'Free':
-                        bpy.context.active_object.pose.bones["properties_leg_R"].space_leg_R = 0.0
-                        refresh_hack()
-                    if self.space == 'Torso':
-                        bpy.context.active_object.pose.bones["properties_leg_R"].space_leg_R = 1.0
-                        refresh_hack()
-                    pbones["properties_leg_R"].keyframe_insert(data_path='space_leg_R')
-
-                    #Re-Paste Transforms
-                    pbones['thigh_fk_ctrl_R'].rotation_euler = ThighFkCtrlRotEuler
-                    pbones['thigh_fk_ctrl_R'].rotation_quaternion = ThighFkCtrlRotQuat
-                    pbones['thigh_fk_ctrl_R'].scale = ThighFkCtrlScale
-                    refresh_hack()
-
-                    insert_bkeys('thigh_fk_ctrl_R', 'RotScale')
-
-        return {"FINISHED"}
-
-#Create Space PopUp
-def Leg_Space_List_R(self, context):
-    col = self.layout.column()
-    col.operator("switch.leg_space_r", text = "Free").space = 'Free'
-    col.operator("switch.leg_space_r", text = "Torso").space = 'Torso'
-
-class Operator_Show_Leg_Space_List_R(bpy.types.Operator):
-    bl_idname = "show.leg_list_r"
-    bl_label = "Leg_R FK Space Switch List"
-    bl_description = "Switch Leg_R FK Space"
-
-    def invoke(self, context, event):
-        context.window_manager.popup_menu(Leg_Space_List_R, title='Switch Leg_R FK Space', icon='MOD_ARMATURE')
-        return {'FINISHED'}
-
-##### Leg_Pole_R Space #####
-
-class Operator_Switch_Leg_Pole_Space_R(bpy.types.Operator):
-
-    bl_idname = "switch.leg_pole_space_r"
-    bl_label = "BlenRig Switch Leg_R Pole Space"
-    bl_description = "Switch Leg_R Pole Space preserving pose"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
-
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
-
-    #Create string property to parse argument to the operator
-    space : bpy.props.StringProperty()
-
-    def execute(self, context):
-
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        anim_data = armobj.animation_data
-
-        #Insert Keyframes if Action present
-        if anim_data:
-            if anim_data.action:
-                if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                    pbones["properties_leg_R"].keyframe_insert(data_path='space_leg_ik_pole_R')
-                    insert_bkeys('knee_pole_R', 'Loc')
-
-        #Collect Matrix
-        PoleMat = pbones['knee_pole_R'].matrix.copy()
-
-        if self.space == 'Free':
-            bpy.context.active_object.pose.bones["properties_leg_R"].space_leg_ik_pole_R = 0.0
-            refresh_hack()
-        if self.space == 'Torso':
-            bpy.context.active_object.pose.bones["properties_leg_R"].space_leg_ik_pole_R = 1.0
-            refresh_hack()
-        if self.space == 'Foot':
-            bpy.context.active_object.pose.bones["properties_leg_R"].space_leg_ik_pole_R = 2.0
-            refresh_hack()
-
-        #Paste Matrix
-        pbones['knee_pole_R'].matrix = PoleMat
-        refresh_hack()
-
-        #Insert Keyframes if Action present
-        if anim_data:
-            if anim_data.action:
-                if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                    #Collect Local Transforms
-                    KneePoleLoc = pbones['knee_pole_R'].location.copy()
-
-                    #Jump to next Frame
-                    bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
-
-                    #Key Property
-                    if self.space == 'Free':
-                        bpy.context.active_object.pose.bones["properties_leg_R"].space_leg_ik_pole_R = 0.0
-                        refresh_hack()
-                    if self.space == 'Torso':
-                        bpy.context.active_object.pose.bones["properties_leg_R"].space_leg_ik_pole_R = 1.0
-                        refresh_hack()
-                    if self.space == 'Foot':
-                        bpy.context.active_object.pose.bones["properties_leg_R"].space_leg_ik_pole_R = 2.0
-                        refresh_hack()
-                    pbones["properties_leg_R"].keyframe_insert(data_path='space_leg_ik_pole_R')
-
-                    #Re-Paste Transforms
-                    pbones['knee_pole_R'].location = KneePoleLoc
-                    refresh_hack()
-
-                    insert_bkeys('knee_pole_R', 'Loc')
-
-        return {"FINISHED"}
-
-#Create Space PopUp
-def Leg_Pole_Space_List_R(self, context):
-    col = self.layout.column()
-    col.operator("switch.leg_pole_space_r", text = "Free").space = 'Free'
-    col.operator("switch.leg_pole_space_r", text = "Torso").space = 'Torso'
-    col.operator("switch.leg_pole_space_r", text = "Foot").space = 'Foot'
-
-class Operator_Show_Leg_Pole_Space_List_R(bpy.types.Operator):
-    bl_idname = "show.leg_pole_list_r"
-    bl_label = "Leg_R Pole Space Switch List"
-    bl_description = "Switch Leg_R Pole Space"
-
-    def invoke(self, context, event):
-        context.window_manager.popup_menu(Leg_Pole_Space_List_R, title='Switch Leg_R Pole Space', icon='MOD_ARMATURE')
-        return {'FINISHED'}
-
-##### Elbow_R Pin #####
-
-class Operator_Elbow_Pin_R(bpy.types.Operator):
-
-    bl_idname = "pin.elbow_r"
-    bl_label = "BlenRig Pin Elbow_R"
-    bl_description = "Pin Elbow_R"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
-
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
-
-    def execute(self, context):
-
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        anim_data = armobj.animation_data
-
-        #Biped
-        for prop in bpy.context.active_object.data.items():
-            if prop[0] == 'rig_type' and prop[1] == 'Biped':
-
-        #### Pin ####
-                if armobj.pose.bones["properties_arm_R"].pin_elbow_R < 0.1:
-
-                    #Collect Matrix
-                    ArmFkMat = pbones['arm_fk_R'].matrix.copy()
-                    ArmFkLoc = pbones['arm_fk_R'].location.copy()
-                    ArmFkScale = pbones['arm_fk_R'].scale.copy()
-                    ForearmFkMat = pbones['forearm_fk_R'].matrix.copy()
-                    ForearmFkLoc = pbones['forearm_fk_R'].location.copy()
-                    ForearmFkScale = pbones['forearm_fk_R'].scale.copy()
-                    ShoulderMat = pbones['shoulder_R'].matrix.copy()
-                    ShoulderLoc = pbones['shoulder_R'].location.copy()
-                    ShoulderScale = pbones['shoulder_R'].scale.copy()
-
-                    #Insert Keyframes if Action present
-                    if anim_data:
-                        if anim_data.action:
-                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                                pbones["properties_arm_R"].keyframe_insert(data_path='pin_elbow_R')
-                                insert_bkeys('master_torso', 'LocRotScale')
-                                insert_bkeys('pelvis_ctrl', 'LocRotScale')
-                                insert_bkeys('spine_1_fk', 'LocRotScale')
-                                insert_bkeys('spine_2_fk', 'LocRotScale')
-                                insert_bkeys('spine_3_fk', 'LocRotScale')
-                                insert_bkeys('spine_1_toon', 'LocRotScale')
-                                insert_bkeys('spine_2_toon', 'LocRotScale')
-                                insert_bkeys('spine_3_toon', 'LocRotScale')
-                                insert_bkeys('spine_4_toon', 'LocRotScale')
-                                insert_bkeys('torso_fk_ctrl_inv', 'LocRotScale')
-                                insert_bkeys('spine_3_fk_inv', 'LocRotScale')
-                                insert_bkeys('spine_2_fk_inv', 'LocRotScale')
-                                insert_bkeys('torso_fk_ctrl', 'LocRotScale')
-                                insert_bkeys('look', 'LocRotScale')
-                                insert_bkeys('elbow_pole_L', 'LocRotScale')
-                                insert_bkeys('elbow_pole_R', 'LocRotScale')
-                                insert_bkeys('knee_pole_L', 'LocRotScale')
-                                insert_bkeys('knee_pole_R', 'LocRotScale')
-                                insert_bkeys('arm_fk_R', 'LocRotScale')
-                                insert_bkeys('forearm_fk_R', 'LocRotScale')
-                                insert_bkeys('arm_ik_R', 'RotScale')
-                                insert_bkeys('forearm_ik_R', 'RotScale')
-                                insert_bkeys('arm_fk_ctrl_R', 'LocRotScale')
-                                insert_bkeys('shoulder_R', 'LocRotScale')
-                                insert_bkeys('hand_ik_ctrl_R', 'LocRotScale')
-                                insert_bkeys('hand_fk_R', 'LocRotScale')
-                                insert_bkeys('elbow_pin_R', 'LocRotScale')
-                                if pbones["properties_arm_R"].toggle_arm_ik_pole_R == 1.0:
-                                    insert_bkeys('elbow_pole_R', 'Loc')
-                                for prop in bpy.context.active_object.data.items():
-                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                                        insert_bkeys('carpal_ik_ctrl_R', 'LocRotScale')
-                                        insert_bkeys('carpal_fk_R', 'LocRotScale')
-                                        insert_bkeys('hand_fk_R', 'LocRotScale')
-
-                    #Paste Matrix
-                    pVisLocExec(pbones['elbow_pin_R'], pbones['snap_elbow_pin_R'])
-                    pVisRotExec(pbones['elbow_pin_R'], pbones['snap_elbow_pin_R'])
-                    pVisScaExec(pbones['elbow_pin_R'], pbones['snap_elbow_pin_R'])
-                    refresh_hack()
-
-                    armobj.pose.bones["properties_arm_R"].pin_elbow_R = 1.0
-                    refresh_hack()
-
-                    pbones['shoulder_R'].matrix = ShoulderMat
-                    pbones['shoulder_R'].location = ShoulderLoc
-                    pbones['shoulder_R'].scale = ShoulderScale
-                    refresh_hack()
-                    pbones['arm_fk_R'].matrix = ArmFkMat
-                    pbones['arm_fk_R'].location = ArmFkLoc
-                    pbones['arm_fk_R'].scale = ArmFkScale
-                    refresh_hack()
-                    pbones['forearm_fk_R'].matrix = ForearmFkMat
-                    pbones['forearm_fk_R'].location = ForearmFkLoc
-                    pbones['forearm_fk_R'].scale = ForearmFkScale
-                    refresh_hack()
-
-                    #Insert Keyframes if Action present
-                    if anim_data:
-                        if anim_data.action:
-                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                                #Collect Local Transforms
-                                ElbowPinRotEuler = pbones['elbow_pin_R'].rotation_euler.copy()
-                                ElbowPinRotQuat = pbones['elbow_pin_R'].rotation_quaternion.copy()
-                                ElbowPinLoc = pbones['elbow_pin_R'].location.copy()
-                                ElbowPinScale = pbones['elbow_pin_R'].scale.copy()
-
-                                ShoulderRotEuler = pbones['shoulder_R'].rotation_euler.copy()
-                                ShoulderRotQuat = pbones['shoulder_R'].rotation_quaternion.copy()
-                                ShoulderLoc = pbones['shoulder_R'].location.copy()
-                                ShoulderScale = pbones['shoulder_R'].scale.copy()
-
-                                ArmFkRotEuler = pbones['arm_fk_R'].rotation_euler.copy()
-                                ArmFkRotQuat = pbones['arm_fk_R'].rotation_quaternion.copy()
-                                ArmFkLoc = pbones['arm_fk_R'].location.copy()
-                                ArmFkScale = pbones['arm_fk_R'].scale.copy()
-
-                                ForearmFkRotEuler = pbones['forearm_fk_R'].rotation_euler.copy()
-                                ForearmFkRotQuat = pbones['forearm_fk_R'].rotation_quaternion.copy()
-                                ForearmFkLoc = pbones['forearm_fk_R'].location.copy()
-                                ForearmFkScale = pbones['forearm_fk_R'].scale.copy()
-
-                                #Jump to next Frame
-                                bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
-
-                                #Key Property
-                                armobj.pose.bones["properties_arm_R"].pin_elbow_R = 1.0
-                                refresh_hack()
-                                pbones["properties_arm_R"].keyframe_insert(data_path='pin_elbow_R')
-
-                                #Re-Paste Transforms
-                                pbones['elbow_pin_R'].rotation_euler = ElbowPinRotEuler
-                                pbones['elbow_pin_R'].rotation_quaternion = ElbowPinRotQuat
-                                pbones['elbow_pin_R'].location = ElbowPinLoc
-                                pbones['elbow_pin_R'].scale = ElbowPinScale
-                                refresh_hack()
-                                pbones['shoulder_R'].rotation_euler = ShoulderRotEuler
-                                pbones['shoulder_R'].rotation_quaternion = ShoulderRotQuat
-                                pbones['shoulder_R'].location = ShoulderLoc
-                                pbones['shoulder_R'].scale = ShoulderScale
-                                refresh_hack()
-                                pbones['arm_fk_R'].rotation_euler = ArmFkRotEuler
-                                pbones['arm_fk_R'].rotation_quaternion = ArmFkRotQuat
-                                pbones['arm_fk_R'].location = ArmFkLoc
-                                pbones['arm_fk_R'].scale = ArmFkScale
-                                refresh_hack()
-                                pbones['forearm_fk_R'].rotation_euler = ForearmFkRotEuler
-                                pbones['forearm_fk_R'].rotation_quaternion = ForearmFkRotQuat
-                                pbones['forearm_fk_R'].location = ForearmFkLoc
-                                pbones['forearm_fk_R'].scale = ForearmFkScale
-                                refresh_hack()
-
-                                insert_bkeys('master_torso', 'LocRotScale')
-                                insert_bkeys('pelvis_ctrl', 'LocRotScale')
-                                insert_bkeys('spine_1_fk', 'LocRotScale')
-                                insert_bkeys('spine_2_fk', 'LocRotScale')
-                                insert_bkeys('spine_3_fk', 'LocRotScale')
-                                insert_bkeys('spine_1_toon', 'LocRotScale')
-                                insert_bkeys('spine_2_toon', 'LocRotScale')
-                                insert_bkeys('spine_3_toon', 'LocRotScale')
-                                insert_bkeys('spine_4_toon', 'LocRotScale')
-                                insert_bkeys('torso_fk_ctrl_inv', 'LocRotScale')
-                                insert_bkeys('spine_3_fk_inv', 'LocRotScale')
-                                insert_bkeys('spine_2_fk_inv', 'LocRotScale')
-                                insert_bkeys('torso_fk_ctrl', 'LocRotScale')
-                                insert_bkeys('look', 'LocRotScale')
-                                insert_bkeys('elbow_pole_L', 'LocRotScale')
-                                insert_bkeys('elbow_pole_R', 'LocRotScale')
-                                insert_bkeys('knee_pole_L', 'LocRotScale')
-                                insert_bkeys('knee_pole_R', 'LocRotScale')
-                                insert_bkeys('arm_fk_R', 'LocRotScale')
-                                insert_bkeys('forearm_fk_R', 'LocRotScale')
-                                insert_bkeys('arm_ik_R', 'RotScale')
-                                insert_bkeys('forearm_ik_R', 'RotScale')
-                                insert_bkeys('arm_fk_ctrl_R', 'LocRotScale')
-                                insert_bkeys('shoulder_R', 'LocRotScale')
-                                insert_bkeys('hand_ik_ctrl_R', 'LocRotScale')
-                                insert_bkeys('hand_fk_R', 'LocRotScale')
-                                insert_bkeys('elbow_pin_R', 'LocRotScale')
-                                if pbones["properties_arm_R"].toggle_arm_ik_pole_R == 1.0:
-                                    insert_bkeys('elbow_pole_R', 'Loc')
-                                for prop in bpy.context.active_object.data.items():
-                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                                        insert_bkeys('carpal_ik_ctrl_R', 'LocRotScale')
-                                        insert_bkeys('carpal_fk_R', 'LocRotScale')
-                                        insert_bkeys('hand_fk_R', 'LocRotScale')
-
-                    #Switch Hand to Arm Space
-                    if anim_data:
-                        if anim_data.action:
-                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                                #Jump to previous Frame
-                                bpy.context.scene.frame_set (bpy.context.scene.frame_current - 1)
-
-                    #Switch Hand to Arm Space
-                    bpy.ops.switch.hand_space_r(space='Arm')
-
-        return {"FINISHED"}
-
-##### Elbow_R UnPin #####
-
-class Operator_Elbow_UnPin_R(bpy.types.Operator):
-
-    bl_idname = "unpin.elbow_r"
-    bl_label = "BlenRig UnPin Elbow_R"
-    bl_description = "UnPin Elbow_R"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
-
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
-
-    def execute(self, context):
-
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        anim_data = armobj.animation_data
-
-        #Biped
-        for prop in bpy.context.active_object.data.items():
-            if prop[0] == 'rig_type' and prop[1] == 'Biped':
-
-                if armobj.pose.bones["properties_arm_R"].pin_elbow_R > 0.9:
-
-                    #Collect Matrix
-                    ArmFkMat = pbones['arm_fk_R'].matrix.copy()
-                    ArmFkLoc = pbones['arm_fk_R'].location.copy()
-                    ArmFkScale = pbones['arm_fk_R'].scale.copy()
-                    ForearmFkMat = pbones['forearm_fk_R'].matrix.copy()
-                    ForearmFkLoc = pbones['forearm_fk_R'].location.copy()
-                    ForearmFkScale = pbones['forearm_fk_R'].scale.copy()
-                    ShoulderMat = pbones['shoulder_R'].matrix.copy()
-                    ShoulderLoc = pbones['shoulder_R'].location.copy()
-                    ShoulderScale = pbones['shoulder_R'].scale.copy()
-
-                    #Insert Keyframes if Action present
-                    if anim_data:
-                        if anim_data.action:
-                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                                pbones["properties_arm_R"].keyframe_insert(data_path='pin_elbow_R')
-                                insert_bkeys('master_torso', 'LocRotScale')
-                                insert_bkeys('pelvis_ctrl', 'LocRotScale')
-                                insert_bkeys('spine_1_fk', 'LocRotScale')
-                                insert_bkeys('spine_2_fk', 'LocRotScale')
-                                insert_bkeys('spine_3_fk', 'LocRotScale')
-                                insert_bkeys('spine_1_toon', 'LocRotScale')
-                                insert_bkeys('spine_2_toon', 'LocRotScale')
-                                insert_bkeys('spine_3_toon', 'LocRotScale')
-                                insert_bkeys('spine_4_toon', 'LocRotScale')
-                                insert_bkeys('torso_fk_ctrl_inv', 'LocRotScale')
-                                insert_bkeys('spine_3_fk_inv', 'LocRotScale')
-                                insert_bkeys('spine_2_fk_inv', 'LocRotScale')
-                                insert_bkeys('torso_fk_ctrl', 'LocRotScale')
-                                insert_bkeys('look', 'LocRotScale')
-                                insert_bkeys('elbow_pole_L', 'LocRotScale')
-                                insert_bkeys('elbow_pole_R', 'LocRotScale')
-                                insert_bkeys('knee_pole_L', 'LocRotScale')
-                                insert_bkeys('knee_pole_R', 'LocRotScale')
-                                insert_bkeys('arm_fk_R', 'LocRotScale')
-                                insert_bkeys('forearm_fk_R', 'LocRotScale')
-                                insert_bkeys('arm_ik_R', 'RotScale')
-                                insert_bkeys('forearm_ik_R', 'RotScale')
-                                insert_bkeys('arm_fk_ctrl_R', 'LocRotScale')
-                                insert_bkeys('shoulder_R', 'LocRotScale')
-                                insert_bkeys('hand_ik_ctrl_R', 'LocRotScale')
-                                insert_bkeys('hand_fk_R', 'LocRotScale')
-                                insert_bkeys('elbow_pin_R', 'LocRotScale')
-                                if pbones["properties_arm_R"].toggle_arm_ik_pole_R == 1.0:
-                                    insert_bkeys('elbow_pole_R', 'Loc')
-                                for prop in bpy.context.active_object.data.items():
-                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                                        insert_bkeys('carpal_ik_ctrl_R', 'LocRotScale')
-                                        insert_bkeys('carpal_fk_R', 'LocRotScale')
-                                        insert_bkeys('hand_fk_R', 'LocRotScale')
-
-                    #Paste Matrix
-                    pVisLocExec(pbones['hand_ik_ctrl_R'], pbones['hand_fk_R'])
-                    refresh_hack()
-                    pVisLocExec(pbones['elbow_pole_R'], pbones['snap_elbow_pole_fk_R'])
-                    refresh_hack()
-                    pVisRotExec (pbones['arm_ik_R'], pbones['arm_rot_R'])
-                    refresh_hack()
-                    pVisRotExec (pbones['arm_fk_ctrl_R'], pbones['arm_fk_R'])
-                    pbones['arm_fk_ctrl_R'].scale[:] = (1.0, 1.0, 1.0)
-                    refresh_hack()
-
-                    bpy.context.active_object.pose.bones["properties_arm_R"].pin_elbow_R = 0.0
-                    refresh_hack()
-
-                    pbones['shoulder_R'].matrix = ShoulderMat
-                    pbones['shoulder_R'].location = ShoulderLoc
-                    pbones['shoulder_R'].scale = ShoulderScale
-                    refresh_hack()
-                    pbones['arm_fk_R'].matrix = ArmFkMat
-                    pbones['arm_fk_R'].location = ArmFkLoc
-                    pbones['arm_fk_R'].scale = ArmFkScale
-                    refresh_hack()
-                    pbones['forearm_fk_R'].matrix = ForearmFkMat
-                    pbones['forearm_fk_R'].location = ForearmFkLoc
-                    pbones['forearm_fk_R'].scale = ForearmFkScale
-                    refresh_hack()
-                    #Correct arm_fk twist
-                    pVisRotExec (pbones['arm_fk_R'], pbones['arm_rot_R'])
-                    refresh_hack()
-                    #Re-paste forearm matrix
-                    pbones['forearm_fk_R'].matrix = ForearmFkMat
-                    pbones['forearm_fk_R'].location = ForearmFkLoc
-                    pbones['forearm_fk_R'].scale = ForearmFkScale
-                    refresh_hack()
-
-                    #Insert Keyframes if Action present
-                    if anim_data:
-                        if anim_data.action:
-                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                                #Collect Local Transforms
-                                ArmCtrlRotEuler = pbones['arm_fk_ctrl_R'].rotation_euler.copy()
-                                ArmCtrlRotQuat = pbones['arm_fk_ctrl_R'].rotation_quaternion.copy()
-                                ArmCtrlLoc = pbones['arm_fk_ctrl_R'].location.copy()
-                                ArmCtrlScale = pbones['arm_fk_ctrl_R'].scale.copy()
-
-                                ShoulderRotEuler = pbones['shoulder_R'].rotation_euler.copy()
-                                ShoulderRotQuat = pbones['shoulder_R'].rotation_quaternion.copy()
-                                ShoulderLoc = pbones['shoulder_R'].location.copy()
-                                ShoulderScale = pbones['shoulder_R'].scale.copy()
-
-                                ArmFkRotEuler = pbones['arm_fk_R'].rotation_euler.copy()
-                                ArmFkRotQuat = pbones['arm_fk_R'].rotation_quaternion.copy()
-                                ArmFkLoc = pbones['arm_fk_R'].location.copy()
-                                ArmFkScale = pbones['arm_fk_R'].scale.copy()
-
-                                ForearmFkRotEuler = pbones['forearm_fk_R'].rotation_euler.copy()
-                                ForearmFkRotQuat = pbones['forearm_fk_R'].rotation_quaternion.copy()
-                                ForearmFkLoc = pbones['forearm_fk_R'].location.copy()
-                                ForearmFkScale = pbones['forearm_fk_R'].scale.copy()
-
-                                HandIkCtrlRotEuler = pbones['hand_ik_ctrl_R'].rotation_euler.copy()
-                                HandIkCtrlRotQuat = pbones['hand_ik_ctrl_R'].rotation_quaternion.copy()
-                                HandIkCtrlLoc = pbones['hand_ik_ctrl_R'].location.copy()
-                                HandIkCtrlScale = pbones['hand_ik_ctrl_R'].scale.copy()
-
-                                ArmIkRotEuler = pbones['arm_ik_R'].rotation_euler.copy()
-                                ArmIkRotQuat = pbones['arm_ik_R'].rotation_quaternion.copy()
-                                ArmIkLoc = pbones['arm_ik_R'].location.copy()
-                                ArmIkScale = pbones['arm_ik_R'].scale.copy()
-
-                                ElbowlLoc = pbones['elbow_pole_R'].location.copy()
-
-                                #Jump to next Frame
-                                bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
-
-                                #Key Property
-                                armobj.pose.bones["properties_arm_R"].pin_elbow_R = 0.0
-                                refresh_hack()
-                                pbones["properties_arm_R"].keyframe_insert(data_path='pin_elbow_R')
-
-                                #Re-Paste Transforms
-                                pbones['arm_fk_ctrl_R'].rotation_euler = ArmCtrlRotEuler
-                                pbones['arm_fk_ctrl_R'].rotation_quaternion = ArmCtrlRotQuat
-                                pbones['arm_fk_ctrl_R'].location = ArmCtrlLoc
-                                pbones['arm_fk_ctrl_R'].scale = ArmCtrlScale
-                                refresh_hack()
-                                pbones['shoulder_R'].rotation_euler = ShoulderRotEuler
-                                pbones['shoulder_R'].rotation_quaternion = ShoulderRotQuat
-                                pbones['shoulder_R'].location = ShoulderLoc
-                                pbones['shoulder_R'].scale = ShoulderScale
-                                refresh_hack()
-                                pbones['arm_fk_R'].rotation_euler = ArmFkRotEuler
-                                pbones['arm_fk_R'].rotation_quaternion = ArmFkRotQuat
-                                pbones['arm_fk_R'].location = ArmFkLoc
-                                pbones['arm_fk_R'].scale = ArmFkScale
-                                refresh_hack()
-                                pbones['forearm_fk_R'].rotation_euler = ForearmFkRotEuler
-                                pbones['forearm_fk_R'].rotation_quaternion = ForearmFkRotQuat
-                                pbones['forearm_fk_R'].location = ForearmFkLoc
-                                pbones['forearm_fk_R'].scale = ForearmFkScale
-                                refresh_hack()
-                                pbones['hand_ik_ctrl_R'].rotation_euler = HandIkCtrlRotEuler
-                                pbones['hand_ik_ctrl_R'].rotation_quaternion = HandIkCtrlRotQuat
-                                pbones['hand_ik_ctrl_R'].location = HandIkCtrlLoc
-                                pbones['hand_ik_ctrl_R'].scale = HandIkCtrlScale
-                                refresh_hack()
-                                pbones['elbow_pole_R'].location = ElbowlLoc
-                                refresh_hack()
-                                pbones['arm_ik_R'].rotation_euler = ArmIkRotEuler
-                                pbones['arm_ik_R'].rotation_quaternion = ArmIkRotQuat
-                                pbones['arm_ik_R'].location = ArmIkLoc
-                                pbones['arm_ik_R'].scale = ArmIkScale
-                                refresh_hack()
-
-                                insert_bkeys('master_torso', 'LocRotScale')
-                                insert_bkeys('pelvis_ctrl', 'LocRotScale')
-                                insert_bkeys('spine_1_fk', 'LocRotScale')
-                                insert_bkeys('spine_2_fk', 'LocRotScale')
-                                insert_bkeys('spine_3_fk', 'LocRotScale')
-                                insert_bkeys('spine_1_toon', 'LocRotScale')
-                                insert_bkeys('spine_2_toon', 'LocRotScale')
-                                insert_bkeys('spine_3_toon', 'LocRotScale')
-                                insert_bkeys('spine_4_toon', 'LocRotScale')
-                                insert_bkeys('torso_fk_ctrl_inv', 'LocRotScale')
-                                insert_bkeys('spine_3_fk_inv', 'LocRotScale')
-                                insert_bkeys('spine_2_fk_inv', 'LocRotScale')
-                                insert_bkeys('torso_fk_ctrl', 'LocRotScale')
-                                insert_bkeys('look', 'LocRotScale')
-                                insert_bkeys('elbow_pole_L', 'LocRotScale')
-                                insert_bkeys('elbow_pole_R', 'LocRotScale')
-                                insert_bkeys('knee_pole_L', 'LocRotScale')
-                                insert_bkeys('knee_pole_R', 'LocRotScale')
-                                insert_bkeys('arm_fk_R', 'LocRotScale')
-                                insert_bkeys('forearm_fk_R', 'LocRotScale')
-                                insert_bkeys('arm_ik_R', 'RotScale')
-                                insert_bkeys('forearm_ik_R', 'RotScale')
-                                insert_bkeys('arm_fk_ctrl_R', 'LocRotScale')
-                                insert_bkeys('shoulder_R', 'LocRotScale')
-                                insert_bkeys('hand_ik_ctrl_R', 'LocRotScale')
-                                insert_bkeys('hand_fk_R', 'LocRotScale')
-                                insert_bkeys('elbow_pin_R', 'LocRotScale')
-                                if pbones["properties_arm_R"].toggle_arm_ik_pole_R == 1.0:
-                                    insert_bkeys('elbow_pole_R', 'Loc')
-                                for prop in bpy.context.active_object.data.items():
-                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                                        insert_bkeys('carpal_ik_ctrl_R', 'LocRotScale')
-                                        insert_bkeys('carpal_fk_R', 'LocRotScale')
-                                        insert_bkeys('hand_fk_R', 'LocRotScale')
-
-                    #Switch Hand to Arm Space
-                    if armobj.pose.bones["properties_arm_R"].ik_arm_R < 0.1:
-                        if anim_data:
-                            if anim_data.action:
-                                if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                                    #Jump to previous Frame
-                                    bpy.context.scene.frame_set (bpy.context.scene.frame_current - 1)
-
-                        #Switch Hand to Free Space
-                        bpy.ops.switch.hand_space_r(space='Free')
-
-        return {"FINISHED"}
-
-##### Knee_R Pin #####
-
-class Operator_Knee_Pin_R(bpy.types.Operator):
-
-    bl_idname = "pin.knee_r"
-    bl_label = "BlenRig Pin Knee_R"
-    bl_description = "Pin Knee_R"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
-
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
-
-    def execute(self, context):
-
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        anim_data = armobj.animation_data
-
-        #Biped
-        for prop in bpy.context.active_object.data.items():
-            if prop[0] == 'rig_type' and prop[1] == 'Biped':
-
-        #### Pin ####
-                if armobj.pose.bones["properties_leg_R"].pin_knee_R < 0.1:
-
-                    #Collect Matrix
-                    ThighFkMat = pbones['thigh_fk_R'].matrix.copy()
-                    ThighFkLoc = pbones['thigh_fk_R'].location.copy()
-                    ThighFkScale = pbones['thigh_fk_R'].scale.copy()
-                    ShinFkMat = pbones['shin_fk_R'].matrix.copy()
-                    ShinFkLoc = pbones['shin_fk_R'].location.copy()
-                    ShinFkScale = pbones['shin_fk_R'].scale.copy()
-                    TorsoMat = pbones['master_torso'].matrix.copy()
-                    TorsoLoc = pbones['master_torso'].location.copy()
-                    TorsoScale = pbones['master_torso'].scale.copy()
-                    PelvisMat = pbones['pelvis_ctrl'].matrix.copy()
-                    PelvisLoc = pbones['pelvis_ctrl'].location.copy()
-                    PelvisScale = pbones['pelvis_ctrl'].scale.copy()
-                    FootFkMat = pbones['foot_fk_R'].matrix.copy()
-                    FootFkLoc = pbones['foot_fk_R'].location.copy()
-                    FootFkScale = pbones['foot_fk_R'].scale.copy()
-                    FootToe1FkMat = pbones['foot_toe_1_fk_R'].matrix.copy()
-                    FootToe1FkLoc = pbones['foot_toe_1_fk_R'].location.copy()
-                    FootToe1FkScale = pbones['foot_toe_1_fk_R'].scale.copy()
-                    FootToe2FkMat = pbones['foot_toe_2_fk_R'].matrix.copy()
-                    FootToe2FkLoc = pbones['foot_toe_2_fk_R'].location.copy()
-                    FootToe2FkScale = pbones['foot_toe_2_fk_R'].scale.copy()
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                            TarsalFkMat = pbones['tarsal_fk_R'].matrix.copy()
-                            TarsalFkLoc = pbones['tarsal_fk_R'].location.copy()
-                            TarsalFkScale = pbones['tarsal_fk_R'].scale.copy()
-
-                    #Insert Keyframes if Action present
-                    if anim_data:
-                        if anim_data.action:
-                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                                pbones["properties_leg_R"].keyframe_insert(data_path='pin_knee_R')
-                                insert_bkeys('master_torso', 'LocRotScale')
-                                insert_bkeys('pelvis_ctrl', 'LocRotScale')
-                                insert_bkeys('spine_1_fk', 'LocRotScale')
-                                insert_bkeys('spine_2_fk', 'LocRotScale')
-                                insert_bkeys('spine_3_fk', 'LocRotScale')
-                                insert_bkeys('spine_1_toon', 'LocRotScale')
-                                insert_bkeys('spine_2_toon', 'LocRotScale')
-                                insert_bkeys('spine_3_toon', 'LocRotScale')
-                                insert_bkeys('spine_4_toon', 'LocRotScale')
-                                insert_bkeys('torso_fk_ctrl_inv', 'LocRotScale')
-                                insert_bkeys('spine_3_fk_inv', 'LocRotScale')
-                                insert_bkeys('spine_2_fk_inv', 'LocRotScale')
-                                insert_bkeys('torso_fk_ctrl', 'LocRotScale')
-                                insert_bkeys('look', 'LocRotScale')
-                                insert_bkeys('elbow_pole_L', 'LocRotScale')
-                                insert_bkeys('elbow_pole_R', 'LocRotScale')
-                                insert_bkeys('knee_pole_L', 'LocRotScale')
-                                insert_bkeys('knee_pole_R', 'LocRotScale')
-                                insert_bkeys('thigh_fk_R', 'LocRotScale')
-                                insert_bkeys('shin_fk_R', 'LocRotScale')
-                                insert_bkeys('thigh_fk_ctrl_R', 'LocRotScale')
-                                insert_bkeys('foot_fk_R', 'LocRotScale')
-                                insert_bkeys('foot_toe_1_fk_R', 'LocRotScale')
-                                insert_bkeys('foot_toe_2_fk_R', 'LocRotScale')
-                                insert_bkeys('thigh_ik_R', 'RotScale')
-                                insert_bkeys('shin_ik_R', 'RotScale')
-                                insert_bkeys('foot_ik_ctrl_R', 'LocRotScale')
-                                insert_bkeys('foot_toe_ik_ctrl_mid_R', 'LocRotScale')
-                                insert_bkeys('foot_toe_ik_ctrl_R', 'LocRotScale')
-                                insert_bkeys('foot_roll_ctrl_R', 'Rot')
-                                insert_bkeys('toe_roll_1_R', 'Rot')
-                                insert_bkeys('toe_roll_2_R', 'Rot')
-                                insert_bkeys('sole_ctrl_R', 'LocRotScale')
-                                insert_bkeys('knee_pin_R', 'LocRotScale')
-                                if pbones["properties_leg_R"].toggle_leg_ik_pole_R == 1.0:
-                                    insert_bkeys('knee_pole_R', 'Loc')
-                                for prop in bpy.context.active_object.data.items():
-                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                                        insert_bkeys('tarsal_fk_R', 'LocRotScale')
-                                        insert_bkeys('tarsal_ik_ctrl_R', 'LocRotScale')
-
-                    #Paste Matrix
-                    pVisLocExec(pbones['knee_pin_R'], pbones['snap_knee_pin_R'])
-                    pVisRotExec(pbones['knee_pin_R'], pbones['snap_knee_pin_R'])
-                    pVisScaExec(pbones['knee_pin_R'], pbones['snap_knee_pin_R'])
-                    refresh_hack()
-                    pVisLocExec(pbones['sole_ctrl_R'], pbones['snap_sole_ctrl_fk_R'])
-                    pVisRotExec(pbones['sole_ctrl_R'], pbones['snap_sole_ctrl_fk_R'])
-                    refresh_hack()
-                    pbones['foot_roll_ctrl_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    pbones['foot_ik_ctrl_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    pbones['foot_ik_ctrl_R'].location[:] = (0.0, 0.0, 0.0)
-                    pbones['toe_roll_1_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    pbones['toe_roll_2_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    pbones['foot_toe_ik_ctrl_mid_R'].location[:] = (0.0, 0.0, 0.0)
-                    pbones['foot_toe_ik_ctrl_mid_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    pbones['foot_toe_ik_ctrl_R'].location[:] = (0.0, 0.0, 0.0)
-                    pbones['foot_toe_ik_ctrl_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
-
-                    armobj.pose.bones["properties_leg_R"].pin_knee_R = 1.0
-                    refresh_hack()
-
-                    pbones['master_torso'].matrix = TorsoMat
-                    refresh_hack()
-                    pbones['pelvis_ctrl'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    pbones['pelvis_ctrl'].location[:] = (0.0, 0.0, 0.0)
-                    refresh_hack()
-                    pbones['thigh_fk_R'].matrix = ThighFkMat
-                    pbones['thigh_fk_R'].location = ThighFkLoc
-                    pbones['thigh_fk_R'].scale = ThighFkScale
-                    refresh_hack()
-                    pbones['shin_fk_R'].matrix = ShinFkMat
-                    pbones['shin_fk_R'].location = ShinFkLoc
-                    pbones['shin_fk_R'].scale = ShinFkScale
-                    pbones['foot_fk_R'].matrix = FootFkMat
-                    pbones['foot_fk_R'].location = FootFkLoc
-                    pbones['foot_fk_R'].scale = FootFkScale
-                    refresh_hack()
-                    pbones['foot_toe_1_fk_R'].matrix = FootToe1FkMat
-                    pbones['foot_toe_1_fk_R'].location = FootToe1FkLoc
-                    pbones['foot_toe_1_fk_R'].scale = FootToe1FkScale
-                    refresh_hack()
-                    pbones['foot_toe_2_fk_R'].matrix = FootToe2FkMat
-                    pbones['foot_toe_2_fk_R'].location = FootToe2FkLoc
-                    pbones['foot_toe_2_fk_R'].scale = FootToe2FkScale
-                    refresh_hack()
-
-
-
-                    #Insert Keyframes if Action present
-                    if anim_data:
-                        if anim_data.action:
-                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                                #Collect Local Transforms
-                                KneePinRotEuler = pbones['knee_pin_R'].rotation_euler.copy()
-                                KneePinRotQuat = pbones['knee_pin_R'].rotation_quaternion.copy()
-                                KneePinLoc = pbones['knee_pin_R'].location.copy()
-                                KneePinScale = pbones['knee_pin_R'].scale.copy()
-
-                                MasterTorsoRotEuler = pbones['master_torso'].rotation_euler.copy()
-                                MasterTorsoRotQuat = pbones['master_torso'].rotation_quaternion.copy()
-                                MasterTorsoLoc = pbones['master_torso'].location.copy()
-                                MasterTorsoScale = pbones['master_torso'].scale.copy()
-
-                                SoleCtrlRotEuler = pbones['sole_ctrl_R'].rotation_euler.copy()
-                                SoleCtrlRotQuat = pbones['sole_ctrl_R'].rotation_quaternion.copy()
-                                SoleCtrlLoc = pbones['sole_ctrl_R'].location.copy()
-                                SoleCtrlScale = pbones['sole_ctrl_R'].scale.copy()
-
-                                KneePoleRotEuler = pbones['knee_pole_R'].rotation_euler.copy()
-                                KneePoleRotQuat = pbones['knee_pole_R'].rotation_quaternion.copy()
-                                KneePoleLoc = pbones['knee_pole_R'].location.copy()
-                                KneePoleScale = pbones['knee_pole_R'].scale.copy()
-
-                                ThighIkRotEuler = pbones['thigh_ik_R'].rotation_euler.copy()
-                                ThighIkRotQuat = pbones['thigh_ik_R'].rotation_quaternion.copy()
-                                ThighIkLoc = pbones['thigh_ik_R'].location.copy()
-                                ThighIkScale = pbones['thigh_ik_R'].scale.copy()
-
-                                ThighFkRotEuler = pbones['thigh_fk_R'].rotation_euler.copy()
-                                ThighFkRotQuat = pbones['thigh_fk_R'].rotation_quaternion.copy()
-                                ThighFkLoc = pbones['thigh_fk_R'].location.copy()
-                                ThighFkScale = pbones['thigh_fk_R'].scale.copy()
-
-                                ShinFkRotEuler = pbones['shin_fk_R'].rotation_euler.copy()
-                                ShinFkRotQuat = pbones['shin_fk_R'].rotation_quaternion.copy()
-                                ShinFkLoc = pbones['shin_fk_R'].location.copy()
-                                ShinFkScale = pbones['shin_fk_R'].scale.copy()
-                                FootFkRotEuler = pbones['foot_fk_R'].rotation_euler.copy()
-                                FootFkRotQuat = pbones['foot_fk_R'].rotation_quaternion.copy()
-                                FootFkLoc = pbones['foot_fk_R'].location.copy()
-                                FootFkScale = pbones['foot_fk_R'].scale.copy()
-
-                                for prop in bpy.context.active_object.data.items():
-                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                                        TarsalFkRotEuler = pbones['tarsal_fk_R'].rotation_euler.copy()
-                                        TarsalFkRotQuat = pbones['tarsal_fk_R'].rotation_quaternion.copy()
-                                        TarsalFkLoc = pbones['tarsal_fk_R'].location.copy()
-                                        TarsalFkScale = pbones['tarsal_fk_R'].scale.copy()
-                                        TarsalIkRotEuler = pbones['tarsal_ik_ctrl_R'].rotation_euler.copy()
-                                        TarsalIkRotQuat = pbones['tarsal_ik_ctrl_R'].rotation_quaternion.copy()
-                                        TarsaIFkLoc = pbones['tarsal_ik_ctrl_R'].location.copy()
-                                        TarsalIkScale = pbones['tarsal_ik_ctrl_R'].scale.copy()
-
-                                FootToe1FkRotEuler = pbones['foot_toe_1_fk_R'].rotation_euler.copy()
-                                FootToe1FkRotQuat = pbones['foot_toe_1_fk_R'].rotation_quaternion.copy()
-                                FootToe1FkLoc = pbones['foot_toe_1_fk_R'].location.copy()
-                                FootToe1FkScale = pbones['foot_toe_1_fk_R'].scale.copy()
-
-                                FootToe2FkRotEuler = pbones['foot_toe_2_fk_R'].rotation_euler.copy()
-                                FootToe2FkRotQuat = pbones['foot_toe_2_fk_R'].rotation_quaternion.copy()
-                                FootToe2FkLoc = pbones['foot_toe_2_fk_R'].location.copy()
-                                FootToe2FkScale = pbones['foot_toe_2_fk_R'].scale.copy()
-
-                                #Jump to next Frame
-                                bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
-
-                                #Key Property
-                                armobj.pose.bones["properties_leg_R"].pin_knee_R = 1.0
-                                refresh_hack()
-                                pbones["properties_leg_R"].keyframe_insert(data_path='pin_knee_R')
-
-                                #Re-Paste Transforms
-                                pbones['master_torso'].rotation_euler = MasterTorsoRotEuler
-                                pbones['master_torso'].rotation_quaternion = MasterTorsoRotQuat
-                                pbones['master_torso'].location = MasterTorsoLoc
-                                pbones['master_torso'].scale = MasterTorsoScale
-                                refresh_hack()
-                                pbones['pelvis_ctrl'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                                pbones['pelvis_ctrl'].location[:] = (0.0, 0.0, 0.0)
-                                refresh_hack()
-                                pbones['knee_pin_R'].rotation_euler = KneePinRotEuler
-                                pbones['knee_pin_R'].rotation_quaternion = KneePinRotQuat
-                                pbones['knee_pin_R'].location = KneePinLoc
-                                pbones['knee_pin_R'].scale = KneePinScale
-                                refresh_hack()
-                                pbones['sole_ctrl_R'].rotation_euler = SoleCtrlRotEuler
-                                pbones['sole_ctrl_R'].rotation_quaternion = SoleCtrlRotQuat
-                                pbones['sole_ctrl_R'].location = SoleCtrlLoc
-                                pbones['sole_ctrl_R'].scale = SoleCtrlScale
-                                refresh_hack()
-                                pbones['knee_pole_R'].rotation_euler = KneePoleRotEuler
-                                pbones['knee_pole_R'].rotation_quaternion = KneePoleRotQuat
-                                pbones['knee_pole_R'].location = KneePoleLoc
-                                pbones['knee_pole_R'].scale = KneePoleScale
-                                refresh_hack()
-                                pbones['thigh_ik_R'].rotation_euler = ThighIkRotEuler
-                                pbones['thigh_ik_R'].rotation_quaternion = ThighIkRotQuat
-                                pbones['thigh_ik_R'].location = ThighIkLoc
-                                pbones['thigh_ik_R'].scale = ThighIkScale
-                                refresh_hack()
-                                pbones['thigh_fk_R'].rotation_euler = ThighFkRotEuler
-                                pbones['thigh_fk_R'].rotation_quaternion = ThighFkRotQuat
-                                pbones['thigh_fk_R'].location = ThighFkLoc
-                                pbones['thigh_fk_R'].scale = ThighFkScale
-                                refresh_hack()
-                                pbones['shin_fk_R'].rotation_euler = ShinFkRotEuler
-                                pbones['shin_fk_R'].rotation_quaternion = ShinFkRotQuat
-                                pbones['shin_fk_R'].location = ShinFkLoc
-                                pbones['shin_fk_R'].scale = ShinFkScale
-                                refresh_hack()
-                                pbones['foot_fk_R'].rotation_euler = FootFkRotEuler
-                                pbones['foot_fk_R'].rotation_quaternion = FootFkRotQuat
-                                pbones['foot_fk_R'].location = FootFkLoc
-                                pbones['foot_fk_R'].scale = FootFkScale
-                                refresh_hack()
-                                for prop in bpy.context.active_object.data.items():
-                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                                        pbones['tarsal_ik_ctrl_R'].rotation_euler = TarsalIkRotEuler
-                                        pbones['tarsal_ik_ctrl_R'].rotation_quaternion = TarsalIkRotQuat
-                                        pbones['tarsal_ik_ctrl_R'].location = TarsaIFkLoc
-                                        pbones['tarsal_ik_ctrl_R'].scale = TarsalIkScale
-                                        refresh_hack()
-                                        pbones['tarsal_fk_R'].rotation_euler = TarsalFkRotEuler
-                                        pbones['tarsal_fk_R'].rotation_quaternion = TarsalFkRotQuat
-                                        pbones['tarsal_fk_R'].location = TarsalFkLoc
-                                        pbones['tarsal_fk_R'].scale = TarsalFkScale
-                                        refresh_hack()
-                                pbones['foot_toe_1_fk_R'].rotation_euler = FootToe1FkRotEuler
-                                pbones['foot_toe_1_fk_R'].rotation_quaternion = FootToe1FkRotQuat
-                                pbones['foot_toe_1_fk_R'].location = FootToe1FkLoc
-                                pbones['foot_toe_1_fk_R'].scale = FootToe1FkScale
-                                refresh_hack()
-                                pbones['foot_toe_2_fk_R'].rotation_euler = FootToe2FkRotEuler
-                                pbones['foot_toe_2_fk_R'].rotation_quaternion = FootToe2FkRotQuat
-                                pbones['foot_toe_2_fk_R'].location = FootToe2FkLoc
-                                pbones['foot_toe_2_fk_R'].scale = FootToe2FkScale
-                                refresh_hack()
-                                pbones['foot_roll_ctrl_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                                pbones['foot_ik_ctrl_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                                pbones['foot_ik_ctrl_R'].location[:] = (0.0, 0.0, 0.0)
-                                pbones['toe_roll_1_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                                pbones['toe_roll_2_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                                pbones['foot_toe_ik_ctrl_mid_R'].location[:] = (0.0, 0.0, 0.0)
-                                pbones['foot_toe_ik_ctrl_mid_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                                pbones['foot_toe_ik_ctrl_R'].location[:] = (0.0, 0.0, 0.0)
-                                pbones['foot_toe_ik_ctrl_R'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                                refresh_hack()
-
-                                insert_bkeys('master_torso', 'LocRotScale')
-                                insert_bkeys('pelvis_ctrl', 'LocRotScale')
-                                insert_bkeys('spine_1_fk', 'LocRotScale')
-                                insert_bkeys('spine_2_fk', 'LocRotScale')
-                                insert_bkeys('spine_3_fk', 'LocRotScale')
-                                insert_bkeys('spine_1_toon', 'LocRotScale')
-                                insert_bkeys('spine_2_toon', 'LocRotScale')
-                                insert_bkeys('spine_3_toon', 'LocRotScale')
-                                insert_bkeys('spine_4_toon', 'LocRotScale')
-                                insert_bkeys('torso_fk_ctrl_inv', 'LocRotScale')
-                                insert_bkeys('spine_3_fk_inv', 'LocRotScale')
-                                insert_bkeys('spine_2_fk_inv', 'LocRotScale')
-                                insert_bkeys('torso_fk_ctrl', 'LocRotScale')
-                                insert_bkeys('look', 'LocRotScale')
-                                insert_bkeys('elbow_pole_L', 'LocRotScale')
-                                insert_bkeys('elbow_pole_R', 'LocRotScale')
-                                insert_bkeys('knee_pole_L', 'LocRotScale')
-                                insert_bkeys('knee_pole_R', 'LocRotScale')
-                                insert_bkeys('thigh_fk_R', 'LocRotScale')
-                                insert_bkeys('shin_fk_R', 'LocRotScale')
-                                insert_bkeys('thigh_fk_ctrl_R', 'LocRotScale')
-                                insert_bkeys('foot_fk_R', 'LocRotScale')
-                                insert_bkeys('foot_toe_1_fk_R', 'LocRotScale')
-                                insert_bkeys('foot_toe_2_fk_R', 'LocRotScale')
-                                insert_bkeys('thigh_ik_R', 'RotScale')
-                                insert_bkeys('shin_ik_R', 'RotScale')
-                                insert_bkeys('foot_ik_ctrl_R', 'LocRotScale')
-                                insert_bkeys('foot_toe_ik_ctrl_mid_R', 'LocRotScale')
-                                insert_bkeys('foot_toe_ik_ctrl_R', 'LocRotScale')
-                                insert_bkeys('foot_roll_ctrl_R', 'Rot')
-                                insert_bkeys('toe_roll_1_R', 'Rot')
-                                insert_bkeys('toe_roll_2_R', 'Rot')
-                                insert_bkeys('sole_ctrl_R', 'LocRotScale')
-                                insert_bkeys('knee_pin_R', 'LocRotScale')
-                                if pbones["properties_leg_R"].toggle_leg_ik_pole_R == 1.0:
-                                    insert_bkeys('knee_pole_R', 'Loc')
-                                for prop in bpy.context.active_object.data.items():
-                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                                        insert_bkeys('tarsal_fk_R', 'LocRotScale')
-                                        insert_bkeys('tarsal_ik_ctrl_R', 'LocRotScale')
-
-        return {"FINISHED"}
-
-##### Knee_R UnPin #####
-
-class Operator_Knee_UnPin_R(bpy.types.Operator):
-
-    bl_idname = "unpin.knee_r"
-    bl_label = "BlenRig UnPin Knee_R"
-    bl_description = "UnPin Knee_R"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
-
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
-
-    def execute(self, context):
-
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        anim_data = armobj.animation_data
-
-        #Biped
-        for prop in bpy.context.active_object.data.items():
-            if prop[0] == 'rig_type' and prop[1] == 'Biped':
-
-                if armobj.pose.bones["properties_leg_R"].pin_knee_R > 0.9:
-
-                    #Collect Matrix
-                    MasterTorsoMat = pbones['master_torso'].matrix.copy()
-                    MasterTorsoLoc = pbones['master_torso'].location.copy()
-                    MasterTorsoScale = pbones['master_torso'].scale.copy()
-                    PelvisMat = pbones['pelvis_ctrl'].matrix.copy()
-                    PelvisLoc = pbones['pelvis_ctrl'].location.copy()
-                    PelvisScale = pbones['pelvis_ctrl'].scale.copy()
-                    Spine1FKMat = pbones['spine_1_fk'].matrix.copy()
-                    Spine1FKLoc = pbones['spine_1_fk'].location.copy()
-                    Spine1FKScale = pbones['spine_1_fk'].scale.copy()
-                    Spine2FKMat = pbones['spine_2_fk'].matrix.copy()
-                    Spine2FKLoc = pbones['spine_2_fk'].location.copy()
-                    Spine2FKScale = pbones['spine_2_fk'].scale.copy()
-                    Spine3FKMat = pbones['spine_3_fk'].matrix.copy()
-                    Spine3FKLoc = pbones['spine_3_fk'].location.copy()
-                    Spine3FKScale = pbones['spine_3_fk'].scale.copy()
-                    Spine1ToonMat = pbones['spine_1_toon'].matrix.copy()
-                    Spine1ToonLoc = pbones['spine_1_toon'].location.copy()
-                    Spine1ToonScale = pbones['spine_1_toon'].scale.copy()
-                    Spine2ToonMat = pbones['spine_2_toon'].matrix.copy()
-                    Spine2ToonLoc = pbones['spine_2_toon'].location.copy()
-                    Spine2ToonScale = pbones['spine_2_toon'].scale.copy()
-                    Spine3ToonMat = pbones['spine_3_toon'].matrix.copy()
-                    Spine3ToonLoc = pbones['spine_3_toon'].location.copy()
-                    Spine3ToonScale = pbones['spine_3_toon'].scale.copy()
-                    Spine4ToonMat = pbones['spine_4_toon'].matrix.copy()
-                    Spine4ToonLoc = pbones['spine_4_toon'].location.copy()
-                    Spine4ToonScale = pbones['spine_4_toon'].scale.copy()
-                    ElbowLMat = pbones['elbow_pole_R'].matrix.copy()
-                    ElbowRMat = pbones['elbow_pole_R'].matrix.copy()
-                    KneeLMat = pbones['knee_pole_R'].matrix.copy()
-                    KneeRMat = pbones['knee_pole_R'].matrix.copy()
-                    ThighFkMat = pbones['thigh_fk_R'].matrix.copy()
-                    ThighFkLoc = pbones['thigh_fk_R'].location.copy()
-                    ThighFkScale = pbones['thigh_fk_R'].scale.copy()
-                    ShinFkMat = pbones['shin_fk_R'].matrix.copy()
-                    ShinFkLoc = pbones['shin_fk_R'].location.copy()
-                    ShinFkScale = pbones['shin_fk_R'].scale.copy()
-                    SoleCtrlMat = pbones['sole_ctrl_R'].matrix.copy()
-                    SoleCtrlLoc = pbones['sole_ctrl_R'].location.copy()
-                    SoleCtrlScale = pbones['sole_ctrl_R'].scale.copy()
-                    FootFKMat = pbones['foot_fk_R'].matrix.copy()
-                    FootFKLoc = pbones['foot_fk_R'].location.copy()
-                    FootFkScale = pbones['foot_fk_R'].scale.copy()
-                    Look_world_mat = pbones['look'].id_data.matrix_world.copy()
-                    Look_mat = pbones['look'].matrix.copy()
-
-                    #Insert Keyframes if Action present
-                    if anim_data:
-                        if anim_data.action:
-                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                                pbones["properties_leg_R"].keyframe_insert(data_path='pin_knee_R')
-                                insert_bkeys('master_torso', 'LocRotScale')
-                                insert_bkeys('pelvis_ctrl', 'LocRotScale')
-                                insert_bkeys('spine_1_fk', 'LocRotScale')
-                                insert_bkeys('spine_2_fk', 'LocRotScale')
-                                insert_bkeys('spine_3_fk', 'LocRotScale')
-                                insert_bkeys('spine_1_toon', 'LocRotScale')
-                                insert_bkeys('spine_2_toon', 'LocRotScale')
-                                insert_bkeys('spine_3_toon', 'LocRotScale')
-                                insert_bkeys('spine_4_toon', 'LocRotScale')
-                                insert_bkeys('torso_fk_ctrl_inv', 'LocRotScale')
-                                insert_bkeys('spine_3_fk_inv', 'LocRotScale')
-                                insert_bkeys('spine_2_fk_inv', 'LocRotScale')
-                                insert_bkeys('torso_fk_ctrl', 'LocRotScale')
-                                insert_bkeys('look', 'LocRotScale')
-                                insert_bkeys('elbow_pole_R', 'LocRotScale')
-                                insert_bkeys('elbow_pole_R', 'LocRotScale')
-                                insert_bkeys('knee_pole_R', 'LocRotScale')
-                                insert_bkeys('knee_pole_R', 'LocRotScale')
-                                insert_bkeys('thigh_fk_R', 'LocRotScale')
-                                insert_bkeys('shin_fk_R', 'LocRotScale')
-                                insert_bkeys('thigh_fk_ctrl_R', 'LocRotScale')
-                                insert_bkeys('foot_fk_R', 'LocRotScale')
-                                insert_bkeys('foot_toe_1_fk_R', 'LocRotScale')
-                                insert_bkeys('foot_toe_2_fk_R', 'LocRotScale')
-                                insert_bkeys('thigh_ik_R', 'RotScale')
-                                insert_bkeys('shin_ik_R', 'RotScale')
-                                insert_bkeys('foot_ik_ctrl_R', 'LocRotScale')
-                                insert_bkeys('foot_toe_ik_ctrl_mid_R', 'LocRotScale')
-                                insert_bkeys('foot_toe_ik_ctrl_R', 'LocRotScale')
-                                insert_bkeys('foot_roll_ctrl_R', 'Rot')
-                                insert_bkeys('toe_roll_1_R', 'Rot')
-                                insert_bkeys('toe_roll_2_R', 'Rot')
-                                insert_bkeys('sole_ctrl_R', 'LocRotScale')
-                                insert_bkeys('knee_pin_R', 'LocRotScale')
-                                if pbones["properties_leg_R"].toggle_leg_ik_pole_R == 1.0:
-                                    insert_bkeys('knee_pole_R', 'Loc')
-                                for prop in bpy.context.active_object.data.items():
-                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                                        insert_bkeys('tarsal_fk_R', 'LocRotScale')
-                                        insert_bkeys('tarsal_ik_ctrl_R', 'LocRotScale')
-
-                    #Collect Current Pose and save new Matrix
-                    pVisLocExec (pbones['spine_1_fk'], pbones['spine_1_def'])
-                    pVisRotExec (pbones['spine_1_fk'], pbones['spine_1_def'])
-                    refresh_hack()
-                    Spine1FKMat2 = pbones['spine_1_fk'].matrix.copy()
-                    refresh_hack()
-                    pbones['spine_1_fk'].matrix = Spine1FKMat
-                    refresh_hack()
-                    pVisLocExec (pbones['spine_2_fk'], pbones['spine_2_def'])
-                    pVisRotExec (pbones['spine_2_fk'], pbones['spine_2_def'])
-                    refresh_hack()
-                    Spine2FKMat2 = pbones['spine_2_fk'].matrix.copy()
-                    refresh_hack()
-                    pbones['spine_2_fk'].matrix = Spine2FKMat
-                    refresh_hack()
-                    pVisLocExec (pbones['spine_3_fk'], pbones['spine_3_def'])
-                    pVisRotExec (pbones['spine_3_fk'], pbones['spine_3_def'])
-                    refresh_hack()
-                    Spine3FKMat2 = pbones['spine_3_fk'].matrix.copy()
-                    refresh_hack()
-                    pbones['spine_3_fk'].matrix = Spine3FKMat
-                    refresh_hack()
-
-                    #Paste Matrix
-                    pVisLocExec(pbones['master_torso'], pbones['snap_master_torso'])
-                    pVisRotExec (pbones['master_torso'], pbones['snap_master_torso'])
-                    refresh_hack()
-                    pVisLocExec(pbones['sole_ctrl_R'], pbones['snap_sole_ctrl_fk_R'])
-                    pVisRotExec (pbones['sole_ctrl_R'], pbones['snap_sole_ctrl_fk_R'])
-                    refresh_hack()
-                    pVisLocExec(pbones['knee_pole_R'], pbones['snap_knee_pole_fk_R'])
-                    refresh_hack()
-                    pVisRotExec (pbones['thigh_ik_R'], pbones['thigh_rot_R'])
-                    refresh_hack()
-                    pVisRotExec (pbones['thigh_fk_ctrl_R'], pbones['thigh_fk_R'])
-                    pbones['thigh_fk_ctrl_R'].scale[:] = (1.0, 1.0, 1.0)
-                    refresh_hack()
-
-                    bpy.context.active_object.pose.bones["properties_leg_R"].pin_knee_R = 0.0
-                    refresh_hack()
-                    #Align Spine
-                    pbones['torso_fk_ctrl_inv'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    pbones['torso_fk_ctrl_inv'].rotation_quaternion[:] = (1.0,0.0, 0.0, 0.0)
-                    pbones['torso_fk_ctrl_inv'].location[:] = (0.0, 0.0, 0.0)
-                    pbones['torso_fk_ctrl_inv'].scale[:] = (1.0, 1.0, 1.0)
-                    refresh_hack()
-                    pbones['spine_3_fk_inv'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    pbones['spine_3_fk_inv'].rotation_quaternion[:] = (1.0,0.0, 0.0, 0.0)
-                    pbones['spine_3_fk_inv'].location[:] = (0.0, 0.0, 0.0)
-                    pbones['spine_3_fk_inv'].scale[:] = (1.0, 1.0, 1.0)
-                    refresh_hack()
-                    pbones['spine_2_fk_inv'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    pbones['spine_2_fk_inv'].rotation_quaternion[:] = (1.0,0.0, 0.0, 0.0)
-                    pbones['spine_2_fk_inv'].location[:] = (0.0, 0.0, 0.0)
-                    pbones['spine_2_fk_inv'].scale[:] = (1.0, 1.0, 1.0)
-                    refresh_hack()
-                    pbones['pelvis_ctrl'].matrix = PelvisMat
-                    refresh_hack()
-                    pbones['spine_1_fk'].matrix = Spine1FKMat2
-                    refresh_hack()
-                    pbones['spine_2_fk'].matrix = Spine2FKMat2
-                    refresh_hack()
-                    pbones['spine_3_fk'].matrix = Spine3FKMat2
-                    refresh_hack()
-                    pbones['spine_1_toon'].matrix = Spine1ToonMat
-                    pbones['spine_1_toon'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    refresh_hack()
-                    pbones['spine_2_toon'].matrix = Spine2ToonMat
-                    pbones['spine_2_toon'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    refresh_hack()
-                    pbones['spine_3_toon'].matrix = Spine3ToonMat
-                    pbones['spine_3_toon'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    refresh_hack()
-                    pbones['spine_4_toon'].matrix = Spine4ToonMat
-                    pbones['spine_4_toon'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                    refresh_hack()
-                    pbones['elbow_pole_R'].matrix = ElbowLMat
-                    refresh_hack()
-                    pbones['elbow_pole_R'].matrix = ElbowRMat
-                    refresh_hack()
-                    #Leg
-                    pbones['thigh_fk_R'].matrix = ThighFkMat
-                    refresh_hack()
-                    pbones['shin_fk_R'].matrix = ShinFkMat
-                    refresh_hack()
-                    #Correct thigh_fk twist
-                    pVisRotExec (pbones['thigh_fk_R'], pbones['thigh_rot_R'])
-                    refresh_hack()
-                    #Re-paste shin matrix
-                    pbones['shin_fk_R'].matrix = ShinFkMat
-                    pbones['shin_fk_R'].location = ShinFkLoc
-                    pbones['shin_fk_R'].scale = ShinFkScale
-                    refresh_hack()
-                    pbones['foot_fk_R'].matrix = FootFKMat
-                    pbones['foot_fk_R'].location = FootFKLoc
-                    pbones['foot_fk_R'].scale = FootFkScale
-                    refresh_hack()
-                    if bpy.context.active_object.pose.bones["properties_head"].look_switch == 0.0:
-                        paste_visual_matrix('look', 'look_free', Look_world_mat, Look_mat, 'Location')
-                        paste_visual_matrix('look', 'look_free', Look_world_mat, Look_mat, 'Rotation')
-                    if bpy.context.active_object.pose.bones["properties_head"].look_switch == 1.0:
-                        paste_visual_matrix('look', 'master_body_pivot', Look_world_mat, Look_mat, 'Location')
-                        paste_visual_matrix('look', 'master_body_pivot', Look_world_mat, Look_mat, 'Rotation')
-                    if bpy.context.active_object.pose.bones["properties_head"].look_switch == 2.0:
-                        paste_visual_matrix('look', 'master_torso_pivot', Look_world_mat, Look_mat, 'Location')
-                        paste_visual_matrix('look', 'master_torso_pivot', Look_world_mat, Look_mat, 'Rotation')
-                    if bpy.context.active_object.pose.bones["properties_head"].look_switch == 3.0:
-                        paste_visual_matrix('look', 'head_fk', Look_world_mat, Look_mat, 'Location')
-                        paste_visual_matrix('look', 'head_fk', Look_world_mat, Look_mat, 'Rotation')
-                    refresh_hack()
-                    #Insert Keyframes if Action present
-                    if anim_data:
-                        if anim_data.action:
-                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                                #Collect Local Transforms
-                                MasterTorsoRotEuler = pbones['master_torso'].rotation_euler.copy()
-                                MasterTorsoLoc = pbones['master_torso'].location.copy()
-                                MasterTorsoScale = pbones['master_torso'].scale.copy()
-
-                                PelvisRotEuler = pbones['pelvis_ctrl'].rotation_euler.copy()
-                                PelvisLoc = pbones['pelvis_ctrl'].location.copy()
-                                PelvisScale = pbones['pelvis_ctrl'].scale.copy()
-
-                                Spine1FKRotEuler = pbones['spine_1_fk'].rotation_euler.copy()
-                                Spine1FKLoc = pbones['spine_1_fk'].location.copy()
-                                Spine1FKScale = pbones['spine_1_fk'].scale.copy()
-
-                                Spine2FKRotEuler = pbones['spine_2_fk'].rotation_euler.copy()
-                                Spine2FKLoc = pbones['spine_2_fk'].location.copy()
-                                Spine2FKScale = pbones['spine_2_fk'].scale.copy()
-
-                                Spine3FKRotEuler = pbones['spine_3_fk'].rotation_euler.copy()
-                                Spine3FKLoc = pbones['spine_3_fk'].location.copy()
-                                Spine3FKScale = pbones['spine_3_fk'].scale.copy()
-
-                                Spine1ToonRotEuler = pbones['spine_1_toon'].rotation_euler.copy()
-                                Spine1ToonLoc = pbones['spine_1_toon'].location.copy()
-                                Spine1ToonScale = pbones['spine_1_toon'].scale.copy()
-
-                                Spine2ToonRotEuler = pbones['spine_2_toon'].rotation_euler.copy()
-                                Spine2ToonLoc = pbones['spine_2_toon'].location.copy()
-                                Spine2ToonScale = pbones['spine_2_toon'].scale.copy()
-
-                                Spine3ToonRotEuler = pbones['spine_3_toon'].rotation_euler.copy()
-                                Spine3ToonLoc = pbones['spine_3_toon'].location.copy()
-                                Spine3ToonScale = pbones['spine_3_toon'].scale.copy()
-
-                                Spine4ToonRotEuler = pbones['spine_4_toon'].rotation_euler.copy()
-                                Spine4ToonLoc = pbones['spine_4_toon'].location.copy()
-                                Spine4ToonScale = pbones['spine_4_toon'].scale.copy()
-
-                                TorsoFkCtrlRotEuler = pbones['torso_fk_ctrl'].rotation_euler.copy()
-                                TorsoFkCtrlLoc = pbones['torso_fk_ctrl'].location.copy()
-                                TorsoFkCtrlScale = pbones['torso_fk_ctrl'].scale.copy()
-
-                                LookRotEuler = pbones['look'].rotation_euler.copy()
-                                LookLoc = pbones['look'].location.copy()
-                                LookScale = pbones['look'].scale.copy()
-
-                                ElbowLRotEuler = pbones['elbow_pole_R'].rotation_euler.copy()
-                                ElbowLLoc = pbones['elbow_pole_R'].location.copy()
-                                ElbowLScale = pbones['elbow_pole_R'].scale.copy()
-
-                                ElbowRRotEuler = pbones['elbow_pole_R'].rotation_euler.copy()
-                                ElbowRLoc = pbones['elbow_pole_R'].location.copy()
-                                ElbowRScale = pbones['elbow_pole_R'].scale.copy()
-
-                                KneeLRotEuler = pbones['knee_pole_R'].rotation_euler.copy()
-                                KneeLLoc = pbones['knee_pole_R'].location.copy()
-                                KneeLScale = pbones['knee_pole_R'].scale.copy()
-
-                                KneeRRotEuler = pbones['knee_pole_R'].rotation_euler.copy()
-                                KneeRLoc = pbones['knee_pole_R'].location.copy()
-                                KneeRScale = pbones['knee_pole_R'].scale.copy()
-
-                                ThighCtrlRotEuler = pbones['thigh_fk_ctrl_R'].rotation_euler.copy()
-                                ThighCtrlRotQuat = pbones['thigh_fk_ctrl_R'].rotation_quaternion.copy()
-                                ThighCtrlLoc = pbones['thigh_fk_ctrl_R'].location.copy()
-                                ThighCtrlScale = pbones['thigh_fk_ctrl_R'].scale.copy()
-
-                                ThighFkRotEuler = pbones['thigh_fk_R'].rotation_euler.copy()
-                                ThighFkRotQuat = pbones['thigh_fk_R'].rotation_quaternion.copy()
-                                ThighFkLoc = pbones['thigh_fk_R'].location.copy()
-                                ThighFkScale = pbones['thigh_fk_R'].scale.copy()
-
-                                ShinFkRotEuler = pbones['shin_fk_R'].rotation_euler.copy()
-                                ShinFkRotQuat = pbones['shin_fk_R'].rotation_quaternion.copy()
-                                ShinFkLoc = pbones['shin_fk_R'].location.copy()
-                                ShinFkScale = pbones['shin_fk_R'].scale.copy()
-
-                                SoleCtrlRotEuler = pbones['sole_ctrl_R'].rotation_euler.copy()
-                                SoleCtrlRotQuat = pbones['sole_ctrl_R'].rotation_quaternion.copy()
-                                SoleCtrlLoc = pbones['sole_ctrl_R'].location.copy()
-                                SoleCtrlScale = pbones['sole_ctrl_R'].scale.copy()
-
-                                ThighIkRotEuler = pbones['thigh_ik_R'].rotation_euler.copy()
-                                ThighIkRotQuat = pbones['thigh_ik_R'].rotation_quaternion.copy()
-                                ThighIkLoc = pbones['thigh_ik_R'].location.copy()
-                                ThighIkScale = pbones['thigh_ik_R'].scale.copy()
-
-                                #Jump to next Frame
-                                bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
-
-                                #Key Property
-                                armobj.pose.bones["properties_leg_R"].pin_knee_R = 0.0
-                                refresh_hack()
-                                pbones["properties_leg_R"].keyframe_insert(data_path='pin_knee_R')
-
-                                #Re-Paste Transforms
-                                pbones['master_torso'].rotation_euler = MasterTorsoRotEuler
-                                pbones['master_torso'].location = MasterTorsoLoc
-                                pbones['master_torso'].scale = MasterTorsoScale
-                                refresh_hack()
-                                pbones['torso_fk_ctrl_inv'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                                pbones['torso_fk_ctrl_inv'].rotation_quaternion[:] = (1.0,0.0, 0.0, 0.0)
-                                pbones['torso_fk_ctrl_inv'].location[:] = (0.0, 0.0, 0.0)
-                                refresh_hack()
-                                pbones['spine_3_fk_inv'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                                pbones['spine_3_fk_inv'].rotation_quaternion[:] = (1.0,0.0, 0.0, 0.0)
-                                pbones['spine_3_fk_inv'].location[:] = (0.0, 0.0, 0.0)
-                                refresh_hack()
-                                pbones['spine_2_fk_inv'].rotation_euler[:] = (0.0, 0.0, 0.0)
-                                pbones['spine_2_fk_inv'].rotation_quaternion[:] = (1.0,0.0, 0.0, 0.0)
-                                pbones['spine_2_fk_inv'].location[:] = (0.0, 0.0, 0.0)
-                                refresh_hack()
-                                pbones['pelvis_ctrl'].rotation_euler = PelvisRotEuler
-                                pbones['pelvis_ctrl'].location = PelvisLoc
-                                pbones['pelvis_ctrl'].scale = PelvisScale
-                                refresh_hack()
-                                pbones['spine_1_fk'].rotation_euler = Spine1FKRotEuler
-                                pbones['spine_1_fk'].location = Spine1FKLoc
-                                pbones['spine_1_fk'].scale = Spine1FKScale
-                                refresh_hack()
-                                pbones['spine_2_fk'].rotation_euler = Spine2FKRotEuler
-                                pbones['spine_2_fk'].location = Spine2FKLoc
-                                pbones['spine_2_fk'].scale = Spine2FKScale
-                                refresh_hack()
-                                pbones['spine_3_fk'].rotation_euler = Spine3FKRotEuler
-                                pbones['spine_3_fk'].location = Spine3FKLoc
-                                pbones['spine_3_fk'].scale = Spine3FKScale
-                                refresh_hack()
-                                pbones['spine_1_toon'].rotation_euler = Spine1ToonRotEuler
-                                pbones['spine_1_toon'].location = Spine1ToonLoc
-                                pbones['spine_1_toon'].scale = Spine1ToonScale
-                                refresh_hack()
-                                pbones['spine_2_toon'].rotation_euler = Spine2ToonRotEuler
-                                pbones['spine_2_toon'].location = Spine2ToonLoc
-                                pbones['spine_2_toon'].scale = Spine2ToonScale
-                                refresh_hack()
-                                pbones['spine_3_toon'].rotation_euler = Spine3ToonRotEuler
-                                pbones['spine_3_toon'].location = Spine3ToonLoc
-                                pbones['spine_3_toon'].scale = Spine3ToonScale
-                                refresh_hack()
-                                pbones['spine_4_toon'].rotation_euler = Spine4ToonRotEuler
-                                pbones['spine_4_toon'].location = Spine4ToonLoc
-                                pbones['spine_4_toon'].scale = Spine4ToonScale
-                                refresh_hack()
-                                pbones['torso_fk_ctrl'].rotation_euler = TorsoFkCtrlRotEuler
-                                pbones['torso_fk_ctrl'].location = TorsoFkCtrlLoc
-                                pbones['torso_fk_ctrl'].scale = TorsoFkCtrlScale
-                                refresh_hack()
-                                pbones['look'].rotation_euler = LookRotEuler
-                                pbones['look'].location = LookLoc
-                                pbones['look'].scale = LookScale
-                                refresh_hack()
-                                pbones['elbow_pole_R'].rotation_euler = ElbowLRotEuler
-                                pbones['elbow_pole_R'].location = ElbowLLoc
-                                pbones['elbow_pole_R'].scale = ElbowLScale
-                                refresh_hack()
-                                pbones['elbow_pole_R'].rotation_euler = ElbowRRotEuler
-                                pbones['elbow_pole_R'].location = ElbowRLoc
-                                pbones['elbow_pole_R'].scale = ElbowRScale
-                                refresh_hack()
-                                pbones['knee_pole_R'].rotation_euler = KneeLRotEuler
-                                pbones['knee_pole_R'].location = KneeLLoc
-                                pbones['knee_pole_R'].scale = KneeLScale
-                                refresh_hack()
-                                pbones['knee_pole_R'].rotation_euler = KneeRRotEuler
-                                pbones['knee_pole_R'].location = KneeRLoc
-                                pbones['knee_pole_R'].scale = KneeRScale
-                                refresh_hack()
-                                pbones['thigh_fk_ctrl_R'].rotation_euler = ThighCtrlRotEuler
-                                pbones['thigh_fk_ctrl_R'].rotation_quaternion = ThighCtrlRotQuat
-                                pbones['thigh_fk_ctrl_R'].location = ThighCtrlLoc
-                                pbones['thigh_fk_ctrl_R'].scale = ThighCtrlScale
-                                refresh_hack()
-                                pbones['thigh_fk_R'].rotation_euler = ThighFkRotEuler
-                                pbones['thigh_fk_R'].rotation_quaternion = ThighFkRotQuat
-                                pbones['thigh_fk_R'].location = ThighFkLoc
-                                pbones['thigh_fk_R'].scale = ThighFkScale
-                                refresh_hack()
-                                pbones['shin_fk_R'].rotation_euler = ShinFkRotEuler
-                                pbones['shin_fk_R'].rotation_quaternion = ShinFkRotQuat
-                                pbones['shin_fk_R'].location = ShinFkLoc
-                                pbones['shin_fk_R'].scale = ShinFkScale
-                                refresh_hack()
-                                pbones['sole_ctrl_R'].rotation_euler = SoleCtrlRotEuler
-                                pbones['sole_ctrl_R'].rotation_quaternion = SoleCtrlRotQuat
-                                pbones['sole_ctrl_R'].location = SoleCtrlLoc
-                                pbones['sole_ctrl_R'].scale = SoleCtrlScale
-                                refresh_hack()
-                                pbones['thigh_ik_R'].rotation_euler = ThighIkRotEuler
-                                pbones['thigh_ik_R'].rotation_quaternion = ThighIkRotQuat
-                                pbones['thigh_ik_R'].location = ThighIkLoc
-                                pbones['thigh_ik_R'].scale = ThighIkScale
-                                refresh_hack()
-
-                                insert_bkeys('master_torso', 'LocRotScale')
-                                insert_bkeys('pelvis_ctrl', 'LocRotScale')
-                                insert_bkeys('spine_1_fk', 'LocRotScale')
-                                insert_bkeys('spine_2_fk', 'LocRotScale')
-                                insert_bkeys('spine_3_fk', 'LocRotScale')
-                                insert_bkeys('spine_1_toon', 'LocRotScale')
-                                insert_bkeys('spine_2_toon', 'LocRotScale')
-                                insert_bkeys('spine_3_toon', 'LocRotScale')
-                                insert_bkeys('spine_4_toon', 'LocRotScale')
-                                insert_bkeys('torso_fk_ctrl_inv', 'LocRotScale')
-                                insert_bkeys('spine_3_fk_inv', 'LocRotScale')
-                                insert_bkeys('spine_2_fk_inv', 'LocRotScale')
-                                insert_bkeys('torso_fk_ctrl', 'LocRotScale')
-                                insert_bkeys('look', 'LocRotScale')
-                                insert_bkeys('elbow_pole_R', 'LocRotScale')
-                                insert_bkeys('elbow_pole_R', 'LocRotScale')
-                                insert_bkeys('knee_pole_R', 'LocRotScale')
-                                insert_bkeys('knee_pole_R', 'LocRotScale')
-                                insert_bkeys('thigh_fk_R', 'LocRotScale')
-                                insert_bkeys('shin_fk_R', 'LocRotScale')
-                                insert_bkeys('thigh_fk_ctrl_R', 'LocRotScale')
-                                insert_bkeys('foot_fk_R', 'LocRotScale')
-                                insert_bkeys('foot_toe_1_fk_R', 'LocRotScale')
-                                insert_bkeys('foot_toe_2_fk_R', 'LocRotScale')
-                                insert_bkeys('thigh_ik_R', 'RotScale')
-                                insert_bkeys('shin_ik_R', 'RotScale')
-                                insert_bkeys('foot_ik_ctrl_R', 'LocRotScale')
-                                insert_bkeys('foot_toe_ik_ctrl_mid_R', 'LocRotScale')
-                                insert_bkeys('foot_toe_ik_ctrl_R', 'LocRotScale')
-                                insert_bkeys('foot_roll_ctrl_R', 'Rot')
-                                insert_bkeys('toe_roll_1_R', 'Rot')
-                                insert_bkeys('toe_roll_2_R', 'Rot')
-                                insert_bkeys('sole_ctrl_R', 'LocRotScale')
-                                insert_bkeys('knee_pin_R', 'LocRotScale')
-                                if pbones["properties_leg_R"].toggle_leg_ik_pole_R == 1.0:
-                                    insert_bkeys('knee_pole_R', 'Loc')
-                                for prop in bpy.context.active_object.data.items():
-                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
-                                        insert_bkeys('tarsal_fk_R', 'LocRotScale')
-                                        insert_bkeys('tarsal_ik_ctrl_R', 'LocRotScale')
-
-        return {"FINISHED"}
-
-##### Head Ops #####
-
-##### Head #####
-
-class Operator_Switch_Head_Space(bpy.types.Operator):
-
-    bl_idname = "switch.head_space"
-    bl_label = "BlenRig Switch Head Space"
-    bl_description = "Switch Head Space preserving pose"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
-
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
-
-    #Create string property to parse argument to the operator
-    space : bpy.props.StringProperty()
-
-    def execute(self, context):
-
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        anim_data = armobj.animation_data
-
-        #Collect Matrix
-        HeadMat = pbones['head_fk'].matrix.copy()
-
-        #Insert Keyframes if Action present
-        if anim_data:
-            if anim_data.action:
-                if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                    pbones["properties_head"].keyframe_insert(data_path='space_head')
-                    insert_bkeys('head_fk', 'LocRotScale')
-
-        if self.space == 'Free':
-            bpy.context.active_object.pose.bones["properties_head"].space_head = 0.0
-            refresh_hack()
-        if self.space == 'Torso':
-            bpy.context.active_object.pose.bones["properties_head"].space_head = 1.0
-            refresh_hack()
-
-        #Paste Matrix
-        pbones['head_fk'].matrix = HeadMat
-        refresh_hack()
-
-        #Insert Keyframes if Action present
-        if anim_data:
-            if anim_data.action:
-                if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                    #Collect Local Transforms
-                    HeadRotEuler = pbones['head_fk'].rotation_euler.copy()
-                    HeadRotQuat = pbones['head_fk'].rotation_quaternion.copy()
-                    HeadLoc = pbones['head_fk'].location.copy()
-                    HeadScale = pbones['head_fk'].scale.copy()
-
-                    #Jump to next Frame
-                    bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
-
-                    #Key Property
-                    if self.space == 'Free':
-                        bpy.context.active_object.pose.bones["properties_head"].space_head = 0.0
-                        refresh_hack()
-                    if self.space == 'Torso':
-                        bpy.context.active_object.pose.bones["properties_head"].space_head = 1.0
-                        refresh_hack()
-                    pbones["properties_head"].keyframe_insert(data_path='space_head')
-
-                    #Re-Paste Transforms
-                    pbones['head_fk'].rotation_euler = HeadRotEuler
-                    pbones['head_fk'].rotation_quaternion = HeadRotQuat
-                    pbones['head_fk'].location = HeadLoc
-                    pbones['head_fk'].scale = HeadScale
-                    refresh_hack()
-
-                    insert_bkeys('head_fk', 'LocRotScale')
-
-        return {"FINISHED"}
-
-#Create Space PopUp
-def Head_Space_List(self, context):
-    col = self.layout.column()
-    col.operator("switch.head_space", text = "Free").space = 'Free'
-    col.operator("switch.head_space", text = "Torso").space = 'Torso'
-
-class Operator_Show_Head_Space_List(bpy.types.Operator):
-    bl_idname = "show.head_list"
-    bl_label = "Head Space Switch List"
-    bl_description = "Switch Head Space"
-
-    def invoke(self, context, event):
-        context.window_manager.popup_menu(Head_Space_List, title='Switch Head Space', icon='MOD_ARMATURE')
-        return {'FINISHED'}
-
-##### Neck #####
-
-class Operator_Switch_Neck_Space(bpy.types.Operator):
-
-    bl_idname = "switch.neck_space"
-    bl_label = "BlenRig Switch Neck Space"
-    bl_description = "Switch Neck Space preserving pose"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
-
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
-
-    #Create string property to parse argument to the operator
-    space : bpy.props.StringProperty()
-
-    def execute(self, context):
-
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        anim_data = armobj.animation_data
-
-        #Collect Matrix
-        NeckMat = pbones['neck_1_fk'].matrix.copy()
-
-        #Insert Keyframes if Action present
-        if anim_data:
-            if anim_data.action:
-                if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                    pbones["properties_head"].keyframe_insert(data_path='space_neck')
-                    insert_bkeys('neck_1_fk', 'LocRotScale')
-
-        if self.space == 'Free':
-            bpy.context.active_object.pose.bones["properties_head"].space_neck = 0.0
-            refresh_hack()
-        if self.space == 'Torso':
-            bpy.context.active_object.pose.bones["properties_head"].space_neck = 1.0
-            refresh_hack()
-
-        #Paste Matrix
-        pbones['neck_1_fk'].matrix = NeckMat
-        refresh_hack()
-
-        #Insert Keyframes if Action present
-        if anim_data:
-            if anim_data.action:
-                if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                    #Collect Local Transforms
-                    NeckRotEuler = pbones['neck_1_fk'].rotation_euler.copy()
-                    NeckRotQuat = pbones['neck_1_fk'].rotation_quaternion.copy()
-                    NeckLoc = pbones['neck_1_fk'].location.copy()
-                    NeckScale = pbones['neck_1_fk'].scale.copy()
-
-                    #Jump to next Frame
-                    bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
-
-                    #Key Property
-                    if self.space == 'Free':
-                        bpy.context.active_object.pose.bones["properties_head"].space_neck = 0.0
-                        refresh_hack()
-                    if self.space == 'Torso':
-                        bpy.context.active_object.pose.bones["properties_head"].space_neck = 1.0
-                        refresh_hack()
-                    pbones["properties_head"].keyframe_insert(data_path='space_neck')
-
-                    #Re-Paste Transforms
-                    pbones['neck_1_fk'].rotation_euler = NeckRotEuler
-                    pbones['neck_1_fk'].rotation_quaternion = NeckRotQuat
-                    pbones['neck_1_fk'].location = NeckLoc
-                    pbones['neck_1_fk'].scale = NeckScale
-                    refresh_hack()
-
-                    insert_bkeys('neck_1_fk', 'LocRotScale')
-
-        return {"FINISHED"}
-
-#Create Space PopUp
-def Neck_Space_List(self, context):
-    col = self.layout.column()
-    col.operator("switch.neck_space", text = "Free").space = 'Free'
-    col.operator("switch.neck_space", text = "Torso").space = 'Torso'
-
-class Operator_Show_Neck_Space_List(bpy.types.Operator):
-    bl_idname = "show.neck_list"
-    bl_label = "Neck Space Switch List"
-    bl_description = "Switch Neck Space"
-
-    def invoke(self, context, event):
-        context.window_manager.popup_menu(Neck_Space_List, title='Switch Neck Space', icon='MOD_ARMATURE')
-        return {'FINISHED'}
-
-##### Look #####
-
-class Operator_Switch_Look_Space(bpy.types.Operator):
-
-    bl_idname = "switch.look_space"
-    bl_label = "BlenRig Switch Look Space"
-    bl_description = "Switch Look Space preserving pose"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
-
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
-
-    #Create string property to parse argument to the operator
-    space : bpy.props.StringProperty()
-
-    def execute(self, context):
-
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        anim_data = armobj.animation_data
-
-        #Insert Keyframes if Action present
-        if anim_data:
-            if anim_data.action:
-                if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                    pbones["properties_head"].keyframe_insert(data_path='look_switch')
-                    insert_bkeys('look', 'LocRotScale')
-
-        if self.space == 'Free':
-            #Get Matrix in previous space
-            Look_world_mat = pbones['look'].id_data.matrix_world.copy()
-            Look_mat = pbones['look'].matrix.copy()
-
-            #Change Space
-            bpy.context.active_object.pose.bones["properties_head"].look_switch = 0.0
-
-            paste_visual_matrix('look', 'look_free', Look_world_mat, Look_mat, 'Location')
-            paste_visual_matrix('look', 'look_free', Look_world_mat, Look_mat, 'Rotation')
-
-        if self.space == 'Body':
-            #Get Matrix in previous space
-            Look_world_mat = pbones['look'].id_data.matrix_world.copy()
-            Look_mat = pbones['look'].matrix.copy()
-
-            #Change Space
-            bpy.context.active_object.pose.bones["properties_head"].look_switch = 1.0
-
-            paste_visual_matrix('look', 'master_body_pivot', Look_world_mat, Look_mat, 'Location')
-            paste_visual_matrix('look', 'master_body_pivot', Look_world_mat, Look_mat, 'Rotation')
-
-        if self.space == 'Torso':
-            #Get Matrix in previous space
-            Look_world_mat = pbones['look'].id_data.matrix_world.copy()
-            Look_mat = pbones['look'].matrix.copy()
-
-            #Change Space
-            bpy.context.active_object.pose.bones["properties_head"].look_switch = 2.0
-
-            paste_visual_matrix('look', 'master_torso_pivot', Look_world_mat, Look_mat, 'Location')
-            paste_visual_matrix('look', 'master_torso_pivot', Look_world_mat, Look_mat, 'Rotation')
-
-        if self.space == 'Head':
-            #Get Matrix in previous space
-            Look_world_mat = pbones['look'].id_data.matrix_world.copy()
-            Look_mat = pbones['look'].matrix.copy()
-
-            #Change Space
-            bpy.context.active_object.pose.bones["properties_head"].look_switch = 3.0
-
-            paste_visual_matrix('look', 'head_fk', Look_world_mat, Look_mat, 'Location')
-            paste_visual_matrix('look', 'head_fk', Look_world_mat, Look_mat, 'Rotation')
-
-        #Insert Keyframes if Action present
-        if anim_data:
-            if anim_data.action:
-                if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                    #Collect Local Transforms
-                    LookRotEuler = pbones['look'].rotation_euler.copy()
-                    LookRotQuat = pbones['look'].rotation_quaternion.copy()
-                    LookLoc = pbones['look'].location.copy()
-                    LookScale = pbones['look'].scale.copy()
-
-                    #Jump to next Frame
-                    bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
-
-                    #Key Property
-                    if self.space == 'Free':
-                        bpy.context.active_object.pose.bones["properties_head"].look_switch = 0.0
-                    if self.space == 'Body':
-                        bpy.context.active_object.pose.bones["properties_head"].look_switch = 1.0
-                    if self.space == 'Torso':
-                        bpy.context.active_object.pose.bones["properties_head"].look_switch = 2.0
-                    if self.space == 'Head':
-                        bpy.context.active_object.pose.bones["properties_head"].look_switch = 3.0
-                    pbones["properties_head"].keyframe_insert(data_path='look_switch')
-
-                    #Re-Paste Transforms
-                    pbones['look'].rotation_euler = LookRotEuler
-                    pbones['look'].rotation_quaternion = LookRotQuat
-                    pbones['look'].location = LookLoc
-                    pbones['look'].scale = LookScale
+                    bpy.context.active_object.pose.bones["properties_leg_R"].pin_knee_R = 0.0
                     refresh_hack()
-
-                    insert_bkeys('look', 'LocRotScale')
-
-        return {"FINISHED"}
-
-#Create Space PopUp
-def Look_Space_List(self, context):
-    col = self.layout.column()
-    col.operator("switch.look_space", text = "Free").space = 'Free'
-    col.operator("switch.look_space", text = "Body").space = 'Body'
-    col.operator("switch.look_space", text = "Torso").space = 'Torso'
-    col.operator("switch.look_space", text = "Head").space = 'Head'
-
-class Operator_Show_Look_Space_List(bpy.types.Operator):
-    bl_idname = "show.look_list"
-    bl_label = "Look Space Switch List"
-    bl_description = "Switch Look Space"
-
-    def invoke(self, context, event):
-        context.window_manager.popup_menu(Look_Space_List, title='Switch Look Space', icon='MOD_ARMATURE')
-        return {'FINISHED'}
-
-##### Props Ops #####
-
-##### EyeGlasses #####
-
-class Operator_Switch_Eyeglasses_Space(bpy.types.Operator):
-
-    bl_idname = "switch.eyeglasses_space"
-    bl_label = "BlenRig Switch Eyeglasses Space"
-    bl_description = "Switch Eyeglasses Space preserving pose"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
-
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
-
-    #Create string property to parse argument to the operator
-    space : bpy.props.StringProperty()
-
-    def execute(self, context):
-
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        anim_data = armobj.animation_data
-
-        #Collect Matrix
-        EyeglassesMat = pbones['eyeglasses_mstr'].matrix.copy()
-
-        #Insert Keyframes if Action present
-        if anim_data:
-            if anim_data.action:
-                if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                    pbones["properties_head"].keyframe_insert(data_path='["glasses_free"]')
-                    insert_bkeys('eyeglasses_mstr', 'LocRotScale')
-
-        if self.space == 'Free':
-            bpy.context.active_object.pose.bones["properties_head"]["glasses_free"] = 0.0
-            refresh_hack()
-        if self.space == 'Head':
-            bpy.context.active_object.pose.bones["properties_head"]["glasses_free"] = 1.0
-            refresh_hack()
-
-        #Paste Matrix
-        pbones['eyeglasses_mstr'].matrix = EyeglassesMat
-        refresh_hack()
-
-        #Insert Keyframes if Action present
-        if anim_data:
-            if anim_data.action:
-                if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                    #Collect Local Transforms
-                    EyeGlassesRotEuler = pbones['eyeglasses_mstr'].rotation_euler.copy()
-                    EyeGlassesRotQuat = pbones['eyeglasses_mstr'].rotation_quaternion.copy()
-                    EyeGlassesLoc = pbones['eyeglasses_mstr'].location.copy()
-                    EyeGlassesScale = pbones['eyeglasses_mstr'].scale.copy()
-
-                    #Jump to next Frame
-                    bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
-
-                    #Key Property
-                    if self.space == 'Free':
-                        bpy.context.active_object.pose.bones["properties_head"]["glasses_free"] = 0.0
-                        refresh_hack()
-                    if self.space == 'Head':
-                        bpy.context.active_object.pose.bones["properties_head"]["glasses_free"] = 1.0
-                        refresh_hack()
-                    pbones["properties_head"].keyframe_insert(data_path='["glasses_free"]')
-
-                    #Re-Paste Transforms
-                    pbones['eyeglasses_mstr'].rotation_euler = EyeGlassesRotEuler
-                    pbones['eyeglasses_mstr'].rotation_quaternion = EyeGlassesRotQuat
-                    pbones['eyeglasses_mstr'].location = EyeGlassesLoc
-                    pbones['eyeglasses_mstr'].scale = EyeGlassesScale
+                    #Align Spine
+                    pbones['torso_fk_ctrl_inv'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                    pbones['torso_fk_ctrl_inv'].rotation_quaternion[:] = (1.0,0.0, 0.0, 0.0)
+                    pbones['torso_fk_ctrl_inv'].location[:] = (0.0, 0.0, 0.0)
+                    pbones['torso_fk_ctrl_inv'].scale[:] = (1.0, 1.0, 1.0)
                     refresh_hack()
+                    pbones['spine_3_fk_inv'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                    pbones['spine_3_fk_inv'].rotation_quaternion[:] = (1.0,0.0, 0.0, 0.0)
+                    pbones['spine_3_fk_inv'].location[:] = (0.0, 0.0, 0.0)
+                    pbones['spine_3_fk_inv'].scale[:] = (1.0, 1.0, 1.0)
+                    refresh_hack()
+                    pbones['spine_2_fk_inv'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                    pbones['spine_2_fk_inv'].rotation_quaternion[:] = (1.0,0.0, 0.0, 0.0)
+                    pbones['spine_2_fk_inv'].location[:] = (0.0, 0.0, 0.0)
+                    pbones['spine_2_fk_inv'].scale[:] = (1.0, 1.0, 1.0)
+                    refresh_hack()
+                    pbones['pelvis_ctrl'].matrix = PelvisMat
+                    refresh_hack()
+                    pbones['spine_1_fk'].matrix = Spine1FKMat2
+                    refresh_hack()
+                    pbones['spine_2_fk'].matrix = Spine2FKMat2
+                    refresh_hack()
+                    pbones['spine_3_fk'].matrix = Spine3FKMat2
+                    refresh_hack()
+                    pbones['spine_1_toon'].matrix = Spine1ToonMat
+                    pbones['spine_1_toon'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                    refresh_hack()
+                    pbones['spine_2_toon'].matrix = Spine2ToonMat
+                    pbones['spine_2_toon'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                    refresh_hack()
+                    pbones['spine_3_toon'].matrix = Spine3ToonMat
+                    pbones['spine_3_toon'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                    refresh_hack()
+                    pbones['spine_4_toon'].matrix = Spine4ToonMat
+                    pbones['spine_4_toon'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                    refresh_hack()
+                    pbones['elbow_pole_R'].matrix = ElbowLMat
+                    refresh_hack()
+                    pbones['elbow_pole_R'].matrix = ElbowRMat
+                    refresh_hack()
+                    #Leg
+                    pbones['thigh_fk_R'].matrix = ThighFkMat
+                    refresh_hack()
+                    pbones['shin_fk_R'].matrix = ShinFkMat
+                    refresh_hack()
+                    #Correct thigh_fk twist
+                    pVisRotExec (pbones['thigh_fk_R'], pbones['thigh_rot_R'])
+                    refresh_hack()
+                    #Re-paste shin matrix
+                    pbones['shin_fk_R'].matrix = ShinFkMat
+                    pbones['shin_fk_R'].location = ShinFkLoc
+                    pbones['shin_fk_R'].scale = ShinFkScale
+                    refresh_hack()
+                    pbones['foot_fk_R'].matrix = FootFKMat
+                    pbones['foot_fk_R'].location = FootFKLoc
+                    pbones['foot_fk_R'].scale = FootFkScale
+                    refresh_hack()
+                    if bpy.context.active_object.pose.bones["properties_head"].look_switch == 0.0:
+                        paste_visual_matrix('look', 'look_free', Look_world_mat, Look_mat, 'Location')
+                        paste_visual_matrix('look', 'look_free', Look_world_mat, Look_mat, 'Rotation')
+                    if bpy.context.active_object.pose.bones["properties_head"].look_switch == 1.0:
+                        paste_visual_matrix('look', 'master_body_pivot', Look_world_mat, Look_mat, 'Location')
+                        paste_visual_matrix('look', 'master_body_pivot', Look_world_mat, Look_mat, 'Rotation')
+                    if bpy.context.active_object.pose.bones["properties_head"].look_switch == 2.0:
+                        paste_visual_matrix('look', 'master_torso_pivot', Look_world_mat, Look_mat, 'Location')
+                        paste_visual_matrix('look', 'master_torso_pivot', Look_world_mat, Look_mat, 'Rotation')
+                    if bpy.context.active_object.pose.bones["properties_head"].look_switch == 3.0:
+                        paste_visual_matrix('look', 'head_fk', Look_world_mat, Look_mat, 'Location')
+                        paste_visual_matrix('look', 'head_fk', Look_world_mat, Look_mat, 'Rotation')
+                    refresh_hack()
+                    #Insert Keyframes if Action present
+                    if anim_data:
+                        if anim_data.action:
+                            if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
+                                #Collect Local Transforms
+                                MasterTorsoRotEuler = pbones['master_torso'].rotation_euler.copy()
+                                MasterTorsoLoc = pbones['master_torso'].location.copy()
+                                MasterTorsoScale = pbones['master_torso'].scale.copy()
 
-                    insert_bkeys('eyeglasses_mstr', 'LocRotScale')
-
-        return {"FINISHED"}
-
-#Create Space PopUp
-def Eyeglasses_Space_List(self, context):
-    col = self.layout.column()
-    col.operator("switch.eyeglasses_space", text = "Free").space = 'Free'
-    col.operator("switch.eyeglasses_space", text = "Head").space = 'Head'
-
-class Operator_Show_Eyeglasses_Space_List(bpy.types.Operator):
-    bl_idname = "show.eyeglasses_list"
-    bl_label = "Eyeglasses Space Switch List"
-    bl_description = "Switch Eyeglasses Space"
-
-    def invoke(self, context, event):
-        context.window_manager.popup_menu(Eyeglasses_Space_List, title='Switch Eyeglasses Space', icon='MOD_ARMATURE')
-        return {'FINISHED'}
-
-##### Hat #####
-
-class Operator_Switch_Hat_Space(bpy.types.Operator):
-
-    bl_idname = "switch.hat_space"
-    bl_label = "BlenRig Switch Hat Space"
-    bl_description = "Switch Hat Space preserving pose"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
-
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
-
-    #Create string property to parse argument to the operator
-    space : bpy.props.StringProperty()
-
-    def execute(self, context):
-
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        anim_data = armobj.animation_data
-
-        #Collect Matrix
-        HatMat = pbones['hat_mstr'].matrix.copy()
-
-        #Insert Keyframes if Action present
-        if anim_data:
-            if anim_data.action:
-                if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                    pbones["properties_head"].keyframe_insert(data_path='["hat_free"]')
-                    insert_bkeys('hat_mstr', 'LocRotScale')
-
-        if self.space == 'Free':
-            bpy.context.active_object.pose.bones["properties_head"]["hat_free"] = 0.0
-            refresh_hack()
-        if self.space == 'Head':
-            bpy.context.active_object.pose.bones["properties_head"]["hat_free"] = 1.0
-            refresh_hack()
-
-        #Paste Matrix
-        pbones['hat_mstr'].matrix = HatMat
-        refresh_hack()
-
-        #Insert Keyframes if Action present
-        if anim_data:
-            if anim_data.action:
-                if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                    #Collect Local Transforms
-                    HatRotEuler = pbones['hat_mstr'].rotation_euler.copy()
-                    HatRotQuat = pbones['hat_mstr'].rotation_quaternion.copy()
-                    HatLoc = pbones['hat_mstr'].location.copy()
-                    HatScale = pbones['hat_mstr'].scale.copy()
-
-                    #Jump to next Frame
-                    bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
-
-                    #Key Property
-                    if self.space == 'Free':
-                        bpy.context.active_object.pose.bones["properties_head"]["hat_free"] = 0.0
-                        refresh_hack()
-                    if self.space == 'Head':
-                        bpy.context.active_object.pose.bones["properties_head"]["hat_free"] = 1.0
-                        refresh_hack()
-                    pbones["properties_head"].keyframe_insert(data_path='["hat_free"]')
+                                PelvisRotEuler = pbones['pelvis_ctrl'].rotation_euler.copy()
+                                PelvisLoc = pbones['pelvis_ctrl'].location.copy()
+                                PelvisScale = pbones['pelvis_ctrl'].scale.copy()
 
-                    #Re-Paste Transforms
-                    pbones['hat_mstr'].rotation_euler = HatRotEuler
-                    pbones['hat_mstr'].rotation_quaternion = HatRotQuat
-                    pbones['hat_mstr'].location = HatLoc
-                    pbones['hat_mstr'].scale = HatScale
-                    refresh_hack()
+                                Spine1FKRotEuler = pbones['spine_1_fk'].rotation_euler.copy()
+                                Spine1FKLoc = pbones['spine_1_fk'].location.copy()
+                                Spine1FKScale = pbones['spine_1_fk'].scale.copy()
 
-                    insert_bkeys('hat_mstr', 'LocRotScale')
+                                Spine2FKRotEuler = pbones['spine_2_fk'].rotation_euler.copy()
+                                Spine2FKLoc = pbones['spine_2_fk'].location.copy()
+                                Spine2FKScale = pbones['spine_2_fk'].scale.copy()
 
-        return {"FINISHED"}
+                                Spine3FKRotEuler = pbones['spine_3_fk'].rotation_euler.copy()
+                                Spine3FKLoc = pbones['spine_3_fk'].location.copy()
+                                Spine3FKScale = pbones['spine_3_fk'].scale.copy()
 
-#Create Space PopUp
-def Hat_Space_List(self, context):
-    col = self.layout.column()
-    col.operator("switch.hat_space", text = "Free").space = 'Free'
-    col.operator("switch.hat_space", text = "Head").space = 'Head'
+                                Spine1ToonRotEuler = pbones['spine_1_toon'].rotation_euler.copy()
+                                Spine1ToonLoc = pbones['spine_1_toon'].location.copy()
+                                Spine1ToonScale = pbones['spine_1_toon'].scale.copy()
 
-class Operator_Show_Hat_Space_List(bpy.types.Operator):
-    bl_idname = "show.hat_list"
-    bl_label = "Hat Space Switch List"
-    bl_description = "Switch Hat Space"
+                                Spine2ToonRotEuler = pbones['spine_2_toon'].rotation_euler.copy()
+                                Spine2ToonLoc = pbones['spine_2_toon'].location.copy()
+                                Spine2ToonScale = pbones['spine_2_toon'].scale.copy()
 
-    def invoke(self, context, event):
-        context.window_manager.popup_menu(Hat_Space_List, title='Switch Hat Space', icon='MOD_ARMATURE')
-        return {'FINISHED'}
+                                Spine3ToonRotEuler = pbones['spine_3_toon'].rotation_euler.copy()
+                                Spine3ToonLoc = pbones['spine_3_toon'].location.copy()
+                                Spine3ToonScale = pbones['spine_3_toon'].scale.copy()
 
-##### Hand Accessory #####
+                                Spine4ToonRotEuler = pbones['spine_4_toon'].rotation_euler.copy()
+                                Spine4ToonLoc = pbones['spine_4_toon'].location.copy()
+                                Spine4ToonScale = pbones['spine_4_toon'].scale.copy()
 
-class Operator_Switch_Hand_Accessory_Space(bpy.types.Operator):
+                                TorsoFkCtrlRotEuler = pbones['torso_fk_ctrl'].rotation_euler.copy()
+                                TorsoFkCtrlLoc = pbones['torso_fk_ctrl'].location.copy()
+                                TorsoFkCtrlScale = pbones['torso_fk_ctrl'].scale.copy()
 
-    bl_idname = "switch.hand_accessory_space"
-    bl_label = "BlenRig Switch Hand Accessory Space"
-    bl_description = "Switch Hand Accessory Space preserving pose"
-    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
+                                LookRotEuler = pbones['look'].rotation_euler.copy()
+                                LookLoc = pbones['look'].location.copy()
+                                LookScale = pbones['look'].scale.copy()
 
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-        if (bpy.context.active_object.type in ["ARMATURE"]):
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-                    for prop in bpy.context.active_object.data.items():
-                        if prop[0] == 'rig_version' and str(prop[1]) >= '2.0.0':
-                            return True
-        else:
-            return False
+                                ElbowLRotEuler = pbones['elbow_pole_R'].rotation_euler.copy()
+                                ElbowLLoc = pbones['elbow_pole_R'].location.copy()
+                                ElbowLScale = pbones['elbow_pole_R'].scale.copy()
 
-    #Create string property to parse argument to the operator
-    space : bpy.props.StringProperty()
+                                ElbowRRotEuler = pbones['elbow_pole_R'].rotation_euler.copy()
+                                ElbowRLoc = pbones['elbow_pole_R'].location.copy()
+                                ElbowRScale = pbones['elbow_pole_R'].scale.copy()
 
-    def execute(self, context):
+                                KneeLRotEuler = pbones['knee_pole_R'].rotation_euler.copy()
+                                KneeLLoc = pbones['knee_pole_R'].location.copy()
+                                KneeLScale = pbones['knee_pole_R'].scale.copy()
 
-        armobj = bpy.context.active_object
-        pbones = armobj.pose.bones
-        anim_data = armobj.animation_data
+                                KneeRRotEuler = pbones['knee_pole_R'].rotation_euler.copy()
+                                KneeRLoc = pbones['knee_pole_R'].location.copy()
+                                KneeRScale = pbones['knee_pole_R'].scale.copy()
 
-        #Collect Matrix
-        AccessoryMat = pbones['accessory'].matrix.copy()
+                                ThighCtrlRotEuler = pbones['thigh_fk_ctrl_R'].rotation_euler.copy()
+                                ThighCtrlRotQuat = pbones['thigh_fk_ctrl_R'].rotation_quaternion.copy()
+                                ThighCtrlLoc = pbones['thigh_fk_ctrl_R'].location.copy()
+                                ThighCtrlScale = pbones['thigh_fk_ctrl_R'].scale.copy()
 
-        #Insert Keyframes if Action present
-        if anim_data:
-            if anim_data.action:
-                if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                    pbones["properties_arm_L"].keyframe_insert(data_path='["hand_accessory_L"]')
-                    pbones["properties_arm_R"].keyframe_insert(data_path='["hand_accessory_R"]')
-                    insert_bkeys('accessory', 'LocRotScale')
+                                ThighFkRotEuler = pbones['thigh_fk_R'].rotation_euler.copy()
+                                ThighFkRotQuat = pbones['thigh_fk_R'].rotation_quaternion.copy()
+                                ThighFkLoc = pbones['thigh_fk_R'].location.copy()
+                                ThighFkScale = pbones['thigh_fk_R'].scale.copy()
 
-        if self.space == 'Free':
-            bpy.context.active_object.pose.bones["properties_arm_L"]["hand_accessory_L"] = 0.0
-            bpy.context.active_object.pose.bones["properties_arm_R"]["hand_accessory_R"] = 0.0
-            refresh_hack()
-        if self.space == 'Hand_L':
-            bpy.context.active_object.pose.bones["properties_arm_L"]["hand_accessory_L"] = 1.0
-            bpy.context.active_object.pose.bones["properties_arm_R"]["hand_accessory_R"] = 0.0
-            refresh_hack()
-        if self.space == 'Hand_R':
-            bpy.context.active_object.pose.bones["properties_arm_L"]["hand_accessory_L"] = 0.0
-            bpy.context.active_object.pose.bones["properties_arm_R"]["hand_accessory_R"] = 1.0
-            refresh_hack()
+                                ShinFkRotEuler = pbones['shin_fk_R'].rotation_euler.copy()
+                                ShinFkRotQuat = pbones['shin_fk_R'].rotation_quaternion.copy()
+                                ShinFkLoc = pbones['shin_fk_R'].location.copy()
+                                ShinFkScale = pbones['shin_fk_R'].scale.copy()
 
-        #Paste Matrix
-        pbones['accessory'].matrix = AccessoryMat
-        refresh_hack()
+                                SoleCtrlRotEuler = pbones['sole_ctrl_R'].rotation_euler.copy()
+                                SoleCtrlRotQuat = pbones['sole_ctrl_R'].rotation_quaternion.copy()
+                                SoleCtrlLoc = pbones['sole_ctrl_R'].location.copy()
+                                SoleCtrlScale = pbones['sole_ctrl_R'].scale.copy()
 
-        #Insert Keyframes if Action present
-        if anim_data:
-            if anim_data.action:
-                if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                    #Collect Local Transforms
-                    AccessoryEuler = pbones['accessory'].rotation_euler.copy()
-                    AccessoryRotQuat = pbones['accessory'].rotation_quaternion.copy()
-                    AccessoryLoc = pbones['accessory'].location.copy()
-                    AccessoryScale = pbones['accessory'].scale.copy()
+                                ThighIkRotEuler = pbones['thigh_ik_R'].rotation_euler.copy()
+                                ThighIkRotQuat = pbones['thigh_ik_R'].rotation_quaternion.copy()
+                                ThighIkLoc = pbones['thigh_ik_R'].location.copy()
+                                ThighIkScale = pbones['thigh_ik_R'].scale.copy()
 
-                    #Jump to next Frame
-                    bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
+                                #Jump to next Frame
+                                bpy.context.scene.frame_set (bpy.context.scene.frame_current + 1)
 
-                    #Key Property
-                    if self.space == 'Free':
-                        bpy.context.active_object.pose.bones["properties_arm_L"]["hand_accessory_L"] = 0.0
-                        bpy.context.active_object.pose.bones["properties_arm_R"]["hand_accessory_R"] = 0.0
-                        refresh_hack()
-                    if self.space == 'Hand_L':
-                        bpy.context.active_object.pose.bones["properties_arm_L"]["hand_accessory_L"] = 1.0
-                        bpy.context.active_object.pose.bones["properties_arm_R"]["hand_accessory_R"] = 0.0
-                        refresh_hack()
-                    if self.space == 'Hand_R':
-                        bpy.context.active_object.pose.bones["properties_arm_L"]["hand_accessory_L"] = 0.0
-                        bpy.context.active_object.pose.bones["properties_arm_R"]["hand_accessory_R"] = 1.0
-                        refresh_hack()
-                    pbones["properties_arm_L"].keyframe_insert(data_path='["hand_accessory_L"]')
-                    pbones["properties_arm_R"].keyframe_insert(data_path='["hand_accessory_R"]')
+                                #Key Property
+                                armobj.pose.bones["properties_leg_R"].pin_knee_R = 0.0
+                                refresh_hack()
+                                insert_pkeys('properties_leg_R', 'pin_knee_R')
 
-                    #Re-Paste Transforms
-                    pbones['accessory'].rotation_euler = AccessoryEuler
-                    pbones['accessory'].rotation_quaternion = AccessoryRotQuat
-                    pbones['accessory'].location = AccessoryLoc
-                    pbones['accessory'].scale = AccessoryScale
-                    refresh_hack()
+                                #Re-Paste Transforms
+                                pbones['master_torso'].rotation_euler = MasterTorsoRotEuler
+                                pbones['master_torso'].location = MasterTorsoLoc
+                                pbones['master_torso'].scale = MasterTorsoScale
+                                refresh_hack()
+                                pbones['torso_fk_ctrl_inv'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                                pbones['torso_fk_ctrl_inv'].rotation_quaternion[:] = (1.0,0.0, 0.0, 0.0)
+                                pbones['torso_fk_ctrl_inv'].location[:] = (0.0, 0.0, 0.0)
+                                refresh_hack()
+                                pbones['spine_3_fk_inv'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                                pbones['spine_3_fk_inv'].rotation_quaternion[:] = (1.0,0.0, 0.0, 0.0)
+                                pbones['spine_3_fk_inv'].location[:] = (0.0, 0.0, 0.0)
+                                refresh_hack()
+                                pbones['spine_2_fk_inv'].rotation_euler[:] = (0.0, 0.0, 0.0)
+                                pbones['spine_2_fk_inv'].rotation_quaternion[:] = (1.0,0.0, 0.0, 0.0)
+                                pbones['spine_2_fk_inv'].location[:] = (0.0, 0.0, 0.0)
+                                refresh_hack()
+                                pbones['pelvis_ctrl'].rotation_euler = PelvisRotEuler
+                                pbones['pelvis_ctrl'].location = PelvisLoc
+                                pbones['pelvis_ctrl'].scale = PelvisScale
+                                refresh_hack()
+                                pbones['spine_1_fk'].rotation_euler = Spine1FKRotEuler
+                                pbones['spine_1_fk'].location = Spine1FKLoc
+                                pbones['spine_1_fk'].scale = Spine1FKScale
+                                refresh_hack()
+                                pbones['spine_2_fk'].rotation_euler = Spine2FKRotEuler
+                                pbones['spine_2_fk'].location = Spine2FKLoc
+                                pbones['spine_2_fk'].scale = Spine2FKScale
+                                refresh_hack()
+                                pbones['spine_3_fk'].rotation_euler = Spine3FKRotEuler
+                                pbones['spine_3_fk'].location = Spine3FKLoc
+                                pbones['spine_3_fk'].scale = Spine3FKScale
+                                refresh_hack()
+                                pbones['spine_1_toon'].rotation_euler = Spine1ToonRotEuler
+                                pbones['spine_1_toon'].location = Spine1ToonLoc
+                                pbones['spine_1_toon'].scale = Spine1ToonScale
+                                refresh_hack()
+                                pbones['spine_2_toon'].rotation_euler = Spine2ToonRotEuler
+                                pbones['spine_2_toon'].location = Spine2ToonLoc
+                                pbones['spine_2_toon'].scale = Spine2ToonScale
+                                refresh_hack()
+                                pbones['spine_3_toon'].rotation_euler = Spine3ToonRotEuler
+                                pbones['spine_3_toon'].location = Spine3ToonLoc
+                                pbones['spine_3_toon'].scale = Spine3ToonScale
+                                refresh_hack()
+                                pbones['spine_4_toon'].rotation_euler = Spine4ToonRotEuler
+                                pbones['spine_4_toon'].location = Spine4ToonLoc
+                                pbones['spine_4_toon'].scale = Spine4ToonScale
+                                refresh_hack()
+                                pbones['torso_fk_ctrl'].rotation_euler = TorsoFkCtrlRotEuler
+                                pbones['torso_fk_ctrl'].location = TorsoFkCtrlLoc
+                                pbones['torso_fk_ctrl'].scale = TorsoFkCtrlScale
+                                refresh_hack()
+                                pbones['look'].rotation_euler = LookRotEuler
+                                pbones['look'].location = LookLoc
+                                pbones['look'].scale = LookScale
+                                refresh_hack()
+                                pbones['elbow_pole_R'].rotation_euler = ElbowLRotEuler
+                                pbones['elbow_pole_R'].location = ElbowLLoc
+                                pbones['elbow_pole_R'].scale = ElbowLScale
+                                refresh_hack()
+                                pbones['elbow_pole_R'].rotation_euler = ElbowRRotEuler
+                                pbones['elbow_pole_R'].location = ElbowRLoc
+                                pbones['elbow_pole_R'].scale = ElbowRScale
+                                refresh_hack()
+                                pbones['knee_pole_R'].rotation_euler = KneeLRotEuler
+                                pbones['knee_pole_R'].location = KneeLLoc
+                                pbones['knee_pole_R'].scale = KneeLScale
+                                refresh_hack()
+                                pbones['knee_pole_R'].rotation_euler = KneeRRotEuler
+                                pbones['knee_pole_R'].location = KneeRLoc
+                                pbones['knee_pole_R'].scale = KneeRScale
+                                refresh_hack()
+                                pbones['thigh_fk_ctrl_R'].rotation_euler = ThighCtrlRotEuler
+                                pbones['thigh_fk_ctrl_R'].rotation_quaternion = ThighCtrlRotQuat
+                                pbones['thigh_fk_ctrl_R'].location = ThighCtrlLoc
+                                pbones['thigh_fk_ctrl_R'].scale = ThighCtrlScale
+                                refresh_hack()
+                                pbones['thigh_fk_R'].rotation_euler = ThighFkRotEuler
+                                pbones['thigh_fk_R'].rotation_quaternion = ThighFkRotQuat
+                                pbones['thigh_fk_R'].location = ThighFkLoc
+                                pbones['thigh_fk_R'].scale = ThighFkScale
+                                refresh_hack()
+                                pbones['shin_fk_R'].rotation_euler = ShinFkRotEuler
+                                pbones['shin_fk_R'].rotation_quaternion = ShinFkRotQuat
+                                pbones['shin_fk_R'].location = ShinFkLoc
+                                pbones['shin_fk_R'].scale = ShinFkScale
+                                refresh_hack()
+                                pbones['sole_ctrl_R'].rotation_euler = SoleCtrlRotEuler
+                                pbones['sole_ctrl_R'].rotation_quaternion = SoleCtrlRotQuat
+                                pbones['sole_ctrl_R'].location = SoleCtrlLoc
+                                pbones['sole_ctrl_R'].scale = SoleCtrlScale
+                                refresh_hack()
+                                pbones['thigh_ik_R'].rotation_euler = ThighIkRotEuler
+                                pbones['thigh_ik_R'].rotation_quaternion = ThighIkRotQuat
+                                pbones['thigh_ik_R'].location = ThighIkLoc
+                                pbones['thigh_ik_R'].scale = ThighIkScale
+                                refresh_hack()
 
-                    insert_bkeys('accessory', 'LocRotScale')
+                                insert_bkeys('master_torso', 'LocRotScale')
+                                insert_bkeys('pelvis_ctrl', 'LocRotScale')
+                                insert_bkeys('spine_1_fk', 'LocRotScale')
+                                insert_bkeys('spine_2_fk', 'LocRotScale')
+                                insert_bkeys('spine_3_fk', 'LocRotScale')
+                                insert_bkeys('spine_1_toon', 'LocRotScale')
+                                insert_bkeys('spine_2_toon', 'LocRotScale')
+                                insert_bkeys('spine_3_toon', 'LocRotScale')
+                                insert_bkeys('spine_4_toon', 'LocRotScale')
+                                insert_bkeys('torso_fk_ctrl_inv', 'LocRotScale')
+                                insert_bkeys('spine_3_fk_inv', 'LocRotScale')
+                                insert_bkeys('spine_2_fk_inv', 'LocRotScale')
+                                insert_bkeys('torso_fk_ctrl', 'LocRotScale')
+                                insert_bkeys('look', 'LocRotScale')
+                                insert_bkeys('elbow_pole_R', 'LocRotScale')
+                                insert_bkeys('elbow_pole_R', 'LocRotScale')
+                                insert_bkeys('knee_pole_R', 'LocRotScale')
+                                insert_bkeys('knee_pole_R', 'LocRotScale')
+                                insert_bkeys('thigh_fk_R', 'LocRotScale')
+                                insert_bkeys('shin_fk_R', 'LocRotScale')
+                                insert_bkeys('thigh_fk_ctrl_R', 'LocRotScale')
+                                insert_bkeys('foot_fk_R', 'LocRotScale')
+                                insert_bkeys('foot_toe_1_fk_R', 'LocRotScale')
+                                insert_bkeys('foot_toe_2_fk_R', 'LocRotScale')
+                                insert_bkeys('thigh_ik_R', 'RotScale')
+                                insert_bkeys('shin_ik_R', 'RotScale')
+                                insert_bkeys('foot_ik_ctrl_R', 'LocRotScale')
+                                insert_bkeys('foot_toe_ik_ctrl_mid_R', 'LocRotScale')
+                                insert_bkeys('foot_toe_ik_ctrl_R', 'LocRotScale')
+                                insert_bkeys('foot_roll_ctrl_R', 'Rot')
+                                insert_bkeys('toe_roll_1_R', 'Rot')
+                                insert_bkeys('toe_roll_2_R', 'Rot')
+                                insert_bkeys('sole_ctrl_R', 'LocRotScale')
+                                insert_bkeys('knee_pin_R', 'LocRotScale')
+                                if pbones["properties_leg_R"].toggle_leg_ik_pole_R == 1.0:
+                                    insert_bkeys('knee_pole_R', 'Loc')
+                                for prop in bpy.context.active_object.data.items():
+                                    if prop[0] == 'rig_type' and prop[1] == 'Quadruped':
+                                        insert_bkeys('tarsal_fk_R', 'LocRotScale')
+                                        insert_bkeys('tarsal_ik_ctrl_R', 'LocRotScale')
 
         return {"FINISHED"}
 
-#Create Space PopUp
-def Hand_Accessory_Space_List(self, context):
-    col = self.layout.column()
-    col.operator("switch.hand_accessory_space", text = "Free").space = 'Free'
-    col.operator("switch.hand_accessory_space", text = "Hand_L").space = 'Hand_L'
-    col.operator("switch.hand_accessory_space", text = "Hand_R").space = 'Hand_R'
+##### Head Ops #####
 
-class Operator_Show_Hand_Accessory_Space_List(bpy.types.Operator):
-    bl_idname = "show.hand_accessory_list"
-    bl_label = "Hand Accessory Space Switch List"
-    bl_description = "Switch Hand Accessory Space"
+Operator_Switch_Head_Space = build_space_op('Operator_Switch_Head_Space', "switch.head_space", 'head')
+Operator_Show_Head_Space_List = build_space_list_op('Operator_Show_Head_Space_List', "show.head_list", "switch.head_space", 'head')
+Operator_Switch_Neck_Space = build_space_op('Operator_Switch_Neck_Space', "switch.neck_space", 'neck')
+Operator_Show_Neck_Space_List = build_space_list_op('Operator_Show_Neck_Space_List', "show.neck_list", "switch.neck_space", 'neck')
+Operator_Switch_Look_Space = build_space_op('Operator_Switch_Look_Space', "switch.look_space", 'look')
+Operator_Show_Look_Space_List = build_space_list_op('Operator_Show_Look_Space_List', "show.look_list", "switch.look_space", 'look')
 
-    def invoke(self, context, event):
-        context.window_manager.popup_menu(Hand_Accessory_Space_List, title='Switch Hand Accessory Space', icon='MOD_ARMATURE')
-        return {'FINISHED'}
+##### Props Ops #####
+
+Operator_Switch_Eyeglasses_Space = build_space_op('Operator_Switch_Eyeglasses_Space', "switch.eyeglasses_space", 'eyeglasses')
+Operator_Show_Eyeglasses_Space_List = build_space_list_op('Operator_Show_Eyeglasses_Space_List', "show.eyeglasses_list", "switch.eyeglasses_space", 'eyeglasses')
+Operator_Switch_Hat_Space = build_space_op('Operator_Switch_Hat_Space', "switch.hat_space", 'hat')
+Operator_Show_Hat_Space_List = build_space_list_op('Operator_Show_Hat_Space_List', "show.hat_list", "switch.hat_space", 'hat')
+Operator_Switch_Hand_Accessory_Space = build_space_op('Operator_Switch_Hand_Accessory_Space', "switch.hand_accessory_space", 'hand_accessory')
+Operator_Show_Hand_Accessory_Space_List = build_space_list_op('Operator_Show_Hand_Accessory_Space_List', "show.hand_accessory_list", "switch.hand_accessory_space", 'hand_accessory')
 
 ##### Pivots Ops #####
 
@@ -8206,6 +2770,7 @@ class Operator_Reset_Hand_L_Pivot(bpy.types.Operator):
         else:
             return False
 
+    @keyframe_batch
     def execute(self, context):
 
         armobj = bpy.context.active_object
@@ -8277,6 +2842,7 @@ class Operator_Reset_Hand_R_Pivot(bpy.types.Operator):
         else:
             return False
 
+    @keyframe_batch
     def execute(self, context):
 
         armobj = bpy.context.active_object
@@ -8348,6 +2914,7 @@ class Operator_Reset_Master_Torso_Pivot(bpy.types.Operator):
         else:
             return False
 
+    @keyframe_batch
     def execute(self, context):
 
         armobj = bpy.context.active_object
@@ -8419,6 +2986,7 @@ class Operator_Reset_Master_Body_Pivot(bpy.types.Operator):
         else:
             return False
 
+    @keyframe_batch
     def execute(self, context):
 
         armobj = bpy.context.active_object
@@ -8490,6 +3058,7 @@ class Operator_Reset_Master_Pivot(bpy.types.Operator):
         else:
             return False
 
+    @keyframe_batch
     def execute(self, context):
 
         armobj = bpy.context.active_object
@@ -8561,6 +3130,7 @@ class Operator_Snap_TorsoIKtoFK(bpy.types.Operator):
         else:
             return False
 
+    @keyframe_batch
     def execute(self, context):
 
         armobj = bpy.context.active_object
@@ -8611,7 +3181,7 @@ class Operator_Snap_TorsoIKtoFK(bpy.types.Operator):
             if anim_data:
                 if anim_data.action:
                     if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        pbones["properties_torso"].keyframe_insert(data_path='ik_torso')
+                        insert_pkeys('properties_torso', 'ik_torso')
                         insert_bkeys('master_torso', 'LocRotScale')
                         insert_bkeys('torso_ik_ctrl', 'LocRotScale')
                         insert_bkeys('spine_ctrl_curve', 'LocRotScale')
@@ -8703,7 +3273,7 @@ class Operator_Snap_TorsoIKtoFK(bpy.types.Operator):
                         #Key Property
                         armobj.pose.bones["properties_torso"].ik_torso = 1.0
                         refresh_hack()
-                        pbones["properties_torso"].keyframe_insert(data_path='ik_torso')
+                        insert_pkeys('properties_torso', 'ik_torso')
 
                         #Re-Paste Transforms
                         pbones['master_torso'].rotation_euler = MasterTorsoRotEuler
@@ -8774,6 +3344,7 @@ class Operator_Snap_TorsoFKtoIK(bpy.types.Operator):
         else:
             return False
 
+    @keyframe_batch
     def execute(self, context):
 
         armobj = bpy.context.active_object
@@ -8824,7 +3395,7 @@ class Operator_Snap_TorsoFKtoIK(bpy.types.Operator):
             if anim_data:
                 if anim_data.action:
                     if bpy.context.scene.tool_settings.use_keyframe_insert_auto == True:
-                        pbones["properties_torso"].keyframe_insert(data_path='ik_torso')
+                        insert_pkeys('properties_torso', 'ik_torso')
                         insert_bkeys('master_torso', 'LocRotScale')
                         insert_bkeys('torso_ik_ctrl', 'LocRotScale')
                         insert_bkeys('spine_ctrl_curve', 'LocRotScale')
@@ -8905,7 +3476,7 @@ class Operator_Snap_TorsoFKtoIK(bpy.types.Operator):
                         #Key Property
                         armobj.pose.bones["properties_torso"].ik_torso = 0.0
                         refresh_hack()
-                        pbones["properties_torso"].keyframe_insert(data_path='ik_torso')
+                        insert_pkeys('properties_torso', 'ik_torso')
 
                         #Re-Paste Transforms
                         pbones['torso_ik_ctrl'].rotation_euler = TorsoIkCtrlRotEuler
@@ -8978,6 +3549,7 @@ class Operator_Align_Spine(bpy.types.Operator):
         else:
             return False
 
+    @keyframe_batch
     def execute(self, context):
 
         armobj = bpy.context.active_object
@@ -10519,6 +5091,196 @@ class Operator_Leg_R_Snap_FK_IK(bpy.types.Operator):
         return {"FINISHED"}
 
 
+##### Bake IK/FK Snap over a Frame Range #####
+
+class Operator_Snap_Bake_IK_FK(bpy.types.Operator):
+
+    bl_idname = "snap.bake_ik_fk"
+    bl_label = "BlenRig Bake IK/FK Snap"
+    bl_description = "Switch a limb between IK and FK on every frame of a range preserving the pose"
+    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
+
+    poll = snap_poll
+
+    limb : EnumProperty(
+        name = "Limb",
+        items = (('arm_L', "Arm L", ""), ('arm_R', "Arm R", ""), ('leg_L', "Leg L", ""), ('leg_R', "Leg R", "")),
+        default = 'arm_L')
+    direction : EnumProperty(
+        name = "Direction",
+        items = (('IK_TO_FK', "IK to FK", ""), ('FK_TO_IK', "FK to IK", "")),
+        default = 'IK_TO_FK')
+    frame_range : EnumProperty(
+        name = "Frames",
+        items = (('SCENE', "Scene Range", "Bake every frame of the scene range"),
+                 ('CUSTOM', "Custom Range", "Bake every frame between Start and End"),
+                 ('KEYED', "Keyed Frames", "Bake only the frames where the limb has keys")),
+        default = 'KEYED')
+    frame_start : IntProperty(name = "Start", default = 1)
+    frame_end : IntProperty(name = "End", default = 250)
+
+    def invoke(self, context, event):
+        self.frame_start = context.scene.frame_start
+        self.frame_end = context.scene.frame_end
+        return context.window_manager.invoke_props_dialog(self)
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "limb")
+        layout.prop(self, "direction")
+        layout.prop(self, "frame_range")
+        if self.frame_range == 'CUSTOM':
+            row = layout.row(align=True)
+            row.prop(self, "frame_start")
+            row.prop(self, "frame_end")
+
+    def execute(self, context):
+        armobj = bpy.context.active_object
+        limb, side = self.limb.split('_')
+        spec = get_snap_spec(armobj, limb, self.direction, side)
+        if spec is None:
+            self.report({'WARNING'}, "Snapping not available for this rig type")
+            return {"CANCELLED"}
+
+        if self.frame_range == 'SCENE':
+            frames = range(context.scene.frame_start, context.scene.frame_end + 1)
+        elif self.frame_range == 'CUSTOM':
+            frames = range(min(self.frame_start, self.frame_end), max(self.frame_start, self.frame_end) + 1)
+        else:
+            frames = collect_keyed_frames(armobj, spec)
+        if not frames:
+            self.report({'WARNING'}, "No frames to bake")
+            return {"CANCELLED"}
+
+        start = perf_counter()
+        baked = bake_snap(context, armobj, spec, frames)
+        self.report({'INFO'}, "Baked {} frames in {:.2f}s".format(baked, perf_counter() - start))
+        return {"FINISHED"}
+
+
+##### Space Switch Bake #####
+
+# Keep a reference to the dynamic enum items, Blender doesn't keep them and the strings would be freed
+space_items_cache = {}
+
+def space_switch_items(self, context):
+    items = space_items_cache.get(self.switch)
+    if items is None:
+        items = space_items_cache[self.switch] = [(space, space, "") for space in space_names(self.switch)]
+    return items
+
+class Operator_Space_Switch_Bake(bpy.types.Operator):
+
+    bl_idname = "switch.bake_space"
+    bl_label = "BlenRig Bake Space Switch"
+    bl_description = "Switch space on every frame of a range preserving the pose. Esc cancels"
+    bl_options = {'REGISTER', 'UNDO','INTERNAL'}
+
+    poll = snap_poll
+
+    switch : EnumProperty(
+        name = "Switch",
+        items = [(name, spec['label'].replace('_{side}', ''), "") for name, spec in SPACE_SPECS.items()],
+        default = 'arm')
+    side : EnumProperty(
+        name = "Side",
+        items = (('L', "Left", ""), ('R', "Right", "")),
+        default = 'L')
+    space : EnumProperty(
+        name = "Space",
+        items = space_switch_items)
+    frame_range : EnumProperty(
+        name = "Frames",
+        items = (('SCENE', "Scene Range", "Bake every frame of the scene range"),
+                 ('CUSTOM', "Custom Range", "Bake every frame between Start and End"),
+                 ('KEYED', "Keyed Frames", "Bake only the frames where the switched bones have keys")),
+        default = 'KEYED')
+    frame_start : IntProperty(name = "Start", default = 1)
+    frame_end : IntProperty(name = "End", default = 250)
+
+    _timer = None
+    _bake = None
+
+    def invoke(self, context, event):
+        self.frame_start = context.scene.frame_start
+        self.frame_end = context.scene.frame_end
+        return context.window_manager.invoke_props_dialog(self)
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "switch")
+        if '{side}' in SPACE_SPECS[self.switch]['label']:
+            layout.prop(self, "side", expand=True)
+        layout.prop(self, "space")
+        layout.prop(self, "frame_range")
+        if self.frame_range == 'CUSTOM':
+            row = layout.row(align=True)
+            row.prop(self, "frame_start")
+            row.prop(self, "frame_end")
+
+    def execute(self, context):
+        armobj = bpy.context.active_object
+        side = self.side if '{side}' in SPACE_SPECS[self.switch]['label'] else None
+        spec = get_space_spec(self.switch, self.space, side)
+        if spec is None:
+            self.report({'WARNING'}, "Unknown space")
+            return {"CANCELLED"}
+
+        if self.frame_range == 'SCENE':
+            frames = range(context.scene.frame_start, context.scene.frame_end + 1)
+        elif self.frame_range == 'CUSTOM':
+            frames = range(min(self.frame_start, self.frame_end), max(self.frame_start, self.frame_end) + 1)
+        else:
+            frames = collect_keyed_frames(armobj, spec)
+        if not frames:
+            self.report({'WARNING'}, "No frames to bake")
+            return {"CANCELLED"}
+
+        self._bake = SnapBake(context, armobj, spec, frames)
+        self._start = perf_counter()
+        #Without a window (scripts, background) bake in one go
+        if context.window is None:
+            while self._bake.step():
+                pass
+            return self.finish(context)
+
+        wm = context.window_manager
+        wm.progress_begin(0, len(self._bake))
+        self._timer = wm.event_timer_add(0.01, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type in {'ESC', 'RIGHTMOUSE'}:
+            self._bake.cancel()
+            self.end_progress(context)
+            self.report({'WARNING'}, "Space switch bake cancelled")
+            return {'CANCELLED'}
+        if event.type != 'TIMER':
+            return {'RUNNING_MODAL'}
+
+        #Bake frames for a short time slice, then let the UI breathe
+        slice_end = perf_counter() + 0.05
+        while perf_counter() < slice_end:
+            if not self._bake.step():
+                self.end_progress(context)
+                return self.finish(context)
+        context.window_manager.progress_update(self._bake.index)
+        return {'RUNNING_MODAL'}
+
+    def end_progress(self, context):
+        wm = context.window_manager
+        wm.progress_end()
+        if self._timer:
+            wm.event_timer_remove(self._timer)
+            self._timer = None
+
+    def finish(self, context):
+        baked = self._bake.finish()
+        self.report({'INFO'}, "Baked {} frames in {:.2f}s".format(baked, perf_counter() - self._start))
+        return {"FINISHED"}
+
+
 #########################################################################################################
 #Matrix Functions (Taken from Copy Attributes Menu Addon)
 
@@ -10571,21 +5333,107 @@ def pVisScaExec(bone, active):
     bone.scale = getmat(bone, active, not obj_bone.data.bones[bone.name].use_inherit_scale)\
         .to_scale()
 
-############ Legacy mode ################
-
-def pVisLocExec_legacy(bone, active, context):
-    bone.location = getmat(bone, active, False).to_translation()
-
-def pVisRotExec_legacy(bone, active, context):
-    obj_bone = bone.id_data
-    rotcopy(bone, getmat(bone, active, not obj_bone.data.bones[bone.name].use_inherit_rotation))
+############ Batch mode ################
 
+def copy_visual_transforms(bones, active, channel):
+    """Batch version of getmat for many bones: active_to_selected is computed once per armature,
+       rest inverses come from the armature cache and bones are solved parent first,
+       so that a child uses the new pose of a selected parent.
+       channel is 'Loc', 'Rot' or 'Scale'. Returns the number of bones changed.
+    """
+    obj_active = active.id_data
+    active_matrix = active.matrix.copy()
+    targets = {}
+    rests = {}
+    solved = {}
+    parent_inverses = {}
+    selected = set(b.name for b in bones)
+
+    for bone in sorted(bones, key=lambda b: len(b.parent_recursive)):
+        obj_bone = bone.id_data
+        key = obj_bone.name
+        if key not in targets:
+            # all matrices are in armature space unless commented otherwise
+            active_to_selected = obj_bone.matrix_world.inverted() @ obj_active.matrix_world
+            targets[key] = active_to_selected @ active_matrix
+            rests[key] = (get_rest_data(obj_bone), get_rest_inverses(obj_bone))
+        otherloc = targets[key]
+        rest, rest_inverses = rests[key]
+        bonemat_local, parent_name, parentbonemat = rest[bone.name]
+        rest_inv, bonemat_inv = rest_inverses[bone.name]
+        data_bone = bone.bone
+
+        if channel == 'Rot':
+            ignoreparent = not data_bone.use_inherit_rotation
+        elif channel == 'Scale':
+            ignoreparent = not data_bone.use_inherit_scale
+        else:
+            ignoreparent = False
+
+        parentposemat = None
+        if parent_name:
+            parentposemat = solved.get((key, parent_name))
+            if parentposemat is None:
+                parentposemat = obj_bone.pose.bones[parent_name].matrix
+        if parentposemat is None or ignoreparent or parentbonemat == parentposemat:
+            newmat = rest_inv @ otherloc
+        else:
+            parent_inv = parent_inverses.get((key, parent_name))
+            if parent_inv is None:
+                parent_inv = parent_inverses[(key, parent_name)] = parentposemat.inverted()
+            newmat = bonemat_inv @ parent_inv @ otherloc
+
+        if channel == 'Loc':
+            bone.location = newmat.to_translation()
+        elif channel == 'Rot':
+            rotcopy(bone, newmat)
+        else:
+            bone.scale = newmat.to_scale()
 
-def pVisScaExec_legacy(bone, active, context):
-    obj_bone = bone.id_data
-    bone.scale = getmat(bone, active, not obj_bone.data.bones[bone.name].use_inherit_scale)\
-        .to_scale()
+        #Keep the new pose for selected children
+        if any(child.name in selected for child in data_bone.children):
+            solved[(key, bone.name)] = compose_pose_matrix(bonemat_local, parentbonemat, bone.matrix_basis,
+                parentposemat if parent_name else None)
+    return len(bones)
 
+def pBatchExec(self, context, channel):
+    """Copy the visual transform of the active bone to the selected ones,
+       on the current frame or keyed on every frame of a range
+    """
+    active = context.active_pose_bone
+    selected = [b for b in context.selected_pose_bones if b != active]
+    if not active or not selected:
+        return
+    if not self.bake_range:
+        copy_visual_transforms(selected, active, channel)
+        return
+
+    scene = context.scene
+    frame_current = scene.frame_current
+    writers = {}
+    for f in range(min(self.frame_start, self.frame_end), max(self.frame_start, self.frame_end) + 1):
+        scene.frame_set(f)
+        copy_visual_transforms(selected, active, channel)
+        for bone in selected:
+            writer = writers.get(bone.id_data.name)
+            if writer is None:
+                writer = writers[bone.id_data.name] = KeyframeWriter(bone.id_data)
+            writer.insert_bone(bone, channel, f)
+    for writer in writers.values():
+        writer.write()
+    scene.frame_set(frame_current)
+
+pose_copy_props = {
+    'bake_range': BoolProperty(name = "Bake Frame Range", description = "Copy the transform on every frame of the range and keyframe it", default = False, options={'SKIP_SAVE'}),
+    'frame_start': IntProperty(name = "Start", default = 1),
+    'frame_end': IntProperty(name = "End", default = 250),
+}
+
+def pose_copy_invoke(self, context, event):
+    """Start from the scene frame range, the redo panel can change it"""
+    self.frame_start = context.scene.frame_start
+    self.frame_end = context.scene.frame_end
+    return self.execute(context)
 
 #Copy Matrix from Bone to Self after Space change
 def paste_visual_matrix(bone, parent_bone, bone_world, bone_matrix, transform_type):
@@ -10631,62 +5479,31 @@ def paste_visual_matrix(bone, parent_bone, bone_world, bone_matrix, transform_ty
         bone.scale = newmat.to_scale()
         refresh_hack()
 
-#Armature Refresh Hack
+#Armature Refresh Hack (kept for the operators, see pose_solver.refresh_pose)
 def refresh_hack():
-    bpy.ops.object.mode_set(mode='OBJECT')
-    bpy.ops.object.mode_set(mode='POSE')
+    refresh_pose()
 
-#Insert Bone Keyframes Function
+#Insert Bone Keyframes Function, shares the writer of the operator keyframe batch when one is open
 def insert_bkeys(b_name, key_type):
     armobj = bpy.context.active_object
     pbones = armobj.pose.bones
 
     if pbones.get(b_name) != None:
-        if key_type == 'Loc':
-            pbones[b_name].keyframe_insert(data_path="location", group=b_name)
-
-        if key_type == 'Rot':
-            if pbones[b_name].rotation_mode == 'QUATERNION':
-                pbones[b_name].keyframe_insert(data_path="rotation_quaternion", group=b_name)
-            elif pbones[b_name].rotation_mode == 'AXIS_ANGLE':
-                pbones[b_name].keyframe_insert(data_path="rotation_axis_angle", group=b_name)
-            else:
-                pbones[b_name].keyframe_insert(data_path="rotation_euler", group=b_name)
-
-        if key_type == 'Scale':
-            pbones[b_name].keyframe_insert(data_path="scale", group=b_name)
-
-        if key_type == 'LocRot':
-            pbones[b_name].keyframe_insert(data_path="location", group=b_name)
-            if pbones[b_name].rotation_mode == 'QUATERNION':
-                pbones[b_name].keyframe_insert(data_path="rotation_quaternion", group=b_name)
-            elif pbones[b_name].rotation_mode == 'AXIS_ANGLE':
-                pbones[b_name].keyframe_insert(data_path="rotation_axis_angle", group=b_name)
-            else:
-                pbones[b_name].keyframe_insert(data_path="rotation_euler", group=b_name)
-
-        if key_type == 'LocScale':
-            pbones[b_name].keyframe_insert(data_path="location", group=b_name)
-            pbones[b_name].keyframe_insert(data_path="scale", group=b_name)
-
-        if key_type == 'RotScale':
-            pbones[b_name].keyframe_insert(data_path="scale", group=b_name)
-            if pbones[b_name].rotation_mode == 'QUATERNION':
-                pbones[b_name].keyframe_insert(data_path="rotation_quaternion", group=b_name)
-            elif pbones[b_name].rotation_mode == 'AXIS_ANGLE':
-                pbones[b_name].keyframe_insert(data_path="rotation_axis_angle", group=b_name)
-            else:
-                pbones[b_name].keyframe_insert(data_path="rotation_euler", group=b_name)
-
-        if key_type == 'LocRotScale':
-            pbones[b_name].keyframe_insert(data_path="location", group=b_name)
-            pbones[b_name].keyframe_insert(data_path="scale", group=b_name)
-            if pbones[b_name].rotation_mode == 'QUATERNION':
-                pbones[b_name].keyframe_insert(data_path="rotation_quaternion", group=b_name)
-            elif pbones[b_name].rotation_mode == 'AXIS_ANGLE':
-                pbones[b_name].keyframe_insert(data_path="rotation_axis_angle", group=b_name)
-            else:
-                pbones[b_name].keyframe_insert(data_path="rotation_euler", group=b_name)
+        writer = batch_writer(armobj) or KeyframeWriter(armobj)
+        writer.insert_bone(pbones[b_name], key_type, bpy.context.scene.frame_current)
+        if not batch_stack:
+            writer.write()
+
+#Insert Property Keyframes Function
+def insert_pkeys(b_name, prop_path):
+    armobj = bpy.context.active_object
+    pbones = armobj.pose.bones
+
+    if pbones.get(b_name) != None:
+        writer = batch_writer(armobj) or KeyframeWriter(armobj)
+        writer.insert_bone_prop(pbones[b_name], prop_path, bpy.context.scene.frame_current)
+        if not batch_stack:
+            writer.write()
 
 def build_exec(loopfunc, func):
     """Generator function that returns exec functions for operators """
@@ -10696,39 +5513,35 @@ def build_exec(loopfunc, func):
         return {'FINISHED'}
     return exec_func
 
-def build_op(idname, label, description, fpoll, fexec):
+def build_op(idname, label, description, fpoll, fexec, props=None, finvoke=None):
     """Generator function that returns the basic operator"""
     class blenrig_myopic(Operator):
         bl_idname = idname
         bl_label = label
         bl_description = description
+        bl_options = {'REGISTER', 'UNDO'}
+        __annotations__ = dict(props or {})
         execute = fexec
         poll = fpoll
+    if finvoke:
+        blenrig_myopic.invoke = finvoke
     return blenrig_myopic
 
-def genops(copylist, oplist, prefix, poll_func, loopfunc):
+def genops(copylist, oplist, prefix, poll_func, loopfunc, props=None, invoke_func=None):
     """Generate ops from the copy list and its associated functions"""
     for op in copylist:
         exec_func = build_exec(loopfunc, op[3])
         opclass = build_op(prefix + op[0], "Copy " + op[1], op[2],
-                           poll_func, exec_func)
+                           poll_func, exec_func, props, invoke_func)
         oplist.append(opclass)
 
-def pLoopExec(self, context, funk):
-    """Loop over selected bones and execute funk on them"""
-    active = context.active_pose_bone
-    selected = context.selected_pose_bones
-    selected.remove(active)
-    for bone in selected:
-        funk(bone, active, context)
-
 pose_copies = (
     ('pose_vis_loc', "Visual Location",
-     "Copy Location from Active to Selected", pVisLocExec_legacy),
+     "Copy Location from Active to Selected", 'Loc'),
     ('pose_vis_rot', "Visual Rotation",
-     "Copy Rotation from Active to Selected", pVisRotExec_legacy),
+     "Copy Rotation from Active to Selected", 'Rot'),
     ('pose_vis_sca', "Visual Scale",
-     "Copy Scale from Active to Selected", pVisScaExec_legacy)
+     "Copy Scale from Active to Selected", 'Scale')
 )
 
 @classmethod
@@ -10736,17 +5549,4 @@ def pose_poll_func(cls, context):
     return(context.mode == 'POSE')
 
 pose_ops = []  # list of pose mode copy operators
-genops(pose_copies, pose_ops, "blenrig_pose.copy_", pose_poll_func, pLoopExec)
-
-snapping_attributes_classes = (*pose_ops,)
-
-def register():
-    from bpy.utils import register_class
-    for cls in snapping_attributes_classes:
-        register_class(cls)
-
-def unregister():
-    from bpy.utils import unregister_class
-    for cls in snapping_attributes_classes:
-        unregister_class(cls)
-register()
\ No newline at end of file
+genops(pose_copies, pose_ops, "blenrig_pose.copy_", pose_poll_func, pBatchExec, pose_copy_props, pose_copy_invoke)
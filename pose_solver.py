@@ -0,0 +1,87 @@
+import bpy
+import numpy as np
+from mathutils import Matrix
+
+##################################### Pose Refresh and Matrix Solver #######################################
+
+# Cached bone rest data per armature: {armature data name: (bone names, rest matrices, read buffer, {bone name: (matrix_local, parent name, parent matrix_local)})}
+rest_cache = {}
+# Cached rest inverses per armature, dropped with the rest data: {armature data name: {bone name: (matrix_local inverted, bone matrix relative to parent inverted)}}
+rest_inverse_cache = {}
+
+def use_legacy_refresh():
+    """Returns True when the add-on preferences ask for the old Object/Pose mode toggle"""
+    addon = bpy.context.preferences.addons.get(__package__)
+    if addon is None:
+        return False
+    return getattr(addon.preferences, 'legacy_pose_refresh', False)
+
+#Armature Refresh
+def refresh_pose():
+    """Re-evaluates the depsgraph so that pose bone matrices reflect the last changes.
+       Falls back to toggling Object/Pose mode when the legacy preference is enabled.
+    """
+    if use_legacy_refresh():
+        bpy.ops.object.mode_set(mode='OBJECT')
+        bpy.ops.object.mode_set(mode='POSE')
+    else:
+        bpy.context.view_layer.update()
+
+def read_rest_matrices(arm_data, buffer=None):
+    """Rest matrices of all the bones of an armature, read in one foreach_get into buffer when its size fits"""
+    bones = arm_data.bones
+    size = len(bones) * 16
+    if buffer is None or len(buffer) != size:
+        buffer = np.empty(size, dtype=np.float32)
+    bones.foreach_get('matrix_local', buffer)
+    return buffer
+
+def get_rest_data(armobj):
+    """Returns the cached rest matrices of the armature bones, rebuilding them when the rest pose changes
+       (edit mode, reproportion, armature apply) or bones are renamed
+    """
+    arm_data = armobj.data
+    stamp_cache = rest_cache.get(arm_data.name)
+    if stamp_cache is not None:
+        names, matrices, buffer, cache = stamp_cache
+        buffer = read_rest_matrices(arm_data, buffer)
+        if np.array_equal(buffer, matrices) and arm_data.bones.keys() == names:
+            return cache
+    else:
+        buffer = read_rest_matrices(arm_data)
+    cache = {}
+    for b in arm_data.bones:
+        if b.parent:
+            cache[b.name] = (b.matrix_local.copy(), b.parent.name, b.parent.matrix_local.copy())
+        else:
+            cache[b.name] = (b.matrix_local.copy(), None, Matrix())
+    rest_cache[arm_data.name] = (arm_data.bones.keys(), buffer.copy(), buffer, cache)
+    rest_inverse_cache.pop(arm_data.name, None)
+    return cache
+
+def get_rest_inverses(armobj):
+    """Returns the cached inverted rest matrices used by solve_local_matrix, so that batches don't invert them per bone"""
+    arm_data = armobj.data
+    rest = get_rest_data(armobj)
+    cache = rest_inverse_cache.get(arm_data.name)
+    if cache is None:
+        cache = {}
+        for b_name, (bone_rest, parent_name, parent_rest) in rest.items():
+            cache[b_name] = (bone_rest.inverted(), (parent_rest.inverted() @ bone_rest).inverted())
+        rest_inverse_cache[arm_data.name] = cache
+    return cache
+
+def solve_local_matrix(bone_rest, parent_rest, target_matrix, parent_pose_matrix, ignoreparent=False):
+    """Pure matrix version of getmat: returns the local (basis) matrix that places a bone
+       at target_matrix (armature space) given its rest matrix and its parent's rest and pose matrices.
+    """
+    if parent_pose_matrix is None or ignoreparent or parent_rest == parent_pose_matrix:
+        return bone_rest.inverted() @ target_matrix
+    bonemat = parent_rest.inverted() @ bone_rest
+    return bonemat.inverted() @ parent_pose_matrix.inverted() @ target_matrix
+
+def compose_pose_matrix(bone_rest, parent_rest, basis_matrix, parent_pose_matrix):
+    """Inverse of solve_local_matrix: returns the armature space matrix of a bone from its local basis"""
+    if parent_pose_matrix is None:
+        return bone_rest @ basis_matrix
+    return parent_pose_matrix @ parent_rest.inverted() @ bone_rest @ basis_matrix
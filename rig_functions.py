@@ -1,6 +1,11 @@
 import bpy
 from math import radians
+from time import perf_counter
 import numpy as np
+from mathutils import Vector
+from .bone_visibility import BoneVisibilityWriter, write_bone_hide
+from .instrumentation import instrumented
+from .driver_index import set_drivers_mute
 
 ####### Bones Hiding System #######
 
@@ -17,6 +22,119 @@ with open(toggle_bones_names_file, "r") as jsonFile:
     target_bones = json.load(jsonFile)
 
 
+
+# Visibility rules of the properties bones: (property names, ((bone list or bone name, hide function), ...))
+# Every hide function gets the property values in order. Later rules win when a bone is in more than one list.
+
+def auto_hide_arm_rules(side, biped):
+    rules = (
+        ('bones_fk_' + side, lambda ik, hinge: ik != 1),
+        ('bones_ik_' + side, lambda ik, hinge: ik != 0),
+    )
+    if biped:
+        rules += (
+            ('bones_ik_hand_' + side, lambda ik, hinge: ik == 1 and hinge == 0),
+            ('bones_fk_hand_' + side, lambda ik, hinge: hinge == 1),
+            ('bones_ik_palm_' + side, lambda ik, hinge: ik == 1 or hinge == 0),
+            ('bones_fk_palm_' + side, lambda ik, hinge: not (ik == 1 or hinge == 0)),
+        )
+    groups = [(('ik_arm_' + side, 'hinge_hand_' + side), rules)]
+    # Fingers
+    for fing in ('ind', 'mid', 'ring', 'lit', 'thumb'):
+        groups.append((
+            ('ik_fing_{}_{}'.format(fing, side), 'hinge_fing_{}_{}'.format(fing, side), 'ik_fing_all_' + side, 'hinge_fing_all_' + side),
+            ((('fing_{}_ik_{}'.format(fing, side),), lambda ik, hinge, ik_all, hinge_all: ik == 0 and hinge == 0 and ik_all == 0 and hinge_all == 0),)))
+    return groups
+
+def auto_hide_leg_rules(side):
+    return [
+        (('ik_leg_' + side,), (
+            ('bones_fk_' + side, lambda ik: ik != 1),
+            ('bones_ik_' + side, lambda ik: ik != 0),
+        )),
+        # Toes
+        (('ik_toes_all_' + side, 'hinge_toes_all_' + side), (
+            ('bones_fk_foot_' + side, lambda ik, hinge: ik != 1),
+            ('bones_ik_foot_' + side, lambda ik, hinge: not (ik == 0 or hinge == 1)),
+        )),
+    ]
+
+def auto_hide_rules(b_name, biped):
+    """Rules of a properties bone, in the order the hiding system applies them"""
+    groups = []
+    if 'torso' in b_name:
+        groups.append((('ik_torso', 'inv_torso'), (
+            ('bones_ik', lambda ik, inv: ik == 1 or inv == 1),
+            ('bones_fk', lambda ik, inv: ik != 1 or inv == 1),
+            ('bones_inv', lambda ik, inv: inv != 1),
+        )))
+    if 'head' in b_name:
+        groups.append((('ik_head', 'hinge_head'), (
+            ('bones_fk', lambda ik, hinge: ik != 1),
+            ('bones_ik', lambda ik, hinge: ik != 0),
+            ('bones_fk_hinge', lambda ik, hinge: not (ik == 1 or hinge == 0)),
+            ('bones_ik_hinge', lambda ik, hinge: not (ik == 0 or hinge == 1)),
+        )))
+    for side in ('L', 'R'):
+        if '_' + side in b_name:
+            if 'arm' in b_name:
+                groups.extend(auto_hide_arm_rules(side, biped))
+            if 'leg' in b_name:
+                groups.extend(auto_hide_leg_rules(side))
+    return groups
+
+# Visibility index per armature: {armature data name: {'bones': bone count, 'groups': [...], 'values': last seen values}}
+auto_hide_index = {}
+
+def clear_bone_indices(*args):
+    """Drops the visibility, toggle bones and constraint indices, they are rebuilt on the next update. Also used as msgbus callback."""
+    auto_hide_index.clear()
+    toggle_bones_index.clear()
+    constraint_index.clear()
+
+def build_auto_hide_index(armobj):
+    arm = armobj.data
+    bone_names = set(arm.bones.keys())
+    biped = arm.get('rig_type') == "Biped"
+    groups = []
+    for b in armobj.pose.bones:
+        if 'properties' not in b.name:
+            continue
+        for prop_names, rules in auto_hide_rules(b.name, biped):
+            if not all(hasattr(b, n) for n in prop_names):
+                continue
+            resolved = []
+            for target, hide_func in rules:
+                if isinstance(target, tuple):
+                    names = [n for n in target if n in bone_names]
+                else:
+                    bone_list = b.get(target)
+                    if bone_list is None:
+                        continue
+                    if isinstance(bone_list, str):
+                        names = [n for n in bone_names if n in bone_list]
+                    else:
+                        names = [n for n in bone_list if n in bone_names]
+                resolved.append((names, hide_func))
+            groups.append((b.name, prop_names, resolved))
+    index = {'bones': len(arm.bones), 'groups': groups, 'values': None}
+    auto_hide_index[arm.name] = index
+    return index
+
+def get_auto_hide_index(armobj):
+    index = auto_hide_index.get(armobj.data.name)
+    if index is None or index['bones'] != len(armobj.data.bones):
+        index = build_auto_hide_index(armobj)
+    return index
+
+def subscribe_bone_indices():
+    """Rebuild the bone indices when bones are renamed. Subscriptions are lost on file load, call again from load_post."""
+    bpy.msgbus.clear_by_owner(auto_hide_index)
+    bpy.msgbus.subscribe_rna(key=(bpy.types.Bone, "name"), owner=auto_hide_index, args=(), notify=clear_bone_indices)
+    bpy.msgbus.subscribe_rna(key=(bpy.types.EditBone, "name"), owner=auto_hide_index, args=(), notify=clear_bone_indices)
+    bpy.msgbus.subscribe_rna(key=(bpy.types.Constraint, "name"), owner=auto_hide_index, args=(), notify=clear_bone_indices)
+
+@instrumented
 def bone_auto_hide(context):
 
     if context:
@@ -30,275 +148,31 @@ def bone_auto_hide(context):
         if not bpy.context.active_object:
             return
 
-        if bpy.context.active_object.type == "ARMATURE" and bpy.context.active_object.mode == 'POSE':
-            for b_prop in bpy.context.active_object.data.items():
-                if b_prop[0] == 'bone_auto_hide' and b_prop[1] == 0:
-                    return False
+        armobj = bpy.context.active_object
+        if armobj.type == "ARMATURE" and armobj.mode == 'POSE':
+            arm = armobj.data
+            if arm.get('bone_auto_hide', 1) == 0:
+                return False
+            if 'BlenRig_' not in str(arm.get('rig_name', '')):
+                return
 
-            for prop in bpy.context.active_object.data.items():
-                if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
+            index = get_auto_hide_index(armobj)
+            p_bones = armobj.pose.bones
+
+            # Nothing to do unless a property changed since the last update
+            values = tuple(tuple(int(getattr(p_bones[b_name], n)) for n in prop_names) for b_name, prop_names, rules in index['groups'])
+            if values == index['values']:
+                return
+            index['values'] = values
+
+            hide_state = {}
+            for (b_name, prop_names, rules), group_values in zip(index['groups'], values):
+                for names, hide_func in rules:
+                    hide = bool(hide_func(*group_values))
+                    for name in names:
+                        hide_state[name] = hide
 
-                    arm = bpy.context.active_object.data
-                    p_bones = bpy.context.active_object.pose.bones
-
-                    for b in p_bones:
-                        if ('properties' in b.name):
-                            if ('torso' in b.name):
-
-                                # Torso FK/IK
-                                prop = int(b.ik_torso)
-                                prop_inv = int(b.inv_torso)
-
-                                for bone in arm.bones:
-                                    if (bone.name in b['bones_ik']):
-                                        if prop == 1 or prop_inv == 1:
-                                            bone.hide = 1
-                                        else:
-                                            bone.hide = 0
-                                    if (bone.name in b['bones_fk']):
-                                        if prop != 1 or prop_inv == 1:
-                                            bone.hide = 1
-                                        else:
-                                            bone.hide = 0
-
-                            # Torso INV
-                                for bone in arm.bones:
-                                    if (bone.name in b['bones_inv']):
-                                        if prop_inv == 1:
-                                            bone.hide = 0
-                                        else:
-                                            bone.hide = 1
-                            if ('head' in b.name):
-                                # Neck FK/IK
-                                prop = int(b.ik_head)
-                                for bone in arm.bones:
-                                    if (bone.name in b['bones_fk']):
-                                        if prop == 1:
-                                            bone.hide = 0
-                                        else:
-                                            bone.hide = 1
-                                    if (bone.name in b['bones_ik']):
-                                        if prop == 0:
-                                            bone.hide = 0
-                                        else:
-                                            bone.hide = 1
-
-                            # Head Hinge
-                                prop_hinge = int(b.hinge_head)
-                                for bone in arm.bones:
-                                    if (bone.name in b['bones_fk_hinge']):
-                                        if prop == 1 or prop_hinge == 0:
-                                            bone.hide = 0
-                                        else:
-                                            bone.hide = 1
-                                    if (bone.name in b['bones_ik_hinge']):
-                                        if prop == 0 or prop_hinge == 1:
-                                            bone.hide = 0
-                                        else:
-                                            bone.hide = 1
-                            # Left Properties
-                            if ('_L' in b.name):
-                                if ('arm' in b.name):
-
-                                    # Arm_L FK/IK
-                                    prop = int(b.ik_arm_L)
-                                    prop_hinge = int(b.hinge_hand_L)
-                                    for bone in arm.bones:
-                                        if (bone.name in b['bones_fk_L']):
-                                            if prop == 1:
-                                                bone.hide = 0
-                                            else:
-                                                bone.hide = 1
-                                        if (bone.name in b['bones_ik_L']):
-                                            if prop == 0:
-                                                bone.hide = 0
-                                            else:
-                                                bone.hide = 1
-
-                                # HAND_L
-                                        if arm['rig_type'] == "Biped":
-                                            if (bone.name in b['bones_ik_hand_L']):
-                                                if prop == 1 and prop_hinge == 0:
-                                                    bone.hide = 1
-                                                else:
-                                                    bone.hide = 0
-                                            if (bone.name in b['bones_fk_hand_L']):
-                                                if prop_hinge == 1:
-                                                    bone.hide = 1
-                                                else:
-                                                    bone.hide = 0
-                                            if (bone.name in b['bones_ik_palm_L']):
-                                                if prop == 1 or prop_hinge == 0:
-                                                    bone.hide = 1
-                                                else:
-                                                    bone.hide = 0
-                                            if (bone.name in b['bones_fk_palm_L']):
-                                                if prop == 1 or prop_hinge == 0:
-                                                    bone.hide = 0
-                                                else:
-                                                    bone.hide = 1
-
-                                # Fingers_L
-                                    prop_ik_all = int(b.ik_fing_all_L)
-                                    prop_hinge_all = int(b.hinge_fing_all_L)
-
-                                    def fingers_hide(b_name):
-                                        for bone in arm.bones:
-                                            ik_bones = [b_name]
-                                            if (bone.name == b_name):
-                                                if prop == 1 or prop_hinge == 1 or prop_ik_all == 1 or prop_hinge_all == 1:
-                                                    bone.hide = 0
-                                                if prop == 0 and prop_hinge == 0 and prop_ik_all == 0 and prop_hinge_all == 0:
-                                                    bone.hide = 1
-                                        return {"FINISHED"}
-
-                                    prop_hinge = int(b.hinge_fing_ind_L)
-                                    prop = int(b.ik_fing_ind_L)
-                                    fingers_hide('fing_ind_ik_L')
-                                    prop_hinge = int(b.hinge_fing_mid_L)
-                                    prop = int(b.ik_fing_mid_L)
-                                    fingers_hide('fing_mid_ik_L')
-                                    prop_hinge = int(b.hinge_fing_ring_L)
-                                    prop = int(b.ik_fing_ring_L)
-                                    fingers_hide('fing_ring_ik_L')
-                                    prop_hinge = int(b.hinge_fing_lit_L)
-                                    prop = int(b.ik_fing_lit_L)
-                                    fingers_hide('fing_lit_ik_L')
-                                    prop_hinge = int(b.hinge_fing_thumb_L)
-                                    prop = int(b.ik_fing_thumb_L)
-                                    fingers_hide('fing_thumb_ik_L')
-
-                                if ('leg' in b.name):
-                                    # Leg_L FK/IK
-                                    prop = int(b.ik_leg_L)
-                                    for bone in arm.bones:
-                                        if (bone.name in b['bones_fk_L']):
-                                            if prop == 1:
-                                                bone.hide = 0
-                                            else:
-                                                bone.hide = 1
-                                        if (bone.name in b['bones_ik_L']):
-                                            if prop == 0:
-                                                bone.hide = 0
-                                            else:
-                                                bone.hide = 1
-
-                                # Toes_L FK/IK
-                                    prop = int(b.ik_toes_all_L)
-                                    prop_hinge = int(b.hinge_toes_all_L)
-                                    for bone in arm.bones:
-                                        if (bone.name in b['bones_fk_foot_L']):
-                                            if prop == 1:
-                                                bone.hide = 0
-                                            else:
-                                                bone.hide = 1
-                                        if (bone.name in b['bones_ik_foot_L']):
-                                            if prop == 0 or prop_hinge == 1:
-                                                bone.hide = 0
-                                            else:
-                                                bone.hide = 1
-
-                            # Right Properties
-                            if ('_R' in b.name):
-                                if ('arm' in b.name):
-
-                                    # Arm_R FK/IK
-                                    prop = int(b.ik_arm_R)
-                                    prop_hinge = int(b.hinge_hand_R)
-                                    for bone in arm.bones:
-                                        if (bone.name in b['bones_fk_R']):
-                                            if prop == 1:
-                                                bone.hide = 0
-                                            else:
-                                                bone.hide = 1
-                                        if (bone.name in b['bones_ik_R']):
-                                            if prop == 0:
-                                                bone.hide = 0
-                                            else:
-                                                bone.hide = 1
-
-                                # HAND_R
-                                        if arm['rig_type'] == "Biped":
-                                            if (bone.name in b['bones_ik_hand_R']):
-                                                if prop == 1 and prop_hinge == 0:
-                                                    bone.hide = 1
-                                                else:
-                                                    bone.hide = 0
-                                            if (bone.name in b['bones_fk_hand_R']):
-                                                if prop_hinge == 1:
-                                                    bone.hide = 1
-                                                else:
-                                                    bone.hide = 0
-                                            if (bone.name in b['bones_ik_palm_R']):
-                                                if prop == 1 or prop_hinge == 0:
-                                                    bone.hide = 1
-                                                else:
-                                                    bone.hide = 0
-                                            if (bone.name in b['bones_fk_palm_R']):
-                                                if prop == 1 or prop_hinge == 0:
-                                                    bone.hide = 0
-                                                else:
-                                                    bone.hide = 1
-
-                                # Fingers_R
-                                    prop_ik_all = int(b.ik_fing_all_R)
-                                    prop_hinge_all = int(b.hinge_fing_all_R)
-
-                                    def fingers_hide(b_name):
-                                        for bone in arm.bones:
-                                            ik_bones = [b_name]
-                                            if (bone.name == b_name):
-                                                if prop == 1 or prop_hinge == 1 or prop_ik_all == 1 or prop_hinge_all == 1:
-                                                    bone.hide = 0
-                                                if prop == 0 and prop_hinge == 0 and prop_ik_all == 0 and prop_hinge_all == 0:
-                                                    bone.hide = 1
-                                        return {"FINISHED"}
-
-                                    prop_hinge = int(b.hinge_fing_ind_R)
-                                    prop = int(b.ik_fing_ind_R)
-                                    fingers_hide('fing_ind_ik_R')
-                                    prop_hinge = int(b.hinge_fing_mid_R)
-                                    prop = int(b.ik_fing_mid_R)
-                                    fingers_hide('fing_mid_ik_R')
-                                    prop_hinge = int(b.hinge_fing_ring_R)
-                                    prop = int(b.ik_fing_ring_R)
-                                    fingers_hide('fing_ring_ik_R')
-                                    prop_hinge = int(b.hinge_fing_lit_R)
-                                    prop = int(b.ik_fing_lit_R)
-                                    fingers_hide('fing_lit_ik_R')
-                                    prop_hinge = int(b.hinge_fing_thumb_R)
-                                    prop = int(b.ik_fing_thumb_R)
-                                    fingers_hide('fing_thumb_ik_R')
-
-                                if ('leg' in b.name):
-                                    # Leg_R FK/IK
-                                    prop = int(b.ik_leg_R)
-                                    for bone in arm.bones:
-                                        if (bone.name in b['bones_fk_R']):
-                                            if prop == 1:
-                                                bone.hide = 0
-                                            else:
-                                                bone.hide = 1
-                                        if (bone.name in b['bones_ik_R']):
-                                            if prop == 0:
-                                                bone.hide = 0
-                                            else:
-                                                bone.hide = 1
-
-                                # Toes_R FK/IK
-                                    prop = int(b.ik_toes_all_R)
-                                    prop_hinge = int(b.hinge_toes_all_R)
-                                    for bone in arm.bones:
-                                        if (bone.name in b['bones_fk_foot_R']):
-                                            if prop == 1:
-                                                bone.hide = 0
-                                            else:
-                                                bone.hide = 1
-                                        if (bone.name in b['bones_ik_foot_R']):
-                                            if prop == 0 or prop_hinge == 1:
-                                                bone.hide = 0
-                                            else:
-                                                bone.hide = 1
+            return write_bone_hide(arm, hide_state)
 
 
 ####### Reproportion Toggle #######
@@ -375,13 +249,48 @@ def reproportion_toggle(self, context):
 
 ####### Rig Toggles #######
 
+# Toggle bones index per armature: {armature data name: {'bones': bone count, 'groups': {(json key, side): bone names}}}
+toggle_bones_index = {}
+
+def toggle_bone_names(armobj, key, side):
+    """Bones of a toggle_bones_names.json list that exist in the armature, with the side suffix"""
+    arm = armobj.data
+    index = toggle_bones_index.get(arm.name)
+    if index is None or index['bones'] != len(arm.bones):
+        bones = arm.bones
+        groups = {}
+        for json_key, names in target_bones["HUMANOID"].items():
+            for json_side in ('_L', '_R'):
+                groups[(json_key, json_side)] = tuple(n + json_side for n in names if n + json_side in bones)
+        index = {'bones': len(bones), 'groups': groups}
+        toggle_bones_index[arm.name] = index
+    return index['groups'][(key, side)]
+
+def set_toggle_constraints(pbone, constraints_state, reproportion):
+    """Mutes the constraints of a toggled bone, REPROP/NOREP ones follow the reproportion state"""
+    constraints = pbone.constraints
+    if not len(constraints):
+        return
+    mute = []
+    for const in constraints:
+        if 'REPROP' in const.name:
+            mute.append(not reproportion)
+        elif 'NOREP' in const.name:
+            mute.append(reproportion)
+        else:
+            mute.append(not constraints_state)
+    current = [False] * len(mute)
+    constraints.foreach_get('mute', current)
+    if current != mute:
+        constraints.foreach_set('mute', mute)
+        # foreach_set skips the constraint update, tag the armature so the new states get evaluated
+        pbone.id_data.update_tag()
+
 # Legacy Function for BlenRig 5 Rigs
 
 
+@instrumented
 def rig_toggles(context, call_from: str, call_from_side: str):
-    # zebus 1
-    from datetime import datetime
-    start = datetime.now()
 
     if not context.screen and context.screen.is_animation_playing == True and not context.active_object:
         return False
@@ -391,44 +300,25 @@ def rig_toggles(context, call_from: str, call_from_side: str):
         arm = amr_obj.data
         p_bones = amr_obj.pose.bones
 
-        # valid_bones = []
-        # for b in p_bones:
-
-        #     # si no contiene ni el sufijo _L ni _R pasamos al siguiente:
-        #     if all([not b.name.endswith("_L"), not b.name.endswith("_R")]):
-        #         continue
-
-        #     valid_bones.append(b)
-
-        # Para poder optimizar el computo a la mitad:
-        # como solo se llama desde toes (pies) y fingers (manos) lo he acotado tanto al tipo como a si es Left o Right:
-        # valid_bones_phase_1 = [b for b in p_bones if b.name.endswith(call_from_side)]
-        pack_bones_1 = [p_bones[finger_name+call_from_side] for finger_name in target_bones["HUMANOID"]["PROPERTIES"]]
+        pack_bones_1 = [p_bones[b_name] for b_name in toggle_bone_names(amr_obj, "PROPERTIES", call_from_side)]
 
         if call_from == "fingers":
             target_key = "HAND"
         elif call_from == "toes":
             target_key = "TOES"
 
-        pack_bones_2 = [p_bones[finger_name+call_from_side] for finger_name in target_bones["HUMANOID"][target_key]]
+        pack_bones_2 = set(toggle_bone_names(amr_obj, target_key, call_from_side))
+        visibility = BoneVisibilityWriter(arm)
 
         def set_bone_layers(bone_list, layer_list, constraints_state, side):
 
             for bl in bone_list:
-                for b in pack_bones_2:
-
-                    if b.name != str(bl + side):
-                        continue
-
-                    b.bone.layers = [i in layer_list for i in range(len(b.bone.layers))]
+                b_name = bl + side
+                if b_name not in pack_bones_2:
+                    continue
 
-                    for const in b.constraints:
-                        if 'REPROP' in const.name:
-                            const.mute = not arm.reproportion
-                        elif 'NOREP' in const.name:
-                            const.mute = arm.reproportion
-                        else:
-                            const.mute = not constraints_state
+                visibility.layers(b_name, layer_list)
+                set_toggle_constraints(p_bones[b_name], constraints_state, arm.reproportion)
 
         fingers_bones = ['hand_close', 'fing_spread']
         foot_toes_str = ['toes_str_1', 'toes_str_2', 'toes_str_3']
@@ -528,9 +418,10 @@ def rig_toggles(context, call_from: str, call_from_side: str):
                     set_bone_layers(['toes_ik_ctrl'], layers_hardcoded_2, toggle_toes_R, side)
                     set_bone_layers(foot_toes_str, layers_hardcoded_3, toggle_toes_R, side)
 
-    print('[###] zebus TIME rig_toggles:', datetime.now()-start)
+        visibility.write()
 
 
+@instrumented
 def fingers_toggles(self, context):
 
     if not context.screen and context.screen.is_animation_playing == True and not context.active_object:
@@ -619,33 +510,20 @@ def fingers_toggles(self, context):
                                     'fing_lit_3_ik_L', 'fing_lit_4_ik_L', 'fing_lit_shp_at_L', 'fing_lit_1_L',
                                     'fing_lit_2_rot_L', 'fing_lit_ctrl_shp_at_L', 'fing_lit_ctrl_bend_loc_L']
 
+                visibility = BoneVisibilityWriter(arm)
+
                 def set_bone_layers(bone_list, layer_list, constraints_state, side):
                     bones = bone_list
                     layers = layer_list
                     for B in bones:
-                        for b in p_bones:
-                            if b.name == str(B[0:-2] + side):
-                                for L in layers:
-                                    b.bone.layers[L] = 1
-                                    for l in range(len(b.bone.layers)):
-                                        if l not in layers:
-                                            b.bone.layers[l] = 0
-                                if constraints_state == 'On':
-                                    for C in b.constraints:
-                                        C.mute = False
-                                        if arm.reproportion:
-                                            if ('REPROP' in C.name):
-                                                C.mute = False
-                                            if ('NOREP' in C.name):
-                                                C.mute = True
-                                        else:
-                                            if ('REPROP' in C.name):
-                                                C.mute = True
-                                            if ('NOREP' in C.name):
-                                                C.mute = False
-                                if constraints_state == 'Off':
-                                    for C in b.constraints:
-                                        C.mute = True
+                        b = p_bones.get(B[0:-2] + side)
+                        if b is None:
+                            continue
+                        visibility.layers(b.name, layers)
+                        if constraints_state == 'On':
+                            set_toggle_constraints(b, True, arm.reproportion)
+                        if constraints_state == 'Off':
+                            b.constraints.foreach_set('mute', [True] * len(b.constraints))
 
                 for b in p_bones:
                     if ('properties' in b.name):
@@ -856,7 +734,10 @@ def fingers_toggles(self, context):
                                     set_bone_layers(little_action_list, [24], 'Off', '_R')
                                     set_bone_layers(little_mech_list, [24], 'Off', '_R')
 
+                visibility.write()
 
+
+@instrumented
 def toes_toggles(self, context, call_from: str, call_from_side: str):
 
     if not context.screen and context.screen.is_animation_playing == True and not context.active_object:
@@ -879,29 +760,18 @@ def toes_toggles(self, context, call_from: str, call_from_side: str):
         # pack_bones_2 = [p_bones[finger_name+call_from_side] for finger_name in target_bones["HUMANOID"][target_key]]
         # print(pack_bones_2)
 
+        visibility = BoneVisibilityWriter(arm)
+
         def set_bone_layers(bone_list, layer_list, constraints_state, side):
 
             for bl in bone_list:
-                for b in p_bones:
-
-                    # print('b.name != str(bl + side)', b.name != str(bl + side))
-                    if b.name != str(bl + side):
-                        continue
-
-                    if "toes_spread" in bl:
-                        print(b.name, bl + side)
+                b = p_bones.get(bl + side)
+                if b is None:
+                    continue
 
-                    b.bone.layers = [i in layer_list for i in range(len(b.bone.layers))]
+                visibility.layers(b.name, layer_list)
+                set_toggle_constraints(b, constraints_state, arm.reproportion)
 
-                    for const in b.constraints:
-                        if 'REPROP' in const.name:
-                            const.mute = not arm.reproportion
-                        elif 'NOREP' in const.name:
-                            const.mute = arm.reproportion
-                        else:
-                            const.mute = not constraints_state
-
-        # zebus 0
         toe_big_fk_list = target_bones["HUMANOID"]["TOE_BIG_FK"]
         toe_big_ctrl_list = target_bones["HUMANOID"]["TOE_BIG_CRTL"]
         toe_big_toon_list = target_bones["HUMANOID"]["TOE_BIG_TOON"]
@@ -1256,6 +1126,8 @@ def toes_toggles(self, context, call_from: str, call_from_side: str):
                 set_bone_layers(toe_little_fix_list, layers_hardcoded7, toggle_toes_little_R, side)
                 set_bone_layers(toe_little_mech_list, layers_hardcoded8, toggle_toes_little_R, side)
 
+        visibility.write()
+
 
 ####### Rig Optimizations #######
 
@@ -1271,7 +1143,6 @@ def toggle_face_drivers(context):
         if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
             prop = bool(context.active_object.data.toggle_face_drivers)
             armobj = context.active_object
-            drivers = armobj.animation_data.drivers
             data_path_list = ['pose.bones["mouth_corner_R"]["BACK_LIMIT_R"]',
                               'pose.bones["mouth_corner_R"]["DOWN_LIMIT_R"]',
                               'pose.bones["mouth_corner_R"]["FORW_LIMIT_R"]',
@@ -1364,15 +1235,7 @@ def toggle_face_drivers(context):
                               'pose.bones["mouth_corner_L"]["AUTO_BACK_L"]',
                               'pose.bones["mouth_corner_R"]["AUTO_BACK_R"]']
 
-            for C in drivers:
-                for vars in C.driver.variables:
-                    for T in vars.targets:
-                        for D in data_path_list:
-                            if D in T.data_path:
-                                if prop == 1:
-                                    C.mute = False
-                                else:
-                                    C.mute = True
+            set_drivers_mute(armobj, data_path_list, not prop)
 
 ####### Toggle Flex Drivers (Legacy Rig)#######
 
@@ -1386,7 +1249,6 @@ def toggle_flex_drivers(context):
         if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
             prop = bool(context.active_object.data.toggle_flex_drivers)
             armobj = context.active_object
-            drivers = armobj.animation_data.drivers
             data_path_list = ['pose.bones["properties_head"]["flex_head_scale"]',
                               'pose.bones["properties_head"]["flex_neck_length"]',
                               'pose.bones["properties_head"]["flex_neck_width"]',
@@ -1423,15 +1285,7 @@ def toggle_flex_drivers(context):
                               'pose.bones["properties_leg_L"]["flex_foot_scale_L"]',
                               'pose.bones["properties_leg_L"]["flex_foot_loc_L"]']
 
-            for C in drivers:
-                for vars in C.driver.variables:
-                    for T in vars.targets:
-                        for D in data_path_list:
-                            if D in T.data_path:
-                                if prop == 1:
-                                    C.mute = False
-                                else:
-                                    C.mute = True
+            set_drivers_mute(armobj, data_path_list, not prop)
 
 ####### Toggle Dynamic Shaping Drivers #######
 
@@ -1445,7 +1299,6 @@ def toggle_dynamic_drivers(context):
         if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
             prop = bool(context.active_object.data.toggle_dynamic_drivers)
             armobj = context.active_object
-            drivers = armobj.animation_data.drivers
             data_path_list = ['pose.bones["properties_head"]["dynamic_head_scale"]',
                               'pose.bones["properties_head"]["dynamic_neck_length"]',
                               'pose.bones["properties_head"]["dynamic_neck_width"]',
@@ -1482,15 +1335,7 @@ def toggle_dynamic_drivers(context):
                               'pose.bones["properties_leg_L"]["dynamic_foot_scale_L"]',
                               'pose.bones["properties_leg_L"]["dynamic_foot_loc_L"]']
 
-            for C in drivers:
-                for vars in C.driver.variables:
-                    for T in vars.targets:
-                        for D in data_path_list:
-                            if D in T.data_path:
-                                if prop == 1:
-                                    C.mute = False
-                                else:
-                                    C.mute = True
+            set_drivers_mute(armobj, data_path_list, not prop)
 
 
 ####### Toggle Body Drivers #######
@@ -1504,7 +1349,6 @@ def toggle_body_drivers(context):
         if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
             prop = bool(context.active_object.data.toggle_body_drivers)
             armobj = context.active_object
-            drivers = armobj.animation_data.drivers
             data_path_list = ['pose.bones["forearm_ik_R"].constraints["Ik_Initial_Rotation"].to_min_x_rot',
                               'pose.bones["forearm_ik_L"].constraints["Ik_Initial_Rotation"].to_min_x_rot',
                               'pose.bones["shin_ik_R"].constraints["Ik_Initial_Rotation"].to_min_x_rot',
@@ -1537,15 +1381,7 @@ def toggle_body_drivers(context):
                               'pose.bones["spine_1_inv"]["fk_follow_main"]',
                               'pose.bones["pelvis_inv"]["fk_follow_main"]']
 
-            for C in drivers:
-                for vars in C.driver.variables:
-                    for T in vars.targets:
-                        for D in data_path_list:
-                            if D in T.data_path:
-                                if prop == 1:
-                                    C.mute = False
-                                else:
-                                    C.mute = True
+            set_drivers_mute(armobj, data_path_list, not prop)
 
 ####### Pole Toggles #######
 
@@ -1629,137 +1465,185 @@ def pole_toggles(context):
 
 ################### MAIN FUNCTIONS ##################################
 
-# Function for setting values on Action Constraints
+# Constraints by type and name per armature: {armature data name: {'stamp': constraint count per bone, 'constraints': {(type, name): [(bone name, constraint name)]}}}
+constraint_index = {}
+
+def constraint_stamp(armobj):
+    """Constraint count of every pose bone, changes when bones or constraints are added or removed"""
+    return tuple(len(b.constraints) for b in armobj.pose.bones)
+
+def build_constraint_index(armobj):
+    constraints = {}
+    for b in armobj.pose.bones:
+        for C in b.constraints:
+            constraints.setdefault((C.type, C.name), []).append((b.name, C.name))
+    index = {'stamp': constraint_stamp(armobj), 'constraints': constraints}
+    constraint_index[armobj.data.name] = index
+    return index
+
+def check_constraint_index(armobj):
+    """Rebuilds the constraint index of an armature when constraints were added or removed since it was built"""
+    index = constraint_index.get(armobj.data.name)
+    if index is None or index['stamp'] != constraint_stamp(armobj):
+        index = build_constraint_index(armobj)
+    return index
+
+def get_constraints(armobj, C_type, C_name, checked=False):
+    """Pose bone constraints of a type and name, looked up in a per armature index.
+       checked skips the index stamp check, for callers that ran check_constraint_index already.
+    """
+    index = constraint_index.get(armobj.data.name) if checked else None
+    if index is None:
+        index = check_constraint_index(armobj)
+    p_bones = armobj.pose.bones
+    found = []
+    for b_name, c_name in index['constraints'].get((C_type, C_name), ()):
+        b = p_bones.get(b_name)
+        C = b.constraints.get(c_name) if b else None
+        if C is None or C.type != C_type:
+            # Constraints changed since the index was built
+            build_constraint_index(armobj)
+            return [C for b in p_bones for C in b.constraints if C.type == C_type and C.name == C_name]
+        found.append(C)
+    return found
+
+def get_bone_prop(armobj, b_name, prop_name):
+    """Custom property of a pose bone, None if the bone or the property don't exist"""
+    b = armobj.pose.bones.get(b_name)
+    if b is None:
+        return None
+    return b.get(prop_name)
 
+def settings_armature():
+    """Armature the settings functions work on: the active armature, else the one set in the rig guide"""
+    if bpy.context.active_object and bpy.context.active_object.type == 'ARMATURE':
+        return bpy.context.active_object
+    return bpy.context.scene.blenrig_guide.arm_obj
 
-def Set_Movement_Ranges_Actions(b_name, prop_name, C_name, min_factor, max_factor):
+class RigSettingsPass():
+    """Applies tables of (values function, arguments) entries to the constraints of an armature.
+       Every bone property is read once per pass and only constraint values that differ are written.
+       Values functions yield (constraint, attribute, value) for the bone property they are given.
+    """
 
-    armobj = bpy.context.active_object
-    arm = bpy.context.active_object.data
-    p_bones = bpy.context.active_object.pose.bones
-    constraint_value = []
+    def __init__(self, armobj):
+        self.armobj = armobj
+        self.props = {}
+        self.changed = 0
+        self.total = 0
+        if armobj is not None:
+            check_constraint_index(armobj)
 
-    for b in p_bones:
-        if b.name == b_name:
-            for cust_prop in b.items():
-                if cust_prop[0] == prop_name:
-                    constraint_value = []
-                    constraint_value.append(cust_prop[1])
-                    for b in p_bones:
-                        for C in b.constraints:
-                            if C.type == 'ACTION':
-                                if C.name == C_name:
-                                    C.min = constraint_value[0] * min_factor
-                                    C.max = constraint_value[0] * max_factor
+    def prop(self, b_name, prop_name):
+        key = (b_name, prop_name)
+        if key not in self.props:
+            self.props[key] = get_bone_prop(self.armobj, b_name, prop_name)
+        return self.props[key]
 
-# Functions for setting values on Realistic Joints Transform Constraints
+    def constraints(self, C_type, C_name):
+        """Constraints of a type and name, the index was checked once when the pass started"""
+        return get_constraints(self.armobj, C_type, C_name, checked=True)
 
+    def apply(self, table):
+        """Writes the values of a table, returns the number of constraint values that changed"""
+        if self.armobj is None:
+            return 0
+        changed = 0
+        for values, args in table:
+            for C, attr, value in values(self, *args):
+                self.total += 1
+                if abs(getattr(C, attr) - value) > 1e-6:
+                    setattr(C, attr, value)
+                    changed += 1
+        self.changed += changed
+        return changed
 
-def Set_RJ_Transforms_Limbs(b_name, prop_name, C_name, x_loc_factor, z_loc_factor, x_rot_factor, z_rot_factor):
+# Values for Action Constraints
 
-    if bpy.context.active_object.type == 'ARMATURE':
-        armobj = bpy.context.active_object
-    else:
-        armobj = bpy.context.scene.blenrig_guide.arm_obj
-    p_bones = armobj.pose.bones
-    constraint_value = []
-
-    for b in p_bones:
-        if b.name == b_name:
-            for cust_prop in b.items():
-                if cust_prop[0] == prop_name:
-                    constraint_value = []
-                    constraint_value.append(cust_prop[1])
-                    for b in p_bones:
-                        for C in b.constraints:
-                            if C.type == 'TRANSFORM':
-                                if C.name == C_name:
-                                    C.to_max_x = constraint_value[0] * x_loc_factor
-                                    C.to_max_z = constraint_value[0] * z_loc_factor
-                                    C.to_max_x_rot = radians(constraint_value[0] * x_rot_factor)
-                                    C.to_max_z_rot = radians(constraint_value[0] * z_rot_factor)
 
+def movement_range_values(settings, b_name, prop_name, C_name, min_factor, max_factor):
 
-def Set_RJ_Transforms_Fing_Toes(b_name, prop_name, C_name, z_loc_factor, x_rot_factor, Loc_Array_n, Rot_Array_n):
+    constraint_value = settings.prop(b_name, prop_name)
+    if constraint_value is None:
+        return
 
-    if bpy.context.active_object.type == 'ARMATURE':
-        armobj = bpy.context.active_object
-    else:
-        armobj = bpy.context.scene.blenrig_guide.arm_obj
-    p_bones = armobj.pose.bones
-    constraint_value = []
-
-    for b in p_bones:
-        if b.name == b_name:
-            for cust_prop in b.items():
-                if cust_prop[0] == prop_name:
-                    constraint_value = []
-                    constraint_value.append(cust_prop[1][0])
-                    constraint_value.append(cust_prop[1][1])
-                    constraint_value.append(cust_prop[1][2])
-                    for b in p_bones:
-                        for C in b.constraints:
-                            if C.type == 'TRANSFORM':
-                                if C.name == C_name:
-                                    C.to_max_z = constraint_value[Loc_Array_n] * z_loc_factor
-                                    C.to_max_x_rot = radians(constraint_value[Rot_Array_n] * x_rot_factor)
-
-# Function for setting values on Volume Variation Constraints
+    for C in settings.constraints('ACTION', C_name):
+        yield C, 'min', constraint_value * min_factor
+        yield C, 'max', constraint_value * max_factor
 
+# Values for Realistic Joints Transform Constraints
 
-def Set_Volume_Variation_Stretch_To(b_name, prop_name, C_name):
 
-    armobj = bpy.context.active_object
-    arm = bpy.context.active_object.data
-    p_bones = bpy.context.active_object.pose.bones
-    constraint_value = []
+def rj_limb_values(settings, b_name, prop_name, C_name, x_loc_factor, z_loc_factor, x_rot_factor, z_rot_factor):
 
-    for b in p_bones:
-        if b.name == b_name:
-            for cust_prop in b.items():
-                if cust_prop[0] == prop_name:
-                    constraint_value = []
-                    constraint_value.append(cust_prop[1])
-                    for b in p_bones:
-                        for C in b.constraints:
-                            if C.type == 'STRETCH_TO':
-                                if C.name == C_name:
-                                    C.bulge = constraint_value[0]
+    constraint_value = settings.prop(b_name, prop_name)
+    if constraint_value is None:
+        return
 
-# Functions for setting values on Volume Preservation bones Constraints
+    for C in settings.constraints('TRANSFORM', C_name):
+        yield C, 'to_max_x', constraint_value * x_loc_factor
+        yield C, 'to_max_z', constraint_value * z_loc_factor
+        yield C, 'to_max_x_rot', radians(constraint_value * x_rot_factor)
+        yield C, 'to_max_z_rot', radians(constraint_value * z_rot_factor)
 
 
-def Set_VP_Transforms(b_name, prop_name, C_name, to_mapping, factor):
+def rj_fing_toes_values(settings, b_name, prop_name, C_name, z_loc_factor, x_rot_factor, Loc_Array_n, Rot_Array_n):
+
+    constraint_value = settings.prop(b_name, prop_name)
+    if constraint_value is None:
+        return
+
+    for C in settings.constraints('TRANSFORM', C_name):
+        yield C, 'to_max_z', constraint_value[Loc_Array_n] * z_loc_factor
+        yield C, 'to_max_x_rot', radians(constraint_value[Rot_Array_n] * x_rot_factor)
+
+# Values for Volume Variation Constraints
+
+
+def vol_variation_values(settings, b_name, prop_name, C_name):
+
+    constraint_value = settings.prop(b_name, prop_name)
+    if constraint_value is None:
+        return
+
+    for C in settings.constraints('STRETCH_TO', C_name):
+        yield C, 'bulge', constraint_value
+
+# Values for Volume Preservation bones Constraints
+
+
+def vp_values(settings, b_name, prop_name, C_name, to_mapping, factor):
+
+    if to_mapping not in ('to_max_x', 'to_max_y', 'to_max_z', 'to_min_x', 'to_min_y', 'to_min_z'):
+        return
+    constraint_value = settings.prop(b_name, prop_name)
+    if constraint_value is None:
+        return
+
+    for C in settings.constraints('TRANSFORM', C_name):
+        yield C, to_mapping, constraint_value * factor
+
+# Single setting functions, the tables below apply the same values in one pass
+
+
+def Set_Movement_Ranges_Actions(b_name, prop_name, C_name, min_factor, max_factor):
+    RigSettingsPass(bpy.context.active_object).apply(((movement_range_values, (b_name, prop_name, C_name, min_factor, max_factor)),))
 
-    if bpy.context.active_object.type == 'ARMATURE':
-        armobj = bpy.context.active_object
-    else:
-        armobj = bpy.context.scene.blenrig_guide.arm_obj
-    p_bones = armobj.pose.bones
-    constraint_value = []
-
-    for b in p_bones:
-        if b.name == b_name:
-            for cust_prop in b.items():
-                if cust_prop[0] == prop_name:
-                    constraint_value = []
-                    constraint_value.append(cust_prop[1])
-                    for b in p_bones:
-                        for C in b.constraints:
-                            if C.type == 'TRANSFORM':
-                                if C.name == C_name:
-                                    if to_mapping == 'to_max_x':
-                                        C.to_max_x = constraint_value[0] * factor
-                                    if to_mapping == 'to_max_y':
-                                        C.to_max_y = constraint_value[0] * factor
-                                    if to_mapping == 'to_max_z':
-                                        C.to_max_z = constraint_value[0] * factor
-                                    if to_mapping == 'to_min_x':
-                                        C.to_min_x = constraint_value[0] * factor
-                                    if to_mapping == 'to_min_y':
-                                        C.to_min_y = constraint_value[0] * factor
-                                    if to_mapping == 'to_min_z':
-                                        C.to_min_z = constraint_value[0] * factor
+
+def Set_RJ_Transforms_Limbs(b_name, prop_name, C_name, x_loc_factor, z_loc_factor, x_rot_factor, z_rot_factor):
+    RigSettingsPass(settings_armature()).apply(((rj_limb_values, (b_name, prop_name, C_name, x_loc_factor, z_loc_factor, x_rot_factor, z_rot_factor)),))
+
+
+def Set_RJ_Transforms_Fing_Toes(b_name, prop_name, C_name, z_loc_factor, x_rot_factor, Loc_Array_n, Rot_Array_n):
+    RigSettingsPass(settings_armature()).apply(((rj_fing_toes_values, (b_name, prop_name, C_name, z_loc_factor, x_rot_factor, Loc_Array_n, Rot_Array_n)),))
+
+
+def Set_Volume_Variation_Stretch_To(b_name, prop_name, C_name):
+    RigSettingsPass(bpy.context.active_object).apply(((vol_variation_values, (b_name, prop_name, C_name)),))
+
+
+def Set_VP_Transforms(b_name, prop_name, C_name, to_mapping, factor):
+    RigSettingsPass(settings_armature()).apply(((vp_values, (b_name, prop_name, C_name, to_mapping, factor)),))
 
 ######## SET FUNCTIONS ###########################################
 
@@ -1768,6 +1652,28 @@ def Set_VP_Transforms(b_name, prop_name, C_name, to_mapping, factor):
 # EYELIDS
 
 
+EYELIDS_SETTINGS = (
+    # Eyelid Up L
+    (movement_range_values, ('eyelid_up_ctrl_L', 'EYELID_UP_LIMIT_L', 'Eyelid_Upper_Up_L_NOREP', 0, 1)),
+    (movement_range_values, ('eyelid_up_ctrl_L', 'EYELID_DOWN_LIMIT_L', 'Eyelid_Upper_Down_L_NOREP', 0, -1)),
+    # Eyelid Up R
+    (movement_range_values, ('eyelid_up_ctrl_R', 'EYELID_UP_LIMIT_R', 'Eyelid_Upper_Up_R_NOREP', 0, 1)),
+    (movement_range_values, ('eyelid_up_ctrl_R', 'EYELID_DOWN_LIMIT_R', 'Eyelid_Upper_Down_R_NOREP', 0, -1)),
+    # Eyelid Low L
+    (movement_range_values, ('eyelid_low_ctrl_L', 'EYELID_UP_LIMIT_L', 'Eyelid_Lower_Up_L_NOREP', 0, 1)),
+    (movement_range_values, ('eyelid_low_ctrl_L', 'EYELID_DOWN_LIMIT_L', 'Eyelid_Lower_Down_L_NOREP', 0, -1)),
+    # Eyelid Low R
+    (movement_range_values, ('eyelid_low_ctrl_R', 'EYELID_UP_LIMIT_R', 'Eyelid_Lower_Up_R_NOREP', 0, 1)),
+    (movement_range_values, ('eyelid_low_ctrl_R', 'EYELID_DOWN_LIMIT_R', 'Eyelid_Lower_Down_R_NOREP', 0, -1)),
+    # Eyelid Sides L
+    (movement_range_values, ('eyelid_up_ctrl_L', 'EYELID_OUT_LIMIT_L', 'Eyelid_Out_L_NOREP', 0, 1)),
+    (movement_range_values, ('eyelid_up_ctrl_L', 'EYELID_IN_LIMIT_L', 'Eyelid_In_L_NOREP', 0, -1)),
+    # Eyelid Sides R
+    (movement_range_values, ('eyelid_up_ctrl_R', 'EYELID_OUT_LIMIT_R', 'Eyelid_Out_R_NOREP', 0, -1)),
+    (movement_range_values, ('eyelid_up_ctrl_R', 'EYELID_IN_LIMIT_R', 'Eyelid_In_R_NOREP', 0, 1)),
+)
+
+
 def set_eyelids(context):
 
     if not context.screen and context.screen.is_animation_playing == True and not context.active_object:
@@ -1777,33 +1683,26 @@ def set_eyelids(context):
         for prop in context.active_object.data.items():
             if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
 
-                # Eyelid Up L
-                Set_Movement_Ranges_Actions('eyelid_up_ctrl_L', 'EYELID_UP_LIMIT_L', 'Eyelid_Upper_Up_L_NOREP', 0, 1)
-                Set_Movement_Ranges_Actions('eyelid_up_ctrl_L', 'EYELID_DOWN_LIMIT_L',
-                                            'Eyelid_Upper_Down_L_NOREP', 0, -1)
-                # Eyelid Up R
-                Set_Movement_Ranges_Actions('eyelid_up_ctrl_R', 'EYELID_UP_LIMIT_R', 'Eyelid_Upper_Up_R_NOREP', 0, 1)
-                Set_Movement_Ranges_Actions('eyelid_up_ctrl_R', 'EYELID_DOWN_LIMIT_R',
-                                            'Eyelid_Upper_Down_R_NOREP', 0, -1)
-                # Eyelid Low L
-                Set_Movement_Ranges_Actions('eyelid_low_ctrl_L', 'EYELID_UP_LIMIT_L', 'Eyelid_Lower_Up_L_NOREP', 0, 1)
-                Set_Movement_Ranges_Actions('eyelid_low_ctrl_L', 'EYELID_DOWN_LIMIT_L',
-                                            'Eyelid_Lower_Down_L_NOREP', 0, -1)
-                # Eyelid Low R
-                Set_Movement_Ranges_Actions('eyelid_low_ctrl_R', 'EYELID_UP_LIMIT_R', 'Eyelid_Lower_Up_R_NOREP', 0, 1)
-                Set_Movement_Ranges_Actions('eyelid_low_ctrl_R', 'EYELID_DOWN_LIMIT_R',
-                                            'Eyelid_Lower_Down_R_NOREP', 0, -1)
-                # Eyelid Sides L
-                Set_Movement_Ranges_Actions('eyelid_up_ctrl_L', 'EYELID_OUT_LIMIT_L', 'Eyelid_Out_L_NOREP', 0, 1)
-                Set_Movement_Ranges_Actions('eyelid_up_ctrl_L', 'EYELID_IN_LIMIT_L', 'Eyelid_In_L_NOREP', 0, -1)
-                # Eyelid Sides R
-                Set_Movement_Ranges_Actions('eyelid_up_ctrl_R', 'EYELID_OUT_LIMIT_R', 'Eyelid_Out_R_NOREP', 0, -1)
-                Set_Movement_Ranges_Actions('eyelid_up_ctrl_R', 'EYELID_IN_LIMIT_R', 'Eyelid_In_R_NOREP', 0, 1)
+                RigSettingsPass(settings_armature()).apply(EYELIDS_SETTINGS)
                 return {"FINISHED"}
 
 # FROWNS
 
 
+FROWNS_SETTINGS = (
+    # Nose Frown L
+    (movement_range_values, ('nose_frown_ctrl_L', 'FROWN_LIMIT_L', 'Nose_Frown_L_NOREP', -1, 1)),
+    # Mouth Frown L
+    (movement_range_values, ('mouth_frown_ctrl_L', 'FROWN_LIMIT_L', 'Mouth_Frown_L_NOREP', 0, -1)),
+    # Nose Frown R
+    (movement_range_values, ('nose_frown_ctrl_R', 'FROWN_LIMIT_R', 'Nose_Frown_R_NOREP', -1, 1)),
+    # Mouth Frown R
+    (movement_range_values, ('mouth_frown_ctrl_R', 'FROWN_LIMIT_R', 'Mouth_Frown_R_NOREP', 0, -1)),
+    # Chin Frown
+    (movement_range_values, ('chin_frown_ctrl', 'FROWN_LIMIT', 'Chin_Frown_NOREP', -1, 1)),
+)
+
+
 def set_frowns(context):
 
     if not context.screen and context.screen.is_animation_playing == True and not context.active_object:
@@ -1813,21 +1712,22 @@ def set_frowns(context):
         for prop in context.active_object.data.items():
             if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
 
-                # Nose Frown L
-                Set_Movement_Ranges_Actions('nose_frown_ctrl_L', 'FROWN_LIMIT_L', 'Nose_Frown_L_NOREP', -1, 1)
-                # Mouth Frown L
-                Set_Movement_Ranges_Actions('mouth_frown_ctrl_L', 'FROWN_LIMIT_L', 'Mouth_Frown_L_NOREP', 0, -1)
-                # Nose Frown R
-                Set_Movement_Ranges_Actions('nose_frown_ctrl_R', 'FROWN_LIMIT_R', 'Nose_Frown_R_NOREP', -1, 1)
-                # Mouth Frown R
-                Set_Movement_Ranges_Actions('mouth_frown_ctrl_R', 'FROWN_LIMIT_R', 'Mouth_Frown_R_NOREP', 0, -1)
-                # Chin Frown
-                Set_Movement_Ranges_Actions('chin_frown_ctrl', 'FROWN_LIMIT', 'Chin_Frown_NOREP', -1, 1)
+                RigSettingsPass(settings_armature()).apply(FROWNS_SETTINGS)
                 return {"FINISHED"}
 
 # CHEEKS
 
 
+CHEEKS_SETTINGS = (
+    # Cheeks L
+    (movement_range_values, ('cheek_ctrl_L', 'CHEEK_UP_LIMIT_L', 'Cheek_Up_L_NOREP', 0, 1)),
+    (movement_range_values, ('cheek_ctrl_L', 'CHEEK_DOWN_LIMIT_L', 'Cheek_Down_L_NOREP', 0, -1)),
+    # Cheeks R
+    (movement_range_values, ('cheek_ctrl_R', 'CHEEK_UP_LIMIT_R', 'Cheek_Up_R_NOREP', 0, 1)),
+    (movement_range_values, ('cheek_ctrl_R', 'CHEEK_DOWN_LIMIT_R', 'Cheek_Down_R_NOREP', 0, -1)),
+)
+
+
 def set_cheeks(context):
 
     if not context.screen and context.screen.is_animation_playing == True and not context.active_object:
@@ -1837,17 +1737,37 @@ def set_cheeks(context):
         for prop in context.active_object.data.items():
             if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
 
-                # Cheeks L
-                Set_Movement_Ranges_Actions('cheek_ctrl_L', 'CHEEK_UP_LIMIT_L', 'Cheek_Up_L_NOREP', 0, 1)
-                Set_Movement_Ranges_Actions('cheek_ctrl_L', 'CHEEK_DOWN_LIMIT_L', 'Cheek_Down_L_NOREP', 0, -1)
-                # Cheeks R
-                Set_Movement_Ranges_Actions('cheek_ctrl_R', 'CHEEK_UP_LIMIT_R', 'Cheek_Up_R_NOREP', 0, 1)
-                Set_Movement_Ranges_Actions('cheek_ctrl_R', 'CHEEK_DOWN_LIMIT_R', 'Cheek_Down_R_NOREP', 0, -1)
+                RigSettingsPass(settings_armature()).apply(CHEEKS_SETTINGS)
                 return {"FINISHED"}
 
 # MOUTH CORNERS
 
 
+MOUTH_CORNERS_SETTINGS = (
+    # Mouth Corner L
+    (movement_range_values, ('mouth_corner_L', 'IN_LIMIT_L', 'Mouth_Corner_In_L_NOREP', 0, 1)),
+    (movement_range_values, ('mouth_corner_L', 'IN_LIMIT_L', 'U_Up_Narrow_Corrective_L_NOREP', 0, 1)),
+    (movement_range_values, ('mouth_corner_L', 'OUT_LIMIT_L', 'Mouth_Corner_Out_L_NOREP', 0, -1)),
+    (movement_range_values, ('mouth_corner_L', 'UP_LIMIT_L', 'Mouth_Corner_Up_L_NOREP', 0, 1)),
+    (movement_range_values, ('mouth_corner_L', 'UP_LIMIT_L', 'Mouth_Corner_Up_Out_Corrective_L_NOREP', 0, 1)),
+    (movement_range_values, ('mouth_corner_L', 'DOWN_LIMIT_L', 'Mouth_Corner_Down_L_NOREP', 0, -1)),
+    (movement_range_values, ('mouth_corner_L', 'DOWN_LIMIT_L', 'Mouth_Corner_Down_Out_Corrective_L_NOREP', 0, -1)),
+    (movement_range_values, ('mouth_corner_L', 'FORW_LIMIT_L', 'Mouth_Corner_Forw_L_NOREP', 0, 1)),
+    (movement_range_values, ('mouth_corner_L', 'BACK_LIMIT_L', 'Mouth_Corner_Back_L_NOREP', 0, -1)),
+    # Mouth Corner R
+    (movement_range_values, ('mouth_corner_R', 'IN_LIMIT_R', 'Mouth_Corner_In_R_NOREP', 0, -1)),
+    (movement_range_values, ('mouth_corner_R', 'IN_LIMIT_R', 'U_Up_Narrow_Corrective_R_NOREP', 0, -1)),
+    (movement_range_values, ('mouth_corner_R', 'OUT_LIMIT_R', 'Mouth_Corner_Out_R_NOREP', 0, 1)),
+    (movement_range_values, ('mouth_corner_R', 'OUT_LIMIT_R', 'Mouth_Corner_Up_Out_Corrective_R_NOREP', 0, 1)),
+    (movement_range_values, ('mouth_corner_R', 'UP_LIMIT_R', 'Mouth_Corner_Up_R_NOREP', 0, 1)),
+    (movement_range_values, ('mouth_corner_R', 'UP_LIMIT_R', 'Mouth_Corner_Up_Out_Corrective_R_NOREP', 0, 1)),
+    (movement_range_values, ('mouth_corner_R', 'DOWN_LIMIT_R', 'Mouth_Corner_Down_R_NOREP', 0, -1)),
+    (movement_range_values, ('mouth_corner_R', 'DOWN_LIMIT_R', 'Mouth_Corner_Down_Out_Corrective_R_NOREP', 0, -1)),
+    (movement_range_values, ('mouth_corner_R', 'FORW_LIMIT_R', 'Mouth_Corner_Forw_R_NOREP', 0, 1)),
+    (movement_range_values, ('mouth_corner_R', 'BACK_LIMIT_R', 'Mouth_Corner_Back_R_NOREP', 0, -1)),
+)
+
+
 def set_mouth_corners(context):
 
     if not context.screen and context.screen.is_animation_playing == True and not context.active_object:
@@ -1857,37 +1777,26 @@ def set_mouth_corners(context):
         for prop in context.active_object.data.items():
             if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
 
-                # Mouth Corner L
-                Set_Movement_Ranges_Actions('mouth_corner_L', 'IN_LIMIT_L', 'Mouth_Corner_In_L_NOREP', 0, 1)
-                Set_Movement_Ranges_Actions('mouth_corner_L', 'IN_LIMIT_L', 'U_Up_Narrow_Corrective_L_NOREP', 0, 1)
-                Set_Movement_Ranges_Actions('mouth_corner_L', 'OUT_LIMIT_L', 'Mouth_Corner_Out_L_NOREP', 0, -1)
-                Set_Movement_Ranges_Actions('mouth_corner_L', 'UP_LIMIT_L', 'Mouth_Corner_Up_L_NOREP', 0, 1)
-                Set_Movement_Ranges_Actions('mouth_corner_L', 'UP_LIMIT_L',
-                                            'Mouth_Corner_Up_Out_Corrective_L_NOREP', 0, 1)
-                Set_Movement_Ranges_Actions('mouth_corner_L', 'DOWN_LIMIT_L', 'Mouth_Corner_Down_L_NOREP', 0, -1)
-                Set_Movement_Ranges_Actions('mouth_corner_L', 'DOWN_LIMIT_L',
-                                            'Mouth_Corner_Down_Out_Corrective_L_NOREP', 0, -1)
-                Set_Movement_Ranges_Actions('mouth_corner_L', 'FORW_LIMIT_L', 'Mouth_Corner_Forw_L_NOREP', 0, 1)
-                Set_Movement_Ranges_Actions('mouth_corner_L', 'BACK_LIMIT_L', 'Mouth_Corner_Back_L_NOREP', 0, -1)
-                # Mouth Corner R
-                Set_Movement_Ranges_Actions('mouth_corner_R', 'IN_LIMIT_R', 'Mouth_Corner_In_R_NOREP', 0, -1)
-                Set_Movement_Ranges_Actions('mouth_corner_R', 'IN_LIMIT_R', 'U_Up_Narrow_Corrective_R_NOREP', 0, -1)
-                Set_Movement_Ranges_Actions('mouth_corner_R', 'OUT_LIMIT_R', 'Mouth_Corner_Out_R_NOREP', 0, 1)
-                Set_Movement_Ranges_Actions('mouth_corner_R', 'OUT_LIMIT_R',
-                                            'Mouth_Corner_Up_Out_Corrective_R_NOREP', 0, 1)
-                Set_Movement_Ranges_Actions('mouth_corner_R', 'UP_LIMIT_R', 'Mouth_Corner_Up_R_NOREP', 0, 1)
-                Set_Movement_Ranges_Actions('mouth_corner_R', 'UP_LIMIT_R',
-                                            'Mouth_Corner_Up_Out_Corrective_R_NOREP', 0, 1)
-                Set_Movement_Ranges_Actions('mouth_corner_R', 'DOWN_LIMIT_R', 'Mouth_Corner_Down_R_NOREP', 0, -1)
-                Set_Movement_Ranges_Actions('mouth_corner_R', 'DOWN_LIMIT_R',
-                                            'Mouth_Corner_Down_Out_Corrective_R_NOREP', 0, -1)
-                Set_Movement_Ranges_Actions('mouth_corner_R', 'FORW_LIMIT_R', 'Mouth_Corner_Forw_R_NOREP', 0, 1)
-                Set_Movement_Ranges_Actions('mouth_corner_R', 'BACK_LIMIT_R', 'Mouth_Corner_Back_R_NOREP', 0, -1)
+                RigSettingsPass(settings_armature()).apply(MOUTH_CORNERS_SETTINGS)
                 return {"FINISHED"}
 
 # MOUTH CTRL
 
 
+MOUTH_CTRL_SETTINGS = (
+    # Mouth Ctrl
+    # Set_Movement_Ranges_Actions('mouth_ctrl', 'IN_LIMIT', 'Mouth_Corner_In_L_NOREP', 0, 1)
+    # Set_Movement_Ranges_Actions('mouth_ctrl', 'OUT_LIMIT', 'Mouth_Corner_Out_L_NOREP', 0, -1)
+    # Set_Movement_Ranges_Actions('mouth_ctrl', 'SMILE_LIMIT', 'Mouth_Corner_Up_L_NOREP', 0, 1)
+    # Set_Movement_Ranges_Actions('mouth_ctrl', 'JAW_ROTATION', 'Mouth_Corner_Down_L_NOREP', 0, -1)
+    (movement_range_values, ('mouth_ctrl', 'U_M_CTRL_LIMIT', 'U_O_M_Up_NOREP', -1, 1)),
+    (movement_range_values, ('mouth_ctrl', 'U_M_CTRL_LIMIT', 'U_O_M_Low_NOREP', -1, 1)),
+    # Jaw
+    (movement_range_values, ('maxi', 'JAW_DOWN_LIMIT', 'Maxi_Down_NOREP', 0, -1)),
+    (movement_range_values, ('maxi', 'JAW_UP_LIMIT', 'Maxi_Up_NOREP', 0, 1)),
+)
+
+
 def set_mouth_ctrl(context):
 
     if not context.screen and context.screen.is_animation_playing == True and not context.active_object:
@@ -1897,21 +1806,60 @@ def set_mouth_ctrl(context):
         for prop in context.active_object.data.items():
             if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
 
-                # Mouth Ctrl
-                # Set_Movement_Ranges_Actions('mouth_ctrl', 'IN_LIMIT', 'Mouth_Corner_In_L_NOREP', 0, 1)
-                # Set_Movement_Ranges_Actions('mouth_ctrl', 'OUT_LIMIT', 'Mouth_Corner_Out_L_NOREP', 0, -1)
-                # Set_Movement_Ranges_Actions('mouth_ctrl', 'SMILE_LIMIT', 'Mouth_Corner_Up_L_NOREP', 0, 1)
-                # Set_Movement_Ranges_Actions('mouth_ctrl', 'JAW_ROTATION', 'Mouth_Corner_Down_L_NOREP', 0, -1)
-                Set_Movement_Ranges_Actions('mouth_ctrl', 'U_M_CTRL_LIMIT', 'U_O_M_Up_NOREP', -1, 1)
-                Set_Movement_Ranges_Actions('mouth_ctrl', 'U_M_CTRL_LIMIT', 'U_O_M_Low_NOREP', -1, 1)
-                # Jaw
-                Set_Movement_Ranges_Actions('maxi', 'JAW_DOWN_LIMIT', 'Maxi_Down_NOREP', 0, -1)
-                Set_Movement_Ranges_Actions('maxi', 'JAW_UP_LIMIT', 'Maxi_Up_NOREP', 0, 1)
+                RigSettingsPass(settings_armature()).apply(MOUTH_CTRL_SETTINGS)
                 return {"FINISHED"}
 
 ### REALISTIC JOINTS CONSTRAINTS ####
 
 
+RJ_TRANSFORMS_SETTINGS = (
+    # Arms L
+    (rj_limb_values, ('properties_arm_L', 'realistic_joints_elbow_loc_L', 'Elbow_RJ_Loc_L_NOREP', 0, 1, 0, 0)),
+    (rj_limb_values, ('properties_arm_L', 'realistic_joints_elbow_rot_L', 'Elbow_RJ_Rot_L_NOREP', 0, 0, -1, 0)),
+    (rj_limb_values, ('properties_arm_L', 'realistic_joints_wrist_rot_L', 'Wrist_RJ_Rot_L_NOREP', 0, 0, -1, 1)),
+    # Arms R
+    (rj_limb_values, ('properties_arm_R', 'realistic_joints_elbow_loc_R', 'Elbow_RJ_Loc_R_NOREP', 0, 1, 0, 0)),
+    (rj_limb_values, ('properties_arm_R', 'realistic_joints_elbow_rot_R', 'Elbow_RJ_Rot_R_NOREP', 0, 0, -1, 0)),
+    (rj_limb_values, ('properties_arm_R', 'realistic_joints_wrist_rot_R', 'Wrist_RJ_Rot_R_NOREP', 0, 0, 1, -1)),
+    # Legs L
+    (rj_limb_values, ('properties_leg_L', 'realistic_joints_knee_loc_L', 'Knee_RJ_Loc_L_NOREP', 0, 1, 0, 0)),
+    (rj_limb_values, ('properties_leg_L', 'realistic_joints_knee_rot_L', 'Knee_RJ_Rot_L_NOREP', 0, 0, -1, 0)),
+    (rj_limb_values, ('properties_leg_L', 'realistic_joints_ankle_rot_L', 'Ankle_RJ_Rot_L_NOREP', 0, 0, -1, -1)),
+    # Legs R
+    (rj_limb_values, ('properties_leg_R', 'realistic_joints_knee_loc_R', 'Knee_RJ_Loc_R_NOREP', 0, 1, 0, 0)),
+    (rj_limb_values, ('properties_leg_R', 'realistic_joints_knee_rot_R', 'Knee_RJ_Rot_R_NOREP', 0, 0, -1, 0)),
+    (rj_limb_values, ('properties_leg_R', 'realistic_joints_ankle_rot_R', 'Ankle_RJ_Rot_R_NOREP', 0, 0, -1, -1)),
+    # Fingers L
+    (rj_fing_toes_values, ('properties_arm_L', 'realistic_joints_fingers_rot_L', 'Fing_1_RJ_Rot_L_NOREP', 0, -1, 0, 0)),
+    (rj_fing_toes_values, ('properties_arm_L', 'realistic_joints_fingers_rot_L', 'Fing_2_RJ_Rot_L_NOREP', 0, -1, 0, 1)),
+    (rj_fing_toes_values, ('properties_arm_L', 'realistic_joints_fingers_rot_L', 'Fing_3_RJ_Rot_L_NOREP', 0, -1, 0, 2)),
+    (rj_fing_toes_values, ('properties_arm_L', 'realistic_joints_fingers_loc_L', 'Fing_2_RJ_Loc_L_NOREP', 1, 0, 0, 0)),
+    (rj_fing_toes_values, ('properties_arm_L', 'realistic_joints_fingers_loc_L', 'Fing_3_RJ_Loc_L_NOREP', 1, 0, 1, 0)),
+    (rj_fing_toes_values, ('properties_arm_L', 'realistic_joints_fingers_loc_L', 'Fing_4_RJ_Loc_L_NOREP', 1, 0, 2, 0)),
+    # Fingers R
+    (rj_fing_toes_values, ('properties_arm_R', 'realistic_joints_fingers_rot_R', 'Fing_1_RJ_Rot_R_NOREP', 0, -1, 0, 0)),
+    (rj_fing_toes_values, ('properties_arm_R', 'realistic_joints_fingers_rot_R', 'Fing_2_RJ_Rot_R_NOREP', 0, -1, 0, 1)),
+    (rj_fing_toes_values, ('properties_arm_R', 'realistic_joints_fingers_rot_R', 'Fing_3_RJ_Rot_R_NOREP', 0, -1, 0, 2)),
+    (rj_fing_toes_values, ('properties_arm_R', 'realistic_joints_fingers_loc_R', 'Fing_2_RJ_Loc_R_NOREP', 1, 0, 0, 0)),
+    (rj_fing_toes_values, ('properties_arm_R', 'realistic_joints_fingers_loc_R', 'Fing_3_RJ_Loc_R_NOREP', 1, 0, 1, 0)),
+    (rj_fing_toes_values, ('properties_arm_R', 'realistic_joints_fingers_loc_R', 'Fing_4_RJ_Loc_R_NOREP', 1, 0, 2, 0)),
+    # Toes L
+    (rj_fing_toes_values, ('properties_leg_L', 'realistic_joints_toes_rot_L', 'Toes_1_RJ_Rot_L_NOREP', 0, -1, 0, 0)),
+    (rj_fing_toes_values, ('properties_leg_L', 'realistic_joints_toes_rot_L', 'Toes_2_RJ_Rot_L_NOREP', 0, -1, 0, 1)),
+    (rj_fing_toes_values, ('properties_leg_L', 'realistic_joints_toes_rot_L', 'Toes_3_RJ_Rot_L_NOREP', 0, -1, 0, 2)),
+    (rj_fing_toes_values, ('properties_leg_L', 'realistic_joints_toes_loc_L', 'Toes_2_RJ_Loc_L_NOREP', 1, 0, 0, 0)),
+    (rj_fing_toes_values, ('properties_leg_L', 'realistic_joints_toes_loc_L', 'Toes_3_RJ_Loc_L_NOREP', 1, 0, 1, 0)),
+    (rj_fing_toes_values, ('properties_leg_L', 'realistic_joints_toes_loc_L', 'Toes_4_RJ_Loc_L_NOREP', 1, 0, 2, 0)),
+    # Toes R
+    (rj_fing_toes_values, ('properties_leg_R', 'realistic_joints_toes_rot_R', 'Toes_1_RJ_Rot_R_NOREP', 0, -1, 0, 0)),
+    (rj_fing_toes_values, ('properties_leg_R', 'realistic_joints_toes_rot_R', 'Toes_2_RJ_Rot_R_NOREP', 0, -1, 0, 1)),
+    (rj_fing_toes_values, ('properties_leg_R', 'realistic_joints_toes_rot_R', 'Toes_3_RJ_Rot_R_NOREP', 0, -1, 0, 2)),
+    (rj_fing_toes_values, ('properties_leg_R', 'realistic_joints_toes_loc_R', 'Toes_2_RJ_Loc_R_NOREP', 1, 0, 0, 0)),
+    (rj_fing_toes_values, ('properties_leg_R', 'realistic_joints_toes_loc_R', 'Toes_3_RJ_Loc_R_NOREP', 1, 0, 1, 0)),
+    (rj_fing_toes_values, ('properties_leg_R', 'realistic_joints_toes_loc_R', 'Toes_4_RJ_Loc_R_NOREP', 1, 0, 2, 0)),
+)
+
+
 def set_rj_transforms(context):
 
     if not context.screen and context.screen.is_animation_playing == True and not context.active_object:
@@ -1921,65 +1869,32 @@ def set_rj_transforms(context):
     #     for prop in context.active_object.data.items():
     #         if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
 
+    RigSettingsPass(settings_armature()).apply(RJ_TRANSFORMS_SETTINGS)
+    return {"FINISHED"}
+
+### VOLUME VARIATION CONSTRAINTS ####
+
+
+VOL_VARIATION_SETTINGS = (
     # Arms L
-    Set_RJ_Transforms_Limbs('properties_arm_L', 'realistic_joints_elbow_loc_L', 'Elbow_RJ_Loc_L_NOREP', 0, 1, 0, 0)
-    Set_RJ_Transforms_Limbs('properties_arm_L', 'realistic_joints_elbow_rot_L', 'Elbow_RJ_Rot_L_NOREP', 0, 0, -1, 0)
-    Set_RJ_Transforms_Limbs('properties_arm_L', 'realistic_joints_wrist_rot_L', 'Wrist_RJ_Rot_L_NOREP', 0, 0, -1, 1)
+    (vol_variation_values, ('properties_arm_L', 'volume_variation_arm_L', 'Vol_Var_Arm_L_Stretch_To')),
+    (vol_variation_values, ('properties_arm_L', 'volume_variation_fingers_L', 'Vol_Var_Hand_L_Stretch_To')),
     # Arms R
-    Set_RJ_Transforms_Limbs('properties_arm_R', 'realistic_joints_elbow_loc_R', 'Elbow_RJ_Loc_R_NOREP', 0, 1, 0, 0)
-    Set_RJ_Transforms_Limbs('properties_arm_R', 'realistic_joints_elbow_rot_R', 'Elbow_RJ_Rot_R_NOREP', 0, 0, -1, 0)
-    Set_RJ_Transforms_Limbs('properties_arm_R', 'realistic_joints_wrist_rot_R', 'Wrist_RJ_Rot_R_NOREP', 0, 0, 1, -1)
+    (vol_variation_values, ('properties_arm_R', 'volume_variation_arm_R', 'Vol_Var_Arm_R_Stretch_To')),
+    (vol_variation_values, ('properties_arm_R', 'volume_variation_fingers_R', 'Vol_Var_Hand_R_Stretch_To')),
     # Legs L
-    Set_RJ_Transforms_Limbs('properties_leg_L', 'realistic_joints_knee_loc_L', 'Knee_RJ_Loc_L_NOREP', 0, 1, 0, 0)
-    Set_RJ_Transforms_Limbs('properties_leg_L', 'realistic_joints_knee_rot_L', 'Knee_RJ_Rot_L_NOREP', 0, 0, -1, 0)
-    Set_RJ_Transforms_Limbs('properties_leg_L', 'realistic_joints_ankle_rot_L', 'Ankle_RJ_Rot_L_NOREP', 0, 0, -1, -1)
+    (vol_variation_values, ('properties_leg_L', 'volume_variation_leg_L', 'Vol_Var_Leg_L_Stretch_To')),
+    (vol_variation_values, ('properties_leg_L', 'volume_variation_toes_L', 'Vol_Var_Foot_L_Stretch_To')),
     # Legs R
-    Set_RJ_Transforms_Limbs('properties_leg_R', 'realistic_joints_knee_loc_R', 'Knee_RJ_Loc_R_NOREP', 0, 1, 0, 0)
-    Set_RJ_Transforms_Limbs('properties_leg_R', 'realistic_joints_knee_rot_R', 'Knee_RJ_Rot_R_NOREP', 0, 0, -1, 0)
-    Set_RJ_Transforms_Limbs('properties_leg_R', 'realistic_joints_ankle_rot_R', 'Ankle_RJ_Rot_R_NOREP', 0, 0, -1, -1)
-    # Fingers L
-    Set_RJ_Transforms_Fing_Toes('properties_arm_L', 'realistic_joints_fingers_rot_L',
-                                'Fing_1_RJ_Rot_L_NOREP', 0, -1, 0, 0)
-    Set_RJ_Transforms_Fing_Toes('properties_arm_L', 'realistic_joints_fingers_rot_L',
-                                'Fing_2_RJ_Rot_L_NOREP', 0, -1, 0, 1)
-    Set_RJ_Transforms_Fing_Toes('properties_arm_L', 'realistic_joints_fingers_rot_L',
-                                'Fing_3_RJ_Rot_L_NOREP', 0, -1, 0, 2)
-    Set_RJ_Transforms_Fing_Toes('properties_arm_L', 'realistic_joints_fingers_loc_L',
-                                'Fing_2_RJ_Loc_L_NOREP', 1, 0, 0, 0)
-    Set_RJ_Transforms_Fing_Toes('properties_arm_L', 'realistic_joints_fingers_loc_L',
-                                'Fing_3_RJ_Loc_L_NOREP', 1, 0, 1, 0)
-    Set_RJ_Transforms_Fing_Toes('properties_arm_L', 'realistic_joints_fingers_loc_L',
-                                'Fing_4_RJ_Loc_L_NOREP', 1, 0, 2, 0)
-    # Fingers R
-    Set_RJ_Transforms_Fing_Toes('properties_arm_R', 'realistic_joints_fingers_rot_R',
-                                'Fing_1_RJ_Rot_R_NOREP', 0, -1, 0, 0)
-    Set_RJ_Transforms_Fing_Toes('properties_arm_R', 'realistic_joints_fingers_rot_R',
-                                'Fing_2_RJ_Rot_R_NOREP', 0, -1, 0, 1)
-    Set_RJ_Transforms_Fing_Toes('properties_arm_R', 'realistic_joints_fingers_rot_R',
-                                'Fing_3_RJ_Rot_R_NOREP', 0, -1, 0, 2)
-    Set_RJ_Transforms_Fing_Toes('properties_arm_R', 'realistic_joints_fingers_loc_R',
-                                'Fing_2_RJ_Loc_R_NOREP', 1, 0, 0, 0)
-    Set_RJ_Transforms_Fing_Toes('properties_arm_R', 'realistic_joints_fingers_loc_R',
-                                'Fing_3_RJ_Loc_R_NOREP', 1, 0, 1, 0)
-    Set_RJ_Transforms_Fing_Toes('properties_arm_R', 'realistic_joints_fingers_loc_R',
-                                'Fing_4_RJ_Loc_R_NOREP', 1, 0, 2, 0)
-    # Toes L
-    Set_RJ_Transforms_Fing_Toes('properties_leg_L', 'realistic_joints_toes_rot_L', 'Toes_1_RJ_Rot_L_NOREP', 0, -1, 0, 0)
-    Set_RJ_Transforms_Fing_Toes('properties_leg_L', 'realistic_joints_toes_rot_L', 'Toes_2_RJ_Rot_L_NOREP', 0, -1, 0, 1)
-    Set_RJ_Transforms_Fing_Toes('properties_leg_L', 'realistic_joints_toes_rot_L', 'Toes_3_RJ_Rot_L_NOREP', 0, -1, 0, 2)
-    Set_RJ_Transforms_Fing_Toes('properties_leg_L', 'realistic_joints_toes_loc_L', 'Toes_2_RJ_Loc_L_NOREP', 1, 0, 0, 0)
-    Set_RJ_Transforms_Fing_Toes('properties_leg_L', 'realistic_joints_toes_loc_L', 'Toes_3_RJ_Loc_L_NOREP', 1, 0, 1, 0)
-    Set_RJ_Transforms_Fing_Toes('properties_leg_L', 'realistic_joints_toes_loc_L', 'Toes_4_RJ_Loc_L_NOREP', 1, 0, 2, 0)
-    # Toes R
-    Set_RJ_Transforms_Fing_Toes('properties_leg_R', 'realistic_joints_toes_rot_R', 'Toes_1_RJ_Rot_R_NOREP', 0, -1, 0, 0)
-    Set_RJ_Transforms_Fing_Toes('properties_leg_R', 'realistic_joints_toes_rot_R', 'Toes_2_RJ_Rot_R_NOREP', 0, -1, 0, 1)
-    Set_RJ_Transforms_Fing_Toes('properties_leg_R', 'realistic_joints_toes_rot_R', 'Toes_3_RJ_Rot_R_NOREP', 0, -1, 0, 2)
-    Set_RJ_Transforms_Fing_Toes('properties_leg_R', 'realistic_joints_toes_loc_R', 'Toes_2_RJ_Loc_R_NOREP', 1, 0, 0, 0)
-    Set_RJ_Transforms_Fing_Toes('properties_leg_R', 'realistic_joints_toes_loc_R', 'Toes_3_RJ_Loc_R_NOREP', 1, 0, 1, 0)
-    Set_RJ_Transforms_Fing_Toes('properties_leg_R', 'realistic_joints_toes_loc_R', 'Toes_4_RJ_Loc_R_NOREP', 1, 0, 2, 0)
-    return {"FINISHED"}
-
-### VOLUME VARIATION CONSTRAINTS ####
+    (vol_variation_values, ('properties_leg_R', 'volume_variation_leg_R', 'Vol_Var_Leg_R_Stretch_To')),
+    (vol_variation_values, ('properties_leg_R', 'volume_variation_toes_R', 'Vol_Var_Foot_R_Stretch_To')),
+    # Torso
+    (vol_variation_values, ('properties_torso', 'volume_variation_torso', 'Vol_Var_Torso_Stretch_To')),
+    # Neck
+    (vol_variation_values, ('properties_head', 'volume_variation_neck', 'Vol_Var_Neck_Stretch_To')),
+    # Head
+    (vol_variation_values, ('properties_head', 'volume_variation_head', 'Vol_Var_Head_Stretch_To')),
+)
 
 
 def set_vol_variation(context):
@@ -1991,82 +1906,76 @@ def set_vol_variation(context):
         for prop in context.active_object.data.items():
             if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
 
-                # Arms L
-                Set_Volume_Variation_Stretch_To(
-                    'properties_arm_L', 'volume_variation_arm_L', 'Vol_Var_Arm_L_Stretch_To')
-                Set_Volume_Variation_Stretch_To(
-                    'properties_arm_L', 'volume_variation_fingers_L', 'Vol_Var_Hand_L_Stretch_To')
-                # Arms R
-                Set_Volume_Variation_Stretch_To(
-                    'properties_arm_R', 'volume_variation_arm_R', 'Vol_Var_Arm_R_Stretch_To')
-                Set_Volume_Variation_Stretch_To(
-                    'properties_arm_R', 'volume_variation_fingers_R', 'Vol_Var_Hand_R_Stretch_To')
-                # Legs L
-                Set_Volume_Variation_Stretch_To(
-                    'properties_leg_L', 'volume_variation_leg_L', 'Vol_Var_Leg_L_Stretch_To')
-                Set_Volume_Variation_Stretch_To(
-                    'properties_leg_L', 'volume_variation_toes_L', 'Vol_Var_Foot_L_Stretch_To')
-                # Legs R
-                Set_Volume_Variation_Stretch_To(
-                    'properties_leg_R', 'volume_variation_leg_R', 'Vol_Var_Leg_R_Stretch_To')
-                Set_Volume_Variation_Stretch_To(
-                    'properties_leg_R', 'volume_variation_toes_R', 'Vol_Var_Foot_R_Stretch_To')
-                # Torso
-                Set_Volume_Variation_Stretch_To(
-                    'properties_torso', 'volume_variation_torso', 'Vol_Var_Torso_Stretch_To')
-                # Neck
-                Set_Volume_Variation_Stretch_To('properties_head', 'volume_variation_neck', 'Vol_Var_Neck_Stretch_To')
-                # Head
-                Set_Volume_Variation_Stretch_To('properties_head', 'volume_variation_head', 'Vol_Var_Head_Stretch_To')
+                RigSettingsPass(settings_armature()).apply(VOL_VARIATION_SETTINGS)
                 return {"FINISHED"}
 
 ### VOLUME PRESERVATION CONSTRAINTS ####
 
-def set_vol_preservation(context):
-
-    if not context.screen and context.screen.is_animation_playing == True and not context.active_object:
-        return False
-
-    # if context.active_object.type == "ARMATURE" and context.active_object.mode == 'POSE':
-    #     for prop in context.active_object.data.items():
-    #         if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
-
+VOL_PRESERVATION_SETTINGS = (
     # Fingers Down L
-    Set_VP_Transforms('properties_arm_L', 'volume_preservation_fingers_down_L', 'Fing_VP_Down_L_NOREP', 'to_max_y', 1)
+    (vp_values, ('properties_arm_L', 'volume_preservation_fingers_down_L', 'Fing_VP_Down_L_NOREP', 'to_max_y', 1)),
     # Kunckles Down L
-    Set_VP_Transforms('properties_arm_L', 'volume_preservation_knuckles_down_L',
-                      'Fing_Knuckles_VP_Down_L_NOREP', 'to_max_z', -1)
+    (vp_values, ('properties_arm_L', 'volume_preservation_knuckles_down_L', 'Fing_Knuckles_VP_Down_L_NOREP', 'to_max_z', -1)),
     # Kunckles Up L
-    Set_VP_Transforms('properties_arm_L', 'volume_preservation_knuckles_up_L',
-                      'Fing_Knuckles_VP_Up_L_NOREP', 'to_min_y', 1)
+    (vp_values, ('properties_arm_L', 'volume_preservation_knuckles_up_L', 'Fing_Knuckles_VP_Up_L_NOREP', 'to_min_y', 1)),
     # Palm Down L
-    Set_VP_Transforms('properties_arm_L', 'volume_preservation_palm_down_L', 'Fing_Palm_VP_Down_L_NOREP', 'to_max_y', 1)
+    (vp_values, ('properties_arm_L', 'volume_preservation_palm_down_L', 'Fing_Palm_VP_Down_L_NOREP', 'to_max_y', 1)),
     # Fingers Down R
-    Set_VP_Transforms('properties_arm_R', 'volume_preservation_fingers_down_R', 'Fing_VP_Down_R_NOREP', 'to_max_y', 1)
+    (vp_values, ('properties_arm_R', 'volume_preservation_fingers_down_R', 'Fing_VP_Down_R_NOREP', 'to_max_y', 1)),
     # Kunckles Down R
-    Set_VP_Transforms('properties_arm_R', 'volume_preservation_knuckles_down_R',
-                      'Fing_Knuckles_VP_Down_R_NOREP', 'to_max_z', -1)
+    (vp_values, ('properties_arm_R', 'volume_preservation_knuckles_down_R', 'Fing_Knuckles_VP_Down_R_NOREP', 'to_max_z', -1)),
     # Kunckles Up R
-    Set_VP_Transforms('properties_arm_R', 'volume_preservation_knuckles_up_R',
-                      'Fing_Knuckles_VP_Up_R_NOREP', 'to_min_y', 1)
+    (vp_values, ('properties_arm_R', 'volume_preservation_knuckles_up_R', 'Fing_Knuckles_VP_Up_R_NOREP', 'to_min_y', 1)),
     # Palm Down R
-    Set_VP_Transforms('properties_arm_R', 'volume_preservation_palm_down_R', 'Fing_Palm_VP_Down_R_NOREP', 'to_max_y', 1)
+    (vp_values, ('properties_arm_R', 'volume_preservation_palm_down_R', 'Fing_Palm_VP_Down_R_NOREP', 'to_max_y', 1)),
     # Sole Down L
-    Set_VP_Transforms('properties_leg_L', 'volume_preservation_sole_down_L', 'Toe_Sole_VP_Down_L_NOREP', 'to_max_y', 1)
+    (vp_values, ('properties_leg_L', 'volume_preservation_sole_down_L', 'Toe_Sole_VP_Down_L_NOREP', 'to_max_y', 1)),
     # Toe Knuckles Up L
-    Set_VP_Transforms('properties_leg_L', 'volume_preservation_toe_knuckles_up_L',
-                      'Toe_Knuckles_VP_Up_L_NOREP', 'to_min_y', 1)
+    (vp_values, ('properties_leg_L', 'volume_preservation_toe_knuckles_up_L', 'Toe_Knuckles_VP_Up_L_NOREP', 'to_min_y', 1)),
     # Toes Down L
-    Set_VP_Transforms('properties_leg_L', 'volume_preservation_toes_down_L', 'Toes_VP_Down_L_NOREP', 'to_max_y', 1)
+    (vp_values, ('properties_leg_L', 'volume_preservation_toes_down_L', 'Toes_VP_Down_L_NOREP', 'to_max_y', 1)),
     # Sole Down R
-    Set_VP_Transforms('properties_leg_R', 'volume_preservation_sole_down_R', 'Toe_Sole_VP_Down_R_NOREP', 'to_max_y', 1)
+    (vp_values, ('properties_leg_R', 'volume_preservation_sole_down_R', 'Toe_Sole_VP_Down_R_NOREP', 'to_max_y', 1)),
     # Toe Knuckles Up R
-    Set_VP_Transforms('properties_leg_R', 'volume_preservation_toe_knuckles_up_R',
-                      'Toe_Knuckles_VP_Up_R_NOREP', 'to_min_y', 1)
+    (vp_values, ('properties_leg_R', 'volume_preservation_toe_knuckles_up_R', 'Toe_Knuckles_VP_Up_R_NOREP', 'to_min_y', 1)),
     # Toes Down R
-    Set_VP_Transforms('properties_leg_R', 'volume_preservation_toes_down_R', 'Toes_VP_Down_R_NOREP', 'to_max_y', 1)
+    (vp_values, ('properties_leg_R', 'volume_preservation_toes_down_R', 'Toes_VP_Down_R_NOREP', 'to_max_y', 1)),
+)
+
+
+def set_vol_preservation(context):
+
+    if not context.screen and context.screen.is_animation_playing == True and not context.active_object:
+        return False
+
+    # if context.active_object.type == "ARMATURE" and context.active_object.mode == 'POSE':
+    #     for prop in context.active_object.data.items():
+    #         if prop[0] == 'rig_name' and prop[1].__contains__('BlenRig_'):
+
+    RigSettingsPass(settings_armature()).apply(VOL_PRESERVATION_SETTINGS)
     return {"FINISHED"}
 
+### Recompute All Settings
+
+ALL_RIG_SETTINGS = (
+    EYELIDS_SETTINGS,
+    FROWNS_SETTINGS,
+    CHEEKS_SETTINGS,
+    MOUTH_CORNERS_SETTINGS,
+    MOUTH_CTRL_SETTINGS,
+    RJ_TRANSFORMS_SETTINGS,
+    VOL_VARIATION_SETTINGS,
+    VOL_PRESERVATION_SETTINGS,
+)
+
+def recompute_rig_settings(armobj):
+    """Applies every settings table in one pass, returns (changed values, total values, seconds)"""
+    start = perf_counter()
+    settings = RigSettingsPass(armobj)
+    for table in ALL_RIG_SETTINGS:
+        settings.apply(table)
+    return settings.changed, settings.total, perf_counter() - start
+
 ### Get Only Insert Available State
 
 def get_state_only_insert_available(context):
@@ -2078,29 +1987,103 @@ def get_state_only_insert_available(context):
 # by Jerryno #
 ##############
 
-def calculate_pole_angle(upper_bone, lower_bone, pole_bone):
-
-    arm_obj = bpy.context.active_object
-
-    def signed_angle(vector_u, vector_v, normal):
-        # Normal specifies orientation
-        angle = vector_u.angle(vector_v)
-        if vector_u.cross(vector_v).angle(normal) < 1:
-            angle = -angle
-        return angle
-
-    def get_pole_angle(base_bone, ik_bone, pole_location):
-        pole_normal = (ik_bone.tail - base_bone.head).cross(pole_location - base_bone.head)
-        projected_pole_axis = pole_normal.cross(base_bone.tail - base_bone.head)
-        return signed_angle(base_bone.x_axis, projected_pole_axis, base_bone.tail - base_bone.head)
-
-    base_bone = arm_obj.pose.bones[upper_bone]
-    ik_bone = arm_obj.pose.bones[lower_bone]
-    pole_bone = arm_obj.pose.bones[pole_bone]
-
-    pole_angle_in_radians = get_pole_angle(
-        base_bone,
-        ik_bone,
-        pole_bone.matrix.translation)
-
-    return np.rad2deg(pole_angle_in_radians)
+def signed_angle(vector_u, vector_v, normal):
+    # Normal specifies orientation
+    angle = vector_u.angle(vector_v)
+    if vector_u.cross(vector_v).angle(normal) < 1:
+        angle = -angle
+    return angle
+
+def get_pole_angle(base_head, base_tail, base_x_axis, ik_tail, pole_location):
+    pole_normal = (ik_tail - base_head).cross(pole_location - base_head)
+    projected_pole_axis = pole_normal.cross(base_tail - base_head)
+    return signed_angle(base_x_axis, projected_pole_axis, base_tail - base_head)
+
+##########################
+# Rest Pose Values       #
+##########################
+
+# IK Pole Angles: (bone with the IK_NOREP constraint, base bone, pole bone)
+POLE_ANGLES = (
+    ('forearm_ik_L', 'arm_ik_L', 'elbow_pole_L'),
+    ('forearm_ik_R', 'arm_ik_R', 'elbow_pole_R'),
+    ('arm_elbow_pin_L', 'shoulder_mstr_L', 'elbow_pole_L'),
+    ('arm_elbow_pin_R', 'shoulder_mstr_R', 'elbow_pole_R'),
+    ('shin_ik_L', 'thigh_ik_L', 'knee_pole_L'),
+    ('shin_ik_R', 'thigh_ik_R', 'knee_pole_R'),
+)
+
+# Blink Rates: (bone, property, upper eyelid bone, lower eyelid bone)
+BLINK_RATES = (
+    ('blink_ctrl_L', 'Blink_Rate_L', 'eyelid_up_ctrl_L', 'eyelid_low_ctrl_L'),
+    ('blink_ctrl_R', 'Blink_Rate_R', 'eyelid_up_ctrl_R', 'eyelid_low_ctrl_R'),
+)
+
+def update_rest_pose_values(armobj, values=True, poles=True):
+    """Recomputes the values that depend on the rest pose: bone length properties, floor constraint offsets
+       and blink rates (values), and IK pole angles (poles).
+       Heads, tails and lengths are read from the rest bones in one foreach_get each, so there is no need
+       to switch to rest position and refresh. Only values that differ are written, returns how many.
+    """
+    bones = armobj.data.bones
+    pbones = armobj.pose.bones
+    count = len(bones)
+    if not count:
+        return 0
+    index = {name: i for i, name in enumerate(bones.keys())}
+    heads = np.empty(count * 3, dtype=np.float32)
+    tails = np.empty(count * 3, dtype=np.float32)
+    lengths = np.empty(count, dtype=np.float32)
+    bones.foreach_get('head_local', heads)
+    bones.foreach_get('tail_local', tails)
+    bones.foreach_get('length', lengths)
+    heads = heads.reshape(count, 3)
+    tails = tails.reshape(count, 3)
+
+    # (owner, property or attribute, value)
+    props = []
+    attrs = []
+    if values:
+        for b in pbones:
+            i = index[b.name]
+            for key in ('b_length_L', 'b_length_R', 'b_length'):
+                if key in b:
+                    props.append((b, key, float(lengths[i])))
+            for C in b.constraints:
+                if C.type != 'FLOOR':
+                    continue
+                if 'Floor_Lips' in C.name and C.subtarget in index:
+                    attrs.append((C, 'offset', abs(float(heads[i][2] - heads[index[C.subtarget]][2]) * 0.9)))
+                if 'Floor_Foot' in C.name and b.custom_shape_transform:
+                    attrs.append((C, 'offset', abs(float(heads[i][2] - heads[index[b.custom_shape_transform.name]][2]))))
+        for b_name, prop_name, up_name, low_name in BLINK_RATES:
+            if b_name in index and up_name in index and low_name in index:
+                props.append((pbones[b_name], prop_name, abs(float(heads[index[up_name]][2] - heads[index[low_name]][2]))))
+
+    if poles:
+        for ik_name, base_name, pole_name in POLE_ANGLES:
+            if ik_name not in index or base_name not in index or pole_name not in index:
+                continue
+            C = pbones[ik_name].constraints.get('IK_NOREP')
+            if C is None:
+                continue
+            base = index[base_name]
+            angle = get_pole_angle(
+                Vector(heads[base]),
+                Vector(tails[base]),
+                bones[base].matrix_local.col[0].xyz,
+                Vector(tails[index[ik_name]]),
+                Vector(heads[index[pole_name]]))
+            attrs.append((C, 'pole_angle', angle))
+
+    changed = 0
+    for owner, key, value in props:
+        current = owner.get(key)
+        if not isinstance(current, (int, float)) or abs(current - value) > 1e-6:
+            owner[key] = value
+            changed += 1
+    for owner, attr, value in attrs:
+        if abs(getattr(owner, attr) - value) > 1e-6:
+            setattr(owner, attr, value)
+            changed += 1
+    return changed
@@ -1,98 +1,35 @@
 import bpy
 
-armature=[]
-mesh_deform=[]
-surface_deform=[]
-armature_name=[]
-mesh_deform_name=[]
-surface_deform_name=[]
-lattices=[]
-boneshapes=[]
+from .deformer_graph import get_deformer_graph
 
 
 ###### Search name of MDef_cage  #####
 def mdef_search(type):
-    mdef_cage_objects = []
-    mdef_cage_names = []
-    sdef_cage_objects = []
-    sdef_cage_names = []
+    """Mesh Deform cages or Surface Deform targets deformed by the active armature, as (objects, names)"""
     arm = bpy.context.active_object.name
-    for ob in bpy.data.objects:
-        if hasattr(ob,'modifiers'):
-            for ob_m in ob.modifiers:
-                if type == 'MESH_DEFORM':
-                    if ob_m.type == type:
-                        if hasattr(ob.modifiers[ob_m.name], 'object') and hasattr(ob.modifiers[ob_m.name].object, 'name'):
-                            cage = ob.modifiers[ob_m.name].object
-                            if hasattr(cage, 'modifiers'):
-                                for mod in cage.modifiers:
-                                    if mod.type == 'ARMATURE':
-                                        if mod.object.name == arm:
-                                            if bpy.data.objects.get(ob.modifiers[ob_m.name].object.name) not in mdef_cage_objects:
-                                                mdef_cage_objects.append(bpy.data.objects.get(ob.modifiers[ob_m.name].object.name))
-                                                mdef_cage_names.append(ob.modifiers[ob_m.name].object.name)
-    return mdef_cage_objects , mdef_cage_names
-    for ob in bpy.data.objects:
-        if hasattr(ob,'modifiers'):
-            for ob_m in ob.modifiers:
-                if type == 'SURFACE_DEFORM':
-                    if ob_m.type == type:
-                        if hasattr(ob.modifiers[ob_m.name], 'target') and hasattr(ob.modifiers[ob_m.name].target, 'name'):
-                            cage = ob.modifiers[ob_m.name].target
-                            if hasattr(cage, 'modifiers'):
-                                for mod in cage.modifiers:
-                                    if mod.type == 'ARMATURE':
-                                        if mod.object.name == arm:
-                                            if bpy.data.objects.get(ob.modifiers[ob_m.name].target.name) not in sdef_cage_objects:
-                                                sdef_cage_objects.append(bpy.data.objects.get(ob.modifiers[ob_m.name].target.name))
-                                                sdef_cage_objects.append(ob.modifiers[ob_m.name].target.name)
-    return sdef_cage_objects , sdef_cage_names
+    graph = get_deformer_graph()
+    if type == 'MESH_DEFORM':
+        cages = graph.mdef_cages(arm)
+    elif type == 'SURFACE_DEFORM':
+        cages = graph.sdef_cages(arm)
+    else:
+        cages = []
+    return cages, [ob.name for ob in cages]
 
 ###### Search objets with modifiers  #####
 def search_mod(type):
+    """Objects deformed by the active armature through a modifier type, as (objects, names)"""
     arm = bpy.context.active_object.name
-
-#Clean Variables
-    mdef_cage_name =[]
-    sdef_cage_name = []
-    surface_deform = []
-    mesh_deform = []
-    armature = []
-    surface_deform_name = []
-    mesh_deform_name = []
-    armature_name = []
-
-    mdef_cage_name = mdef_search('MESH_DEFORM')
-    sdef_cage_name = mdef_search('SURFACE_DEFORM')
-    for ob in bpy.data.objects:
-        if hasattr(ob,'modifiers'):
-            for ob_m in ob.modifiers:
-                if ob_m.type == type:
-
-                    if hasattr(ob.modifiers[ob_m.name], 'object') and hasattr(ob.modifiers[ob_m.name].object, 'name'):
-                        if ob.modifiers[ob_m.name].object in mdef_cage_name[0]:
-                            if ob not in mesh_deform:
-                                mesh_deform.append(ob)
-                                mesh_deform_name.append(ob.name)
-
-                    if hasattr(ob.modifiers[ob_m.name], 'object') and hasattr(ob.modifiers[ob_m.name].object, 'name'):
-                        if ob.modifiers[ob_m.name].object.name == arm:
-                            if ob not in armature:
-                                armature.append(ob)
-                                armature_name.append(ob.name)
-
-                    if hasattr(ob.modifiers[ob_m.name],'target') and hasattr(ob.modifiers[ob_m.name].target, 'name'):
-                        if ob.modifiers[ob_m.name].target in sdef_cage_name[0]:
-                            if ob not in surface_deform:
-                                surface_deform.append(ob)
-                                surface_deform_name.append(ob.name)
-
+    graph = get_deformer_graph()
     if type == "ARMATURE":
-        return armature, armature_name
-    if type == "MESH_DEFORM":
-        return mesh_deform, mesh_deform_name
-    if type =="SURFACE_DEFORM":
-        return surface_deform, surface_deform_name
+        objects = graph.armature_deformed(arm)
+    elif type == "MESH_DEFORM":
+        objects = graph.mdef_bound_objects(arm)
+    elif type =="SURFACE_DEFORM":
+        objects = graph.sdef_bound_objects(arm)
+    else:
+        return None
+    return objects, [ob.name for ob in objects]
 
 ###########  Toggle link/unlink objets with modifiers in BlenRig_temp #######
 def blenrig_temp(type,lnk = True):
@@ -143,20 +80,11 @@ def unlink_objects(objects):
 ####### Search objets parent with  biped_blenrig (lattices) ######
 def search_parent():
     arm = bpy.context.active_object.name
-    for ob in bpy.data.objects:
-        if hasattr(ob,'parent') and hasattr(ob.parent, 'name'):
-            if not ob.name.startswith('cs_') and ob.parent.name == arm:
-                lattices.append(ob)
-    return lattices
+    return [ob for ob in get_deformer_graph().child_objects(arm) if not ob.name.startswith('cs_')]
 
 ####### Search BoneShapes #####
 def search_boneshapes():
-    arm = bpy.context.active_object.name
-    for ob in bpy.data.objects:
-        if hasattr(ob,'parent'):
-            if ob.name.startswith('cs_'):
-                boneshapes.append(ob)
-    return boneshapes
+    return get_deformer_graph().boneshape_objects()
 
 ###########  Toggle linking objets BoneShapes in BlenRig_temp #######
 def blenrig_temp_boneshapes(lnk = True):
@@ -0,0 +1,180 @@
+import bpy
+import numpy as np
+from time import perf_counter
+from .mesh_bake import get_coords, set_coords
+
+##################################### Shape Key Math #######################################
+
+def shape_coords(key_block):
+    """(n, 3) float32 array with the coordinates of a shape key"""
+    return get_coords(key_block.data).reshape(-1, 3)
+
+def copy_shape(source, destination):
+    """Sets the coordinates of a shape key to those of another"""
+    set_coords(destination.data, shape_coords(source))
+
+def add_delta(key_block, delta, factor=1.0):
+    """Moves the points of a shape key by delta, (n, 3) or (3,), times factor"""
+    co = shape_coords(key_block)
+    co += np.asarray(delta, dtype=np.float32) * factor
+    set_coords(key_block.data, co)
+
+def shape_offset(key, key_block):
+    """Offset of a shape key from the key it is relative to, zero for the reference key"""
+    co = shape_coords(key_block)
+    relative = key_block.relative_key
+    if not key.use_relative or relative is None or relative == key_block:
+        return np.zeros_like(co)
+    return co - shape_coords(relative)
+
+def blend_coords(key, source, co, blend=1.0, add=False):
+    """Coordinates of a shape key after blending source into them, like Blend from Shape in edit mode:
+       add moves them by the offset of source from its relative key, otherwise they are interpolated
+       towards source
+    """
+    if add:
+        return co + shape_offset(key, source) * blend
+    return co + (shape_coords(source) - co) * blend
+
+def relative_dependents(key, key_block):
+    """Shape keys relative to key_block, which move along with it when it is edited"""
+    if not key.use_relative:
+        return []
+    return [kb for kb in key.key_blocks if kb != key_block and kb.relative_key == key_block]
+
+def propagate_shape(ob, source_name, destination_names, blend=1.0, add=False, propagate=True):
+    """Blends a shape key into many others in one pass over the key block arrays.
+       With propagate, the change of every destination is also added to the shape keys relative to it,
+       as editing a shape key in edit mode does, and a changed reference key is written to the mesh.
+       Missing destinations are skipped, returns the names of the shape keys written.
+    """
+    key = ob.data.shape_keys
+    key_blocks = key.key_blocks
+    source = key_blocks.get(source_name)
+    if source is None:
+        return []
+    destinations = [key_blocks[name] for name in destination_names if name in key_blocks]
+    destination_names = {kb.name for kb in destinations}
+    offsets = {}
+    written = []
+    for kb in destinations:
+        co = shape_coords(kb)
+        new_co = blend_coords(key, source, co, blend, add)
+        set_coords(kb.data, new_co)
+        written.append(kb.name)
+        if propagate:
+            delta = new_co - co
+            for dependent in relative_dependents(key, kb):
+                if dependent.name not in destination_names:
+                    offsets[dependent.name] = offsets.get(dependent.name, 0.0) + delta
+    for name, delta in offsets.items():
+        add_delta(key_blocks[name], delta)
+        written.append(name)
+    if propagate and key.reference_key.name in written:
+        set_coords(ob.data.vertices, shape_coords(key.reference_key))
+    ob.data.update()
+    return written
+
+def sculpt_deltas(ob, sculpt_object, depsgraph):
+    """Differences between the evaluated sculpt object and the evaluated rigged object, (n, 3),
+       for the vertices both have
+    """
+    sculpt_co = get_coords(sculpt_object.evaluated_get(depsgraph).data.vertices).reshape(-1, 3)
+    rigged_co = get_coords(ob.evaluated_get(depsgraph).data.vertices).reshape(-1, 3)
+    count = min(len(sculpt_co), len(rigged_co), len(ob.data.vertices))
+    return sculpt_co[:count] - rigged_co[:count]
+
+def sculpt_to_shape_key(ob, sculpt_object, key_block, depsgraph, scene, threshold=1e-6):
+    """Sets a shape key to the base mesh plus the sculpted differences, taken back through the
+       deformation of modifiers and shape keys with the crazyspace.
+       Crazyspace corrections are only asked for the vertices that moved, since Python can only
+       get them one vertex at a time. Returns the number of vertices that moved.
+    """
+    delta = sculpt_deltas(ob, sculpt_object, depsgraph)
+    count = len(delta)
+    base = get_coords(ob.data.vertices).reshape(-1, 3)
+    result = shape_coords(key_block)
+    result[:count] = base[:count]
+    moved = np.flatnonzero(np.abs(delta).max(axis=1) > threshold) if count else np.empty(0, dtype=np.int64)
+
+    if len(moved):
+        ob.crazyspace_eval(depsgraph, scene)
+        try:
+            to_original = ob.crazyspace_displacement_to_original
+            result[moved] += np.array([to_original(vertex_index=i, displacement=d)
+                for i, d in zip(moved.tolist(), delta[moved].tolist())], dtype=np.float32)
+        finally:
+            ob.crazyspace_eval_clear()
+
+    set_coords(key_block.data, result)
+    ob.data.update()
+    return len(moved)
+
+##################################### Benchmarks #######################################
+
+def legacy_sculpt_to_shape_key(ob, sculpt_object, key_block, depsgraph, scene):
+    """Per vertex transfer as the Apply Sculpt operator used to do it, kept as the benchmark reference"""
+    sculpt_eval_verts = sculpt_object.evaluated_get(depsgraph).data.vertices
+    ob_eval_verts = ob.evaluated_get(depsgraph).data.vertices
+    rigged_base_verts = ob.data.vertices
+    ob.crazyspace_eval(depsgraph, scene)
+    for i, v in enumerate(sculpt_eval_verts):
+        if i > len(rigged_base_verts)-1:
+            break
+        delta = v.co - ob_eval_verts[i].co
+        delta = ob.crazyspace_displacement_to_original(vertex_index=i, displacement=delta)
+        key_block.data[i].co = rigged_base_verts[i].co + delta
+    ob.crazyspace_eval_clear()
+
+def benchmark_sculpt_to_shape_key(segments=300, moved_ratio=0.1, legacy=True):
+    """Times the sculpt to shape key transfer on a generated grid of segments x segments vertices
+       where moved_ratio of the vertices are sculpted. Run it from the Python console:
+       from blenrig.shape_key_math import benchmark_sculpt_to_shape_key; benchmark_sculpt_to_shape_key()
+       Returns {method: seconds}.
+    """
+    import bmesh
+    scene = bpy.context.scene
+    collection = scene.collection
+    created = []
+    try:
+        mesh = bpy.data.meshes.new('BlenRig_Benchmark')
+        bm = bmesh.new()
+        bmesh.ops.create_grid(bm, x_segments=segments, y_segments=segments, size=1.0)
+        bm.to_mesh(mesh)
+        bm.free()
+        sculpt_mesh = mesh.copy()
+        ob = bpy.data.objects.new('BlenRig_Benchmark', mesh)
+        collection.objects.link(ob)
+        created.append(ob)
+        ob.shape_key_add(name='Basis', from_mix=False)
+        key_block = ob.shape_key_add(name='Benchmark', from_mix=False)
+        ob.active_shape_key_index = 1
+
+        sculpt_object = bpy.data.objects.new('BlenRig_Benchmark_Sculpt', sculpt_mesh)
+        collection.objects.link(sculpt_object)
+        created.append(sculpt_object)
+        co = get_coords(sculpt_mesh.vertices).reshape(-1, 3)
+        moved = np.random.default_rng(0).random(len(co)) < moved_ratio
+        co[moved, 2] += 0.05
+        set_coords(sculpt_mesh.vertices, co)
+        sculpt_mesh.update()
+
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        timings = {}
+        start = perf_counter()
+        sculpt_to_shape_key(ob, sculpt_object, key_block, depsgraph, scene)
+        timings['vectorized'] = perf_counter() - start
+        result = shape_coords(key_block)
+        if legacy:
+            start = perf_counter()
+            legacy_sculpt_to_shape_key(ob, sculpt_object, key_block, depsgraph, scene)
+            timings['legacy'] = perf_counter() - start
+            timings['max_difference'] = float(np.abs(shape_coords(key_block) - result).max())
+        print('BlenRig sculpt to shape key benchmark, ' + str(len(co)) + ' vertices: ' + str(timings))
+        return timings
+    finally:
+        for ob in created:
+            mesh = ob.data
+            bpy.data.objects.remove(ob)
+            if mesh.users == 0:
+                bpy.data.meshes.remove(mesh)
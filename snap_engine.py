@@ -0,0 +1,631 @@
+import numpy as np
+from mathutils import Matrix
+from .pose_solver import solve_local_matrix, get_rest_data, refresh_pose
+from .keyframe_writer import KeyframeWriter
+
+##################################### IK/FK Snapping Engine #######################################
+
+# A snap is described as a list of stages. Each stage reads the pose at its start, sets its properties,
+# then applies its resets and pastes. The pose is re-evaluated between stages (where the operators used refresh_hack).
+#   ('prop', bone, property, value)
+#   ('paste', bone, source, channels, when, parent)  when: 'pre' = matrix captured before the snap, 'current' = matrix at stage start
+#                                                    parent: bone used as parent instead of the real one (see paste_visual_matrix)
+#                                                    'pre' pastes without parent set the whole pose matrix, channels are ignored
+#   ('reset', bone, channels)
+# Space switches use the same stages, one list per space.
+
+def prop(bone, prop_name, value):
+    return ('prop', bone, prop_name, value)
+
+def paste(bone, source=None, channels='Rot', when='pre', parent=None):
+    return ('paste', bone, source or bone, channels, when, parent)
+
+def reset(bone, channels):
+    return ('reset', bone, channels)
+
+##### Arm #####
+
+ARM_IK_TO_FK_BIPED = {
+    'prop': ('properties_arm_L', 'ik_arm_L'),
+    'condition': ('<', 0.1),
+    'stages': (
+        (prop('properties_arm_L', 'ik_arm_L', 1.0),),
+        (paste('arm_fk_ctrl_L', 'arm_ik_L', 'Rot', 'current'), reset('arm_fk_ctrl_L', 'Scale')),
+        (paste('shoulder_L'),),
+        (paste('arm_fk_L'),),
+        (paste('forearm_fk_L'),),
+        #Correct arm_fk twist
+        (paste('arm_fk_L', 'arm_rot_L', 'Rot', 'current'),),
+        (paste('forearm_fk_L'),),
+        #Switch Hand to Arm Space
+        (prop('properties_arm_L', 'space_hand_L', 1.0), paste('hand_fk_L', 'hand_fk_L', 'Rot', 'current')),
+    ),
+    'keys': (
+        ('arm_fk_L', 'LocRotScale'),
+        ('forearm_fk_L', 'LocRotScale'),
+        ('arm_ik_L', 'RotScale'),
+        ('forearm_ik_L', 'RotScale'),
+        ('arm_fk_ctrl_L', 'LocRotScale'),
+        ('shoulder_L', 'LocRotScale'),
+        ('hand_ik_ctrl_L', 'LocRotScale'),
+        ('hand_fk_L', 'LocRotScale'),
+        ('elbow_pole_L', 'Loc', ('properties_arm_L', 'toggle_arm_ik_pole_L')),
+    ),
+}
+
+ARM_FK_TO_IK_BIPED = {
+    'prop': ('properties_arm_L', 'ik_arm_L'),
+    'condition': ('>', 0.9),
+    'stages': (
+        (paste('hand_ik_ctrl_L', 'hand_fk_L', 'Loc', 'current'),),
+        (paste('elbow_pole_L', 'snap_elbow_pole_fk_L', 'Loc', 'current'),),
+        (paste('arm_ik_L', 'arm_rot_L', 'Rot', 'current'),),
+        (prop('properties_arm_L', 'ik_arm_L', 0.0),),
+        (paste('shoulder_L'),),
+        (paste('arm_fk_L'),),
+        (paste('forearm_fk_L'),),
+        #Correct arm_fk twist
+        (paste('arm_fk_L', 'arm_rot_L', 'Rot', 'current'),),
+        (paste('forearm_fk_L'),),
+        #Switch Hand to Free Space
+        (paste('hand_ik_ctrl_L', 'hand_fk_L', 'Rot', 'current'),),
+        (prop('properties_arm_L', 'space_hand_L', 0.0),),
+    ),
+    'keys': ARM_IK_TO_FK_BIPED['keys'],
+}
+
+ARM_IK_TO_FK_QUADRUPED = {
+    'prop': ('properties_arm_L', 'ik_arm_L'),
+    'condition': ('<', 0.1),
+    'stages': (
+        (prop('properties_arm_L', 'ik_arm_L', 1.0),),
+        (paste('arm_fk_ctrl_L', 'arm_ik_L', 'Rot', 'current'), reset('arm_fk_ctrl_L', 'Scale')),
+        (paste('shoulder_L'),),
+        (paste('arm_fk_L'),),
+        (paste('forearm_fk_L'),),
+        (paste('carpal_fk_L'),),
+        (paste('hand_fk_L'),),
+        (paste('hand_fing_1_fk_L'),),
+        (paste('hand_fing_2_fk_L'),),
+    ),
+    'keys': (
+        ('arm_fk_L', 'LocRotScale'),
+        ('forearm_fk_L', 'LocRotScale'),
+        ('carpal_fk_L', 'LocRotScale'),
+        ('carpal_ik_ctrl_L', 'LocRotScale'),
+        ('arm_fk_ctrl_L', 'LocRotScale'),
+        ('shoulder_L', 'LocRotScale'),
+        ('hand_fk_L', 'LocRotScale'),
+        ('hand_fing_1_fk_L', 'LocRotScale'),
+        ('hand_fing_2_fk_L', 'LocRotScale'),
+        ('arm_ik_L', 'RotScale'),
+        ('forearm_ik_L', 'RotScale'),
+        ('hand_ik_ctrl_L', 'LocRotScale'),
+        ('hand_fing_ik_ctrl_mid_L', 'LocRotScale'),
+        ('fings_ik_ctrl_L', 'LocRotScale'),
+        ('hand_roll_ctrl_L', 'Rot'),
+        ('fing_roll_1_L', 'Rot'),
+        ('fing_roll_2_L', 'Rot'),
+        ('hand_sole_ctrl_L', 'LocRotScale'),
+        ('elbow_pole_L', 'Loc', ('properties_arm_L', 'toggle_arm_ik_pole_L')),
+    ),
+}
+
+ARM_FK_TO_IK_QUADRUPED = {
+    'prop': ('properties_arm_L', 'ik_arm_L'),
+    'condition': ('>', 0.9),
+    'stages': (
+        (paste('hand_sole_ctrl_L', 'snap_hand_sole_ctrl_fk_L', 'LocRot', 'current'),),
+        (reset('hand_roll_ctrl_L', 'Rot'),
+         reset('hand_ik_ctrl_L', 'LocRot'),
+         reset('fing_roll_1_L', 'Rot'),
+         reset('fing_roll_2_L', 'Rot'),
+         reset('hand_fing_ik_ctrl_mid_L', 'LocRot'),
+         reset('fings_ik_ctrl_L', 'LocRot'),
+         paste('elbow_pole_L', 'snap_elbow_pole_fk_L', 'Loc', 'current')),
+        (paste('carpal_ik_ctrl_L', 'snap_carpal_fk_L', 'LocRot', 'current'),),
+        (prop('properties_arm_L', 'ik_arm_L', 0.0),),
+        (paste('arm_ik_L', 'arm_fk_ctrl_L', 'Rot', 'current'),),
+        (paste('shoulder_L'),),
+        (paste('arm_fk_L'),),
+        (paste('forearm_fk_L'),),
+        (paste('carpal_fk_L'),),
+        (paste('hand_fing_1_fk_L'),),
+        (paste('hand_fing_2_fk_L'),),
+    ),
+    'keys': ARM_IK_TO_FK_QUADRUPED['keys'],
+}
+
+##### Leg #####
+
+LEG_KEYS = (
+    ('thigh_fk_L', 'LocRotScale'),
+    ('shin_fk_L', 'LocRotScale'),
+    ('thigh_fk_ctrl_L', 'LocRotScale'),
+    ('foot_fk_L', 'LocRotScale'),
+    ('foot_toe_1_fk_L', 'LocRotScale'),
+    ('foot_toe_2_fk_L', 'LocRotScale'),
+    ('thigh_ik_L', 'RotScale'),
+    ('shin_ik_L', 'RotScale'),
+    ('foot_ik_ctrl_L', 'LocRotScale'),
+    ('foot_toe_ik_ctrl_mid_L', 'LocRotScale'),
+    ('foot_toe_ik_ctrl_L', 'LocRotScale'),
+    ('foot_roll_ctrl_L', 'Rot'),
+    ('toe_roll_1_L', 'Rot'),
+    ('toe_roll_2_L', 'Rot'),
+    ('sole_ctrl_L', 'LocRotScale'),
+    ('knee_pole_L', 'Loc', ('properties_leg_L', 'toggle_leg_ik_pole_L')),
+)
+
+LEG_IK_TO_FK_BIPED = {
+    'prop': ('properties_leg_L', 'ik_leg_L'),
+    'condition': ('<', 0.1),
+    'stages': (
+        (prop('properties_leg_L', 'ik_leg_L', 1.0),),
+        (paste('thigh_fk_ctrl_L', 'thigh_ik_L', 'Rot', 'current'), reset('thigh_fk_ctrl_L', 'Scale')),
+        (paste('thigh_fk_L'),),
+        (paste('shin_fk_L'),),
+        #Correct thigh_fk twist
+        (paste('thigh_fk_L', 'thigh_rot_L', 'Rot', 'current'),),
+        (paste('shin_fk_L'),),
+        (paste('foot_fk_L'),),
+        (paste('foot_toe_1_fk_L'),),
+        (paste('foot_toe_2_fk_L'),),
+    ),
+    'keys': LEG_KEYS,
+}
+
+LEG_FK_TO_IK_BIPED = {
+    'prop': ('properties_leg_L', 'ik_leg_L'),
+    'condition': ('>', 0.9),
+    'stages': (
+        (paste('sole_ctrl_L', 'snap_sole_ctrl_fk_L', 'LocRot', 'current'),),
+        (reset('foot_roll_ctrl_L', 'Rot'),
+         reset('foot_ik_ctrl_L', 'LocRot'),
+         reset('toe_roll_1_L', 'Rot'),
+         reset('toe_roll_2_L', 'Rot'),
+         reset('foot_toe_ik_ctrl_mid_L', 'LocRot'),
+         reset('foot_toe_ik_ctrl_L', 'LocRot'),
+         paste('knee_pole_L', 'snap_knee_pole_fk_L', 'Loc', 'current')),
+        (paste('thigh_ik_L', 'thigh_rot_L', 'Rot', 'current'),),
+        (prop('properties_leg_L', 'ik_leg_L', 0.0),),
+        (paste('thigh_fk_L'),),
+        (paste('shin_fk_L'),),
+        #Correct thigh_fk twist
+        (paste('thigh_fk_L', 'thigh_rot_L', 'Rot', 'current'),),
+        (paste('shin_fk_L'),),
+        (paste('foot_toe_1_fk_L'),),
+        (paste('foot_toe_2_fk_L'),),
+    ),
+    'keys': LEG_KEYS,
+}
+
+LEG_QUADRUPED_KEYS = LEG_KEYS + (
+    ('tarsal_fk_L', 'LocRotScale'),
+    ('tarsal_ik_ctrl_L', 'LocRotScale'),
+)
+
+LEG_IK_TO_FK_QUADRUPED = {
+    'prop': ('properties_leg_L', 'ik_leg_L'),
+    'condition': ('<', 0.1),
+    'stages': (
+        (prop('properties_leg_L', 'ik_leg_L', 1.0),),
+        (paste('thigh_fk_ctrl_L', 'thigh_ik_L', 'Rot', 'current'), reset('thigh_fk_ctrl_L', 'Scale')),
+        (paste('thigh_fk_L'),),
+        (paste('shin_fk_L'),),
+        (paste('thigh_fk_L', 'thigh_rot_L', 'Rot', 'current'),),
+        (paste('shin_fk_L'),),
+        (paste('tarsal_fk_L'),),
+        (paste('foot_fk_L'),),
+        (paste('foot_toe_1_fk_L'),),
+        (paste('foot_toe_2_fk_L'),),
+    ),
+    'keys': LEG_QUADRUPED_KEYS,
+}
+
+LEG_FK_TO_IK_QUADRUPED = {
+    'prop': ('properties_leg_L', 'ik_leg_L'),
+    'condition': ('>', 0.9),
+    'stages': LEG_FK_TO_IK_BIPED['stages'][:3] + (
+        (paste('tarsal_ik_ctrl_L', 'snap_tarsal_fk_L', 'LocRot', 'current'),),
+        (prop('properties_leg_L', 'ik_leg_L', 0.0),),
+        (paste('thigh_fk_L'),),
+        (paste('shin_fk_L'),),
+        (paste('thigh_fk_L', 'thigh_rot_L', 'Rot', 'current'),),
+        (paste('shin_fk_L'),),
+        (paste('tarsal_fk_L'),),
+        (paste('foot_toe_1_fk_L'),),
+        (paste('foot_toe_2_fk_L'),),
+    ),
+    'keys': LEG_QUADRUPED_KEYS,
+}
+
+SNAP_SPECS = {
+    ('arm', 'IK_TO_FK', 'Biped'): ARM_IK_TO_FK_BIPED,
+    ('arm', 'FK_TO_IK', 'Biped'): ARM_FK_TO_IK_BIPED,
+    ('arm', 'IK_TO_FK', 'Quadruped'): ARM_IK_TO_FK_QUADRUPED,
+    ('arm', 'FK_TO_IK', 'Quadruped'): ARM_FK_TO_IK_QUADRUPED,
+    ('leg', 'IK_TO_FK', 'Biped'): LEG_IK_TO_FK_BIPED,
+    ('leg', 'FK_TO_IK', 'Biped'): LEG_FK_TO_IK_BIPED,
+    ('leg', 'IK_TO_FK', 'Quadruped'): LEG_IK_TO_FK_QUADRUPED,
+    ('leg', 'FK_TO_IK', 'Quadruped'): LEG_FK_TO_IK_QUADRUPED,
+}
+
+##### Space Switches #####
+
+def space_switch(label, prop_bone, prop_name, spaces, bones, keys, pre_keys=None):
+    """Space switch that pastes back the matrix of the bones after changing the space property"""
+    return {
+        'label': label,
+        'spaces': tuple((name, ((prop(prop_bone, prop_name, value),), tuple(paste(b, b, channels) for b, channels in bones)))
+            for name, value in spaces),
+        'keys': keys,
+        'pre_keys': pre_keys or keys,
+    }
+
+def finger_space(label, finger):
+    bone = 'fing_{}_ik_L'.format(finger)
+    space_prop = 'space_fing_{}_L'.format(finger)
+    return {
+        'label': label,
+        'spaces': (
+            ('Free', ((prop('properties_arm_L', space_prop, 0.0), paste(bone, bone, 'Loc', 'pre', 'master_pivot')),)),
+            ('Hand', ((prop('properties_arm_L', space_prop, 1.0), paste(bone, bone, 'Loc', 'pre', 'fing_{}_ctrl_track_L'.format(finger))),)),
+        ),
+        'keys': ((bone, 'Loc'),),
+    }
+
+FINGERS = ('thumb', 'ind', 'mid', 'ring', 'lit')
+
+SPACE_SPECS = {
+    'arm': space_switch('Arm_{side}', 'properties_arm_L', 'space_arm_L',
+        (('Free', 0.0), ('Pelvis', 1.0), ('Torso', 2.0), ('Head', 3.0)),
+        (('hand_ik_ctrl_L', 'LocRotScale'), ('arm_fk_ctrl_L', 'LocRotScale')),
+        (('hand_ik_ctrl_L', 'LocRotScale'), ('arm_fk_ctrl_L', 'LocRotScale'))),
+    'hand': {
+        'label': 'Hand_{side}',
+        'spaces': (
+            ('Arm', ((prop('properties_arm_L', 'space_hand_L', 1.0), paste('hand_fk_L', 'hand_fk_L', 'Rot', 'current')),)),
+            ('Free', ((paste('hand_ik_ctrl_L', 'hand_fk_L', 'Rot', 'current'),),
+                      (prop('properties_arm_L', 'space_hand_L', 0.0),))),
+        ),
+        'keys': (('hand_ik_ctrl_L', 'LocRotScale'), ('hand_fk_L', 'LocRotScale')),
+        'pre_keys': (('hand_ik_ctrl_L', 'RotScale'), ('hand_fk_L', 'RotScale')),
+    },
+    'arm_pole': space_switch('Arm_{side} Pole', 'properties_arm_L', 'space_arm_ik_pole_L',
+        (('Free', 0.0), ('Torso', 1.0)),
+        (('elbow_pole_L', 'LocRotScale'),),
+        (('elbow_pole_L', 'Loc'),)),
+    'fing_thumb': finger_space('Thumb Finger_{side}', 'thumb'),
+    'fing_ind': finger_space('Index Finger_{side}', 'ind'),
+    'fing_mid': finger_space('Middle Finger_{side}', 'mid'),
+    'fing_ring': finger_space('Ring Finger_{side}', 'ring'),
+    'fing_lit': finger_space('Little Finger_{side}', 'lit'),
+    'leg': space_switch('Leg_{side} FK', 'properties_leg_L', 'space_leg_L',
+        (('Free', 0.0), ('Torso', 1.0)),
+        (('thigh_fk_ctrl_L', 'LocRotScale'),),
+        (('thigh_fk_ctrl_L', 'RotScale'),)),
+    'leg_pole': space_switch('Leg_{side} Pole', 'properties_leg_L', 'space_leg_ik_pole_L',
+        (('Free', 0.0), ('Torso', 1.0), ('Foot', 2.0)),
+        (('knee_pole_L', 'LocRotScale'),),
+        (('knee_pole_L', 'Loc'),)),
+    'head': space_switch('Head', 'properties_head', 'space_head',
+        (('Free', 0.0), ('Torso', 1.0)),
+        (('head_fk', 'LocRotScale'),),
+        (('head_fk', 'LocRotScale'),)),
+    'neck': space_switch('Neck', 'properties_head', 'space_neck',
+        (('Free', 0.0), ('Torso', 1.0)),
+        (('neck_1_fk', 'LocRotScale'),),
+        (('neck_1_fk', 'LocRotScale'),)),
+    'look': {
+        'label': 'Look',
+        'spaces': tuple((name, ((prop('properties_head', 'look_switch', value), paste('look', 'look', 'LocRot', 'pre', parent)),))
+            for name, value, parent in (('Free', 0.0, 'look_free'), ('Body', 1.0, 'master_body_pivot'),
+                                        ('Torso', 2.0, 'master_torso_pivot'), ('Head', 3.0, 'head_fk'))),
+        'keys': (('look', 'LocRotScale'),),
+    },
+    'eyeglasses': space_switch('Eyeglasses', 'properties_head', '["glasses_free"]',
+        (('Free', 0.0), ('Head', 1.0)),
+        (('eyeglasses_mstr', 'LocRotScale'),),
+        (('eyeglasses_mstr', 'LocRotScale'),)),
+    'hat': space_switch('Hat', 'properties_head', '["hat_free"]',
+        (('Free', 0.0), ('Head', 1.0)),
+        (('hat_mstr', 'LocRotScale'),),
+        (('hat_mstr', 'LocRotScale'),)),
+    'hand_accessory': {
+        'label': 'Hand Accessory',
+        'spaces': tuple((name, ((prop('properties_arm_L', '["hand_accessory_L"]', value_L),
+                                 prop('properties_arm_R', '["hand_accessory_R"]', value_R)),
+                                (paste('accessory', 'accessory', 'LocRotScale'),)))
+            for name, value_L, value_R in (('Free', 0.0, 0.0), ('Hand_L', 1.0, 0.0), ('Hand_R', 0.0, 1.0))),
+        'keys': (('accessory', 'LocRotScale'),),
+    },
+}
+
+#All fingers at once
+SPACE_SPECS['fing_all'] = {
+    'label': 'All Fingers_{side}',
+    'spaces': tuple((name, sum((dict(SPACE_SPECS['fing_' + f]['spaces'])[name] for f in FINGERS), ())
+                     + ((prop('properties_arm_L', 'space_fing_all_L', value),),))
+        for name, value in (('Free', 0.0), ('Hand', 1.0))),
+    'keys': sum((SPACE_SPECS['fing_' + f]['keys'] for f in FINGERS), ()),
+}
+
+#### Spec Helpers ####
+
+def mirror_name(name, side):
+    """Left side names are used in the tables, swap the suffix for the right side"""
+    if side == 'R' and isinstance(name, str) and name.endswith('_L'):
+        return name[:-2] + '_R'
+    return name
+
+def mirror_spec(item, side):
+    if isinstance(item, dict):
+        return {k: mirror_spec(v, side) for k, v in item.items()}
+    if isinstance(item, tuple):
+        return tuple(mirror_spec(v, side) for v in item)
+    return mirror_name(item, side)
+
+def get_snap_spec(armobj, limb, direction, side):
+    rig_type = armobj.data.get('rig_type', 'Biped')
+    spec = SNAP_SPECS.get((limb, direction, rig_type))
+    if spec is None:
+        return None
+    return mirror_spec(spec, side)
+
+def get_space_spec(name, space, side=None):
+    """Returns a runnable spec (stages and keys) for one space of a space switch"""
+    table = SPACE_SPECS[name]
+    stages = dict(table['spaces']).get(space)
+    if stages is None:
+        return None
+    spec = {'stages': stages, 'keys': table['keys'], 'pre_keys': table.get('pre_keys', table['keys'])}
+    return mirror_spec(spec, side)
+
+def space_names(name):
+    return [space for space, stages in SPACE_SPECS[name]['spaces']]
+
+def spec_bones(spec):
+    """All the pose bones that the snap reads or writes"""
+    bones = set()
+    for stage in spec['stages']:
+        for step in stage:
+            if step[0] == 'paste':
+                bones.add(step[1])
+                bones.add(step[2])
+                if step[5]:
+                    bones.add(step[5])
+            else:
+                bones.add(step[1])
+    for key in spec['keys']:
+        bones.add(key[0])
+    return bones
+
+def spec_props(spec):
+    """(bone, property) pairs set by the snap, in order"""
+    props = []
+    for stage in spec['stages']:
+        for step in stage:
+            if step[0] == 'prop' and (step[1], step[2]) not in props:
+                props.append((step[1], step[2]))
+    return props
+
+def get_prop(pbone, prop_path):
+    """Property value, prop_path can be an RNA property or a custom '["prop"]'"""
+    if prop_path.startswith('["'):
+        return pbone[prop_path[2:-2]]
+    return getattr(pbone, prop_path)
+
+def set_prop(pbone, prop_path, value):
+    if prop_path.startswith('["'):
+        pbone[prop_path[2:-2]] = value
+    else:
+        setattr(pbone, prop_path, value)
+
+def condition_met(value, condition):
+    if condition[0] == '<':
+        return value < condition[1]
+    return value > condition[1]
+
+#### Channels ####
+
+def apply_channels(pbone, mat, channels):
+    """Copy the requested channels of a local matrix to the pose bone"""
+    if 'Loc' in channels:
+        pbone.location = mat.to_translation()
+    if 'Rot' in channels:
+        if pbone.rotation_mode == 'QUATERNION':
+            pbone.rotation_quaternion = mat.to_3x3().to_quaternion()
+        elif pbone.rotation_mode == 'AXIS_ANGLE':
+            rot = mat.to_3x3().to_quaternion().to_axis_angle()
+            pbone.rotation_axis_angle = rot[1], rot[0][0], rot[0][1], rot[0][2]
+        else:
+            pbone.rotation_euler = mat.to_3x3().to_euler(pbone.rotation_mode, pbone.rotation_euler)
+    if 'Scale' in channels:
+        pbone.scale = mat.to_scale()
+
+def reset_channels(pbone, channels):
+    if 'Loc' in channels:
+        pbone.location[:] = (0.0, 0.0, 0.0)
+    if 'Rot' in channels:
+        pbone.rotation_euler[:] = (0.0, 0.0, 0.0)
+        pbone.rotation_quaternion[:] = (1.0, 0.0, 0.0, 0.0)
+        pbone.rotation_axis_angle[:] = (0.0, 0.0, 1.0, 0.0)
+    if 'Scale' in channels:
+        pbone.scale[:] = (1.0, 1.0, 1.0)
+
+#### Solver ####
+
+def run_snap(armobj, spec, refresh):
+    """Runs the stages of a snap on the current frame. refresh re-evaluates the pose between stages."""
+    pbones = armobj.pose.bones
+    rest = get_rest_data(armobj)
+
+    #Collect Matrix
+    pre = {}
+    for stage in spec['stages']:
+        for step in stage:
+            if step[0] == 'paste' and step[4] == 'pre' and step[2] in pbones:
+                pre[step[2]] = pbones[step[2]].matrix.copy()
+
+    for stage in spec['stages']:
+        #Read the pose at the start of the stage
+        current = {}
+        parents = {}
+        for step in stage:
+            if step[0] != 'paste' or step[1] not in pbones:
+                continue
+            if step[4] == 'current' and step[2] in pbones:
+                current[step[2]] = pbones[step[2]].matrix.copy()
+            parent = step[5] or rest[step[1]][1]
+            if parent and parent in pbones:
+                parents[step[1]] = (pbones[parent].matrix.copy(), rest[parent][0])
+        #Set Properties
+        for step in stage:
+            if step[0] == 'prop' and step[1] in pbones:
+                set_prop(pbones[step[1]], step[2], step[3])
+        #Paste Matrix
+        for step in stage:
+            if step[0] == 'reset' and step[1] in pbones:
+                reset_channels(pbones[step[1]], step[2])
+            elif step[0] == 'paste' and step[1] in pbones:
+                source = pre.get(step[2]) if step[4] == 'pre' else current.get(step[2])
+                if source is None:
+                    continue
+                if step[4] == 'pre' and step[5] is None:
+                    #Same as the old operators, the matrix setter honours inherit_scale and use_local_location
+                    pbones[step[1]].matrix = source
+                    continue
+                parent_pose, parent_rest = parents.get(step[1], (None, Matrix()))
+                ignoreparent = step[3] == 'Rot' and not armobj.data.bones[step[1]].use_inherit_rotation
+                mat = solve_local_matrix(rest[step[1]][0], parent_rest, source, parent_pose, ignoreparent)
+                apply_channels(pbones[step[1]], mat, step[3])
+        refresh()
+
+def insert_spec_keys(writer, pbones, spec, frame, key_list='keys'):
+    """Adds the keys of a snap (its properties and bones) to a KeyframeWriter"""
+    for b_name, prop_path in spec_props(spec):
+        if b_name in pbones:
+            writer.insert_bone_prop(pbones[b_name], prop_path, frame)
+    for key in spec.get(key_list, spec['keys']):
+        if key[0] not in pbones:
+            continue
+        if len(key) > 2 and get_prop(pbones[key[2][0]], key[2][1]) != 1.0:
+            continue
+        writer.insert_bone(pbones[key[0]], key[1], frame)
+
+def snap_current_frame(context, armobj, spec):
+    """Runs a snap on the current frame. With auto keying and an action, the pose before the snap
+       is keyed on the current frame and the new one on the next frame, like the old operators did.
+    """
+    pbones = armobj.pose.bones
+    if 'condition' in spec:
+        prop_bone, prop_name = spec['prop']
+        if prop_bone not in pbones or not condition_met(get_prop(pbones[prop_bone], prop_name), spec['condition']):
+            return False
+
+    scene = context.scene
+    anim_data = armobj.animation_data
+    autokey = anim_data and anim_data.action and scene.tool_settings.use_keyframe_insert_auto
+    frame = scene.frame_current
+    if autokey:
+        writer = KeyframeWriter(armobj)
+        insert_spec_keys(writer, pbones, spec, frame, 'pre_keys')
+        writer.write()
+
+    run_snap(armobj, spec, refresh_pose)
+
+    if autokey:
+        insert_spec_keys(writer, pbones, spec, frame + 1)
+        writer.write()
+        scene.frame_set(frame + 1)
+    return True
+
+def collect_keyed_frames(armobj, spec):
+    """Returns the frames of all the keys that belong to the bones of the snap"""
+    anim_data = armobj.animation_data
+    if not anim_data or not anim_data.action:
+        return []
+    prefixes = tuple('pose.bones["{}"]'.format(b) for b in spec_bones(spec))
+    frames = set()
+    for fc in anim_data.action.fcurves:
+        if fc.data_path.startswith(prefixes):
+            co = np.empty(len(fc.keyframe_points) * 2, dtype=np.float32)
+            fc.keyframe_points.foreach_get('co', co)
+            frames.update(int(round(f)) for f in co[0::2])
+    return sorted(frames)
+
+class SnapBake():
+    """Snaps on every frame of a list and collects the resulting keys, one frame per step(),
+       so that long ranges can run from a modal operator with progress and cancel.
+       Keys are written to the action once, on finish().
+    """
+
+    def __init__(self, context, armobj, spec, frames):
+        self.scene = context.scene
+        self.view_layer = context.view_layer
+        self.armobj = armobj
+        self.spec = spec
+        self.frames = list(frames)
+        self.index = 0
+        self.baked = 0
+        self.writer = KeyframeWriter(armobj)
+        self.frame_current = self.scene.frame_current
+
+        #Keep the unkeyed state so that every frame starts from the original pose
+        pbones = armobj.pose.bones
+        self.original_basis = {b: pbones[b].matrix_basis.copy() for b in spec_bones(spec) if b in pbones}
+        self.original_props = {p: get_prop(pbones[p[0]], p[1]) for p in spec_props(spec) if p[0] in pbones}
+
+    def __len__(self):
+        return len(self.frames)
+
+    def step(self):
+        """Bakes the next frame, returns False when there are no frames left"""
+        if self.index >= len(self.frames):
+            return False
+        f = self.frames[self.index]
+        self.index += 1
+        pbones = self.armobj.pose.bones
+        spec = self.spec
+        self.scene.frame_set(f)
+        if 'condition' in spec:
+            prop_bone, prop_name = spec['prop']
+            if not condition_met(get_prop(pbones[prop_bone], prop_name), spec['condition']):
+                return True
+        run_snap(self.armobj, spec, self.view_layer.update)
+        self.baked += 1
+        insert_spec_keys(self.writer, pbones, spec, f)
+        self.restore()
+        return True
+
+    def restore(self):
+        pbones = self.armobj.pose.bones
+        for b, mat in self.original_basis.items():
+            pbones[b].matrix_basis = mat
+        for p, v in self.original_props.items():
+            set_prop(pbones[p[0]], p[1], v)
+
+    def finish(self):
+        """Writes the collected keys and goes back to the starting frame, returns the number of baked frames"""
+        self.writer.write()
+        self.scene.frame_set(self.frame_current)
+        return self.baked
+
+    def cancel(self):
+        """Drops the collected keys and restores the pose of the starting frame"""
+        self.writer.keys.clear()
+        self.restore()
+        self.scene.frame_set(self.frame_current)
+
+def bake_snap(context, armobj, spec, frames):
+    """Snaps the limb on every frame and writes the resulting keys into the action.
+       Returns the number of baked frames.
+    """
+    prop_bone = spec.get('prop', (None,))[0]
+    if prop_bone is not None and prop_bone not in armobj.pose.bones:
+        return 0
+    bake = SnapBake(context, armobj, spec, frames)
+    while bake.step():
+        pass
+    return bake.finish()
@@ -2,11 +2,86 @@ import bpy
 import bmesh
 from math import *
 from mathutils import bvhtree
-import mathutils as mathu
 from mathutils import Vector, Matrix
+import numpy as np
 from bpy.types import Operator, PropertyGroup
 from bpy.props import *
 
+##################################### Batch Snapping Engine #######################################
+
+def matrix_array(matrix):
+    return np.array(matrix, dtype=np.float64)
+
+def transform_points(matrix, points):
+    """Applies a 4x4 matrix to an (n, 3) array of points with one multiply"""
+    mat = matrix_array(matrix)
+    return points @ mat[:3, :3].T + mat[:3, 3]
+
+def selected_verts(bm):
+    """Indices and (n, 3) coordinates of the selected vertices of a BMesh"""
+    bm.verts.ensure_lookup_table()
+    verts = [v for v in bm.verts if v.select]
+    indices = np.array([v.index for v in verts], dtype=np.int64)
+    coords = np.array([v.co for v in verts], dtype=np.float64).reshape(-1, 3)
+    return indices, coords
+
+def nearest_points(obj, points, targets, depsgraph):
+    """Nearest surface point of any target object for each point of obj, in obj local space.
+       Returns the (n, 3) positions and a mask of the points that found a hit.
+    """
+    count = len(points)
+    nearest = points.copy()
+    best = np.full(count, np.inf)
+    world = transform_points(obj.matrix_world, points)
+    world_to_obj = obj.matrix_world.inverted()
+    for target in targets:
+        bvh = bvhtree.BVHTree.FromObject(target, depsgraph)
+        local = transform_points(target.matrix_world.inverted(), world)
+        hits = np.full((count, 3), np.nan)
+        for i, co in enumerate(local.tolist()):
+            hit = bvh.find_nearest(co)[0]
+            if hit is not None:
+                hits[i] = hit
+        found = ~np.isnan(hits[:, 0])
+        hits[found] = transform_points(world_to_obj @ target.matrix_world, hits[found])
+        distance = np.full(count, np.inf)
+        distance[found] = np.linalg.norm(hits[found] - points[found], axis=1)
+        closer = distance < best
+        nearest[closer] = hits[closer]
+        best[closer] = distance[closer]
+    return nearest, np.isfinite(best)
+
+def write_verts(obj, bm, indices, coords):
+    """Writes vertex positions, then updates the normals and the edit mesh once"""
+    verts = bm.verts
+    for i, co in zip(indices.tolist(), coords.tolist()):
+        verts[i].co = co
+    bm.normal_update()
+    bmesh.update_edit_mesh(obj.data)
+
+def write_verts_centered(obj, bm, indices, coords):
+    """Writes vertex positions like write_verts and puts every center loop vertex back on the X = 0 plane"""
+    center = center_loop_indices(obj, bm)
+    extra = np.setdiff1d(center, indices)
+    write_indices = np.concatenate((indices, extra))
+    write_coords = np.concatenate((coords, np.array([bm.verts[i].co for i in extra.tolist()]).reshape(-1, 3)))
+    write_coords[np.isin(write_indices, center), 0] = 0
+    write_verts(obj, bm, write_indices, write_coords)
+
+def center_loop_indices(obj, bm=None):
+    """Indices of the vertices in the center_loop vertex group, read in one pass.
+       Pass the edit BMesh in edit mode. The cage distance slider keeps them in its CageOffsetState.
+    """
+    group = obj.vertex_groups.get('center_loop')
+    if group is None:
+        return np.empty(0, dtype=np.int64)
+    if bm is not None:
+        deform = bm.verts.layers.deform.active
+        if deform is None:
+            return np.empty(0, dtype=np.int64)
+        return np.array([v.index for v in bm.verts if group.index in v[deform]], dtype=np.int64)
+    return np.array([v.index for v in obj.data.vertices if any(g.group == group.index for g in v.groups)], dtype=np.int64)
+
 class BLENRIG_OT_SnapPoints(bpy.types.Operator):
     bl_idname = "blenrig.snap_points"
     bl_label = "Snap Points"
@@ -18,67 +93,141 @@ class BLENRIG_OT_SnapPoints(bpy.types.Operator):
             bpy.ops.mesh.select_mirror(extend=True)
 
         active_obj = context.active_object
-        props = context.window_manager.blenrig_6_props.adjust_distance_cage
 
         bm = bmesh.from_edit_mesh(active_obj.data)
-        bm.verts.ensure_lookup_table()
-        sel_verts = [v for v in bm.verts if v.select]
+        indices, coords = selected_verts(bm)
 
         objects_array = [obj for obj in context.visible_objects if obj != active_obj and obj.type == 'MESH']
 
         # do snapping
-        if sel_verts and objects_array:
-            vert_pose_list = {}
-
-            # get nearest positions
-            for obj in objects_array:
-                bvh = mathu.bvhtree.BVHTree.FromObject(obj, context.evaluated_depsgraph_get())
-
-                for idx, vert in enumerate(sel_verts):
-                    v_pos = obj.matrix_world.inverted() @ (active_obj.matrix_world @ vert.co)
-                    nearest = bvh.find_nearest(v_pos)
-
-                    if nearest and nearest[0]:
-                        v_pos_near = active_obj.matrix_world.inverted() @ (obj.matrix_world @ nearest[0])
-
-                        if vert in vert_pose_list.keys():
-                            # if new near position is less
-                            if (vert.co - vert_pose_list[vert]).length > (vert.co - v_pos_near).length:
-                                vert_pose_list[vert] = v_pos_near
-                        else:
-                            vert_pose_list[vert] =  v_pos_near
-
-            for vert in sel_verts:
-                append_attribute_to_obj(active_obj, str(vert.index), vert.co)
-                vert.co = vert_pose_list[vert]
-                bm.normal_update()
-                bmesh.update_edit_mesh(active_obj.data)
-
-        bpy.ops.mesh.select_all(action='DESELECT')
-        nombre_vertex_group = 'center_loop'
-        for center in  bpy.context.active_object.vertex_groups.items():
-            if center.__contains__('center_loop'):
-                bpy.context.active_object.vertex_groups.active = bpy.context.active_object.vertex_groups.get(nombre_vertex_group)
-                bpy.ops.object.vertex_group_select()
-                bm = bmesh.from_edit_mesh(active_obj.data)
-                bm.normal_update()
-                sel_center_verts = [v for v in bm.verts if v.select]        
-            
-                for vert in sel_center_verts:
-                    vert.co[0] = 0
-                    vert.select = False
-                    bm.normal_update()
-                    bmesh.update_edit_mesh(active_obj.data)
-        else:
-            for vert in sel_verts:
-                vert.select= True
-            bmesh.update_edit_mesh(active_obj.data)
+        snapped_indices = np.empty(0, dtype=np.int64)
+        snapped = np.empty((0, 3))
+        if len(indices) and objects_array:
+            snapped, found = nearest_points(active_obj, coords, objects_array, context.evaluated_depsgraph_get())
+            snapped_indices, snapped = indices[found], snapped[found]
+
+            store_snap_originals(active_obj, bm, indices, coords)
+
+        write_verts_centered(active_obj, bm, snapped_indices, snapped)
+        cage_offset_states[active_obj.name] = CageOffsetState(active_obj)
         return {'FINISHED'}
 
+##################################### Snap Originals #######################################
+
+# Positions of the vertices before snapping, stored in a float vector point attribute.
+# Vertices that were never snapped hold NaN.
+SNAP_ORIGINAL = '.blenrig_snap_original'
+
 def append_attribute_to_obj(obj, attribute, value):
     v = str(value.x) + " " + str(value.y) + " " + str(value.z)
     obj[attribute] = str(v)
 
+def store_snap_originals(obj, bm, indices, coords):
+    """Stores the positions of the vertices before snapping"""
+    layers = getattr(bm.verts.layers, 'float_vector', None)
+    if layers is None:
+        # BMesh float vector layers need Blender 3.0, keep one ID property per vertex
+        for i, co in zip(indices.tolist(), coords.tolist()):
+            append_attribute_to_obj(obj, str(i), Vector(co))
+        return
+    layer = layers.get(SNAP_ORIGINAL)
+    if layer is None:
+        layer = layers.new(SNAP_ORIGINAL)
+        missing = Vector((nan, nan, nan))
+        for v in bm.verts:
+            v[layer] = missing
+        # Originals of older files, one string ID property per vertex
+        for i, co in legacy_snap_originals(obj, len(bm.verts)).items():
+            bm.verts[i][layer] = co
+        for key in [k for k in obj.keys() if k.isdigit()]:
+            del obj[key]
+    verts = bm.verts
+    for i, co in zip(indices.tolist(), coords.tolist()):
+        verts[i][layer] = co
+
+def legacy_snap_originals(obj, count):
+    """{vertex index: position} stored as string ID properties by older versions"""
+    originals = {}
+    for key, value in obj.items():
+        if key.isdigit() and int(key) < count and isinstance(value, str):
+            a = value.split()
+            originals[int(key)] = Vector((float(a[0]), float(a[1]), float(a[2])))
+    return originals
+
+def read_snap_originals(obj):
+    """(n, 3) array of the original positions of the vertices, NaN where there is none.
+       Reads the mesh, call obj.update_from_editmode() first in edit mode.
+    """
+    mesh = obj.data
+    count = len(mesh.vertices)
+    attribute = mesh.attributes.get(SNAP_ORIGINAL)
+    if attribute is not None:
+        originals = np.empty(count * 3, dtype=np.float32)
+        attribute.data.foreach_get('vector', originals)
+        return originals.reshape(count, 3)
+    originals = np.full((count, 3), np.nan, dtype=np.float32)
+    for i, co in legacy_snap_originals(obj, count).items():
+        originals[i] = co
+    return originals
+
+##################################### Cage Distance Slider #######################################
+
+class CageOffsetState():
+    """Everything the adjust_distance_cage slider needs, read once when snapping finishes:
+       the snapped selected vertices with their originals and normals, plus the other center loop vertices.
+       Every slider change is then base + normal * distance and one edit mesh update.
+    """
+
+    def __init__(self, obj):
+        obj.update_from_editmode()
+        mesh = obj.data
+        count = len(mesh.vertices)
+        select = np.empty(count, dtype=bool)
+        normals = np.empty(count * 3, dtype=np.float32)
+        mesh.vertices.foreach_get('select', select)
+        mesh.vertices.foreach_get('normal', normals)
+        normals = normals.reshape(count, 3)
+        originals = read_snap_originals(obj)
+
+        mask = select & ~np.isnan(originals[:, 0])
+        snapped = np.flatnonzero(mask)
+        center = center_loop_indices(obj, bmesh.from_edit_mesh(mesh))
+        self.count = count
+        self.indices = snapped
+        self.base = originals[mask]
+        self.normals = normals[mask]
+        self.center = np.isin(snapped, center)
+        # Center loop vertices that were not snapped keep their current position, only X is zeroed
+        self.extra = np.setdiff1d(center, snapped)
+
+    def apply(self, obj, distance):
+        """Writes the offset positions, returns False when the mesh changed since the state was read"""
+        bm = bmesh.from_edit_mesh(obj.data)
+        if len(bm.verts) != self.count:
+            return False
+        bm.verts.ensure_lookup_table()
+        coords = self.base + self.normals * distance
+        coords[self.center, 0] = 0
+        extra_coords = np.array([bm.verts[i].co for i in self.extra.tolist()], dtype=np.float64).reshape(-1, 3)
+        extra_coords[:, 0] = 0
+        write_verts(obj, bm, np.concatenate((self.indices, self.extra)), np.concatenate((coords, extra_coords)))
+        return True
+
+# {object name: CageOffsetState}
+cage_offset_states = {}
+
+def adjust_cage_distance(obj, distance):
+    """Moves the snapped vertices to their original position plus distance along their normal,
+       with the center loop on the X = 0 plane
+    """
+    if obj is None or obj.type != 'MESH' or obj.mode != 'EDIT':
+        return
+    state = cage_offset_states.get(obj.name)
+    if state is None or not state.apply(obj, distance):
+        # Cage snapped in an earlier session or edited since, read the stored originals again
+        state = cage_offset_states[obj.name] = CageOffsetState(obj)
+        state.apply(obj, distance)
+
 
 class BLENRIG_OT_center_loop_cage(bpy.types.Operator):
     bl_idname = "blenrig.center_loop_cage"
@@ -86,19 +235,12 @@ class BLENRIG_OT_center_loop_cage(bpy.types.Operator):
     bl_description = "Center loop Cage"
     bl_options = {'REGISTER', 'UNDO'}
 
-    def execute(self, context):    
+    def execute(self, context):
         active_obj = bpy.context.active_object
-        bpy.ops.mesh.select_all(action='DESELECT')
-        nombre_vertex_group = 'center_loop'
-        bpy.context.active_object.vertex_groups.active = bpy.context.active_object.vertex_groups.get(nombre_vertex_group)
-        bpy.ops.object.vertex_group_select()
         bm = bmesh.from_edit_mesh(active_obj.data)
-        bm.normal_update()
-        sel_center_verts = [v for v in bm.verts if v.select]
-
-        for vert in sel_center_verts:
-            vert.co[0] = 0
-            vert.select = False
-            bm.normal_update()
-            bmesh.update_edit_mesh(active_obj.data)
-        return {'FINISHED'}
\ No newline at end of file
+        bm.verts.ensure_lookup_table()
+        center = center_loop_indices(active_obj, bm)
+        coords = np.array([bm.verts[i].co for i in center.tolist()]).reshape(-1, 3)
+        coords[:, 0] = 0
+        write_verts(active_obj, bm, center, coords)
+        return {'FINISHED'}
@@ -44,6 +44,7 @@ class BLENRIG_PT_Rigging_and_baking(bpy.types.Panel):
                     row.scale_x = 0.5
                     row.scale_y = 1.8
                     row.operator("blenrig.armature_baker_all_part_1", text="Bake All")
+                    row.operator("blenrig.armature_baker_all_part_1", text="", icon='TEXT').dry_run = True
 
             elif context.mode in ['EDIT_ARMATURE']:
                 if context.active_object.data.reproportion:
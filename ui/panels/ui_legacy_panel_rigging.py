@@ -1005,4 +1005,6 @@ class BLENRIG_PT_legacy_blenrig_5_rigging_panel(bpy.types.Panel):
         row.label(text="Armature Ver. " + str(arm_data['rig_version']))
         if bpy.app.version > (2,9,0):
             overrides = col.row()
-            overrides.operator("blenrig.set_lib_overrides_on", text="Set Library Overrides On")
\ No newline at end of file
+            overrides.operator("blenrig.set_lib_overrides_on", text="Set Library Overrides On")
+        settings = col.row()
+        settings.operator("blenrig.recompute_rig_settings", text="Recompute Rig Settings")
\ No newline at end of file
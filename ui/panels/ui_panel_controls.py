@@ -2428,6 +2428,7 @@ class BLENRIG_PT_blenrig_6_Interface(bpy.types.Panel):
                             row_fk_3 = row_fk.row()
                             row_fk_3.scale_x = BL_Ver(2.1, 2.1)
                             row_fk_3.operator("snap.arm_ik_to_fk_r", text="", icon='PLAY', emboss=True)
+                            row_fk_3.operator("snap.bake_ik_fk", text="", icon='REC', emboss=True).limb = 'arm_R'
                             row_fk_4 = row_fk.row()
                             row_fk_4.scale_x = BL_Ver(2, 2)
                             col_prop = row_fk_4.column(align=True)
@@ -2592,6 +2593,7 @@ class BLENRIG_PT_blenrig_6_Interface(bpy.types.Panel):
                             row_fk_3 = row_fk.row()
                             row_fk_3.scale_x = BL_Ver(2.1, 2.1)
                             row_fk_3.operator("snap.leg_ik_to_fk_r", text="", icon='PLAY', emboss=True)
+                            row_fk_3.operator("snap.bake_ik_fk", text="", icon='REC', emboss=True).limb = 'leg_R'
                             row_fk_4 = row_fk.row()
                             row_fk_4.scale_x = BL_Ver(2, 2)
                             col_prop = row_fk_4.column(align=True)
@@ -2711,6 +2713,7 @@ class BLENRIG_PT_blenrig_6_Interface(bpy.types.Panel):
                             row_fk_3 = row_fk.row()
                             row_fk_3.scale_x = BL_Ver(2.1, 2.1)
                             row_fk_3.operator("snap.arm_ik_to_fk_l", text="", icon='PLAY', emboss=True)
+                            row_fk_3.operator("snap.bake_ik_fk", text="", icon='REC', emboss=True).limb = 'arm_L'
                             row_fk_4 = row_fk.row()
                             row_fk_4.scale_x = BL_Ver(2, 2)
                             col_prop = row_fk_4.column(align=True)
@@ -2875,6 +2878,7 @@ class BLENRIG_PT_blenrig_6_Interface(bpy.types.Panel):
                             row_fk_3 = row_fk.row()
                             row_fk_3.scale_x = BL_Ver(2.1, 2.1)
                             row_fk_3.operator("snap.leg_ik_to_fk_l", text="", icon='PLAY', emboss=True)
+                            row_fk_3.operator("snap.bake_ik_fk", text="", icon='REC', emboss=True).limb = 'leg_L'
                             row_fk_4 = row_fk.row()
                             row_fk_4.scale_x = BL_Ver(2, 2)
                             col_prop = row_fk_4.column(align=True)
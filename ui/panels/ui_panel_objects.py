@@ -44,6 +44,9 @@ class BLENRIG_PT_blenrig_6_mesh_panel(bpy.types.Panel):
         row_bake = col_bake.row()
         row_bake.operator("blenrig.mesh_pose_baker", text="Bake Mesh")
         row_bake.prop(props, "bake_to_shape")
+        row_sequence = col_bake.row()
+        row_sequence.operator("blenrig.mesh_sequence_baker", text="Bake Sequence")
+        row_sequence.operator("blenrig.import_point_cache", text="Import Cache")
         col_buttons.separator()
         #Weights Transfer Buttons
         box_transfer = col_buttons.box()
@@ -3,6 +3,7 @@ import bpy
 from bpy.props import BoolProperty, PointerProperty
 from bpy.types import Panel, Operator, PropertyGroup
 import json, os
+from .bone_visibility import write_bone_hide
 
 script_file = os.path.realpath(__file__)
 directory = os.path.dirname(script_file)
@@ -24,22 +25,9 @@ def get_bones(target_groups):
     return bones
 
 def toggle_bone_visibility(left_side, right_side, target, bones):
-    for bone in bones:
-        if bone in bpy.context.object.data.bones:
-            if target:
-                if not left_side and bone.endswith('_L') or bone.endswith(".L"):
-                    bpy.context.object.data.bones[bone].hide = False
-                elif not right_side and bone.endswith('_R') or bone.endswith(".R"):
-                    bpy.context.object.data.bones[bone].hide = False
-                else:
-                    bpy.context.object.data.bones[bone].hide = False
-            else:
-                if not left_side and bone.endswith('_L') or bone.endswith(".L"):                
-                    bpy.context.object.data.bones[bone].hide = True
-                elif not right_side and bone.endswith('_R') or bone.endswith(".R"):
-                    bpy.context.object.data.bones[bone].hide = True
-                else:
-                    bpy.context.object.data.bones[bone].hide = True
+    """Shows (target) or hides the bones, written in one go. Returns the number of bones that changed"""
+    arm = bpy.context.object.data
+    return write_bone_hide(arm, {bone: not target for bone in bones if bone in arm.bones})
 
 def get_properties(context):
     ao = context.active_object